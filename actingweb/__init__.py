@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Any
+
 __version__ = "3.14.0"
 
 # Modules are lazy-loaded on-demand, so they're not imported here
@@ -27,5 +29,15 @@ from . import interface
 # through every retry -- callers that want to catch this without importing
 # actingweb.property_list directly can do `from actingweb import
 # ListMetadataContentionError`. handlers/properties.py maps it to 503 with
-# Retry-After.
-from .property_list import ListMetadataContentionError
+# Retry-After. Resolved on first access so that importing the package does
+# not import the property list machinery.
+if TYPE_CHECKING:
+    from .property_list import ListMetadataContentionError
+
+
+def __getattr__(name: str) -> Any:
+    if name == "ListMetadataContentionError":
+        from .property_list import ListMetadataContentionError
+
+        return ListMetadataContentionError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
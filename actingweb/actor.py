@@ -1,13 +1,21 @@
 import base64
 import datetime
-import json
 import logging
 import time
 from typing import Any
 
-import requests
-
-from actingweb import attribute, deletion, peertrustee, property, subscription, trust
+import httpx
+
+from actingweb import (
+    attribute,
+    deletion,
+    json_codec,
+    peer_transport,
+    peertrustee,
+    property,
+    subscription,
+    trust,
+)
 from actingweb.constants import (
     DEFAULT_CREATOR,
 )
@@ -107,6 +115,10 @@ class Actor:
         Note: This sync method blocks the event loop. In FastAPI/uvicorn contexts,
         use AsyncTrustHandler which calls create_reciprocal_trust_async() instead.
 
+        The /meta document is cached per peer (see
+        :func:`actingweb.peer_capabilities.get_peer_meta`), so repeated calls for
+        the same peer are usually served without a request.
+
         :param url: Root URI of a remote actor
         :param max_retries: Maximum number of retry attempts (default: 3)
         :param retry_delay: Initial delay between retries in seconds (default: 0.5)
@@ -124,6 +136,8 @@ class Actor:
         """
         import time
 
+        from .peer_capabilities import get_peer_meta
+
         last_error: Exception | None = None
         for attempt in range(max_retries):
             try:
@@ -134,16 +148,13 @@ class Actor:
                 else:
                     logger.debug(f"Fetching peer info from {url}")
 
-                response = requests.get(url=url + "/meta", timeout=(5, 10))
-                res = {
-                    "last_response_code": response.status_code,
-                    "last_response_message": response.content,
-                    "data": json.loads(response.content.decode("utf-8", "ignore")),
+                meta = get_peer_meta(url, self.config, timeout=(5, 10))
+                logger.debug(f"Got peer info from url({url}) with body({meta.data})")
+                return {
+                    "last_response_code": meta.status_code,
+                    "last_response_message": meta.content,
+                    "data": meta.data,
                 }
-                logger.debug(
-                    f"Got peer info from url({url}) with body({response.content})"
-                )
-                return res
             except (TypeError, ValueError, KeyError) as e:
                 # JSON parsing errors - don't retry
                 logger.warning(f"Invalid response from peer {url}: {e}")
@@ -151,7 +162,7 @@ class Actor:
                     "last_response_code": 500,
                     "last_response_message": str(e),
                 }
-            except requests.exceptions.RequestException as e:
+            except (httpx.HTTPError, httpx.InvalidURL) as e:
                 # Network errors - retry with exponential backoff
                 last_error = e
                 if attempt < max_retries - 1:
@@ -181,21 +192,17 @@ class Actor:
         :param url: Root URI of a remote actor
         :return: Dict with last_response_code, last_response_message, and data
         """
-        import httpx
+        from .peer_capabilities import get_peer_meta_async
 
         try:
             logger.debug(f"Fetching peer info async from {url}")
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url + "/meta")
-                res = {
-                    "last_response_code": response.status_code,
-                    "last_response_message": response.content,
-                    "data": response.json(),
-                }
-                logger.debug(
-                    f"Got peer info async from url({url}) with body({response.content})"
-                )
-                return res
+            meta = await get_peer_meta_async(url, self.config, timeout=10.0)
+            logger.debug(f"Got peer info async from url({url}) with body({meta.data})")
+            return {
+                "last_response_code": meta.status_code,
+                "last_response_message": meta.content,
+                "data": meta.data,
+            }
         except (TypeError, ValueError, KeyError) as e:
             # JSON parsing errors
             logger.warning(f"Invalid response from peer {url}: {e}")
@@ -552,7 +559,7 @@ class Actor:
             "Authorization": "Basic " + base64.b64encode(u_p).decode("utf-8"),
         }
         try:
-            response = requests.delete(
+            response = peer_transport.delete(
                 url=peer_data["baseuri"], headers=headers, timeout=(5, 10)
             )
             self.last_response_code = response.status_code
@@ -632,17 +639,17 @@ class Actor:
                 "creator": "trustee",
                 "trustee_root": (self.config.root + self.id) if self.config else "",
             }
-            data = json.dumps(params)
+            data = json_codec.encode(params)
             logger.debug(f"Creating peer actor at factory({factory})")
             response = None
             try:
-                response = requests.post(
+                response = peer_transport.post(
                     url=factory,
                     data=data,
                     timeout=(5, 10),
                     headers={"Content-Type": "application/json"},
                 )
-                if response:
+                if response is not None:
                     self.last_response_code = response.status_code
                     self.last_response_message = (
                         response.content.decode("utf-8", "ignore")
@@ -656,13 +663,13 @@ class Actor:
             if self.last_response_code < 200 or self.last_response_code > 299:
                 return None
             try:
-                if response and response.content:
+                if response is not None and response.content:
                     content_str = (
                         response.content.decode("utf-8", "ignore")
                         if isinstance(response.content, bytes)
                         else str(response.content)
                     )
-                    data = json.loads(content_str)
+                    data = json_codec.loads(content_str)
                 else:
                     data = {}
             except (TypeError, ValueError, KeyError):
@@ -670,9 +677,9 @@ class Actor:
                     f"Not able to parse response when creating peer at factory({factory})"
                 )
                 return None
-            if response and "Location" in response.headers:
+            if response is not None and "Location" in response.headers:
                 baseuri = response.headers["Location"]
-            elif response and "location" in response.headers:
+            elif response is not None and "location" in response.headers:
                 baseuri = response.headers["location"]
             else:
                 logger.warning(
@@ -740,9 +747,9 @@ class Actor:
                 "Authorization": "Basic " + base64.b64encode(u_p).decode("utf-8"),
                 "Content-Type": "application/json",
             }
-            data = json.dumps(params)
+            data = json_codec.encode(params)
             try:
-                response = requests.put(
+                response = peer_transport.put(
                     url=new_peer_data["baseuri"]
                     + "/trust/"
                     + relationship
@@ -752,7 +759,7 @@ class Actor:
                     headers=headers,
                     timeout=(5, 10),
                 )
-                if response:
+                if response is not None:
                     self.last_response_code = response.status_code
                     self.last_response_message = (
                         response.content.decode("utf-8", "ignore")
@@ -858,7 +865,7 @@ class Actor:
                     "Authorization": "Bearer " + this_trust["secret"],
                     "Content-Type": "application/json",
                 }
-            data = json.dumps(params)
+            data = json_codec.encode(params)
             # Note the POST here instead of PUT. POST is used to used to notify about
             # state change in the relationship (i.e. not change the object as PUT
             # would do)
@@ -868,7 +875,7 @@ class Actor:
                 + ")"
             )
             try:
-                response = requests.post(
+                response = peer_transport.post(
                     url=requrl, data=data, headers=headers, timeout=(5, 10)
                 )
                 self.last_response_code = response.status_code
@@ -905,12 +912,14 @@ class Actor:
         """Async version of modify_trust_and_notify - prevents blocking on peer notification.
 
         Changes a trust relationship and notifies the peer if approval is changed.
-        Database operations remain synchronous, but peer HTTP notification is async.
+        Database operations run in a worker thread, peer HTTP notification is async.
         """
+        import asyncio
+
         if not relationship or not peerid:
             return False
-        relationships = self.get_trust_relationships(
-            relationship=relationship, peerid=peerid
+        relationships = await asyncio.to_thread(
+            self.get_trust_relationships, relationship=relationship, peerid=peerid
         )
         if not relationships:
             return False
@@ -919,8 +928,11 @@ class Actor:
         # IMPORTANT: Save approval to database BEFORE notifying peer
         # This prevents race condition where peer tries to subscribe back
         # before our approval is saved
-        dbtrust = trust.Trust(actor_id=self.id, peerid=peerid, config=self.config)
-        result = dbtrust.modify(
+        dbtrust = await asyncio.to_thread(
+            trust.Trust, actor_id=self.id, peerid=peerid, config=self.config
+        )
+        result = await asyncio.to_thread(
+            dbtrust.modify,
             baseuri=baseuri,
             secret=secret,
             desc=desc,
@@ -1034,12 +1046,12 @@ class Actor:
             "verify": new_trust["verification_token"] if new_trust else "",
         }
         requrl = url + "/trust/" + relationship
-        data = json.dumps(params)
+        data = json_codec.encode(params)
         logger.debug(
             f"Creating reciprocal trust at url({requrl}) for peer {params.get('id', 'unknown')}"
         )
         try:
-            response = requests.post(
+            response = peer_transport.post(
                 url=requrl,
                 data=data,
                 timeout=(5, 10),
@@ -1145,26 +1157,25 @@ class Actor:
             "verify": new_trust["verification_token"] if new_trust else "",
         }
 
-        import httpx
-
         requrl = url + "/trust/" + relationship
-        data = json.dumps(params)
+        data = json_codec.encode(params)
         logger.info(
             f"Requesting trust relationship async from peer at ({requrl}) with data({data})"
         )
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    requrl,
-                    content=data,
-                    headers={"Content-Type": "application/json"},
-                )
-                self.last_response_code = response.status_code
-                self.last_response_message = (
-                    response.content.decode("utf-8", "ignore")
-                    if isinstance(response.content, bytes)
-                    else str(response.content)
-                )
+            client = await peer_transport.get_async_client()
+            response = await client.post(
+                requrl,
+                content=data,
+                headers={"Content-Type": "application/json"},
+                timeout=10.0,
+            )
+            self.last_response_code = response.status_code
+            self.last_response_message = (
+                response.content.decode("utf-8", "ignore")
+                if isinstance(response.content, bytes)
+                else str(response.content)
+            )
         except httpx.TimeoutException:
             logger.debug("Timeout creating trust with peer async, deleting my trust.")
             dbtrust.delete()
@@ -1234,7 +1245,9 @@ class Actor:
                 f"Verifying trust at requesting peer({peerid}) at url ({requrl})"
             )
             try:
-                response = requests.get(url=requrl, headers=headers, timeout=(5, 10))
+                response = peer_transport.get(
+                    url=requrl, headers=headers, timeout=(5, 10)
+                )
                 self.last_response_code = response.status_code
                 self.last_response_message = (
                     response.content.decode("utf-8", "ignore")
@@ -1247,7 +1260,7 @@ class Actor:
                         if isinstance(response.content, bytes)
                         else str(response.content)
                     )
-                    data = json.loads(content_str)
+                    data = json_codec.loads(content_str)
                     logger.debug(
                         f"Verifying trust response: verified={data.get('verified', False)}, "
                         f"approved={data.get('approved', False)}, peer_approved={data.get('peer_approved', False)}"
@@ -1318,7 +1331,7 @@ class Actor:
                     }
                 logger.info(f"Deleting reciprocal relationship at {url}")
                 try:
-                    response = requests.delete(
+                    response = peer_transport.delete(
                         url=url, headers=headers, timeout=(5, 10)
                     )
                 except Exception:
@@ -1534,7 +1547,7 @@ class Actor:
         if granularity and len(granularity) > 0:
             params["granularity"] = granularity
         requrl = peer["baseuri"] + "/subscriptions/" + self.id
-        data = json.dumps(params)
+        data = json_codec.encode(params)
         headers = {
             "Authorization": "Bearer " + peer["secret"],
             "Content-Type": "application/json",
@@ -1547,7 +1560,7 @@ class Actor:
                 + str(data)
                 + ")"
             )
-            response = requests.post(
+            response = peer_transport.post(
                 url=requrl, data=data, headers=headers, timeout=(5, 10)
             )
             self.last_response_code = response.status_code
@@ -1571,7 +1584,7 @@ class Actor:
                 if isinstance(response.content, bytes)
                 else str(response.content)
             )
-            data = json.loads(content_str)
+            data = json_codec.loads(content_str)
         except ValueError:
             return None
         if "subscriptionid" in data:
@@ -1684,7 +1697,7 @@ class Actor:
         }
         try:
             logger.info(f"Deleting remote subscription at {url}")
-            response = requests.delete(url=url, headers=headers, timeout=(5, 10))
+            response = peer_transport.delete(url=url, headers=headers, timeout=(5, 10))
             self.last_response_code = response.status_code
             self.last_response_message = (
                 response.content.decode("utf-8", "ignore")
@@ -1807,7 +1820,7 @@ class Actor:
             params["resource"] = sub["resource"]
         if sub["granularity"] == "high":
             try:
-                params["data"] = json.loads(blob)
+                params["data"] = json_codec.loads(blob)
             except (TypeError, ValueError, KeyError):
                 params["data"] = blob
         if sub["granularity"] == "low":
@@ -1828,7 +1841,7 @@ class Actor:
             + "/"
             + sub["subscriptionid"]
         )
-        data = json.dumps(params)
+        data = json_codec.encode(params)
         headers = {
             "Authorization": "Bearer " + trust_rel["secret"],
             "Content-Type": "application/json",
@@ -1836,7 +1849,7 @@ class Actor:
 
         # Helper function for sync callback
         def _send_callback_sync():
-            """Send subscription callback using requests (blocking)."""
+            """Send subscription callback on the shared client (blocking)."""
             try:
                 logger.debug(
                     "Doing sync callback on subscription at url("
@@ -1845,7 +1858,7 @@ class Actor:
                     + str(data)
                     + ")"
                 )
-                response = requests.post(
+                response = peer_transport.post(
                     url=requrl,
                     data=data.encode("utf-8"),
                     headers=headers,
@@ -1871,7 +1884,7 @@ class Actor:
                 # might have added the callback to a pending queue (due to sequence gaps),
                 # and the diff would be lost. Diffs are cleared when the subscriber
                 # explicitly confirms processing via PUT /subscriptions/{id} with sequence.
-            except (requests.RequestException, requests.Timeout, ConnectionError) as e:
+            except (httpx.HTTPError, httpx.InvalidURL, ConnectionError) as e:
                 logger.warning(
                     f"Callback seq={diff.get('sequence')} failed - peer did not respond: {e}"
                 )
@@ -1892,8 +1905,6 @@ class Actor:
         # Fire callback asynchronously to avoid blocking the caller
         async def _send_callback_async():
             """Send subscription callback using httpx (non-blocking)."""
-            import httpx
-
             try:
                 logger.debug(
                     "Doing async callback on subscription at url("
@@ -1902,12 +1913,13 @@ class Actor:
                     + str(data)
                     + ")"
                 )
-                async with httpx.AsyncClient(
-                    timeout=httpx.Timeout(10.0, connect=5.0)
-                ) as client:
-                    response = await client.post(
-                        requrl, content=data.encode("utf-8"), headers=headers
-                    )
+                client = await peer_transport.get_async_client()
+                response = await client.post(
+                    requrl,
+                    content=data.encode("utf-8"),
+                    headers=headers,
+                    timeout=peer_transport.DEFAULT_TIMEOUT,
+                )
                 self.last_response_code = response.status_code
                 self.last_response_message = (
                     response.content.decode("utf-8", "ignore")
@@ -2041,15 +2053,15 @@ class Actor:
 
             # Parse blob with explicit encoding handling for bytes
             if isinstance(blob, bytes):
-                data = json.loads(blob.decode("utf-8"))
+                data = json_codec.loads(blob.decode("utf-8"))
             elif isinstance(blob, str):
-                data = json.loads(blob)
+                data = json_codec.loads(blob)
             else:
                 data = blob
 
             if not isinstance(data, dict):
                 logger.debug(f"Cannot filter non-dict subscription data: {type(data)}")
-                return blob if isinstance(blob, str) else json.dumps(blob)
+                return blob if isinstance(blob, str) else json_codec.encode(blob)
 
             filtered_data = {}
             for property_name, value in data.items():
@@ -2081,7 +2093,7 @@ class Actor:
                 )
                 return None
 
-            return json.dumps(filtered_data)
+            return json_codec.encode(filtered_data)
         except Exception as e:
             logger.error(f"Permission filtering failed for subscription callback: {e}")
             return None  # Fail-closed: don't send data on error
@@ -2249,18 +2261,16 @@ class Actor:
         Returns:
             True if callback was sent successfully
         """
-        import httpx
-
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(
-                    callback_url,
-                    json=payload,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Authorization": f"Bearer {secret}",
-                    },
-                )
+            response = peer_transport.get_client().post(
+                callback_url,
+                json=payload,
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {secret}",
+                },
+                timeout=30.0,
+            )
 
             if response.status_code in (200, 204):
                 logger.info(
@@ -2291,18 +2301,17 @@ class Actor:
         """
 
         async def _send():
-            import httpx
-
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(
-                        callback_url,
-                        json=payload,
-                        headers={
-                            "Content-Type": "application/json",
-                            "Authorization": f"Bearer {secret}",
-                        },
-                    )
+                client = await peer_transport.get_async_client()
+                response = await client.post(
+                    callback_url,
+                    json=payload,
+                    headers={
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {secret}",
+                    },
+                    timeout=30.0,
+                )
 
                 if response.status_code in (200, 204):
                     logger.info(
@@ -2607,8 +2616,6 @@ class Actor:
         Returns:
             URL to fetch this diff
         """
-        import json
-
         from .db import get_subscription_diff
 
         if not self.config:
@@ -2622,7 +2629,7 @@ class Actor:
         )
 
         diff_handle = get_subscription_diff(self.config)
-        blob = json.dumps(data)
+        blob = json_codec.encode(data)
 
         logger.debug(f"Diff blob size: {len(blob)} chars")
 
@@ -2764,15 +2771,15 @@ class Actor:
                 # Create a json diff on the subpart that this subscription
                 # covers
                 try:
-                    jsonblob = json.loads(blob)
+                    jsonblob = json_codec.loads(blob)
                     if not subtarget:
-                        subblob = json.dumps(
+                        subblob = json_codec.encode(
                             jsonblob[sub_obj_data["subtarget"]][
                                 sub_obj_data["resource"]
                             ]
                         )
                     else:
-                        subblob = json.dumps(jsonblob[sub_obj_data["resource"]])
+                        subblob = json_codec.encode(jsonblob[sub_obj_data["resource"]])
                 except (TypeError, ValueError, KeyError):
                     # The diff does not contain the resource
                     logger.debug(
@@ -2794,7 +2801,7 @@ class Actor:
                 # If the subscription is for a target, send [subtarget][resource] = blob
                 upblob = {}
                 try:
-                    jsonblob = json.loads(blob)
+                    jsonblob = json_codec.loads(blob)
                     if not sub_obj_data["subtarget"]:
                         upblob[subtarget] = {}
                         upblob[subtarget][resource] = jsonblob
@@ -2806,7 +2813,7 @@ class Actor:
                         upblob[subtarget][resource] = blob
                     else:
                         upblob[resource] = blob
-                finblob = json.dumps(upblob)
+                finblob = json_codec.encode(upblob)
                 logger.debug(
                     "         - diff has resource(%s), subscription has not, adding diff(%s bytes)",
                     resource,
@@ -2818,8 +2825,8 @@ class Actor:
                 # covers
                 subblob = None
                 try:
-                    jsonblob = json.loads(blob)
-                    subblob = json.dumps(jsonblob[sub_obj_data["subtarget"]])
+                    jsonblob = json_codec.loads(blob)
+                    subblob = json_codec.encode(jsonblob[sub_obj_data["subtarget"]])
                 except (TypeError, ValueError, KeyError):
                     # The diff blob does not contain the subtarget
                     pass
@@ -2836,11 +2843,11 @@ class Actor:
                 # of diff to subscriber
                 upblob = {}
                 try:
-                    jsonblob = json.loads(blob)
+                    jsonblob = json_codec.loads(blob)
                     upblob[subtarget] = jsonblob
                 except (TypeError, ValueError, KeyError):
                     upblob[subtarget] = blob
-                finblob = json.dumps(upblob)
+                finblob = json_codec.encode(upblob)
                 logger.debug(
                     "         - diff has subtarget(%s), subscription has not, adding diff(%s chars)",
                     subtarget,
@@ -153,6 +153,60 @@ class Attributes:
             )
         return False
 
+    def insert_attr_if_absent(
+        self,
+        name: str | None = None,
+        data: Any | None = None,
+        timestamp: Any | None = None,
+        ttl_seconds: int | None = None,
+    ) -> bool:
+        """Create an attribute only if it does not already exist.
+
+        One conditional write on the bundled backends. A backend without
+        ``insert_attr_if_absent`` gets a read followed by a write, which is
+        not atomic across processes.
+
+        Returns:
+            True if this call created the attribute, False if it existed
+        """
+        if not self.actor_id or not self.bucket or not name or not data:
+            return False
+        if not self.dbprop:
+            return False
+        insert = getattr(self.dbprop, "insert_attr_if_absent", None)
+        if insert is None:
+            existing = self.dbprop.get_attr(
+                actor_id=self.actor_id, bucket=self.bucket, name=name
+            )
+            if existing:
+                return False
+            created = bool(
+                self.dbprop.set_attr(
+                    actor_id=self.actor_id,
+                    bucket=self.bucket,
+                    name=name,
+                    data=data,
+                    timestamp=timestamp,
+                    ttl_seconds=ttl_seconds,
+                )
+            )
+        else:
+            created = bool(
+                insert(
+                    actor_id=self.actor_id,
+                    bucket=self.bucket,
+                    name=name,
+                    data=data,
+                    timestamp=timestamp,
+                    ttl_seconds=ttl_seconds,
+                )
+            )
+        if created:
+            if self.data is None:
+                self.data = {}
+            self.data[name] = {"data": data, "timestamp": timestamp}
+        return created
+
     def conditional_update_attr(
         self,
         name: str | None = None,
@@ -1,12 +1,10 @@
 import base64
-import json
 import logging
 from typing import Any
 
 import httpx
-import requests
 
-from actingweb import request_context, trust
+from actingweb import json_codec, peer_transport, request_context, trust
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +32,8 @@ class AwProxy:
                  connect and read timeouts) or a tuple (connect_timeout, read_timeout).
                  Default: (5, 20) = 5s connect, 20s read timeout.
 
-    Provides both sync methods (using ``requests``) and async methods
-    (using ``httpx``) for peer communication:
+    Provides both sync and async methods for peer communication, on the
+    shared ``peer_transport`` clients (kept-alive connections per peer):
 
     - Sync: ``get_resource()``, ``create_resource()``, ``change_resource()``, ``delete_resource()``
     - Async: ``get_resource_async()``, ``create_resource_async()``, ``change_resource_async()``, ``delete_resource_async()``
@@ -148,19 +146,21 @@ class AwProxy:
                     bh["X-Parent-Request-ID"] = headers["X-Parent-Request-ID"]
             if data is None:
                 if method == "GET":
-                    return requests.get(url=url, headers=bh, timeout=self.timeout)
+                    return peer_transport.get(url=url, headers=bh, timeout=self.timeout)
                 if method == "DELETE":
-                    return requests.delete(url=url, headers=bh, timeout=self.timeout)
+                    return peer_transport.delete(
+                        url=url, headers=bh, timeout=self.timeout
+                    )
             else:
                 if method == "POST":
-                    return requests.post(
+                    return peer_transport.post(
                         url=url,
                         data=data,
                         headers={**bh, "Content-Type": "application/json"},
                         timeout=self.timeout,
                     )
                 if method == "PUT":
-                    return requests.put(
+                    return peer_transport.put(
                         url=url,
                         data=data,
                         headers={**bh, "Content-Type": "application/json"},
@@ -183,7 +183,9 @@ class AwProxy:
         headers = self._bearer_headers()
         logger.debug(f"Fetching peer resource from {url}")
         try:
-            response = requests.get(url=url, headers=headers, timeout=self.timeout)
+            response = peer_transport.get(
+                url=url, headers=headers, timeout=self.timeout
+            )
             # Retry with Basic if Bearer gets redirected/unauthorized/forbidden
             if response.status_code in (302, 401, 403):
                 retry = self._maybe_retry_with_basic("GET", url, headers=headers)
@@ -240,14 +242,14 @@ class AwProxy:
             params = {}
         if not self.trust or not self.trust["baseuri"] or not self.trust["secret"]:
             return None
-        data = json.dumps(params)
+        data = json_codec.encode(params)
         headers = {**self._bearer_headers(), "Content-Type": "application/json"}
         url = self.trust["baseuri"].strip("/") + "/" + path.strip("/")
         logger.debug(
             "Creating trust peer resource at (" + url + ") with data(" + str(data) + ")"
         )
         try:
-            response = requests.post(
+            response = peer_transport.post(
                 url=url, data=data, headers=headers, timeout=self.timeout
             )
             if response.status_code in (302, 401, 403):
@@ -297,7 +299,7 @@ class AwProxy:
             params = {}
         if not self.trust or not self.trust["baseuri"] or not self.trust["secret"]:
             return None
-        data = json.dumps(params)
+        data = json_codec.encode(params)
         # Use _bearer_headers() to include correlation headers
         headers = self._bearer_headers()
         headers["Content-Type"] = "application/json"
@@ -306,7 +308,7 @@ class AwProxy:
             "Changing trust peer resource at (" + url + ") with data(" + str(data) + ")"
         )
         try:
-            response = requests.put(
+            response = peer_transport.put(
                 url=url, data=data, headers=headers, timeout=self.timeout
             )
             if response.status_code in (302, 401, 403):
@@ -355,7 +357,9 @@ class AwProxy:
         url = self.trust["baseuri"].strip("/") + "/" + path.strip("/")
         logger.info(f"Deleting peer resource at {url}")
         try:
-            response = requests.delete(url=url, headers=headers, timeout=self.timeout)
+            response = peer_transport.delete(
+                url=url, headers=headers, timeout=self.timeout
+            )
             if response.status_code in (302, 401, 403):
                 retry = self._maybe_retry_with_basic("DELETE", url, headers=headers)
                 if retry is not None:
@@ -393,22 +397,32 @@ class AwProxy:
                     bh["X-Request-ID"] = headers["X-Request-ID"]
                 if "X-Parent-Request-ID" in headers:
                     bh["X-Parent-Request-ID"] = headers["X-Parent-Request-ID"]
-            async with httpx.AsyncClient(timeout=self._httpx_timeout) as client:
-                if data is None:
-                    if method == "GET":
-                        return await client.get(url, headers=bh)
-                    if method == "DELETE":
-                        return await client.delete(url, headers=bh)
-                else:
-                    final_headers = {**bh, "Content-Type": "application/json"}
-                    if method == "POST":
-                        return await client.post(
-                            url, content=data, headers=final_headers
-                        )
-                    if method == "PUT":
-                        return await client.put(
-                            url, content=data, headers=final_headers
-                        )
+            client = await peer_transport.get_async_client()
+            if data is None:
+                if method == "GET":
+                    return await client.get(
+                        url, headers=bh, timeout=self._httpx_timeout
+                    )
+                if method == "DELETE":
+                    return await client.delete(
+                        url, headers=bh, timeout=self._httpx_timeout
+                    )
+            else:
+                final_headers = {**bh, "Content-Type": "application/json"}
+                if method == "POST":
+                    return await client.post(
+                        url,
+                        content=data,
+                        headers=final_headers,
+                        timeout=self._httpx_timeout,
+                    )
+                if method == "PUT":
+                    return await client.put(
+                        url,
+                        content=data,
+                        headers=final_headers,
+                        timeout=self._httpx_timeout,
+                    )
         except Exception:
             return None
         return None
@@ -440,17 +454,19 @@ class AwProxy:
         headers = self._bearer_headers()
         logger.debug(f"Fetching peer resource async from {url}")
         try:
-            async with httpx.AsyncClient(timeout=self._httpx_timeout) as client:
-                response = await client.get(url, headers=headers)
-                # Retry with Basic if Bearer gets redirected/unauthorized/forbidden
-                if response.status_code in (302, 401, 403):
-                    retry = await self._maybe_retry_with_basic_async(
-                        "GET", url, headers=headers
-                    )
-                    if retry is not None:
-                        response = retry
-                self.last_response_code = response.status_code
-                self.last_response_message = response.content
+            client = await peer_transport.get_async_client()
+            response = await client.get(
+                url, headers=headers, timeout=self._httpx_timeout
+            )
+            # Retry with Basic if Bearer gets redirected/unauthorized/forbidden
+            if response.status_code in (302, 401, 403):
+                retry = await self._maybe_retry_with_basic_async(
+                    "GET", url, headers=headers
+                )
+                if retry is not None:
+                    response = retry
+            self.last_response_code = response.status_code
+            self.last_response_message = response.content
         except httpx.TimeoutException:
             logger.debug("Timeout getting peer resource async")
             self.last_response_code = 408
@@ -533,7 +549,7 @@ class AwProxy:
             params = {}
         if not self.trust or not self.trust["baseuri"] or not self.trust["secret"]:
             return None
-        data = json.dumps(params)
+        data = json_codec.encode(params)
         headers = {**self._bearer_headers(), "Content-Type": "application/json"}
         url = self.trust["baseuri"].strip("/") + "/" + path.strip("/")
         logger.debug(
@@ -544,16 +560,18 @@ class AwProxy:
             + ")"
         )
         try:
-            async with httpx.AsyncClient(timeout=self._httpx_timeout) as client:
-                response = await client.post(url, content=data, headers=headers)
-                if response.status_code in (302, 401, 403):
-                    retry = await self._maybe_retry_with_basic_async(
-                        "POST", url, data=data, headers=headers
-                    )
-                    if retry is not None:
-                        response = retry
-                self.last_response_code = response.status_code
-                self.last_response_message = response.content
+            client = await peer_transport.get_async_client()
+            response = await client.post(
+                url, content=data, headers=headers, timeout=self._httpx_timeout
+            )
+            if response.status_code in (302, 401, 403):
+                retry = await self._maybe_retry_with_basic_async(
+                    "POST", url, data=data, headers=headers
+                )
+                if retry is not None:
+                    response = retry
+            self.last_response_code = response.status_code
+            self.last_response_message = response.content
         except httpx.TimeoutException:
             logger.debug("Timeout creating peer resource async")
             self.last_response_code = 408
@@ -635,7 +653,7 @@ class AwProxy:
             params = {}
         if not self.trust or not self.trust["baseuri"] or not self.trust["secret"]:
             return None
-        data = json.dumps(params)
+        data = json_codec.encode(params)
         # Use _bearer_headers() to include correlation headers
         headers = self._bearer_headers()
         headers["Content-Type"] = "application/json"
@@ -648,16 +666,18 @@ class AwProxy:
             + ")"
         )
         try:
-            async with httpx.AsyncClient(timeout=self._httpx_timeout) as client:
-                response = await client.put(url, content=data, headers=headers)
-                if response.status_code in (302, 401, 403):
-                    retry = await self._maybe_retry_with_basic_async(
-                        "PUT", url, data=data, headers=headers
-                    )
-                    if retry is not None:
-                        response = retry
-                self.last_response_code = response.status_code
-                self.last_response_message = response.content
+            client = await peer_transport.get_async_client()
+            response = await client.put(
+                url, content=data, headers=headers, timeout=self._httpx_timeout
+            )
+            if response.status_code in (302, 401, 403):
+                retry = await self._maybe_retry_with_basic_async(
+                    "PUT", url, data=data, headers=headers
+                )
+                if retry is not None:
+                    response = retry
+            self.last_response_code = response.status_code
+            self.last_response_message = response.content
         except httpx.TimeoutException:
             logger.debug("Timeout changing peer resource async")
             self.last_response_code = 408
@@ -737,16 +757,18 @@ class AwProxy:
         url = self.trust["baseuri"].strip("/") + "/" + path.strip("/")
         logger.info(f"Deleting peer resource async at {url}")
         try:
-            async with httpx.AsyncClient(timeout=self._httpx_timeout) as client:
-                response = await client.delete(url, headers=headers)
-                if response.status_code in (302, 401, 403):
-                    retry = await self._maybe_retry_with_basic_async(
-                        "DELETE", url, headers=headers
-                    )
-                    if retry is not None:
-                        response = retry
-                self.last_response_code = response.status_code
-                self.last_response_message = response.content
+            client = await peer_transport.get_async_client()
+            response = await client.delete(
+                url, headers=headers, timeout=self._httpx_timeout
+            )
+            if response.status_code in (302, 401, 403):
+                retry = await self._maybe_retry_with_basic_async(
+                    "DELETE", url, headers=headers
+                )
+                if retry is not None:
+                    response = retry
+            self.last_response_code = response.status_code
+            self.last_response_message = response.content
         except httpx.TimeoutException:
             logger.debug("Timeout deleting peer resource async")
             self.last_response_code = 408
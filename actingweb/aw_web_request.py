@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Any
 
 
@@ -62,6 +63,18 @@ class AWResponse:
             self.body = body
         return None
 
+    def write_stream(
+        self, chunks: Iterable[str], content_type: str = "application/json"
+    ) -> None:
+        """Send ``chunks`` as the body, each as soon as it is produced.
+
+        The integrations send a streamed body with chunked transfer encoding
+        (no Content-Length) and read ``chunks`` only after the handler has
+        returned, so status and headers must be final when this is called.
+        """
+        self.stream: Iterable[str] | None = chunks
+        self.headers["Content-Type"] = content_type
+
     def set_cookie(
         self,
         name: str,
@@ -92,6 +105,8 @@ class AWResponse:
         self.status_message = "Ok"
         self.headers: dict[str, str] = {}
         self.body: str | bytes = ""
+        # Set by write_stream(): the body as an iterable of chunks
+        self.stream = None
         self.redirect: str | None = None
         self.cookies: list[dict[str, Any]] = []
         self.template_values: dict[str, Any] = {}
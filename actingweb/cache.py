@@ -0,0 +1,789 @@
+"""
+Bounded, TTL-aware caches with group eviction and generation stamps.
+
+The MCP handler grew the caching pattern this module generalises: module-level
+dicts of tokens, actor wrappers and trust relationships, swept periodically by
+full ``.copy()`` scans, evicted per actor by a linear scan of tuple keys, and
+guarded against refill races by a module-global generation counter. Every one
+of those pieces is needed by any endpoint that caches authorization-relevant
+state (``docs/guides/caching.md``), so they live here once:
+
+- **Size bound.** A cache holds at most ``max_entries`` items and drops the
+  least recently used when full, so an anonymous caller minting distinct keys
+  cannot grow it without limit.
+- **TTL.** Per cache, overridable per entry (a cached negative result usually
+  wants a much shorter life than a positive one). ``sliding=True`` measures the
+  TTL from last access instead of from insertion.
+- **Groups.** Every entry may carry a secondary key -- in practice an actor id.
+  :meth:`TTLCache.evict_group` drops all of a group's entries in time
+  proportional to the group, not to the cache.
+- **Generations.** :class:`CacheGeneration` is the time-of-check guard: a
+  request snapshots it before the storage reads that feed a cache and passes
+  the snapshot to :meth:`TTLCache.put`, which refuses the fill if an eviction
+  landed in between. One generation may be shared by several caches that are
+  invalidated together.
+
+Storage is pluggable. :class:`LocalCacheBackend` is the in-process default.
+:class:`AttributeCacheBackend` keeps entries in the attribute store so every
+worker of a multi-process deployment sees the same entries and the same
+evictions; it only holds JSON-serialisable values and costs a database round
+trip per access, so use it for values that are expensive to recompute and
+cheap to serialise, not for live objects such as ``ActorInterface``.
+
+Between the two sits :class:`ActorGenerations`: caches stay in process, but
+each actor has one counter row that every write to its cached state bumps.
+A worker re-reads an actor's counter at most once per ``ttl`` seconds and
+drops its local entries for that actor when the counter has moved, so a
+change made by one worker reaches the others within ``ttl`` at the cost of
+one small read per actor, not one read per cached item. The per-actor stores
+(trust permission overrides, peer permissions, profiles and capabilities)
+use it through :func:`actor_store_cache`, :func:`sync_actor` and
+:func:`bump_actor`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, MutableMapping
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for "use the cache's default TTL"; None already means "never expires".
+_DEFAULT_TTL: Any = object()
+_MISSING: Any = object()
+
+
+class CacheGeneration:
+    """Monotonic counter bumped by every invalidation of the caches that share it.
+
+    Deliberately coarse: the entry being invalidated is usually not known to
+    the reader until *after* the read that needs guarding, so there is nothing
+    finer to snapshot beforehand. An unrelated invalidation makes one fill be
+    skipped; that request still succeeds, it just pays full price.
+    """
+
+    def __init__(self) -> None:
+        self._value = 0
+        self.lock = threading.RLock()
+
+    @property
+    def current(self) -> int:
+        return self._value
+
+    def bump(self) -> int:
+        with self.lock:
+            self._value += 1
+            return self._value
+
+    def still_valid(self, snapshot: int | None) -> bool:
+        """False when an invalidation landed after ``snapshot`` was taken."""
+        if snapshot is None:
+            return True
+        return snapshot == self._value
+
+
+class CacheEntry:
+    """One cached value plus the bookkeeping the cache needs to expire it."""
+
+    __slots__ = ("value", "group", "stored_at", "accessed_at", "ttl")
+
+    def __init__(
+        self,
+        value: Any,
+        group: Hashable | None = None,
+        ttl: float | None = None,
+        stored_at: float | None = None,
+    ) -> None:
+        now = time.time() if stored_at is None else stored_at
+        self.value = value
+        self.group = group
+        self.ttl = ttl
+        self.stored_at = now
+        self.accessed_at = now
+
+    def is_expired(self, now: float, sliding: bool = False) -> bool:
+        if self.ttl is None:
+            return False
+        since = self.accessed_at if sliding else self.stored_at
+        return now - since > self.ttl
+
+
+class CacheBackend(Protocol):
+    """Storage behind a :class:`TTLCache`.
+
+    Backends store and return :class:`CacheEntry` objects; expiry, statistics
+    and generation checks are the front end's job. Implementations must be
+    safe to call from concurrent threads.
+    """
+
+    def load(self, key: Hashable, touch: bool = True) -> CacheEntry | None: ...
+
+    def store(self, key: Hashable, entry: CacheEntry) -> None: ...
+
+    def discard(self, key: Hashable) -> bool: ...
+
+    def discard_group(self, group: Hashable) -> list[Hashable]: ...
+
+    def discard_expired(self, now: float, sliding: bool) -> list[Hashable]: ...
+
+    def keys(self) -> list[Hashable]: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class LocalCacheBackend:
+    """In-process LRU storage with a secondary group index.
+
+    An ``OrderedDict`` in access order gives O(1) lookup, insert and LRU
+    eviction; the group index maps each group to the set of its keys so
+    group eviction never scans unrelated entries.
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._groups: dict[Hashable, set[Hashable]] = {}
+        self._lock = threading.Lock()
+
+    def _unlink(self, key: Hashable, entry: CacheEntry) -> None:
+        if entry.group is None:
+            return
+        members = self._groups.get(entry.group)
+        if members is not None:
+            members.discard(key)
+            if not members:
+                del self._groups[entry.group]
+
+    def load(self, key: Hashable, touch: bool = True) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and touch:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: Hashable, entry: CacheEntry) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._unlink(key, previous)
+            self._entries[key] = entry
+            if entry.group is not None:
+                self._groups.setdefault(entry.group, set()).add(key)
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    old_key, old_entry = self._entries.popitem(last=False)
+                    self._unlink(old_key, old_entry)
+                    self.evictions += 1
+
+    def discard(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._unlink(key, entry)
+            return True
+
+    def discard_group(self, group: Hashable) -> list[Hashable]:
+        with self._lock:
+            members = self._groups.pop(group, None)
+            if not members:
+                return []
+            for key in members:
+                self._entries.pop(key, None)
+            return list(members)
+
+    def discard_expired(self, now: float, sliding: bool) -> list[Hashable]:
+        """Drop expired entries from the least recently used end.
+
+        Stops at the first live entry, so a sweep costs O(expired), not
+        O(size). An expired entry that sits behind a live one is left for the
+        next access to it (which drops it) or for LRU eviction.
+        """
+        expired: list[Hashable] = []
+        with self._lock:
+            while self._entries:
+                key, entry = next(iter(self._entries.items()))
+                if not entry.is_expired(now, sliding):
+                    break
+                self._entries.popitem(last=False)
+                self._unlink(key, entry)
+                expired.append(key)
+        return expired
+
+    def keys(self) -> list[Hashable]:
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._groups.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class AttributeCacheBackend:
+    """Shared storage in the attribute store, visible to every worker.
+
+    Entries live in one bucket per cache namespace under
+    :data:`~actingweb.constants.SHARED_CACHE_STORE`, named by a digest of the
+    key. Group eviction is a generation bump rather than a delete sweep: each
+    group has a counter row, every entry records the counter it was written
+    under, and a read whose recorded counter no longer matches is a miss. That
+    makes :meth:`discard_group` a single conditional write however many
+    entries the group has, and makes it visible to all workers at once.
+
+    Keys must be strings or tuples of strings, values JSON-serialisable. The
+    database row carries the entry's TTL, so expired rows are also removed by
+    the backend's own TTL cleanup. There is no entry-count bound: the TTL is
+    what bounds the bucket.
+    """
+
+    def __init__(self, config: Any, namespace: str) -> None:
+        from .constants import SHARED_CACHE_BUCKET_PREFIX
+
+        self.config = config
+        self.namespace = namespace
+        self._bucket = f"{SHARED_CACHE_BUCKET_PREFIX}{namespace}"
+        self._group_bucket = f"{self._bucket}:groups"
+
+    def _attributes(self, bucket: str) -> Any:
+        from . import attribute
+        from .constants import SHARED_CACHE_STORE
+
+        return attribute.Attributes(
+            actor_id=SHARED_CACHE_STORE, bucket=bucket, config=self.config
+        )
+
+    @staticmethod
+    def _encode_key(key: Hashable) -> Any:
+        return list(key) if isinstance(key, tuple) else key
+
+    @staticmethod
+    def _decode_key(raw: Any) -> Hashable:
+        return tuple(raw) if isinstance(raw, list) else raw
+
+    @classmethod
+    def _attr_name(cls, key: Hashable) -> str:
+        encoded = json.dumps(cls._encode_key(key), separators=(",", ":"))
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    @staticmethod
+    def _group_name(group: Hashable) -> str:
+        encoded = json.dumps(
+            list(group) if isinstance(group, tuple) else group, separators=(",", ":")
+        )
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def _group_generation(self, group: Hashable) -> int:
+        record = self._attributes(self._group_bucket).get_attr(
+            name=self._group_name(group)
+        )
+        if record and isinstance(record.get("data"), dict):
+            return int(record["data"].get("gen", 0))
+        return 0
+
+    def load(self, key: Hashable, touch: bool = True) -> CacheEntry | None:
+        name = self._attr_name(key)
+        record = self._attributes(self._bucket).get_attr(name=name)
+        if not record or not isinstance(record.get("data"), dict):
+            return None
+        data = record["data"]
+        group = self._decode_key(data.get("group"))
+        if group is not None and data.get("gen", 0) != self._group_generation(group):
+            return None
+        entry = CacheEntry(
+            data.get("value"),
+            group=group,
+            ttl=data.get("ttl"),
+            stored_at=float(data.get("stored_at", 0.0)),
+        )
+        return entry
+
+    def store(self, key: Hashable, entry: CacheEntry) -> None:
+        data = {
+            "key": self._encode_key(key),
+            "value": entry.value,
+            "group": self._encode_key(entry.group),
+            "gen": self._group_generation(entry.group)
+            if entry.group is not None
+            else 0,
+            "stored_at": entry.stored_at,
+            "ttl": entry.ttl,
+        }
+        self._attributes(self._bucket).set_attr(
+            name=self._attr_name(key),
+            data=data,
+            ttl_seconds=int(entry.ttl) + 1 if entry.ttl is not None else None,
+        )
+
+    def discard(self, key: Hashable) -> bool:
+        return bool(
+            self._attributes(self._bucket).delete_attr_conditional(
+                name=self._attr_name(key)
+            )
+        )
+
+    def discard_group(self, group: Hashable) -> list[Hashable]:
+        bucket = self._attributes(self._group_bucket)
+        name = self._group_name(group)
+        # Compare-and-swap so two workers evicting at once both move the
+        # counter; a lost update would leave one eviction invisible.
+        for _ in range(5):
+            record = bucket.get_attr(name=name)
+            current = record.get("data") if record else None
+            generation = int(current.get("gen", 0)) if current else 0
+            new_data = {"gen": generation + 1}
+            if current is None:
+                if bucket.insert_attr_if_absent(name=name, data=new_data):
+                    return []
+            elif bucket.conditional_update_attr(
+                name=name, old_data=current, new_data=new_data
+            ):
+                return []
+            bucket.data.pop(name, None)
+        logger.warning("Shared cache %s: group eviction lost CAS race", self.namespace)
+        return []
+
+    def discard_expired(self, now: float, sliding: bool) -> list[Hashable]:
+        # Expired rows are invisible to load() and removed by the database's
+        # TTL cleanup; sweeping them here would be a full bucket read.
+        return []
+
+    def keys(self) -> list[Hashable]:
+        bucket = self._attributes(self._bucket).get_bucket() or {}
+        return [
+            self._decode_key(record["data"].get("key"))
+            for record in bucket.values()
+            if record and isinstance(record.get("data"), dict)
+        ]
+
+    def clear(self) -> None:
+        self._attributes(self._bucket).delete_bucket()
+        self._attributes(self._group_bucket).delete_bucket()
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+
+class TTLCache(MutableMapping[Hashable, Any]):
+    """A bounded TTL cache with group eviction and generation-guarded fills.
+
+    The mapping interface (``cache[key]``, ``in``, ``len``, iteration) honours
+    expiry and is meant for tests and introspection; request paths use
+    :meth:`lookup`, which also maintains the hit/miss statistics and
+    distinguishes a cached ``None`` from a miss.
+
+    Args:
+        name: Label used in logs and :meth:`stats`.
+        max_entries: Size bound for the default in-process backend.
+        ttl: Default entry lifetime in seconds; None for no expiry.
+        sliding: Measure the TTL from last access rather than from insertion.
+        group_of: Derives an entry's group from ``(key, value)`` when
+            :meth:`put` is not given one explicitly.
+        generation: A :class:`CacheGeneration` shared with sibling caches;
+            a private one is created when omitted.
+        backend: Storage; defaults to :class:`LocalCacheBackend`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int | None = 10_000,
+        ttl: float | None = None,
+        sliding: bool = False,
+        group_of: Callable[[Hashable, Any], Hashable | None] | None = None,
+        generation: CacheGeneration | None = None,
+        backend: CacheBackend | None = None,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.sliding = sliding
+        self.group_of = group_of
+        self.generation = generation if generation is not None else CacheGeneration()
+        self.backend: CacheBackend = (
+            backend if backend is not None else LocalCacheBackend(max_entries)
+        )
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+
+    # -- request-path API ----------------------------------------------------
+
+    def _load_live(self, key: Hashable) -> CacheEntry | None:
+        entry = self.backend.load(key)
+        if entry is None:
+            return None
+        now = time.time()
+        if entry.is_expired(now, self.sliding):
+            self.backend.discard(key)
+            self.expirations += 1
+            return None
+        if self.sliding:
+            entry.accessed_at = now
+        return entry
+
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+        """Return ``(hit, value)``. A hit may carry a cached ``None``."""
+        entry = self._load_live(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, entry.value
+
+    def entry(self, key: Hashable) -> CacheEntry | None:
+        """The raw entry for ``key`` regardless of expiry, for introspection.
+
+        Does not count as an access: LRU order and statistics are untouched.
+        """
+        return self.backend.load(key, touch=False)
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        group: Hashable | None = _MISSING,
+        ttl: float | None = _DEFAULT_TTL,
+        if_generation: int | None = None,
+    ) -> bool:
+        """Store ``value``. Returns False when the fill was refused.
+
+        ``if_generation`` is a snapshot from ``self.generation.current`` taken
+        before the storage reads that produced ``value``; if any invalidation
+        has happened since, the value may describe a revoked state and is not
+        cached. The check and the store happen under the generation lock, so
+        an invalidation cannot slip between them.
+        """
+        if group is _MISSING:
+            group = self.group_of(key, value) if self.group_of else None
+        entry = CacheEntry(
+            value, group=group, ttl=self.ttl if ttl is _DEFAULT_TTL else ttl
+        )
+        if if_generation is None:
+            self.backend.store(key, entry)
+            return True
+        with self.generation.lock:
+            if not self.generation.still_valid(if_generation):
+                return False
+            self.backend.store(key, entry)
+            return True
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop ``key`` and bump the generation. True if it was cached."""
+        with self.generation.lock:
+            self.generation.bump()
+            return self.backend.discard(key)
+
+    def evict_group(self, group: Hashable) -> int:
+        """Drop every entry in ``group`` and bump the generation.
+
+        The bump happens first and under the generation lock, so a fill that
+        snapshotted the generation before this call is refused even if it
+        lands after the entries are gone.
+        """
+        with self.generation.lock:
+            self.generation.bump()
+            return len(self.backend.discard_group(group))
+
+    def purge_expired(self) -> list[Hashable]:
+        """Drop expired entries; returns their keys. See the backend for cost."""
+        expired = self.backend.discard_expired(time.time(), self.sliding)
+        self.expirations += len(expired)
+        return expired
+
+    def stats(self) -> dict[str, Any]:
+        evictions = getattr(self.backend, "evictions", 0)
+        return {
+            "name": self.name,
+            "size": len(self.backend),
+            "hits": self.hits,
+            "misses": self.misses,
+            "expirations": self.expirations,
+            "evictions": evictions,
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+
+    # -- mapping interface ---------------------------------------------------
+
+    def __getitem__(self, key: Hashable) -> Any:
+        entry = self._load_live(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry.value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        if not self.backend.discard(key):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.backend.keys())
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    def items(self) -> list[tuple[Hashable, Any]]:  # type: ignore[override]
+        """Snapshot of live ``(key, value)`` pairs.
+
+        A list rather than a view: entries can expire or be evicted by another
+        thread between listing the keys and reading a value, which a live
+        view would surface as ``KeyError`` mid-iteration.
+        """
+        result = []
+        for key in self.backend.keys():
+            entry = self._load_live(key)
+            if entry is not None:
+                result.append((key, entry.value))
+        return result
+
+    def values(self) -> list[Any]:  # type: ignore[override]
+        return [value for _, value in self.items()]
+
+    def clear(self) -> None:
+        """Drop everything and bump the generation."""
+        with self.generation.lock:
+            self.generation.bump()
+            self.backend.clear()
+
+    def __repr__(self) -> str:
+        return f"<TTLCache {self.name!r} size={len(self.backend)}>"
+
+
+class ActorGenerations:
+    """Per-actor invalidation counters shared by every worker process.
+
+    Each actor has one counter row (``{"gen": n}`` in the actor's
+    :data:`~actingweb.constants.ACTOR_CACHE_GENERATION_BUCKET`). Writers call
+    :meth:`bump` after changing cached state; readers call :meth:`sync` before
+    consulting a registered cache, which evicts the actor's group from every
+    registered cache when the counter differs from the one this process last
+    saw. The counter itself is cached for ``ttl`` seconds, which is the bound
+    on how long another worker's change can go unnoticed.
+
+    Registered caches must group their entries by actor id. Fills should be
+    guarded with ``if_generation``: :meth:`sync` evicts through
+    :meth:`TTLCache.evict_group`, so a fill whose storage read predates the
+    eviction is refused.
+    """
+
+    def __init__(self, config: Any, ttl: float = 1.0, max_actors: int = 10_000) -> None:
+        self.config = config
+        self.ttl = ttl
+        # actor_id -> counter as last read from storage, trusted for ``ttl``
+        self._remote = TTLCache("actor_generations", max_entries=max_actors, ttl=ttl)
+        # actor_id -> counter the registered caches are consistent with. Larger
+        # than _remote so a busy process rarely forgets an actor it caches.
+        self._seen = TTLCache("actor_generations_seen", max_entries=max_actors * 4)
+        # id -> cache; TTLCache is a mapping and so not hashable itself
+        self._caches: weakref.WeakValueDictionary[int, TTLCache] = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+        self.remote_reads = 0
+        self.syncs_evicted = 0
+
+    def register(self, cache: TTLCache) -> TTLCache:
+        """Have :meth:`sync` evict from ``cache``. Returns ``cache``."""
+        self._caches[id(cache)] = cache
+        return cache
+
+    def _bucket(self, actor_id: str) -> Any:
+        from . import attribute
+        from .constants import ACTOR_CACHE_GENERATION_BUCKET
+
+        return attribute.Attributes(
+            actor_id=actor_id, bucket=ACTOR_CACHE_GENERATION_BUCKET, config=self.config
+        )
+
+    @staticmethod
+    def _generation_of(record: dict[str, Any] | None) -> int:
+        if record and isinstance(record.get("data"), dict):
+            return int(record["data"].get("gen", 0))
+        return 0
+
+    def _read(self, actor_id: str) -> int | None:
+        self.remote_reads += 1
+        try:
+            return self._generation_of(self._bucket(actor_id).get_attr(name="gen"))
+        except Exception as e:
+            logger.warning("Cache generation read failed for %s: %s", actor_id, e)
+            return None
+
+    def _evict_local(self, actor_id: str) -> None:
+        for cache in list(self._caches.values()):
+            cache.evict_group(actor_id)
+
+    def current(self, actor_id: str) -> int | None:
+        """The actor's counter, from storage at most once per ``ttl``."""
+        hit, generation = self._remote.lookup(actor_id)
+        if hit:
+            return int(generation)
+        generation = self._read(actor_id)
+        if generation is not None:
+            self._remote.put(actor_id, generation)
+        return generation
+
+    def sync(self, actor_id: str) -> bool:
+        """Evict the actor's local entries if another worker changed them.
+
+        Returns True when entries were evicted. An unreadable counter evicts
+        too: without it there is no telling what is still valid.
+        """
+        generation = self.current(actor_id)
+        with self._lock:
+            seen_hit, seen = self._seen.lookup(actor_id)
+            if seen_hit and generation is not None and seen == generation:
+                return False
+            # First sighting (or the seen table forgot this actor): the local
+            # caches may hold entries filled under an older counter.
+            self._evict_local(actor_id)
+            self.syncs_evicted += 1
+            if generation is not None:
+                self._seen.put(actor_id, generation)
+            else:
+                self._seen.invalidate(actor_id)
+            return True
+
+    def bump(self, actor_id: str) -> int | None:
+        """Advance the actor's counter so every other worker re-reads.
+
+        Call after the write has reached storage. Returns the new counter, or
+        None if it could not be advanced (logged; other workers then only
+        catch up when their entries expire).
+        """
+        bucket = self._bucket(actor_id)
+        for _ in range(5):
+            try:
+                record = bucket.get_attr(name="gen")
+                current = record.get("data") if record else None
+                generation = self._generation_of(record)
+                new_data = {"gen": generation + 1}
+                if current is None:
+                    stored = bucket.insert_attr_if_absent(name="gen", data=new_data)
+                else:
+                    stored = bucket.conditional_update_attr(
+                        name="gen", old_data=current, new_data=new_data
+                    )
+            except Exception as e:
+                logger.warning("Cache generation bump failed for %s: %s", actor_id, e)
+                break
+            if stored:
+                with self._lock:
+                    seen_hit, seen = self._seen.lookup(actor_id)
+                    if not seen_hit or seen != generation:
+                        # Changes by other workers went unnoticed so far.
+                        self._evict_local(actor_id)
+                    self._seen.put(actor_id, generation + 1)
+                    self._remote.put(actor_id, generation + 1)
+                return generation + 1
+            bucket.data.pop("gen", None)
+        else:
+            logger.warning("Cache generation bump for %s lost CAS race", actor_id)
+        with self._lock:
+            self._remote.invalidate(actor_id)
+        return None
+
+    def forget(self, actor_id: str) -> None:
+        """Drop what this process knows about the actor's counter."""
+        with self._lock:
+            self._remote.invalidate(actor_id)
+            self._seen.invalidate(actor_id)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "actors": len(self._seen),
+            "remote_reads": self.remote_reads,
+            "syncs_evicted": self.syncs_evicted,
+            "caches": len(self._caches),
+        }
+
+
+# Config -> its ActorGenerations. Keyed by config so separate apps (and tests)
+# never share counters or registered caches.
+_actor_generations: weakref.WeakKeyDictionary[Any, ActorGenerations] = (
+    weakref.WeakKeyDictionary()
+)
+_actor_generations_lock = threading.Lock()
+
+
+def actor_generations(config: Any) -> ActorGenerations | None:
+    """The config's :class:`ActorGenerations`, or None when coherence is off.
+
+    Enabled by ``config.cache_coherence``; ``config.cache_coherence_ttl`` is
+    the counter's local lifetime.
+    """
+    if config is None or getattr(config, "cache_coherence", False) is not True:
+        return None
+    generations = _actor_generations.get(config)
+    if generations is None:
+        with _actor_generations_lock:
+            generations = _actor_generations.get(config)
+            if generations is None:
+                ttl = getattr(config, "cache_coherence_ttl", 1.0)
+                generations = ActorGenerations(
+                    config, ttl=float(ttl) if isinstance(ttl, int | float) else 1.0
+                )
+                _actor_generations[config] = generations
+    return generations
+
+
+def _actor_of(key: Hashable, _value: Any) -> Hashable | None:
+    if isinstance(key, str):
+        return key.partition(":")[0]
+    return None
+
+
+def actor_store_cache(name: str, config: Any) -> TTLCache:
+    """A bounded local cache for a per-actor store keyed ``"{actor_id}:{...}"``.
+
+    Entries are grouped by actor id so :class:`ActorGenerations` can evict
+    them. ``config.store_cache_max_entries`` bounds the size (default 10,000).
+    """
+    max_entries = getattr(config, "store_cache_max_entries", 10_000)
+    return TTLCache(
+        name,
+        max_entries=max_entries if isinstance(max_entries, int) else 10_000,
+        group_of=_actor_of,
+    )
+
+
+def sync_actor(config: Any, actor_id: str, cache: TTLCache) -> None:
+    """Before reading ``cache`` for ``actor_id``: catch up with other workers.
+
+    A no-op unless ``config.cache_coherence`` is on. Registering on use rather
+    than at construction keeps a store built before coherence was enabled
+    (stores are created at application startup) covered too.
+    """
+    generations = actor_generations(config)
+    if generations is not None:
+        generations.register(cache)
+        generations.sync(actor_id)
+
+
+def bump_actor(config: Any, actor_id: str, cache: TTLCache) -> None:
+    """After writing ``actor_id``'s state: tell the other workers.
+
+    A no-op unless ``config.cache_coherence`` is on.
+    """
+    generations = actor_generations(config)
+    if generations is not None:
+        generations.register(cache)
+        generations.bump(actor_id)
@@ -166,6 +166,37 @@ class Config:
         # (allow all); set specific origins to restrict cross-origin access in
         # production. An empty list is treated as ["*"] by the handler.
         self.spa_cors_origins: list[str] = ["*"]
+        # Number of actor ids the single-use login records (id_token replay
+        # markers, OAuth state nonces, mobile tickets) are spread over. 1 keeps
+        # them all on the OAuth2 system actor; raise it on DynamoDB when login
+        # storms make that actor's partition hot. See system_shard_actor_id().
+        self.oauth2_system_shards: int = 1
+        # Remember id_tokens this process has accepted, so an in-process replay
+        # is rejected without a database round trip.
+        self.id_token_replay_prefilter: bool = True
+        # Keep the per-actor store caches (trust permission overrides, peer
+        # permissions, profiles, capabilities) coherent across worker
+        # processes through a per-actor generation row; see
+        # actingweb.cache.ActorGenerations. Off by default: a single-process
+        # deployment does not need the extra read.
+        self.cache_coherence: bool = False
+        # Seconds a worker trusts its last read of an actor's generation row,
+        # i.e. how long another worker's change can go unnoticed.
+        self.cache_coherence_ttl: float = 1.0
+        # Size bound of each per-actor store cache (LRU beyond it).
+        self.store_cache_max_entries: int = 10_000
+        # Keep each actor's last rendering of each www page and re-render
+        # only when the page's data changes; see
+        # actingweb.interface.integrations.www_templates.
+        self.www_fragment_cache: bool = False
+        # Send property, trust and subscription listings with at least this
+        # many entries as streamed (chunked) JSON; see actingweb.json_stream.
+        # None buffers every listing.
+        self.stream_listings_min_items: int | None = None
+        # Keep snapshots of the properties of this many recently used actors
+        # across requests, validated by a per-actor version counter; see
+        # actingweb.property_snapshot. None reads properties per request.
+        self.property_snapshot_max_actors: int | None = None
         self.bot = {
             "token": "",
             "email": "",
@@ -384,6 +415,8 @@ class Config:
 
         This method is called when features are dynamically enabled after
         Config initialization (e.g., via ActingWebApp builder methods).
+        The encoded /meta documents (``actingweb.discovery``) follow
+        ``aw_supported`` and are rebuilt on next use.
         """
         # Parse existing options into a set
         current_options = set(self.aw_supported.split(","))
@@ -103,6 +103,11 @@ OAUTH2_SYSTEM_ACTOR = "_actingweb_oauth2"
 # cannot be destroyed by the deletion it describes.
 DELETED_ACTORS_STORE = "_actingweb_deleted"
 
+# Shared cache store (actingweb.cache.AttributeCacheBackend). Like the
+# tombstone store, an id that is never itself an actor: cache rows are
+# disposable and must not be wiped with, or keep alive, any real actor.
+SHARED_CACHE_STORE = "_actingweb_cache"
+
 # Standard Bucket Names for Global Data
 # =====================================
 # These bucket names are used consistently across the system
@@ -132,6 +137,20 @@ OAUTH_SESSION_BUCKET = (
     "_oauth_sessions"  # Temporary OAuth sessions for postponed actor creation
 )
 
+# Shared cache buckets, one per cache namespace: "_cache:<namespace>"
+SHARED_CACHE_BUCKET_PREFIX = "_cache:"
+
+# Cached /meta documents of peer actors by base URI (under SHARED_CACHE_STORE)
+PEER_META_BUCKET = f"{SHARED_CACHE_BUCKET_PREFIX}peer_meta"
+
+# Per-actor cache generation counter (actingweb.cache.ActorGenerations). Kept
+# on the actor itself so deleting the actor removes it.
+ACTOR_CACHE_GENERATION_BUCKET = "_cache_generation"
+
+# Per-actor property version counter (actingweb.property_snapshot), advanced
+# by every property write. Kept on the actor itself like the one above.
+PROPERTY_VERSION_BUCKET = "_property_version"
+
 # id_token replay protection (native OIDC / JWT-bearer grant)
 ID_TOKEN_REPLAY_BUCKET = "_id_token_replay"  # Seen id_token jti/sub+iat markers
 
@@ -35,15 +35,58 @@ This pattern provides:
 - Explicitness: Clear configuration dependencies
 - Testability: Easy to mock and test
 - Maintainability: No hidden factory patterns or monkey-patching
+
+Request Identity Map
+--------------------
+During a request (``request_context.set_request_context()``) ``get_actor()``,
+``get_trust()``, ``get_trust_list()``, ``get_subscription()`` and
+``get_subscription_list()`` read through a per-request identity map, so each
+row is read from the backend at most once per request; writes go to the
+backend and evict the cached rows. See ``actingweb.db.identity_map``.
+
+Query Instrumentation
+---------------------
+With ``actingweb.db.instrumentation`` enabled, every accessor's object times
+its calls and records operation, table, latency, items and (DynamoDB)
+consumed capacity in the request's query log; a summary is logged when the
+request ends and slow calls are logged as they happen. Disabled (the
+default), the accessors return the backend objects unwrapped.
+
+Async Accessors
+---------------
+``get_property_async()``, ``get_attribute_async()``, ``get_trust_async()`` etc.
+return objects whose methods are awaitable (see the ``Async*Protocol`` classes
+in ``actingweb.db.protocols``), for use from async handlers:
+
+    db = get_property_async(config)
+    value = await db.get(actor_id="abc123", name="email")
+
+A backend module that provides native ``Async*`` classes is used directly:
+PostgreSQL on ``psycopg_pool.AsyncConnectionPool``, DynamoDB on a shared
+aiobotocore client (when aiobotocore is installed). Otherwise the sync
+implementation is run in a worker thread per call.
 """
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+from typing import TYPE_CHECKING, Any, cast
 
 from actingweb.db.exceptions import DbError
+from actingweb.db.identity_map import identity_mapped
+from actingweb.db.instrumentation import instrumented
+from actingweb.property_snapshot import versioned
 
 if TYPE_CHECKING:
     from actingweb.config import Config
     from actingweb.db.protocols import (
+        AsyncDbAttributeProtocol,
+        AsyncDbPropertyListProtocol,
+        AsyncDbPropertyProtocol,
+        AsyncDbSubscriptionDiffListProtocol,
+        AsyncDbSubscriptionDiffProtocol,
+        AsyncDbSubscriptionListProtocol,
+        AsyncDbSubscriptionProtocol,
+        AsyncDbTrustListProtocol,
+        AsyncDbTrustProtocol,
         DbActorListProtocol,
         DbActorProtocol,
         DbAttributeBucketListProtocol,
@@ -85,10 +128,11 @@ def get_property(config: "Config") -> "DbPropertyProtocol":
         >>> db = get_property(config)
         >>> db.set(actor_id="abc123", name="email", value="user@example.com")
     """
-    return config.DbProperty.DbProperty(
+    db = config.DbProperty.DbProperty(
         use_lookup_table=config.use_lookup_table,
         indexed_properties=config.indexed_properties,
     )
+    return cast("DbPropertyProtocol", versioned(instrumented("property", db), config))
 
 
 def get_property_list(config: "Config") -> "DbPropertyListProtocol":
@@ -109,10 +153,14 @@ def get_property_list(config: "Config") -> "DbPropertyListProtocol":
         >>> db_list = get_property_list(config)
         >>> props = db_list.fetch(actor_id="abc123")
     """
-    return config.DbProperty.DbPropertyList(
+    db = config.DbProperty.DbPropertyList(
         use_lookup_table=config.use_lookup_table,
         indexed_properties=config.indexed_properties,
     )
+    return cast(
+        "DbPropertyListProtocol",
+        versioned(instrumented("property_list", db), config, listing=True),
+    )
 
 
 # =============================================================================
@@ -134,7 +182,10 @@ def get_actor(config: "Config") -> "DbActorProtocol":
         >>> db = get_actor(config)
         >>> actor_data = db.get(actor_id="abc123")
     """
-    return config.DbActor.DbActor()
+    return cast(
+        "DbActorProtocol",
+        identity_mapped("actor", instrumented("actor", config.DbActor.DbActor())),
+    )
 
 
 def get_actor_list(config: "Config") -> "DbActorListProtocol":
@@ -151,7 +202,9 @@ def get_actor_list(config: "Config") -> "DbActorListProtocol":
         >>> db_list = get_actor_list(config)
         >>> all_actors = db_list.fetch()
     """
-    return config.DbActor.DbActorList()
+    return cast(
+        "DbActorListProtocol", instrumented("actor_list", config.DbActor.DbActorList())
+    )
 
 
 # =============================================================================
@@ -173,7 +226,10 @@ def get_trust(config: "Config") -> "DbTrustProtocol":
         >>> db = get_trust(config)
         >>> trust_data = db.get(actor_id="abc123", peerid="peer456")
     """
-    return config.DbTrust.DbTrust()
+    return cast(
+        "DbTrustProtocol",
+        identity_mapped("trust", instrumented("trust", config.DbTrust.DbTrust())),
+    )
 
 
 def get_trust_list(config: "Config") -> "DbTrustListProtocol":
@@ -190,7 +246,12 @@ def get_trust_list(config: "Config") -> "DbTrustListProtocol":
         >>> db_list = get_trust_list(config)
         >>> all_trusts = db_list.fetch(actor_id="abc123")
     """
-    return config.DbTrust.DbTrustList()
+    return cast(
+        "DbTrustListProtocol",
+        identity_mapped(
+            "trust_list", instrumented("trust_list", config.DbTrust.DbTrustList())
+        ),
+    )
 
 
 # =============================================================================
@@ -212,7 +273,10 @@ def get_peer_trustee(config: "Config") -> "DbPeerTrusteeProtocol":
         >>> db = get_peer_trustee(config)
         >>> peer_data = db.get(actor_id="abc123", peer_type="myapp")
     """
-    return config.DbPeerTrustee.DbPeerTrustee()
+    return cast(
+        "DbPeerTrusteeProtocol",
+        instrumented("peer_trustee", config.DbPeerTrustee.DbPeerTrustee()),
+    )
 
 
 def get_peer_trustee_list(config: "Config") -> "DbPeerTrusteeListProtocol":
@@ -229,7 +293,10 @@ def get_peer_trustee_list(config: "Config") -> "DbPeerTrusteeListProtocol":
         >>> db_list = get_peer_trustee_list(config)
         >>> all_peers = db_list.fetch(actor_id="abc123")
     """
-    return config.DbPeerTrustee.DbPeerTrusteeList()
+    return cast(
+        "DbPeerTrusteeListProtocol",
+        instrumented("peer_trustee_list", config.DbPeerTrustee.DbPeerTrusteeList()),
+    )
 
 
 # =============================================================================
@@ -251,7 +318,13 @@ def get_subscription(config: "Config") -> "DbSubscriptionProtocol":
         >>> db = get_subscription(config)
         >>> sub_data = db.get(actor_id="abc123", subid="sub789")
     """
-    return config.DbSubscription.DbSubscription()
+    return cast(
+        "DbSubscriptionProtocol",
+        identity_mapped(
+            "subscription",
+            instrumented("subscription", config.DbSubscription.DbSubscription()),
+        ),
+    )
 
 
 def get_subscription_list(config: "Config") -> "DbSubscriptionListProtocol":
@@ -268,7 +341,15 @@ def get_subscription_list(config: "Config") -> "DbSubscriptionListProtocol":
         >>> db_list = get_subscription_list(config)
         >>> all_subs = db_list.fetch(actor_id="abc123")
     """
-    return config.DbSubscription.DbSubscriptionList()
+    return cast(
+        "DbSubscriptionListProtocol",
+        identity_mapped(
+            "subscription_list",
+            instrumented(
+                "subscription_list", config.DbSubscription.DbSubscriptionList()
+            ),
+        ),
+    )
 
 
 # =============================================================================
@@ -290,7 +371,12 @@ def get_subscription_diff(config: "Config") -> "DbSubscriptionDiffProtocol":
         >>> db = get_subscription_diff(config)
         >>> diff_data = db.get(actor_id="abc123", subid="sub789", seqnr=5)
     """
-    return config.DbSubscriptionDiff.DbSubscriptionDiff()
+    return cast(
+        "DbSubscriptionDiffProtocol",
+        instrumented(
+            "subscription_diff", config.DbSubscriptionDiff.DbSubscriptionDiff()
+        ),
+    )
 
 
 def get_subscription_diff_list(config: "Config") -> "DbSubscriptionDiffListProtocol":
@@ -307,7 +393,12 @@ def get_subscription_diff_list(config: "Config") -> "DbSubscriptionDiffListProto
         >>> db_list = get_subscription_diff_list(config)
         >>> all_diffs = db_list.fetch(actor_id="abc123", subid="sub789")
     """
-    return config.DbSubscriptionDiff.DbSubscriptionDiffList()
+    return cast(
+        "DbSubscriptionDiffListProtocol",
+        instrumented(
+            "subscription_diff_list", config.DbSubscriptionDiff.DbSubscriptionDiffList()
+        ),
+    )
 
 
 # =============================================================================
@@ -332,7 +423,13 @@ def get_subscription_suspension(
         >>> db = get_subscription_suspension(config, actor_id="my-actor")
         >>> db.suspend(target="properties", subtarget="email")
     """
-    return config.DbSubscriptionSuspension.DbSubscriptionSuspension(actor_id)
+    return cast(
+        "SubscriptionSuspensionProtocol",
+        instrumented(
+            "subscription_suspension",
+            config.DbSubscriptionSuspension.DbSubscriptionSuspension(actor_id),
+        ),
+    )
 
 
 # =============================================================================
@@ -362,7 +459,10 @@ def get_attribute(config: "Config") -> "DbAttributeProtocol":
         ...     data={"name": "John", "email": "john@example.com"}
         ... )
     """
-    return config.DbAttribute.DbAttribute()
+    return cast(
+        "DbAttributeProtocol",
+        instrumented("attribute", config.DbAttribute.DbAttribute()),
+    )
 
 
 def get_attribute_bucket_list(config: "Config") -> "DbAttributeBucketListProtocol":
@@ -379,7 +479,171 @@ def get_attribute_bucket_list(config: "Config") -> "DbAttributeBucketListProtoco
         >>> db_list = get_attribute_bucket_list(config)
         >>> all_attrs = db_list.fetch(actor_id="abc123")
     """
-    return config.DbAttribute.DbAttributeBucketList()
+    return cast(
+        "DbAttributeBucketListProtocol",
+        instrumented(
+            "attribute_bucket_list", config.DbAttribute.DbAttributeBucketList()
+        ),
+    )
+
+
+# =============================================================================
+# Async Database Accessors
+# =============================================================================
+
+
+class _ThreadedAsyncDb:
+    """Awaitable facade over a sync DB object, for backends without native
+    ``Async*`` classes: each method call runs in a worker thread. Attributes
+    such as ``handle`` are read through from the wrapped object."""
+
+    def __init__(self, db: Any) -> None:
+        self._db = db
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._db, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await asyncio.to_thread(attr, *args, **kwargs)
+
+        return call
+
+
+def _native_async(module: Any, name: str) -> Any:
+    """The backend's native ``Async*`` class ``name``, or None if it has none
+    or its async driver is not installed (``ASYNC_DB_AVAILABLE`` of the
+    backend module's ``_async`` helper module, where it has one)."""
+    helpers = getattr(module, "_async", None)
+    if not getattr(helpers, "ASYNC_DB_AVAILABLE", True):
+        return None
+    return getattr(module, name, None)
+
+
+def get_property_async(config: "Config") -> "AsyncDbPropertyProtocol":
+    """Async counterpart of :func:`get_property`.
+
+    Example:
+        >>> db = get_property_async(config)
+        >>> await db.set(actor_id="abc123", name="email", value="user@example.com")
+    """
+    cls = _native_async(config.DbProperty, "AsyncDbProperty")
+    if cls is not None:
+        db = cls(
+            use_lookup_table=config.use_lookup_table,
+            indexed_properties=config.indexed_properties,
+        )
+        return cast(
+            "AsyncDbPropertyProtocol",
+            versioned(instrumented("property", db), config),
+        )
+    return cast("AsyncDbPropertyProtocol", _ThreadedAsyncDb(get_property(config)))
+
+
+def get_property_list_async(config: "Config") -> "AsyncDbPropertyListProtocol":
+    """Async counterpart of :func:`get_property_list` (``fetch`` only)."""
+    cls = _native_async(config.DbProperty, "AsyncDbPropertyList")
+    if cls is not None:
+        db = cls(
+            use_lookup_table=config.use_lookup_table,
+            indexed_properties=config.indexed_properties,
+        )
+        return cast(
+            "AsyncDbPropertyListProtocol",
+            versioned(instrumented("property_list", db), config, listing=True),
+        )
+    return cast(
+        "AsyncDbPropertyListProtocol", _ThreadedAsyncDb(get_property_list(config))
+    )
+
+
+def get_trust_async(config: "Config") -> "AsyncDbTrustProtocol":
+    """Async counterpart of :func:`get_trust`.
+
+    Example:
+        >>> db = get_trust_async(config)
+        >>> trust_data = await db.get(actor_id="abc123", peerid="peer456")
+    """
+    cls = _native_async(config.DbTrust, "AsyncDbTrust")
+    if cls is not None:
+        return cast("AsyncDbTrustProtocol", instrumented("trust", cls()))
+    return cast("AsyncDbTrustProtocol", _ThreadedAsyncDb(get_trust(config)))
+
+
+def get_trust_list_async(config: "Config") -> "AsyncDbTrustListProtocol":
+    """Async counterpart of :func:`get_trust_list` (``fetch`` only)."""
+    cls = _native_async(config.DbTrust, "AsyncDbTrustList")
+    if cls is not None:
+        return cast("AsyncDbTrustListProtocol", instrumented("trust_list", cls()))
+    return cast("AsyncDbTrustListProtocol", _ThreadedAsyncDb(get_trust_list(config)))
+
+
+def get_subscription_async(config: "Config") -> "AsyncDbSubscriptionProtocol":
+    """Async counterpart of :func:`get_subscription`."""
+    cls = _native_async(config.DbSubscription, "AsyncDbSubscription")
+    if cls is not None:
+        return cast("AsyncDbSubscriptionProtocol", instrumented("subscription", cls()))
+    return cast(
+        "AsyncDbSubscriptionProtocol", _ThreadedAsyncDb(get_subscription(config))
+    )
+
+
+def get_subscription_list_async(
+    config: "Config",
+) -> "AsyncDbSubscriptionListProtocol":
+    """Async counterpart of :func:`get_subscription_list` (``fetch`` only)."""
+    cls = _native_async(config.DbSubscription, "AsyncDbSubscriptionList")
+    if cls is not None:
+        return cast(
+            "AsyncDbSubscriptionListProtocol", instrumented("subscription_list", cls())
+        )
+    return cast(
+        "AsyncDbSubscriptionListProtocol",
+        _ThreadedAsyncDb(get_subscription_list(config)),
+    )
+
+
+def get_subscription_diff_async(config: "Config") -> "AsyncDbSubscriptionDiffProtocol":
+    """Async counterpart of :func:`get_subscription_diff`."""
+    cls = _native_async(config.DbSubscriptionDiff, "AsyncDbSubscriptionDiff")
+    if cls is not None:
+        return cast(
+            "AsyncDbSubscriptionDiffProtocol", instrumented("subscription_diff", cls())
+        )
+    return cast(
+        "AsyncDbSubscriptionDiffProtocol",
+        _ThreadedAsyncDb(get_subscription_diff(config)),
+    )
+
+
+def get_subscription_diff_list_async(
+    config: "Config",
+) -> "AsyncDbSubscriptionDiffListProtocol":
+    """Async counterpart of :func:`get_subscription_diff_list`."""
+    cls = _native_async(config.DbSubscriptionDiff, "AsyncDbSubscriptionDiffList")
+    if cls is not None:
+        return cast(
+            "AsyncDbSubscriptionDiffListProtocol",
+            instrumented("subscription_diff_list", cls()),
+        )
+    return cast(
+        "AsyncDbSubscriptionDiffListProtocol",
+        _ThreadedAsyncDb(get_subscription_diff_list(config)),
+    )
+
+
+def get_attribute_async(config: "Config") -> "AsyncDbAttributeProtocol":
+    """Async counterpart of :func:`get_attribute`.
+
+    Example:
+        >>> db = get_attribute_async(config)
+        >>> attr = await db.get_attr(actor_id="abc123", bucket="cache", name="k")
+    """
+    cls = _native_async(config.DbAttribute, "AsyncDbAttribute")
+    if cls is not None:
+        return cast("AsyncDbAttributeProtocol", instrumented("attribute", cls()))
+    return cast("AsyncDbAttributeProtocol", _ThreadedAsyncDb(get_attribute(config)))
 
 
 # =============================================================================
@@ -418,6 +682,15 @@ def get_db_accessors() -> dict[str, Any]:
         "subscription_suspension": get_subscription_suspension,
         "attribute": get_attribute,
         "attribute_bucket_list": get_attribute_bucket_list,
+        "property_async": get_property_async,
+        "property_list_async": get_property_list_async,
+        "trust_async": get_trust_async,
+        "trust_list_async": get_trust_list_async,
+        "subscription_async": get_subscription_async,
+        "subscription_list_async": get_subscription_list_async,
+        "subscription_diff_async": get_subscription_diff_async,
+        "subscription_diff_list_async": get_subscription_diff_list_async,
+        "attribute_async": get_attribute_async,
     }
 
 
@@ -445,6 +718,16 @@ __all__ = [
     # Attribute accessors
     "get_attribute",
     "get_attribute_bucket_list",
+    # Async accessors
+    "get_property_async",
+    "get_property_list_async",
+    "get_trust_async",
+    "get_trust_list_async",
+    "get_subscription_async",
+    "get_subscription_list_async",
+    "get_subscription_diff_async",
+    "get_subscription_diff_list_async",
+    "get_attribute_async",
     # Utility
     "get_db_accessors",
 ]
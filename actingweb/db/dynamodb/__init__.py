@@ -11,6 +11,7 @@ re-implementing the environment parsing.
 """
 
 # Import all database classes for backward compatibility and convenience
+from ._async import close_client as close_async_client
 from ._ensure import auto_create_enabled, reset_ensure_cache, set_auto_create
 from .actor import Actor, CreatorIndex, DbActor, DbActorList
 from .attribute import Attribute, DbAttribute, DbAttributeBucketList
@@ -31,6 +32,8 @@ __all__ = [
     "auto_create_enabled",
     "set_auto_create",
     "reset_ensure_cache",
+    # Shutdown of the shared aiobotocore client used by the Async* classes
+    "close_async_client",
     # Actor
     "Actor",
     "CreatorIndex",
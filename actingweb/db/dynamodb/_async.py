@@ -0,0 +1,280 @@
+"""
+Non-blocking DynamoDB I/O for the ``Async*`` DB classes.
+
+The PynamoDB models stay the single definition of every table: requests are
+built and items decoded through them, so the async classes read and write
+exactly the items (names, key layout, attribute types) the sync classes do.
+Only the network calls differ. They go through one shared aiobotocore client
+per event loop, configured like the PynamoDB connection:
+
+- ``AWS_DEFAULT_REGION`` / ``AWS_DB_HOST`` for region and endpoint,
+- ``AWS_DB_MAX_POOL_CONNECTIONS``: HTTP connections the client keeps
+  (default: 50),
+- ``AWS_DB_MAX_RETRY_ATTEMPTS``: retries on throttling and 5xx (default: 3).
+
+aiobotocore is optional. Without it :data:`ASYNC_DB_AVAILABLE` is False and
+``actingweb.db``'s async accessors run the sync classes in a worker thread.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import weakref
+from contextlib import AsyncExitStack
+from typing import Any, TypeVar
+
+from pynamodb.expressions.condition import Condition
+from pynamodb.expressions.update import Action
+from pynamodb.models import Model
+
+from actingweb.db import instrumentation
+from actingweb.db.dynamodb._instrument import consumed_capacity_units
+
+logger = logging.getLogger(__name__)
+
+ASYNC_DB_AVAILABLE = importlib.util.find_spec("aiobotocore") is not None
+
+_M = TypeVar("_M", bound=Model)
+
+
+class _LoopClient:
+    """A loop's client and what closes it."""
+
+    __slots__ = ("client", "closer")
+
+    def __init__(self, client: Any, closer: Any) -> None:
+        self.client = client
+        self.closer = closer
+
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_client_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _close_at_shutdown(
+    loop: asyncio.AbstractEventLoop, stack: AsyncExitStack
+) -> Any:
+    """Forgets ``loop``'s client and closes ``stack`` when finalized.
+
+    Started once, the generator is one of the loop's async generators, which
+    ``loop.shutdown_asyncgens()`` (run by ``asyncio.run()`` and uvicorn
+    before they close the loop) finalizes on that loop.
+    """
+    try:
+        yield
+    finally:
+        _clients.pop(loop, None)
+        await stack.aclose()
+        logger.info("Closed async DynamoDB client")
+
+
+async def get_client() -> Any:
+    """
+    Get or create the shared aiobotocore DynamoDB client for the running loop.
+
+    Each loop has its own client, closed when the loop shuts down its async
+    generators or by :func:`close_client`.
+
+    Raises:
+        ImportError: If aiobotocore is not installed
+    """
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(loop)
+    if entry is not None:
+        return entry.client
+
+    lock = _client_locks.get(loop)
+    if lock is None:
+        lock = _client_locks[loop] = asyncio.Lock()
+    async with lock:
+        entry = _clients.get(loop)
+        if entry is not None:
+            return entry.client
+        try:
+            from aiobotocore.config import AioConfig  # type: ignore[import-untyped]
+            from aiobotocore.session import get_session  # type: ignore[import-untyped]
+        except ImportError as e:
+            raise ImportError(
+                "The async DynamoDB backend requires aiobotocore. "
+                "Install with: pip install aiobotocore"
+            ) from e
+
+        # The client holds its loop, so an entry outlives a loop closed
+        # without shutting down its async generators; it cannot be closed
+        # from here, only dropped
+        for closed in [other for other in _clients if other.is_closed()]:
+            _clients.pop(closed, None)
+
+        stack = AsyncExitStack()
+        config = AioConfig(
+            max_pool_connections=int(os.getenv("AWS_DB_MAX_POOL_CONNECTIONS", "50")),
+            retries={
+                "max_attempts": int(os.getenv("AWS_DB_MAX_RETRY_ATTEMPTS", "3")),
+                "mode": "standard",
+            },
+        )
+        client = await stack.enter_async_context(
+            get_session().create_client(
+                "dynamodb",
+                region_name=os.getenv("AWS_DEFAULT_REGION", "us-west-1"),
+                endpoint_url=os.getenv("AWS_DB_HOST") or None,
+                config=config,
+            )
+        )
+        closer = _close_at_shutdown(loop, stack)
+        await closer.__anext__()
+        _clients[loop] = _LoopClient(client, closer)
+        logger.info("Created async DynamoDB client")
+    return client
+
+
+async def close_client() -> None:
+    """Close the running loop's client, e.g. at application shutdown."""
+    entry = _clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry.closer.aclose()
+
+
+def is_condition_failure(error: Exception) -> bool:
+    """Whether ``error`` is a failed ``ConditionExpression``."""
+    response = getattr(error, "response", None) or {}
+    return bool(
+        response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+    )
+
+
+async def _send(operation: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Call ``operation`` on the shared client.
+
+    With ``actingweb.db.instrumentation`` enabled, the consumed capacity is
+    requested and added to the accessor call in progress, as PynamoDB's
+    requests are on the sync path.
+    """
+    client = await get_client()
+    if not instrumentation.is_enabled():
+        response: dict[str, Any] = await getattr(client, operation)(**params)
+        return response
+    params.setdefault("ReturnConsumedCapacity", "TOTAL")
+    response = await getattr(client, operation)(**params)
+    instrumentation.add_consumed_capacity(consumed_capacity_units(response))
+    return response
+
+
+def _key_kwargs(
+    model: type[Model],
+    hash_key: Any,
+    range_key: Any = None,
+    *,
+    key: str = "Key",
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Request parameters as the model's PynamoDB connection would send them.
+
+    The connection describes the table from the model's schema, so building
+    them needs no network call. All keys in these tables are strings.
+    """
+    params: dict[str, Any] = model._get_connection().get_operation_kwargs(
+        hash_key, range_key, key=key, **kwargs
+    )
+    return params
+
+
+async def get_item(model: type[_M], hash_key: Any, range_key: Any = None) -> _M | None:
+    """Consistent GetItem; None if the item does not exist."""
+    response = await _send(
+        "get_item", _key_kwargs(model, hash_key, range_key, consistent_read=True)
+    )
+    item = response.get("Item")
+    return model.from_raw_data(item) if item else None
+
+
+async def put_item(instance: Model, condition: Condition | None = None) -> None:
+    """PutItem of a model instance, as ``instance.save(condition)`` would send."""
+    args, kwargs = instance._get_save_args(condition=condition)
+    (hash_key,) = args
+    await _send(
+        "put_item",
+        _key_kwargs(
+            type(instance),
+            hash_key,
+            kwargs.get("range_key"),
+            key="Item",
+            attributes=kwargs["attributes"],
+            condition=kwargs["condition"],
+        ),
+    )
+
+
+async def delete_item(
+    model: type[Model],
+    hash_key: Any,
+    range_key: Any = None,
+    condition: Condition | None = None,
+) -> None:
+    """DeleteItem by key."""
+    await _send(
+        "delete_item", _key_kwargs(model, hash_key, range_key, condition=condition)
+    )
+
+
+async def update_item(
+    model: type[Model],
+    hash_key: Any,
+    range_key: Any,
+    actions: list[Action],
+    condition: Condition | None = None,
+) -> None:
+    """UpdateItem by key with PynamoDB update actions."""
+    await _send(
+        "update_item",
+        _key_kwargs(model, hash_key, range_key, actions=actions, condition=condition),
+    )
+
+
+async def query(
+    model: type[_M],
+    hash_key: Any,
+    range_key_condition: Condition | None = None,
+    index: Any = None,
+) -> list[_M]:
+    """
+    All items of a Query, following pagination.
+
+    Args:
+        model: Table model
+        hash_key: Partition key value (of ``index`` if given)
+        range_key_condition: Optional sort key condition
+        index: Optional PynamoDB index (eventually consistent, as on the
+            sync path); table queries use consistent reads
+    """
+    key_owner: Any = index if index is not None else model
+    key_condition = key_owner._hash_key_attribute() == hash_key
+    if range_key_condition is not None:
+        key_condition &= range_key_condition
+
+    names: dict[str, str] = {}
+    values: dict[str, Any] = {}
+    params: dict[str, Any] = {
+        "TableName": model.Meta.table_name,
+        "KeyConditionExpression": key_condition.serialize(names, values),
+        "ExpressionAttributeNames": {v: k for k, v in names.items()},
+        "ExpressionAttributeValues": values,
+    }
+    if index is not None:
+        params["IndexName"] = index.Meta.index_name
+    else:
+        params["ConsistentRead"] = True
+
+    items: list[_M] = []
+    while True:
+        response = await _send("query", params)
+        items.extend(model.from_raw_data(item) for item in response.get("Items", []))
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return items
+        params["ExclusiveStartKey"] = last_key
@@ -0,0 +1,54 @@
+"""
+Consumed capacity of DynamoDB requests, for ``actingweb.db.instrumentation``.
+
+PynamoDB asks for ``ReturnConsumedCapacity=TOTAL`` on every data request but
+only logs the answer at DEBUG. :func:`install` wraps PynamoDB's
+``Connection.dispatch`` so the units are added to the accessor call in
+progress. It is installed the first time an instrumented DynamoDB object is
+created, so with instrumentation disabled PynamoDB is left untouched.
+"""
+
+import threading
+from typing import Any
+
+from pynamodb.connection.base import Connection
+
+from actingweb.db import instrumentation
+
+_install_lock = threading.Lock()
+_installed = False
+
+
+def consumed_capacity_units(response: dict[str, Any] | None) -> float | None:
+    """Total capacity units in a DynamoDB response, None if it reports none.
+
+    Batch and transaction responses report a list, one entry per table.
+    """
+    if not response:
+        return None
+    capacity = response.get("ConsumedCapacity")
+    if isinstance(capacity, dict):
+        capacity = [capacity]
+    if not capacity:
+        return None
+    return float(sum(entry.get("CapacityUnits", 0.0) for entry in capacity))
+
+
+def install() -> None:
+    """Report consumed capacity of PynamoDB requests; idempotent."""
+    global _installed
+
+    with _install_lock:
+        if _installed:
+            return
+        dispatch = Connection.dispatch
+
+        def instrumented_dispatch(
+            self: Connection, operation_name: str, operation_kwargs: dict[str, Any]
+        ) -> dict[str, Any]:
+            data = dispatch(self, operation_name, operation_kwargs)
+            instrumentation.add_consumed_capacity(consumed_capacity_units(data))
+            return data
+
+        Connection.dispatch = instrumented_dispatch  # type: ignore[method-assign]
+        _installed = True
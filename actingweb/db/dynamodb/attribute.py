@@ -1,6 +1,9 @@
+import json
 import os
 import time
 from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
 
 from pynamodb.attributes import (
     JSONAttribute,
@@ -9,9 +12,12 @@ from pynamodb.attributes import (
     UTCDateTimeAttribute,
 )
 from pynamodb.constants import PAY_PER_REQUEST_BILLING_MODE
-from pynamodb.exceptions import DoesNotExist
+from pynamodb.exceptions import DoesNotExist, PutError
+from pynamodb.expressions.update import Action
 from pynamodb.models import Model
 
+from actingweb import json_codec
+from actingweb.db.dynamodb import _async
 from actingweb.db.dynamodb._ensure import ensure_table
 
 """
@@ -20,6 +26,22 @@ from actingweb.db.dynamodb._ensure import ensure_table
 """
 
 
+class CodecJSONAttribute(JSONAttribute):
+    """``JSONAttribute`` encoded and decoded with ``actingweb.json_codec``."""
+
+    def serialize(self, value: Any) -> str | None:
+        if value is None:
+            return None
+        return json_codec.encode(value)
+
+    def deserialize(self, value: Any) -> Any:
+        try:
+            return json_codec.loads(value)
+        except ValueError:
+            # Raw control characters in strings, which JSONAttribute accepts
+            return json.loads(value, strict=False)
+
+
 class Attribute(Model):
     """
     DynamoDB data model for a property
@@ -35,7 +57,7 @@ class Attribute(Model):
     bucket_name = UnicodeAttribute(range_key=True)
     bucket = UnicodeAttribute()
     name = UnicodeAttribute()
-    data = JSONAttribute(null=True)
+    data = CodecJSONAttribute(null=True)
     timestamp = UTCDateTimeAttribute(null=True)
     # TTL timestamp for automatic DynamoDB expiration (Unix epoch timestamp)
     # Enable DynamoDB TTL on this field for automatic cleanup
@@ -207,6 +229,59 @@ class DbAttribute:
         except Exception:
             return False
 
+    @staticmethod
+    def insert_attr_if_absent(
+        actor_id=None,
+        bucket=None,
+        name=None,
+        data=None,
+        timestamp=None,
+        ttl_seconds=None,
+    ):
+        """Create an attribute only if no live item exists, in one PutItem.
+
+        The put carries ``attribute_not_exists(id) OR ttl_timestamp <= now``, so
+        an item the TTL sweeper has not removed yet is replaced, matching
+        :meth:`get_attr`, which already reads it as absent.
+
+        Returns:
+            True if this call created the item, False if a live one exists
+        """
+        if not actor_id or not bucket or not name or not data:
+            return False
+
+        ttl_timestamp = None
+        if ttl_seconds is not None:
+            from ...constants import TTL_CLOCK_SKEW_BUFFER
+
+            ttl_timestamp = int(time.time()) + ttl_seconds + TTL_CLOCK_SKEW_BUFFER
+
+        from actingweb.db.utils import sanitize_json_data
+
+        data = sanitize_json_data(data, log_source="attribute")
+
+        new = Attribute(
+            id=actor_id,
+            bucket_name=bucket + ":" + name,
+            bucket=bucket,
+            name=name,
+            data=data,
+            timestamp=timestamp,
+            ttl_timestamp=ttl_timestamp,
+        )
+        try:
+            new.save(
+                condition=(
+                    Attribute.id.does_not_exist()
+                    | (Attribute.ttl_timestamp <= int(time.time()))
+                )
+            )
+        except PutError as e:
+            if e.cause_response_code == "ConditionalCheckFailedException":
+                return False
+            raise
+        return True
+
     @staticmethod
     def conditional_update_attr(
         actor_id=None,
@@ -235,8 +310,6 @@ class DbAttribute:
         Returns:
             True if update succeeded (current matched old_data), False otherwise
         """
-        import json
-
         if not actor_id or not bucket or not name:
             return False
 
@@ -258,7 +331,7 @@ class DbAttribute:
                 """Normalize JSON data by serializing with sorted keys."""
                 if data is None:
                     return None
-                return json.loads(json.dumps(data, sort_keys=True))
+                return json_codec.loads(json_codec.encode(data, sort_keys=True))
 
             old_data_normalized = normalize_json(old_data)
             current_data_normalized = normalize_json(item.data)
@@ -423,3 +496,206 @@ class DbAttributeBucketList:
 
     def __init__(self):
         ensure_table(Attribute)
+
+
+def _new_attribute(
+    actor_id: str,
+    bucket: str,
+    name: str,
+    data: Any,
+    timestamp: datetime | None,
+    ttl_seconds: int | None,
+) -> Attribute:
+    """The item ``DbAttribute.set_attr`` would save."""
+    from actingweb.db.utils import sanitize_json_data
+
+    ttl_timestamp = None
+    if ttl_seconds is not None:
+        from ...constants import TTL_CLOCK_SKEW_BUFFER
+
+        ttl_timestamp = int(time.time()) + ttl_seconds + TTL_CLOCK_SKEW_BUFFER
+    return Attribute(
+        id=actor_id,
+        bucket_name=bucket + ":" + name,
+        bucket=bucket,
+        name=name,
+        data=sanitize_json_data(data, log_source="attribute"),
+        timestamp=timestamp,
+        ttl_timestamp=ttl_timestamp,
+    )
+
+
+class AsyncDbAttribute:
+    """
+    Async DbAttribute for the async handlers, on the shared aiobotocore client.
+
+    Same items, conditions and return shapes as :class:`DbAttribute`.
+    """
+
+    def __init__(self) -> None:
+        ensure_table(Attribute)
+
+    async def get_bucket(
+        self, actor_id: str | None = None, bucket: str | None = None
+    ) -> dict[str, dict[str, Any]] | None:
+        """Returns a dict of attributes from a bucket, each with data and timestamp"""
+        if not actor_id or not bucket:
+            return None
+        try:
+            items = await _async.query(
+                Attribute, actor_id, Attribute.bucket_name.startswith(bucket)
+            )
+        except Exception:
+            return None
+        return {t.name: {"data": t.data, "timestamp": t.timestamp} for t in items}
+
+    async def get_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Returns the data and timestamp of one attribute"""
+        if not actor_id or not bucket or not name:
+            return None
+        try:
+            r = await _async.get_item(Attribute, actor_id, bucket + ":" + name)
+        except Exception:
+            return None
+        if r is None:
+            return None
+        return {"data": r.data, "timestamp": r.timestamp}
+
+    async def set_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+        data: Any = None,
+        timestamp: datetime | None = None,
+        ttl_seconds: int | None = None,
+    ) -> bool:
+        """Sets a data value for a given attribute in a bucket (empty deletes)."""
+        if not actor_id or not name or not bucket:
+            return False
+        if not data:
+            # DeleteItem of a missing key is a no-op, so no read first
+            try:
+                await _async.delete_item(Attribute, actor_id, bucket + ":" + name)
+            except Exception:
+                pass
+            return True
+        await _async.put_item(
+            _new_attribute(actor_id, bucket, name, data, timestamp, ttl_seconds)
+        )
+        return True
+
+    async def delete_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+    ) -> bool:
+        """Deletes an attribute in a bucket"""
+        return await self.set_attr(actor_id=actor_id, bucket=bucket, name=name)
+
+    async def delete_attr_conditional(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+    ) -> bool:
+        """Atomically delete an attribute, returning True only if THIS call
+        removed an existing item (see :meth:`DbAttribute.delete_attr_conditional`).
+        """
+        if not actor_id or not bucket or not name:
+            return False
+        try:
+            await _async.delete_item(
+                Attribute,
+                actor_id,
+                bucket + ":" + name,
+                condition=Attribute.id.exists(),
+            )
+        except Exception:
+            return False
+        return True
+
+    async def insert_attr_if_absent(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+        data: Any = None,
+        timestamp: datetime | None = None,
+        ttl_seconds: int | None = None,
+    ) -> bool:
+        """Create an attribute only if no live item exists, in one PutItem.
+
+        Returns:
+            True if this call created the item, False if a live one exists
+        """
+        if not actor_id or not bucket or not name or not data:
+            return False
+        try:
+            await _async.put_item(
+                _new_attribute(actor_id, bucket, name, data, timestamp, ttl_seconds),
+                condition=(
+                    Attribute.id.does_not_exist()
+                    | (Attribute.ttl_timestamp <= int(time.time()))
+                ),
+            )
+        except Exception as e:
+            if _async.is_condition_failure(e):
+                return False
+            raise
+        return True
+
+    async def conditional_update_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+        old_data: Any = None,
+        new_data: Any = None,
+        timestamp: datetime | None = None,
+    ) -> bool:
+        """Conditionally update an attribute only if current data matches
+        old_data, compared order-independently as in
+        :meth:`DbAttribute.conditional_update_attr`.
+
+        Returns:
+            True if update succeeded (current matched old_data), False otherwise
+        """
+        if not actor_id or not bucket or not name:
+            return False
+
+        from actingweb.db.utils import sanitize_json_data
+
+        old_data = sanitize_json_data(old_data, log_source="attribute")
+        new_data = sanitize_json_data(new_data, log_source="attribute")
+
+        def normalize_json(data: Any) -> Any:
+            if data is None:
+                return None
+            return json_codec.loads(json_codec.encode(data, sort_keys=True))
+
+        bucket_name = bucket + ":" + name
+        try:
+            item = await _async.get_item(Attribute, actor_id, bucket_name)
+            if item is None or normalize_json(old_data) != normalize_json(item.data):
+                return False
+            actions: list[Action] = [Attribute.data.set(new_data)]
+            if timestamp:
+                actions.append(Attribute.timestamp.set(timestamp))
+            # Condition on the stored value, whatever its key ordering
+            await _async.update_item(
+                Attribute,
+                actor_id,
+                bucket_name,
+                actions,
+                condition=(Attribute.data == item.data),
+            )
+        except Exception:
+            return False
+        return True
@@ -1,4 +1,5 @@
 # mypy: disable-error-code="override"
+import asyncio
 import logging
 import os
 from typing import Any
@@ -9,6 +10,7 @@ from pynamodb.exceptions import DeleteError, DoesNotExist, PutError, UpdateError
 from pynamodb.indexes import AllProjection, GlobalSecondaryIndex
 from pynamodb.models import Model
 
+from actingweb.db.dynamodb import _async
 from actingweb.db.dynamodb._ensure import ensure_table
 from actingweb.db.exceptions import DbError
 
@@ -104,14 +106,13 @@ def _serialize_property_value(value: Any) -> str | None:
     callers treat this as "would delete", which conditional-create callers
     must reject rather than silently no-op).
     """
-    import json
-
+    from actingweb import json_codec
     from actingweb.db.utils import sanitize_json_data
 
     if value is not None and not isinstance(value, str):
         try:
             sanitized_value = sanitize_json_data(value, log_source="property")
-            value = json.dumps(sanitized_value)
+            value = json_codec.dumps(sanitized_value)
         except (TypeError, ValueError):
             value = str(value)
     elif isinstance(value, str):
@@ -346,15 +347,14 @@ class DbProperty:
             return False
 
         # Convert non-string values to JSON strings for storage
-        import json
-
+        from actingweb import json_codec
         from actingweb.db.utils import sanitize_json_data
 
         if value is not None and not isinstance(value, str):
             try:
                 # Defensive sanitization of own data before JSON encoding
                 sanitized_value = sanitize_json_data(value, log_source="property")
-                value = json.dumps(sanitized_value)
+                value = json_codec.dumps(sanitized_value)
             except (TypeError, ValueError):
                 value = str(value)
         elif isinstance(value, str):
@@ -791,3 +791,121 @@ class DbPropertyList:
 
         self.handle = None
         return True
+
+
+class AsyncDbProperty:
+    """
+    Async DbProperty for the async handlers, on the shared aiobotocore client.
+
+    Takes the same configuration as :class:`DbProperty`. Writes to indexed
+    properties also sync the lookup table, so those run :class:`DbProperty`
+    in a worker thread; everything else is native.
+    """
+
+    def __init__(
+        self,
+        use_lookup_table: bool | None = None,
+        indexed_properties: list[str] | None = None,
+    ) -> None:
+        self._sync = DbProperty(
+            use_lookup_table=use_lookup_table, indexed_properties=indexed_properties
+        )
+        self.handle: Property | None = None
+
+    async def get(
+        self, actor_id: str | None = None, name: str | None = None
+    ) -> str | None:
+        """Retrieves the property from the database.
+
+        Returns ``None`` only when the row is absent. A backend fault raises
+        ``DbError`` instead of being reported as absence.
+        """
+        if not actor_id or not name:
+            return None
+        try:
+            self.handle = await _async.get_item(Property, actor_id, name)
+        except Exception as e:
+            raise DbError("property read", actor_id) from e
+        if self.handle is None or not self.handle.value:
+            return None
+        return str(self.handle.value)
+
+    async def set(
+        self, actor_id: str | None = None, name: str | None = None, value: Any = None
+    ) -> bool:
+        """Sets a new value for the property name (empty value deletes)."""
+        if not name:
+            return False
+        if self._sync._should_index_property(name):
+            return await self._run_sync(self._sync.set, actor_id, name, value)
+
+        value = _serialize_property_value(value)
+        if value is None:
+            if await self.get(actor_id=actor_id, name=name):
+                await self.delete()
+            return True
+        if (
+            actor_id
+            and self.handle is not None
+            and (str(self.handle.id) != actor_id or str(self.handle.name) != name)
+        ):
+            self.handle = None
+        if not self.handle:
+            if not actor_id:
+                return False
+            self.handle = Property(id=actor_id, name=name, value=value)
+        else:
+            self.handle.value = value
+
+        try:
+            await _async.put_item(self.handle)
+        except Exception as e:
+            raise DbError("property write", actor_id) from e
+        return True
+
+    async def delete(self) -> bool:
+        """Deletes the property in the database after a get()"""
+        if not self.handle:
+            return False
+        if self._sync._should_index_property(str(self.handle.name)):
+            return await self._run_sync(self._sync.delete)
+
+        await _async.delete_item(Property, self.handle.id, self.handle.name)
+        self.handle = None
+        return True
+
+    async def _run_sync(self, method: Any, *args: Any) -> bool:
+        """Run a ``DbProperty`` write in a thread, sharing this handle."""
+        self._sync.handle = self.handle
+        ok: bool = await asyncio.to_thread(method, *args)
+        self.handle = self._sync.handle
+        return ok
+
+
+class AsyncDbPropertyList:
+    """Async DbPropertyList: fetches an actor's plain properties."""
+
+    def __init__(
+        self,
+        use_lookup_table: bool | None = None,
+        indexed_properties: list[str] | None = None,
+    ) -> None:
+        if use_lookup_table is None:
+            use_lookup_table = (
+                os.getenv("USE_PROPERTY_LOOKUP_TABLE", "true").lower() == "true"
+            )
+        ensure_table(Property if use_lookup_table else PropertyLegacy)
+        self.actor_id: str | None = None
+        self.props: dict[str, str] | None = None
+
+    async def fetch(self, actor_id: str | None = None) -> dict[str, str] | None:
+        """Retrieves the PLAIN (non-list) properties of an actor_id, with the
+        same pair of range Queries as :meth:`DbPropertyList.fetch`."""
+        if not actor_id:
+            return None
+        self.actor_id = actor_id
+        self.props = {}
+        for condition in (Property.name < "list:", Property.name >= "list;"):
+            for d in await _async.query(Property, actor_id, condition):
+                self.props[d.name] = d.value
+        return self.props
@@ -1,10 +1,12 @@
 import logging
 import os
+from typing import Any
 
 from pynamodb.attributes import BooleanAttribute, NumberAttribute, UnicodeAttribute
 from pynamodb.constants import PAY_PER_REQUEST_BILLING_MODE
 from pynamodb.models import Model
 
+from actingweb.db.dynamodb import _async
 from actingweb.db.dynamodb._ensure import ensure_table
 
 """
@@ -36,6 +38,21 @@ class Subscription(Model):
     callback = BooleanAttribute()
 
 
+def _subscription_to_dict(t: Subscription) -> dict[str, Any]:
+    """Subscription item as the dict ``DbSubscription.get`` returns."""
+    return {
+        "id": t.id,
+        "peerid": t.peerid,
+        "subscriptionid": t.subid,
+        "granularity": (t.granularity or ""),
+        "target": (t.target or ""),
+        "subtarget": (t.subtarget or ""),
+        "resource": (t.resource or ""),
+        "sequence": t.seqnr,
+        "callback": t.callback,
+    }
+
+
 class DbSubscription:
     """
     DbSubscription does all the db operations for subscription objects
@@ -58,17 +75,7 @@ class DbSubscription:
                 consistent_read=True,
             ):
                 self.handle = t
-                return {
-                    "id": t.id,
-                    "peerid": t.peerid,
-                    "subscriptionid": t.subid,
-                    "granularity": (t.granularity or ""),
-                    "target": (t.target or ""),
-                    "subtarget": (t.subtarget or ""),
-                    "resource": (t.resource or ""),
-                    "sequence": t.seqnr,
-                    "callback": t.callback,
-                }
+                return _subscription_to_dict(t)
         except Exception:  # PynamoDB DoesNotExist exception
             pass
         return None
@@ -175,19 +182,7 @@ class DbSubscriptionList:
         self.subscriptions = []
         if self.handle:
             for t in self.handle:
-                self.subscriptions.append(
-                    {
-                        "id": t.id,
-                        "peerid": t.peerid,
-                        "subscriptionid": t.subid,
-                        "granularity": (t.granularity or ""),
-                        "target": (t.target or ""),
-                        "subtarget": (t.subtarget or ""),
-                        "resource": (t.resource or ""),
-                        "sequence": t.seqnr,
-                        "callback": t.callback,
-                    }
-                )
+                self.subscriptions.append(_subscription_to_dict(t))
             return self.subscriptions
         else:
             return []
@@ -209,3 +204,129 @@ class DbSubscriptionList:
         self.actor_id = None
         self.subscriptions = []
         ensure_table(Subscription)
+
+
+class AsyncDbSubscription:
+    """Async DbSubscription for the async handlers, on the shared client."""
+
+    def __init__(self) -> None:
+        self.handle: Subscription | None = None
+        ensure_table(Subscription)
+
+    async def get(
+        self,
+        actor_id: str | None = None,
+        peerid: str | None = None,
+        subid: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Retrieves the subscription from the database"""
+        if not actor_id:
+            return None
+        if not peerid or not subid:
+            logger.debug("Attempt to get subscription without peerid or subid")
+            return None
+        try:
+            self.handle = await _async.get_item(
+                Subscription, actor_id, peerid + ":" + subid
+            )
+        except Exception:
+            return None
+        return _subscription_to_dict(self.handle) if self.handle else None
+
+    async def modify(
+        self,
+        peerid: str | None = None,
+        subid: str | None = None,
+        granularity: str | None = None,
+        target: str | None = None,
+        subtarget: str | None = None,
+        resource: str | None = None,
+        seqnr: int | None = None,
+        callback: bool | None = None,
+    ) -> bool:
+        """Modify a subscription
+        If bools are none, they will not be changed.
+        """
+        if not self.handle:
+            logger.debug("Attempted modification of DbSubscription without db handle")
+            return False
+        if peerid:
+            self.handle.peerid = peerid
+        if subid:
+            self.handle.subid = subid
+        if granularity:
+            self.handle.granularity = granularity
+        if callback is not None:
+            self.handle.callback = callback
+        if target:
+            self.handle.target = target
+        if subtarget:
+            self.handle.subtarget = subtarget
+        if resource:
+            self.handle.resource = resource
+        if seqnr is not None:
+            self.handle.seqnr = seqnr
+        await _async.put_item(self.handle)
+        return True
+
+    async def create(
+        self,
+        actor_id: str | None = None,
+        peerid: str | None = None,
+        subid: str | None = None,
+        granularity: str | None = None,
+        target: str | None = None,
+        subtarget: str | None = None,
+        resource: str | None = None,
+        seqnr: int = 0,
+        callback: bool = False,
+    ) -> bool:
+        """Create a new subscription"""
+        if not actor_id or not peerid or not subid:
+            return False
+        if await self.get(actor_id=actor_id, peerid=peerid, subid=subid):
+            return False
+        self.handle = Subscription(
+            id=actor_id,
+            peer_sub_id=peerid + ":" + subid,
+            peerid=peerid,
+            subid=subid,
+            seqnr=seqnr,
+            callback=callback,
+            granularity=granularity or None,
+            target=target or None,
+            subtarget=subtarget or None,
+            resource=resource or None,
+        )
+        await _async.put_item(self.handle)
+        return True
+
+    async def delete(self) -> bool:
+        """Deletes the subscription in the database"""
+        if not self.handle:
+            logger.debug("Attempted delete of DbSubscription with no handle set.")
+            return False
+        await _async.delete_item(Subscription, self.handle.id, self.handle.peer_sub_id)
+        self.handle = None
+        return True
+
+
+class AsyncDbSubscriptionList:
+    """Async DbSubscriptionList: fetches all subscriptions of an actor."""
+
+    def __init__(self) -> None:
+        self.actor_id: str | None = None
+        self.subscriptions: list[dict[str, Any]] = []
+        ensure_table(Subscription)
+
+    async def fetch(
+        self, actor_id: str | None = None
+    ) -> list[dict[str, Any]] | list[Any]:
+        """Retrieves the subscriptions of an actor_id from the database as a list"""
+        if not actor_id:
+            return []
+        self.actor_id = actor_id
+        self.subscriptions = [
+            _subscription_to_dict(t) for t in await _async.query(Subscription, actor_id)
+        ]
+        return self.subscriptions
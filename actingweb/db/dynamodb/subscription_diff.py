@@ -1,11 +1,15 @@
+import asyncio
 import datetime
 import logging
 import os
+from collections.abc import Iterator
+from typing import Any
 
 from pynamodb.attributes import NumberAttribute, UnicodeAttribute, UTCDateTimeAttribute
 from pynamodb.constants import PAY_PER_REQUEST_BILLING_MODE
 from pynamodb.models import Model
 
+from actingweb.db.dynamodb import _async
 from actingweb.db.dynamodb._ensure import ensure_table
 
 """
@@ -17,6 +21,9 @@ from actingweb.db.dynamodb._ensure import ensure_table
 
 logger = logging.getLogger(__name__)
 
+# Items per Query page of DbSubscriptionDiffList.iter_fetch()
+DIFF_PAGE_SIZE = 100
+
 
 class SubscriptionDiff(Model):
     class Meta:  # type: ignore[misc]
@@ -138,6 +145,36 @@ class DbSubscriptionDiffList:
         else:
             return []
 
+    def iter_fetch(
+        self,
+        actor_id: str | None = None,
+        subid: str | None = None,
+        page_size: int = DIFF_PAGE_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Yields the subscription diffs of an actor_id, as fetch() returns them
+
+        The Query reads page_size items per request as the diffs are
+        consumed, instead of the whole partition up front.
+        """
+        if not actor_id:
+            return
+        range_key_condition = (
+            SubscriptionDiff.subid_seqnr.startswith(subid + ":") if subid else None
+        )
+        for t in SubscriptionDiff.query(
+            actor_id,
+            range_key_condition,
+            consistent_read=True,
+            page_size=page_size,
+        ):
+            yield {
+                "id": t.id,
+                "subscriptionid": t.subid,
+                "timestamp": t.timestamp,
+                "diff": t.diff,
+                "sequence": t.seqnr,
+            }
+
     def delete(self, seqnr=None):
         """Deletes all the fetched subscription diffs in the database
 
@@ -162,3 +199,135 @@ class DbSubscriptionDiffList:
         self.actor_id = None
         self.subid = None
         ensure_table(SubscriptionDiff)
+
+
+def _diff_to_dict(t: SubscriptionDiff) -> dict[str, Any]:
+    """Diff item as the dict ``DbSubscriptionDiff.get`` returns."""
+    return {
+        "id": t.id,
+        "subscriptionid": t.subid,
+        "timestamp": t.timestamp,
+        "data": t.diff,
+        "sequence": t.seqnr,
+    }
+
+
+async def _query_diffs(actor_id: str, subid: str | None) -> list[SubscriptionDiff]:
+    """An actor's diffs, only those of ``subid`` if given."""
+    if not subid:
+        return await _async.query(SubscriptionDiff, actor_id)
+    items = await _async.query(
+        SubscriptionDiff, actor_id, SubscriptionDiff.subid_seqnr.startswith(subid + ":")
+    )
+    return [t for t in items if t.subid == subid]
+
+
+class AsyncDbSubscriptionDiff:
+    """Async DbSubscriptionDiff for the async handlers, on the shared client."""
+
+    def __init__(self) -> None:
+        self.handle: SubscriptionDiff | None = None
+        ensure_table(SubscriptionDiff)
+
+    async def get(
+        self,
+        actor_id: str | None = None,
+        subid: str | None = None,
+        seqnr: int | None = None,
+    ) -> dict[str, Any] | None:
+        """Retrieves the subscriptiondiff from the database; the lowest
+        sequence number if seqnr is not given."""
+        if not actor_id or not subid:
+            logger.debug("Attempt to get subscriptiondiff without actorid or subid")
+            return None
+        if seqnr:
+            self.handle = await _async.get_item(
+                SubscriptionDiff, actor_id, subid + ":" + str(seqnr)
+            )
+        else:
+            diffs = await _query_diffs(actor_id, subid)
+            self.handle = min(diffs, key=lambda t: t.seqnr) if diffs else None
+        if not self.handle:
+            return None
+        return _diff_to_dict(self.handle)
+
+    async def create(
+        self,
+        actor_id: str | None = None,
+        subid: str | None = None,
+        diff: str = "",
+        seqnr: int = 1,
+    ) -> bool:
+        """Create a new subscription diff"""
+        if not actor_id or not subid:
+            logger.debug("Attempt to create subscriptiondiff without actorid or subid")
+            return False
+        self.handle = SubscriptionDiff(
+            id=actor_id,
+            subid_seqnr=subid + ":" + str(seqnr),
+            subid=subid,
+            diff=diff,
+            seqnr=seqnr,
+        )
+        await _async.put_item(self.handle)
+        return True
+
+    async def delete(self) -> bool:
+        """Deletes the subscription diff in the database"""
+        if not self.handle:
+            return False
+        await _async.delete_item(
+            SubscriptionDiff, self.handle.id, self.handle.subid_seqnr
+        )
+        self.handle = None
+        return True
+
+
+class AsyncDbSubscriptionDiffList:
+    """Async DbSubscriptionDiffList for the async handlers, on the shared client."""
+
+    def __init__(self) -> None:
+        self.diffs: list[dict[str, Any]] = []
+        self.actor_id: str | None = None
+        self.subid: str | None = None
+        ensure_table(SubscriptionDiff)
+
+    async def fetch(
+        self, actor_id: str | None = None, subid: str | None = None
+    ) -> list[dict[str, Any]] | list[Any]:
+        """Retrieve an actor's diffs, optionally for one subscription, by seqnr."""
+        if not actor_id:
+            return []
+        self.actor_id = actor_id
+        self.subid = subid
+        diffs = sorted(await _query_diffs(actor_id, subid), key=lambda t: t.seqnr)
+        # Same keys as DbSubscriptionDiffList.fetch(): "diff", not "data"
+        self.diffs = [
+            {
+                "id": t.id,
+                "subscriptionid": t.subid,
+                "timestamp": t.timestamp,
+                "diff": t.diff,
+                "sequence": t.seqnr,
+            }
+            for t in diffs
+        ]
+        return self.diffs
+
+    async def delete(self, seqnr: int | None = None) -> bool:
+        """Delete the fetched diffs, up to and including seqnr if given.
+
+        The DeleteItems are issued concurrently over the client's pool.
+        """
+        if not self.actor_id:
+            return False
+        if not seqnr or not isinstance(seqnr, int):
+            seqnr = 0
+        await asyncio.gather(
+            *(
+                _async.delete_item(SubscriptionDiff, t.id, t.subid_seqnr)
+                for t in await _query_diffs(self.actor_id, self.subid)
+                if seqnr == 0 or t.seqnr <= seqnr
+            )
+        )
+        return True
@@ -1,12 +1,15 @@
+import asyncio
 import logging
 import os
 from datetime import datetime
+from typing import Any
 
 from pynamodb.attributes import BooleanAttribute, UnicodeAttribute, UTCDateTimeAttribute
 from pynamodb.constants import PAY_PER_REQUEST_BILLING_MODE
 from pynamodb.indexes import AllProjection, GlobalSecondaryIndex
 from pynamodb.models import Model
 
+from actingweb.db.dynamodb import _async
 from actingweb.db.dynamodb._ensure import ensure_table
 from actingweb.db.utils import ensure_timezone_aware_iso
 from actingweb.trust import canonical_connection_method
@@ -114,6 +117,68 @@ class Trust(Model):
     secret_index = SecretIndex()
 
 
+def _trust_to_dict(t: Trust, always_established_via: bool = False) -> dict[str, Any]:
+    """Trust item as the dict ``DbTrust.get`` returns.
+
+    ``DbTrustList.fetch`` has always included ``established_via`` even when
+    empty; ``always_established_via`` keeps that.
+    """
+    result = {
+        "id": t.id,
+        "peerid": t.peerid,
+        "baseuri": t.baseuri,
+        "type": t.type,
+        "relationship": t.relationship,
+        "secret": t.secret,
+        "desc": t.desc,
+        "approved": t.approved,
+        "peer_approved": t.peer_approved,
+        "verified": t.verified,
+        "verification_token": t.verification_token,
+    }
+
+    # Add new unified trust attributes if they exist
+    if hasattr(t, "peer_identifier") and t.peer_identifier:
+        result["peer_identifier"] = t.peer_identifier
+    if hasattr(t, "established_via") and (t.established_via or always_established_via):
+        result["established_via"] = t.established_via
+    created_at_iso = None
+    if hasattr(t, "created_at") and t.created_at:
+        created_at_iso = ensure_timezone_aware_iso(t.created_at)
+        result["created_at"] = created_at_iso
+    if hasattr(t, "last_accessed") and t.last_accessed:
+        last_accessed_iso = ensure_timezone_aware_iso(t.last_accessed)
+        result["last_accessed"] = last_accessed_iso
+        result["last_connected_at"] = last_accessed_iso
+    elif created_at_iso:
+        result["last_connected_at"] = created_at_iso
+
+    if hasattr(t, "last_connected_via") and t.last_connected_via:
+        result["last_connected_via"] = canonical_connection_method(t.last_connected_via)
+
+    # Add client metadata for OAuth2 clients if they exist
+    if hasattr(t, "client_name") and t.client_name:
+        result["client_name"] = t.client_name
+    if hasattr(t, "client_version") and t.client_version:
+        result["client_version"] = t.client_version
+    if hasattr(t, "client_platform") and t.client_platform:
+        result["client_platform"] = t.client_platform
+    if hasattr(t, "oauth_client_id") and t.oauth_client_id:
+        result["oauth_client_id"] = t.oauth_client_id
+
+    # Add peer capability tracking fields
+    if hasattr(t, "aw_supported") and t.aw_supported:
+        result["aw_supported"] = t.aw_supported
+    if hasattr(t, "aw_version") and t.aw_version:
+        result["aw_version"] = t.aw_version
+    if hasattr(t, "capabilities_fetched_at") and t.capabilities_fetched_at:
+        result["capabilities_fetched_at"] = ensure_timezone_aware_iso(
+            t.capabilities_fetched_at
+        )
+
+    return result
+
+
 class DbTrust:
     """
     DbTrust does all the db operations for trust objects
@@ -142,63 +207,7 @@ class DbTrust:
             return None
         if not self.handle:
             return None
-        t = self.handle
-        result = {
-            "id": t.id,
-            "peerid": t.peerid,
-            "baseuri": t.baseuri,
-            "type": t.type,
-            "relationship": t.relationship,
-            "secret": t.secret,
-            "desc": t.desc,
-            "approved": t.approved,
-            "peer_approved": t.peer_approved,
-            "verified": t.verified,
-            "verification_token": t.verification_token,
-        }
-
-        # Add new unified trust attributes if they exist
-        if hasattr(t, "peer_identifier") and t.peer_identifier:
-            result["peer_identifier"] = t.peer_identifier
-        if hasattr(t, "established_via") and t.established_via:
-            result["established_via"] = t.established_via
-        created_at_iso = None
-        if hasattr(t, "created_at") and t.created_at:
-            created_at_iso = ensure_timezone_aware_iso(t.created_at)
-            result["created_at"] = created_at_iso
-        if hasattr(t, "last_accessed") and t.last_accessed:
-            last_accessed_iso = ensure_timezone_aware_iso(t.last_accessed)
-            result["last_accessed"] = last_accessed_iso
-            result["last_connected_at"] = last_accessed_iso
-        elif created_at_iso:
-            result["last_connected_at"] = created_at_iso
-
-        if hasattr(t, "last_connected_via") and t.last_connected_via:
-            result["last_connected_via"] = canonical_connection_method(
-                t.last_connected_via
-            )
-
-        # Add client metadata for OAuth2 clients if they exist
-        if hasattr(t, "client_name") and t.client_name:
-            result["client_name"] = t.client_name
-        if hasattr(t, "client_version") and t.client_version:
-            result["client_version"] = t.client_version
-        if hasattr(t, "client_platform") and t.client_platform:
-            result["client_platform"] = t.client_platform
-        if hasattr(t, "oauth_client_id") and t.oauth_client_id:
-            result["oauth_client_id"] = t.oauth_client_id
-
-        # Add peer capability tracking fields
-        if hasattr(t, "aw_supported") and t.aw_supported:
-            result["aw_supported"] = t.aw_supported
-        if hasattr(t, "aw_version") and t.aw_version:
-            result["aw_version"] = t.aw_version
-        if hasattr(t, "capabilities_fetched_at") and t.capabilities_fetched_at:
-            result["capabilities_fetched_at"] = ensure_timezone_aware_iso(
-                t.capabilities_fetched_at
-            )
-
-        return result
+        return _trust_to_dict(self.handle)
 
     def modify(
         self,
@@ -446,62 +455,7 @@ class DbTrustList:
         self.trusts = []
         if self.handle:
             for t in self.handle:
-                result = {
-                    "id": t.id,
-                    "peerid": t.peerid,
-                    "baseuri": t.baseuri,
-                    "type": t.type,
-                    "relationship": t.relationship,
-                    "secret": t.secret,
-                    "desc": t.desc,
-                    "approved": t.approved,
-                    "peer_approved": t.peer_approved,
-                    "verified": t.verified,
-                    "verification_token": t.verification_token,
-                }
-
-                # Add new unified trust attributes if they exist (same logic as get() method)
-                if hasattr(t, "peer_identifier") and t.peer_identifier:
-                    result["peer_identifier"] = t.peer_identifier
-                if hasattr(t, "established_via"):
-                    result["established_via"] = t.established_via
-                created_at_iso = None
-                if hasattr(t, "created_at") and t.created_at:
-                    created_at_iso = ensure_timezone_aware_iso(t.created_at)
-                    result["created_at"] = created_at_iso
-                if hasattr(t, "last_accessed") and t.last_accessed:
-                    last_accessed_iso = ensure_timezone_aware_iso(t.last_accessed)
-                    result["last_accessed"] = last_accessed_iso
-                    result["last_connected_at"] = last_accessed_iso
-                elif created_at_iso:
-                    result["last_connected_at"] = created_at_iso
-
-                if hasattr(t, "last_connected_via") and t.last_connected_via:
-                    result["last_connected_via"] = canonical_connection_method(
-                        t.last_connected_via
-                    )
-
-                # Add client metadata for OAuth2 clients if they exist (same logic as get() method)
-                if hasattr(t, "client_name") and t.client_name:
-                    result["client_name"] = t.client_name
-                if hasattr(t, "client_version") and t.client_version:
-                    result["client_version"] = t.client_version
-                if hasattr(t, "client_platform") and t.client_platform:
-                    result["client_platform"] = t.client_platform
-                if hasattr(t, "oauth_client_id") and t.oauth_client_id:
-                    result["oauth_client_id"] = t.oauth_client_id
-
-                # Add peer capability tracking fields (same logic as get() method)
-                if hasattr(t, "aw_supported") and t.aw_supported:
-                    result["aw_supported"] = t.aw_supported
-                if hasattr(t, "aw_version") and t.aw_version:
-                    result["aw_version"] = t.aw_version
-                if hasattr(t, "capabilities_fetched_at") and t.capabilities_fetched_at:
-                    result["capabilities_fetched_at"] = ensure_timezone_aware_iso(
-                        t.capabilities_fetched_at
-                    )
-
-                self.trusts.append(result)
+                self.trusts.append(_trust_to_dict(t, always_established_via=True))
             return self.trusts
         else:
             return []
@@ -523,3 +477,102 @@ class DbTrustList:
         self.actor_id = None
         self.trusts = []
         ensure_table(Trust)
+
+
+class AsyncDbTrust:
+    """
+    Async DbTrust for the async handlers, on the shared aiobotocore client.
+
+    Reads and delete are native; create() and modify() run :class:`DbTrust`
+    in a worker thread; their timestamp parsing and attribute mapping are
+    not duplicated here.
+    """
+
+    def __init__(self) -> None:
+        self.handle: Trust | None = None
+        ensure_table(Trust)
+
+    async def get(
+        self,
+        actor_id: str | None = None,
+        peerid: str | None = None,
+        token: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Retrieve trust by peerid or, failing that, token. See :meth:`DbTrust.get`."""
+        if not actor_id:
+            return None
+        try:
+            if not self.handle and peerid:
+                self.handle = await _async.get_item(Trust, actor_id, peerid)
+            elif not self.handle and token:
+                self.handle = await self._find_by_token(actor_id, token)
+        except Exception:
+            return None
+        if not self.handle:
+            return None
+        return _trust_to_dict(self.handle)
+
+    async def create(
+        self, actor_id: str | None = None, peerid: str | None = None, **kwargs: Any
+    ) -> bool:
+        """Create a new trust; takes the arguments of :meth:`DbTrust.create`."""
+        db = DbTrust()
+        ok: bool = await asyncio.to_thread(
+            db.create, actor_id=actor_id, peerid=peerid, **kwargs
+        )
+        self.handle = db.handle
+        return ok
+
+    async def modify(self, **kwargs: Any) -> bool:
+        """Modify the trust in self.handle; see :meth:`DbTrust.modify`."""
+        db = DbTrust()
+        if self.handle:
+            db.handle = self.handle
+        ok: bool = await asyncio.to_thread(db.modify, **kwargs)
+        self.handle = db.handle
+        return ok
+
+    async def delete(self) -> bool:
+        """Deletes the trust in the database"""
+        if not self.handle:
+            return False
+        await _async.delete_item(Trust, self.handle.id, self.handle.peerid)
+        self.handle = None
+        return True
+
+    async def is_token_in_db(
+        self, actor_id: str | None = None, token: str | None = None
+    ) -> bool:
+        """Returns True if token is found in db"""
+        if not actor_id or not token:
+            return False
+        return await self._find_by_token(actor_id, token) is not None
+
+    @staticmethod
+    async def _find_by_token(actor_id: str, token: str) -> Trust | None:
+        for t in await _async.query(Trust, token, index=Trust.secret_index):
+            if t.id == actor_id:
+                return t
+        return None
+
+
+class AsyncDbTrustList:
+    """Async DbTrustList: fetches all trusts of an actor without a thread."""
+
+    def __init__(self) -> None:
+        self.actor_id: str | None = None
+        self.trusts: list[dict[str, Any]] = []
+        ensure_table(Trust)
+
+    async def fetch(
+        self, actor_id: str | None = None
+    ) -> list[dict[str, Any]] | list[Any]:
+        """Retrieves the trusts of an actor_id from the database as a list"""
+        if not actor_id:
+            return []
+        self.actor_id = actor_id
+        self.trusts = [
+            _trust_to_dict(t, always_established_via=True)
+            for t in await _async.query(Trust, actor_id)
+        ]
+        return self.trusts
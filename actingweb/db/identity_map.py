@@ -0,0 +1,220 @@
+"""Request-scoped read-through cache (identity map) for DB rows.
+
+One request tends to read the same rows several times: the actor row in
+``Auth`` and again in ``ActorInterface``, the trust row in auth, in the
+permission lookup and in the subscription callback, the subscription rows in
+``register_diffs`` and in ``get_subscription_obj``. While a request is being
+handled (``request_context.set_request_context()`` until
+``clear_request_context()``) the accessors in ``actingweb.db`` wrap the actor,
+trust and subscription objects they return so that each row is read from the
+backend at most once per request:
+
+- ``get()`` / ``fetch()`` results are kept per family and actor, and callers
+  get a copy, so mutating a returned dict does not change the cache.
+- Any other call (``modify()``, ``create()``, ``delete()``, ...) goes straight
+  to the backend and then evicts the actor's cached rows of that family (all
+  families for an actor write), so the next read sees the change.
+- A cache hit does not load the backend object's ``handle``. It is loaded,
+  with the original read, the first time anything else on the object is used,
+  so ``db.get(...)`` followed by ``db.modify(...)`` or ``db.handle`` behaves
+  exactly as without the cache.
+
+Outside a request nothing is cached. ``IdentityMap.stats()`` reports the reads
+issued and avoided, per family.
+"""
+
+import copy
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from actingweb import request_context
+
+logger = logging.getLogger(__name__)
+
+# Read method and cache key of each cached family; the key functions take
+# the read method's arguments and return (actor_id, key within the actor).
+_KeyFunc = Callable[..., tuple[str | None, tuple[Any, ...]]]
+
+
+def _actor_key(
+    actor_id: str | None = None,
+) -> tuple[str | None, tuple[Any, ...]]:
+    return actor_id, ()
+
+
+def _trust_key(
+    actor_id: str | None = None, peerid: str | None = None, token: str | None = None
+) -> tuple[str | None, tuple[Any, ...]]:
+    # DbTrust.get() ignores the token when a peerid is given
+    return actor_id, ("peerid", peerid) if peerid else ("token", token)
+
+
+def _subscription_key(
+    actor_id: str | None = None, peerid: str | None = None, subid: str | None = None
+) -> tuple[str | None, tuple[Any, ...]]:
+    return actor_id, (peerid, subid)
+
+
+def _list_key(actor_id: str | None = None) -> tuple[str | None, tuple[Any, ...]]:
+    return actor_id, ()
+
+
+FAMILIES: dict[str, tuple[str, _KeyFunc]] = {
+    "actor": ("get", _actor_key),
+    "trust": ("get", _trust_key),
+    "trust_list": ("fetch", _list_key),
+    "subscription": ("get", _subscription_key),
+    "subscription_list": ("fetch", _list_key),
+}
+
+# A write to one family also makes these families' cached rows stale
+_RELATED = {
+    "trust": ("trust", "trust_list"),
+    "trust_list": ("trust", "trust_list"),
+    "subscription": ("subscription", "subscription_list"),
+    "subscription_list": ("subscription", "subscription_list"),
+}
+
+# Calls that neither read through the cache nor write
+_PASSTHROUGH = frozenset({"get_by_creator", "is_token_in_db"})
+
+
+class IdentityMap:
+    """Rows read during one request, with read counters per family."""
+
+    def __init__(self) -> None:
+        self._rows: dict[tuple[str, str | None], dict[tuple[Any, ...], Any]] = {}
+        self._counts: dict[str, list[int]] = {}
+        # Sync handlers and fan-out may share the map across threads
+        self._lock = threading.Lock()
+
+    def lookup(
+        self, family: str, actor_id: str | None, key: tuple[Any, ...]
+    ) -> tuple[bool, Any]:
+        """(True, copy of the row) on a hit, else (False, None)."""
+        with self._lock:
+            rows = self._rows.get((family, actor_id))
+            if rows is None or key not in rows:
+                return False, None
+            self._count(family, hit=True)
+            return True, copy.deepcopy(rows[key])
+
+    def store(
+        self, family: str, actor_id: str | None, key: tuple[Any, ...], value: Any
+    ) -> Any:
+        """Remember a row just read from the backend; returns the caller's copy."""
+        with self._lock:
+            self._rows.setdefault((family, actor_id), {})[key] = copy.deepcopy(value)
+            self._count(family, hit=False)
+        return value
+
+    def refetched(self, family: str) -> None:
+        """A hit whose backend object had to be loaded after all."""
+        with self._lock:
+            counts = self._counts.setdefault(family, [0, 0])
+            counts[0] += 1
+            counts[1] -= 1
+
+    def evict(self, family: str, actor_id: str | None) -> None:
+        """Forget cached rows a write to ``family`` may have changed.
+
+        An actor write evicts every family of that actor; a write whose actor
+        is unknown evicts the related families for all actors.
+        """
+        families = (
+            set(FAMILIES) if family == "actor" else set(_RELATED.get(family, (family,)))
+        )
+        with self._lock:
+            for cached_family, cached_actor in list(self._rows):
+                if cached_family in families and (
+                    actor_id is None or cached_actor == actor_id
+                ):
+                    del self._rows[(cached_family, cached_actor)]
+
+    def stats(self) -> dict[str, Any]:
+        """Backend reads issued and avoided, in total and per family."""
+        with self._lock:
+            families = {
+                family: {"queries": issued, "avoided": avoided}
+                for family, (issued, avoided) in self._counts.items()
+            }
+        return {
+            "queries": sum(f["queries"] for f in families.values()),
+            "avoided": sum(f["avoided"] for f in families.values()),
+            "families": families,
+        }
+
+    def _count(self, family: str, hit: bool) -> None:
+        counts = self._counts.setdefault(family, [0, 0])
+        counts[1 if hit else 0] += 1
+
+
+class _IdentityMappedDb:
+    """A DB object whose reads go through the request's identity map."""
+
+    def __init__(self, db: Any, family: str, identity_map: IdentityMap) -> None:
+        self._db = db
+        self._family = family
+        self._map = identity_map
+        self._read_name, self._key = FAMILIES[family]
+        self._actor_id: str | None = None
+        # The read a cache hit stood in for, until the object itself is needed
+        self._pending: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name == self._read_name:
+            return self._read
+        self._load_pending()
+        attr = getattr(self._db, name)
+        if not callable(attr) or name in _PASSTHROUGH:
+            return attr
+
+        def write(*args: Any, **kwargs: Any) -> Any:
+            actor_id = kwargs.get("actor_id", self._actor_id)
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                self._map.evict(self._family, actor_id)
+
+        return write
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            self._load_pending()
+            setattr(self._db, name, value)
+
+    def _read(self, *args: Any, **kwargs: Any) -> Any:
+        actor_id, key = self._key(*args, **kwargs)
+        self._actor_id = actor_id
+        # A loaded handle decides what a backend read returns (DbTrust.get()
+        # returns its handle regardless of arguments), so bypass the cache
+        if self._pending is None and getattr(self._db, "handle", None) is None:
+            hit, value = self._map.lookup(self._family, actor_id, key)
+            if hit:
+                # A miss leaves no handle behind, so there is nothing to load
+                if value is not None:
+                    self._pending = (args, kwargs)
+                return value
+        self._load_pending()
+        value = getattr(self._db, self._read_name)(*args, **kwargs)
+        return self._map.store(self._family, actor_id, key, value)
+
+    def _load_pending(self) -> None:
+        if self._pending is None:
+            return
+        args, kwargs = self._pending
+        self._pending = None
+        getattr(self._db, self._read_name)(*args, **kwargs)
+        self._map.refetched(self._family)
+
+
+def identity_mapped(family: str, db: Any) -> Any:
+    """``db`` routed through the current request's identity map, if any."""
+    identity_map = request_context.get_identity_map()
+    if identity_map is None:
+        return db
+    return _IdentityMappedDb(db, family, identity_map)
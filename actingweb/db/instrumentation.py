@@ -0,0 +1,408 @@
+"""Per-request DB query accounting and slow-query logging.
+
+When enabled, the objects returned by the accessors in ``actingweb.db`` time
+every call to the backend and record one :class:`QueryRecord` per call:
+operation (method name), table, backend, latency, items returned and, on
+DynamoDB, the consumed capacity units the service reports. Records of a
+request (``request_context.set_request_context()`` until
+``clear_request_context()``) are collected in its :class:`QueryLog`, and when
+the request ends:
+
+- a one-line summary is logged at INFO (queries, milliseconds, items,
+  capacity, reads avoided by the identity map and the busiest operations),
+- ``on_request`` callbacks receive the :class:`QueryLog`.
+
+Calls slower than ``slow_query_ms`` are logged at WARNING as they finish, in
+or outside a request, and ``on_query`` callbacks receive every record, e.g. to
+turn it into an OpenTelemetry span::
+
+    from opentelemetry import trace
+
+    tracer = trace.get_tracer("actingweb.db")
+
+    def export(record):
+        span = tracer.start_span(
+            record.span_name,
+            kind=trace.SpanKind.CLIENT,
+            start_time=record.start_time_ns,
+            attributes=record.attributes(),
+        )
+        if record.error:
+            span.set_status(trace.Status(trace.StatusCode.ERROR, record.error))
+        span.end(end_time=record.end_time_ns)
+
+    instrumentation.configure(slow_query_ms=200, on_query=export)
+
+Instrumentation is off by default and costs nothing then: the accessors
+return the backend objects unwrapped. Enable it with :func:`configure` (or
+``ActingWebApp.with_db_instrumentation()``), or with the environment
+variables ``ACTINGWEB_DB_INSTRUMENTATION=true`` and
+``ACTINGWEB_DB_SLOW_QUERY_MS``.
+
+Reads served by the request's identity map (``actingweb.db.identity_map``)
+never reach the backend and are not recorded.
+"""
+
+import inspect
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from actingweb import request_context
+
+logger = logging.getLogger(__name__)
+
+# Table each accessor family reads and writes. The DynamoDB tables carry the
+# AWS_DB_PREFIX in front of these names.
+TABLES = {
+    "actor": "actors",
+    "actor_list": "actors",
+    "attribute": "attributes",
+    "attribute_bucket_list": "attributes",
+    "peer_trustee": "peertrustees",
+    "peer_trustee_list": "peertrustees",
+    "property": "properties",
+    "property_list": "properties",
+    "subscription": "subscriptions",
+    "subscription_list": "subscriptions",
+    "subscription_diff": "subscription_diffs",
+    "subscription_diff_list": "subscription_diffs",
+    "subscription_suspension": "subscription_suspensions",
+    "trust": "trusts",
+    "trust_list": "trusts",
+}
+
+# Methods whose dict result is a collection of rows rather than one row
+_MULTI_ROW_DICTS = frozenset({"fetch", "fetch_all_including_lists", "get_bucket"})
+
+
+def _env_enabled() -> bool:
+    return os.getenv("ACTINGWEB_DB_INSTRUMENTATION", "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+def _env_slow_query_ms() -> float | None:
+    raw = os.getenv("ACTINGWEB_DB_SLOW_QUERY_MS", "").strip()
+    if not raw:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning(f"Ignoring invalid ACTINGWEB_DB_SLOW_QUERY_MS={raw!r}")
+        return None
+
+
+_enabled = _env_enabled()
+_slow_query_ms = _env_slow_query_ms()
+_summary_log = True
+_on_query: list[Callable[["QueryRecord"], None]] = []
+_on_request: list[Callable[["QueryLog"], None]] = []
+
+# Record of the call in progress, for backend hooks that add to it
+_current: ContextVar["QueryRecord | None"] = ContextVar(
+    "db_current_query", default=None
+)
+
+
+@dataclass
+class QueryRecord:
+    """One call to a DB backend object."""
+
+    operation: str
+    table: str
+    backend: str
+    start_time_ns: int
+    duration_ms: float = 0.0
+    items: int | None = None
+    consumed_capacity: float | None = None
+    error: str | None = None
+    request_id: str | None = None
+
+    @property
+    def end_time_ns(self) -> int:
+        return self.start_time_ns + int(self.duration_ms * 1_000_000)
+
+    @property
+    def span_name(self) -> str:
+        """Span name following the OpenTelemetry database conventions."""
+        return f"{self.operation} {self.table}"
+
+    def attributes(self) -> dict[str, Any]:
+        """The record as OpenTelemetry database span attributes."""
+        attributes: dict[str, Any] = {
+            "db.system.name": self.backend,
+            "db.operation.name": self.operation,
+            "db.collection.name": self.table,
+        }
+        if self.items is not None:
+            attributes["db.response.returned_rows"] = self.items
+        if self.consumed_capacity is not None:
+            attributes["aws.dynamodb.consumed_capacity"] = self.consumed_capacity
+        if self.error is not None:
+            attributes["error.type"] = self.error
+        if self.request_id is not None:
+            attributes["actingweb.request_id"] = self.request_id
+        return attributes
+
+
+@dataclass
+class QueryLog:
+    """The DB calls of one request."""
+
+    records: list[QueryRecord] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, record: QueryRecord) -> None:
+        # Sync handlers and fan-out may record from several threads
+        with self._lock:
+            self.records.append(record)
+
+    def summary(self) -> dict[str, Any]:
+        """Totals, and count and milliseconds per ``table.operation``."""
+        with self._lock:
+            records = list(self.records)
+        operations: dict[str, dict[str, Any]] = {}
+        for record in records:
+            entry = operations.setdefault(
+                f"{record.table}.{record.operation}", {"count": 0, "duration_ms": 0.0}
+            )
+            entry["count"] += 1
+            entry["duration_ms"] += record.duration_ms
+        capacities = [
+            r.consumed_capacity for r in records if r.consumed_capacity is not None
+        ]
+        return {
+            "queries": len(records),
+            "duration_ms": sum(r.duration_ms for r in records),
+            "items": sum(r.items or 0 for r in records),
+            "consumed_capacity": sum(capacities) if capacities else None,
+            "errors": sum(1 for r in records if r.error is not None),
+            "operations": operations,
+        }
+
+
+def configure(
+    enabled: bool = True,
+    *,
+    slow_query_ms: float | None = None,
+    summary_log: bool = True,
+    on_query: Callable[[QueryRecord], None] | None = None,
+    on_request: Callable[[QueryLog], None] | None = None,
+) -> None:
+    """
+    Enable or disable DB instrumentation for the process.
+
+    Args:
+        enabled: Record DB calls. When False the accessors return the backend
+            objects unwrapped and the other settings have no effect.
+        slow_query_ms: Log calls taking longer than this at WARNING; None
+            keeps the ``ACTINGWEB_DB_SLOW_QUERY_MS`` setting, 0 disables.
+        summary_log: Log a summary line at the end of each request
+        on_query: Called with every :class:`QueryRecord` (added to the
+            callbacks already registered)
+        on_request: Called with the :class:`QueryLog` of each request that
+            made DB calls, when it ends
+
+    Example:
+        >>> configure(slow_query_ms=100, on_query=lambda r: print(r.span_name))
+    """
+    global _enabled, _slow_query_ms, _summary_log
+
+    _enabled = enabled
+    if slow_query_ms is not None:
+        _slow_query_ms = slow_query_ms or None
+    _summary_log = summary_log
+    if on_query is not None:
+        _on_query.append(on_query)
+    if on_request is not None:
+        _on_request.append(on_request)
+
+
+def reset() -> None:
+    """Back to the environment's settings, without callbacks (for tests)."""
+    global _enabled, _slow_query_ms, _summary_log
+
+    _enabled = _env_enabled()
+    _slow_query_ms = _env_slow_query_ms()
+    _summary_log = True
+    _on_query.clear()
+    _on_request.clear()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def add_consumed_capacity(units: float | None) -> None:
+    """Add capacity units a backend reported to the call in progress."""
+    record = _current.get()
+    if record is not None and units is not None:
+        record.consumed_capacity = (record.consumed_capacity or 0.0) + units
+
+
+def _item_count(operation: str, result: Any) -> int | None:
+    """Rows a call returned; None for writes and other non-row results."""
+    if isinstance(result, bool):
+        return None
+    if result is None:
+        return 0 if operation.startswith(("get", "fetch")) else None
+    if isinstance(result, list | tuple | set) or (
+        isinstance(result, dict) and operation in _MULTI_ROW_DICTS
+    ):
+        return len(result)
+    return 1
+
+
+def _finish(
+    record: QueryRecord, started: int, result: Any = None, rows: int | None = None
+) -> None:
+    record.duration_ms = (time.perf_counter_ns() - started) / 1_000_000
+    if record.error is None:
+        record.items = (
+            rows if rows is not None else _item_count(record.operation, result)
+        )
+    query_log = request_context.get_query_log()
+    if query_log is not None:
+        query_log.add(record)
+    if _slow_query_ms is not None and record.duration_ms >= _slow_query_ms:
+        logger.warning(
+            f"Slow DB query: {record.table}.{record.operation} took "
+            f"{record.duration_ms:.1f} ms ({record.backend}, items={record.items}, "
+            f"capacity={record.consumed_capacity})"
+        )
+    for callback in _on_query:
+        try:
+            callback(record)
+        except Exception as e:
+            logger.error(f"DB instrumentation on_query callback failed: {e}")
+
+
+def finish_request(query_log: QueryLog, identity_map: Any = None) -> None:
+    """Log the summary of a finished request and run ``on_request`` callbacks."""
+    if not query_log.records:
+        return
+    if _summary_log:
+        summary = query_log.summary()
+        busiest = sorted(
+            summary["operations"].items(),
+            key=lambda item: item[1]["duration_ms"],
+            reverse=True,
+        )[:3]
+        avoided = identity_map.stats()["avoided"] if identity_map is not None else 0
+        logger.info(
+            f"DB: {summary['queries']} queries in {summary['duration_ms']:.1f} ms, "
+            f"{summary['items']} items, capacity={summary['consumed_capacity']}, "
+            f"errors={summary['errors']}, avoided={avoided}; top: "
+            + ", ".join(
+                f"{name} x{entry['count']} {entry['duration_ms']:.1f} ms"
+                for name, entry in busiest
+            )
+        )
+    for callback in _on_request:
+        try:
+            callback(query_log)
+        except Exception as e:
+            logger.error(f"DB instrumentation on_request callback failed: {e}")
+
+
+class _InstrumentedDb:
+    """A DB object whose method calls are timed and recorded."""
+
+    def __init__(self, db: Any, table: str, backend: str) -> None:
+        self._db = db
+        self._table = table
+        self._backend = backend
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._db, name)
+        if not callable(attr):
+            return attr
+        if inspect.iscoroutinefunction(attr):
+
+            async def call_async(*args: Any, **kwargs: Any) -> Any:
+                record, started, token = self._start(name)
+                try:
+                    result = await attr(*args, **kwargs)
+                except Exception as e:
+                    record.error = type(e).__name__
+                    _finish(record, started)
+                    raise
+                finally:
+                    _current.reset(token)
+                _finish(record, started, result)
+                return result
+
+            return call_async
+
+        if inspect.isgeneratorfunction(attr):
+
+            def call_iter(*args: Any, **kwargs: Any) -> Iterator[Any]:
+                # One record from the call to the last row, including the
+                # time the caller spends between rows
+                record, started, token = self._start(name)
+                _current.reset(token)
+                rows = 0
+                try:
+                    for row in attr(*args, **kwargs):
+                        rows += 1
+                        yield row
+                except Exception as e:
+                    record.error = type(e).__name__
+                    raise
+                finally:
+                    _finish(record, started, rows=rows)
+
+            return call_iter
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            record, started, token = self._start(name)
+            try:
+                result = attr(*args, **kwargs)
+            except Exception as e:
+                record.error = type(e).__name__
+                _finish(record, started)
+                raise
+            finally:
+                _current.reset(token)
+            _finish(record, started, result)
+            return result
+
+        return call
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._db, name, value)
+
+    def _start(self, operation: str) -> tuple[QueryRecord, int, Any]:
+        record = QueryRecord(
+            operation=operation,
+            table=self._table,
+            backend=self._backend,
+            start_time_ns=time.time_ns(),
+            request_id=request_context.get_request_id(),
+        )
+        return record, time.perf_counter_ns(), _current.set(record)
+
+
+def instrumented(family: str, db: Any) -> Any:
+    """``db`` with its calls recorded, if instrumentation is enabled."""
+    if not _enabled:
+        return db
+    # actingweb.db.<backend>.<module>
+    parts = type(db).__module__.split(".")
+    backend = parts[2] if len(parts) > 3 and parts[:2] == ["actingweb", "db"] else ""
+    if backend == "dynamodb":
+        from actingweb.db.dynamodb._instrument import install
+
+        install()
+    return _InstrumentedDb(db, TABLES.get(family, family), backend or "unknown")
@@ -1,13 +1,14 @@
 """PostgreSQL implementation of attribute database operations."""
 
-import json
+import asyncio
 import logging
 import os
 import time
 from datetime import datetime
 from typing import Any
 
-from actingweb.db.postgresql.connection import get_connection
+from actingweb import json_codec
+from actingweb.db.postgresql.connection import get_async_connection, get_connection
 
 logger = logging.getLogger(__name__)
 
@@ -413,7 +414,7 @@ class DbAttribute:
                             bucket_name,
                             bucket,
                             name,
-                            json.dumps(data_json),
+                            json_codec.encode(data_json),
                             timestamp,
                             ttl_timestamp,
                         ),
@@ -491,6 +492,86 @@ class DbAttribute:
             )
             return False
 
+    @staticmethod
+    def insert_attr_if_absent(
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+        data: Any = None,
+        timestamp: datetime | None = None,
+        ttl_seconds: int | None = None,
+    ) -> bool:
+        """
+        Create an attribute only if no live row exists, in one statement.
+
+        ``INSERT ... ON CONFLICT DO UPDATE ... WHERE`` only overwrites a row
+        whose TTL has passed (which :meth:`get_attr` already reads as absent);
+        a live row makes the statement a no-op with rowcount 0. The conflicting
+        insert waits on the row lock, so concurrent callers see exactly one
+        True.
+
+        Args:
+            actor_id: The actor ID
+            bucket: The bucket name
+            name: The attribute name
+            data: The data to store (JSON-serializable, non-empty)
+            timestamp: Optional timestamp
+            ttl_seconds: Optional TTL in seconds from now (plus clock-skew buffer)
+
+        Returns:
+            True if this call created the attribute, False if a live one
+            exists or on error
+        """
+        if not actor_id or not bucket or not name or not data:
+            return False
+
+        ttl_timestamp = None
+        if ttl_seconds is not None:
+            from actingweb.constants import TTL_CLOCK_SKEW_BUFFER
+
+            ttl_timestamp = int(time.time()) + ttl_seconds + TTL_CLOCK_SKEW_BUFFER
+
+        from actingweb.db.utils import sanitize_json_data
+
+        data = sanitize_json_data(data, log_source="attribute")
+        bucket_name = bucket + ":" + name
+
+        try:
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        """
+                        INSERT INTO attributes (
+                            id, bucket_name, bucket, name, data, timestamp, ttl_timestamp
+                        ) VALUES (
+                            %s, %s, %s, %s, %s, %s, %s
+                        )
+                        ON CONFLICT (id, bucket_name)
+                        DO UPDATE SET
+                            data = EXCLUDED.data,
+                            timestamp = EXCLUDED.timestamp,
+                            ttl_timestamp = EXCLUDED.ttl_timestamp
+                        WHERE attributes.ttl_timestamp IS NOT NULL
+                            AND attributes.ttl_timestamp <= %s
+                        """,
+                        (
+                            actor_id,
+                            bucket_name,
+                            bucket,
+                            name,
+                            json_codec.encode(data),
+                            timestamp,
+                            ttl_timestamp,
+                            int(time.time()),
+                        ),
+                    )
+                    rows = cur.rowcount
+                conn.commit()
+            return rows == 1
+        except Exception as e:
+            logger.error(f"Error inserting attribute {actor_id}/{bucket}/{name}: {e}")
+            return False
+
     @staticmethod
     def conditional_update_attr(
         actor_id: str | None = None,
@@ -540,11 +621,11 @@ class DbAttribute:
                         WHERE id = %s AND bucket_name = %s AND data = %s::jsonb
                         """,
                         (
-                            json.dumps(new_data),
+                            json_codec.encode(new_data),
                             timestamp,
                             actor_id,
                             bucket_name,
-                            json.dumps(old_data),
+                            json_codec.encode(old_data),
                         ),
                     )
                     rows_updated = cur.rowcount
@@ -816,3 +897,267 @@ class DbAttributeBucketList:
         except Exception as e:
             logger.error(f"Error deleting all attributes for actor {actor_id}: {e}")
             return False
+
+
+def _ttl_timestamp(ttl_seconds: int | None) -> int | None:
+    """Epoch expiry for ``ttl_seconds`` from now, plus the clock-skew buffer."""
+    if ttl_seconds is None:
+        return None
+    from actingweb.constants import TTL_CLOCK_SKEW_BUFFER
+
+    return int(time.time()) + ttl_seconds + TTL_CLOCK_SKEW_BUFFER
+
+
+class AsyncDbAttribute:
+    """
+    Async DbAttribute for the async handlers, on the async connection pool.
+
+    Same SQL and return shapes as :class:`DbAttribute`. Deletes with
+    ``ACTINGWEB_PG_DELETE_DIAGNOSTICS`` on run the instrumented sync path in a
+    worker thread.
+    """
+
+    async def _execute(self, query: str, params: tuple[Any, ...]) -> int:
+        """Run one write statement and commit; returns the rowcount."""
+        async with get_async_connection("attribute") as conn:
+            cur = await conn.execute(query, params)
+            rowcount: int = cur.rowcount
+            await conn.commit()
+        return rowcount
+
+    async def get_bucket(
+        self, actor_id: str | None = None, bucket: str | None = None
+    ) -> dict[str, dict[str, Any]] | None:
+        """Get all attributes from a bucket, or None if it is empty."""
+        if not actor_id or not bucket:
+            return None
+
+        try:
+            async with get_async_connection("attribute") as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        """
+                        SELECT name, data, timestamp
+                        FROM attributes
+                        WHERE id = %s AND bucket = %s
+                        """,
+                        (actor_id, bucket),
+                    )
+                    rows = await cur.fetchall()
+        except Exception as e:
+            logger.error(f"Error retrieving bucket {actor_id}/{bucket}: {e}")
+            return None
+        if not rows:
+            return None
+        return {row[0]: {"data": row[1], "timestamp": row[2]} for row in rows}
+
+    async def get_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Get a single attribute from a bucket."""
+        if not actor_id or not bucket or not name:
+            return None
+
+        try:
+            async with get_async_connection("attribute") as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        """
+                        SELECT data, timestamp
+                        FROM attributes
+                        WHERE id = %s AND bucket_name = %s
+                        """,
+                        (actor_id, bucket + ":" + name),
+                    )
+                    row = await cur.fetchone()
+        except Exception as e:
+            logger.error(f"Error retrieving attribute {actor_id}/{bucket}/{name}: {e}")
+            return None
+        if not row:
+            return None
+        return {"data": row[0], "timestamp": row[1]}
+
+    async def set_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+        data: Any = None,
+        timestamp: datetime | None = None,
+        ttl_seconds: int | None = None,
+    ) -> bool:
+        """Set an attribute in a bucket (empty data deletes)."""
+        if not actor_id or not name or not bucket:
+            return False
+        bucket_name = bucket + ":" + name
+
+        if not data:
+            if _delete_diagnostics_enabled():
+                return await asyncio.to_thread(
+                    DbAttribute.set_attr, actor_id, bucket, name, None
+                )
+            try:
+                await self._execute(
+                    "DELETE FROM attributes WHERE id = %s AND bucket_name = %s",
+                    (actor_id, bucket_name),
+                )
+                return True
+            except Exception as e:
+                logger.error(
+                    f"Error deleting attribute {actor_id}/{bucket}/{name}: {e}"
+                )
+                return False
+
+        from actingweb.db.utils import sanitize_json_data
+
+        data = sanitize_json_data(data, log_source="attribute")
+        try:
+            await self._execute(
+                """
+                INSERT INTO attributes (
+                    id, bucket_name, bucket, name, data, timestamp, ttl_timestamp
+                ) VALUES (
+                    %s, %s, %s, %s, %s, %s, %s
+                )
+                ON CONFLICT (id, bucket_name)
+                DO UPDATE SET
+                    data = EXCLUDED.data,
+                    timestamp = EXCLUDED.timestamp,
+                    ttl_timestamp = EXCLUDED.ttl_timestamp
+                """,
+                (
+                    actor_id,
+                    bucket_name,
+                    bucket,
+                    name,
+                    json_codec.encode(data),
+                    timestamp,
+                    _ttl_timestamp(ttl_seconds),
+                ),
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error setting attribute {actor_id}/{bucket}/{name}: {e}")
+            return False
+
+    async def delete_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+    ) -> bool:
+        """Delete an attribute in a bucket."""
+        return await self.set_attr(actor_id=actor_id, bucket=bucket, name=name)
+
+    async def delete_attr_conditional(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+    ) -> bool:
+        """Delete an attribute; True only if this call removed an existing row."""
+        if not actor_id or not bucket or not name:
+            return False
+
+        try:
+            rows = await self._execute(
+                "DELETE FROM attributes WHERE id = %s AND bucket_name = %s",
+                (actor_id, bucket + ":" + name),
+            )
+        except Exception as e:
+            logger.error(
+                f"Error conditionally deleting attribute {actor_id}/{bucket}/{name}: {e}"
+            )
+            return False
+        return rows == 1
+
+    async def insert_attr_if_absent(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+        data: Any = None,
+        timestamp: datetime | None = None,
+        ttl_seconds: int | None = None,
+    ) -> bool:
+        """Create an attribute only if no live row exists; see
+        :meth:`DbAttribute.insert_attr_if_absent`."""
+        if not actor_id or not bucket or not name or not data:
+            return False
+
+        from actingweb.db.utils import sanitize_json_data
+
+        data = sanitize_json_data(data, log_source="attribute")
+        try:
+            rows = await self._execute(
+                """
+                INSERT INTO attributes (
+                    id, bucket_name, bucket, name, data, timestamp, ttl_timestamp
+                ) VALUES (
+                    %s, %s, %s, %s, %s, %s, %s
+                )
+                ON CONFLICT (id, bucket_name)
+                DO UPDATE SET
+                    data = EXCLUDED.data,
+                    timestamp = EXCLUDED.timestamp,
+                    ttl_timestamp = EXCLUDED.ttl_timestamp
+                WHERE attributes.ttl_timestamp IS NOT NULL
+                    AND attributes.ttl_timestamp <= %s
+                """,
+                (
+                    actor_id,
+                    bucket + ":" + name,
+                    bucket,
+                    name,
+                    json_codec.encode(data),
+                    timestamp,
+                    _ttl_timestamp(ttl_seconds),
+                    int(time.time()),
+                ),
+            )
+        except Exception as e:
+            logger.error(f"Error inserting attribute {actor_id}/{bucket}/{name}: {e}")
+            return False
+        return rows == 1
+
+    async def conditional_update_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+        old_data: Any = None,
+        new_data: Any = None,
+        timestamp: datetime | None = None,
+    ) -> bool:
+        """Compare-and-swap: update only if the stored data equals old_data."""
+        if not actor_id or not bucket or not name:
+            return False
+
+        from actingweb.db.utils import sanitize_json_data
+
+        new_data = sanitize_json_data(new_data, log_source="attribute")
+        old_data = sanitize_json_data(old_data, log_source="attribute")
+        try:
+            rows = await self._execute(
+                """
+                UPDATE attributes
+                SET data = %s::jsonb, timestamp = %s
+                WHERE id = %s AND bucket_name = %s AND data = %s::jsonb
+                """,
+                (
+                    json_codec.encode(new_data),
+                    timestamp,
+                    actor_id,
+                    bucket + ":" + name,
+                    json_codec.encode(old_data),
+                ),
+            )
+        except Exception as e:
+            logger.error(
+                f"Error conditionally updating attribute {actor_id}/{bucket}/{name}: {e}"
+            )
+            return False
+        return rows == 1
@@ -3,17 +3,36 @@ PostgreSQL connection pool management for ActingWeb.
 
 Provides thread-safe connection pooling using psycopg3's built-in ConnectionPool.
 Handles configuration from environment variables and supports test isolation via schema prefixes.
+
+Every checkout is timed and attributed to a *query family* (by default the
+``actingweb.db.postgresql`` module that asked for the connection), so under
+load :func:`pool_metrics` tells pool wait apart from time spent holding the
+connection. An optional background thread health-checks idle connections.
+
+:func:`get_async_connection` is the asyncio counterpart, backed by a
+``psycopg_pool.AsyncConnectionPool`` with the same settings and counted in the
+same metrics. It serves the ``Async*`` DB classes used by async handlers.
 """
 
+import asyncio
 import logging
 import os
+import sys
 import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass
 from typing import Any
 
+from actingweb import json_codec
+
 # Import will be available when postgresql extra is installed
 try:
     from psycopg import sql
-    from psycopg_pool import ConnectionPool
+    from psycopg.types.json import set_json_loads
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool, PoolTimeout
 except ImportError as e:
     raise ImportError(
         "PostgreSQL backend requires psycopg. "
@@ -35,6 +54,176 @@ _pool_schema: str | None = None
 _pool_lock = threading.Lock()
 
 
+# An async pool and its background tasks belong to the event loop that opened
+# it, so each loop gets its own, closed when the loop shuts down its async
+# generators or by close_async_pool(). Like the sync pool, a loop's pool is
+# rebuilt when the schema changes.
+class _LoopPool:
+    """A loop's pool, the schema it was built for and what closes it."""
+
+    __slots__ = ("pool", "schema", "closer")
+
+    def __init__(self, pool: Any, schema: str | None, closer: Any) -> None:
+        self.pool = pool
+        self.schema = schema
+        self.closer = closer
+
+
+_async_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_pool_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool tuning, read from the environment by :meth:`from_env`.
+
+    Environment variables:
+        PG_POOL_MIN_SIZE: Connections kept open (default: 2)
+        PG_POOL_MAX_SIZE: Upper bound on connections (default: 10)
+        PG_POOL_TIMEOUT: Seconds to wait for a connection (default: 30)
+        PG_POOL_MAX_WAITING: Queued requests before new ones fail at once,
+            0 for unbounded (default: 0)
+        PG_POOL_MAX_IDLE: Seconds before an idle connection above the
+            minimum is closed (default: 600)
+        PG_POOL_MAX_LIFETIME: Seconds before a connection is replaced
+            (default: 3600)
+        PG_POOL_CHECK_ON_CHECKOUT: Test each connection with a round trip
+            when it is handed out (default: true). With the background health
+            check enabled this can be turned off to save that round trip.
+        PG_POOL_HEALTH_CHECK_INTERVAL: Seconds between background health
+            checks, 0 to disable (default: 60)
+        PG_PREPARE_THRESHOLD: Executions of a query before psycopg prepares
+            it server-side; "none" disables prepared statements, as needed
+            behind PgBouncer in transaction mode (default: 5)
+        PG_STATEMENT_TIMEOUT_MS: Server-side statement timeout, 0 for none
+            (default: 0)
+    """
+
+    min_size: int = 2
+    max_size: int = 10
+    timeout: float = 30.0
+    max_waiting: int = 0
+    max_idle: float = 600.0
+    max_lifetime: float = 3600.0
+    check_on_checkout: bool = True
+    health_check_interval: float = 60.0
+    prepare_threshold: int | None = 5
+    statement_timeout_ms: int = 0
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        prepare = os.getenv("PG_PREPARE_THRESHOLD", "5").strip().lower()
+        settings = cls(
+            min_size=int(os.getenv("PG_POOL_MIN_SIZE", "2")),
+            max_size=int(os.getenv("PG_POOL_MAX_SIZE", "10")),
+            timeout=float(os.getenv("PG_POOL_TIMEOUT", "30.0")),
+            max_waiting=int(os.getenv("PG_POOL_MAX_WAITING", "0")),
+            max_idle=float(os.getenv("PG_POOL_MAX_IDLE", "600")),
+            max_lifetime=float(os.getenv("PG_POOL_MAX_LIFETIME", "3600")),
+            check_on_checkout=_env_bool("PG_POOL_CHECK_ON_CHECKOUT", True),
+            health_check_interval=float(
+                os.getenv("PG_POOL_HEALTH_CHECK_INTERVAL", "60")
+            ),
+            prepare_threshold=None if prepare in ("", "none") else int(prepare),
+            statement_timeout_ms=int(os.getenv("PG_STATEMENT_TIMEOUT_MS", "0")),
+        )
+        if settings.min_size < 0 or settings.max_size < max(settings.min_size, 1):
+            raise ValueError(
+                f"Invalid PostgreSQL pool size: min={settings.min_size}, "
+                f"max={settings.max_size}"
+            )
+        return settings
+
+    def connection_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for each new ``psycopg.Connection``."""
+        kwargs: dict[str, Any] = {"prepare_threshold": self.prepare_threshold}
+        if self.statement_timeout_ms > 0:
+            kwargs["options"] = f"-c statement_timeout={self.statement_timeout_ms}"
+        return kwargs
+
+
+@dataclass
+class QueryFamilyStats:
+    """Checkout statistics for one query family. Times in milliseconds."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+    held_ms_total: float = 0.0
+
+
+class PoolMetrics:
+    """Per-query-family checkout counters, shared by all threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._families: dict[str, QueryFamilyStats] = {}
+        self.last_health_check: dict[str, Any] | None = None
+
+    def _family(self, family: str) -> QueryFamilyStats:
+        stats = self._families.get(family)
+        if stats is None:
+            stats = self._families[family] = QueryFamilyStats()
+        return stats
+
+    def record_checkout(self, family: str, wait_s: float) -> None:
+        wait_ms = wait_s * 1000.0
+        with self._lock:
+            stats = self._family(family)
+            stats.checkouts += 1
+            stats.wait_ms_total += wait_ms
+            if wait_ms > stats.wait_ms_max:
+                stats.wait_ms_max = wait_ms
+
+    def record_timeout(self, family: str, wait_s: float) -> None:
+        wait_ms = wait_s * 1000.0
+        with self._lock:
+            stats = self._family(family)
+            stats.timeouts += 1
+            stats.wait_ms_total += wait_ms
+            if wait_ms > stats.wait_ms_max:
+                stats.wait_ms_max = wait_ms
+
+    def record_held(self, family: str, held_s: float) -> None:
+        with self._lock:
+            self._family(family).held_ms_total += held_s * 1000.0
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            families = {name: asdict(stats) for name, stats in self._families.items()}
+        for stats in families.values():
+            attempts = stats["checkouts"] + stats["timeouts"]
+            stats["wait_ms_avg"] = (
+                stats["wait_ms_total"] / attempts if attempts else 0.0
+            )
+            stats["held_ms_avg"] = (
+                stats["held_ms_total"] / stats["checkouts"]
+                if stats["checkouts"]
+                else 0.0
+            )
+        return families
+
+    def reset(self) -> None:
+        with self._lock:
+            self._families.clear()
+            self.last_health_check = None
+
+
+_metrics = PoolMetrics()
+_pool_settings: PoolSettings | None = None
+_health_checker: "_HealthChecker | None" = None
+
+
 def get_connection_string() -> str:
     """
     Build PostgreSQL connection string from environment variables.
@@ -101,7 +290,8 @@ def _configure_connection(conn: Any) -> None:
     """
     Configure a connection after checkout from the pool.
 
-    Sets the search_path to the worker-specific schema for test isolation.
+    JSON and JSONB columns are decoded with ``actingweb.json_codec``. Sets the
+    search_path to the worker-specific schema for test isolation.
     This ensures all queries use the correct schema without requiring
     explicit schema prefixes in SQL statements.
 
@@ -112,6 +302,7 @@ def _configure_connection(conn: Any) -> None:
     Args:
         conn: The connection to configure
     """
+    set_json_loads(json_codec.loads, conn)
     schema = get_schema_name()
     if schema and schema != "public":
         with conn.cursor() as cur:
@@ -130,10 +321,8 @@ def get_pool() -> ConnectionPool:
     The pool is created on first access and reused for all subsequent connections.
     Configuration is read from environment variables.
 
-    Environment variables:
-        PG_POOL_MIN_SIZE: Minimum pool size (default: 2)
-        PG_POOL_MAX_SIZE: Maximum pool size (default: 10)
-        PG_POOL_TIMEOUT: Connection timeout in seconds (default: 30)
+    Sizing, timeouts, prepared statements and the health check are read from
+    the environment; see :class:`PoolSettings`.
 
     Returns:
         ConnectionPool instance
@@ -141,7 +330,7 @@ def get_pool() -> ConnectionPool:
     Raises:
         psycopg.OperationalError: If unable to connect to database
     """
-    global _pool, _pool_schema
+    global _pool, _pool_schema, _pool_settings, _health_checker
 
     schema_now = get_schema_name()
     if _pool is None or _pool_schema != schema_now:
@@ -153,6 +342,7 @@ def get_pool() -> ConnectionPool:
                     _pool_schema,
                     schema_now,
                 )
+                _stop_health_checker()
                 try:
                     _pool.close()
                 except Exception:  # pragma: no cover - best effort
@@ -160,33 +350,46 @@ def get_pool() -> ConnectionPool:
                 _pool = None
             if _pool is None:
                 conninfo = get_connection_string()
-                min_size = int(os.getenv("PG_POOL_MIN_SIZE", "2"))
-                max_size = int(os.getenv("PG_POOL_MAX_SIZE", "10"))
-                timeout = float(os.getenv("PG_POOL_TIMEOUT", "30.0"))
+                settings = PoolSettings.from_env()
                 schema = get_schema_name()
 
                 logger.info(
-                    f"Creating PostgreSQL connection pool (min={min_size}, max={max_size}, schema={schema})"
+                    f"Creating PostgreSQL connection pool (min={settings.min_size}, "
+                    f"max={settings.max_size}, schema={schema})"
                 )
 
                 _pool = ConnectionPool(
                     conninfo=conninfo,
-                    min_size=min_size,
-                    max_size=max_size,
-                    timeout=timeout,
+                    kwargs=settings.connection_kwargs(),
+                    min_size=settings.min_size,
+                    max_size=settings.max_size,
+                    timeout=settings.timeout,
+                    max_waiting=settings.max_waiting,
+                    max_idle=settings.max_idle,
+                    max_lifetime=settings.max_lifetime,
                     # Configure pool to check connections on checkout
-                    check=ConnectionPool.check_connection,
+                    check=(
+                        ConnectionPool.check_connection
+                        if settings.check_on_checkout
+                        else None
+                    ),
                     # Configure each connection after checkout to set search_path
                     configure=_configure_connection,
                 )
 
                 _pool_schema = schema
+                _pool_settings = settings
+                if settings.health_check_interval > 0:
+                    _health_checker = _HealthChecker(
+                        _pool, settings.health_check_interval
+                    )
+                    _health_checker.start()
                 logger.info("PostgreSQL connection pool created successfully")
 
     return _pool
 
 
-def get_connection() -> Any:
+def get_connection(family: str | None = None) -> Any:
     """
     Get a connection from the pool (as context manager).
 
@@ -195,14 +398,289 @@ def get_connection() -> Any:
             with conn.cursor() as cur:
                 cur.execute("SELECT 1")
 
+    Args:
+        family: Query family the checkout is counted under in
+            :func:`pool_metrics`. Defaults to the calling module's name
+            (``"property"``, ``"trust"``, ...).
+
     Returns:
         Connection context manager from the pool
 
     Raises:
         psycopg.OperationalError: If unable to get connection from pool
+        psycopg_pool.PoolTimeout: If no connection became free in time
     """
     pool = get_pool()
-    return pool.connection()
+    if family is None:
+        module = sys._getframe(1).f_globals.get("__name__", "")
+        family = module.rsplit(".", 1)[-1] or "unknown"
+    return _checkout(pool, family)
+
+
+@contextmanager
+def _checkout(pool: Any, family: str) -> Iterator[Any]:
+    """``pool.connection()``, timing the wait for it and how long it is held."""
+    start = time.perf_counter()
+    acquired: float | None = None
+    try:
+        with ExitStack() as stack:
+            try:
+                conn = stack.enter_context(pool.connection())
+            except PoolTimeout:
+                _metrics.record_timeout(family, time.perf_counter() - start)
+                raise
+            acquired = time.perf_counter()
+            _metrics.record_checkout(family, acquired - start)
+            yield conn
+    finally:
+        if acquired is not None:
+            _metrics.record_held(family, time.perf_counter() - acquired)
+
+
+async def _configure_async_connection(conn: Any) -> None:
+    """Async counterpart of :func:`_configure_connection`."""
+    set_json_loads(json_codec.loads, conn)
+    schema = get_schema_name()
+    if schema and schema != "public":
+        if not schema.replace("_", "").replace("-", "").isalnum():
+            raise ValueError(f"Invalid schema name: {schema}")
+        async with conn.cursor() as cur:
+            await cur.execute(
+                sql.SQL("SET search_path TO {}").format(sql.Identifier(schema))
+            )
+        await conn.commit()  # Leave the connection idle, as above
+        logger.debug(f"Set search_path to {schema} (async)")
+
+
+async def _close_at_shutdown(loop: asyncio.AbstractEventLoop, pool: Any) -> Any:
+    """Forgets ``loop``'s pool and closes it when finalized.
+
+    Started once, the generator is one of the loop's async generators, which
+    ``loop.shutdown_asyncgens()`` (run by ``asyncio.run()`` and uvicorn
+    before they close the loop) finalizes on that loop.
+    """
+    try:
+        yield
+    finally:
+        entry = _async_pools.get(loop)
+        if entry is not None and entry.pool is pool:
+            del _async_pools[loop]
+        logger.info("Closing async PostgreSQL connection pool")
+        await pool.close()
+
+
+async def get_async_pool() -> AsyncConnectionPool:
+    """
+    Get or create the async connection pool for the running event loop.
+
+    Built from the same :class:`PoolSettings` as :func:`get_pool`. Each loop
+    has its own pool, closed when the loop shuts down its async generators or
+    by :func:`close_async_pool`, and rebuilt when the schema changes. The
+    background health checker only watches the sync pool; the async pools
+    rely on ``check_connection`` at checkout (``PG_POOL_CHECK_ON_CHECKOUT``).
+
+    Returns:
+        Open AsyncConnectionPool instance
+    """
+    loop = asyncio.get_running_loop()
+    schema_now = get_schema_name()
+    entry = _async_pools.get(loop)
+    if entry is not None and entry.schema == schema_now:
+        return entry.pool  # type: ignore[no-any-return]
+
+    lock = _async_pool_locks.get(loop)
+    if lock is None:
+        lock = _async_pool_locks[loop] = asyncio.Lock()
+    async with lock:
+        entry = _async_pools.get(loop)
+        if entry is not None:
+            if entry.schema == schema_now:
+                return entry.pool  # type: ignore[no-any-return]
+            logger.info("Rebuilding async PostgreSQL connection pool")
+            del _async_pools[loop]
+            try:
+                await entry.closer.aclose()
+            except Exception:  # pragma: no cover - best effort
+                logger.debug("Error closing stale async pool", exc_info=True)
+
+        # A pool holds its loop, so an entry outlives a loop closed without
+        # shutting down its async generators; it cannot be closed from here,
+        # only dropped
+        for closed in [other for other in _async_pools if other.is_closed()]:
+            _async_pools.pop(closed, None)
+
+        settings = PoolSettings.from_env()
+        logger.info(
+            f"Creating async PostgreSQL connection pool (min={settings.min_size}, "
+            f"max={settings.max_size}, schema={schema_now})"
+        )
+        pool = AsyncConnectionPool(
+            conninfo=get_connection_string(),
+            kwargs=settings.connection_kwargs(),
+            min_size=settings.min_size,
+            max_size=settings.max_size,
+            timeout=settings.timeout,
+            max_waiting=settings.max_waiting,
+            max_idle=settings.max_idle,
+            max_lifetime=settings.max_lifetime,
+            check=(
+                AsyncConnectionPool.check_connection
+                if settings.check_on_checkout
+                else None
+            ),
+            configure=_configure_async_connection,
+            open=False,
+        )
+        await pool.open()
+        closer = _close_at_shutdown(loop, pool)
+        await closer.__anext__()
+        _async_pools[loop] = _LoopPool(pool, schema_now, closer)
+    return pool
+
+
+def get_async_connection(family: str | None = None) -> Any:
+    """
+    Get a connection from the async pool (as async context manager).
+
+        async with get_async_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute("SELECT 1")
+
+    Args:
+        family: Query family for :func:`pool_metrics`, as for
+            :func:`get_connection`.
+
+    Returns:
+        Async context manager yielding a ``psycopg.AsyncConnection``
+
+    Raises:
+        psycopg.OperationalError: If unable to get connection from pool
+        psycopg_pool.PoolTimeout: If no connection became free in time
+    """
+    if family is None:
+        module = sys._getframe(1).f_globals.get("__name__", "")
+        family = module.rsplit(".", 1)[-1] or "unknown"
+    return _async_checkout(family)
+
+
+@asynccontextmanager
+async def _async_checkout(family: str) -> AsyncIterator[Any]:
+    """Async ``pool.connection()``, timed like :func:`_checkout`."""
+    pool = await get_async_pool()
+    start = time.perf_counter()
+    acquired: float | None = None
+    try:
+        async with AsyncExitStack() as stack:
+            try:
+                conn = await stack.enter_async_context(pool.connection())
+            except PoolTimeout:
+                _metrics.record_timeout(family, time.perf_counter() - start)
+                raise
+            acquired = time.perf_counter()
+            _metrics.record_checkout(family, acquired - start)
+            yield conn
+    finally:
+        if acquired is not None:
+            _metrics.record_held(family, time.perf_counter() - acquired)
+
+
+async def close_async_pool() -> None:
+    """
+    Close the running event loop's async connection pool.
+
+    Call it e.g. in the FastAPI lifespan shutdown. A new pool is created on
+    the loop's next :func:`get_async_connection`.
+    """
+    entry = _async_pools.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry.closer.aclose()
+
+
+def pool_metrics() -> dict[str, Any]:
+    """
+    Pool usage statistics, for a metrics endpoint or periodic logging.
+
+    Returns:
+        ``pool``: ``ConnectionPool.get_stats()`` (sizes, waiting requests,
+        errors; empty before the pool exists), ``async_pool``: the same
+        summed over the event loops' async pools, ``families``: per query family
+        checkouts, timeouts and wait/held milliseconds, ``health``: result of
+        the last :func:`check_pool_health`, and ``settings``.
+    """
+    pool = _pool
+    async_stats: dict[str, int] = {}
+    for entry in list(_async_pools.values()):
+        for key, value in entry.pool.get_stats().items():
+            async_stats[key] = async_stats.get(key, 0) + value
+    return {
+        "pool": pool.get_stats() if pool is not None else {},
+        "async_pool": async_stats,
+        "families": _metrics.snapshot(),
+        "health": _metrics.last_health_check,
+        "settings": asdict(_pool_settings) if _pool_settings is not None else None,
+    }
+
+
+def reset_pool_metrics() -> None:
+    """Clear the per-family counters (the pool's own stats are kept)."""
+    _metrics.reset()
+
+
+def check_pool_health(pool: Any = None, timeout: float = 5.0) -> dict[str, Any]:
+    """
+    Replace broken or expired idle connections, then run ``SELECT 1``.
+
+    Args:
+        pool: Pool to check (default: the global pool, if created)
+        timeout: Seconds to wait for a connection; a saturated pool reports
+            unhealthy rather than blocking the checker
+
+    Returns:
+        ``{"ok": bool, "latency_ms": float, "checked_at": float}`` plus
+        ``"error"`` when the check failed. Also kept for :func:`pool_metrics`.
+    """
+    pool = pool if pool is not None else _pool
+    start = time.perf_counter()
+    result: dict[str, Any]
+    if pool is None:
+        result = {"ok": False, "error": "connection pool not created"}
+    else:
+        try:
+            pool.check()
+            with pool.connection(timeout=timeout) as conn:
+                conn.execute("SELECT 1")
+            result = {"ok": True}
+        except Exception as e:
+            logger.warning(f"PostgreSQL pool health check failed: {e}")
+            result = {"ok": False, "error": str(e)}
+    result["latency_ms"] = (time.perf_counter() - start) * 1000.0
+    result["checked_at"] = time.time()
+    _metrics.last_health_check = result
+    return result
+
+
+class _HealthChecker(threading.Thread):
+    """Runs :func:`check_pool_health` every ``interval`` seconds."""
+
+    def __init__(self, pool: Any, interval: float) -> None:
+        super().__init__(name="actingweb-pg-health", daemon=True)
+        self._pool = pool
+        self._interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            check_pool_health(self._pool)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+def _stop_health_checker() -> None:
+    global _health_checker
+    if _health_checker is not None:
+        _health_checker.stop()
+        _health_checker = None
 
 
 def close_pool() -> None:
@@ -216,15 +694,17 @@ def close_pool() -> None:
 
     After calling this, a new pool will be created on next get_connection() call.
     """
-    global _pool, _pool_schema
+    global _pool, _pool_schema, _pool_settings
 
     if _pool is not None:
         with _pool_lock:
             if _pool is not None:
                 logger.info("Closing PostgreSQL connection pool")
+                _stop_health_checker()
                 _pool.close()
                 _pool = None
                 _pool_schema = None
+                _pool_settings = None
                 logger.info("PostgreSQL connection pool closed")
 
 
@@ -1,12 +1,13 @@
 """PostgreSQL implementation of property database operations."""
 
-import json
+import asyncio
 import logging
 import os
 from typing import Any
 
+from actingweb import json_codec
 from actingweb.db.exceptions import DbError
-from actingweb.db.postgresql.connection import get_connection
+from actingweb.db.postgresql.connection import get_async_connection, get_connection
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ def _serialize_property_value(value: Any) -> str | None:
     if value is not None and not isinstance(value, str):
         try:
             sanitized_value = sanitize_json_data(value, log_source="property")
-            value = json.dumps(sanitized_value)
+            value = json_codec.dumps(sanitized_value)
         except (TypeError, ValueError):
             value = str(value)
     elif isinstance(value, str):
@@ -288,7 +289,7 @@ class DbProperty:
             try:
                 # Defensive sanitization of own data before JSON encoding
                 sanitized_value = sanitize_json_data(value, log_source="property")
-                value = json.dumps(sanitized_value)
+                value = json_codec.dumps(sanitized_value)
             except (TypeError, ValueError):
                 value = str(value)
         elif isinstance(value, str):
@@ -898,3 +899,176 @@ class DbPropertyList:
         except Exception as e:
             logger.error(f"Error deleting properties for actor {self.actor_id}: {e}")
             return False
+
+
+class AsyncDbProperty:
+    """
+    Async DbProperty for the async handlers, on the async connection pool.
+
+    Takes the same configuration as :class:`DbProperty`. Writes to indexed
+    properties keep the lookup table in step inside one transaction, so those
+    run :class:`DbProperty` in a worker thread; everything else is native.
+    """
+
+    handle: dict[str, Any] | None
+
+    def __init__(
+        self,
+        use_lookup_table: bool | None = None,
+        indexed_properties: list[str] | None = None,
+    ) -> None:
+        self.handle = None
+        self._sync = DbProperty(
+            use_lookup_table=use_lookup_table, indexed_properties=indexed_properties
+        )
+
+    async def get(
+        self, actor_id: str | None = None, name: str | None = None
+    ) -> str | None:
+        """
+        Get property value.
+
+        Raises:
+            DbError: On a backend fault. Only row absence returns None.
+        """
+        if not actor_id or not name:
+            return None
+
+        try:
+            async with get_async_connection("property") as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        "SELECT value FROM properties WHERE id = %s AND name = %s",
+                        (actor_id, name),
+                    )
+                    row = await cur.fetchone()
+        except Exception as e:
+            logger.error(f"Error retrieving property {actor_id}/{name}: {e}")
+            raise DbError("property read", actor_id) from e
+        if not row:
+            return None
+        value: str = row[0]
+        self.handle = {"id": actor_id, "name": name, "value": value}
+        return value
+
+    async def set(
+        self, actor_id: str | None = None, name: str | None = None, value: Any = None
+    ) -> bool:
+        """
+        Set property value (empty value deletes).
+
+        Returns:
+            True on success, False on failure (logged, not raised).
+        """
+        if not name:
+            return False
+        if self._sync._should_index_property(name):
+            return await self._run_sync(self._sync.set, actor_id, name, value)
+
+        value = _serialize_property_value(value)
+        if value is None:
+            if await self.get(actor_id=actor_id, name=name):
+                await self.delete()
+            return True
+        if not actor_id:
+            return False
+
+        try:
+            async with get_async_connection("property") as conn:
+                await conn.execute(
+                    """
+                    INSERT INTO properties (id, name, value)
+                    VALUES (%s, %s, %s)
+                    ON CONFLICT (id, name)
+                    DO UPDATE SET value = EXCLUDED.value
+                    """,
+                    (actor_id, name, value),
+                )
+                await conn.commit()
+        except Exception as e:
+            logger.error(f"Error setting property {actor_id}/{name}: {e}")
+            return False
+        self.handle = {"id": actor_id, "name": name, "value": value}
+        return True
+
+    async def delete(self) -> bool:
+        """
+        Delete property using self.handle.
+
+        Returns:
+            True on success, False on failure
+        """
+        if not self.handle:
+            return False
+        actor_id = self.handle.get("id")
+        name = self.handle.get("name")
+        if not actor_id or not name:
+            logger.error("AsyncDbProperty handle missing id or name field")
+            return False
+        if self._sync._should_index_property(name):
+            return await self._run_sync(self._sync.delete)
+
+        try:
+            async with get_async_connection("property") as conn:
+                await conn.execute(
+                    "DELETE FROM properties WHERE id = %s AND name = %s",
+                    (actor_id, name),
+                )
+                await conn.commit()
+        except Exception as e:
+            logger.error(f"Error deleting property {actor_id}/{name}: {e}")
+            return False
+        self.handle = None
+        return True
+
+    async def _run_sync(self, method: Any, *args: Any) -> bool:
+        """Run a ``DbProperty`` write in a thread, sharing this handle."""
+        self._sync.handle = self.handle
+        ok: bool = await asyncio.to_thread(method, *args)
+        self.handle = self._sync.handle
+        return ok
+
+
+class AsyncDbPropertyList:
+    """Async DbPropertyList: fetches an actor's plain properties."""
+
+    def __init__(
+        self,
+        use_lookup_table: bool | None = None,
+        indexed_properties: list[str] | None = None,
+    ) -> None:
+        # Accepted for symmetry with DbPropertyList; fetch() does not need them
+        self.actor_id: str | None = None
+        self.props: dict[str, str] | None = None
+
+    async def fetch(self, actor_id: str | None = None) -> dict[str, str] | None:
+        """
+        Retrieve the plain (non-list) properties for an actor, as
+        :meth:`DbPropertyList.fetch` does.
+
+        Returns:
+            Dict of {property_name: property_value}, or None on error
+        """
+        if not actor_id:
+            return None
+        self.actor_id = actor_id
+
+        try:
+            async with get_async_connection("property") as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        """
+                        SELECT name, value
+                        FROM properties
+                        WHERE id = %s
+                          AND name NOT LIKE 'list:%%'
+                        ORDER BY name
+                        """,
+                        (actor_id,),
+                    )
+                    rows = await cur.fetchall()
+        except Exception as e:
+            logger.error(f"Error fetching properties for actor {actor_id}: {e}")
+            return None
+        self.props = dict(rows)
+        return self.props
@@ -1,13 +1,17 @@
 """PostgreSQL implementation of subscription diff database operations."""
 
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
-from actingweb.db.postgresql.connection import get_connection
+from actingweb.db.postgresql.connection import get_async_connection, get_connection
 
 logger = logging.getLogger(__name__)
 
+# Rows per query of DbSubscriptionDiffList.iter_fetch()
+DIFF_PAGE_SIZE = 100
+
 
 class DbSubscriptionDiff:
     """
@@ -310,6 +314,67 @@ class DbSubscriptionDiffList:
             logger.error(f"Error fetching subscription diffs for actor {actor_id}: {e}")
             return []
 
+    def iter_fetch(
+        self,
+        actor_id: str | None = None,
+        subid: str | None = None,
+        page_size: int = DIFF_PAGE_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield subscription diffs for an actor, as fetch() returns them.
+
+        Reads page_size rows per query (keyset pagination on seqnr) and
+        returns the connection to the pool between pages, so a consumer that
+        streams the diffs to a slow client holds neither all rows nor a
+        connection.
+
+        Args:
+            actor_id: The actor ID
+            subid: Optional subscription ID to filter by
+            page_size: Rows read per query
+
+        Yields:
+            Subscription diff dicts sorted by sequence
+        """
+        if not actor_id:
+            return
+
+        query = """
+            SELECT id, subid_seqnr, subid, timestamp, diff, seqnr
+            FROM subscription_diffs
+            WHERE id = %s AND (seqnr, subid_seqnr) > (%s, %s)
+        """
+        filters: tuple[Any, ...] = ()
+        if subid:
+            query += " AND subid = %s"
+            filters = (subid,)
+        query += " ORDER BY seqnr, subid_seqnr LIMIT %s"
+
+        # (seqnr, subid_seqnr) of the last row read; seqnr is at least 1
+        after: tuple[int, str] = (0, "")
+        while True:
+            try:
+                with get_connection() as conn:
+                    with conn.cursor() as cur:
+                        cur.execute(query, (actor_id, *after, *filters, page_size))
+                        rows = cur.fetchall()
+            except Exception as e:
+                logger.error(
+                    f"Error fetching subscription diffs for actor {actor_id}: {e}"
+                )
+                return
+            for row in rows:
+                yield {
+                    "id": row[0],
+                    "subscriptionid": row[2],
+                    "timestamp": row[3],
+                    "diff": row[4],
+                    "sequence": row[5],
+                }
+            if len(rows) < page_size:
+                return
+            after = (rows[-1][5], rows[-1][1])
+
     def delete(self, seqnr: int | None = None) -> bool:
         """
         Delete fetched subscription diffs.
@@ -380,3 +445,217 @@ class DbSubscriptionDiffList:
                 f"Error deleting subscription diffs for actor {self.actor_id}: {e}"
             )
             return False
+
+
+def _diff_from_row(row: Any) -> dict[str, Any]:
+    """Diff dict as returned by ``get()``, from a ``subscription_diffs`` row."""
+    return {
+        "id": row[0],
+        "subscriptionid": row[2],
+        "timestamp": row[3],
+        "data": row[4],
+        "sequence": row[5],
+    }
+
+
+class AsyncDbSubscriptionDiff:
+    """Async DbSubscriptionDiff for the async handlers, on the async pool."""
+
+    handle: dict[str, Any] | None
+
+    def __init__(self) -> None:
+        self.handle = None
+
+    async def get(
+        self,
+        actor_id: str | None = None,
+        subid: str | None = None,
+        seqnr: int | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Retrieve a subscription diff; the lowest sequence number if seqnr is
+        not given.
+        """
+        if not actor_id or not subid:
+            logger.debug("Attempt to get subscriptiondiff without actorid or subid")
+            return None
+
+        if seqnr is not None:
+            query = """
+                SELECT id, subid_seqnr, subid, timestamp, diff, seqnr
+                FROM subscription_diffs
+                WHERE id = %s AND subid_seqnr = %s
+            """
+            params: tuple[Any, ...] = (actor_id, subid + ":" + str(seqnr))
+        else:
+            query = """
+                SELECT id, subid_seqnr, subid, timestamp, diff, seqnr
+                FROM subscription_diffs
+                WHERE id = %s AND subid = %s
+                ORDER BY seqnr ASC
+                LIMIT 1
+            """
+            params = (actor_id, subid)
+
+        try:
+            async with get_async_connection("subscription_diff") as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, params)
+                    row = await cur.fetchone()
+        except Exception as e:
+            logger.error(
+                f"Error retrieving subscription diff {actor_id}/{subid}/{seqnr}: {e}"
+            )
+            return None
+        if not row:
+            return None
+        self.handle = {
+            "id": row[0],
+            "subid": row[2],
+            "timestamp": row[3],
+            "diff": row[4],
+            "seqnr": row[5],
+        }
+        return _diff_from_row(row)
+
+    async def create(
+        self,
+        actor_id: str | None = None,
+        subid: str | None = None,
+        diff: str = "",
+        seqnr: int = 1,
+    ) -> bool:
+        """Create a new subscription diff."""
+        if not actor_id or not subid:
+            logger.debug("Attempt to create subscriptiondiff without actorid or subid")
+            return False
+
+        timestamp = datetime.utcnow()
+        try:
+            async with get_async_connection("subscription_diff") as conn:
+                await conn.execute(
+                    """
+                    INSERT INTO subscription_diffs (
+                        id, subid_seqnr, subid, timestamp, diff, seqnr
+                    ) VALUES (
+                        %s, %s, %s, %s, %s, %s
+                    )
+                    """,
+                    (actor_id, subid + ":" + str(seqnr), subid, timestamp, diff, seqnr),
+                )
+                await conn.commit()
+        except Exception as e:
+            logger.error(
+                f"Error creating subscription diff {actor_id}/{subid}/{seqnr}: {e}"
+            )
+            return False
+        self.handle = {
+            "id": actor_id,
+            "subid": subid,
+            "timestamp": timestamp,
+            "diff": diff,
+            "seqnr": seqnr,
+        }
+        return True
+
+    async def delete(self) -> bool:
+        """Delete subscription diff using self.handle."""
+        if not self.handle:
+            return False
+        actor_id = self.handle.get("id")
+        subid = self.handle.get("subid")
+        seqnr = self.handle.get("seqnr")
+        if not actor_id or not subid or seqnr is None:
+            logger.error("AsyncDbSubscriptionDiff handle missing required fields")
+            return False
+
+        subid_seqnr = subid + ":" + str(seqnr)
+        try:
+            async with get_async_connection("subscription_diff") as conn:
+                await conn.execute(
+                    "DELETE FROM subscription_diffs WHERE id = %s AND subid_seqnr = %s",
+                    (actor_id, subid_seqnr),
+                )
+                await conn.commit()
+        except Exception as e:
+            logger.error(
+                f"Error deleting subscription diff {actor_id}/{subid_seqnr}: {e}"
+            )
+            return False
+        self.handle = None
+        return True
+
+
+class AsyncDbSubscriptionDiffList:
+    """Async DbSubscriptionDiffList for the async handlers, on the async pool."""
+
+    def __init__(self) -> None:
+        self.diffs: list[dict[str, Any]] = []
+        self.actor_id: str | None = None
+        self.subid: str | None = None
+
+    async def fetch(
+        self, actor_id: str | None = None, subid: str | None = None
+    ) -> list[dict[str, Any]] | list[Any]:
+        """Retrieve an actor's diffs, optionally for one subscription, by seqnr."""
+        if not actor_id:
+            return []
+        self.actor_id = actor_id
+        self.subid = subid
+
+        query = """
+            SELECT id, subid_seqnr, subid, timestamp, diff, seqnr
+            FROM subscription_diffs
+            WHERE id = %s
+        """
+        params: tuple[Any, ...] = (actor_id,)
+        if subid:
+            query += " AND subid = %s"
+            params += (subid,)
+        query += " ORDER BY seqnr"
+
+        try:
+            async with get_async_connection("subscription_diff") as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, params)
+                    rows = await cur.fetchall()
+        except Exception as e:
+            logger.error(f"Error fetching subscription diffs for actor {actor_id}: {e}")
+            return []
+        # Same keys as DbSubscriptionDiffList.fetch(): "diff", not "data"
+        self.diffs = [
+            {
+                "id": row[0],
+                "subscriptionid": row[2],
+                "timestamp": row[3],
+                "diff": row[4],
+                "sequence": row[5],
+            }
+            for row in rows
+        ]
+        return self.diffs
+
+    async def delete(self, seqnr: int | None = None) -> bool:
+        """Delete the fetched diffs, up to and including seqnr if given."""
+        if not self.actor_id:
+            return False
+
+        query = "DELETE FROM subscription_diffs WHERE id = %s"
+        params: tuple[Any, ...] = (self.actor_id,)
+        if self.subid:
+            query += " AND subid = %s"
+            params += (self.subid,)
+        if seqnr and isinstance(seqnr, int):
+            query += " AND seqnr <= %s"
+            params += (seqnr,)
+
+        try:
+            async with get_async_connection("subscription_diff") as conn:
+                await conn.execute(query, params)
+                await conn.commit()
+        except Exception as e:
+            logger.error(
+                f"Error deleting subscription diffs for actor {self.actor_id}: {e}"
+            )
+            return False
+        return True
@@ -1,10 +1,11 @@
 """PostgreSQL implementation of trust database operations."""
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any
 
-from actingweb.db.postgresql.connection import get_connection
+from actingweb.db.postgresql.connection import get_async_connection, get_connection
 from actingweb.db.utils import ensure_timezone_aware_iso
 from actingweb.trust import canonical_connection_method
 
@@ -39,6 +40,74 @@ def _parse_timestamp(value: str | datetime | None) -> datetime:
         raise ValueError(f"Timestamp must be string or datetime, got {type(value)}")
 
 
+_TRUST_COLUMNS = """
+    id, peerid, baseuri, type, relationship, secret, "desc",
+    approved, peer_approved, verified, verification_token,
+    peer_identifier, established_via, created_at, last_accessed,
+    last_connected_via, client_name, client_version, client_platform,
+    oauth_client_id, aw_supported, aw_version, capabilities_fetched_at
+"""
+
+
+def _trust_from_row(row: Any) -> dict[str, Any]:
+    """Build the trust dict returned by ``get()``/``fetch()`` from a
+    ``_TRUST_COLUMNS`` row, leaving out unset optional attributes."""
+    result: dict[str, Any] = {
+        "id": row[0],
+        "peerid": row[1],
+        "baseuri": row[2],
+        "type": row[3],
+        "relationship": row[4],
+        "secret": row[5],
+        "desc": row[6],
+        "approved": row[7],
+        "peer_approved": row[8],
+        "verified": row[9],
+        "verification_token": row[10],
+    }
+
+    # Add unified trust attributes if they exist
+    if row[11]:  # peer_identifier
+        result["peer_identifier"] = row[11]
+    if row[12]:  # established_via
+        result["established_via"] = row[12]
+
+    created_at_iso = None
+    if row[13]:  # created_at
+        created_at_iso = ensure_timezone_aware_iso(row[13])
+        result["created_at"] = created_at_iso
+
+    if row[14]:  # last_accessed
+        last_accessed_iso = ensure_timezone_aware_iso(row[14])
+        result["last_accessed"] = last_accessed_iso
+        result["last_connected_at"] = last_accessed_iso
+    elif created_at_iso:
+        result["last_connected_at"] = created_at_iso
+
+    if row[15]:  # last_connected_via
+        result["last_connected_via"] = canonical_connection_method(row[15])
+
+    # Add client metadata for OAuth2 clients if they exist
+    if row[16]:  # client_name
+        result["client_name"] = row[16]
+    if row[17]:  # client_version
+        result["client_version"] = row[17]
+    if row[18]:  # client_platform
+        result["client_platform"] = row[18]
+    if row[19]:  # oauth_client_id
+        result["oauth_client_id"] = row[19]
+
+    # Add peer capability tracking fields
+    if row[20]:  # aw_supported
+        result["aw_supported"] = row[20]
+    if row[21]:  # aw_version
+        result["aw_version"] = row[21]
+    if row[22]:  # capabilities_fetched_at
+        result["capabilities_fetched_at"] = ensure_timezone_aware_iso(row[22])
+
+    return result
+
+
 class DbTrust:
     """
     DbTrust does all the db operations for trust objects.
@@ -115,63 +184,7 @@ class DbTrust:
                     if not row:
                         return None
 
-                    # Build result dict
-                    result: dict[str, Any] = {
-                        "id": row[0],
-                        "peerid": row[1],
-                        "baseuri": row[2],
-                        "type": row[3],
-                        "relationship": row[4],
-                        "secret": row[5],
-                        "desc": row[6],
-                        "approved": row[7],
-                        "peer_approved": row[8],
-                        "verified": row[9],
-                        "verification_token": row[10],
-                    }
-
-                    # Add unified trust attributes if they exist
-                    if row[11]:  # peer_identifier
-                        result["peer_identifier"] = row[11]
-                    if row[12]:  # established_via
-                        result["established_via"] = row[12]
-
-                    created_at_iso = None
-                    if row[13]:  # created_at
-                        created_at_iso = ensure_timezone_aware_iso(row[13])
-                        result["created_at"] = created_at_iso
-
-                    if row[14]:  # last_accessed
-                        last_accessed_iso = ensure_timezone_aware_iso(row[14])
-                        result["last_accessed"] = last_accessed_iso
-                        result["last_connected_at"] = last_accessed_iso
-                    elif created_at_iso:
-                        result["last_connected_at"] = created_at_iso
-
-                    if row[15]:  # last_connected_via
-                        result["last_connected_via"] = canonical_connection_method(
-                            row[15]
-                        )
-
-                    # Add client metadata for OAuth2 clients if they exist
-                    if row[16]:  # client_name
-                        result["client_name"] = row[16]
-                    if row[17]:  # client_version
-                        result["client_version"] = row[17]
-                    if row[18]:  # client_platform
-                        result["client_platform"] = row[18]
-                    if row[19]:  # oauth_client_id
-                        result["oauth_client_id"] = row[19]
-
-                    # Add peer capability tracking fields
-                    if row[20]:  # aw_supported
-                        result["aw_supported"] = row[20]
-                    if row[21]:  # aw_version
-                        result["aw_version"] = row[21]
-                    if row[22]:  # capabilities_fetched_at
-                        result["capabilities_fetched_at"] = ensure_timezone_aware_iso(
-                            row[22]
-                        )
+                    result = _trust_from_row(row)
 
                     # Store handle for future operations
                     self.handle = result
@@ -709,64 +722,7 @@ class DbTrustList:
                     rows = cur.fetchall()
 
                     for row in rows:
-                        result: dict[str, Any] = {
-                            "id": row[0],
-                            "peerid": row[1],
-                            "baseuri": row[2],
-                            "type": row[3],
-                            "relationship": row[4],
-                            "secret": row[5],
-                            "desc": row[6],
-                            "approved": row[7],
-                            "peer_approved": row[8],
-                            "verified": row[9],
-                            "verification_token": row[10],
-                        }
-
-                        # Add unified trust attributes if they exist
-                        if row[11]:  # peer_identifier
-                            result["peer_identifier"] = row[11]
-                        if row[12]:  # established_via
-                            result["established_via"] = row[12]
-
-                        created_at_iso = None
-                        if row[13]:  # created_at
-                            created_at_iso = ensure_timezone_aware_iso(row[13])
-                            result["created_at"] = created_at_iso
-
-                        if row[14]:  # last_accessed
-                            last_accessed_iso = ensure_timezone_aware_iso(row[14])
-                            result["last_accessed"] = last_accessed_iso
-                            result["last_connected_at"] = last_accessed_iso
-                        elif created_at_iso:
-                            result["last_connected_at"] = created_at_iso
-
-                        if row[15]:  # last_connected_via
-                            result["last_connected_via"] = canonical_connection_method(
-                                row[15]
-                            )
-
-                        # Add client metadata for OAuth2 clients if they exist
-                        if row[16]:  # client_name
-                            result["client_name"] = row[16]
-                        if row[17]:  # client_version
-                            result["client_version"] = row[17]
-                        if row[18]:  # client_platform
-                            result["client_platform"] = row[18]
-                        if row[19]:  # oauth_client_id
-                            result["oauth_client_id"] = row[19]
-
-                        # Add peer capability tracking fields
-                        if row[20]:  # aw_supported
-                            result["aw_supported"] = row[20]
-                        if row[21]:  # aw_version
-                            result["aw_version"] = row[21]
-                        if row[22]:  # capabilities_fetched_at
-                            result["capabilities_fetched_at"] = (
-                                ensure_timezone_aware_iso(row[22])
-                            )
-
-                        self.trusts.append(result)
+                        self.trusts.append(_trust_from_row(row))
 
                     return self.trusts
 
@@ -802,3 +758,143 @@ class DbTrustList:
         except Exception as e:
             logger.error(f"Error deleting trusts for actor {self.actor_id}: {e}")
             return False
+
+
+class AsyncDbTrust:
+    """
+    Async DbTrust for the async handlers, on the async connection pool.
+
+    Reads and delete are native; create() and modify() run
+    :class:`DbTrust` in a worker thread; their timestamp parsing and
+    column mapping are not duplicated here.
+    """
+
+    handle: dict[str, Any] | None
+
+    def __init__(self) -> None:
+        self.handle = None
+
+    async def get(
+        self,
+        actor_id: str | None = None,
+        peerid: str | None = None,
+        token: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Retrieve trust by peerid or, failing that, token. See :meth:`DbTrust.get`."""
+        if not actor_id:
+            return None
+        if peerid:
+            query = f"SELECT {_TRUST_COLUMNS} FROM trusts WHERE id = %s AND peerid = %s"
+            params = (actor_id, peerid)
+        elif token:
+            query = (
+                f"SELECT {_TRUST_COLUMNS} FROM trusts "
+                "WHERE id = %s AND secret = %s LIMIT 1"
+            )
+            params = (actor_id, token)
+        else:
+            return None
+
+        try:
+            async with get_async_connection("trust") as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, params)
+                    row = await cur.fetchone()
+        except Exception as e:
+            logger.error(f"Error retrieving trust {actor_id}/{peerid or token}: {e}")
+            return None
+        if not row:
+            return None
+        self.handle = _trust_from_row(row)
+        return self.handle
+
+    async def create(
+        self, actor_id: str | None = None, peerid: str | None = None, **kwargs: Any
+    ) -> bool:
+        """Create a new trust; takes the arguments of :meth:`DbTrust.create`."""
+        db = DbTrust()
+        ok = await asyncio.to_thread(
+            db.create, actor_id=actor_id, peerid=peerid, **kwargs
+        )
+        self.handle = db.handle
+        return ok
+
+    async def modify(self, **kwargs: Any) -> bool:
+        """Modify the trust in self.handle; see :meth:`DbTrust.modify`."""
+        db = DbTrust()
+        db.handle = self.handle
+        ok = await asyncio.to_thread(db.modify, **kwargs)
+        self.handle = db.handle
+        return ok
+
+    async def delete(self) -> bool:
+        """Delete trust using self.handle."""
+        if not self.handle:
+            return False
+        actor_id = self.handle.get("id")
+        peerid = self.handle.get("peerid")
+        if not actor_id or not peerid:
+            logger.error("AsyncDbTrust handle missing id or peerid field")
+            return False
+
+        try:
+            async with get_async_connection("trust") as conn:
+                await conn.execute(
+                    "DELETE FROM trusts WHERE id = %s AND peerid = %s",
+                    (actor_id, peerid),
+                )
+                await conn.commit()
+        except Exception as e:
+            logger.error(f"Error deleting trust {actor_id}/{peerid}: {e}")
+            return False
+        self.handle = None
+        return True
+
+    async def is_token_in_db(
+        self, actor_id: str | None = None, token: str | None = None
+    ) -> bool:
+        """Check if token exists in database for actor."""
+        if not actor_id or not token:
+            return False
+
+        try:
+            async with get_async_connection("trust") as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        "SELECT id FROM trusts WHERE id = %s AND secret = %s LIMIT 1",
+                        (actor_id, token),
+                    )
+                    return await cur.fetchone() is not None
+        except Exception as e:
+            logger.error(f"Error checking token {actor_id}/{token}: {e}")
+            return False
+
+
+class AsyncDbTrustList:
+    """Async DbTrustList: fetches all trusts of an actor without a thread."""
+
+    def __init__(self) -> None:
+        self.actor_id: str | None = None
+        self.trusts: list[dict[str, Any]] = []
+
+    async def fetch(
+        self, actor_id: str | None = None
+    ) -> list[dict[str, Any]] | list[Any]:
+        """Retrieve all trusts for an actor, ordered by peerid."""
+        if not actor_id:
+            return []
+        self.actor_id = actor_id
+
+        try:
+            async with get_async_connection("trust") as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        f"SELECT {_TRUST_COLUMNS} FROM trusts WHERE id = %s ORDER BY peerid",
+                        (actor_id,),
+                    )
+                    rows = await cur.fetchall()
+        except Exception as e:
+            logger.error(f"Error fetching trusts for actor {actor_id}: {e}")
+            return []
+        self.trusts = [_trust_from_row(row) for row in rows]
+        return self.trusts
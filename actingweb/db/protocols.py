@@ -8,6 +8,7 @@ All database backends (DynamoDB, PostgreSQL, etc.) must implement these protocol
 to ensure consistent interfaces across the ActingWeb codebase.
 """
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Protocol, runtime_checkable
 
@@ -924,6 +925,28 @@ class DbSubscriptionDiffListProtocol(Protocol):
         """
         ...
 
+    def iter_fetch(
+        self,
+        actor_id: str | None = None,
+        subid: str | None = None,
+        page_size: int = 100,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield subscription diffs for an actor, as fetch() returns them.
+
+        Reads page_size diffs at a time from the database as they are
+        consumed, for responses that stream the diffs.
+
+        Args:
+            actor_id: The actor ID
+            subid: Optional subscription ID to filter
+            page_size: Diffs read per database request
+
+        Yields:
+            Diff dicts
+        """
+        ...
+
     def delete(self, seqnr: int | None = None) -> bool:
         """
         Delete subscription diffs.
@@ -1067,6 +1090,38 @@ class DbAttributeProtocol(Protocol):
         """
         ...
 
+    @staticmethod
+    def insert_attr_if_absent(
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+        data: Any = None,
+        timestamp: datetime | None = None,
+        ttl_seconds: int | None = None,
+    ) -> bool:
+        """
+        Atomically create an attribute, only if it does not exist yet.
+
+        A row whose TTL has passed counts as absent (it reads as absent in
+        ``get_attr`` too) and is replaced. Concurrent callers inserting the
+        same attribute see exactly one True. This is the single-write
+        primitive behind first-sighting checks such as id_token replay
+        protection.
+
+        Args:
+            actor_id: The actor ID
+            bucket: Bucket name
+            name: Attribute name
+            data: Data to store (JSON-serializable, non-empty)
+            timestamp: Optional timestamp
+            ttl_seconds: Optional TTL in seconds
+
+        Returns:
+            True if this call created the attribute, False if a live one
+            already existed (or on error)
+        """
+        ...
+
     @staticmethod
     def conditional_update_attr(
         actor_id: str | None = None,
@@ -1259,3 +1314,408 @@ class SubscriptionSuspensionProtocol(Protocol):
             List of (target, subtarget) tuples
         """
         ...
+
+
+# =============================================================================
+# Async Protocols
+# =============================================================================
+#
+# Awaitable mirrors of the protocols above for the accessors async handlers
+# use (``get_property_async()`` etc. in ``actingweb.db``). Each method takes
+# the same arguments and returns the same shapes as its sync counterpart. A
+# backend without native async classes is served by running the sync
+# implementation in a worker thread.
+
+
+@runtime_checkable
+class AsyncDbPropertyProtocol(Protocol):
+    """Async protocol for property operations."""
+
+    handle: Any | None
+
+    async def get(
+        self, actor_id: str | None = None, name: str | None = None
+    ) -> str | None:
+        """
+        Get property value. See :meth:`DbPropertyProtocol.get`.
+
+        Raises:
+            DbError: On a backend fault. Only row absence returns None.
+        """
+        ...
+
+    async def set(
+        self, actor_id: str | None = None, name: str | None = None, value: Any = None
+    ) -> bool:
+        """
+        Set property value (empty value deletes). See
+        :meth:`DbPropertyProtocol.set`.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+    async def delete(self) -> bool:
+        """
+        Delete property using self.handle.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncDbPropertyListProtocol(Protocol):
+    """Async protocol for property list operations."""
+
+    async def fetch(self, actor_id: str | None = None) -> dict[str, str] | None:
+        """
+        Retrieve the plain (non-list) properties for an actor.
+
+        Returns:
+            Dict of {property_name: property_value}, or None
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncDbTrustProtocol(Protocol):
+    """Async protocol for trust relationship operations."""
+
+    handle: Any | None
+
+    async def get(
+        self,
+        actor_id: str | None = None,
+        peerid: str | None = None,
+        token: str | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Retrieve trust from database. See :meth:`DbTrustProtocol.get`.
+
+        Returns:
+            Trust dict with all fields, or None if not found
+        """
+        ...
+
+    async def create(
+        self, actor_id: str | None = None, peerid: str | None = None, **kwargs: Any
+    ) -> bool:
+        """
+        Create new trust. Takes the keyword arguments of
+        :meth:`DbTrustProtocol.create`.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+    async def modify(self, **kwargs: Any) -> bool:
+        """
+        Modify trust using self.handle. Takes the keyword arguments of
+        :meth:`DbTrustProtocol.modify`.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+    async def delete(self) -> bool:
+        """
+        Delete trust using self.handle.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+    async def is_token_in_db(
+        self, actor_id: str | None = None, token: str | None = None
+    ) -> bool:
+        """
+        Check if token exists in database.
+
+        Returns:
+            True if token found, False otherwise
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncDbTrustListProtocol(Protocol):
+    """Async protocol for trust list operations."""
+
+    async def fetch(self, actor_id: str | None) -> list[dict[str, Any]] | list[Any]:
+        """
+        Retrieve all trusts for an actor.
+
+        Returns:
+            List of trust dicts, or empty list
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncDbSubscriptionProtocol(Protocol):
+    """Async protocol for subscription operations."""
+
+    handle: Any | None
+
+    async def get(
+        self,
+        actor_id: str | None = None,
+        peerid: str | None = None,
+        subid: str | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Retrieve subscription from database. See
+        :meth:`DbSubscriptionProtocol.get`.
+
+        Returns:
+            Subscription dict, or None if not found
+        """
+        ...
+
+    async def modify(
+        self,
+        peerid: str | None = None,
+        subid: str | None = None,
+        granularity: str | None = None,
+        target: str | None = None,
+        subtarget: str | None = None,
+        resource: str | None = None,
+        seqnr: int | None = None,
+        callback: bool | None = None,
+    ) -> bool:
+        """
+        Modify subscription using self.handle.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+    async def create(
+        self,
+        actor_id: str | None = None,
+        peerid: str | None = None,
+        subid: str | None = None,
+        granularity: str | None = None,
+        target: str | None = None,
+        subtarget: str | None = None,
+        resource: str | None = None,
+        seqnr: int = 1,
+        callback: bool = False,
+    ) -> bool:
+        """
+        Create new subscription.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+    async def delete(self) -> bool:
+        """
+        Delete subscription using self.handle.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncDbSubscriptionListProtocol(Protocol):
+    """Async protocol for subscription list operations."""
+
+    async def fetch(self, actor_id: str | None) -> list[dict[str, Any]] | list[Any]:
+        """
+        Retrieve all subscriptions for an actor.
+
+        Returns:
+            List of subscription dicts, or empty list
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncDbSubscriptionDiffProtocol(Protocol):
+    """Async protocol for subscription diff operations."""
+
+    handle: Any | None
+
+    async def get(
+        self,
+        actor_id: str | None = None,
+        subid: str | None = None,
+        seqnr: int | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Retrieve subscription diff from database. See
+        :meth:`DbSubscriptionDiffProtocol.get`.
+
+        Returns:
+            SubscriptionDiff dict, or None if not found
+        """
+        ...
+
+    async def create(
+        self,
+        actor_id: str | None = None,
+        subid: str | None = None,
+        diff: str = "",
+        seqnr: int = 1,
+    ) -> bool:
+        """
+        Create new subscription diff.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+    async def delete(self) -> bool:
+        """
+        Delete subscription diff using self.handle.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncDbSubscriptionDiffListProtocol(Protocol):
+    """Async protocol for subscription diff list operations."""
+
+    async def fetch(
+        self, actor_id: str | None = None, subid: str | None = None
+    ) -> list[dict[str, Any]] | list[Any]:
+        """
+        Retrieve subscription diffs for an actor, sorted by sequence.
+
+        Returns:
+            List of diff dicts, or empty list
+        """
+        ...
+
+    async def delete(self, seqnr: int | None = None) -> bool:
+        """
+        Delete fetched subscription diffs, up to and including seqnr if set.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncDbAttributeProtocol(Protocol):
+    """Async protocol for attribute operations (internal storage)."""
+
+    async def get_bucket(
+        self, actor_id: str | None = None, bucket: str | None = None
+    ) -> dict[str, dict[str, Any]] | None:
+        """
+        Get all attributes from a bucket.
+
+        Returns:
+            Dict of {attr_name: {"data": ..., "timestamp": ...}}, or None
+        """
+        ...
+
+    async def get_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Get single attribute from bucket.
+
+        Returns:
+            Dict with "data" and "timestamp", or None
+        """
+        ...
+
+    async def set_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+        data: Any = None,
+        timestamp: datetime | None = None,
+        ttl_seconds: int | None = None,
+    ) -> bool:
+        """
+        Set attribute in bucket (empty data deletes).
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+    async def delete_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+    ) -> bool:
+        """
+        Delete an attribute.
+
+        Returns:
+            True on success, False on failure
+        """
+        ...
+
+    async def delete_attr_conditional(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+    ) -> bool:
+        """
+        Delete an attribute, returning True only if this call removed it.
+
+        Returns:
+            True if this call removed an existing row, False otherwise
+        """
+        ...
+
+    async def insert_attr_if_absent(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+        data: Any = None,
+        timestamp: datetime | None = None,
+        ttl_seconds: int | None = None,
+    ) -> bool:
+        """
+        Create an attribute only if no live one exists.
+
+        Returns:
+            True if this call created the attribute, False otherwise
+        """
+        ...
+
+    async def conditional_update_attr(
+        self,
+        actor_id: str | None = None,
+        bucket: str | None = None,
+        name: str | None = None,
+        old_data: Any = None,
+        new_data: Any = None,
+        timestamp: datetime | None = None,
+    ) -> bool:
+        """
+        Update an attribute only if its current data equals old_data.
+
+        Returns:
+            True if the update was applied, False otherwise
+        """
+        ...
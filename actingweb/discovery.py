@@ -0,0 +1,412 @@
+"""
+Pre-encoded discovery documents.
+
+Peers read ``/<actor_id>/meta`` and MCP clients read the OAuth2 discovery
+documents (``/.well-known/oauth-authorization-server``,
+``/.well-known/oauth-protected-resource[/mcp]``), ``GET /mcp`` and
+``/mcp/info`` on every handshake. Those documents depend only on the
+Config -- plus, for /meta, the actor id, its ``trustee_root`` and the
+registered trust types -- but were rebuilt and re-serialised per request.
+
+:func:`get_document` and :func:`get_actor_meta` return an
+:class:`EncodedDocument`: the JSON body encoded once, a strong ``ETag`` (a
+hash of the body) and a ``Cache-Control`` value. A request whose
+``If-None-Match`` matches is answered with ``304 Not Modified`` and no body.
+``ActingWebApp.integrate_*`` builds the config-only documents up front
+(:func:`prebuild`).
+
+**When a document is rebuilt.** A Config's documents are keyed by a
+fingerprint of the config attributes they are built from, so
+``Config.update_supported_options()`` (which rewrites ``aw_supported``) or a
+changed ``fqdn`` rebuilds them on next use. Documents that list trust types
+also carry the trust type registry's ``version``. The per-actor /meta
+document is rebuilt when the actor's ``trustee_root`` changes.
+"""
+
+import hashlib
+import logging
+import operator
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from . import json_codec
+from .cache import TTLCache
+
+if TYPE_CHECKING:
+    from .aw_web_request import AWResponse
+    from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# /meta: matches what peers cache it for (peer_capabilities.PEER_META_TTL and
+# PEER_META_STALE_TTL), so a peer revalidates with If-None-Match afterwards.
+META_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=86400"
+# OAuth2 and MCP discovery: only change with the deployment
+DISCOVERY_CACHE_CONTROL = "public, max-age=3600"
+
+# Config attributes the documents are built from
+_fingerprint = operator.attrgetter(
+    "proto",
+    "fqdn",
+    "aw_type",
+    "version",
+    "desc",
+    "info",
+    "specification",
+    "aw_version",
+    "aw_supported",
+    "aw_formats",
+)
+
+
+@dataclass(frozen=True)
+class EncodedDocument:
+    """A JSON document encoded once, with its validator and cache lifetime."""
+
+    body: bytes
+    etag: str
+    cache_control: str
+    content_type: str = "application/json"
+
+    @classmethod
+    def from_json(cls, data: Any, cache_control: str) -> "EncodedDocument":
+        body = json_codec.dumps(data).encode("utf-8")
+        return cls(body, f'"{hashlib.sha256(body).hexdigest()[:32]}"', cache_control)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """``ETag`` and ``Cache-Control``, for both 200 and 304 responses."""
+        return {"ETag": self.etag, "Cache-Control": self.cache_control}
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """True if ``If-None-Match`` names this document (weak comparison)."""
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*" or tag.removeprefix("W/") == self.etag:
+                return True
+        return False
+
+    def write(self, response: "AWResponse", if_none_match: str | None) -> None:
+        """Set ``response`` to this document, or to 304 if the client has it."""
+        response.headers.update(self.headers)
+        if self.matches(if_none_match):
+            response.set_status(304, "Not Modified")
+            return
+        response.headers["Content-Type"] = self.content_type
+        response.body = self.body
+        response.set_status(200, "Ok")
+
+
+# -- document builders -------------------------------------------------------
+
+
+def authorization_server_metadata(config: "Config") -> dict[str, Any]:
+    """OAuth2 Authorization Server Discovery (RFC 8414) for the MCP server."""
+    base_url = f"{config.proto}{config.fqdn}"
+    return {
+        "issuer": base_url,
+        "authorization_endpoint": f"{base_url}/oauth/authorize",
+        "token_endpoint": f"{base_url}/oauth/token",
+        "registration_endpoint": f"{base_url}/oauth/register",
+        "scopes_supported": ["mcp"],
+        "response_types_supported": ["code"],
+        "grant_types_supported": [
+            "authorization_code",
+            "refresh_token",
+            "client_credentials",
+        ],
+        "token_endpoint_auth_methods_supported": [
+            "client_secret_post",
+            "client_secret_basic",
+            "none",
+        ],
+        "code_challenge_methods_supported": ["S256"],
+        "service_documentation": f"{base_url}/mcp/info",
+        "mcp_resource": f"{base_url}/mcp",
+    }
+
+
+def protected_resource_metadata(config: "Config") -> dict[str, Any]:
+    """OAuth2 Protected Resource metadata for ``/mcp``."""
+    base_url = f"{config.proto}{config.fqdn}"
+    return {
+        "resource": f"{base_url}/mcp",
+        "authorization_servers": [base_url],
+        "scopes_supported": ["mcp"],
+        "bearer_methods_supported": ["header"],
+        "resource_documentation": f"{base_url}/mcp/info",
+        "resource_policy_uri": f"{base_url}",
+    }
+
+
+def mcp_protected_resource_metadata(config: "Config") -> dict[str, Any]:
+    """Protected Resource metadata with the MCP-specific additions."""
+    from .mcp.protocol import LATEST_PROTOCOL_VERSION, SUPPORTED_PROTOCOL_VERSIONS
+
+    metadata = protected_resource_metadata(config)
+    metadata.update(
+        {
+            "mcp_version": LATEST_PROTOCOL_VERSION,
+            "supported_protocol_versions": SUPPORTED_PROTOCOL_VERSIONS,
+            "capabilities": {
+                "tools": True,
+                "prompts": True,
+                "resources": False,
+                "roots": False,
+            },
+        }
+    )
+    return metadata
+
+
+def mcp_server_info(config: "Config") -> dict[str, Any]:
+    """``GET /mcp``: what an MCP client needs before it authenticates."""
+    from .mcp.protocol import LATEST_PROTOCOL_VERSION, SUPPORTED_PROTOCOL_VERSIONS
+
+    return {
+        "version": LATEST_PROTOCOL_VERSION,
+        "server_name": "actingweb-mcp",
+        "capabilities": {
+            "tools": True,  # We support tools
+            "resources": True,  # We support resources
+            "prompts": True,  # We support prompts
+        },
+        "transport": {
+            "type": "http",
+            "endpoint": "/mcp",
+            "supported_versions": list(SUPPORTED_PROTOCOL_VERSIONS),
+        },
+        "authentication": {
+            "required": True,
+            "type": "oauth2",
+            "discovery_url": f"{config.proto}{config.fqdn}/.well-known/oauth-protected-resource",
+        },
+    }
+
+
+def mcp_info(config: "Config") -> dict[str, Any]:
+    """``GET /mcp/info``."""
+    base_url = f"{config.proto}{config.fqdn}"
+    return {
+        "mcp_enabled": True,
+        "mcp_endpoint": "/mcp",
+        "authentication": {
+            "type": "oauth2",
+            "provider": "actingweb",
+            "required_scopes": ["mcp"],
+            "flow": "authorization_code",
+            "auth_url": f"{base_url}/oauth/authorize",
+            "token_url": f"{base_url}/oauth/token",
+            "callback_url": f"{base_url}/oauth/callback",
+            "registration_endpoint": f"{base_url}/oauth/register",
+            "authorization_endpoint": f"{base_url}/oauth/authorize",
+            "token_endpoint": f"{base_url}/oauth/token",
+            "discovery_url": f"{base_url}/.well-known/oauth-authorization-server",
+            "resource_discovery_url": f"{base_url}/.well-known/oauth-protected-resource",
+            "enabled": True,
+        },
+        "supported_features": ["tools", "prompts"],
+        "tools_count": 4,
+        "prompts_count": 3,
+        "actor_lookup": "email_based",
+        "description": "ActingWeb MCP Demo - AI can interact with actors through MCP protocol using OAuth2",
+    }
+
+
+def trust_type_details(config: "Config") -> list[dict[str, Any]]:
+    """``/meta/actingweb/trust_types``: the registered trust types in detail."""
+    try:
+        from .trust_type_registry import get_registry
+
+        trust_types = get_registry(config).list_types()
+        return [
+            {
+                "name": trust_type.name,
+                "display_name": trust_type.display_name,
+                "description": getattr(trust_type, "description", ""),
+                "created_by": trust_type.created_by,
+            }
+            for trust_type in trust_types
+        ]
+    except Exception as e:
+        logger.error(f"Error retrieving trust types: {e}")
+        return []
+
+
+def trust_type_summary(config: "Config") -> dict[str, Any]:
+    """``/meta/trusttypes``: trust types by name, and the default one."""
+    try:
+        from .trust_type_registry import get_registry
+
+        trust_types = get_registry(config).list_types()
+        trust_types_dict: dict[str, dict[str, str]] = {}
+        default_type = None
+
+        if trust_types:
+            for trust_type in trust_types:
+                trust_types_dict[trust_type.name] = {
+                    "display_name": trust_type.display_name,
+                    "description": getattr(trust_type, "description", ""),
+                }
+            default_type = trust_types[0].name
+
+        # Fall back to config.trust_types if registry is empty
+        if not trust_types_dict and hasattr(config, "trust_types"):
+            config_types = getattr(config, "trust_types", {})
+            if config_types:
+                for name, type_data in config_types.items():
+                    trust_types_dict[name] = {
+                        "display_name": type_data.get(
+                            "display_name", type_data.get("name", name)
+                        ),
+                        "description": type_data.get("description", ""),
+                    }
+                default_type = getattr(config, "default_trust_type", None)
+
+        return {"trust_types": trust_types_dict, "default_trust_type": default_type}
+    except Exception as e:
+        logger.error(f"Error retrieving trust types: {e}")
+        return {"trust_types": {}, "default_trust_type": None}
+
+
+def actor_meta(config: "Config", actor_id: str, trustee_root: str) -> dict[str, Any]:
+    """``/<actor_id>/meta``."""
+    values: dict[str, Any] = {
+        "id": actor_id,
+        "type": config.aw_type,
+        "version": config.version,
+        "desc": config.desc,
+        "info": config.info,
+        "trustee_root": trustee_root,
+        "specification": config.specification,
+        "aw_version": config.aw_version,
+        "aw_supported": config.aw_supported,
+        "aw_formats": config.aw_formats,
+    }
+    # Add supported trust types if available
+    try:
+        from .trust_type_registry import get_registry
+
+        trust_types = get_registry(config).list_types()
+        if trust_types:
+            values["aw_trust_types"] = [trust_type.name for trust_type in trust_types]
+    except Exception:
+        # If trust type registry is not available, don't include trust types
+        pass
+    return values
+
+
+# name -> (builder, Cache-Control, lists trust types)
+_DOCUMENTS: dict[str, tuple[Callable[["Config"], Any], str, bool]] = {
+    ".well-known/oauth-authorization-server": (
+        authorization_server_metadata,
+        DISCOVERY_CACHE_CONTROL,
+        False,
+    ),
+    ".well-known/oauth-protected-resource": (
+        protected_resource_metadata,
+        DISCOVERY_CACHE_CONTROL,
+        False,
+    ),
+    ".well-known/oauth-protected-resource/mcp": (
+        mcp_protected_resource_metadata,
+        DISCOVERY_CACHE_CONTROL,
+        False,
+    ),
+    "mcp": (mcp_server_info, DISCOVERY_CACHE_CONTROL, False),
+    "mcp/info": (mcp_info, DISCOVERY_CACHE_CONTROL, False),
+    "meta/actingweb/trust_types": (trust_type_details, META_CACHE_CONTROL, True),
+    "meta/trusttypes": (trust_type_summary, META_CACHE_CONTROL, True),
+}
+
+
+# -- cache -------------------------------------------------------------------
+
+
+class _ConfigDocuments:
+    """The documents built from one state of a Config."""
+
+    def __init__(self, config: "Config", fingerprint: tuple[Any, ...]) -> None:
+        self.fingerprint = fingerprint
+        # name -> (trust type registry version, document)
+        self.documents: dict[str, tuple[Hashable, EncodedDocument]] = {}
+        # actor id -> ((trustee_root, registry version), document)
+        self.actor_meta = TTLCache(
+            "meta_documents",
+            max_entries=getattr(config, "store_cache_max_entries", 10_000),
+        )
+
+
+# Config -> its documents. Weak, so a Config dropped by a test or a rebuilt
+# app takes its documents with it.
+_by_config: "weakref.WeakKeyDictionary[Config, _ConfigDocuments]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def _documents_for(config: "Config") -> _ConfigDocuments:
+    fingerprint = _fingerprint(config)
+    docs = _by_config.get(config)
+    if docs is not None and docs.fingerprint == fingerprint:
+        return docs
+    with _lock:
+        docs = _by_config.get(config)
+        if docs is None or docs.fingerprint != fingerprint:
+            if docs is not None:
+                logger.debug("Config changed; rebuilding discovery documents")
+            docs = _ConfigDocuments(config, fingerprint)
+            _by_config[config] = docs
+        return docs
+
+
+def _trust_types_version(config: "Config") -> Hashable:
+    try:
+        from .trust_type_registry import get_registry
+
+        registry = get_registry(config)
+        return (id(registry), registry.current_version())
+    except Exception:
+        return None
+
+
+def get_document(config: "Config", name: str) -> EncodedDocument:
+    """The encoded document ``name`` (a key of ``_DOCUMENTS``) for ``config``."""
+    builder, cache_control, lists_trust_types = _DOCUMENTS[name]
+    docs = _documents_for(config)
+    version = _trust_types_version(config) if lists_trust_types else None
+    cached = docs.documents.get(name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    document = EncodedDocument.from_json(builder(config), cache_control)
+    docs.documents[name] = (version, document)
+    return document
+
+
+def get_actor_meta(
+    config: "Config", actor_id: str, trustee_root: str
+) -> EncodedDocument:
+    """The encoded ``/<actor_id>/meta`` document."""
+    docs = _documents_for(config)
+    key = (trustee_root, _trust_types_version(config))
+    found, cached = docs.actor_meta.lookup(actor_id)
+    if found and cached[0] == key:
+        document: EncodedDocument = cached[1]
+        return document
+    document = EncodedDocument.from_json(
+        actor_meta(config, actor_id, trustee_root), META_CACHE_CONTROL
+    )
+    docs.actor_meta.put(actor_id, (key, document))
+    return document
+
+
+def prebuild(config: "Config") -> None:
+    """Build the documents that depend on the config alone."""
+    for name, (_, _, lists_trust_types) in _DOCUMENTS.items():
+        if not lists_trust_types:
+            get_document(config, name)
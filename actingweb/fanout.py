@@ -5,12 +5,11 @@ Provides scalable callback delivery with:
 - Parallel HTTP requests with bounded concurrency
 - Circuit breaker pattern for failing peers (with persistence for Kubernetes)
 - Automatic granularity downgrade for large payloads
-- Connection pooling via shared HTTP client
+- Connection pooling via the shared peer HTTP client (``peer_transport``)
 """
 
 import asyncio
 import gzip
-import json
 import logging
 import time
 from dataclasses import dataclass, field
@@ -20,46 +19,28 @@ from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from . import json_codec, peer_transport
+
 if TYPE_CHECKING:
     from .interface.actor_interface import ActorInterface
     from .peer_capabilities import PeerCapabilities
 
 logger = logging.getLogger(__name__)
 
-# Shared HTTP client for connection pooling (module-level singleton)
-_shared_client: httpx.AsyncClient | None = None
-_client_lock = asyncio.Lock()
-
 
 async def get_shared_client(timeout: float = 30.0) -> httpx.AsyncClient:
-    """Get or create shared HTTP client for connection pooling.
+    """Get the shared peer HTTP client of the running event loop.
 
-    Using a shared client provides:
-    - Connection pooling and reuse
-    - Reduced TIME_WAIT socket accumulation
-    - Better performance with many subscribers
+    Kept for compatibility; this is ``peer_transport.get_async_client()``,
+    the client all peer calls share. ``timeout`` is unused: pass the
+    timeout per request.
     """
-    global _shared_client
-    async with _client_lock:
-        if _shared_client is None or _shared_client.is_closed:
-            _shared_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(timeout),
-                limits=httpx.Limits(
-                    max_connections=100,
-                    max_keepalive_connections=20,
-                    keepalive_expiry=30.0,
-                ),
-            )
-    return _shared_client
+    return await peer_transport.get_async_client()
 
 
 async def close_shared_client() -> None:
     """Close the shared HTTP client. Call during application shutdown."""
-    global _shared_client
-    async with _client_lock:
-        if _shared_client is not None and not _shared_client.is_closed:
-            await _shared_client.aclose()
-            _shared_client = None
+    await peer_transport.close_async_client()
 
 
 class CircuitState(Enum):
@@ -332,8 +313,7 @@ class FanOutManager:
             return FanOutResult(total=0, successful=0, failed=0, circuit_open=0)
 
         # Prepare payload
-        payload_json = json.dumps(payload)
-        payload_size = len(payload_json.encode("utf-8"))
+        payload_size = len(json_codec.encode_bytes(payload))
         needs_downgrade = payload_size > self._max_payload_size
 
         # Create semaphore for bounded concurrency
@@ -449,8 +429,7 @@ class FanOutManager:
             else:
                 callback_wrapper["data"] = payload
 
-            body = json.dumps(callback_wrapper)
-            body_bytes = body.encode("utf-8")
+            body_bytes = json_codec.encode_bytes(callback_wrapper)
 
             # Compress if enabled and beneficial
             if self._enable_compression and len(body_bytes) > 1024:
@@ -466,9 +445,12 @@ class FanOutManager:
                 headers["Authorization"] = f"Bearer {trust.get('secret', '')}"
 
             # Make HTTP request using shared client for connection pooling
-            client = await get_shared_client(self._request_timeout)
+            client = await peer_transport.get_async_client()
             response = await client.post(
-                callback_url, content=body_bytes, headers=headers
+                callback_url,
+                content=body_bytes,
+                headers=headers,
+                timeout=self._request_timeout,
             )
             status = response.status_code
 
@@ -600,6 +582,14 @@ class FanOutManager:
 
         Runs the async version in an event loop.
         """
-        return asyncio.run(
-            self.deliver_to_subscribers(subscriptions, payload, target, sequence)
-        )
+
+        async def deliver() -> FanOutResult:
+            try:
+                return await self.deliver_to_subscribers(
+                    subscriptions, payload, target, sequence
+                )
+            finally:
+                # The loop's shared client cannot outlive asyncio.run()
+                await peer_transport.close_async_client()
+
+        return asyncio.run(deliver())
@@ -5,11 +5,10 @@ Actions are trigger-based functions that execute external events or operations.
 GET returns action status, PUT/POST executes the action.
 """
 
-import json
 import logging
 from typing import Any
 
-from actingweb import auth
+from actingweb import auth, json_codec
 from actingweb.handlers import base_handler
 
 from ..permission_evaluator import (
@@ -158,7 +157,7 @@ class ActionsHandler(base_handler.BaseHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(result))
+                self.response.write(json_codec.dumps(result))
         else:
             if self.response:
                 self.response.set_status(404, "Not found")
@@ -200,7 +199,7 @@ class ActionsHandler(base_handler.BaseHandler):
                 body_str = body.decode("utf-8", "ignore")
             else:
                 body_str = body
-            params = json.loads(body_str)
+            params = json_codec.loads(body_str)
         except (TypeError, ValueError, KeyError):
             if self.response:
                 self.response.set_status(400, "Error in json body")
@@ -220,7 +219,7 @@ class ActionsHandler(base_handler.BaseHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(result))
+                self.response.write(json_codec.dumps(result))
         else:
             if self.response:
                 self.response.set_status(400, "Processing error")
@@ -262,7 +261,7 @@ class ActionsHandler(base_handler.BaseHandler):
                 body_str = body.decode("utf-8", "ignore")
             else:
                 body_str = body
-            params = json.loads(body_str)
+            params = json_codec.loads(body_str)
         except (TypeError, ValueError, KeyError):
             if self.response:
                 self.response.set_status(400, "Error in json body")
@@ -282,7 +281,7 @@ class ActionsHandler(base_handler.BaseHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(result))
+                self.response.write(json_codec.dumps(result))
         else:
             if self.response:
                 self.response.set_status(400, "Processing error")
@@ -6,10 +6,9 @@ with FastAPI and other async frameworks. It properly awaits async hooks
 without thread pool overhead.
 """
 
-import json
 import logging
 
-from actingweb import auth
+from actingweb import auth, json_codec
 from actingweb.handlers.actions import ActionsHandler
 
 logger = logging.getLogger(__name__)
@@ -78,7 +77,7 @@ class AsyncActionsHandler(ActionsHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(result))
+                self.response.write(json_codec.dumps(result))
         else:
             if self.response:
                 self.response.set_status(404, "Not found")
@@ -120,7 +119,7 @@ class AsyncActionsHandler(ActionsHandler):
                 body_str = body.decode("utf-8", "ignore")
             else:
                 body_str = body
-            params = json.loads(body_str)
+            params = json_codec.loads(body_str)
         except (TypeError, ValueError, KeyError):
             if self.response:
                 self.response.set_status(400, "Error in json body")
@@ -141,7 +140,7 @@ class AsyncActionsHandler(ActionsHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(result))
+                self.response.write(json_codec.dumps(result))
         else:
             if self.response:
                 self.response.set_status(400, "Processing error")
@@ -183,7 +182,7 @@ class AsyncActionsHandler(ActionsHandler):
                 body_str = body.decode("utf-8", "ignore")
             else:
                 body_str = body
-            params = json.loads(body_str)
+            params = json_codec.loads(body_str)
         except (TypeError, ValueError, KeyError):
             if self.response:
                 self.response.set_status(400, "Error in json body")
@@ -204,7 +203,7 @@ class AsyncActionsHandler(ActionsHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(result))
+                self.response.write(json_codec.dumps(result))
         else:
             if self.response:
                 self.response.set_status(400, "Processing error")
@@ -4,13 +4,27 @@ Async-capable handler for ActingWeb MCP endpoint.
 This handler provides async versions of HTTP methods for optimal performance
 with FastAPI and other async frameworks. It properly awaits async hooks
 without thread pool overhead.
+
+Warm requests never leave the event loop: authentication is answered from the
+MCP token/actor/trust caches and ``*/list`` from the listing cache, both pure
+in-memory lookups. Only the steps that have to read storage -- a cache miss,
+``initialize``, a ``clientInfo`` write-back -- run the synchronous code in a
+worker thread via ``asyncio.to_thread`` (the default executor, not the
+``aw-handler`` pool sized by ``with_thread_pool_workers``), so a cold request
+cannot stall the loop for every other session.
 """
 
+import asyncio
 import inspect
 import logging
+from collections.abc import Callable
 from typing import Any
 
-from actingweb.handlers.mcp import MCPHandler, format_call_tool_result
+from actingweb.handlers.mcp import (
+    MCPHandler,
+    _ListingNotCached,
+    format_call_tool_result,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +70,11 @@ class AsyncMCPHandler(MCPHandler):
             # validation — otherwise a client sending a bad version header on
             # initialize would be rejected before it could learn what to use.
             if method == "initialize":
-                return self._handle_initialize(request_id, params)
+                # Stores clientInfo on the trust relationship when the client
+                # is already authenticated: storage, so off the loop.
+                return await asyncio.to_thread(
+                    self._handle_initialize, request_id, params
+                )
 
             # All other methods: resolve/validate the negotiated protocol
             # version from the header (sets self._negotiated_version; returns
@@ -72,7 +90,7 @@ class AsyncMCPHandler(MCPHandler):
                 return self._handle_ping(request_id, params)
 
             # All other methods require authentication
-            actor = self.authenticate_and_get_actor_cached()
+            actor = await self.authenticate_and_get_actor_async()
             if not actor:
                 # Set proper HTTP 401 response headers for framework-agnostic handling
                 base_url = f"{self.config.proto}{self.config.fqdn}"
@@ -90,17 +108,24 @@ class AsyncMCPHandler(MCPHandler):
 
             # Extract and update client info if provided in the request
             # MCP clients send clientInfo with many requests, not just initialize
-            self._update_actor_client_info(actor, data)
+            if self._carries_client_info(data):
+                await asyncio.to_thread(self._update_actor_client_info, actor, data)
 
             # MCP access is controlled granularly through individual permission types
             # (tools, resources, prompts) - no need for separate MCP access check
 
             if method == "tools/list":
-                return self._handle_tools_list(request_id, actor)
+                return await self._handle_list_async(
+                    self._handle_tools_list, request_id, actor
+                )
             elif method == "resources/list":
-                return self._handle_resources_list(request_id, actor)
+                return await self._handle_list_async(
+                    self._handle_resources_list, request_id, actor
+                )
             elif method == "prompts/list":
-                return self._handle_prompts_list(request_id, actor)
+                return await self._handle_list_async(
+                    self._handle_prompts_list, request_id, actor
+                )
             elif method == "tools/call":
                 return await self._handle_tool_call_async(request_id, params, actor)
             elif method == "prompts/get":
@@ -118,6 +143,46 @@ class AsyncMCPHandler(MCPHandler):
                 data.get("id"), -32603, f"Internal error: {str(e)}"
             )
 
+    async def authenticate_and_get_actor_async(self) -> Any:
+        """Async counterpart of ``authenticate_and_get_actor_cached``.
+
+        A request whose token, actor and trust relationship are all cached is
+        resolved inline. Anything else runs the synchronous flow -- token
+        validation, actor load, trust lookup -- in a worker thread.
+        """
+        bearer_token = self._bearer_token_for_cached_auth()
+        if not bearer_token:
+            # Nothing to look up; the sync path returns immediately.
+            return self.authenticate_and_get_actor_cached()
+        cached = self._cached_token_and_actor(bearer_token)
+        if cached is not None:
+            resolved, actor = self._authenticate_cached(*cached, allow_io=False)
+            if resolved:
+                return actor
+        # The sync flow continues from this miss instead of parsing the
+        # token and looking up the caches again.
+        self._auth_cache_miss = (bearer_token, cached)
+        return await asyncio.to_thread(self.authenticate_and_get_actor_cached)
+
+    async def _handle_list_async(
+        self,
+        handler: Callable[..., dict[str, Any]],
+        request_id: Any,
+        actor: Any,
+    ) -> dict[str, Any]:
+        """Serve a ``*/list`` from the listing cache, else from a worker thread."""
+        try:
+            return handler(request_id, actor, cache_only=True)
+        except _ListingNotCached:
+            return await asyncio.to_thread(handler, request_id, actor)
+
+    @staticmethod
+    def _carries_client_info(data: dict[str, Any]) -> bool:
+        params = data.get("params")
+        return "clientInfo" in data or (
+            isinstance(params, dict) and "clientInfo" in params
+        )
+
     async def _handle_tool_call_async(
         self, request_id: Any, params: dict[str, Any], actor: Any
     ) -> dict[str, Any]:
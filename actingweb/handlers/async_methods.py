@@ -6,11 +6,10 @@ with FastAPI and other async frameworks. It properly awaits async hooks
 without thread pool overhead.
 """
 
-import json
 import logging
 from typing import Any
 
-from actingweb import auth
+from actingweb import auth, json_codec
 from actingweb.handlers.methods import MethodsHandler
 
 logger = logging.getLogger(__name__)
@@ -80,7 +79,7 @@ class AsyncMethodsHandler(MethodsHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(result))
+                self.response.write(json_codec.dumps(result))
         else:
             if self.response:
                 self.response.set_status(404, "Not found")
@@ -122,7 +121,7 @@ class AsyncMethodsHandler(MethodsHandler):
                 body_str = body.decode("utf-8", "ignore")
             else:
                 body_str = body
-            params = json.loads(body_str)
+            params = json_codec.loads(body_str)
         except (TypeError, ValueError, KeyError):
             if self.response:
                 self.response.set_status(400, "Error in json body")
@@ -152,7 +151,7 @@ class AsyncMethodsHandler(MethodsHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(result))
+                self.response.write(json_codec.dumps(result))
         else:
             if self.response:
                 self.response.set_status(400, "Processing error")
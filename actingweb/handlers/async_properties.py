@@ -0,0 +1,66 @@
+"""
+Async-capable handler for ActingWeb properties endpoint.
+
+GET of a simple property reads the value through the async property accessor
+(``actingweb.db.get_property_async``). Actor loading, authentication, the
+permission check and the property hooks are synchronous and run in a worker
+thread via ``asyncio.to_thread``, as do list properties and the property
+listing.
+"""
+
+import asyncio
+import logging
+
+from actingweb.db import get_property_async
+from actingweb.handlers.properties import PropertiesHandler
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPropertiesHandler(PropertiesHandler):
+    """Async-capable properties handler for FastAPI integration.
+
+    Inherits all synchronous methods from PropertiesHandler for backward
+    compatibility.
+    """
+
+    async def get_async(self, actor_id: str, name: str = "") -> None:
+        """
+        Handle GET requests to properties endpoint asynchronously.
+
+        GET /properties - List properties
+        GET /properties/name[/path] - Get a property, or part of it
+        """
+        if self.request.get("_method") in ("PUT", "DELETE"):
+            await asyncio.to_thread(self.get, actor_id, name)
+            return
+        authorized = await asyncio.to_thread(self._authorize_get, actor_id, name)
+        if authorized is None:
+            return
+        myself, check, path = authorized
+        name = path[0] if path else ""
+        if not name:
+            await asyncio.to_thread(self.listall, myself, check)
+            return
+
+        # Block direct access to list: prefixed properties
+        if name.startswith("list:"):
+            if self.response:
+                self.response.set_status(404, "Not found")
+            return
+
+        lookup = await get_property_async(self.config).get(
+            actor_id=myself.id, name=name
+        )
+        if lookup is None and await asyncio.to_thread(
+            self._is_list_property, myself, name
+        ):
+            await asyncio.to_thread(self._get_list_property, myself, check, name)
+            return
+        if self.hooks:
+            # Property hooks and their permission check are synchronous
+            await asyncio.to_thread(
+                self._write_property, myself, check, name, path, lookup
+            )
+        else:
+            self._write_property(myself, check, name, path, lookup)
@@ -0,0 +1,46 @@
+"""
+Async-capable handler for ActingWeb subscription endpoint.
+
+Creating a subscription is two round trips to the peer: the subscription
+request and the baseline fetch. The async handler awaits both instead of
+holding a thread of the FastAPI integration's handler pool while it waits.
+"""
+
+import asyncio
+
+from actingweb.handlers.subscription import SubscriptionRootHandler
+
+
+class AsyncSubscriptionRootHandler(SubscriptionRootHandler):
+    """Async-capable handler for /subscriptions.
+
+    Inherits all synchronous methods from SubscriptionRootHandler.
+    """
+
+    async def post_async(self, actor_id: str) -> None:
+        """
+        Handle POST requests to subscription endpoint asynchronously.
+
+        POST /subscriptions - Subscribe to a peer and fetch the baseline
+        """
+        # Authentication reads storage, so keep it off the event loop
+        myself = await asyncio.to_thread(
+            self.require_authenticated_actor, actor_id, "subscriptions", "POST"
+        )
+        if not myself:
+            return
+
+        actor_interface = self._get_actor_interface(myself)
+        if not actor_interface:
+            if self.response:
+                self.response.set_status(500, "Internal error")
+            return
+
+        params = self._parse_post_params()
+        if params is None:
+            return
+
+        remote_loc = await actor_interface.subscriptions.subscribe_to_peer_async(
+            **params
+        )
+        self._post_response(remote_loc)
@@ -6,10 +6,13 @@ with FastAPI and other async frameworks. It properly awaits async trust
 operations without blocking the event loop.
 """
 
-import json
+import asyncio
 import logging
+from typing import Any
 
-from actingweb.handlers.trust import TrustHandler
+from actingweb import json_codec
+from actingweb.db import get_trust_async
+from actingweb.handlers.trust import TrustHandler, TrustPeerHandler
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +50,7 @@ class AsyncTrustHandler(TrustHandler):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
             if "url" in params:
                 url = params["url"]
             else:
@@ -113,7 +116,99 @@ class AsyncTrustHandler(TrustHandler):
             + "/"
             + new_trust["peerid"]
         )
-        out = json.dumps(new_trust)
+        out = json_codec.dumps(new_trust)
         self.response.write(out)
         self.response.headers["Content-Type"] = "application/json"
         self.response.set_status(201, "Created")
+
+
+class AsyncTrustPeerHandler(TrustPeerHandler):
+    """Async-capable handler for /trust/<relationship>/<peerid>.
+
+    PUT approving a relationship notifies the peer. ``put_async`` awaits that
+    notification instead of holding an ``aw-handler`` thread for the peer's
+    round trip. Both methods read the relationship through the async trust
+    accessor (``actingweb.db.get_trust_async``); the steps that remain
+    synchronous (authentication, hooks, permission overrides) run in a
+    worker thread via ``asyncio.to_thread``.
+
+    Inherits all synchronous methods from TrustPeerHandler.
+    """
+
+    async def get_async(self, actor_id: str, relationship: str, peerid: str) -> None:
+        """
+        Handle GET requests to a trust relationship asynchronously.
+
+        GET /trust/<relationship>/<peerid> - Return the relationship
+        """
+        if self.request.get("_method") == "PUT":
+            await self.put_async(actor_id, relationship, peerid)
+            self._redirect_to_trust_page(actor_id)
+            return
+        if self.request.get("_method") == "DELETE":
+            await asyncio.to_thread(self.get, actor_id, relationship, peerid)
+            return
+        auth_result = await asyncio.to_thread(
+            self._authorize_get, actor_id, relationship, peerid
+        )
+        if not auth_result:
+            return
+        my_trust = await self._read_trust_async(actor_id, relationship, peerid)
+        if my_trust and self.request.get("permissions") == "true":
+            # The permission overrides come from the attribute store
+            await asyncio.to_thread(
+                self._write_trust, actor_id, peerid, auth_result, my_trust
+            )
+        else:
+            self._write_trust(actor_id, peerid, auth_result, my_trust)
+
+    async def _read_trust_async(
+        self, actor_id: str, relationship: str, peerid: str
+    ) -> dict[str, Any] | None:
+        """The relationship with ``peerid`` if it is of type ``relationship``."""
+        trust = await get_trust_async(self.config).get(actor_id=actor_id, peerid=peerid)
+        if not trust or trust.get("relationship") != relationship:
+            return None
+        return trust
+
+    async def put_async(self, actor_id: str, relationship: str, peerid: str) -> None:
+        """
+        Handle PUT requests to a trust relationship asynchronously.
+
+        PUT /trust/<relationship>/<peerid> - Modify the relationship and
+        notify the peer when it is approved
+        """
+        myself = await asyncio.to_thread(self._authorize_put, actor_id, relationship)
+        if not myself:
+            return
+        params = self._parse_put_params()
+        if params is None:
+            return
+        baseuri, desc, approved, permission_updates = params
+        actor_interface = self._get_actor_interface(myself)
+        if not actor_interface:
+            if self.response:
+                self.response.set_status(500, "Internal error")
+            return
+
+        trust_updated = await actor_interface.trust.modify_and_notify_async(
+            peer_id=peerid,
+            relationship=relationship,
+            baseuri=baseuri,
+            approved=approved,
+            description=desc,
+        )
+        trust_data = None
+        if self._put_rereads_trust(approved, trust_updated):
+            trust_data = await self._read_trust_async(actor_id, relationship, peerid)
+        await asyncio.to_thread(
+            self._complete_put,
+            actor_id,
+            relationship,
+            peerid,
+            actor_interface,
+            approved,
+            permission_updates,
+            trust_updated,
+            trust_data,
+        )
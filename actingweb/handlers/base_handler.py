@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Any, Optional
 
-from actingweb import aw_web_request
+from actingweb import aw_web_request, json_stream
 from actingweb import config as config_class
 
 if TYPE_CHECKING:
@@ -239,6 +239,24 @@ class BaseHandler:
         """
         return self._authenticate_internal(actor_id, path, subpath, add_response)
 
+    def stream_listings_min_items(self) -> int | None:
+        """Smallest listing sent as streamed JSON, or None to buffer all."""
+        return getattr(self.config, "stream_listings_min_items", None)
+
+    def write_json_listing(self, value: Any, entries: int) -> None:
+        """Write ``value`` (see :mod:`actingweb.json_stream`) as the JSON body.
+
+        A listing of at least ``stream_listings_min_items()`` ``entries`` is
+        streamed: encoded entry by entry while the integration sends it.
+        Anything that can fail the request must be checked before this call.
+        """
+        min_items = self.stream_listings_min_items()
+        if min_items is not None and entries >= min_items:
+            self.response.write_stream(json_stream.iter_encode(value))
+            return
+        self.response.write(json_stream.dumps(value))
+        self.response.headers["Content-Type"] = "application/json"
+
     def get_actor_allow_unauthenticated(
         self, actor_id: str, path: str = "", subpath: str = ""
     ) -> Any | None:
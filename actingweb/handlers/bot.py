@@ -1,3 +1,4 @@
+from actingweb import json_codec
 from actingweb.handlers import base_handler
 
 
@@ -27,9 +28,7 @@ class BotHandler(base_handler.BaseHandler):
                         body_str = body.decode("utf-8", "ignore")
                     else:
                         body_str = body
-                    import json
-
-                    hook_data["body"] = json.loads(body_str)
+                    hook_data["body"] = json_codec.loads(body_str)
             except (TypeError, ValueError, KeyError):
                 pass  # No body or invalid JSON
 
@@ -1,9 +1,8 @@
-import json
 import logging
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from actingweb import auth
+from actingweb import auth, json_codec
 from actingweb.handlers import base_handler
 
 if TYPE_CHECKING:
@@ -56,7 +55,7 @@ class CallbacksHandler(base_handler.BaseHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(hook_result))
+                self.response.write(json_codec.dumps(hook_result))
         else:
             self.response.set_status(403, "Forbidden")
 
@@ -158,7 +157,7 @@ class CallbacksHandler(base_handler.BaseHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(hook_result))
+                self.response.write(json_codec.dumps(hook_result))
         else:
             self.response.set_status(403, "Forbidden")
 
@@ -202,7 +201,7 @@ class CallbacksHandler(base_handler.BaseHandler):
                     body_str = body.decode("utf-8", "ignore")
                 else:
                     body_str = body
-                params = json.loads(body_str)
+                params = json_codec.loads(body_str)
             except (TypeError, ValueError, KeyError):
                 self.response.set_status(400, "Error in json body")
                 return
@@ -356,7 +355,7 @@ class CallbacksHandler(base_handler.BaseHandler):
                         body_str = body.decode("utf-8", "ignore")
                     else:
                         body_str = body
-                    params = json.loads(body_str)
+                    params = json_codec.loads(body_str)
                 except (TypeError, ValueError, KeyError):
                     self.response.set_status(400, "Error in json body")
                     return
@@ -422,7 +421,7 @@ class CallbacksHandler(base_handler.BaseHandler):
                         body_str = body.decode("utf-8", "ignore")
                     else:
                         body_str = body
-                    hook_data = json.loads(body_str)
+                    hook_data = json_codec.loads(body_str)
                 except (TypeError, ValueError, KeyError):
                     hook_data = {}
 
@@ -435,7 +434,7 @@ class CallbacksHandler(base_handler.BaseHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(hook_result))
+                self.response.write(json_codec.dumps(hook_result))
         else:
             self.response.set_status(403, "Forbidden")
 
@@ -539,8 +538,7 @@ class CallbacksHandler(base_handler.BaseHandler):
             else:
                 # Low-granularity diff callback - fetch from subscription diff endpoint
                 try:
-                    import httpx
-
+                    from actingweb import peer_transport
                     from actingweb.trust import Trust
 
                     # Get trust relationship for authentication
@@ -552,13 +550,13 @@ class CallbacksHandler(base_handler.BaseHandler):
                     trust_data = trust.get()
                     secret = trust_data.get("secret", "") if trust_data else ""
 
-                    with httpx.Client(timeout=10.0) as client:
-                        response = client.get(
-                            callback_url,
-                            headers={
-                                "Authorization": f"Bearer {secret}",
-                            },
-                        )
+                    response = peer_transport.get_client().get(
+                        callback_url,
+                        headers={
+                            "Authorization": f"Bearer {secret}",
+                        },
+                        timeout=10.0,
+                    )
                     if response.status_code == 200:
                         url_data = response.json()
                         # Low-granularity: URL points to subscription diff endpoint
@@ -611,23 +609,23 @@ class CallbacksHandler(base_handler.BaseHandler):
                 if config.subscription_data_hooks:
                     import inspect
 
+                    from actingweb.interface.hook_executor import run_async_hook
+
                     # Invoke target-specific hooks
                     if target in config.subscription_data_hooks:
                         for hook in config.subscription_data_hooks[target]:
                             try:
                                 if inspect.iscoroutinefunction(hook):
-                                    # Can't await in sync context, run via asyncio.run
-                                    import asyncio
-
-                                    asyncio.run(
-                                        hook(
-                                            actor_interface,
-                                            peer_id,
-                                            target,
-                                            cb.data,
-                                            cb.sequence,
-                                            cb.callback_type.value,
-                                        )
+                                    # Can't await in sync context, run on the
+                                    # shared hook event loop
+                                    run_async_hook(
+                                        hook,
+                                        actor_interface,
+                                        peer_id,
+                                        target,
+                                        cb.data,
+                                        cb.sequence,
+                                        cb.callback_type.value,
                                     )
                                 else:
                                     hook(
@@ -648,17 +646,14 @@ class CallbacksHandler(base_handler.BaseHandler):
                         for hook in config.subscription_data_hooks["*"]:
                             try:
                                 if inspect.iscoroutinefunction(hook):
-                                    import asyncio
-
-                                    asyncio.run(
-                                        hook(
-                                            actor_interface,
-                                            peer_id,
-                                            target,
-                                            cb.data,
-                                            cb.sequence,
-                                            cb.callback_type.value,
-                                        )
+                                    run_async_hook(
+                                        hook,
+                                        actor_interface,
+                                        peer_id,
+                                        target,
+                                        cb.data,
+                                        cb.sequence,
+                                        cb.callback_type.value,
                                     )
                                 else:
                                     hook(
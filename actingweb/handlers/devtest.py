@@ -1,7 +1,6 @@
 import datetime
-import json
 
-from actingweb import attribute, aw_proxy
+from actingweb import attribute, aw_proxy, json_codec
 from actingweb.handlers import base_handler
 
 
@@ -26,7 +25,7 @@ class DevtestHandler(base_handler.BaseHandler):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
         except (TypeError, ValueError, KeyError):
             body = self.request.body
             if isinstance(body, bytes):
@@ -122,7 +121,7 @@ class DevtestHandler(base_handler.BaseHandler):
                     if proxy.last_response_code != 200:
                         self.response.set_status(proxy.last_response_code)
                         return
-                    out = json.dumps(prop)
+                    out = json_codec.dumps(prop)
                     if self.response:
                         self.response.write(out)
                     self.response.headers["Content-Type"] = "application/json"
@@ -151,7 +150,7 @@ class DevtestHandler(base_handler.BaseHandler):
                         except AttributeError:
                             # timestamp might be None or a string already
                             pass
-                    out = json.dumps(attr)
+                    out = json_codec.dumps(attr)
                     if self.response:
                         self.response.write(out)
                     self.response.headers["Content-Type"] = "application/json"
@@ -177,7 +176,7 @@ class DevtestHandler(base_handler.BaseHandler):
                             except AttributeError:
                                 # timestamp might be None or a string already
                                 pass
-                    out = json.dumps(params)
+                    out = json_codec.dumps(params)
                     if self.response:
                         self.response.write(out)
                 else:
@@ -200,7 +199,7 @@ class DevtestHandler(base_handler.BaseHandler):
                             d[k]["timestamp"] = v["timestamp"].strftime(
                                 "%Y-%m-%d %H:%M:%S"
                             )
-                    out = json.dumps(params)
+                    out = json_codec.dumps(params)
                     if self.response:
                         self.response.write(out)
                 else:
@@ -232,7 +231,7 @@ class DevtestHandler(base_handler.BaseHandler):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
         except (TypeError, ValueError, KeyError):
             params = None
         paths = path.split("/")
@@ -244,7 +243,7 @@ class DevtestHandler(base_handler.BaseHandler):
                     meta = proxy.get_resource(path="/meta")
                     if params:
                         proxy.create_resource("/properties", params=params)
-                    out = json.dumps(meta)
+                    out = json_codec.dumps(meta)
                     if self.response:
                         self.response.write(out)
                     self.response.headers["Content-Type"] = "application/json"
@@ -263,7 +262,7 @@ class DevtestHandler(base_handler.BaseHandler):
                             key, value, timestamp=datetime.datetime.utcnow()
                         )
                     # Return the created content as JSON
-                    out = json.dumps(params)
+                    out = json_codec.dumps(params)
                     if self.response:
                         self.response.write(out)
                     self.response.headers["Content-Type"] = "application/json"
@@ -8,12 +8,12 @@ Supports both HTML template responses and JSON API responses based on
 the Accept header (application/json for API clients).
 """
 
-import json
 import logging
 import secrets
 import time
 from typing import TYPE_CHECKING, Any, Optional
 
+from .. import json_codec
 from .base_handler import BaseHandler
 
 if TYPE_CHECKING:
@@ -58,7 +58,7 @@ class EmailVerificationHandler(BaseHandler):
     ) -> dict[str, Any]:
         """Return JSON response for API clients."""
         if self.response:
-            self.response.write(json.dumps(data))
+            self.response.write(json_codec.dumps(data))
             self.response.headers["Content-Type"] = "application/json"
             self.response.set_status(status_code)
         return data
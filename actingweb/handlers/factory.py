@@ -1,7 +1,6 @@
-import json
 import logging
 
-from actingweb import actor
+from actingweb import actor, json_codec
 from actingweb.db import get_actor
 from actingweb.handlers import base_handler
 
@@ -125,7 +124,7 @@ class RootFactoryHandler(base_handler.BaseHandler):
         }
 
         # Write JSON response
-        self.response.write(json.dumps(response_data))
+        self.response.write(json_codec.dumps(response_data))
         self.response.headers["Content-Type"] = "application/json"
         self.response.set_status(200)
 
@@ -203,7 +202,7 @@ class RootFactoryHandler(base_handler.BaseHandler):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
             is_json = True
             if "creator" in params:
                 creator = params["creator"]
@@ -292,7 +291,7 @@ class RootFactoryHandler(base_handler.BaseHandler):
         if self.config.ui and not is_json:
             self.response.template_values = {**pair, "base_path": self._base_path()}
             return
-        out = json.dumps(pair)
+        out = json_codec.dumps(pair)
         self.response.write(out)
         self.response.headers["Content-Type"] = "application/json"
         self.response.set_status(201, "Created")
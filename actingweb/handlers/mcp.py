@@ -11,24 +11,20 @@ ActingWeb server supports MCP (and thus all actors can be accessed via MCP), or
 MCP is not available at all.
 """
 
-import json
 import logging
 import re
 import threading
 import time
-from typing import Any
-
-# Global cache for MCP client info during session establishment
-_mcp_client_info_cache: dict[str, dict[str, Any]] = {}
+from typing import Any, cast
 
 # Imports after MCP availability check
-from .. import __version__, aw_web_request  # noqa: E402
+from .. import __version__, aw_web_request, discovery, json_codec  # noqa: E402
 from .. import config as config_class  # noqa: E402
+from ..cache import CacheGeneration, TTLCache  # noqa: E402
 from ..interface.actor_interface import ActorInterface  # noqa: E402
 from ..interface.hooks import HookRegistry  # noqa: E402
 from ..mcp.protocol import (  # noqa: E402
     DEFAULT_NEGOTIATED_VERSION,
-    LATEST_PROTOCOL_VERSION,
     SUPPORTED_PROTOCOL_VERSIONS,
     is_supported_protocol_version,
     negotiate_protocol_version,
@@ -40,20 +36,10 @@ from .base_handler import BaseHandler  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
-# Global caches for MCP performance optimization
-_token_cache: dict[str, dict[str, Any]] = {}  # token -> validation data
-_actor_cache: dict[str, dict[str, Any]] = {}  # actor_id -> {actor, last_accessed}
-# (actor_id, client_id) -> {"trust": relationship-or-None, "cached_at": float}.
-# Keyed per actor/client pair: one trust row exists per client, and an
-# actor-only key let one client's resolved trust serve another client on the
-# same actor (authorization bypass). The value wraps the relationship so the
-# entry carries its own timestamp; "trust" may be None (cached negative).
-_trust_cache: dict[tuple[str, str], dict[str, Any]] = {}
 _cache_ttl = 300  # 5 minutes cache TTL
 
-# Per-entry TTLs for the trust cache, checked against each entry's
-# "cached_at". None means no per-entry bound: entries live until evicted by
-# actor expiry or logout.
+# Per-entry TTLs for the trust cache. None means no per-entry bound: entries
+# live until evicted by actor expiry, logout, or the cache's size bound.
 _TRUST_CACHE_TTL: float | None = None
 # Cached-None ("negative") entries get their own, short, knob. Under
 # fail-closed authorization, a cached None pins a denial for the entry's
@@ -63,6 +49,65 @@ _TRUST_CACHE_TTL: float | None = None
 # _cache_ttl instead of resolving itself within seconds.
 _TRUST_CACHE_NEGATIVE_TTL: float | None = 10.0
 
+# Shared by the token, actor and trust caches: a request snapshots it before
+# the storage reads that feed them, and every eviction bumps it, so a fill
+# that raced a revocation is refused.
+#
+# Eviction alone is not enough, and the gap is a plain time-of-check race: a
+# request can read a token or a trust relationship from storage, a revocation
+# can then delete that row *and* run its eviction, and the in-flight request
+# then writes the result it read a moment earlier back into the cache. The
+# revoked credential is live again for a full TTL, and the eviction reported
+# success. Raised as a P1 by Codex review on PR #130. Deliberately **global**
+# rather than per-actor: the actor is not known until after the read that
+# needs guarding -- see :class:`actingweb.cache.CacheGeneration`.
+_cache_generation = CacheGeneration()
+
+# token -> {"actor_id", "client_id", "token_data"}, grouped by actor id so
+# actor-wide eviction does not scan other actors' tokens.
+_token_cache = TTLCache(
+    "mcp_tokens",
+    max_entries=10_000,
+    ttl=_cache_ttl,
+    group_of=lambda _token, data: (
+        data.get("actor_id") if isinstance(data, dict) else None
+    ),
+    generation=_cache_generation,
+)
+# actor_id -> {"actor": ActorInterface, "config": Config}, on a sliding TTL.
+_actor_cache = TTLCache(
+    "mcp_actors",
+    max_entries=2_000,
+    ttl=_cache_ttl,
+    sliding=True,
+    generation=_cache_generation,
+)
+# (actor_id, client_id) -> trust relationship, or None (cached negative).
+# Keyed per actor/client pair: one trust row exists per client, and an
+# actor-only key let one client's resolved trust serve another client on the
+# same actor (authorization bypass). Grouped by actor id for eviction.
+_trust_cache = TTLCache(
+    "mcp_trust",
+    max_entries=20_000,
+    ttl=_TRUST_CACHE_TTL,
+    group_of=lambda key, _trust: key[0] if isinstance(key, tuple) else None,
+    generation=_cache_generation,
+)
+# session key -> client_info, held during session establishment until the
+# OAuth2 flow completes and the info lands on the trust relationship.
+_mcp_client_info_cache = TTLCache("mcp_client_info", max_entries=1_024, ttl=600)
+# (actor_id, peer_id, permission_version, protocol_version, permission type,
+# client type, catalog serial) -> permitted catalog descriptors for a
+# ``*/list`` call. Grouped by actor id, so any change that evicts an actor's
+# trust or permissions also drops its listings.
+_listing_cache = TTLCache(
+    "mcp_listings",
+    max_entries=10_000,
+    ttl=_cache_ttl,
+    group_of=lambda key, _descriptors: key[0] if isinstance(key, tuple) else None,
+    generation=_cache_generation,
+)
+
 # Cleanup scheduling: run cache cleanup at most once every N seconds. (The
 # previous `time.time() % 20 == 0` float comparison was effectively never
 # true, so cleanup never ran and entries accumulated.) A monotonic deadline
@@ -73,16 +118,6 @@ _TRUST_CACHE_NEGATIVE_TTL: float | None = 10.0
 _CLEANUP_INTERVAL_SECONDS = 20.0
 _next_cleanup_at = 0.0
 
-# Cache statistics for performance monitoring
-_cache_stats = {
-    "token_hits": 0,
-    "token_misses": 0,
-    "actor_hits": 0,
-    "actor_misses": 0,
-    "trust_hits": 0,
-    "trust_misses": 0,
-}
-
 
 def _trust_cache_key(actor_id: str, client_id: str) -> tuple[str, str]:
     """Construct the trust-cache key: one entry per (actor, client) pair.
@@ -99,34 +134,24 @@ def _trust_cache_get(trust_key: tuple[str, str]) -> tuple[bool, Any]:
     A hit with ``trust=None`` is a valid cached negative result, so callers
     must branch on the hit flag, never on the truthiness of the trust value.
     """
-    entry = _trust_cache.get(trust_key)
-    if entry is None:
-        return False, None
-    trust = entry.get("trust")
-    ttl = _TRUST_CACHE_NEGATIVE_TTL if trust is None else _TRUST_CACHE_TTL
-    if ttl is not None and time.time() - entry.get("cached_at", 0.0) > ttl:
-        _trust_cache.pop(trust_key, None)
-        return False, None
-    return True, trust
-
-
-def _trust_cache_put(trust_key: tuple[str, str], trust_relationship: Any) -> None:
-    """Store a resolved trust (or None) with its resolution timestamp."""
-    _trust_cache[trust_key] = {"trust": trust_relationship, "cached_at": time.time()}
-
-
-def _evict_trust_entries_for_actor(actor_id: str) -> None:
-    """Remove every (actor_id, client_id) trust entry for the actor.
-
-    Scans a ``.copy()`` of the cache: these module dicts are mutated from
-    concurrent worker threads with no lock, and ``.copy()`` is a single C-level
-    operation that yields an independent dict, unlike iterating the live dict
-    (or ``list(d)``, which iterates it), which can raise
-    ``RuntimeError: dictionary changed size during iteration`` if another
-    thread mutates it mid-scan.
-    """
-    for key in [k for k in _trust_cache.copy() if k[0] == actor_id]:
-        _trust_cache.pop(key, None)
+    return _trust_cache.lookup(trust_key)
+
+
+def _trust_cache_put(
+    trust_key: tuple[str, str],
+    trust_relationship: Any,
+    generation_at_read: int | None = None,
+) -> bool:
+    """Store a resolved trust (or None) under the TTL that fits it."""
+    ttl = _TRUST_CACHE_NEGATIVE_TTL if trust_relationship is None else _TRUST_CACHE_TTL
+    return _trust_cache.put(
+        trust_key, trust_relationship, ttl=ttl, if_generation=generation_at_read
+    )
+
+
+def _evict_trust_entries_for_actor(actor_id: str) -> int:
+    """Remove every (actor_id, client_id) trust entry for the actor."""
+    return _trust_cache.evict_group(actor_id)
 
 
 # --- Unsupported-protocol-version rejection telemetry ------------------------
@@ -213,42 +238,13 @@ def _reset_unsupported_version_telemetry() -> None:
         _unsupported_version_origins.clear()
 
 
-# Monotonic counter bumped by every eviction, anywhere.
-#
-# Eviction alone is not enough, and the gap is a plain time-of-check race: a
-# request can read a token or a trust relationship from storage, a revocation
-# can then delete that row *and* run its eviction, and the in-flight request
-# then writes the result it read a moment earlier back into the cache. The
-# revoked credential is live again for a full TTL, and the eviction reported
-# success. Raised as a P1 by Codex review on PR #130.
-#
-# The counter closes it: a request snapshots it before the storage reads that
-# feed the caches, and declines to populate them if it has moved by the time it
-# would insert. Deliberately **global** rather than per-actor: the actor is not
-# known until after the read that needs guarding, so there is nothing per-actor
-# to snapshot beforehand. The cost of the coarseness is that an unrelated
-# revocation elsewhere makes one request skip its cache fill — that request
-# still succeeds, it just pays full price. Revocations are rare and cache
-# misses are cheap; a resurrected credential is neither.
-_cache_generation = 0
-_cache_generation_lock = threading.Lock()
-
-
 def _current_cache_generation() -> int:
-    return _cache_generation
-
-
-def _bump_cache_generation() -> None:
-    global _cache_generation
-    with _cache_generation_lock:
-        _cache_generation += 1
+    return _cache_generation.current
 
 
 def _cache_fill_still_valid(generation_at_read: int | None) -> bool:
     """False when an eviction landed while this request was reading storage."""
-    if generation_at_read is None:
-        return True
-    return generation_at_read == _cache_generation
+    return _cache_generation.still_valid(generation_at_read)
 
 
 def evict_mcp_caches_for_actor(actor_id: str) -> int:
@@ -273,27 +269,15 @@ def evict_mcp_caches_for_actor(actor_id: str) -> int:
     ``thoughts/todo/mcp-cache-lifecycle-and-revocation.md``, deliberately out of
     scope here.
     """
-    evicted = 0
-
-    for token in [
-        token
-        for token, data in _token_cache.copy().items()
-        if data.get("actor_id") == actor_id
-    ]:
-        _token_cache.pop(token, None)
-        evicted += 1
-
-    if _actor_cache.pop(actor_id, None) is not None:
+    # Each eviction bumps the shared generation, unconditionally, not only
+    # when something was evicted: an in-flight request may be about to insert
+    # an entry that did not exist yet when this ran, which is exactly the race
+    # the generation exists to stop.
+    evicted = _token_cache.evict_group(actor_id)
+    if _actor_cache.invalidate(actor_id):
         evicted += 1
-
-    trust_keys = [k for k in _trust_cache.copy() if k[0] == actor_id]
-    _evict_trust_entries_for_actor(actor_id)
-    evicted += len(trust_keys)
-
-    # Bumped unconditionally, not only when something was evicted: an
-    # in-flight request may be about to insert an entry that did not exist yet
-    # when this ran, which is exactly the race the counter exists to stop.
-    _bump_cache_generation()
+    evicted += _evict_trust_entries_for_actor(actor_id)
+    evicted += _listing_cache.evict_group(actor_id)
 
     if evicted:
         logger.debug("Evicted %d MCP cache entries for actor %s", evicted, actor_id)
@@ -499,6 +483,11 @@ def format_call_tool_result(
     return out
 
 
+class _ListingNotCached(Exception):
+    """A ``cache_only`` listing needed work beyond the listing cache (a
+    cache miss, or tool predicates to run)."""
+
+
 class MCPHandler(BaseHandler):
     """
     Handler for the /mcp endpoint.
@@ -521,36 +510,27 @@ class MCPHandler(BaseHandler):
         # request from the MCP-Protocol-Version header (post-initialize) and
         # consulted when formatting version-gated response fields.
         self._negotiated_version: str = DEFAULT_NEGOTIATED_VERSION
+        # Set by AsyncMCPHandler before it hands a cache miss to
+        # authenticate_and_get_actor_cached(): the bearer token and the
+        # cached (token data, actor) when only the trust lookup missed.
+        self._auth_cache_miss: tuple[str, tuple[dict[str, Any], Any] | None] | None = (
+            None
+        )
 
     def _cleanup_expired_cache_entries(self) -> None:
         """Remove expired entries from all caches.
 
-        Scans a ``.copy()`` of each cache dict: they are mutated from
-        concurrent worker threads with no lock, and ``.copy()`` yields an
-        independent dict unaffected by later mutation (unlike iterating the
-        live dict, which can raise
-        ``RuntimeError: dictionary changed size during iteration``).
+        Each sweep walks its cache from the least recently used end and stops
+        at the first live entry, so it costs O(expired). An expired actor takes
+        every trust entry for that actor with it.
         """
-        current_time = time.time()
-
-        # Clean token cache
-        expired_tokens = [
-            token
-            for token, data in _token_cache.copy().items()
-            if current_time - data.get("cached_at", 0) > _cache_ttl
-        ]
-        for token in expired_tokens:
-            _token_cache.pop(token, None)
-
-        # Clean actor cache, and every trust entry for each expired actor
-        expired_actors = [
-            actor_id
-            for actor_id, data in _actor_cache.copy().items()
-            if current_time - data.get("last_accessed", 0) > _cache_ttl
-        ]
+        expired_tokens = _token_cache.purge_expired()
+        expired_actors = _actor_cache.purge_expired()
         for actor_id in expired_actors:
-            _actor_cache.pop(actor_id, None)
-            _evict_trust_entries_for_actor(actor_id)
+            _evict_trust_entries_for_actor(str(actor_id))
+        _trust_cache.purge_expired()
+        _mcp_client_info_cache.purge_expired()
+        _listing_cache.purge_expired()
 
         if expired_tokens or expired_actors:
             logger.debug(
@@ -567,25 +547,7 @@ class MCPHandler(BaseHandler):
         try:
             # For initial discovery, don't require authentication
             # Return basic server information that MCP clients can use
-            return {
-                "version": LATEST_PROTOCOL_VERSION,
-                "server_name": "actingweb-mcp",
-                "capabilities": {
-                    "tools": True,  # We support tools
-                    "resources": True,  # We support resources
-                    "prompts": True,  # We support prompts
-                },
-                "transport": {
-                    "type": "http",
-                    "endpoint": "/mcp",
-                    "supported_versions": list(SUPPORTED_PROTOCOL_VERSIONS),
-                },
-                "authentication": {
-                    "required": True,
-                    "type": "oauth2",
-                    "discovery_url": f"{self.config.proto}{self.config.fqdn}/.well-known/oauth-protected-resource",
-                },
-            }
+            return discovery.mcp_server_info(self.config)
 
         except Exception as e:
             logger.error(f"Error handling MCP GET request: {e}")
@@ -672,51 +634,15 @@ class MCPHandler(BaseHandler):
 
     def _has_mcp_tools(self) -> bool:
         """Check if server has any MCP-exposed tools."""
-        if not self.hooks:
-            return False
-
-        # Check if any action hooks are MCP-exposed
-        from ..mcp.decorators import get_mcp_metadata, is_mcp_exposed
-
-        for _action_name, hooks in self.hooks._action_hooks.items():
-            for hook in hooks:
-                if is_mcp_exposed(hook):
-                    metadata = get_mcp_metadata(hook)
-                    if metadata and metadata.get("type") == "tool":
-                        return True
-        return False
+        return bool(self.hooks) and bool(self._catalog().tools)
 
     def _has_mcp_resources(self) -> bool:
         """Check if server has any MCP-exposed resources."""
-        if not self.hooks:
-            return False
-
-        # Check if any method hooks are MCP-exposed as resources
-        from ..mcp.decorators import get_mcp_metadata, is_mcp_exposed
-
-        for _method_name, hooks in self.hooks._method_hooks.items():
-            for hook in hooks:
-                if is_mcp_exposed(hook):
-                    metadata = get_mcp_metadata(hook)
-                    if metadata and metadata.get("type") == "resource":
-                        return True
-        return False
+        return bool(self.hooks) and bool(self._catalog().resources)
 
     def _has_mcp_prompts(self) -> bool:
         """Check if server has any MCP-exposed prompts."""
-        if not self.hooks:
-            return False
-
-        # Check if any method hooks are MCP-exposed
-        from ..mcp.decorators import get_mcp_metadata, is_mcp_exposed
-
-        for _method_name, hooks in self.hooks._method_hooks.items():
-            for hook in hooks:
-                if is_mcp_exposed(hook):
-                    metadata = get_mcp_metadata(hook)
-                    if metadata and metadata.get("type") == "prompt":
-                        return True
-        return False
+        return bool(self.hooks) and bool(self._catalog().prompts)
 
     def _handle_initialize(
         self, request_id: Any, params: dict[str, Any]
@@ -854,266 +780,259 @@ class MCPHandler(BaseHandler):
             return None
         return peer_id
 
-    def _handle_tools_list(self, request_id: Any, actor: Any) -> dict[str, Any]:
-        """Handle MCP tools/list request with permission filtering and client filtering."""
-        global _mcp_client_info_cache
-        tools = []
-
-        if self.hooks:
-            from ..mcp.decorators import get_mcp_metadata, is_mcp_exposed
-            from ..permission_evaluator import (
-                PermissionResult,
-                PermissionType,
-                get_permission_evaluator,
-            )
+    @staticmethod
+    def _classify_client_name(client_name: str) -> str:
+        """Map an MCP client name to the client type ``allowed_clients`` uses."""
+        client_name = client_name.lower()
+        if any(pattern in client_name for pattern in ["openai", "chatgpt", "gpt"]):
+            return "chatgpt"
+        if any(pattern in client_name for pattern in ["claude", "anthropic"]):
+            return "claude"
+        if "cursor" in client_name:
+            return "cursor"
+        if "mcp-inspector" in client_name:
+            return "mcp_inspector"
+        return "universal"
+
+    def _detect_client_type(self, actor: Any) -> str:
+        """Client type for ``tools/list`` filtering; ``"universal"`` if unknown."""
+        try:
+            from ..runtime_context import get_client_info_from_context
 
-            # No trust relationship resolved for this client -> fail-closed:
-            # an empty list, not every tool. Evaluated before the fail-open
-            # evaluator try/except below, so an unrelated exception there
-            # cannot revert this to "show every tool".
-            peer_id = self._peer_id_for_list(actor, "tools/list")
-            if not peer_id:
-                return {"jsonrpc": "2.0", "id": request_id, "result": {"tools": []}}
+            client_info = get_client_info_from_context(actor)
+            if not (client_info and client_info.get("name")):
+                # Fallback: the trust relationship may not carry client info
+                # yet; use what initialize stored for this session.
+                session_key = self._get_session_key()
+                client_info = MCPHandler.get_stored_client_info(session_key)
+            if client_info and client_info.get("name"):
+                return self._classify_client_name(client_info["name"])
+        except Exception as e:
+            logger.debug(f"Could not detect client type for tools filtering: {e}")
+        return "universal"
 
-            # Get evaluator if the permission system is initialized
-            evaluator = None
-            try:
-                evaluator = get_permission_evaluator(self.config)
-            except Exception as e:
-                logger.debug(f"Permission evaluator unavailable during tools/list: {e}")
-                evaluator = None
+    def _permitted_descriptors(
+        self,
+        descriptors: tuple[Any, ...],
+        actor: Any,
+        peer_id: str,
+        evaluator: Any,
+        permission_type: Any,
+        operation: str,
+        client_type: str | None = None,
+        cache_only: bool = False,
+    ) -> tuple[Any, ...]:
+        """Descriptors this peer may see, cached per (actor, peer, versions).
+
+        Applies the parts of ``*/list`` filtering that depend only on the key:
+        ``allowed_clients`` and the permission evaluator. Per-actor predicates
+        stay with the caller and run on every request, since they exist to
+        gate on live actor state.
+
+        The key carries the evaluator's ``permission_version`` (trust type
+        definitions) and the negotiated protocol version; per-relationship
+        permission and trust changes evict the actor's group through
+        :func:`evict_mcp_caches_for_actor`. A listing is only stored when it
+        was computed from a working evaluator: a fail-open result (no
+        evaluator, or one that raised) is served but never cached.
+        """
+        from ..permission_evaluator import PermissionResult
 
-            # Detect client type for filtering
-            client_type = None
+        catalog_serial = self._catalog().serial
+        permission_version = None
+        if evaluator is not None:
             try:
-                from ..runtime_context import get_client_info_from_context
-
-                client_info = get_client_info_from_context(actor)
-                if client_info and client_info.get("name"):
-                    client_name = client_info["name"].lower()
-                    # Classify client type based on name patterns
-                    if any(
-                        pattern in client_name
-                        for pattern in ["openai", "chatgpt", "gpt"]
-                    ):
-                        client_type = "chatgpt"
-                    elif any(
-                        pattern in client_name for pattern in ["claude", "anthropic"]
-                    ):
-                        client_type = "claude"
-                    elif "cursor" in client_name:
-                        client_type = "cursor"
-                    elif "mcp-inspector" in client_name:
-                        client_type = "mcp_inspector"
-                    else:
-                        client_type = "universal"
-                    # Client type detected (no logging needed for routine operation)
-                else:
-                    # Fallback: Check global client info cache like the other handler does
-                    session_key = self._get_session_key()
-                    if session_key in _mcp_client_info_cache:
-                        cached_info = _mcp_client_info_cache[session_key]
-                        if cached_info and "client_info" in cached_info:
-                            fallback_client_info = cached_info["client_info"]
-                            if fallback_client_info.get("name"):
-                                client_name = fallback_client_info["name"].lower()
-                                if any(
-                                    pattern in client_name
-                                    for pattern in ["openai", "chatgpt", "gpt"]
-                                ):
-                                    client_type = "chatgpt"
-                                elif any(
-                                    pattern in client_name
-                                    for pattern in ["claude", "anthropic"]
-                                ):
-                                    client_type = "claude"
-                                elif "cursor" in client_name:
-                                    client_type = "cursor"
-                                elif "mcp-inspector" in client_name:
-                                    client_type = "mcp_inspector"
-                                else:
-                                    client_type = "universal"
-                                # Client type detected (no logging needed for routine operation)
-
-                    if not client_type:
-                        client_type = "universal"
-            except Exception as e:
-                logger.debug(f"Could not detect client type for tools filtering: {e}")
-                client_type = "universal"
-
-            # Discover MCP tools from action hooks
-            for action_name, hooks in self.hooks._action_hooks.items():
-                for hook in hooks:
-                    if not is_mcp_exposed(hook):
-                        continue
-                    metadata = get_mcp_metadata(hook)
-                    if not (metadata and metadata.get("type") == "tool"):
+                permission_version = evaluator.permission_version
+            except Exception:
+                permission_version = None
+        cacheable = isinstance(permission_version, int)
+        key = (
+            actor.id,
+            peer_id,
+            permission_version,
+            self._negotiated_version,
+            permission_type.value,
+            client_type,
+            catalog_serial,
+        )
+        if cacheable:
+            hit, cached = _listing_cache.lookup(key)
+            if hit:
+                return cast(tuple[Any, ...], cached)
+        if cache_only:
+            raise _ListingNotCached(permission_type.value)
+        generation_at_read = _current_cache_generation()
+
+        permitted = []
+        complete = evaluator is not None
+        for descriptor in descriptors:
+            allowed_clients = descriptor.metadata.get("allowed_clients")
+            if allowed_clients and client_type and client_type not in allowed_clients:
+                logger.debug(
+                    f"'{descriptor.target}' filtered out for client type '{client_type}' (allowed: {allowed_clients})"
+                )
+                continue
+
+            if evaluator:
+                try:
+                    decision = evaluator.evaluate_permission(
+                        actor.id,
+                        peer_id,
+                        permission_type,
+                        descriptor.target,
+                        operation=operation,
+                    )
+                    if decision != PermissionResult.ALLOWED:
+                        logger.debug(
+                            f"'{descriptor.target}' filtered out for peer {peer_id} (actor {actor.id})"
+                        )
                         continue
+                except Exception as e:
+                    logger.warning(
+                        f"Error evaluating {permission_type.value} permission for '{descriptor.target}': {e}"
+                    )
+                    # Fail-open on evaluation errors to avoid hard lockouts
+                    complete = False
 
-                    tool_name = metadata.get("name") or action_name
-
-                    # Filter by client restrictions
-                    allowed_clients = metadata.get("allowed_clients")
-                    if allowed_clients and client_type:
-                        if client_type not in allowed_clients:
-                            logger.debug(
-                                f"Tool '{tool_name}' filtered out for client type '{client_type}' (allowed: {allowed_clients})"
-                            )
-                            continue
-
-                    # Filter by visibility_predicate (per-actor gating)
-                    visibility_predicate = metadata.get("visibility_predicate")
-                    if visibility_predicate is not None:
-                        try:
-                            if not visibility_predicate(actor):
-                                logger.debug(
-                                    f"Tool '{tool_name}' filtered out by visibility_predicate for actor {getattr(actor, 'id', '?')}"
-                                )
-                                continue
-                        except Exception as e:
-                            logger.warning(
-                                f"visibility_predicate for tool '{tool_name}' raised {e}; treating as not visible (fail-closed)"
-                            )
-                            continue
-
-                    # Filter by permissions when we have context
-                    if peer_id and evaluator:
-                        try:
-                            decision = evaluator.evaluate_permission(
-                                actor.id,
-                                peer_id,
-                                PermissionType.TOOLS,
-                                tool_name,
-                                operation="use",
-                            )
-                            if decision != PermissionResult.ALLOWED:
-                                logger.debug(
-                                    f"Tool '{tool_name}' filtered out for peer {peer_id} (actor {actor.id})"
-                                )
-                                continue
-                        except Exception as e:
-                            logger.warning(
-                                f"Error evaluating tool permission for '{tool_name}': {e}"
-                            )
-                            # Fail-open on evaluation errors to avoid hard lockouts
-
-                    # Description precedence (most specific wins):
-                    #   1. description_predicate(actor) — per-actor override.
-                    #      Used by feature-flagged tools to keep feature names out
-                    #      of descriptions for actors without the feature.
-                    #   2. client_descriptions[client_type] — per-client override.
-                    #   3. metadata["description"] — static base description.
-                    description = None
-                    description_predicate = metadata.get("description_predicate")
-                    if description_predicate is not None:
-                        try:
-                            override = description_predicate(actor)
-                            if override is not None:
-                                description = override
-                        except Exception as e:
-                            logger.warning(
-                                f"description_predicate for tool '{tool_name}' raised {e}; falling back to static description"
-                            )
+            permitted.append(descriptor)
 
-                    if description is None:
-                        client_descriptions = metadata.get("client_descriptions", {})
-                        if client_type and client_type in client_descriptions:
-                            description = client_descriptions[client_type]
-                        else:
-                            description = (
-                                metadata.get("description")
-                                or f"Execute {action_name} action"
-                            )
+        result = tuple(permitted)
+        if cacheable and complete:
+            _listing_cache.put(key, result, if_generation=generation_at_read)
+        return result
 
-                    tool_def = {
-                        "name": tool_name,
-                        "description": description,
-                    }
+    def _catalog(self) -> Any:
+        """Precomputed MCP descriptors for this handler's hook registry."""
+        from ..mcp.catalog import get_catalog
 
-                    title = metadata.get("title")
-                    if title:
-                        tool_def["title"] = title
+        return get_catalog(self.hooks)
 
-                    input_schema = metadata.get("input_schema")
-                    if input_schema:
-                        tool_def["inputSchema"] = input_schema
+    def _list_context(self, actor: Any, list_name: str) -> tuple[str | None, Any]:
+        """``(peer_id, evaluator)`` for a ``*/list`` handler.
 
-                    output_schema = metadata.get("output_schema")
-                    if output_schema:
-                        tool_def["outputSchema"] = output_schema
-                    else:
-                        _warn_hook_output_schema_not_advertised_once(hook, tool_name)
+        ``peer_id`` is ``None`` when the listing must fail closed. The
+        evaluator is ``None`` when the permission system is unavailable, in
+        which case listings fail open.
+        """
+        # No trust relationship resolved for this client -> fail-closed: an
+        # empty list, not every entry. Evaluated before the fail-open
+        # evaluator try/except below, so an unrelated exception there cannot
+        # revert this to "show everything".
+        peer_id = self._peer_id_for_list(actor, list_name)
+        if not peer_id:
+            return None, None
 
-                    # Add annotations if present (for ChatGPT safety evaluation)
-                    annotations = metadata.get("annotations")
-                    if annotations:
-                        tool_def["annotations"] = annotations
+        from ..permission_evaluator import get_permission_evaluator
 
-                    tools.append(tool_def)
+        try:
+            return peer_id, get_permission_evaluator(self.config)
+        except Exception as e:
+            logger.debug(f"Permission evaluator unavailable during {list_name}: {e}")
+            return peer_id, None
 
-        # Apply client-specific formatting for tools/list response
-        tools_result = {"tools": tools}
+    def _handle_tools_list(
+        self, request_id: Any, actor: Any, cache_only: bool = False
+    ) -> dict[str, Any]:
+        """Handle MCP tools/list request with permission filtering and client filtering."""
+        tools = []
 
-        # Get client info from trust relationship to determine formatting
-        try:
-            from ..runtime_context import get_client_info_from_context
+        if self.hooks:
+            from ..permission_evaluator import PermissionType
 
-            client_info = get_client_info_from_context(actor)
+            peer_id, evaluator = self._list_context(actor, "tools/list")
+            if not peer_id:
+                return {"jsonrpc": "2.0", "id": request_id, "result": {"tools": []}}
 
-            # Fallback: Check global client info cache if trust relationship doesn't have client info yet
-            if not client_info:
-                session_key = self._get_session_key()
-                if session_key in _mcp_client_info_cache:
-                    cached_info = _mcp_client_info_cache[session_key]
-                    if cached_info and "client_info" in cached_info:
-                        fallback_client_info = cached_info["client_info"]
-                        if fallback_client_info.get("name"):
-                            client_info = {
-                                "name": fallback_client_info["name"],
-                                "version": fallback_client_info.get("version", ""),
-                                "platform": "",
-                                "type": "mcp",
-                            }
+            client_type = self._detect_client_type(actor)
+            permitted = self._permitted_descriptors(
+                self._catalog().tools,
+                actor,
+                peer_id,
+                evaluator,
+                PermissionType.TOOLS,
+                "use",
+                client_type=client_type,
+                cache_only=cache_only,
+            )
+            if cache_only and any(
+                descriptor.metadata.get("visibility_predicate") is not None
+                or descriptor.metadata.get("description_predicate") is not None
+                for descriptor in permitted
+            ):
+                # App predicates may read storage or the network
+                raise _ListingNotCached(PermissionType.TOOLS.value)
+
+            for descriptor in permitted:
+                metadata = descriptor.metadata
+                tool_name = descriptor.target
+
+                # Filter by visibility_predicate (per-actor gating)
+                visibility_predicate = metadata.get("visibility_predicate")
+                if visibility_predicate is not None:
+                    try:
+                        if not visibility_predicate(actor):
                             logger.debug(
-                                f"Using fallback client info from cache: {client_info}"
+                                f"Tool '{tool_name}' filtered out by visibility_predicate for actor {getattr(actor, 'id', '?')}"
                             )
+                            continue
+                    except Exception as e:
+                        logger.warning(
+                            f"visibility_predicate for tool '{tool_name}' raised {e}; treating as not visible (fail-closed)"
+                        )
+                        continue
 
-            if client_info and client_info.get("name"):
-                client_name = client_info["name"].lower()
+                # Description precedence (most specific wins):
+                #   1. description_predicate(actor) — per-actor override.
+                #      Used by feature-flagged tools to keep feature names out
+                #      of descriptions for actors without the feature.
+                #   2. client_descriptions[client_type] — per-client override.
+                #   3. metadata["description"] — static base description,
+                #      already in the precomputed definition.
+                description = None
+                description_predicate = metadata.get("description_predicate")
+                if description_predicate is not None:
+                    try:
+                        description = description_predicate(actor)
+                    except Exception as e:
+                        logger.warning(
+                            f"description_predicate for tool '{tool_name}' raised {e}; falling back to static description"
+                        )
 
-                # Apply ChatGPT-specific formatting if needed
-                if any(
-                    pattern in client_name for pattern in ["openai", "chatgpt", "gpt"]
-                ):
-                    # ChatGPT MCP specification requires direct JSON structure for tools/list (not JSON-encoded text)
-                    logger.debug(
-                        f"Applying ChatGPT formatting for tools/list: {len(tools)} tools (client: {client_name})"
+                if description is None:
+                    client_descriptions = metadata.get("client_descriptions") or {}
+                    description = client_descriptions.get(client_type)
+
+                tool_def = dict(descriptor.definition)
+                if description is not None:
+                    tool_def["description"] = description
+
+                if "outputSchema" not in tool_def:
+                    _warn_hook_output_schema_not_advertised_once(
+                        descriptor.hook, tool_name
                     )
-                    return {"jsonrpc": "2.0", "id": request_id, "result": tools_result}
-        except Exception as e:
-            logger.debug(
-                f"Could not apply client-specific formatting for tools/list: {e}"
-            )
-            # Fall back to standard formatting
 
-        return {"jsonrpc": "2.0", "id": request_id, "result": tools_result}
+                tools.append(tool_def)
+
+            if client_type == "chatgpt":
+                # ChatGPT MCP specification requires direct JSON structure for
+                # tools/list (not JSON-encoded text), which is what every
+                # client gets.
+                logger.debug(
+                    f"Applying ChatGPT formatting for tools/list: {len(tools)} tools"
+                )
 
-    def _handle_resources_list(self, request_id: Any, actor: Any) -> dict[str, Any]:
+        return {"jsonrpc": "2.0", "id": request_id, "result": {"tools": tools}}
+
+    def _handle_resources_list(
+        self, request_id: Any, actor: Any, cache_only: bool = False
+    ) -> dict[str, Any]:
         """Handle MCP resources/list request with permission filtering."""
         resources = []
 
         if self.hooks:
-            from ..mcp.decorators import get_mcp_metadata, is_mcp_exposed
-            from ..permission_evaluator import (
-                PermissionResult,
-                PermissionType,
-                get_permission_evaluator,
-            )
+            from ..permission_evaluator import PermissionType
 
-            # No trust relationship resolved for this client -> fail-closed:
-            # an empty list, evaluated before the fail-open evaluator
-            # try/except below.
-            peer_id = self._peer_id_for_list(actor, "resources/list")
+            peer_id, evaluator = self._list_context(actor, "resources/list")
             if not peer_id:
                 return {
                     "jsonrpc": "2.0",
@@ -1121,133 +1040,42 @@ class MCPHandler(BaseHandler):
                     "result": {"resources": []},
                 }
 
-            evaluator = None
-            try:
-                evaluator = get_permission_evaluator(self.config)
-            except Exception as e:
-                logger.debug(
-                    f"Permission evaluator unavailable during resources/list: {e}"
-                )
-                evaluator = None
-
-            # Discover MCP resources from method hooks
-            for method_name, hooks in self.hooks._method_hooks.items():
-                for hook in hooks:
-                    if not is_mcp_exposed(hook):
-                        continue
-                    metadata = get_mcp_metadata(hook)
-                    if not (metadata and metadata.get("type") == "resource"):
-                        continue
-
-                    # Decorator stores 'uri_template'; fall back to actingweb://{method_name}
-                    uri_template = (
-                        metadata.get("uri_template") or f"actingweb://{method_name}"
-                    )
-
-                    # Filter by permissions when available
-                    if peer_id and evaluator:
-                        try:
-                            decision = evaluator.evaluate_permission(
-                                actor.id,
-                                peer_id,
-                                PermissionType.RESOURCES,
-                                uri_template,
-                                operation="read",
-                            )
-                            if decision != PermissionResult.ALLOWED:
-                                logger.debug(
-                                    f"Resource '{uri_template}' filtered out for peer {peer_id} (actor {actor.id})"
-                                )
-                                continue
-                        except Exception as e:
-                            logger.warning(
-                                f"Error evaluating resource permission for '{uri_template}': {e}"
-                            )
-
-                    resource_def = {
-                        "uri": uri_template,
-                        "name": metadata.get("name")
-                        or method_name.replace("_", " ").title(),
-                        "description": metadata.get("description")
-                        or f"Access {method_name} resource",
-                        # Output key follows MCP spec; decorator uses 'mime_type'
-                        "mimeType": metadata.get("mime_type", "application/json"),
-                    }
-                    resources.append(resource_def)
+            permitted = self._permitted_descriptors(
+                self._catalog().resources,
+                actor,
+                peer_id,
+                evaluator,
+                PermissionType.RESOURCES,
+                "read",
+                cache_only=cache_only,
+            )
+            resources = [dict(descriptor.definition) for descriptor in permitted]
 
         return {"jsonrpc": "2.0", "id": request_id, "result": {"resources": resources}}
 
-    def _handle_prompts_list(self, request_id: Any, actor: Any) -> dict[str, Any]:
+    def _handle_prompts_list(
+        self, request_id: Any, actor: Any, cache_only: bool = False
+    ) -> dict[str, Any]:
         """Handle MCP prompts/list request with permission filtering."""
         prompts = []
 
         if self.hooks:
-            from ..mcp.decorators import get_mcp_metadata, is_mcp_exposed
-            from ..permission_evaluator import (
-                PermissionResult,
-                PermissionType,
-                get_permission_evaluator,
-            )
+            from ..permission_evaluator import PermissionType
 
-            # No trust relationship resolved for this client -> fail-closed:
-            # an empty list, evaluated before the fail-open evaluator
-            # try/except below.
-            peer_id = self._peer_id_for_list(actor, "prompts/list")
+            peer_id, evaluator = self._list_context(actor, "prompts/list")
             if not peer_id:
                 return {"jsonrpc": "2.0", "id": request_id, "result": {"prompts": []}}
 
-            evaluator = None
-            try:
-                evaluator = get_permission_evaluator(self.config)
-            except Exception as e:
-                logger.debug(
-                    f"Permission evaluator unavailable during prompts/list: {e}"
-                )
-                evaluator = None
-
-            # Discover MCP prompts from method hooks
-            for method_name, hooks in self.hooks._method_hooks.items():
-                for hook in hooks:
-                    if not is_mcp_exposed(hook):
-                        continue
-                    metadata = get_mcp_metadata(hook)
-                    if not (metadata and metadata.get("type") == "prompt"):
-                        continue
-
-                    prompt_name = metadata.get("name") or method_name
-
-                    # Filter by permissions when available
-                    if peer_id and evaluator:
-                        try:
-                            decision = evaluator.evaluate_permission(
-                                actor.id,
-                                peer_id,
-                                PermissionType.PROMPTS,
-                                prompt_name,
-                                operation="invoke",
-                            )
-                            if decision != PermissionResult.ALLOWED:
-                                logger.debug(
-                                    f"Prompt '{prompt_name}' filtered out for peer {peer_id} (actor {actor.id})"
-                                )
-                                continue
-                        except Exception as e:
-                            logger.warning(
-                                f"Error evaluating prompt permission for '{prompt_name}': {e}"
-                            )
-
-                    prompt_def = {
-                        "name": prompt_name,
-                        "description": metadata.get("description")
-                        or f"Generate prompt for {method_name}",
-                    }
-
-                    # Add arguments if provided
-                    arguments = metadata.get("arguments")
-                    if arguments:
-                        prompt_def["arguments"] = arguments
-
-                    prompts.append(prompt_def)
+            permitted = self._permitted_descriptors(
+                self._catalog().prompts,
+                actor,
+                peer_id,
+                evaluator,
+                PermissionType.PROMPTS,
+                "invoke",
+                cache_only=cache_only,
+            )
+            prompts = [dict(descriptor.definition) for descriptor in permitted]
 
         return {"jsonrpc": "2.0", "id": request_id, "result": {"prompts": prompts}}
 
@@ -1550,7 +1378,9 @@ class MCPHandler(BaseHandler):
                                             }
                                         else:
                                             # Convert dict to JSON content
-                                            content_text = json.dumps(result, indent=2)
+                                            content_text = json_codec.dumps(
+                                                result, indent=2
+                                            )
                                     else:
                                         # Convert other types to string
                                         content_text = str(result)
@@ -1785,21 +1615,8 @@ class MCPHandler(BaseHandler):
             return None
         return MCPHandler.get_stored_client_info(session_key)
 
-    def authenticate_and_get_actor_cached(self) -> Any:
-        """
-        Optimized authenticate request and get actor with caching.
-
-        This method provides authentication with intelligent caching:
-        1. Token validation results are cached for 5 minutes
-        2. Actor instances are cached to avoid repeated DynamoDB loads
-        3. Trust relationship lookups are cached per (actor, client) pair
-        4. Automatic cache cleanup removes expired entries
-
-        Cache keys: token validation is keyed by token, actors by actor ID,
-        and trust relationships by the (actor_id, client_id) tuple, providing
-        significant performance improvements for repeated requests from the
-        same clients.
-        """
+    def _bearer_token_for_cached_auth(self) -> str | None:
+        """The request's bearer token, after the periodic cache sweep."""
         # Clean up expired cache entries periodically. A racing double-run of
         # this check across concurrent worker threads is harmless (cleanup is
         # idempotent), so the deadline is read/written without a lock.
@@ -1814,83 +1631,120 @@ class MCPHandler(BaseHandler):
             logger.debug("No Bearer token found in Authorization header")
             return None
 
-        bearer_token = auth_header[7:]  # Remove "Bearer " prefix
-        current_time = time.time()
-
-        # Check token cache first
-        if bearer_token in _token_cache:
-            cached_data = _token_cache[bearer_token]
-            if current_time - cached_data.get("cached_at", 0) < _cache_ttl:
-                _cache_stats["token_hits"] += 1
-                actor_id = cached_data["actor_id"]
-                client_id = cached_data["client_id"]
-                token_data = cached_data["token_data"]
-
-                # Check actor cache
-                if actor_id in _actor_cache:
-                    cached_actor_data = _actor_cache[actor_id]
-                    if (
-                        current_time - cached_actor_data.get("last_accessed", 0)
-                        < _cache_ttl
-                    ):
-                        _cache_stats["actor_hits"] += 1
-                        # Update last accessed time
-                        cached_actor_data["last_accessed"] = current_time
-                        actor_interface = cached_actor_data["actor"]
-
-                        # Refresh trust context from cache or lookup, keyed
-                        # per (actor, client) pair so one client's trust can
-                        # never serve another client on the same actor. A hit
-                        # may carry trust=None (cached negative), which must
-                        # still yield an empty peer_id below.
-                        trust_key = _trust_cache_key(actor_id, client_id)
-                        trust_hit, trust_relationship = _trust_cache_get(trust_key)
-                        if trust_hit:
-                            _cache_stats["trust_hits"] += 1
-                        else:
-                            _cache_stats["trust_misses"] += 1
-                            trust_relationship = self._lookup_mcp_trust_relationship(
-                                actor_interface, client_id, token_data
-                            )
-                            _trust_cache_put(trust_key, trust_relationship)
-                        self._check_trust_client_invariant(
-                            actor_id, client_id, trust_relationship
-                        )
+        return auth_header[7:]  # Remove "Bearer " prefix
 
-                        # Update runtime context with MCP authentication info
-                        runtime_context = RuntimeContext(actor_interface)
-                        runtime_context.set_mcp_context(
-                            client_id=client_id,
-                            trust_relationship=trust_relationship,
-                            peer_id=trust_relationship.peerid
-                            if trust_relationship
-                            else "",
-                            token_data=token_data,
-                            transport_session_id=self._resolve_transport_session_id(),
-                            client_info=self._resolve_live_client_info(),
-                        )
+    def _authenticate_from_cache(
+        self, bearer_token: str, allow_io: bool = True
+    ) -> tuple[bool, Any]:
+        """Serve authentication from the token and actor caches.
 
-                        # Log cache performance periodically
-                        total_requests = sum(_cache_stats.values())
-                        if (
-                            total_requests > 0 and total_requests % 10 == 0
-                        ):  # Every 10 requests
-                            logger.debug(
-                                f"MCP cache stats - Token hits: {_cache_stats['token_hits']}, Actor hits: {_cache_stats['actor_hits']}, Trust hits: {_cache_stats['trust_hits']}"
-                            )
+        Returns ``(True, actor)`` when the request was resolved here and
+        ``(False, None)`` when the caller must run the full flow. With
+        ``allow_io=False`` a trust-cache miss is also reported as unresolved
+        instead of being looked up, so the call never touches storage -- what
+        lets ``AsyncMCPHandler`` answer warm requests on the event loop.
+        """
+        cached = self._cached_token_and_actor(bearer_token)
+        if cached is None:
+            return False, None
+        return self._authenticate_cached(*cached, allow_io=allow_io)
+
+    def _cached_token_and_actor(
+        self, bearer_token: str
+    ) -> tuple[dict[str, Any], Any] | None:
+        """The token's cached validation and actor, or None on a miss of
+        either (then the full flow in ``_authenticate_uncached`` applies)."""
+        token_hit, cached_data = _token_cache.lookup(bearer_token)
+        if not token_hit:
+            return None
 
-                        # Serving cached MCP authentication (no logging needed for routine operation)
-                        return actor_interface
-                    else:
-                        _cache_stats["actor_misses"] += 1
-                else:
-                    _cache_stats["actor_misses"] += 1
-            else:
-                _cache_stats["token_misses"] += 1
-        else:
-            _cache_stats["token_misses"] += 1
+        # Check actor cache
+        actor_hit, cached_actor_data = _actor_cache.lookup(cached_data["actor_id"])
+        if not (actor_hit and cached_actor_data.get("config") is self.config):
+            return None
+        return cached_data, cached_actor_data["actor"]
+
+    def _authenticate_cached(
+        self, cached_data: dict[str, Any], actor_interface: Any, allow_io: bool = True
+    ) -> tuple[bool, Any]:
+        """Finish :meth:`_authenticate_from_cache` for a cached token and actor:
+        resolve the trust relationship and set the MCP runtime context."""
+        actor_id = cached_data["actor_id"]
+        client_id = cached_data["client_id"]
+        token_data = cached_data["token_data"]
+
+        # Refresh trust context from cache or lookup, keyed per (actor,
+        # client) pair so one client's trust can never serve another client
+        # on the same actor. A hit may carry trust=None (cached negative),
+        # which must still yield an empty peer_id below.
+        trust_key = _trust_cache_key(actor_id, client_id)
+        trust_hit, trust_relationship = _trust_cache_get(trust_key)
+        if not trust_hit:
+            if not allow_io:
+                return False, None
+            generation_at_read = _current_cache_generation()
+            trust_relationship = self._lookup_mcp_trust_relationship(
+                actor_interface, client_id, token_data
+            )
+            _trust_cache_put(trust_key, trust_relationship, generation_at_read)
+        self._check_trust_client_invariant(actor_id, client_id, trust_relationship)
+
+        # Update runtime context with MCP authentication info
+        runtime_context = RuntimeContext(actor_interface)
+        runtime_context.set_mcp_context(
+            client_id=client_id,
+            trust_relationship=trust_relationship,
+            peer_id=trust_relationship.peerid if trust_relationship else "",
+            token_data=token_data,
+            transport_session_id=self._resolve_transport_session_id(),
+            client_info=self._resolve_live_client_info(),
+        )
+
+        # Log cache performance periodically
+        if _token_cache.hits % 100 == 0:
+            logger.debug(
+                "MCP cache stats - %s",
+                [c.stats() for c in (_token_cache, _actor_cache, _trust_cache)],
+            )
 
-        # Cache miss - perform full authentication flow
+        # Serving cached MCP authentication (no logging needed for routine operation)
+        return True, actor_interface
+
+    def authenticate_and_get_actor_cached(self) -> Any:
+        """
+        Optimized authenticate request and get actor with caching.
+
+        This method provides authentication with intelligent caching:
+        1. Token validation results are cached for 5 minutes
+        2. Actor instances are cached to avoid repeated DynamoDB loads
+        3. Trust relationship lookups are cached per (actor, client) pair
+        4. Automatic cache cleanup removes expired entries
+
+        Cache keys: token validation is keyed by token, actors by actor ID,
+        and trust relationships by the (actor_id, client_id) tuple, providing
+        significant performance improvements for repeated requests from the
+        same clients.
+        """
+        if self._auth_cache_miss is not None:
+            # The caches were already consulted (AsyncMCPHandler)
+            bearer_token, cached = self._auth_cache_miss
+            self._auth_cache_miss = None
+            if cached is not None:
+                return self._authenticate_cached(*cached)[1]
+            return self._authenticate_uncached(bearer_token)
+
+        token = self._bearer_token_for_cached_auth()
+        if not token:
+            return None
+
+        resolved, actor_interface = self._authenticate_from_cache(token)
+        if resolved:
+            return actor_interface
+        return self._authenticate_uncached(token)
+
+    def _authenticate_uncached(self, bearer_token: str) -> Any:
+        """The full authentication flow after a token or actor cache miss:
+        validate the token, load the actor and its trust, and cache them."""
         try:
             from ..oauth2_server.oauth2_server import get_actingweb_oauth2_server
 
@@ -1910,17 +1764,19 @@ class MCPHandler(BaseHandler):
             actor_id, client_id, token_data = token_validation
 
             # Cache token validation result
-            if _cache_fill_still_valid(generation_at_read):
-                _token_cache[bearer_token] = {
+            _token_cache.put(
+                bearer_token,
+                {
                     "actor_id": actor_id,
                     "client_id": client_id,
                     "token_data": token_data,
-                    "cached_at": current_time,
-                }
+                },
+                if_generation=generation_at_read,
+            )
 
             # Get or create actor (with caching)
             actor_interface = self._get_or_create_actor_cached(
-                actor_id, token_data, current_time, generation_at_read
+                actor_id, token_data, generation_at_read
             )
             if not actor_interface:
                 return None
@@ -1929,10 +1785,11 @@ class MCPHandler(BaseHandler):
             trust_relationship = self._lookup_mcp_trust_relationship(
                 actor_interface, client_id, token_data
             )
-            if _cache_fill_still_valid(generation_at_read):
-                _trust_cache_put(
-                    _trust_cache_key(actor_id, client_id), trust_relationship
-                )
+            _trust_cache_put(
+                _trust_cache_key(actor_id, client_id),
+                trust_relationship,
+                generation_at_read,
+            )
             self._check_trust_client_invariant(actor_id, client_id, trust_relationship)
 
             # Mark client as peer_approved on successful authentication (if not already)
@@ -1964,7 +1821,6 @@ class MCPHandler(BaseHandler):
         self,
         actor_id: str,
         token_data: dict[str, Any],
-        current_time: float,
         generation_at_read: int | None = None,
     ) -> ActorInterface | None:
         """Get or create actor with caching."""
@@ -1975,14 +1831,9 @@ class MCPHandler(BaseHandler):
         # notably the shared "_actingweb_oauth2" system actor -- would
         # otherwise be served an ActorInterface wrapping the other app's
         # config, and therefore that app's database backend.
-        if actor_id in _actor_cache:
-            cached_data = _actor_cache[actor_id]
-            if (
-                current_time - cached_data.get("last_accessed", 0) < _cache_ttl
-                and cached_data.get("config") is self.config
-            ):
-                cached_data["last_accessed"] = current_time
-                return cached_data["actor"]
+        hit, cached_data = _actor_cache.lookup(actor_id)
+        if hit and cached_data.get("config") is self.config:
+            return cached_data["actor"]
 
         # Cache miss - create/load actor
         from .. import actor as actor_module
@@ -2031,13 +1882,15 @@ class MCPHandler(BaseHandler):
         )
 
         # Cache the actor, unless a revocation landed while we were loading it.
-        if _cache_fill_still_valid(generation_at_read):
-            _actor_cache[actor_id] = {
+        _actor_cache.put(
+            actor_id,
+            {
                 "actor": actor_interface,
-                "last_accessed": current_time,
                 # Which application's config built this wrapper -- see above.
                 "config": self.config,
-            }
+            },
+            if_generation=generation_at_read,
+        )
 
         return actor_interface
 
@@ -2443,24 +2296,12 @@ class MCPHandler(BaseHandler):
 
     def _store_mcp_client_info_temporarily(self, client_info: dict[str, Any]) -> None:
         """Store MCP client info temporarily until OAuth2 authentication completes."""
-        global _mcp_client_info_cache
 
-        # Use client IP and user agent as session key
+        # Use client IP and user agent as session key. Entries expire after
+        # ten minutes; the cache's size bound keeps a flood of distinct
+        # session ids from growing it without limit.
         session_key = self._get_session_key()
-        _mcp_client_info_cache[session_key] = {
-            "client_info": client_info,
-            "timestamp": time.time(),
-        }
-
-        # Clean up old entries (older than 10 minutes)
-        current_time = time.time()
-        expired_keys = [
-            key
-            for key, data in _mcp_client_info_cache.items()
-            if current_time - data["timestamp"] > 600
-        ]
-        for key in expired_keys:
-            del _mcp_client_info_cache[key]
+        _mcp_client_info_cache.put(session_key, client_info)
 
     def _get_session_key(self) -> str:
         """Generate a session key for the in-memory client_info cache.
@@ -2500,14 +2341,8 @@ class MCPHandler(BaseHandler):
     @classmethod
     def get_stored_client_info(cls, session_key: str) -> dict[str, Any] | None:
         """Retrieve stored client info for a session key."""
-        global _mcp_client_info_cache
-        if session_key in _mcp_client_info_cache:
-            data = _mcp_client_info_cache[session_key]
-            if time.time() - data["timestamp"] < 600:  # 10 minutes
-                return data["client_info"]
-            else:
-                del _mcp_client_info_cache[session_key]
-        return None
+        hit, client_info = _mcp_client_info_cache.lookup(session_key)
+        return client_info if hit else None
 
     @classmethod
     def clear_token_from_cache(cls, token: str) -> bool:
@@ -2523,33 +2358,26 @@ class MCPHandler(BaseHandler):
         Returns:
             True if token was found and removed, False if not found in cache
         """
-        global _token_cache, _actor_cache, _trust_cache
-
-        token_found = False
-
-        # Remove token from cache
-        if token in _token_cache:
-            # Get actor_id before removing token data to clean associated caches
-            cached_data = _token_cache[token]
-            actor_id = cached_data.get("actor_id")
-
-            del _token_cache[token]
-            token_found = True
-
-            # Also clear associated actor and trust caches to force
-            # re-authentication. Actor-wide by design: evicting the shared
-            # actor wrapper already affects every client on the actor, so
-            # every (actor, client) trust entry goes with it. Delegated rather
-            # than repeated, so the two cannot drift.
-            if actor_id:
-                evict_mcp_caches_for_actor(actor_id)
-        else:
+        # The raw entry, expired or not: a logout must still clear the actor's
+        # other entries even when this token's own entry has lapsed.
+        entry = _token_cache.entry(token)
+        if entry is None:
             # Nothing cached under this token, but a revocation still happened;
             # bump so an in-flight authentication cannot cache what it read
             # just before it.
-            _bump_cache_generation()
+            _cache_generation.bump()
+            return False
 
-        return token_found
+        _token_cache.invalidate(token)
+        # Also clear associated actor and trust caches to force
+        # re-authentication. Actor-wide by design: evicting the shared actor
+        # wrapper already affects every client on the actor, so every
+        # (actor, client) trust entry goes with it. Delegated rather than
+        # repeated, so the two cannot drift.
+        actor_id = entry.group
+        if actor_id:
+            evict_mcp_caches_for_actor(str(actor_id))
+        return True
 
     def _mark_client_peer_approved(
         self, actor_interface, client_id: str, trust_relationship
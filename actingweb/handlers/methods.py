@@ -5,11 +5,10 @@ Methods are RPC-style functions that actors can expose. They support JSON-RPC
 protocol for structured method calls.
 """
 
-import json
 import logging
 from typing import Any
 
-from actingweb import auth
+from actingweb import auth, json_codec
 from actingweb.handlers import base_handler
 
 from ..permission_evaluator import (
@@ -159,7 +158,7 @@ class MethodsHandler(base_handler.BaseHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(result))
+                self.response.write(json_codec.dumps(result))
         else:
             if self.response:
                 self.response.set_status(404, "Not found")
@@ -201,7 +200,7 @@ class MethodsHandler(base_handler.BaseHandler):
                 body_str = body.decode("utf-8", "ignore")
             else:
                 body_str = body
-            params = json.loads(body_str)
+            params = json_codec.loads(body_str)
         except (TypeError, ValueError, KeyError):
             if self.response:
                 self.response.set_status(400, "Error in json body")
@@ -228,7 +227,7 @@ class MethodsHandler(base_handler.BaseHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(result))
+                self.response.write(json_codec.dumps(result))
         else:
             if self.response:
                 self.response.set_status(400, "Processing error")
@@ -14,6 +14,7 @@ import time
 from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import urlparse
 
+from .. import json_codec
 from .base_handler import BaseHandler
 from .oauth2_utils import normalize_user_info
 
@@ -30,7 +31,7 @@ def _decode_state_with_extras(state: str) -> dict[str, Any]:
     if not state or not state.strip().startswith("{"):
         return {}
     try:
-        result = json.loads(state)
+        result = json_codec.loads(state)
         if isinstance(result, dict):
             return result
         return {}
@@ -766,7 +767,7 @@ class OAuth2CallbackHandler(BaseHandler):
                 del response_data["refresh_token"]
 
             if self.response:
-                self.response.write(json.dumps(response_data))
+                self.response.write(json_codec.dumps(response_data))
                 self.response.headers["Content-Type"] = "application/json"
                 self.response.set_status(200)
 
@@ -874,7 +875,7 @@ class OAuth2CallbackHandler(BaseHandler):
         if not payload or user_info is None:
             return user_info
         try:
-            data = json.loads(payload) if isinstance(payload, str) else payload
+            data = json_codec.loads(payload) if isinstance(payload, str) else payload
         except (json.JSONDecodeError, TypeError):
             return user_info
         if not isinstance(data, dict):
@@ -1417,7 +1418,7 @@ class OAuth2AppleCallbackHandler(OAuth2CallbackHandler):
             return self.error_response(400, "Missing authorization code")
 
         self._pending_apple_user_json = user_json or None
-        state_json = json.dumps(payload)
+        state_json = json_codec.dumps(payload)
         new_params = {"code": code, "state": state_json}
         if id_token:
             new_params["id_token"] = id_token
@@ -23,8 +23,7 @@ import json
 import logging
 from typing import TYPE_CHECKING, Any, Optional
 
-# MCP protocol version constants (single source of truth)
-from ..mcp.protocol import LATEST_PROTOCOL_VERSION, SUPPORTED_PROTOCOL_VERSIONS
+from .. import discovery, json_codec
 from .base_handler import BaseHandler
 
 if TYPE_CHECKING:
@@ -165,7 +164,7 @@ class OAuth2EndpointsHandler(BaseHandler):
                 body_str = str(body)
 
             try:
-                registration_data = json.loads(body_str)
+                registration_data = json_codec.loads(body_str)
             except json.JSONDecodeError:
                 return self.error_response(400, "Invalid JSON in request body")
 
@@ -753,16 +752,7 @@ class OAuth2EndpointsHandler(BaseHandler):
             "Authorization, Content-Type, mcp-protocol-version"
         )
 
-        base_url = f"{self.config.proto}{self.config.fqdn}"
-
-        return {
-            "resource": f"{base_url}/mcp",
-            "authorization_servers": [base_url],
-            "scopes_supported": ["mcp"],
-            "bearer_methods_supported": ["header"],
-            "resource_documentation": f"{base_url}/mcp/info",
-            "resource_policy_uri": f"{base_url}",
-        }
+        return discovery.protected_resource_metadata(self.config)
 
     def _handle_protected_resource_mcp_discovery(self) -> dict[str, Any]:
         """
@@ -778,24 +768,7 @@ class OAuth2EndpointsHandler(BaseHandler):
             "Authorization, Content-Type, mcp-protocol-version"
         )
 
-        base_url = f"{self.config.proto}{self.config.fqdn}"
-
-        return {
-            "resource": f"{base_url}/mcp",
-            "authorization_servers": [base_url],
-            "scopes_supported": ["mcp"],
-            "bearer_methods_supported": ["header"],
-            "resource_documentation": f"{base_url}/mcp/info",
-            "resource_policy_uri": f"{base_url}",
-            "mcp_version": LATEST_PROTOCOL_VERSION,
-            "supported_protocol_versions": SUPPORTED_PROTOCOL_VERSIONS,
-            "capabilities": {
-                "tools": True,
-                "prompts": True,
-                "resources": False,
-                "roots": False,
-            },
-        }
+        return discovery.mcp_protected_resource_metadata(self.config)
 
     def _handle_logout_request(self, method: str = "GET") -> dict[str, Any]:
         """
@@ -29,6 +29,7 @@ import time
 from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import urlparse
 
+from .. import json_codec
 from ..constants import SPA_REFRESH_TOKEN_REUSE_WINDOW
 from .base_handler import BaseHandler
 from .oauth2_utils import normalize_user_info
@@ -378,7 +379,7 @@ class OAuth2SPAHandler(BaseHandler):
             else:
                 body_str = str(body)
 
-            params = json.loads(body_str) if body_str else {}
+            params = json_codec.loads(body_str) if body_str else {}
         except json.JSONDecodeError:
             return self._json_error(400, "Invalid JSON in request body")
 
@@ -467,14 +468,14 @@ class OAuth2SPAHandler(BaseHandler):
             pkce_session_id = session_manager.store_session(
                 token_data={},
                 user_info={},
-                state=json.dumps(state_data),
+                state=json_codec.dumps(state_data),
                 provider=provider,
                 pkce_verifier=code_verifier,
             )
             state_data["pkce_session_id"] = pkce_session_id
 
         # Create authorization URL
-        state_json = json.dumps(state_data)
+        state_json = json_codec.dumps(state_data)
 
         # Apple uses response_mode=form_post (cross-site POST callback). A
         # cleartext-JSON state offers no CSRF protection there, so we store the
@@ -551,7 +552,7 @@ class OAuth2SPAHandler(BaseHandler):
             else:
                 body_str = str(body)
 
-            params = json.loads(body_str) if body_str else {}
+            params = json_codec.loads(body_str) if body_str else {}
         except json.JSONDecodeError:
             return self._json_error(400, "Invalid JSON in request body")
 
@@ -1409,7 +1410,7 @@ class OAuth2SPAHandler(BaseHandler):
             else:
                 body_str = str(body)
 
-            params = json.loads(body_str) if body_str else {}
+            params = json_codec.loads(body_str) if body_str else {}
         except json.JSONDecodeError:
             return self._json_error(400, "Invalid JSON in request body")
 
@@ -13,6 +13,7 @@ import logging
 import time
 from typing import TYPE_CHECKING, Any, Optional
 
+from .. import json_codec
 from .base_handler import BaseHandler
 
 if TYPE_CHECKING:
@@ -116,7 +117,7 @@ class OAuth2EmailHandler(BaseHandler):
                     "message": "Your email address has already been verified.",
                     "email": actor.store.email or actor.creator,
                 }
-                self.response.write(json.dumps(response_data))
+                self.response.write(json_codec.dumps(response_data))
                 self.response.headers["Content-Type"] = "application/json"
                 self.response.set_status(200)
                 return response_data
@@ -181,7 +182,7 @@ class OAuth2EmailHandler(BaseHandler):
                 "email": actor.creator,
                 "redirect_url": f"/{actor_id}/www",
             }
-            self.response.write(json.dumps(response_data))
+            self.response.write(json_codec.dumps(response_data))
             self.response.headers["Content-Type"] = "application/json"
             self.response.set_status(200)
             return response_data
@@ -246,7 +247,7 @@ class OAuth2EmailHandler(BaseHandler):
                 "verified_emails": verified_emails,
                 "has_verified_emails": bool(verified_emails),
             }
-            self.response.write(json.dumps(response_data))
+            self.response.write(json_codec.dumps(response_data))
             self.response.headers["Content-Type"] = "application/json"
             self.response.set_status(200)
             return response_data
@@ -283,7 +284,7 @@ class OAuth2EmailHandler(BaseHandler):
 
             # Try JSON first
             try:
-                params = json.loads(body_str) if body_str else {}
+                params = json_codec.loads(body_str) if body_str else {}
                 session_id = params.get("session", "")
                 email = params.get("email", "")
             except (json.JSONDecodeError, ValueError):
@@ -493,7 +494,7 @@ class OAuth2EmailHandler(BaseHandler):
                 response_data["access_token"] = actor_instance.store.oauth_token
                 response_data["token_type"] = "Bearer"
 
-            self.response.write(json.dumps(response_data))
+            self.response.write(json_codec.dumps(response_data))
             self.response.headers["Content-Type"] = "application/json"
             self.response.set_status(200)
             return response_data
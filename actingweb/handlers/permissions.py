@@ -4,10 +4,10 @@ Permission Query Handler for ActingWeb.
 Provides HTTP endpoint for querying permissions granted by the actor to peers.
 """
 
-import json
 import logging
 from typing import TYPE_CHECKING, Any
 
+from actingweb import json_codec
 from actingweb.handlers import base_handler
 from actingweb.trust_permissions import get_trust_permission_store
 from actingweb.trust_type_registry import get_registry
@@ -144,7 +144,7 @@ class PermissionsHandler(base_handler.BaseHandler):
             if self.response:
                 self.response.set_status(200, "OK")
                 self.response.headers["Content-Type"] = "application/json"
-                self.response.write(json.dumps(response_data))
+                self.response.write(json_codec.dumps(response_data))
 
         except Exception as e:
             logger.error(
@@ -1,8 +1,10 @@
 import copy
-import json
+import itertools
 import logging
+from collections.abc import Iterator
 from typing import Any
 
+from actingweb import json_codec, json_stream
 from actingweb.db import get_property_list
 from actingweb.handlers import base_handler
 from actingweb.property_list import ListCorruptionError, ListMetadataContentionError
@@ -60,7 +62,7 @@ def _write_list_corrupted_response(response: Any, name: str, error: Exception) -
         response.set_status(409, "List corrupted")
         response.headers["Content-Type"] = "application/json"
         response.write(
-            json.dumps(
+            json_codec.dumps(
                 {
                     "error": "list_corrupted",
                     "list": name,
@@ -90,7 +92,7 @@ def _write_list_metadata_contention_response(response: Any, error: Exception) ->
         response.headers["Content-Type"] = "application/json"
         response.headers["Retry-After"] = _LIST_METADATA_CONTENTION_RETRY_AFTER_SECONDS
         response.write(
-            json.dumps(
+            json_codec.dumps(
                 {
                     "error": "list_metadata_contended",
                     "detail": str(error),
@@ -234,22 +236,11 @@ class PropertiesHandler(base_handler.BaseHandler):
         if self.request.get("_method") == "DELETE":
             self.delete(actor_id, name)
             return
-        auth_result = self.authenticate_actor(actor_id, "properties", subpath=name)
-        if not auth_result.success:
-            return
-        myself = auth_result.actor
-        check = auth_result.auth_obj
-        if not name:
-            path = []
-        else:
-            path = name.split("/")
-            name = path[0]
-        # Use unified access control system for permission checking
-        property_path = "/".join(path) if path else ""
-        if not self._check_property_permission(actor_id, check, property_path, "read"):
-            if self.response:
-                self.response.set_status(403)
+        authorized = self._authorize_get(actor_id, name)
+        if authorized is None:
             return
+        myself, check, path = authorized
+        name = path[0] if path else ""
         # if name is not set, this request URI was the properties root
         if not name:
             self.listall(myself, check)
@@ -267,150 +258,178 @@ class PropertiesHandler(base_handler.BaseHandler):
         # both a simple property and a list, so a simple-property hit never
         # needs the extra list-existence read.
         lookup = myself.property[name] if myself and myself.property else None
+        if lookup is None and self._is_list_property(myself, name):
+            self._get_list_property(myself, check, name)
+            return
+        self._write_property(myself, check, name, path, lookup)
 
-        # Check if this is a list property
-        if (
-            lookup is None
-            and myself
+    def _authorize_get(
+        self, actor_id: str, name: str
+    ) -> tuple[Any, Any, list[str]] | None:
+        """Authenticate and authorize a GET.
+
+        Returns ``(actor, auth object, path)``, ``path`` being ``name`` split
+        on "/", or None after setting the error response.
+        """
+        auth_result = self.authenticate_actor(actor_id, "properties", subpath=name)
+        if not auth_result.success:
+            return None
+        path = name.split("/") if name else []
+        # Use unified access control system for permission checking
+        property_path = "/".join(path) if path else ""
+        if not self._check_property_permission(
+            actor_id, auth_result.auth_obj, property_path, "read"
+        ):
+            if self.response:
+                self.response.set_status(403)
+            return None
+        return auth_result.actor, auth_result.auth_obj, path
+
+    @staticmethod
+    def _is_list_property(myself: Any, name: str) -> bool:
+        return bool(
+            myself
             and hasattr(myself, "property_lists")
             and myself.property_lists is not None
             and myself.property_lists.exists(name)
-        ):
-            # This is a list property - handle format and index parameters
-            logger.info(f"Processing list property '{name}'")
-            index_param = (
-                self.request.get("index") or None
-            )  # Convert empty string to None
-            format_param = (
-                self.request.get("format") or None
-            )  # Convert empty string to None
+        )
 
-            try:
-                logger.info(f"Getting list property object for '{name}'")
-                list_prop = getattr(myself.property_lists, name)
-                logger.info(f"Got list_prop: {type(list_prop).__name__}")
-                logger.info(f"index_param={index_param}, format_param={format_param}")
+    def _get_list_property(self, myself: Any, check: Any, name: str) -> None:
+        """GET a list property, as a whole, short or one item (``index``)."""
+        # This is a list property - handle format and index parameters
+        logger.info(f"Processing list property '{name}'")
+        # Convert empty strings to None
+        index_param = self.request.get("index") or None
+        format_param = self.request.get("format") or None
 
-                if index_param is not None:
-                    logger.info(f"Handling index access for index={index_param}")
-                    # Get specific item by index
-                    try:
-                        index = int(index_param)
-                        item = list_prop[index]
+        try:
+            logger.info(f"Getting list property object for '{name}'")
+            list_prop = getattr(myself.property_lists, name)
+            logger.info(f"Got list_prop: {type(list_prop).__name__}")
+            logger.info(f"index_param={index_param}, format_param={format_param}")
+
+            if index_param is not None:
+                logger.info(f"Handling index access for index={index_param}")
+                # Get specific item by index
+                try:
+                    index = int(index_param)
+                    item = list_prop[index]
 
-                        # Execute property hook if available
-                        if self.hooks:
-                            actor_interface = self._get_actor_interface(myself)
-                            if actor_interface:
-                                hook_path = [str(index)]
-                                auth_context = self._create_auth_context(check, "read")
-                                transformed = self.hooks.execute_property_hooks(
-                                    name,
-                                    "get",
-                                    actor_interface,
-                                    item,
-                                    hook_path,
-                                    auth_context,
-                                )
-                                if transformed is not None:
-                                    item = transformed
-                                else:
-                                    if self.response:
-                                        self.response.set_status(404)
-                                    return
+                    # Execute property hook if available
+                    if self.hooks:
+                        actor_interface = self._get_actor_interface(myself)
+                        if actor_interface:
+                            hook_path = [str(index)]
+                            auth_context = self._create_auth_context(check, "read")
+                            transformed = self.hooks.execute_property_hooks(
+                                name,
+                                "get",
+                                actor_interface,
+                                item,
+                                hook_path,
+                                auth_context,
+                            )
+                            if transformed is not None:
+                                item = transformed
+                            else:
+                                if self.response:
+                                    self.response.set_status(404)
+                                return
 
-                        out = json.dumps(item)
-                    except ListCorruptionError:
-                        raise  # let the outer handler write the structured 409
-                    except (IndexError, ValueError):
-                        if self.response:
-                            self.response.set_status(404, "List item not found")
-                        return
+                    out = json_codec.dumps(item)
+                except ListCorruptionError:
+                    raise  # let the outer handler write the structured 409
+                except (IndexError, ValueError):
+                    if self.response:
+                        self.response.set_status(404, "List item not found")
+                    return
+            else:
+                logger.info(
+                    f"Handling list access (not index), format_param={format_param}"
+                )
+                # Determine response format
+                if format_param == "short":
+                    logger.info("Using short format")
+                    # Short format: return metadata only
+                    # This matches the format used in GET /properties?metadata=true
+                    metadata = {
+                        "_list": True,
+                        # Advisory under v2 (count_hint) -- avoids a
+                        # whole-list range query for a count-only
+                        # request. See ListProperty's class docstring
+                        # for the drift bound.
+                        "count": list_prop.get_metadata()["length"],
+                        "description": list_prop.get_description(),
+                        "explanation": list_prop.get_explanation(),
+                    }
+                    out = json_codec.dumps(metadata)
                 else:
-                    logger.info(
-                        f"Handling list access (not index), format_param={format_param}"
-                    )
-                    # Determine response format
-                    if format_param == "short":
-                        logger.info("Using short format")
-                        # Short format: return metadata only
-                        # This matches the format used in GET /properties?metadata=true
-                        metadata = {
-                            "_list": True,
-                            # Advisory under v2 (count_hint) -- avoids a
-                            # whole-list range query for a count-only
-                            # request. See ListProperty's class docstring
-                            # for the drift bound.
-                            "count": list_prop.get_metadata()["length"],
-                            "description": list_prop.get_description(),
-                            "explanation": list_prop.get_explanation(),
-                        }
-                        out = json.dumps(metadata)
-                    else:
-                        # Default (no format or format=full): return all items
-                        # This is the expected behavior for subscriptions
-                        all_items = list_prop.to_list()
+                    # Default (no format or format=full): return all items
+                    # This is the expected behavior for subscriptions
+                    all_items = list_prop.to_list()
 
-                        # Execute property hook if available
+                    # Execute property hook if available
+                    logger.info(f"Checking hooks: has_hooks={self.hooks is not None}")
+                    if self.hooks:
+                        actor_interface = self._get_actor_interface(myself)
                         logger.info(
-                            f"Checking hooks: has_hooks={self.hooks is not None}"
+                            f"Got actor_interface: {actor_interface is not None}"
                         )
-                        if self.hooks:
-                            actor_interface = self._get_actor_interface(myself)
+                        if actor_interface:
+                            hook_path = []
+                            auth_context = self._create_auth_context(check, "read")
                             logger.info(
-                                f"Got actor_interface: {actor_interface is not None}"
+                                f"Executing property hooks for '{name}', items count={len(all_items)}"
                             )
-                            if actor_interface:
-                                hook_path = []
-                                auth_context = self._create_auth_context(check, "read")
-                                logger.info(
-                                    f"Executing property hooks for '{name}', items count={len(all_items)}"
-                                )
-                                transformed = self.hooks.execute_property_hooks(
-                                    name,
-                                    "get",
-                                    actor_interface,
-                                    all_items,
-                                    hook_path,
-                                    auth_context,
-                                )
-                                logger.info(
-                                    f"Hook result: transformed is None? {transformed is None}"
+                            transformed = self.hooks.execute_property_hooks(
+                                name,
+                                "get",
+                                actor_interface,
+                                all_items,
+                                hook_path,
+                                auth_context,
+                            )
+                            logger.info(
+                                f"Hook result: transformed is None? {transformed is None}"
+                            )
+                            if transformed is not None:
+                                all_items = transformed
+                            else:
+                                logger.warning(
+                                    f"Property hook returned None for '{name}', returning 404"
                                 )
-                                if transformed is not None:
-                                    all_items = transformed
-                                else:
-                                    logger.warning(
-                                        f"Property hook returned None for '{name}', returning 404"
-                                    )
-                                    if self.response:
-                                        self.response.set_status(404)
-                                    return
+                                if self.response:
+                                    self.response.set_status(404)
+                                return
 
-                        out = json.dumps(all_items)
+                    out = json_codec.dumps(all_items)
 
-                if self.response:
-                    self.response.set_status(200, "Ok")
-                    self.response.headers["Content-Type"] = "application/json"
-                    self.response.write(out)
-                return
+            if self.response:
+                self.response.set_status(200, "Ok")
+                self.response.headers["Content-Type"] = "application/json"
+                self.response.write(out)
+            return
 
-            except ListCorruptionError as e:
-                self._respond_list_corrupted(name, e)
-                return
-            except Exception as e:
-                logger.error(f"Error accessing list property '{name}': {e}")
-                if self.response:
-                    self.response.set_status(500, "Error accessing list property")
-                return
+        except ListCorruptionError as e:
+            self._respond_list_corrupted(name, e)
+            return
+        except Exception as e:
+            logger.error(f"Error accessing list property '{name}': {e}")
+            if self.response:
+                self.response.set_status(500, "Error accessing list property")
+            return
 
-        # Regular property handling (lookup was fetched above)
+    def _write_property(
+        self, myself: Any, check: Any, name: str, path: list[str], lookup: Any
+    ) -> None:
+        """Write the stored value ``lookup`` of simple property ``name``, or
+        the part of it ``path`` selects, as the GET response."""
         if not lookup:
             if self.response:
                 self.response.set_status(404, "Property not found")
             return
         try:
-            jsonblob = json.loads(lookup)
+            jsonblob = json_codec.loads(lookup)
             try:
                 out = jsonblob
                 if len(path) > 1:
@@ -440,7 +459,7 @@ class PropertiesHandler(base_handler.BaseHandler):
                             if self.response:
                                 self.response.set_status(404)
                             return
-                out = json.dumps(out)
+                out = json_codec.dumps(out)
             except (TypeError, ValueError, KeyError):
                 if self.response:
                     self.response.set_status(404)
@@ -489,56 +508,33 @@ class PropertiesHandler(base_handler.BaseHandler):
                 )
             return
 
-        pair = {}
-        if properties and len(properties) > 0:
-            for name, value in list(properties.items()):
-                try:
-                    js = json.loads(value)
-                    pair[name] = js
-                except ValueError:
-                    pair[name] = value
-
         # Filter properties based on peer permissions (bulk evaluation)
+        names = list(properties)
         peer_id = check.acl.get("peerid", "") if hasattr(check, "acl") else ""
-        if peer_id and actor_interface and actor_interface.id and pair:
+        if peer_id and actor_interface and actor_interface.id and names:
             try:
                 evaluator = get_permission_evaluator(self.config)
                 # Use bulk evaluation to reduce logging verbosity
-                property_names = list(pair.keys())
                 results = evaluator.evaluate_bulk_property_access(
-                    actor_interface.id, peer_id, property_names, "read"
+                    actor_interface.id, peer_id, names, "read"
                 )
-                # Filter based on results
-                filtered_pair = {}
-                for prop_name, prop_value in pair.items():
-                    result = results.get(prop_name, PermissionResult.DENIED)
-                    if result == PermissionResult.ALLOWED:
-                        filtered_pair[prop_name] = prop_value
-                    elif result == PermissionResult.NOT_FOUND:
-                        # No specific rule - include for backward compatibility
-                        filtered_pair[prop_name] = prop_value
-                    # DENIED properties are excluded
-                pair = filtered_pair
+                # No specific rule (NOT_FOUND) - include for backward
+                # compatibility; DENIED properties are excluded
+                names = [
+                    name
+                    for name in names
+                    if results.get(name, PermissionResult.DENIED)
+                    in (PermissionResult.ALLOWED, PermissionResult.NOT_FOUND)
+                ]
             except Exception as e:
                 logger.error(f"Error filtering properties by permission: {e}")
                 # On error, return empty for security (fail closed)
-                pair = {}
+                names = []
 
-        # Execute property hooks for all properties if available
-        if self.hooks and pair:
-            if actor_interface:
-                auth_context = self._create_auth_context(check, "read")
-                result = {}
-                for key, value in pair.items():
-                    transformed = self.hooks.execute_property_hooks(
-                        key, "get", actor_interface, value, [], auth_context
-                    )
-                    if transformed is not None:
-                        result[key] = transformed
-                pair = result
-
-        # Note: Don't return early if pair is empty - we still need to add list properties below
-        # The final output will be handled at the end of the function
+        # Property values are decoded and passed through the property hooks
+        # one at a time, as the response is written (see _iter_values())
+        auth_context = self._create_auth_context(check, "read") if self.hooks else None
+        pair = self._iter_values(properties, names, actor_interface, auth_context)
 
         # Always discover list properties (needed for both metadata and non-metadata responses)
         list_names: set[str] = set()
@@ -577,80 +573,129 @@ class PropertiesHandler(base_handler.BaseHandler):
                 # No peer - include all (owner access)
                 list_names = all_list_names
 
-        # Build response based on query parameters
+        # Build response based on query parameters. Lists are read (and
+        # checked for corruption) here, before any of the response is
+        # written; only their hooks run as it is written.
+        out: Any
         try:
             if include_metadata:
                 # Metadata-only response: no property values, just structure info
-                simple_names = list(pair.keys())
-                simple_total_bytes = sum(len(json.dumps(v)) for v in pair.values())
+                simple_names = []
+                simple_total_bytes = 0
+                for name, value in pair:
+                    simple_names.append(name)
+                    simple_total_bytes += len(json_codec.dumps(value))
                 lists_info: dict[str, Any] = {}
                 for list_name in list_names:
                     list_prop = getattr(actor_interface.property_lists, list_name)
                     list_prop.prime_from_rows(all_rows)
                     items = list_prop.to_list_from_rows(all_rows)
-                    total_bytes = sum(len(json.dumps(item)) for item in items)
+                    total_bytes = sum(len(json_codec.dumps(item)) for item in items)
                     lists_info[list_name] = {
                         "count": len(items),
                         "total_bytes": total_bytes,
                         "description": list_prop.get_description(),
                         "explanation": list_prop.get_explanation(),
                     }
-                pair = {
+                out = {
                     "simple": {
                         "properties": simple_names,
                         "total_bytes": simple_total_bytes,
                     },
                     "lists": lists_info,
                 }
-            elif format_param == "full":
-                # Full format: simple props as-is + list props with items, description, explanation
-                for list_name in list_names:
-                    list_prop = getattr(actor_interface.property_lists, list_name)
-                    list_prop.prime_from_rows(all_rows)
-                    items = list_prop.to_list_from_rows(all_rows)
-                    # Execute property hooks on list items if available
-                    if self.hooks and actor_interface:
-                        auth_context = self._create_auth_context(check, "read")
-                        transformed_items = []
-                        for item in items:
-                            transformed = self.hooks.execute_property_hooks(
-                                list_name,
-                                "get",
-                                actor_interface,
-                                item,
-                                [],
-                                auth_context,
-                            )
-                            if transformed is not None:
-                                transformed_items.append(transformed)
-                            else:
-                                transformed_items.append(item)
-                        items = transformed_items
-                    pair[list_name] = {
-                        "_list": True,
-                        "count": len(items),
-                        "description": list_prop.get_description(),
-                        "explanation": list_prop.get_explanation(),
-                        "items": items,
-                    }
             else:
-                # Default / format=short: simple props as-is + minimal list markers
+                list_members: list[tuple[str, Any]] = []
                 for list_name in list_names:
                     list_prop = getattr(actor_interface.property_lists, list_name)
                     list_prop.prime_from_rows(all_rows)
-                    pair[list_name] = {
-                        "_list": True,
-                        "count": len(list_prop),
-                    }
+                    if format_param == "full":
+                        # Full format: simple props as-is + list props with items, description, explanation
+                        items = list_prop.to_list_from_rows(all_rows)
+                        entry = json_stream.StreamedObject(
+                            [
+                                ("_list", True),
+                                ("count", len(items)),
+                                ("description", list_prop.get_description()),
+                                ("explanation", list_prop.get_explanation()),
+                                (
+                                    "items",
+                                    json_stream.StreamedArray(
+                                        self._iter_list_items(
+                                            list_name,
+                                            items,
+                                            actor_interface,
+                                            auth_context,
+                                        )
+                                    ),
+                                ),
+                            ]
+                        )
+                    else:
+                        # Default / format=short: simple props as-is + minimal list markers
+                        entry = json_stream.StreamedObject(
+                            [("_list", True), ("count", len(list_prop))]
+                        )
+                    list_members.append((list_name, entry))
+                # A list replaces a simple property of the same name
+                out = json_stream.StreamedObject(
+                    itertools.chain(
+                        (
+                            (name, value)
+                            for name, value in pair
+                            if name not in list_names
+                        ),
+                        list_members,
+                    )
+                )
         except ListCorruptionError as e:
             self._respond_list_corrupted(e.list_name, e)
             return
 
-        out = json.dumps(pair)
-        self.response.write(out)
-        self.response.headers["Content-Type"] = "application/json"
+        self.write_json_listing(out, len(all_rows))
         return
 
+    def _iter_values(
+        self,
+        properties: dict[str, str],
+        names: list[str],
+        actor_interface: Any,
+        auth_context: dict[str, Any] | None,
+    ) -> Iterator[tuple[str, Any]]:
+        """(name, value) of ``names``, decoded and passed through the property
+        hooks; a property whose hook returns None is left out."""
+        for name in names:
+            value = properties[name]
+            try:
+                value = json_codec.loads(value)
+            except ValueError:
+                pass
+            if auth_context is not None and self.hooks:
+                value = self.hooks.execute_property_hooks(
+                    name, "get", actor_interface, value, [], auth_context
+                )
+                if value is None:
+                    continue
+            yield name, value
+
+    def _iter_list_items(
+        self,
+        list_name: str,
+        items: list[Any],
+        actor_interface: Any,
+        auth_context: dict[str, Any] | None,
+    ) -> Iterator[Any]:
+        """``items`` passed through the property hooks of ``list_name``; an
+        item whose hook returns None is kept as it is."""
+        for item in items:
+            if auth_context is not None and self.hooks:
+                transformed = self.hooks.execute_property_hooks(
+                    list_name, "get", actor_interface, item, [], auth_context
+                )
+                if transformed is not None:
+                    item = transformed
+            yield item
+
     def put(self, actor_id, name):
         auth_result = self.authenticate_actor(actor_id, "properties", subpath=name)
         if not auth_result.success:
@@ -698,7 +743,7 @@ class PropertiesHandler(base_handler.BaseHandler):
                 body = ""
 
             try:
-                item_value = json.loads(body)
+                item_value = json_codec.loads(body)
             except (TypeError, ValueError, KeyError):
                 item_value = body
 
@@ -786,7 +831,7 @@ class PropertiesHandler(base_handler.BaseHandler):
                 myself.register_diffs(
                     target="properties",
                     subtarget=name,
-                    blob=json.dumps({"index": index, "value": item_value}),
+                    blob=json_codec.encode({"index": index, "value": item_value}),
                 )
 
                 if self.response:
@@ -824,11 +869,11 @@ class PropertiesHandler(base_handler.BaseHandler):
         if len(path) == 1:
             old = myself.property[name] if myself and myself.property else None
             try:
-                old = json.loads(old or "{}")
+                old = json_codec.loads(old or "{}")
             except (TypeError, ValueError, KeyError):
                 old = {}
             try:
-                new_body = json.loads(body)
+                new_body = json_codec.loads(body)
                 is_json = True
             except (TypeError, ValueError, KeyError):
                 new_body = body
@@ -857,7 +902,7 @@ class PropertiesHandler(base_handler.BaseHandler):
                         return
             if is_json:
                 if myself and myself.property:
-                    myself.property[name] = json.dumps(new)
+                    myself.property[name] = json_codec.dumps(new)
             else:
                 if myself and myself.property:
                     myself.property[name] = new
@@ -868,7 +913,7 @@ class PropertiesHandler(base_handler.BaseHandler):
         blob = body
         # Make store var to be merged with original struct
         try:
-            body = json.loads(body)
+            body = json_codec.loads(body)
         except (TypeError, ValueError, KeyError):
             pass
         store = {path[len(path) - 1]: body}
@@ -880,7 +925,7 @@ class PropertiesHandler(base_handler.BaseHandler):
             i -= 1
         orig = myself.property[name] if myself and myself.property else None
         try:
-            orig = json.loads(orig or "{}")
+            orig = json_codec.loads(orig or "{}")
             merge_dict(orig, store)
             res = orig
         except (TypeError, ValueError, KeyError):
@@ -901,7 +946,7 @@ class PropertiesHandler(base_handler.BaseHandler):
                     self.response.set_status(400, "Payload is not accepted")
                     return
         res = final_res
-        res = json.dumps(res)
+        res = json_codec.dumps(res)
         if myself and myself.property:
             myself.property[name] = res
         myself.register_diffs(
@@ -1039,7 +1084,7 @@ class PropertiesHandler(base_handler.BaseHandler):
                     body = body.decode("utf-8", "ignore")
                 elif body is None:
                     body = "{}"
-                params = json.loads(body)
+                params = json_codec.loads(body)
             except (TypeError, ValueError, KeyError):
                 if self.response:
                     self.response.set_status(400, "Error in json body")
@@ -1547,7 +1592,7 @@ class PropertiesHandler(base_handler.BaseHandler):
                                 continue
                     pair[key] = val
                     if isinstance(val, dict):
-                        text = json.dumps(val)
+                        text = json_codec.dumps(val)
                     else:
                         text = val
                     if myself and myself.property:
@@ -1556,7 +1601,7 @@ class PropertiesHandler(base_handler.BaseHandler):
             if self.response:
                 self.response.set_status(403, "No attributes accepted")
             return
-        out = json.dumps(pair)
+        out = json_codec.dumps(pair)
         myself.register_diffs(target="properties", blob=out)
         if self.response:
             self.response.write(out)
@@ -1680,7 +1725,7 @@ class PropertiesHandler(base_handler.BaseHandler):
         orig = myself.property[name] if myself and myself.property else None
         old = orig
         try:
-            orig = json.loads(orig or "{}")
+            orig = json_codec.loads(orig or "{}")
         except (TypeError, ValueError, KeyError):
             # Since /properties/something was handled above
             # orig must be json loadable
@@ -1706,7 +1751,7 @@ class PropertiesHandler(base_handler.BaseHandler):
                 if result is None:
                     self.response.set_status(403)
                     return
-        res = json.dumps(orig)
+        res = json_codec.dumps(orig)
         if myself and myself.property:
             myself.property[name] = res
         myself.register_diffs(
@@ -1821,7 +1866,7 @@ class PropertyMetadataHandler(base_handler.BaseHandler):
         }
 
         if self.response:
-            self.response.write(json.dumps(metadata))
+            self.response.write(json_codec.dumps(metadata))
             self.response.headers["Content-Type"] = "application/json"
             self.response.set_status(200)
 
@@ -1857,7 +1902,7 @@ class PropertyMetadataHandler(base_handler.BaseHandler):
             body = self.request.body
             if isinstance(body, bytes):
                 body = body.decode("utf-8", "ignore")
-            params = json.loads(body or "{}")
+            params = json_codec.loads(body or "{}")
         except (TypeError, ValueError, KeyError):
             if self.response:
                 self.response.set_status(400, "Invalid JSON body")
@@ -1887,7 +1932,7 @@ class PropertyMetadataHandler(base_handler.BaseHandler):
         myself.register_diffs(
             target="properties",
             subtarget=name,
-            blob=json.dumps({"action": "metadata_update", **params}),
+            blob=json_codec.encode({"action": "metadata_update", **params}),
         )
 
         if self.response:
@@ -2017,7 +2062,7 @@ class PropertyListItemsHandler(base_handler.BaseHandler):
 
         if self.response:
             self.response.write(
-                json.dumps(
+                json_codec.dumps(
                     {
                         "items": [{"index": i, "item": item} for i, item in indexed],
                         "count": len(indexed),
@@ -2065,7 +2110,7 @@ class PropertyListItemsHandler(base_handler.BaseHandler):
             body = self.request.body
             if isinstance(body, bytes):
                 body = body.decode("utf-8", "ignore")
-            params = json.loads(body or "{}")
+            params = json_codec.loads(body or "{}")
         except (TypeError, ValueError, KeyError):
             if self.response:
                 self.response.set_status(400, "Invalid JSON body")
@@ -2097,7 +2142,7 @@ class PropertyListItemsHandler(base_handler.BaseHandler):
                 myself.register_diffs(
                     target="properties",
                     subtarget=name,
-                    blob=json.dumps(
+                    blob=json_codec.encode(
                         {
                             "action": "add",
                             "index": new_index,
@@ -2108,7 +2153,7 @@ class PropertyListItemsHandler(base_handler.BaseHandler):
 
                 if self.response:
                     self.response.write(
-                        json.dumps({"success": True, "index": new_index})
+                        json_codec.dumps({"success": True, "index": new_index})
                     )
                     self.response.headers["Content-Type"] = "application/json"
                     self.response.set_status(201)
@@ -2171,7 +2216,7 @@ class PropertyListItemsHandler(base_handler.BaseHandler):
                 myself.register_diffs(
                     target="properties",
                     subtarget=name,
-                    blob=json.dumps(
+                    blob=json_codec.encode(
                         {"action": "update", "index": index, "value": item_value}
                     ),
                 )
@@ -2225,7 +2270,7 @@ class PropertyListItemsHandler(base_handler.BaseHandler):
                 myself.register_diffs(
                     target="properties",
                     subtarget=name,
-                    blob=json.dumps({"action": "delete", "index": index}),
+                    blob=json_codec.encode({"action": "delete", "index": index}),
                 )
 
                 if self.response:
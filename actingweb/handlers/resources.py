@@ -1,6 +1,5 @@
 # Fixed imports after removing init_actingweb
-import json
-
+from actingweb import json_codec
 from actingweb.handlers import base_handler
 
 
@@ -23,7 +22,7 @@ class ResourcesHandler(base_handler.BaseHandler):
                     f"resource_{name}", actor_interface, {"method": "GET"}
                 )
         if pair:
-            out = json.dumps(pair)
+            out = json_codec.dumps(pair)
             if self.response:
                 self.response.write(out)
                 self.response.headers["Content-Type"] = "application/json"
@@ -53,7 +52,7 @@ class ResourcesHandler(base_handler.BaseHandler):
             if isinstance(pair, int) and 100 <= pair <= 999:
                 return
             if pair:
-                out = json.dumps(pair)
+                out = json_codec.dumps(pair)
                 if self.response:
                     self.response.write(out)
                     self.response.headers["Content-Type"] = "application/json"
@@ -79,7 +78,7 @@ class ResourcesHandler(base_handler.BaseHandler):
                 body_str = body.decode("utf-8", "ignore")
             else:
                 body_str = body
-            params = json.loads(body_str)
+            params = json_codec.loads(body_str)
         except (TypeError, ValueError, KeyError):
             if self.response:
                 self.response.set_status(400, "Error in json body")
@@ -99,7 +98,7 @@ class ResourcesHandler(base_handler.BaseHandler):
             if isinstance(pair, int) and 100 <= pair <= 999:
                 return
             if pair:
-                out = json.dumps(pair)
+                out = json_codec.dumps(pair)
                 if self.response:
                     self.response.write(out)
                     self.response.headers["Content-Type"] = "application/json"
@@ -125,7 +124,7 @@ class ResourcesHandler(base_handler.BaseHandler):
                 body_str = body.decode("utf-8", "ignore")
             else:
                 body_str = body
-            params = json.loads(body_str)
+            params = json_codec.loads(body_str)
         except (TypeError, ValueError, KeyError):
             if self.response:
                 self.response.set_status(400, "Error in json body")
@@ -145,7 +144,7 @@ class ResourcesHandler(base_handler.BaseHandler):
             if isinstance(pair, int) and 100 <= pair <= 999:
                 return
             if pair:
-                out = json.dumps(pair)
+                out = json_codec.dumps(pair)
                 if self.response:
                     self.response.write(out)
                     self.response.headers["Content-Type"] = "application/json"
@@ -1,7 +1,6 @@
-import json
 import logging
 
-from actingweb import deletion
+from actingweb import deletion, json_codec
 from actingweb.handlers import base_handler
 
 logger = logging.getLogger(__name__)
@@ -67,7 +66,7 @@ class RootHandler(base_handler.BaseHandler):
         trustee_root = myself.store.trustee_root if myself.store else None
         if trustee_root and len(trustee_root) > 0:
             pair["trustee_root"] = trustee_root
-        out = json.dumps(pair)
+        out = json_codec.dumps(pair)
         if self.response:
             self.response.write(out)
         self.response.headers["Content-Type"] = "application/json"
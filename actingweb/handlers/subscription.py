@@ -1,11 +1,25 @@
-import json
 import logging
+from typing import Any
 
+from actingweb import json_codec, json_stream
 from actingweb.handlers import base_handler
 
 logger = logging.getLogger(__name__)
 
 
+def _diff_entry(diff: dict[str, Any]) -> dict[str, Any]:
+    """A stored diff as listed in ``GET /subscriptions/<peerid>/<subid>``."""
+    try:
+        d = json_codec.loads(diff["diff"])
+    except (TypeError, ValueError, KeyError):
+        d = diff["diff"]
+    return {
+        "sequence": diff["sequence"],
+        "timestamp": diff["timestamp"].strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        "data": d,
+    }
+
+
 class SubscriptionRootHandler(base_handler.BaseHandler):
     """Handles requests to /subscription"""
 
@@ -54,7 +68,7 @@ class SubscriptionRootHandler(base_handler.BaseHandler):
             "id": myself.id,
             "data": subscriptions,
         }
-        out = json.dumps(data)
+        out = json_codec.dumps(data)
         if self.response:
             self.response.write(out)
             self.response.headers["Content-Type"] = "application/json"
@@ -72,13 +86,27 @@ class SubscriptionRootHandler(base_handler.BaseHandler):
                 self.response.set_status(500, "Internal error")
             return
 
+        params = self._parse_post_params()
+        if params is None:
+            return
+
+        # Use SubscriptionManager to create remote subscription
+        remote_loc = actor_interface.subscriptions.subscribe_to_peer(**params)
+        self._post_response(remote_loc)
+
+    def _parse_post_params(self) -> dict[str, Any] | None:
+        """Read the subscription to create from the POST body or form.
+
+        Returns the keyword arguments for ``subscribe_to_peer()``, or None
+        after setting a 400 response.
+        """
         try:
             body = self.request.body
             if isinstance(body, bytes):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
             peerid = params.get("peerid")
             target = params.get("target")
             subtarget = params.get("subtarget", "")
@@ -94,21 +122,20 @@ class SubscriptionRootHandler(base_handler.BaseHandler):
         if not peerid or len(peerid) == 0:
             if self.response:
                 self.response.set_status(400, "Missing peer URL")
-            return
+            return None
         if not target or len(target) == 0:
             if self.response:
                 self.response.set_status(400, "Missing target")
-            return
-
-        # Use SubscriptionManager to create remote subscription
-        remote_loc = actor_interface.subscriptions.subscribe_to_peer(
-            peer_id=peerid,
-            target=target,
-            subtarget=subtarget,
-            resource=resource,
-            granularity=granularity,
-        )
+            return None
+        return {
+            "peer_id": peerid,
+            "target": target,
+            "subtarget": subtarget,
+            "resource": resource,
+            "granularity": granularity,
+        }
 
+    def _post_response(self, remote_loc: str | None) -> None:
         if not remote_loc:
             if self.response:
                 self.response.set_status(
@@ -182,7 +209,7 @@ class SubscriptionRelationshipHandler(base_handler.BaseHandler):
             "peerid": peerid,
             "data": subscriptions,
         }
-        out = json.dumps(data)
+        out = json_codec.dumps(data)
         if self.response:
             self.response.write(out)
             self.response.headers["Content-Type"] = "application/json"
@@ -201,7 +228,7 @@ class SubscriptionRelationshipHandler(base_handler.BaseHandler):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
             if "target" in params:
                 target = params["target"]
             else:
@@ -277,7 +304,7 @@ class SubscriptionRelationshipHandler(base_handler.BaseHandler):
                 "granularity": new_sub["granularity"],
                 "sequence": new_sub["sequence"],
             }
-            out = json.dumps(pair)
+            out = json_codec.dumps(pair)
             self.response.write(out)
             self.response.headers["Content-Type"] = "application/json"
             self.response.set_status(201, "Created")
@@ -324,40 +351,31 @@ class SubscriptionHandler(base_handler.BaseHandler):
                 self.response.set_status(404, "Subscription does not exist")
             return
 
-        diffs = sub_with_diffs.get_diffs()
-        pairs = []
-        for diff in diffs:
-            try:
-                d = json.loads(diff["diff"])
-            except (TypeError, ValueError, KeyError):
-                d = diff["diff"]
-            pairs.append(
-                {
-                    "sequence": diff["sequence"],
-                    "timestamp": diff["timestamp"].strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-                    "data": d,
-                }
-            )
+        # Diffs are read a page at a time; a short listing is read whole
+        # and buffered, a long one is streamed as it is read.
+        head, diffs = json_stream.peek(
+            sub_with_diffs.iter_diffs(), self.stream_listings_min_items()
+        )
 
         # Always return subscription metadata with current sequence,
         # even when there are no new diffs. This allows subscribers
         # to synchronize their sequence number with the publisher.
         sub_dict = sub_info.to_dict()
-        data = {
-            "id": myself.id,
-            "peerid": peerid,
-            "subscriptionid": subid,
-            "target": sub_dict["target"],
-            "subtarget": sub_dict["subtarget"],
-            "resource": sub_dict["resource"],
-            "sequence": sub_dict["sequence"],
-            "data": pairs,
-        }
-        out = json.dumps(data)
+        data = json_stream.StreamedObject(
+            [
+                ("id", myself.id),
+                ("peerid", peerid),
+                ("subscriptionid", subid),
+                ("target", sub_dict["target"]),
+                ("subtarget", sub_dict["subtarget"]),
+                ("resource", sub_dict["resource"]),
+                ("sequence", sub_dict["sequence"]),
+                ("data", json_stream.StreamedArray(map(_diff_entry, diffs))),
+            ]
+        )
         if self.response:
-            self.response.write(out)
-            self.response.headers["Content-Type"] = "application/json"
             self.response.set_status(200, "Ok")
+            self.write_json_listing(data, len(head))
 
     def put(self, actor_id, peerid, subid):
         auth_result = self.authenticate_actor(
@@ -374,7 +392,7 @@ class SubscriptionHandler(base_handler.BaseHandler):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
             if "sequence" in params:
                 seq = params["sequence"]
             else:
@@ -567,7 +585,7 @@ class SubscriptionDiffHandler(base_handler.BaseHandler):
             return
 
         try:
-            d = json.loads(diff["data"])
+            d = json_codec.loads(diff["data"])
         except (TypeError, ValueError, KeyError):
             d = diff["data"]
 
@@ -584,7 +602,7 @@ class SubscriptionDiffHandler(base_handler.BaseHandler):
             "data": d,
         }
         sub_with_diffs.clear_diff(seqnr)
-        out = json.dumps(pairs)
+        out = json_codec.dumps(pairs)
         if self.response:
             self.response.write(out)
             self.response.headers["Content-Type"] = "application/json"
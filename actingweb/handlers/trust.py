@@ -1,7 +1,7 @@
-import json
 import logging
+from typing import Any
 
-from actingweb import auth
+from actingweb import auth, json_codec, json_stream
 from actingweb.handlers import base_handler
 from actingweb.permission_evaluator import PermissionResult, get_permission_evaluator
 
@@ -71,10 +71,8 @@ class TrustHandler(base_handler.BaseHandler):
         # Return empty array with 200 OK when no relationships exist (SPA-friendly, spec v1.2)
         if not pairs:
             pairs = []
-        out = json.dumps(pairs)
-        self.response.write(out)
-        self.response.headers["Content-Type"] = "application/json"
         self.response.set_status(200, "Ok")
+        self.write_json_listing(json_stream.StreamedArray(pairs), len(pairs))
 
     def post(self, actor_id):
         myself = self.require_authenticated_actor(actor_id, "trust", "POST")
@@ -88,7 +86,7 @@ class TrustHandler(base_handler.BaseHandler):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
             if "url" in params:
                 url = params["url"]
             else:
@@ -153,7 +151,7 @@ class TrustHandler(base_handler.BaseHandler):
             + "/"
             + new_trust["peerid"]
         )
-        out = json.dumps(new_trust)
+        out = json_codec.dumps(new_trust)
         self.response.write(out)
         self.response.headers["Content-Type"] = "application/json"
         self.response.set_status(201, "Created")
@@ -196,7 +194,7 @@ class TrustRelationshipHandler(base_handler.BaseHandler):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
             if "trustee_root" in params:
                 trustee_root = params["trustee_root"]
             else:
@@ -271,7 +269,7 @@ class TrustRelationshipHandler(base_handler.BaseHandler):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
             if "baseuri" in params:
                 baseuri = params["baseuri"]
             else:
@@ -362,7 +360,7 @@ class TrustRelationshipHandler(base_handler.BaseHandler):
             + "/"
             + new_trust["peerid"]
         )
-        out = json.dumps(new_trust)
+        out = json_codec.dumps(new_trust)
         self.response.write(out)
         self.response.headers["Content-Type"] = "application/json"
         if approved:
@@ -377,31 +375,40 @@ class TrustPeerHandler(base_handler.BaseHandler):
         if self.request.get("_method") == "PUT":
             # Web UI method override for updating/approving trust
             self.put(actor_id, relationship, peerid)
-            try:
-                status = getattr(self.response, "status_code", 0)
-            except Exception:
-                status = 0
-            if status in (200, 201, 202, 204):
-                self.response.set_status(302, "Found")
-                self.response.set_redirect(f"/{actor_id}/www/trust")
+            self._redirect_to_trust_page(actor_id)
             return
         if self.request.get("_method") == "DELETE":
             # Perform deletion, then redirect back to the web UI trust page on success
             self.delete(actor_id, relationship, peerid)
-            try:
-                status = getattr(self.response, "status_code", 0)
-            except Exception:
-                status = 0
-            if status in (200, 201, 202, 204):
-                # Redirect to the trust overview so the browser view updates
-                self.response.set_status(302, "Found")
-                self.response.set_redirect(f"/{actor_id}/www/trust")
+            self._redirect_to_trust_page(actor_id)
             return
         logger.debug("GET trust request received")
+        auth_result = self._authorize_get(actor_id, relationship, peerid)
+        if not auth_result:
+            return
+        relationships = auth_result.actor.get_trust_relationships(
+            relationship=relationship, peerid=peerid
+        )
+        self._write_trust(
+            actor_id, peerid, auth_result, relationships[0] if relationships else None
+        )
+
+    def _redirect_to_trust_page(self, actor_id: str) -> None:
+        """After a web UI override succeeded, redirect to the trust overview
+        so the browser view updates."""
+        try:
+            status = getattr(self.response, "status_code", 0)
+        except Exception:
+            status = 0
+        if status in (200, 201, 202, 204):
+            self.response.set_status(302, "Found")
+            self.response.set_redirect(f"/{actor_id}/www/trust")
+
+    def _authorize_get(self, actor_id: str, relationship: str, peerid: str) -> Any:
+        """Authenticate and authorize a GET; returns the auth result or None."""
         auth_result = self.authenticate_actor(actor_id, "trust", subpath=relationship)
         if not auth_result.success:
-            return
-        myself = auth_result.actor
+            return None
         # Custom authorization check for peer access - peers can read their own trust relationship
         if not auth_result.auth_obj.check_authorisation(
             path="trust",
@@ -412,15 +419,22 @@ class TrustPeerHandler(base_handler.BaseHandler):
         ):
             if self.response:
                 self.response.set_status(403)
-            return
-        relationships = myself.get_trust_relationships(
-            relationship=relationship, peerid=peerid
-        )
-        if not relationships or len(relationships) == 0:
+            return None
+        return auth_result
+
+    def _write_trust(
+        self,
+        actor_id: str,
+        peerid: str,
+        auth_result: Any,
+        my_trust: dict[str, Any] | None,
+    ) -> None:
+        """Write the trust relationship (and, if asked for, its permission
+        overrides) as the GET response."""
+        if not my_trust:
             if self.response:
                 self.response.set_status(404, "Not found")
             return
-        my_trust = relationships[0]
 
         # Check access based on authentication type (needed for verification logic)
         _ = (
@@ -465,7 +479,7 @@ class TrustPeerHandler(base_handler.BaseHandler):
                 self.response.set_status(403, "Trust relationship not approved")
             return
 
-        out = json.dumps(my_trust)
+        out = json_codec.dumps(my_trust)
         self.response.write(out)
         self.response.headers["Content-Type"] = "application/json"
         if my_trust["approved"]:
@@ -485,7 +499,7 @@ class TrustPeerHandler(base_handler.BaseHandler):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
             peer_approved = None
             if "approved" in params:
                 if params["approved"] and params["approved"] is True:
@@ -572,22 +586,69 @@ class TrustPeerHandler(base_handler.BaseHandler):
             self.response.set_status(500, "Not modified")
 
     def put(self, actor_id, relationship, peerid):
+        myself = self._authorize_put(actor_id, relationship)
+        if not myself:
+            return
+        params = self._parse_put_params()
+        if params is None:
+            return
+        baseuri, desc, approved, permission_updates = params
+        # Use developer API - ActorInterface with TrustManager
+        actor_interface = self._get_actor_interface(myself)
+        if not actor_interface:
+            if self.response:
+                self.response.set_status(500, "Internal error")
+            return
+
+        # Update trust relationship
+        trust_updated = actor_interface.trust.modify_and_notify(
+            peer_id=peerid,
+            relationship=relationship,
+            baseuri=baseuri,
+            approved=approved,
+            description=desc,
+        )
+        trust_data = None
+        if self._put_rereads_trust(approved, trust_updated):
+            relationships = myself.get_trust_relationships(
+                relationship=relationship, peerid=peerid
+            )
+            trust_data = relationships[0] if relationships else None
+        self._complete_put(
+            actor_id,
+            relationship,
+            peerid,
+            actor_interface,
+            approved,
+            permission_updates,
+            trust_updated,
+            trust_data,
+        )
+
+    def _authorize_put(self, actor_id: str, relationship: str) -> Any:
+        """Authenticate and authorize a PUT; returns the actor or None."""
         auth_result = self.authenticate_actor(actor_id, "trust", subpath=relationship)
         if not auth_result.success:
-            return
-        myself = auth_result.actor
+            return None
         if not auth_result.authorize("PUT", "trust", "<type>/<id>"):
-            return
+            return None
+        return auth_result.actor
+
+    def _parse_put_params(self) -> tuple[str, str, bool | None, Any] | None:
+        """Read the trust changes from the PUT body or form.
+
+        Returns ``(baseuri, desc, approved, permission_updates)``, or None
+        after setting a 400 response.
+        """
         approved = None
         permission_updates = None
-        actor_interface = None  # Initialize to satisfy type checker
         try:
             body = self.request.body
             if isinstance(body, bytes):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
             if "baseuri" in params:
                 baseuri = params["baseuri"]
             else:
@@ -607,7 +668,7 @@ class TrustPeerHandler(base_handler.BaseHandler):
             if not self.request.get("_method") or self.request.get("_method") != "PUT":
                 if self.response:
                     self.response.set_status(400, "No json content")
-                return
+                return None
             if self.request.get("approved") and len(self.request.get("approved")) > 0:
                 if self.request.get("approved").lower() == "true":
                     approved = True
@@ -619,47 +680,52 @@ class TrustPeerHandler(base_handler.BaseHandler):
                 desc = self.request.get("desc")
             else:
                 desc = ""
-        # Use developer API - ActorInterface with TrustManager
-        if actor_interface is None:
-            actor_interface = self._get_actor_interface(myself)
-            if not actor_interface:
-                if self.response:
-                    self.response.set_status(500, "Internal error")
-                return
-
-        # Update trust relationship
-        trust_updated = actor_interface.trust.modify_and_notify(
-            peer_id=peerid,
-            relationship=relationship,
-            baseuri=baseuri,
-            approved=approved,
-            description=desc,
-        )
-
+        return baseuri, desc, approved, permission_updates
+
+    def _put_rereads_trust(self, approved: bool | None, trust_updated: bool) -> bool:
+        """Whether completing a PUT needs the trust relationship as stored
+        after the change: for the approval hook, or to tell a missing
+        relationship from a rejected change."""
+        return (approved is True and bool(self.hooks)) or not trust_updated
+
+    def _complete_put(
+        self,
+        actor_id: str,
+        relationship: str,
+        peerid: str,
+        actor_interface: Any,
+        approved: bool | None,
+        permission_updates: Any,
+        trust_updated: bool,
+        trust_data: dict[str, Any] | None,
+    ) -> None:
+        """Run the approval hook, store permission changes and set the response.
+
+        ``trust_data`` is the relationship as read back after the change
+        (None if it does not exist, or if ``_put_rereads_trust()`` is False).
+        """
         # Trigger trust_fully_approved_local lifecycle hook if this actor just approved and both are now approved
         if approved is True and self.hooks:
             try:
-                # Get the trust relationship data to check if both sides approved
-                relationships = myself.get_trust_relationships(
-                    relationship=relationship, peerid=peerid
-                )
-                if relationships:
-                    trust_data = relationships[0]
-                    # Only trigger hook if BOTH sides have approved
-                    if trust_data.get("approved") and trust_data.get("peer_approved"):
-                        logger.info(
-                            f"Trust fully approved locally via PUT: {actor_id} approved, completing relationship with {peerid}"
-                        )
-                        self.hooks.execute_lifecycle_hooks(
-                            "trust_fully_approved_local",
-                            actor=actor_interface,
-                            peer_id=peerid,
-                            relationship=relationship,
-                            trust_data=trust_data,
-                        )
-                        logger.info(
-                            f"trust_fully_approved_local hook triggered for {actor_id} <-> {peerid}"
-                        )
+                # Only trigger hook if BOTH sides have approved
+                if (
+                    trust_data
+                    and trust_data.get("approved")
+                    and trust_data.get("peer_approved")
+                ):
+                    logger.info(
+                        f"Trust fully approved locally via PUT: {actor_id} approved, completing relationship with {peerid}"
+                    )
+                    self.hooks.execute_lifecycle_hooks(
+                        "trust_fully_approved_local",
+                        actor=actor_interface,
+                        peer_id=peerid,
+                        relationship=relationship,
+                        trust_data=trust_data,
+                    )
+                    logger.info(
+                        f"trust_fully_approved_local hook triggered for {actor_id} <-> {peerid}"
+                    )
             except Exception as e:
                 logger.error(
                     f"Error triggering trust_fully_approved_local hook in PUT handler: {e}"
@@ -713,10 +779,7 @@ class TrustPeerHandler(base_handler.BaseHandler):
         elif not trust_updated:
             # Trust modification failed - check if it's because trust doesn't exist
             # or because of a validation error
-            relationships = myself.get_trust_relationships(
-                relationship=relationship, peerid=peerid
-            )
-            if not relationships:
+            if not trust_data:
                 logger.warning(
                     f"Trust modification failed: no trust relationship found for "
                     f"actor={actor_id}, peer={peerid}, relationship={relationship}"
@@ -989,7 +1052,7 @@ class TrustPermissionHandler(base_handler.BaseHandler):
                         )
                     return
 
-            out = json.dumps(permission_data)
+            out = json_codec.dumps(permission_data)
             self.response.write(out)
             self.response.headers["Content-Type"] = "application/json"
             self.response.set_status(200, "Ok")
@@ -1021,7 +1084,7 @@ class TrustPermissionHandler(base_handler.BaseHandler):
                 body = body.decode("utf-8", "ignore")
             elif body is None:
                 body = "{}"
-            params = json.loads(body)
+            params = json_codec.loads(body)
 
             # Validate trust relationship exists
             relationships = myself.get_trust_relationships(
@@ -1214,6 +1277,6 @@ class TrustSharedPropertiesHandler(base_handler.BaseHandler):
         }
 
         if self.response:
-            self.response.write(json.dumps(response_data))
+            self.response.write(json_codec.dumps(response_data))
             self.response.headers["Content-Type"] = "application/json"
             self.response.set_status(200)
@@ -1,7 +1,9 @@
 # mypy: disable-error-code="unreachable,unused-ignore"
 import json
 import logging
+from typing import Any
 
+from actingweb import json_codec
 from actingweb.db import get_property
 from actingweb.handlers import base_handler
 from actingweb.property_list import ListCorruptionError
@@ -390,7 +392,7 @@ class WwwHandler(base_handler.BaseHandler):
                             # This is an old-style list property
                             is_list_property = True
                             try:
-                                meta_data = json.loads(meta)
+                                meta_data = json_codec.loads(meta)
                                 list_length = meta_data.get("length", 0)
                                 created_at = meta_data.get("created_at", "Unknown")
 
@@ -460,9 +462,9 @@ class WwwHandler(base_handler.BaseHandler):
                 }
             return
         if path == "trust":
-            relationships = myself.get_trust_relationships()
-            if not relationships:
-                relationships = []
+            relationships, custom_permission_peers, oauth_clients = (
+                self._load_trust_page_data(myself, actor_id)
+            )
 
             # Sort by last_connected_at (most recent first), fallback to created_at if no last connection
             def get_sort_key(trust):
@@ -497,9 +499,7 @@ class WwwHandler(base_handler.BaseHandler):
                     )
 
                     # Check if this relationship has custom permissions
-                    t["has_custom_permissions"] = self._has_custom_permissions(
-                        myself.id or "", peerid
-                    )
+                    t["has_custom_permissions"] = peerid in custom_permission_peers
 
                     connection_metadata.append(
                         {
@@ -520,9 +520,7 @@ class WwwHandler(base_handler.BaseHandler):
                         t.approveuri = (
                             f"{self.config.root}{myself.id or ''}/trust/{rel}/{peerid}"
                         )
-                        t.has_custom_permissions = self._has_custom_permissions(
-                            myself.id or "", peerid
-                        )
+                        t.has_custom_permissions = peerid in custom_permission_peers
                     except Exception:
                         pass
 
@@ -540,9 +538,6 @@ class WwwHandler(base_handler.BaseHandler):
                         }
                     )
 
-            # Get OAuth2 clients for this actor
-            oauth_clients = self._get_oauth_clients_for_actor(actor_id)
-
             # Enrich OAuth2 client trust relationships with client metadata if missing
             if oauth_clients:
                 client_index = {
@@ -644,7 +639,7 @@ class WwwHandler(base_handler.BaseHandler):
                     elif isinstance(hook_result, str):
                         output = hook_result  # type: ignore[unreachable]
                     elif isinstance(hook_result, dict):
-                        output = json.dumps(hook_result)  # type: ignore[unreachable]
+                        output = json_codec.dumps(hook_result)  # type: ignore[unreachable]
                     else:
                         output = str(hook_result)
         if output:
@@ -653,21 +648,38 @@ class WwwHandler(base_handler.BaseHandler):
             self.response.set_status(404, "Not found")
         return
 
-    def _has_custom_permissions(self, actor_id: str, peer_id: str) -> bool:
-        """Check if a trust relationship has custom permission overrides."""
-        if not actor_id or not peer_id:
-            return False
+    def _load_trust_page_data(
+        self, myself: Any, actor_id: str
+    ) -> tuple[list[Any], set[str], list[dict[str, str]]]:
+        """Everything the trust page shows, in one read per store.
+
+        Returns the trust relationships, the ids of the peers with custom
+        permission overrides (one bucket read for all of them, not one per
+        relationship) and the actor's OAuth2 clients.
+        """
+        relationships = myself.get_trust_relationships() or []
+        return (
+            relationships,
+            self._custom_permission_peers(myself.id or ""),
+            self._get_oauth_clients_for_actor(actor_id),
+        )
+
+    def _custom_permission_peers(self, actor_id: str) -> set[str]:
+        """Peer ids with custom permission overrides for ``actor_id``."""
+        if not actor_id:
+            return set()
 
         try:
-            # Import permission system with fallback
             from ..trust_permissions import get_trust_permission_store
 
             permission_store = get_trust_permission_store(self.config)
-            permissions = permission_store.get_permissions(actor_id, peer_id)
-            return permissions is not None
+            return {
+                permissions.peer_id
+                for permissions in permission_store.list_actor_permissions(actor_id)
+            }
         except Exception:
             # If permission system is not available or there's an error, assume no custom permissions
-            return False
+            return set()
 
     def _get_available_trust_types(self) -> list[dict[str, str]]:
         """Get available trust types for trust relationship creation."""
@@ -880,7 +892,7 @@ class WwwHandler(base_handler.BaseHandler):
 
                         # Try to parse as JSON, fall back to string
                         try:
-                            parsed_value = json.loads(item_value)
+                            parsed_value = json_codec.loads(item_value)
                             logger.debug(f"Parsed item_value as JSON: {parsed_value}")
                         except json.JSONDecodeError:
                             parsed_value = item_value
@@ -923,7 +935,7 @@ class WwwHandler(base_handler.BaseHandler):
 
                         # Try to parse as JSON, fall back to string
                         try:
-                            parsed_value = json.loads(item_value)
+                            parsed_value = json_codec.loads(item_value)
                         except json.JSONDecodeError:
                             parsed_value = item_value
 
@@ -1193,7 +1205,7 @@ class WwwHandler(base_handler.BaseHandler):
                     if isinstance(hook_result, str):
                         output = hook_result  # type: ignore[unreachable]
                     elif isinstance(hook_result, dict):
-                        output = json.dumps(hook_result)  # type: ignore[unreachable]
+                        output = json_codec.dumps(hook_result)  # type: ignore[unreachable]
                     else:
                         output = str(hook_result)
 
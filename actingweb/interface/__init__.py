@@ -3,42 +3,101 @@ Modern developer interface for ActingWeb library.
 
 This module provides a clean, fluent API for building ActingWeb applications
 with improved developer experience.
+
+Names are imported from their modules on first access, so
+``from actingweb.interface import ActingWebApp`` does not pull in the actor,
+HTTP client and subscription machinery before it is used.
 """
 
-from ..callback_processor import CallbackProcessor, CallbackType, ProcessResult
-from ..deletion import DeletionStatus, get_deletion_status
-from ..fanout import FanOutManager, FanOutResult
-from ..peer_capabilities import PeerCapabilities
-from ..remote_storage import RemotePeerStore, get_remote_bucket
-from ..subscription_config import SubscriptionProcessingConfig
-from .actor_interface import ActorInterface
-from .app import ActingWebApp
-from .authenticated_views import (
-    AuthContext,
-    AuthenticatedActorView,
-    AuthenticatedPropertyListStore,
-    AuthenticatedPropertyStore,
-    AuthenticatedSubscriptionManager,
-    PermissionError,
-)
-from .hooks import (
-    HookMetadata,
-    HookRegistry,
-    action_hook,
-    app_callback_hook,
-    callback_hook,
-    get_hook_metadata,
-    method_hook,
-    property_hook,
-    subscription_hook,
-)
-from .property_store import PropertyStore
-from .subscription_manager import (
-    PeerSyncResult,
-    SubscriptionManager,
-    SubscriptionSyncResult,
-)
-from .trust_manager import TrustManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..callback_processor import CallbackProcessor, CallbackType, ProcessResult
+    from ..deletion import DeletionStatus, get_deletion_status
+    from ..fanout import FanOutManager, FanOutResult
+    from ..peer_capabilities import PeerCapabilities
+    from ..remote_storage import RemotePeerStore, get_remote_bucket
+    from ..subscription_config import SubscriptionProcessingConfig
+    from .actor_interface import ActorInterface
+    from .app import ActingWebApp
+    from .authenticated_views import (
+        AuthContext,
+        AuthenticatedActorView,
+        AuthenticatedPropertyListStore,
+        AuthenticatedPropertyStore,
+        AuthenticatedSubscriptionManager,
+        PermissionError,
+    )
+    from .hooks import (
+        HookMetadata,
+        HookRegistry,
+        action_hook,
+        app_callback_hook,
+        callback_hook,
+        get_hook_metadata,
+        method_hook,
+        property_hook,
+        subscription_hook,
+    )
+    from .property_store import PropertyStore
+    from .subscription_manager import (
+        PeerSyncResult,
+        SubscriptionManager,
+        SubscriptionSyncResult,
+    )
+    from .trust_manager import TrustManager
+
+# public name -> module it is defined in, relative to this package
+_LAZY_IMPORTS: dict[str, str] = {
+    "CallbackProcessor": "..callback_processor",
+    "CallbackType": "..callback_processor",
+    "ProcessResult": "..callback_processor",
+    "DeletionStatus": "..deletion",
+    "get_deletion_status": "..deletion",
+    "FanOutManager": "..fanout",
+    "FanOutResult": "..fanout",
+    "PeerCapabilities": "..peer_capabilities",
+    "RemotePeerStore": "..remote_storage",
+    "get_remote_bucket": "..remote_storage",
+    "SubscriptionProcessingConfig": "..subscription_config",
+    "ActorInterface": ".actor_interface",
+    "ActingWebApp": ".app",
+    "AuthContext": ".authenticated_views",
+    "AuthenticatedActorView": ".authenticated_views",
+    "AuthenticatedPropertyListStore": ".authenticated_views",
+    "AuthenticatedPropertyStore": ".authenticated_views",
+    "AuthenticatedSubscriptionManager": ".authenticated_views",
+    "PermissionError": ".authenticated_views",
+    "HookMetadata": ".hooks",
+    "HookRegistry": ".hooks",
+    "action_hook": ".hooks",
+    "app_callback_hook": ".hooks",
+    "callback_hook": ".hooks",
+    "get_hook_metadata": ".hooks",
+    "method_hook": ".hooks",
+    "property_hook": ".hooks",
+    "subscription_hook": ".hooks",
+    "PropertyStore": ".property_store",
+    "PeerSyncResult": ".subscription_manager",
+    "SubscriptionManager": ".subscription_manager",
+    "SubscriptionSyncResult": ".subscription_manager",
+    "TrustManager": ".trust_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     "ActingWebApp",
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any
 from .. import __version__
 from ..config import Config
 from ..subscription_config import SubscriptionProcessingConfig
+from . import hook_executor
 from .hooks import HookMetadata, HookRegistry
 
 if TYPE_CHECKING:
@@ -73,6 +74,7 @@ class ActingWebApp:
         self._thread_pool_workers = (
             10  # Default thread pool size for FastAPI integration
         )
+        self._thread_pool_max_workers: int | None = None  # Grows up to this
 
         # Property lookup configuration. None means "not set via the builder":
         # Config's own default and the INDEXED_PROPERTIES /
@@ -98,6 +100,19 @@ class ActingWebApp:
         # Allowed CORS origins for the SPA OAuth endpoints (default: allow all)
         self._spa_cors_origins: list[str] = ["*"]
 
+        # Cross-worker coherence of the per-actor store caches
+        self._cache_coherence: bool = False
+        self._cache_coherence_ttl: float = 1.0
+
+        # Rendered-page cache for the web UI
+        self._www_fragment_cache: bool = False
+
+        # Streamed JSON for large listings
+        self._stream_listings_min_items: int | None = None
+
+        # Cross-request property snapshots
+        self._property_snapshot_max_actors: int | None = None
+
         # Hook registry
         self.hooks = HookRegistry()
 
@@ -227,6 +242,12 @@ class ActingWebApp:
         # Allowed CORS origins for the SPA OAuth endpoints
         if hasattr(self, "_spa_cors_origins"):
             self._config.spa_cors_origins = list(self._spa_cors_origins)
+        # Cross-worker cache coherence
+        self._config.cache_coherence = self._cache_coherence
+        self._config.cache_coherence_ttl = self._cache_coherence_ttl
+        self._config.www_fragment_cache = self._www_fragment_cache
+        self._config.stream_listings_min_items = self._stream_listings_min_items
+        self._config.property_snapshot_max_actors = self._property_snapshot_max_actors
         # Update supported options based on enabled features
         self._config.update_supported_options()
         # Keep service registry reference in sync
@@ -285,9 +306,63 @@ class ActingWebApp:
         self._apply_runtime_changes_to_config()
         return self
 
-    def with_web_ui(self, enable: bool = True) -> "ActingWebApp":
-        """Enable or disable the web UI."""
+    def with_web_ui(
+        self, enable: bool = True, fragment_cache: bool = False
+    ) -> "ActingWebApp":
+        """Enable or disable the web UI.
+
+        Args:
+            enable: Whether to serve ``/<actor_id>/www``.
+            fragment_cache: Keep each actor's last rendering of each www page
+                and render it again only when the page's data changes. Only
+                for templates that use nothing but their template values.
+        """
         self._enable_ui = enable
+        self._www_fragment_cache = fragment_cache
+        self._apply_runtime_changes_to_config()
+        return self
+
+    def with_streaming_listings(self, min_items: int = 1000) -> "ActingWebApp":
+        """Stream large JSON listings instead of building them in memory.
+
+        ``GET /properties``, ``GET /trust`` and ``GET
+        /subscriptions/<peerid>/<subid>`` responses with at least
+        ``min_items`` entries are encoded entry by entry and sent with
+        chunked transfer encoding, so the full response is never held in
+        memory. The JSON itself is unchanged.
+
+        Args:
+            min_items: Smallest listing to stream. Must be >= 0.
+
+        Raises:
+            ValueError: If min_items is negative.
+        """
+        if min_items < 0:
+            raise ValueError(f"min_items must be >= 0, got {min_items}")
+        self._stream_listings_min_items = min_items
+        self._apply_runtime_changes_to_config()
+        return self
+
+    def with_property_snapshots(self, max_actors: int = 1000) -> "ActingWebApp":
+        """Reuse actors' property reads across requests.
+
+        Each actor's properties, once read, are kept in a process-wide
+        snapshot that later requests read from after checking the actor's
+        property version: one small read per request instead of one per
+        property. Every property write advances the version, so writes made
+        through any worker are seen by the next request. Costs a read and a
+        conditional write of the version per property write.
+
+        Args:
+            max_actors: Actors whose snapshots are kept (least recently used
+                dropped first). Must be >= 1.
+
+        Raises:
+            ValueError: If max_actors is less than 1.
+        """
+        if max_actors < 1:
+            raise ValueError(f"max_actors must be >= 1, got {max_actors}")
+        self._property_snapshot_max_actors = max_actors
         self._apply_runtime_changes_to_config()
         return self
 
@@ -470,6 +545,83 @@ class ActingWebApp:
         set_auto_create(auto_create_tables)
         return self
 
+    def with_db_instrumentation(
+        self,
+        enable: bool = True,
+        slow_query_ms: float | None = None,
+        summary_log: bool = True,
+        on_query: Callable[..., None] | None = None,
+        on_request: Callable[..., None] | None = None,
+    ) -> "ActingWebApp":
+        """Record the DB calls each request makes.
+
+        Every call through the ``actingweb.db`` accessors is timed and
+        recorded with its operation, table, item count and (DynamoDB)
+        consumed capacity. A summary line is logged when each request ends,
+        and calls slower than ``slow_query_ms`` are logged at WARNING. See
+        ``actingweb.db.instrumentation``.
+
+        Args:
+            enable: Whether to record DB calls. Default True.
+            slow_query_ms: Threshold for the slow-query log in milliseconds;
+                None keeps ``ACTINGWEB_DB_SLOW_QUERY_MS``, 0 disables it.
+            summary_log: Whether to log the per-request summary line.
+            on_query: Called with each ``QueryRecord``, e.g. to export it as
+                an OpenTelemetry span.
+            on_request: Called with each request's ``QueryLog`` when it ends.
+
+        Returns:
+            Self for method chaining
+
+        Note:
+            The setting is process-wide, like the DB connection pools, and
+            takes precedence over ``ACTINGWEB_DB_INSTRUMENTATION``.
+
+        Example:
+            >>> app = ActingWebApp(...).with_db_instrumentation(slow_query_ms=200)
+        """
+        from ..db import instrumentation
+
+        instrumentation.configure(
+            enable,
+            slow_query_ms=slow_query_ms,
+            summary_log=summary_log,
+            on_query=on_query,
+            on_request=on_request,
+        )
+        return self
+
+    def with_json_codec(self, backend: str = "orjson") -> "ActingWebApp":
+        """Encode and decode JSON with a faster backend.
+
+        Decoding everywhere, and the encoding of list items, subscription
+        diffs, attribute data and peer request bodies, use ``backend``.
+        Stored property values and response bodies keep the exact text of
+        the stdlib encoder. See ``actingweb.json_codec``.
+
+        Args:
+            backend: ``"orjson"`` (default), ``"msgspec"`` or ``"json"`` (the
+                stdlib). A backend that is not installed is logged and the
+                stdlib used instead.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If ``backend`` is not one of these
+
+        Note:
+            The setting is process-wide and takes precedence over
+            ``ACTINGWEB_JSON_BACKEND``.
+
+        Example:
+            >>> app = ActingWebApp(...).with_json_codec("orjson")
+        """
+        from .. import json_codec
+
+        json_codec.configure(backend)
+        return self
+
     def with_bot(
         self, token: str = "", email: str = "", secret: str = "", admin_room: str = ""
     ) -> "ActingWebApp":
@@ -544,38 +696,94 @@ class ActingWebApp:
         self._apply_runtime_changes_to_config()
         return self
 
-    def with_thread_pool_workers(self, workers: int) -> "ActingWebApp":
+    def with_thread_pool_workers(
+        self, workers: int, max_workers: int | None = None
+    ) -> "ActingWebApp":
         """Configure thread pool size for FastAPI integration.
 
         The thread pool is used to execute synchronous ActingWeb handlers
         (database operations, HTTP requests) without blocking the async event loop.
+        It keeps ``workers`` threads and starts more, up to ``max_workers``,
+        while requests are waiting for a thread; the extra threads exit after
+        a minute without work.
 
         Tuning guidelines:
-        - Default: 10 workers (suitable for most applications)
+        - Default: 10 workers, growing to 64 (suitable for most applications)
         - Low traffic: 5 workers (reduces memory overhead)
         - High traffic: 20-50 workers (handles more concurrent requests)
-        - Lambda: 5-10 workers (limited by function concurrency)
+        - Lambda: 5-10 workers with max_workers equal to workers (limited by
+          function concurrency)
         - Container: Scale based on CPU cores (e.g., 2-5 per core)
 
         Memory overhead: ~8MB per worker thread on average.
 
+        Async hooks called from sync code (``hook_executor``) are spread over
+        ``workers`` event loops, with any integration.
+
         Args:
-            workers: Number of thread pool workers. Must be between 1 and 100.
+            workers: Number of thread pool workers kept running. Must be between
+                1 and 100.
+            max_workers: Upper bound the pool grows to under load. Must be
+                between ``workers`` and 1000. Defaults to ``max(workers, 64)``.
 
         Returns:
             Self for method chaining.
 
         Raises:
-            ValueError: If workers is outside the valid range [1, 100].
+            ValueError: If workers is outside the valid range [1, 100] or
+                max_workers is outside [workers, 1000].
 
         Example:
-            >>> app = ActingWebApp(...).with_thread_pool_workers(20)
+            >>> app = ActingWebApp(...).with_thread_pool_workers(20, max_workers=200)
         """
         if not 1 <= workers <= 100:
             raise ValueError(
                 f"Thread pool workers must be between 1 and 100, got {workers}"
             )
+        if max_workers is not None and not workers <= max_workers <= 1000:
+            raise ValueError(
+                f"Thread pool max_workers must be between {workers} and 1000, "
+                f"got {max_workers}"
+            )
         self._thread_pool_workers = workers
+        self._thread_pool_max_workers = max_workers
+        hook_executor.configure(workers)
+        return self
+
+    def with_cache_coherence(
+        self, enable: bool = True, ttl_seconds: float = 1.0
+    ) -> "ActingWebApp":
+        """Keep per-actor caches coherent across worker processes.
+
+        Trust permission overrides, peer permissions, peer profiles, peer
+        capabilities and the permission evaluator's effective permissions are
+        cached per process. Without coherence, a change handled by one
+        gunicorn/uvicorn worker is not seen by the others until their entries
+        are evicted. When enabled, every write bumps a generation counter row
+        stored on the actor, and each worker re-reads an actor's counter at
+        most once per ``ttl_seconds``, dropping its cached entries for that
+        actor when the counter moved.
+
+        Args:
+            enable: Whether to enable cache coherence. Default True.
+            ttl_seconds: How long a worker trusts its last read of an actor's
+                counter, i.e. the upper bound on how long another worker's
+                change can go unnoticed. Default 1 second. Must be >= 0.
+
+        Returns:
+            Self for method chaining.
+
+        Raises:
+            ValueError: If ttl_seconds is negative.
+
+        Example:
+            >>> app = ActingWebApp(...).with_cache_coherence(ttl_seconds=2.0)
+        """
+        if ttl_seconds < 0:
+            raise ValueError(f"ttl_seconds must be >= 0, got {ttl_seconds}")
+        self._cache_coherence = enable
+        self._cache_coherence_ttl = float(ttl_seconds)
+        self._apply_runtime_changes_to_config()
         return self
 
     def with_peer_profile(
@@ -1307,6 +1515,14 @@ class ActingWebApp:
             self._config.spa_redirect_origins = list(self._spa_redirect_origins)
             # Allowed CORS origins for the SPA OAuth endpoints
             self._config.spa_cors_origins = list(self._spa_cors_origins)
+            # Cross-worker cache coherence
+            self._config.cache_coherence = self._cache_coherence
+            self._config.cache_coherence_ttl = self._cache_coherence_ttl
+            self._config.www_fragment_cache = self._www_fragment_cache
+            self._config.stream_listings_min_items = self._stream_listings_min_items
+            self._config.property_snapshot_max_actors = (
+                self._property_snapshot_max_actors
+            )
             self._attach_service_registry_to_config()
             # Attach hooks to config so OAuth2 and other modules can access them
             self._config._hooks = self.hooks
@@ -1367,6 +1583,41 @@ class ActingWebApp:
         except Exception as e:
             logger.info(f"Table pre-warm skipped: {e}")
 
+    def _precompute_mcp_catalog(self) -> None:
+        """Build the MCP tool/resource/prompt descriptors before serving traffic.
+
+        Saves the first ``tools/list`` the work of walking the hook registry.
+        Hooks registered after integration still show up: the catalog is
+        rebuilt when the registry changes.
+        """
+        if not self._enable_mcp:
+            return
+        try:
+            from ..mcp.catalog import get_catalog
+
+            get_catalog(self.hooks)
+        except Exception as e:
+            import logging
+
+            logging.getLogger(__name__).debug(f"Could not precompute MCP catalog: {e}")
+
+    def _prebuild_discovery_documents(self) -> None:
+        """Encode the OAuth2/MCP discovery documents before serving traffic.
+
+        They are rebuilt on next use if ``update_supported_options()`` or
+        another config change alters them.
+        """
+        try:
+            from .. import discovery
+
+            discovery.prebuild(self.get_config())
+        except Exception as e:
+            import logging
+
+            logging.getLogger(__name__).debug(
+                f"Could not prebuild discovery documents: {e}"
+            )
+
     def _check_lookup_backfill_needed(self) -> None:
         """Warn loudly when reverse lookups would silently miss.
 
@@ -1434,6 +1685,9 @@ class ActingWebApp:
             ) from e
         self._prewarm_dynamodb_tables()
         self._check_lookup_backfill_needed()
+        self.hooks.build_dispatch_table()
+        self._precompute_mcp_catalog()
+        self._prebuild_discovery_documents()
         integration = FlaskIntegration(self, flask_app)
         integration.setup_routes()
         return integration
@@ -1465,11 +1719,15 @@ class ActingWebApp:
 
         self._prewarm_dynamodb_tables()
         self._check_lookup_backfill_needed()
+        self.hooks.build_dispatch_table()
+        self._precompute_mcp_catalog()
+        self._prebuild_discovery_documents()
         integration = FastAPIIntegration(
             self,
             fastapi_app,
             templates_dir=templates_dir,
             thread_pool_workers=self._thread_pool_workers,
+            thread_pool_max_workers=self._thread_pool_max_workers,
         )
         integration.setup_routes()
         return integration
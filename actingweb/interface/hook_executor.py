@@ -0,0 +1,239 @@
+"""
+Running async hooks from sync code.
+
+Sync handlers (Flask, and the sync paths of the FastAPI integration) call
+async hooks through ``HookRegistry``'s sync ``execute_*_hooks()`` methods.
+Those used to build and tear down an event loop per hook call with
+``asyncio.run()``, plus a one-thread pool per call when the caller's thread
+already ran a loop. Property hooks fire on every property read and write, so
+that cost was paid on the hot path.
+
+:func:`run_async_hook` instead runs the hook on a small pool of event loops,
+each kept running on a daemon thread for the life of the process:
+
+- The caller's ContextVars (request context, the MCP ``RuntimeContext``) are
+  copied into the hook's task, as ``asyncio.run()`` under ``ctx.run()`` did.
+- Each call goes to the least busy loop, the first one on a tie, so loops
+  beyond the first only start when hooks run concurrently. A hook that blocks
+  instead of awaiting (calling the sync actor, property or DB APIs, say)
+  holds up only the hooks on its own loop.
+- Loop-bound resources the hook uses, such as the ``peer_transport`` async
+  client and async DB pools, live as long as their loop and are reused.
+
+The pool has as many loops as the FastAPI handler pool keeps threads
+(``ActingWebApp.with_thread_pool_workers()``, 10 by default). Loops are
+re-created after a fork. A hook bridged from one of the loop threads (an
+async hook calling sync code that runs another async hook) gets a private
+loop on a new thread, since waiting on the pool from inside it could
+deadlock.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import logging
+import os
+import threading
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# Loops in the pool when none is configured: the default number of threads
+# of the FastAPI handler pool
+DEFAULT_LOOPS = 10
+
+
+def _run_private(
+    ctx: contextvars.Context,
+    func: Callable[..., Coroutine[Any, Any, T]],
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """Run ``func`` in ``ctx`` on a new loop on a new thread, and wait."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(ctx.run, asyncio.run, func(*args, **kwargs)).result()
+
+
+class AsyncHookRunner:
+    """An event loop on a daemon thread that sync code hands coroutines to."""
+
+    def __init__(self, name: str = "actingweb-async-hooks") -> None:
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    def owns_current_thread(self) -> bool:
+        """Whether the caller runs on this runner's loop thread."""
+        return threading.current_thread() is self._thread
+
+    def _is_running(self) -> bool:
+        return (
+            self._loop is not None
+            and self._thread is not None
+            and self._pid == os.getpid()
+            and self._thread.is_alive()
+        )
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is not None and self._is_running():
+            return loop
+        with self._lock:
+            loop = self._loop
+            if loop is not None and self._is_running():
+                return loop
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=self._serve, args=(loop,), name=self.name, daemon=True
+            )
+            thread.start()
+            self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            logger.debug(f"Started {self.name} event loop thread")
+            return loop
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def run(
+        self,
+        func: Callable[..., Coroutine[Any, Any, T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run ``func(*args, **kwargs)`` on the loop and wait for its result.
+
+        Exceptions raised by the coroutine are re-raised here.
+        """
+        ctx = contextvars.copy_context()
+        if self.owns_current_thread():
+            return _run_private(ctx, func, *args, **kwargs)
+
+        loop = self._get_loop()
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+
+        def done(task: "asyncio.Task[T]") -> None:
+            if task.cancelled():
+                future.cancel()
+            elif (error := task.exception()) is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(task.result())
+
+        def start() -> None:
+            try:
+                # The task runs in the caller's context, not the loop thread's
+                task = loop.create_task(func(*args, **kwargs), context=ctx)
+            except BaseException as e:
+                future.set_exception(e)
+                return
+            task.add_done_callback(done)
+
+        loop.call_soon_threadsafe(start)
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Stop the loop and its thread; the next :meth:`run` starts new ones."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = self._pid = None
+        if loop is not None and thread is not None and thread.is_alive():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+
+
+class AsyncHookRunnerPool:
+    """``size`` :class:`AsyncHookRunner` loops; each call goes to the least
+    busy one (the first one on a tie)."""
+
+    def __init__(
+        self, size: int = DEFAULT_LOOPS, name: str = "actingweb-async-hooks"
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"Hook loop pool size must be at least 1, got {size}")
+        self.name = name
+        self._runners = [AsyncHookRunner(name=f"{name}-{i}") for i in range(size)]
+        self._busy = [0] * size
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return len(self._runners)
+
+    def _acquire(self) -> int:
+        with self._lock:
+            index = min(range(len(self._busy)), key=self._busy.__getitem__)
+            self._busy[index] += 1
+            return index
+
+    def _release(self, index: int) -> None:
+        with self._lock:
+            self._busy[index] -= 1
+
+    def busy(self) -> int:
+        """Calls in progress on the pool's loops."""
+        with self._lock:
+            return sum(self._busy)
+
+    def run(
+        self,
+        func: Callable[..., Coroutine[Any, Any, T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run ``func(*args, **kwargs)`` on the least busy loop and wait for
+        its result (see :meth:`AsyncHookRunner.run`)."""
+        if any(runner.owns_current_thread() for runner in self._runners):
+            return _run_private(contextvars.copy_context(), func, *args, **kwargs)
+        index = self._acquire()
+        try:
+            return self._runners[index].run(func, *args, **kwargs)
+        finally:
+            self._release(index)
+
+    def shutdown(self) -> None:
+        """Stop the loops and their threads; :meth:`run` starts new ones."""
+        for runner in self._runners:
+            runner.shutdown()
+
+
+_pool = AsyncHookRunnerPool()
+_pool_lock = threading.Lock()
+
+
+def configure(loops: int) -> None:
+    """Use a pool of ``loops`` hook loops from now on.
+
+    ``ActingWebApp.with_thread_pool_workers()`` calls this with the handler
+    pool's size. The previous pool is stopped unless hooks are running on it;
+    then its loops are left to finish them.
+    """
+    global _pool
+    with _pool_lock:
+        if loops == _pool.size:
+            return
+        old, _pool = _pool, AsyncHookRunnerPool(loops)
+    if old.busy() == 0:
+        old.shutdown()
+
+
+def run_async_hook(
+    func: Callable[..., Coroutine[Any, Any, T]], *args: Any, **kwargs: Any
+) -> T:
+    """Run an async hook from sync code on the process' hook loop pool."""
+    return _pool.run(func, *args, **kwargs)
+
+
+def shutdown() -> None:
+    """Stop the hook loops (they restart on the next async hook)."""
+    _pool.shutdown()
@@ -6,14 +6,14 @@ to various ActingWeb events.
 """
 
 import asyncio
-import contextvars
 import inspect
 import logging
 import types
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from enum import Enum
 from typing import (
+    TYPE_CHECKING,
     Any,
     Union,
     get_args,
@@ -22,16 +22,22 @@ from typing import (
     is_typeddict,
 )
 
-# Import permission system for transparent permission checking
-try:
-    from ..permission_evaluator import PermissionResult, get_permission_evaluator
+from .hook_executor import run_async_hook
 
-    PERMISSION_SYSTEM_AVAILABLE = True
-except ImportError:
-    # Fallback definitions for when permission system is not available
-    get_permission_evaluator = None
-    PermissionResult = None
-    PERMISSION_SYSTEM_AVAILABLE = False  # pyright: ignore[reportConstantRedefinition]
+if TYPE_CHECKING:
+    from ..permission_evaluator import PermissionEvaluator
+
+# The permission system is imported on the first hook permission check, not
+# with this module: every app imports hooks, and the evaluator pulls in the
+# actor and storage layers.
+PERMISSION_SYSTEM_AVAILABLE = True
+
+
+def get_permission_evaluator(config: Any) -> "PermissionEvaluator":
+    """Return the permission evaluator for ``config``."""
+    from ..permission_evaluator import get_permission_evaluator as _get_evaluator
+
+    return _get_evaluator(config)
 
 
 def _python_type_to_json_schema(python_type: Any) -> dict[str, Any]:
@@ -323,6 +329,74 @@ def get_hook_metadata(func: Callable[..., Any]) -> HookMetadata:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class HookChain:
+    """The hooks one dispatch runs, in order.
+
+    ``specific`` are registered for the name itself, ``wildcard`` for ``"*"``.
+    An empty chain is falsy.
+    """
+
+    specific: tuple[Callable[..., Any], ...] = ()
+    wildcard: tuple[Callable[..., Any], ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.specific or self.wildcard)
+
+
+NO_HOOKS = HookChain()
+
+
+@dataclass(frozen=True)
+class HookDispatchTable:
+    """Immutable name -> :class:`HookChain` lookups for one registry version.
+
+    Built by :meth:`HookRegistry.build_dispatch_table`. Names without hooks of
+    their own resolve to the wildcard chain, so a lookup is one or two dict
+    reads whatever the number of registered hooks.
+    """
+
+    version: int
+    properties: Mapping[tuple[str, str], HookChain]
+    property_wildcards: Mapping[str, HookChain]
+    callbacks: Mapping[str, HookChain]
+    callback_wildcard: HookChain
+    app_callbacks: Mapping[str, HookChain]
+    methods: Mapping[str, HookChain]
+    method_wildcard: HookChain
+    actions: Mapping[str, HookChain]
+    action_wildcard: HookChain
+
+    def property_hooks(self, property_name: str, operation: str) -> HookChain:
+        return self.properties.get(
+            (property_name, operation)
+        ) or self.property_wildcards.get(operation, NO_HOOKS)
+
+    def callback_hooks(self, callback_name: str) -> HookChain:
+        return self.callbacks.get(callback_name) or self.callback_wildcard
+
+    def app_callback_hooks(self, callback_name: str) -> HookChain:
+        return self.app_callbacks.get(callback_name, NO_HOOKS)
+
+    def method_hooks(self, method_name: str) -> HookChain:
+        return self.methods.get(method_name) or self.method_wildcard
+
+    def action_hooks(self, action_name: str) -> HookChain:
+        return self.actions.get(action_name) or self.action_wildcard
+
+
+def _chains(
+    hooks: dict[str, list[Callable[..., Any]]],
+) -> tuple[Mapping[str, HookChain], HookChain]:
+    wildcard = tuple(hooks.get("*", ()))
+    chains = {
+        name: HookChain(tuple(funcs), wildcard)
+        for name, funcs in list(hooks.items())
+        if funcs
+    }
+    return types.MappingProxyType(chains), HookChain(wildcard=wildcard)
+
+
 class HookRegistry:
     """
     Registry for managing application hooks.
@@ -345,6 +419,60 @@ class HookRegistry:
         self._action_hooks: dict[
             str, list[Callable[..., Any]]
         ] = {}  # New: for action hooks
+        # Bumped on every hook registration; lets derived views such as the
+        # dispatch table and the MCP catalog (actingweb.mcp.catalog) know to
+        # rebuild.
+        self._version = 0
+        self._dispatch: HookDispatchTable | None = None
+
+    def build_dispatch_table(self) -> HookDispatchTable:
+        """Build the lookup table the ``execute_*_hooks()`` methods dispatch from.
+
+        ``ActingWebApp.integrate_*()`` calls this once registration is done.
+        Registering a hook afterwards makes the table stale; the next dispatch
+        builds a new one.
+        """
+        version = self._version
+        star = self._property_hooks.get("*", {})
+        callbacks, callback_wildcard = _chains(self._callback_hooks)
+        app_callbacks, _ = _chains(self._app_callback_hooks)
+        methods, method_wildcard = _chains(self._method_hooks)
+        actions, action_wildcard = _chains(self._action_hooks)
+        table = HookDispatchTable(
+            version=version,
+            properties=types.MappingProxyType(
+                {
+                    (name, operation): HookChain(
+                        tuple(funcs), tuple(star.get(operation, ()))
+                    )
+                    for name, by_operation in list(self._property_hooks.items())
+                    for operation, funcs in by_operation.items()
+                    if funcs
+                }
+            ),
+            property_wildcards=types.MappingProxyType(
+                {
+                    operation: HookChain(wildcard=tuple(funcs))
+                    for operation, funcs in star.items()
+                    if funcs
+                }
+            ),
+            callbacks=callbacks,
+            callback_wildcard=callback_wildcard,
+            app_callbacks=app_callbacks,
+            methods=methods,
+            method_wildcard=method_wildcard,
+            actions=actions,
+            action_wildcard=action_wildcard,
+        )
+        self._dispatch = table
+        return table
+
+    def _dispatch_table(self) -> HookDispatchTable:
+        table = self._dispatch
+        if table is None or table.version != self._version:
+            table = self.build_dispatch_table()
+        return table
 
     def _check_hook_permission(
         self,
@@ -391,7 +519,7 @@ class HookRegistry:
 
             # Get permission evaluator and check access
             if PERMISSION_SYSTEM_AVAILABLE:
-                evaluator = get_permission_evaluator(config)  # type: ignore
+                evaluator = get_permission_evaluator(config)
             else:
                 logger.warning(
                     "Permission system is not available due to failed import."
@@ -423,9 +551,11 @@ class HookRegistry:
                 logger.warning(f"Unknown hook type for permission check: {hook_type}")
                 return True
 
-            if result == PermissionResult.ALLOWED:  # type: ignore
+            from ..permission_evaluator import PermissionResult
+
+            if result == PermissionResult.ALLOWED:
                 return True
-            elif result == PermissionResult.DENIED:  # type: ignore
+            elif result == PermissionResult.DENIED:
                 logger.info(
                     f"Hook access denied: {hook_type}:{resource_name} for {actor_id} -> {peer_id}"
                 )
@@ -461,6 +591,7 @@ class HookRegistry:
         for op in operations:
             if op in self._property_hooks[property_name]:
                 self._property_hooks[property_name][op].append(func)
+        self._version += 1
 
     def register_callback_hook(
         self, callback_name: str, func: Callable[..., Any]
@@ -475,6 +606,7 @@ class HookRegistry:
         if callback_name not in self._callback_hooks:
             self._callback_hooks[callback_name] = []
         self._callback_hooks[callback_name].append(func)
+        self._version += 1
 
     def register_app_callback_hook(
         self, callback_name: str, func: Callable[..., Any]
@@ -489,6 +621,7 @@ class HookRegistry:
         if callback_name not in self._app_callback_hooks:
             self._app_callback_hooks[callback_name] = []
         self._app_callback_hooks[callback_name].append(func)
+        self._version += 1
 
     def register_subscription_hook(self, func: Callable[..., Any]) -> None:
         """
@@ -522,6 +655,7 @@ class HookRegistry:
         if method_name not in self._method_hooks:
             self._method_hooks[method_name] = []
         self._method_hooks[method_name].append(func)
+        self._version += 1
 
     def register_action_hook(self, action_name: str, func: Callable[..., Any]) -> None:
         """
@@ -534,6 +668,7 @@ class HookRegistry:
         if action_name not in self._action_hooks:
             self._action_hooks[action_name] = []
         self._action_hooks[action_name].append(func)
+        self._version += 1
 
     def _execute_hook_in_sync_context(
         self, hook: Callable[..., Any], *args: Any, **kwargs: Any
@@ -543,8 +678,8 @@ class HookRegistry:
         For use in sync contexts only. In async contexts, use the _async methods.
 
         - Sync hooks: Called directly
-        - Async hooks: Executed via asyncio.run() if no event loop exists,
-                       or via thread pool if already in an async context
+        - Async hooks: Run on the process' hook event loop pool (see
+          ``hook_executor``) with the caller's ContextVars, and waited for
 
         Args:
             hook: The hook function to execute
@@ -563,25 +698,9 @@ class HookRegistry:
                     f"Async hook {hook.__name__} called from sync method in async context. "
                     "Consider using execute_*_hooks_async() for better performance."
                 )
-                # Run in a thread pool to avoid event loop conflicts.
-                # Capture the calling thread's context (e.g. the MCP
-                # RuntimeContext set for this request) and run asyncio.run
-                # under it on the worker thread: a bare ThreadPoolExecutor
-                # does not inherit ContextVars automatically, and wrapping
-                # only the coroutine would be too late -- the coroutine's
-                # Task binds its context at creation, inside the worker
-                # thread, where the caller's context is not yet visible.
-                import concurrent.futures
-
-                ctx = contextvars.copy_context()
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(
-                        ctx.run, asyncio.run, hook(*args, **kwargs)
-                    )
-                    return future.result()
             except RuntimeError:
-                # No running loop - safe to create one
-                return asyncio.run(hook(*args, **kwargs))
+                pass
+            return run_async_hook(hook, *args, **kwargs)
         else:
             return hook(*args, **kwargs)
 
@@ -598,16 +717,21 @@ class HookRegistry:
 
         Note: If you have async hooks and are in an async context,
         use execute_property_hooks_async() instead for proper async execution.
-        Async hooks in this method will be executed via asyncio.run() which
-        may cause issues if already in an event loop.
+        Async hooks in this method are run on the shared hook event loop and
+        block the calling thread until they finish.
         """
+        hooks = self._dispatch_table().property_hooks(property_name, operation)
+        if not hooks:
+            # Nothing to run, so nothing to check permission for
+            return value
+
         path = path or []
 
         # Check permission before executing hooks
         if auth_context:
             auth_context["operation"] = operation  # Add operation to context
 
-        property_path = "/".join([property_name] + (path or []))
+        property_path = "/".join([property_name] + path)
         if not self._check_hook_permission(
             "property", property_path, actor, auth_context
         ):
@@ -615,35 +739,31 @@ class HookRegistry:
             return None if operation in ["put", "post"] else value
 
         # Execute hooks for specific property
-        if property_name in self._property_hooks:
-            hooks = self._property_hooks[property_name].get(operation, [])
-            for hook in hooks:
-                try:
-                    value = self._execute_hook_in_sync_context(
-                        hook, actor, operation, value, path
-                    )
-                    if value is None and operation in ["put", "post"]:
-                        # Hook rejected the operation
-                        return None
-                except Exception as e:
-                    logger.error(f"Error in property hook for {property_name}: {e}")
-                    if operation in ["put", "post"]:
-                        return None
+        for hook in hooks.specific:
+            try:
+                value = self._execute_hook_in_sync_context(
+                    hook, actor, operation, value, path
+                )
+                if value is None and operation in ["put", "post"]:
+                    # Hook rejected the operation
+                    return None
+            except Exception as e:
+                logger.error(f"Error in property hook for {property_name}: {e}")
+                if operation in ["put", "post"]:
+                    return None
 
         # Execute hooks for all properties
-        if "*" in self._property_hooks:
-            hooks = self._property_hooks["*"].get(operation, [])
-            for hook in hooks:
-                try:
-                    value = self._execute_hook_in_sync_context(
-                        hook, actor, operation, value, path
-                    )
-                    if value is None and operation in ["put", "post"]:
-                        return None
-                except Exception as e:
-                    logger.error(f"Error in wildcard property hook: {e}")
-                    if operation in ["put", "post"]:
-                        return None
+        for hook in hooks.wildcard:
+            try:
+                value = self._execute_hook_in_sync_context(
+                    hook, actor, operation, value, path
+                )
+                if value is None and operation in ["put", "post"]:
+                    return None
+            except Exception as e:
+                logger.error(f"Error in wildcard property hook: {e}")
+                if operation in ["put", "post"]:
+                    return None
 
         return value
 
@@ -654,39 +774,41 @@ class HookRegistry:
 
         Note: If you have async hooks and are in an async context,
         use execute_callback_hooks_async() instead for proper async execution.
-        Async hooks in this method will be executed via asyncio.run() which
-        may cause issues if already in an event loop.
+        Async hooks in this method are run on the shared hook event loop and
+        block the calling thread until they finish.
         """
+        hooks = self._dispatch_table().callback_hooks(callback_name)
+        if not hooks:
+            return False
+
         processed = False
         result_data: dict[str, Any] | None = None
 
         # Execute hooks for specific callback
-        if callback_name in self._callback_hooks:
-            for hook in self._callback_hooks[callback_name]:
-                try:
-                    hook_result = self._execute_hook_in_sync_context(
-                        hook, actor, callback_name, data
-                    )
-                    if hook_result:
-                        processed = True
-                        if isinstance(hook_result, dict):
-                            result_data = hook_result
-                except Exception as e:
-                    logger.error(f"Error in callback hook for {callback_name}: {e}")
+        for hook in hooks.specific:
+            try:
+                hook_result = self._execute_hook_in_sync_context(
+                    hook, actor, callback_name, data
+                )
+                if hook_result:
+                    processed = True
+                    if isinstance(hook_result, dict):
+                        result_data = hook_result
+            except Exception as e:
+                logger.error(f"Error in callback hook for {callback_name}: {e}")
 
         # Execute hooks for all callbacks
-        if "*" in self._callback_hooks:
-            for hook in self._callback_hooks["*"]:
-                try:
-                    hook_result = self._execute_hook_in_sync_context(
-                        hook, actor, callback_name, data
-                    )
-                    if hook_result:
-                        processed = True
-                        if isinstance(hook_result, dict):
-                            result_data = hook_result
-                except Exception as e:
-                    logger.error(f"Error in wildcard callback hook: {e}")
+        for hook in hooks.wildcard:
+            try:
+                hook_result = self._execute_hook_in_sync_context(
+                    hook, actor, callback_name, data
+                )
+                if hook_result:
+                    processed = True
+                    if isinstance(hook_result, dict):
+                        result_data = hook_result
+            except Exception as e:
+                logger.error(f"Error in wildcard callback hook: {e}")
 
         # Return result data if available, otherwise return processed status
         if result_data is not None:
@@ -700,23 +822,26 @@ class HookRegistry:
 
         Note: If you have async hooks and are in an async context,
         use execute_app_callback_hooks_async() instead for proper async execution.
-        Async hooks in this method will be executed via asyncio.run() which
-        may cause issues if already in an event loop.
+        Async hooks in this method are run on the shared hook event loop and
+        block the calling thread until they finish.
         """
+        hooks = self._dispatch_table().app_callback_hooks(callback_name)
+        if not hooks:
+            return False
+
         processed = False
         result_data: dict[str, Any] | None = None
 
         # Execute hooks for specific callback
-        if callback_name in self._app_callback_hooks:
-            for hook in self._app_callback_hooks[callback_name]:
-                try:
-                    hook_result = self._execute_hook_in_sync_context(hook, data)
-                    if hook_result:
-                        processed = True
-                        if isinstance(hook_result, dict):
-                            result_data = hook_result
-                except Exception as e:
-                    logger.error(f"Error in app callback hook '{callback_name}': {e}")
+        for hook in hooks.specific:
+            try:
+                hook_result = self._execute_hook_in_sync_context(hook, data)
+                if hook_result:
+                    processed = True
+                    if isinstance(hook_result, dict):
+                        result_data = hook_result
+            except Exception as e:
+                logger.error(f"Error in app callback hook '{callback_name}': {e}")
 
         # Return result data if available, otherwise return processed status
         if result_data is not None:
@@ -730,8 +855,8 @@ class HookRegistry:
 
         Note: If you have async hooks and are in an async context,
         use execute_subscription_hooks_async() instead for proper async execution.
-        Async hooks in this method will be executed via asyncio.run() which
-        may cause issues if already in an event loop.
+        Async hooks in this method are run on the shared hook event loop and
+        block the calling thread until they finish.
         """
         processed = False
 
@@ -752,8 +877,8 @@ class HookRegistry:
 
         Note: If you have async hooks and are in an async context,
         use execute_lifecycle_hooks_async() instead for proper async execution.
-        Async hooks in this method will be executed via asyncio.run() which
-        may cause issues if already in an event loop.
+        Async hooks in this method are run on the shared hook event loop and
+        block the calling thread until they finish.
         """
         result = None
 
@@ -781,9 +906,13 @@ class HookRegistry:
 
         Note: If you have async hooks and are in an async context,
         use execute_method_hooks_async() instead for proper async execution.
-        Async hooks in this method will be executed via asyncio.run() which
-        may cause issues if already in an event loop.
+        Async hooks in this method are run on the shared hook event loop and
+        block the calling thread until they finish.
         """
+        hooks = self._dispatch_table().method_hooks(method_name)
+        if not hooks:
+            return None
+
         # Check permission before executing hooks
         if not self._check_hook_permission("method", method_name, actor, auth_context):
             logger.debug(f"Method hook permission denied for {method_name}")
@@ -792,21 +921,20 @@ class HookRegistry:
         result = None
 
         # Execute hooks for specific method
-        if method_name in self._method_hooks:
-            for hook in self._method_hooks[method_name]:
-                try:
-                    hook_result = self._execute_hook_in_sync_context(
-                        hook, actor, method_name, data
-                    )
-                    if hook_result is not None:
-                        result = hook_result
-                        break  # First successful hook wins
-                except Exception as e:
-                    logger.error(f"Error in method hook for {method_name}: {e}")
+        for hook in hooks.specific:
+            try:
+                hook_result = self._execute_hook_in_sync_context(
+                    hook, actor, method_name, data
+                )
+                if hook_result is not None:
+                    result = hook_result
+                    break  # First successful hook wins
+            except Exception as e:
+                logger.error(f"Error in method hook for {method_name}: {e}")
 
         # Execute hooks for all methods if no specific hook handled it
-        if result is None and "*" in self._method_hooks:
-            for hook in self._method_hooks["*"]:
+        if result is None:
+            for hook in hooks.wildcard:
                 try:
                     hook_result = self._execute_hook_in_sync_context(
                         hook, actor, method_name, data
@@ -830,9 +958,13 @@ class HookRegistry:
 
         Note: If you have async hooks and are in an async context,
         use execute_action_hooks_async() instead for proper async execution.
-        Async hooks in this method will be executed via asyncio.run() which
-        may cause issues if already in an event loop.
+        Async hooks in this method are run on the shared hook event loop and
+        block the calling thread until they finish.
         """
+        hooks = self._dispatch_table().action_hooks(action_name)
+        if not hooks:
+            return None
+
         # Check permission before executing hooks
         if not self._check_hook_permission("action", action_name, actor, auth_context):
             logger.debug(f"Action hook permission denied for {action_name}")
@@ -841,21 +973,20 @@ class HookRegistry:
         result = None
 
         # Execute hooks for specific action
-        if action_name in self._action_hooks:
-            for hook in self._action_hooks[action_name]:
-                try:
-                    hook_result = self._execute_hook_in_sync_context(
-                        hook, actor, action_name, data
-                    )
-                    if hook_result is not None:
-                        result = hook_result
-                        break  # First successful hook wins
-                except Exception as e:
-                    logger.error(f"Error in action hook for {action_name}: {e}")
+        for hook in hooks.specific:
+            try:
+                hook_result = self._execute_hook_in_sync_context(
+                    hook, actor, action_name, data
+                )
+                if hook_result is not None:
+                    result = hook_result
+                    break  # First successful hook wins
+            except Exception as e:
+                logger.error(f"Error in action hook for {action_name}: {e}")
 
         # Execute hooks for all actions if no specific hook handled it
-        if result is None and "*" in self._action_hooks:
-            for hook in self._action_hooks["*"]:
+        if result is None:
+            for hook in hooks.wildcard:
                 try:
                     hook_result = self._execute_hook_in_sync_context(
                         hook, actor, action_name, data
@@ -893,6 +1024,10 @@ class HookRegistry:
         Returns:
             Result from the first successful hook, or None
         """
+        hooks = self._dispatch_table().method_hooks(method_name)
+        if not hooks:
+            return None
+
         # Permission check (sync - fast operation)
         if not self._check_hook_permission("method", method_name, actor, auth_context):
             logger.debug(f"Method hook permission denied for {method_name}")
@@ -901,23 +1036,22 @@ class HookRegistry:
         result = None
 
         # Execute hooks for specific method
-        if method_name in self._method_hooks:
-            for hook in self._method_hooks[method_name]:
-                try:
-                    if inspect.iscoroutinefunction(hook):
-                        hook_result = await hook(actor, method_name, data)
-                    else:
-                        hook_result = hook(actor, method_name, data)
+        for hook in hooks.specific:
+            try:
+                if inspect.iscoroutinefunction(hook):
+                    hook_result = await hook(actor, method_name, data)
+                else:
+                    hook_result = hook(actor, method_name, data)
 
-                    if hook_result is not None:
-                        result = hook_result
-                        break  # First successful hook wins
-                except Exception as e:
-                    logger.error(f"Error in method hook for {method_name}: {e}")
+                if hook_result is not None:
+                    result = hook_result
+                    break  # First successful hook wins
+            except Exception as e:
+                logger.error(f"Error in method hook for {method_name}: {e}")
 
         # Execute wildcard hooks if no specific hook handled it
-        if result is None and "*" in self._method_hooks:
-            for hook in self._method_hooks["*"]:
+        if result is None:
+            for hook in hooks.wildcard:
                 try:
                     if inspect.iscoroutinefunction(hook):
                         hook_result = await hook(actor, method_name, data)
@@ -952,28 +1086,31 @@ class HookRegistry:
         Returns:
             Result from the first successful hook, or None
         """
+        hooks = self._dispatch_table().action_hooks(action_name)
+        if not hooks:
+            return None
+
         if not self._check_hook_permission("action", action_name, actor, auth_context):
             logger.debug(f"Action hook permission denied for {action_name}")
             return None
 
         result = None
 
-        if action_name in self._action_hooks:
-            for hook in self._action_hooks[action_name]:
-                try:
-                    if inspect.iscoroutinefunction(hook):
-                        hook_result = await hook(actor, action_name, data)
-                    else:
-                        hook_result = hook(actor, action_name, data)
+        for hook in hooks.specific:
+            try:
+                if inspect.iscoroutinefunction(hook):
+                    hook_result = await hook(actor, action_name, data)
+                else:
+                    hook_result = hook(actor, action_name, data)
 
-                    if hook_result is not None:
-                        result = hook_result
-                        break
-                except Exception as e:
-                    logger.error(f"Error in action hook for {action_name}: {e}")
+                if hook_result is not None:
+                    result = hook_result
+                    break
+            except Exception as e:
+                logger.error(f"Error in action hook for {action_name}: {e}")
 
-        if result is None and "*" in self._action_hooks:
-            for hook in self._action_hooks["*"]:
+        if result is None:
+            for hook in hooks.wildcard:
                 try:
                     if inspect.iscoroutinefunction(hook):
                         hook_result = await hook(actor, action_name, data)
@@ -1010,13 +1147,17 @@ class HookRegistry:
         Returns:
             Modified property value or None if operation was rejected
         """
+        hooks = self._dispatch_table().property_hooks(property_name, operation)
+        if not hooks:
+            return value
+
         path = path or []
 
         # Check permission before executing hooks
         if auth_context:
             auth_context["operation"] = operation  # Add operation to context
 
-        property_path = "/".join([property_name] + (path or []))
+        property_path = "/".join([property_name] + path)
         if not self._check_hook_permission(
             "property", property_path, actor, auth_context
         ):
@@ -1024,39 +1165,35 @@ class HookRegistry:
             return None if operation in ["put", "post"] else value
 
         # Execute hooks for specific property
-        if property_name in self._property_hooks:
-            hooks = self._property_hooks[property_name].get(operation, [])
-            for hook in hooks:
-                try:
-                    if inspect.iscoroutinefunction(hook):
-                        value = await hook(actor, operation, value, path)
-                    else:
-                        value = hook(actor, operation, value, path)
+        for hook in hooks.specific:
+            try:
+                if inspect.iscoroutinefunction(hook):
+                    value = await hook(actor, operation, value, path)
+                else:
+                    value = hook(actor, operation, value, path)
 
-                    if value is None and operation in ["put", "post"]:
-                        # Hook rejected the operation
-                        return None
-                except Exception as e:
-                    logger.error(f"Error in property hook for {property_name}: {e}")
-                    if operation in ["put", "post"]:
-                        return None
+                if value is None and operation in ["put", "post"]:
+                    # Hook rejected the operation
+                    return None
+            except Exception as e:
+                logger.error(f"Error in property hook for {property_name}: {e}")
+                if operation in ["put", "post"]:
+                    return None
 
         # Execute hooks for all properties
-        if "*" in self._property_hooks:
-            hooks = self._property_hooks["*"].get(operation, [])
-            for hook in hooks:
-                try:
-                    if inspect.iscoroutinefunction(hook):
-                        value = await hook(actor, operation, value, path)
-                    else:
-                        value = hook(actor, operation, value, path)
+        for hook in hooks.wildcard:
+            try:
+                if inspect.iscoroutinefunction(hook):
+                    value = await hook(actor, operation, value, path)
+                else:
+                    value = hook(actor, operation, value, path)
 
-                    if value is None and operation in ["put", "post"]:
-                        return None
-                except Exception as e:
-                    logger.error(f"Error in wildcard property hook: {e}")
-                    if operation in ["put", "post"]:
-                        return None
+                if value is None and operation in ["put", "post"]:
+                    return None
+            except Exception as e:
+                logger.error(f"Error in wildcard property hook: {e}")
+                if operation in ["put", "post"]:
+                    return None
 
         return value
 
@@ -1073,40 +1210,42 @@ class HookRegistry:
         Returns:
             True if processed, or result data dict
         """
+        hooks = self._dispatch_table().callback_hooks(callback_name)
+        if not hooks:
+            return False
+
         processed = False
         result_data: dict[str, Any] | None = None
 
         # Execute hooks for specific callback
-        if callback_name in self._callback_hooks:
-            for hook in self._callback_hooks[callback_name]:
-                try:
-                    if inspect.iscoroutinefunction(hook):
-                        hook_result = await hook(actor, callback_name, data)
-                    else:
-                        hook_result = hook(actor, callback_name, data)
+        for hook in hooks.specific:
+            try:
+                if inspect.iscoroutinefunction(hook):
+                    hook_result = await hook(actor, callback_name, data)
+                else:
+                    hook_result = hook(actor, callback_name, data)
 
-                    if hook_result:
-                        processed = True
-                        if isinstance(hook_result, dict):
-                            result_data = hook_result
-                except Exception as e:
-                    logger.error(f"Error in callback hook for {callback_name}: {e}")
+                if hook_result:
+                    processed = True
+                    if isinstance(hook_result, dict):
+                        result_data = hook_result
+            except Exception as e:
+                logger.error(f"Error in callback hook for {callback_name}: {e}")
 
         # Execute hooks for all callbacks
-        if "*" in self._callback_hooks:
-            for hook in self._callback_hooks["*"]:
-                try:
-                    if inspect.iscoroutinefunction(hook):
-                        hook_result = await hook(actor, callback_name, data)
-                    else:
-                        hook_result = hook(actor, callback_name, data)
+        for hook in hooks.wildcard:
+            try:
+                if inspect.iscoroutinefunction(hook):
+                    hook_result = await hook(actor, callback_name, data)
+                else:
+                    hook_result = hook(actor, callback_name, data)
 
-                    if hook_result:
-                        processed = True
-                        if isinstance(hook_result, dict):
-                            result_data = hook_result
-                except Exception as e:
-                    logger.error(f"Error in wildcard callback hook: {e}")
+                if hook_result:
+                    processed = True
+                    if isinstance(hook_result, dict):
+                        result_data = hook_result
+            except Exception as e:
+                logger.error(f"Error in wildcard callback hook: {e}")
 
         # Return result data if available, otherwise return processed status
         if result_data is not None:
@@ -1125,24 +1264,27 @@ class HookRegistry:
         Returns:
             True if processed, or result data dict
         """
+        hooks = self._dispatch_table().app_callback_hooks(callback_name)
+        if not hooks:
+            return False
+
         processed = False
         result_data: dict[str, Any] | None = None
 
         # Execute hooks for specific callback
-        if callback_name in self._app_callback_hooks:
-            for hook in self._app_callback_hooks[callback_name]:
-                try:
-                    if inspect.iscoroutinefunction(hook):
-                        hook_result = await hook(data)
-                    else:
-                        hook_result = hook(data)
+        for hook in hooks.specific:
+            try:
+                if inspect.iscoroutinefunction(hook):
+                    hook_result = await hook(data)
+                else:
+                    hook_result = hook(data)
 
-                    if hook_result:
-                        processed = True
-                        if isinstance(hook_result, dict):
-                            result_data = hook_result
-                except Exception as e:
-                    logger.error(f"Error in app callback hook '{callback_name}': {e}")
+                if hook_result:
+                    processed = True
+                    if isinstance(hook_result, dict):
+                        result_data = hook_result
+            except Exception as e:
+                logger.error(f"Error in app callback hook '{callback_name}': {e}")
 
         # Return result data if available, otherwise return processed status
         if result_data is not None:
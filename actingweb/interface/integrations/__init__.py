@@ -2,24 +2,35 @@
 Web framework integrations for ActingWeb.
 
 Provides seamless integration with popular Python web frameworks.
+
+The integration classes are imported on first access, so using one framework
+never imports the other.
 """
 
-try:
-    from .flask_integration import FlaskIntegration
+import importlib
+import importlib.util
+from typing import Any
+
+# class -> (module, framework package it needs)
+_INTEGRATIONS = {
+    "FlaskIntegration": (".flask_integration", "flask"),
+    "FastAPIIntegration": (".fastapi_integration", "fastapi"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    entry = _INTEGRATIONS.get(name)
+    if entry is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(entry[0], __name__), name)
 
-    _flask_available = True
-except ImportError:
-    _flask_available = False
 
-try:
-    from .fastapi_integration import FastAPIIntegration
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_INTEGRATIONS))
 
-    _fastapi_available = True
-except ImportError:
-    _fastapi_available = False
 
-__all__ = []
-if _flask_available:
-    __all__.append("FlaskIntegration")
-if _fastapi_available:
-    __all__.append("FastAPIIntegration")
+__all__ = [
+    name
+    for name, (_, framework) in _INTEGRATIONS.items()
+    if importlib.util.find_spec(framework) is not None
+]
@@ -0,0 +1,235 @@
+"""
+Thread pool for the synchronous handlers of the FastAPI integration.
+
+Most ActingWeb handlers are synchronous and spend their time waiting on
+storage and on peers, not on the CPU. Behind a fixed ``ThreadPoolExecutor``
+of ``with_thread_pool_workers()`` threads (10 by default) the eleventh
+concurrent request waits for a thread even though the process is idle, so
+throughput was capped by the pool size rather than by I/O.
+
+:class:`AdaptiveThreadPoolExecutor` keeps ``min_workers`` threads and starts
+more, up to ``max_workers``, whenever work is queued and no thread is idle.
+Threads above ``min_workers`` exit after ``idle_timeout`` seconds without
+work. The time each call spends queued before a thread picks it up is
+recorded and reported by :meth:`AdaptiveThreadPoolExecutor.stats`; waits
+above ``slow_wait_threshold`` are logged, as they mean ``max_workers`` is
+too low for the load.
+"""
+
+import collections
+import concurrent.futures
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# max_workers when only the number of core threads is configured
+DEFAULT_MAX_WORKERS = 64
+
+# Number of recent queue waits kept for the p95 in ExecutorStats
+WAIT_SAMPLES = 1024
+
+# Minimum seconds between two "slow queue wait" warnings
+SLOW_WAIT_LOG_INTERVAL = 60.0
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    """Snapshot of an :class:`AdaptiveThreadPoolExecutor` (times in seconds)."""
+
+    workers: int
+    idle_workers: int
+    peak_workers: int
+    min_workers: int
+    max_workers: int
+    queued: int
+    completed: int
+    queue_wait_avg: float
+    queue_wait_p95: float
+    queue_wait_max: float
+
+
+class _WorkItem:
+    __slots__ = ("future", "fn", "args", "kwargs", "enqueued_at")
+
+    def __init__(
+        self,
+        future: concurrent.futures.Future[Any],
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.enqueued_at = time.monotonic()
+
+
+class AdaptiveThreadPoolExecutor(concurrent.futures.Executor):
+    """A thread pool that grows with its queue between two bounds.
+
+    Usable wherever a ``concurrent.futures.Executor`` is, including
+    ``loop.run_in_executor()``.
+    """
+
+    def __init__(
+        self,
+        min_workers: int = 10,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        idle_timeout: float = 60.0,
+        thread_name_prefix: str = "aw-handler",
+        slow_wait_threshold: float = 0.5,
+    ) -> None:
+        if min_workers < 1:
+            raise ValueError(f"min_workers must be at least 1, got {min_workers}")
+        if max_workers < min_workers:
+            raise ValueError(
+                f"max_workers ({max_workers}) must be >= min_workers ({min_workers})"
+            )
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.idle_timeout = idle_timeout
+        self.thread_name_prefix = thread_name_prefix
+        self.slow_wait_threshold = slow_wait_threshold
+
+        self._queue: queue.SimpleQueue[_WorkItem | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads: set[threading.Thread] = set()
+        self._thread_counter = 0
+        self._idle = 0
+        self._queued = 0
+        self._peak = 0
+        self._shutdown = False
+
+        self._waits: collections.deque[float] = collections.deque(maxlen=WAIT_SAMPLES)
+        self._completed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._last_slow_log = float("-inf")
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future[Any]:
+        future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queue.put(_WorkItem(future, fn, args, kwargs))
+            self._queued += 1
+            if self._queued > self._idle and len(self._threads) < self.max_workers:
+                self._start_worker()
+        return future
+
+    def _start_worker(self) -> None:
+        # Called with self._lock held
+        self._thread_counter += 1
+        thread = threading.Thread(
+            target=self._work,
+            name=f"{self.thread_name_prefix}_{self._thread_counter}",
+            daemon=True,
+        )
+        self._threads.add(thread)
+        self._peak = max(self._peak, len(self._threads))
+        thread.start()
+
+    def _work(self) -> None:
+        me = threading.current_thread()
+        while True:
+            with self._lock:
+                self._idle += 1
+            try:
+                item = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    self._idle -= 1
+                    # Stay if work arrived after the timeout counted on us
+                    if (
+                        len(self._threads) > self.min_workers
+                        and self._queued <= self._idle
+                    ):
+                        self._threads.discard(me)
+                        return
+                continue
+            with self._lock:
+                self._idle -= 1
+                if item is None:
+                    self._threads.discard(me)
+                    return
+                self._queued -= 1
+            self._run(item)
+
+    def _run(self, item: _WorkItem) -> None:
+        if not item.future.set_running_or_notify_cancel():
+            return
+        self._record_wait(time.monotonic() - item.enqueued_at)
+        try:
+            result = item.fn(*item.args, **item.kwargs)
+        except BaseException as e:
+            item.future.set_exception(e)
+        else:
+            item.future.set_result(result)
+
+    def _record_wait(self, wait: float) -> None:
+        with self._lock:
+            self._waits.append(wait)
+            self._completed += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            workers = len(self._threads)
+            queued = self._queued
+            now = time.monotonic()
+            log_slow = (
+                wait >= self.slow_wait_threshold
+                and now - self._last_slow_log >= SLOW_WAIT_LOG_INTERVAL
+            )
+            if log_slow:
+                self._last_slow_log = now
+        if log_slow:
+            logger.warning(
+                f"{self.thread_name_prefix} call waited {wait * 1000:.0f} ms for a "
+                f"thread ({workers}/{self.max_workers} threads, {queued} queued); "
+                f"consider raising max_workers"
+            )
+
+    def stats(self) -> ExecutorStats:
+        """Current pool size and queue-wait figures."""
+        with self._lock:
+            waits = sorted(self._waits)
+            completed = self._completed
+            return ExecutorStats(
+                workers=len(self._threads),
+                idle_workers=self._idle,
+                peak_workers=self._peak,
+                min_workers=self.min_workers,
+                max_workers=self.max_workers,
+                queued=self._queued,
+                completed=completed,
+                queue_wait_avg=self._wait_total / completed if completed else 0.0,
+                queue_wait_p95=waits[int(len(waits) * 0.95)] if waits else 0.0,
+                queue_wait_max=self._wait_max,
+            )
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        self._queued -= 1
+                        item.future.cancel()
+            for _ in threads:
+                self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
@@ -5,8 +5,9 @@ This module contains common handler selection logic, utility methods, and
 patterns used by both Flask and FastAPI integrations.
 """
 
+import importlib
 import os
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from ...config import Config
@@ -14,6 +15,34 @@ if TYPE_CHECKING:
     from ..app import ActingWebApp
 
 
+# endpoint -> (handler module, class, class in "async_<module>" or None).
+# Handler modules are imported on the first request that needs them, so a
+# deployment only pays for the endpoints it actually serves.
+_ENDPOINT_HANDLERS: dict[str, tuple[str, str, str | None]] = {
+    "root": ("root", "RootHandler", None),
+    "meta": ("meta", "MetaHandler", None),
+    "www": ("www", "WwwHandler", None),
+    "properties": ("properties", "PropertiesHandler", "AsyncPropertiesHandler"),
+    "permissions": ("permissions", "PermissionsHandler", None),
+    "resources": ("resources", "ResourcesHandler", None),
+    "callbacks": ("callbacks", "CallbacksHandler", None),
+    "devtest": ("devtest", "DevtestHandler", None),
+    "methods": ("methods", "MethodsHandler", "AsyncMethodsHandler"),
+    "actions": ("actions", "ActionsHandler", "AsyncActionsHandler"),
+}
+
+
+def load_handler(module: str, class_name: str) -> "type[base_handler.BaseHandler]":
+    """Return handler class ``class_name`` from ``actingweb.handlers.<module>``.
+
+    Imports the module on first use.
+    """
+    handler_class = getattr(
+        importlib.import_module(f"actingweb.handlers.{module}"), class_name
+    )
+    return cast("type[base_handler.BaseHandler]", handler_class)
+
+
 def default_templates_dir() -> str:
     """Absolute path to the library's built-in default web-UI templates.
 
@@ -38,6 +67,21 @@ class BaseActingWebIntegration:
     def __init__(self, aw_app: "ActingWebApp"):
         """Initialize base integration with ActingWeb app."""
         self.aw_app = aw_app
+        self._www_fragment_cache: Any = None
+
+    def get_www_fragment_cache(self) -> Any:
+        """The www rendered-page cache, or None unless it is enabled.
+
+        See ``with_web_ui(fragment_cache=True)`` and
+        :mod:`actingweb.interface.integrations.www_templates`.
+        """
+        if not getattr(self.aw_app.get_config(), "www_fragment_cache", False):
+            return None
+        if self._www_fragment_cache is None:
+            from .www_templates import FragmentCache
+
+            self._www_fragment_cache = FragmentCache()
+        return self._www_fragment_cache
 
     def get_handler_class(
         self,
@@ -61,70 +105,18 @@ class BaseActingWebIntegration:
         Returns:
             Handler instance or None if no handler matches
         """
-        from ...handlers import (
-            actions,
-            async_actions,
-            async_methods,
-            callbacks,
-            devtest,
-            meta,
-            methods,
-            permissions,
-            properties,
-            resources,
-            root,
-            www,
-        )
-
         # Check if we should use async handlers (for FastAPI)
         # Subclasses can override _prefer_async_handlers() to return True
         prefer_async = getattr(self, "_prefer_async_handlers", lambda: False)()
-
-        # Create handler dictionary - most endpoints map directly to handlers
-        handlers = {
-            "root": lambda: root.RootHandler(webobj, config, hooks=self.aw_app.hooks),
-            "meta": lambda: meta.MetaHandler(webobj, config, hooks=self.aw_app.hooks),
-            "www": lambda: www.WwwHandler(webobj, config, hooks=self.aw_app.hooks),
-            "properties": lambda: properties.PropertiesHandler(
-                webobj, config, hooks=self.aw_app.hooks
-            ),
-            "permissions": lambda: permissions.PermissionsHandler(
-                webobj, config, hooks=self.aw_app.hooks
-            ),
-            "resources": lambda: resources.ResourcesHandler(
-                webobj, config, hooks=self.aw_app.hooks
-            ),
-            "callbacks": lambda: callbacks.CallbacksHandler(
-                webobj, config, hooks=self.aw_app.hooks
-            ),
-            "devtest": lambda: devtest.DevtestHandler(
-                webobj, config, hooks=self.aw_app.hooks
-            ),
-            "methods": lambda: (
-                async_methods.AsyncMethodsHandler(
-                    webobj, config, hooks=self.aw_app.hooks
-                )
-                if prefer_async
-                else methods.MethodsHandler(webobj, config, hooks=self.aw_app.hooks)
-            ),
-            "actions": lambda: (
-                async_actions.AsyncActionsHandler(
-                    webobj, config, hooks=self.aw_app.hooks
-                )
-                if prefer_async
-                else actions.ActionsHandler(webobj, config, hooks=self.aw_app.hooks)
-            ),
-        }
-
         # Special handling for properties metadata endpoint
         if endpoint == "properties" and kwargs.get("metadata"):
-            return properties.PropertyMetadataHandler(
+            return load_handler("properties", "PropertyMetadataHandler")(
                 webobj, config, hooks=self.aw_app.hooks
             )
 
         # Special handling for properties list items endpoint
         if endpoint == "properties" and kwargs.get("items"):
-            return properties.PropertyListItemsHandler(
+            return load_handler("properties", "PropertyListItemsHandler")(
                 webobj, config, hooks=self.aw_app.hooks
             )
 
@@ -137,10 +129,13 @@ class BaseActingWebIntegration:
             return self._get_subscription_handler(webobj, config, kwargs)
 
         # Standard handler lookup
-        if endpoint in handlers:
-            return handlers[endpoint]()
-
-        return None
+        entry = _ENDPOINT_HANDLERS.get(endpoint)
+        if entry is None:
+            return None
+        module, class_name, async_class_name = entry
+        if prefer_async and async_class_name:
+            module, class_name = f"async_{module}", async_class_name
+        return load_handler(module, class_name)(webobj, config, hooks=self.aw_app.hooks)
 
     def _get_trust_handler(
         self,
@@ -160,7 +155,7 @@ class BaseActingWebIntegration:
         Special case: UI forms that send GET /trust/<peerid>?_method=DELETE|PUT
         are treated as peer operations (TrustPeerHandler).
         """
-        from ...handlers import async_trust, trust
+        from ...handlers import trust
 
         # Check if we should use async handlers (for FastAPI)
         prefer_async = getattr(self, "_prefer_async_handlers", lambda: False)()
@@ -194,6 +189,8 @@ class BaseActingWebIntegration:
         if len(path_parts) == 0:
             # Root trust endpoint - use async handler for POST (trust creation)
             if prefer_async:
+                from ...handlers import async_trust
+
                 return async_trust.AsyncTrustHandler(
                     webobj, config, hooks=self.aw_app.hooks
                 )
@@ -208,6 +205,13 @@ class BaseActingWebIntegration:
                     webobj, config, hooks=self.aw_app.hooks
                 )
         else:
+            # Peer endpoint - use async handler for PUT (approval notifies the peer)
+            if prefer_async:
+                from ...handlers import async_trust
+
+                return async_trust.AsyncTrustPeerHandler(
+                    webobj, config, hooks=self.aw_app.hooks
+                )
             return trust.TrustPeerHandler(webobj, config, hooks=self.aw_app.hooks)
 
     def _get_subscription_handler(
@@ -220,6 +224,7 @@ class BaseActingWebIntegration:
 
         Subscription endpoints follow this pattern:
         - GET/POST /subscriptions -> SubscriptionRootHandler
+          (AsyncSubscriptionRootHandler for async frameworks)
         - GET /subscriptions/{peerid} -> SubscriptionRelationshipHandler
         - GET/DELETE /subscriptions/{peerid}/{subid} -> SubscriptionHandler
         - GET /subscriptions/{peerid}/{subid}/diffs -> SubscriptionDiffHandler (subid may be numeric)
@@ -227,6 +232,9 @@ class BaseActingWebIntegration:
         """
         from ...handlers import subscription
 
+        # Check if we should use async handlers (for FastAPI)
+        prefer_async = getattr(self, "_prefer_async_handlers", lambda: False)()
+
         peerid = kwargs.get("peerid")
         subid = kwargs.get("subid")
         seqnr = kwargs.get("seqnr")
@@ -235,6 +243,13 @@ class BaseActingWebIntegration:
         path_parts = [p for p in [peerid, subid] if p]
 
         if len(path_parts) == 0:
+            # Root endpoint - use async handler for POST (subscribes to the peer)
+            if prefer_async:
+                from ...handlers import async_subscription
+
+                return async_subscription.AsyncSubscriptionRootHandler(
+                    webobj, config, hooks=self.aw_app.hooks
+                )
             return subscription.SubscriptionRootHandler(
                 webobj, config, hooks=self.aw_app.hooks
             )
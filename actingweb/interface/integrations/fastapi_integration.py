@@ -7,25 +7,34 @@ with async support.
 
 import asyncio
 import base64
-import concurrent.futures
 import contextvars
 import inspect
 import json
 import logging
 import re
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable
 from typing import TYPE_CHECKING, Any
 
 from fastapi import FastAPI, HTTPException, Request, Response
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    RedirectResponse,
+    StreamingResponse,
+)
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from ... import request_context, runtime_context
+from ... import discovery, json_codec, request_context, runtime_context
 from ...aw_web_request import AWWebObj
-from ...handlers import bot, factory, services
+from .adaptive_executor import (
+    DEFAULT_MAX_WORKERS,
+    AdaptiveThreadPoolExecutor,
+    ExecutorStats,
+)
 from .base_integration import BaseActingWebIntegration, default_templates_dir
+from .www_templates import prepare_environment, www_template_for
 
 if TYPE_CHECKING:
     from ..app import ActingWebApp
@@ -398,7 +407,7 @@ async def get_json_body(request: Request) -> dict[str, Any]:
         body = await request.body()
         if not body:
             return {}
-        parsed_json = json.loads(body.decode("utf-8"))
+        parsed_json = json_codec.loads(body.decode("utf-8"))
         return parsed_json if isinstance(parsed_json, dict) else {}
     except (json.JSONDecodeError, UnicodeDecodeError):
         return {}
@@ -518,6 +527,7 @@ class FastAPIIntegration(BaseActingWebIntegration):
         fastapi_app: FastAPI,
         templates_dir: str | None = None,
         thread_pool_workers: int = 10,
+        thread_pool_max_workers: int | None = None,
     ):
         super().__init__(aw_app)
         self.fastapi_app = fastapi_app
@@ -530,14 +540,22 @@ class FastAPIIntegration(BaseActingWebIntegration):
             template_dirs.append(templates_dir)
         template_dirs.append(default_templates_dir())
         self.templates = Jinja2Templates(directory=template_dirs)
+        prepare_environment(self.templates.env, precompile=bool(aw_app.get_config().ui))
         self.logger = logging.getLogger(__name__)
-        # Thread pool for running synchronous ActingWeb handlers
-        # Size is configurable via ActingWebApp.with_thread_pool_workers()
-        self.executor = concurrent.futures.ThreadPoolExecutor(
-            max_workers=thread_pool_workers, thread_name_prefix="aw-handler"
+        # Thread pool for running synchronous ActingWeb handlers. It keeps
+        # thread_pool_workers threads and grows up to thread_pool_max_workers
+        # while requests are queued; both are set with
+        # ActingWebApp.with_thread_pool_workers()
+        if thread_pool_max_workers is None:
+            thread_pool_max_workers = max(thread_pool_workers, DEFAULT_MAX_WORKERS)
+        self.executor = AdaptiveThreadPoolExecutor(
+            min_workers=thread_pool_workers,
+            max_workers=thread_pool_max_workers,
+            thread_name_prefix="aw-handler",
         )
         self.logger.info(
-            f"FastAPI thread pool initialized with {thread_pool_workers} workers"
+            f"FastAPI thread pool initialized with {thread_pool_workers} workers "
+            f"(up to {thread_pool_max_workers} under load)"
         )
         # Add request context middleware for logging correlation
         self.fastapi_app.add_middleware(RequestContextMiddleware)
@@ -591,6 +609,10 @@ class FastAPIIntegration(BaseActingWebIntegration):
         """
         return True
 
+    def executor_stats(self) -> ExecutorStats:
+        """Size and queue-wait statistics of the handler thread pool."""
+        return self.executor.stats()
+
     def shutdown(self) -> None:
         """Shutdown the thread pool executor."""
         if hasattr(self, "executor"):
@@ -896,7 +918,7 @@ class FastAPIIntegration(BaseActingWebIntegration):
         # OAuth2 Discovery endpoints using OAuth2EndpointsHandler
         @self.fastapi_app.get("/.well-known/oauth-authorization-server")
         @self.fastapi_app.options("/.well-known/oauth-authorization-server")
-        async def oauth_discovery(request: Request) -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        async def oauth_discovery(request: Request) -> Response:  # pyright: ignore[reportUnusedFunction]
             """OAuth2 Authorization Server Discovery endpoint (RFC 8414)."""
             return await self._handle_oauth2_discovery_endpoint(
                 request, ".well-known/oauth-authorization-server"
@@ -904,7 +926,7 @@ class FastAPIIntegration(BaseActingWebIntegration):
 
         @self.fastapi_app.get("/.well-known/oauth-protected-resource")
         @self.fastapi_app.options("/.well-known/oauth-protected-resource")
-        async def oauth_protected_resource_discovery(request: Request) -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        async def oauth_protected_resource_discovery(request: Request) -> Response:  # pyright: ignore[reportUnusedFunction]
             """OAuth2 Protected Resource discovery endpoint."""
             return await self._handle_oauth2_discovery_endpoint(
                 request, ".well-known/oauth-protected-resource"
@@ -914,7 +936,7 @@ class FastAPIIntegration(BaseActingWebIntegration):
         @self.fastapi_app.options("/.well-known/oauth-protected-resource/mcp")
         async def oauth_protected_resource_mcp_discovery(
             request: Request,
-        ) -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        ) -> Response:  # pyright: ignore[reportUnusedFunction]
             """OAuth2 Protected Resource discovery endpoint for MCP."""
             return await self._handle_oauth2_discovery_endpoint(
                 request, ".well-known/oauth-protected-resource/mcp"
@@ -922,9 +944,9 @@ class FastAPIIntegration(BaseActingWebIntegration):
 
         # MCP information endpoint
         @self.fastapi_app.get("/mcp/info")
-        async def mcp_info() -> dict[str, Any]:  # pyright: ignore[reportUnusedFunction]
+        async def mcp_info(request: Request) -> Response:  # pyright: ignore[reportUnusedFunction]
             """MCP information endpoint."""
-            return self._create_mcp_info_response()
+            return self._discovery_response(request, "mcp/info")
 
         # Actor root
         @self.fastapi_app.get("/{actor_id}")
@@ -1376,10 +1398,28 @@ class FastAPIIntegration(BaseActingWebIntegration):
         else:
             # Create appropriate response based on content type
             content_type = webobj.response.headers.get("Content-Type", "")
-            if "application/json" in content_type:
+            if webobj.response.stream is not None:
+                # Streamed listing (AWResponse.write_stream): chunked
+                response = StreamingResponse(
+                    self._stream_body(webobj.response.stream),
+                    status_code=webobj.response.status_code,
+                    media_type=content_type,
+                )
+            elif "application/json" in content_type and isinstance(
+                webobj.response.body, bytes
+            ):
+                # Already encoded (e.g. a pre-encoded /meta document)
+                response = Response(
+                    content=webobj.response.body,
+                    status_code=webobj.response.status_code,
+                    media_type=content_type,
+                )
+            elif "application/json" in content_type:
                 try:
                     json_content = (
-                        json.loads(webobj.response.body) if webobj.response.body else {}
+                        json_codec.loads(webobj.response.body)
+                        if webobj.response.body
+                        else {}
                     )
                     response = JSONResponse(
                         content=json_content, status_code=webobj.response.status_code
@@ -1419,6 +1459,31 @@ class FastAPIIntegration(BaseActingWebIntegration):
 
         return response
 
+    def _stream_body(self, chunks: Iterable[str | bytes]) -> AsyncIterator[str | bytes]:
+        """Read a streamed handler body chunk by chunk in the handler thread
+        pool, with the request's context (handlers' generators read the
+        database as they go)."""
+        ctx = contextvars.copy_context()
+        iterator = iter(chunks)
+
+        async def body() -> AsyncIterator[str]:
+            loop = asyncio.get_running_loop()
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(
+                        self.executor, _run_with_context, ctx, next, iterator, None
+                    )
+                    if chunk is None:
+                        return
+                    yield chunk
+            finally:
+                # Client went away: let the handler's generators clean up
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+
+        return body()
+
     async def _handle_factory_request(self, request: Request) -> Response:
         """Handle factory requests (actor creation)."""
         req_data = await self._normalize_request(request)
@@ -1518,6 +1583,8 @@ class FastAPIIntegration(BaseActingWebIntegration):
                 return oauth_redirect
 
         # Always use the standard factory handler
+        from ...handlers import factory
+
         handler = factory.RootFactoryHandler(
             webobj, self.aw_app.get_config(), hooks=self.aw_app.hooks
         )
@@ -1605,6 +1672,8 @@ class FastAPIIntegration(BaseActingWebIntegration):
         )
 
         # Call the factory handler's get() method to populate OAuth template variables
+        from ...handlers import factory
+
         handler = factory.RootFactoryHandler(
             webobj, self.aw_app.get_config(), hooks=self.aw_app.hooks
         )
@@ -1651,7 +1720,7 @@ class FastAPIIntegration(BaseActingWebIntegration):
             # Try to get email from JSON body first
             if req_data["data"]:
                 try:
-                    data = json.loads(req_data["data"])
+                    data = json_codec.loads(req_data["data"])
                     email = data.get("creator") or data.get("email")
                 except (json.JSONDecodeError, ValueError):
                     pass
@@ -1731,6 +1800,8 @@ class FastAPIIntegration(BaseActingWebIntegration):
             )
 
             # Use the standard factory handler
+            from ...handlers import factory
+
             handler = factory.RootFactoryHandler(
                 webobj, self.aw_app.get_config(), hooks=self.aw_app.hooks
             )
@@ -1796,7 +1867,7 @@ class FastAPIIntegration(BaseActingWebIntegration):
                 webobj.response.set_redirect(redirect_url)
             else:
                 # Convert result to JSON response
-                webobj.response.body = json.dumps(result).encode("utf-8")
+                webobj.response.body = json_codec.dumps(result).encode("utf-8")
                 webobj.response.headers["Content-Type"] = "application/json"
 
         # Handle OAuth2 errors with template rendering for better UX
@@ -1844,7 +1915,7 @@ class FastAPIIntegration(BaseActingWebIntegration):
             if redirect_url:
                 webobj.response.set_redirect(redirect_url)
             else:
-                webobj.response.body = json.dumps(result).encode("utf-8")
+                webobj.response.body = json_codec.dumps(result).encode("utf-8")
                 webobj.response.headers["Content-Type"] = "application/json"
         elif (
             isinstance(result, dict)
@@ -2321,6 +2392,8 @@ class FastAPIIntegration(BaseActingWebIntegration):
             cookies=req_data["cookies"],
         )
 
+        from ...handlers import bot
+
         handler = bot.BotHandler(
             webobj=webobj, config=self.aw_app.get_config(), hooks=self.aw_app.hooks
         )
@@ -2332,6 +2405,10 @@ class FastAPIIntegration(BaseActingWebIntegration):
 
     async def _handle_mcp_request(self, request: Request) -> Response:
         """Handle MCP requests with async handler for optimal performance."""
+        if request.method == "GET":
+            # Server discovery: the same document for every client
+            return self._discovery_response(request, "mcp")
+
         req_data = await self._normalize_request(request)
         webobj = AWWebObj(
             url=req_data["url"],
@@ -2349,13 +2426,11 @@ class FastAPIIntegration(BaseActingWebIntegration):
         )
 
         # Execute async methods directly - no thread pool bouncing
-        if request.method == "GET":
-            result = await handler.get_async()
-        elif request.method == "POST":
+        if request.method == "POST":
             # Parse JSON body for POST requests
             try:
                 if webobj.request.body:
-                    data = json.loads(webobj.request.body)
+                    data = json_codec.loads(webobj.request.body)
                 else:
                     data = {}
             except (json.JSONDecodeError, ValueError):
@@ -2381,8 +2456,18 @@ class FastAPIIntegration(BaseActingWebIntegration):
 
     async def _handle_oauth2_discovery_endpoint(
         self, request: Request, endpoint: str
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle OAuth2 discovery endpoints that return JSON directly."""
+        # Add CORS headers directly for OAuth2 discovery endpoints
+        cors_headers = {
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Methods": "GET, OPTIONS",
+            "Access-Control-Allow-Headers": "Authorization, Content-Type, mcp-protocol-version",
+            "Access-Control-Max-Age": "86400",
+        }
+        if request.method != "OPTIONS":
+            return self._discovery_response(request, endpoint, cors_headers)
+
         req_data = await self._normalize_request(request)
         webobj = AWWebObj(
             url=req_data["url"],
@@ -2399,21 +2484,22 @@ class FastAPIIntegration(BaseActingWebIntegration):
         )
 
         # Run the synchronous handler in a thread pool
-        if request.method == "OPTIONS":
-            result = await self._run_in_executor_with_context(handler.options, endpoint)
-        else:
-            result = await self._run_in_executor_with_context(handler.get, endpoint)
-
-        # Add CORS headers directly for OAuth2 discovery endpoints
-        cors_headers = {
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, OPTIONS",
-            "Access-Control-Allow-Headers": "Authorization, Content-Type, mcp-protocol-version",
-            "Access-Control-Max-Age": "86400",
-        }
+        result = await self._run_in_executor_with_context(handler.options, endpoint)
 
         return JSONResponse(content=result, headers=cors_headers)
 
+    def _discovery_response(
+        self, request: Request, name: str, headers: dict[str, str] | None = None
+    ) -> Response:
+        """Serve a pre-encoded discovery document, or 304 if the client has it."""
+        document = discovery.get_document(self.aw_app.get_config(), name)
+        headers = {**(headers or {}), **document.headers}
+        if document.matches(request.headers.get("if-none-match")):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=document.body, media_type=document.content_type, headers=headers
+        )
+
     async def _handle_actor_request(
         self, request: Request, actor_id: str, endpoint: str, **kwargs: Any
     ) -> Response:
@@ -2565,21 +2651,7 @@ class FastAPIIntegration(BaseActingWebIntegration):
             and webobj.response.status_code == 200
             and self.templates
         ):
-            path = kwargs.get("path", "")
-            template_map = {
-                "": "aw-actor-www-root.html",
-                "init": "aw-actor-www-init.html",
-                "properties": "aw-actor-www-properties.html",
-                "property": "aw-actor-www-property.html",
-                "trust": "aw-actor-www-trust.html",
-                "trust/new": "aw-actor-www-trust-new.html",
-            }
-            template_name = template_map.get(path)
-
-            # Handle individual property pages like "properties/notes", "properties/demo_version"
-            if not template_name and path.startswith("properties/"):
-                # This is an individual property page
-                template_name = "aw-actor-www-property.html"
+            template_name = www_template_for(kwargs.get("path", ""))
 
             # Check for custom template name from callback hook
             if (
@@ -2590,10 +2662,22 @@ class FastAPIIntegration(BaseActingWebIntegration):
                 template_name = webobj.response.template_name
 
             if template_name:
-                return self.templates.TemplateResponse(
-                    request,
-                    template_name,
-                    context=webobj.response.template_values,
+                fragment_cache = self.get_www_fragment_cache()
+                if fragment_cache is None:
+                    return self.templates.TemplateResponse(
+                        request,
+                        template_name,
+                        context=webobj.response.template_values,
+                    )
+                values = webobj.response.template_values or {}
+                template = self.templates.get_template(template_name)
+                return HTMLResponse(
+                    fragment_cache.render(
+                        actor_id,
+                        template,
+                        values,
+                        lambda: template.render({**values, "request": request}),
+                    )
                 )
 
         return self._create_fastapi_response(webobj, request)
@@ -2655,36 +2739,12 @@ class FastAPIIntegration(BaseActingWebIntegration):
 
     def _create_mcp_info_response(self) -> dict[str, Any]:
         """Create MCP information response."""
-        config = self.aw_app.get_config()
-        base_url = f"{config.proto}{config.fqdn}"
-
-        return {
-            "mcp_enabled": True,
-            "mcp_endpoint": "/mcp",
-            "authentication": {
-                "type": "oauth2",
-                "provider": "actingweb",
-                "required_scopes": ["mcp"],
-                "flow": "authorization_code",
-                "auth_url": f"{base_url}/oauth/authorize",
-                "token_url": f"{base_url}/oauth/token",
-                "callback_url": f"{base_url}/oauth/callback",
-                "registration_endpoint": f"{base_url}/oauth/register",
-                "authorization_endpoint": f"{base_url}/oauth/authorize",
-                "token_endpoint": f"{base_url}/oauth/token",
-                "discovery_url": f"{base_url}/.well-known/oauth-authorization-server",
-                "resource_discovery_url": f"{base_url}/.well-known/oauth-protected-resource",
-                "enabled": True,
-            },
-            "supported_features": ["tools", "prompts"],
-            "tools_count": 4,
-            "prompts_count": 3,
-            "actor_lookup": "email_based",
-            "description": "ActingWeb MCP Demo - AI can interact with actors through MCP protocol using OAuth2",
-        }
+        return discovery.mcp_info(self.aw_app.get_config())
 
     def _create_services_handler(self, webobj: AWWebObj, config) -> Any:
         """Create services handler with service registry injection."""
+        from ...handlers import services
+
         handler = services.ServicesHandler(webobj, config, hooks=self.aw_app.hooks)
         # Inject service registry into the handler so it can access it
         handler._service_registry = self.aw_app.get_service_registry()
@@ -8,13 +8,20 @@ import logging
 import re
 from typing import TYPE_CHECKING, Any
 
-from flask import Flask, Response, redirect, render_template, request
+from flask import (
+    Flask,
+    Response,
+    redirect,
+    render_template,
+    request,
+    stream_with_context,
+)
 from werkzeug.wrappers import Response as WerkzeugResponse
 
-from ... import request_context, runtime_context
+from ... import discovery, json_codec, request_context, runtime_context
 from ...aw_web_request import AWWebObj
-from ...handlers import bot, factory, mcp, services
 from .base_integration import BaseActingWebIntegration, default_templates_dir
+from .www_templates import prepare_environment, www_template_for
 
 if TYPE_CHECKING:
     from ..app import ActingWebApp
@@ -34,6 +41,9 @@ class FlaskIntegration(BaseActingWebIntegration):
         super().__init__(aw_app)
         self.flask_app = flask_app
         self._install_default_templates()
+        prepare_environment(
+            self.flask_app.jinja_env, precompile=bool(aw_app.get_config().ui)
+        )
         self._setup_context_hooks()
 
     def _install_default_templates(self) -> None:
@@ -309,9 +319,9 @@ class FlaskIntegration(BaseActingWebIntegration):
 
         # MCP information endpoint
         @self.flask_app.route("/mcp/info", methods=["GET"])
-        def mcp_info() -> dict[str, Any]:  # pyright: ignore[reportUnusedFunction]
+        def mcp_info() -> Response:  # pyright: ignore[reportUnusedFunction]
             """MCP information endpoint."""
-            return self._create_mcp_info_response()
+            return self._discovery_response("mcp/info")
 
         # Actor root
         @self.flask_app.route("/<actor_id>", methods=["GET", "POST", "DELETE"])
@@ -625,6 +635,13 @@ class FlaskIntegration(BaseActingWebIntegration):
         """Convert ActingWeb response to Flask response."""
         if webobj.response.redirect:
             response = redirect(webobj.response.redirect, code=302)
+        elif webobj.response.stream is not None:
+            # Streamed listing (AWResponse.write_stream): chunked
+            response = Response(
+                response=stream_with_context(iter(webobj.response.stream)),
+                status=webobj.response.status_message,
+                headers=webobj.response.headers,
+            )
         else:
             response = Response(
                 response=webobj.response.body,
@@ -717,6 +734,8 @@ class FlaskIntegration(BaseActingWebIntegration):
                 return oauth_redirect
 
         # Use the standard factory handler
+        from ...handlers import factory
+
         handler = factory.RootFactoryHandler(
             webobj, self.aw_app.get_config(), hooks=self.aw_app.hooks
         )
@@ -820,7 +839,7 @@ class FlaskIntegration(BaseActingWebIntegration):
             # Try to get email from JSON body first
             if req_data["data"]:
                 try:
-                    data = json.loads(req_data["data"])
+                    data = json_codec.loads(req_data["data"])
                     email = data.get("creator") or data.get("email")
                 except (json.JSONDecodeError, ValueError):
                     pass
@@ -898,6 +917,8 @@ class FlaskIntegration(BaseActingWebIntegration):
             )
 
             # Use the standard factory handler
+            from ...handlers import factory
+
             handler = factory.RootFactoryHandler(
                 webobj, self.aw_app.get_config(), hooks=self.aw_app.hooks
             )
@@ -947,6 +968,8 @@ class FlaskIntegration(BaseActingWebIntegration):
             cookies=req_data["cookies"],
         )
 
+        from ...handlers import bot
+
         handler = bot.BotHandler(
             webobj=webobj, config=self.aw_app.get_config(), hooks=self.aw_app.hooks
         )
@@ -1373,6 +1396,16 @@ class FlaskIntegration(BaseActingWebIntegration):
         self, endpoint: str
     ) -> Response | WerkzeugResponse | str:
         """Handle OAuth2 discovery endpoints that return JSON directly."""
+        # Add CORS headers directly for OAuth2 discovery endpoints
+        cors_headers = {
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Methods": "GET, OPTIONS",
+            "Access-Control-Allow-Headers": "Authorization, Content-Type, mcp-protocol-version",
+            "Access-Control-Max-Age": "86400",
+        }
+        if request.method != "OPTIONS":
+            return self._discovery_response(endpoint, cors_headers)
+
         req_data = self._normalize_request()
         webobj = AWWebObj(
             url=req_data["url"],
@@ -1388,26 +1421,34 @@ class FlaskIntegration(BaseActingWebIntegration):
             webobj, self.aw_app.get_config(), hooks=self.aw_app.hooks
         )
 
-        if request.method == "OPTIONS":
-            result = handler.options(endpoint)
-        else:
-            result = handler.get(endpoint)
-
-        # Add CORS headers directly for OAuth2 discovery endpoints
         from flask import jsonify
 
-        response = jsonify(result)
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Methods"] = "GET, OPTIONS"
-        response.headers["Access-Control-Allow-Headers"] = (
-            "Authorization, Content-Type, mcp-protocol-version"
-        )
-        response.headers["Access-Control-Max-Age"] = "86400"
+        response = jsonify(handler.options(endpoint))
+        response.headers.update(cors_headers)
 
         return response
 
+    def _discovery_response(
+        self, name: str, headers: dict[str, str] | None = None
+    ) -> Response:
+        """Serve a pre-encoded discovery document, or 304 if the client has it."""
+        document = discovery.get_document(self.aw_app.get_config(), name)
+        headers = {**(headers or {}), **document.headers}
+        if document.matches(request.headers.get("If-None-Match")):
+            return Response(status=304, headers=headers)
+        return Response(
+            document.body,
+            status=200,
+            mimetype=document.content_type,
+            headers=headers,
+        )
+
     def _handle_mcp_request(self) -> Response | WerkzeugResponse | str:
         """Handle MCP requests."""
+        if request.method == "GET":
+            # Server discovery: the same document for every client
+            return self._discovery_response("mcp")
+
         req_data = self._normalize_request()
         webobj = AWWebObj(
             url=req_data["url"],
@@ -1417,20 +1458,20 @@ class FlaskIntegration(BaseActingWebIntegration):
             cookies=req_data["cookies"],
         )
 
+        from ...handlers import mcp
+
         handler = mcp.MCPHandler(
             webobj, self.aw_app.get_config(), hooks=self.aw_app.hooks
         )
 
         # Execute appropriate method based on request method
-        if request.method == "GET":
-            result = handler.get()
-        elif request.method == "POST":
+        if request.method == "POST":
             import json
 
             # Parse JSON body for POST requests
             try:
                 if webobj.request.body:
-                    data = json.loads(webobj.request.body)
+                    data = json_codec.loads(webobj.request.body)
                 else:
                     data = {}
             except (json.JSONDecodeError, ValueError):
@@ -1679,48 +1720,19 @@ class FlaskIntegration(BaseActingWebIntegration):
         ):
             path = kwargs.get("path", "")
             template_values = webobj.response.template_values or {}
+            template_name = www_template_for(path)
+            if (
+                not template_name
+                and hasattr(webobj.response, "template_name")
+                and webobj.response.template_name
+            ):
+                # Custom template from callback hook
+                template_name = webobj.response.template_name
             try:
-                if not path:
-                    return Response(
-                        render_template("aw-actor-www-root.html", **template_values)
-                    )
-                elif path == "init":
+                if template_name:
                     return Response(
-                        render_template("aw-actor-www-init.html", **template_values)
-                    )
-                elif path == "properties":
-                    return Response(
-                        render_template(
-                            "aw-actor-www-properties.html", **template_values
-                        )
-                    )
-                elif path == "property":
-                    return Response(
-                        render_template("aw-actor-www-property.html", **template_values)
-                    )
-                elif path == "trust/new":
-                    return Response(
-                        render_template(
-                            "aw-actor-www-trust-new.html", **template_values
-                        )
-                    )
-                elif path.startswith("properties/"):
-                    # Handle individual property pages like "properties/notes", "properties/demo_version"
-                    return Response(
-                        render_template("aw-actor-www-property.html", **template_values)
-                    )
-                elif path == "trust":
-                    return Response(
-                        render_template("aw-actor-www-trust.html", **template_values)
-                    )
-                elif (
-                    hasattr(webobj.response, "template_name")
-                    and webobj.response.template_name
-                ):
-                    # Custom template from callback hook
-                    return Response(
-                        render_template(
-                            webobj.response.template_name, **template_values
+                        self._render_www_template(
+                            actor_id, template_name, template_values
                         )
                     )
             except Exception as e:
@@ -1729,6 +1741,23 @@ class FlaskIntegration(BaseActingWebIntegration):
 
         return self._create_flask_response(webobj)
 
+    def _render_www_template(
+        self, actor_id: str, template_name: str, template_values: dict[str, Any]
+    ) -> str:
+        """Render a www page, through the fragment cache when it is enabled."""
+        fragment_cache = self.get_www_fragment_cache()
+        if fragment_cache is None:
+            return render_template(template_name, **template_values)
+        template = self.flask_app.jinja_env.get_template(template_name)
+        return str(
+            fragment_cache.render(
+                actor_id,
+                template,
+                template_values,
+                lambda: render_template(template, **template_values),
+            )
+        )
+
     def _get_handler(
         self,
         endpoint: str,
@@ -1791,36 +1820,12 @@ class FlaskIntegration(BaseActingWebIntegration):
 
     def _create_mcp_info_response(self) -> dict[str, Any]:
         """Create MCP information response."""
-        config = self.aw_app.get_config()
-        base_url = f"{config.proto}{config.fqdn}"
-
-        return {
-            "mcp_enabled": True,
-            "mcp_endpoint": "/mcp",
-            "authentication": {
-                "type": "oauth2",
-                "provider": "actingweb",
-                "required_scopes": ["mcp"],
-                "flow": "authorization_code",
-                "auth_url": f"{base_url}/oauth/authorize",
-                "token_url": f"{base_url}/oauth/token",
-                "callback_url": f"{base_url}/oauth/callback",
-                "registration_endpoint": f"{base_url}/oauth/register",
-                "authorization_endpoint": f"{base_url}/oauth/authorize",
-                "token_endpoint": f"{base_url}/oauth/token",
-                "discovery_url": f"{base_url}/.well-known/oauth-authorization-server",
-                "resource_discovery_url": f"{base_url}/.well-known/oauth-protected-resource",
-                "enabled": True,
-            },
-            "supported_features": ["tools", "prompts"],
-            "tools_count": 4,
-            "prompts_count": 3,
-            "actor_lookup": "email_based",
-            "description": "ActingWeb MCP Demo - AI can interact with actors through MCP protocol using OAuth2",
-        }
+        return discovery.mcp_info(self.aw_app.get_config())
 
     def _create_services_handler(self, webobj: AWWebObj, config) -> Any:
         """Create services handler with service registry injection."""
+        from ...handlers import services
+
         handler = services.ServicesHandler(webobj, config, hooks=self.aw_app.hooks)
         # Inject service registry into the handler so it can access it
         handler._service_registry = self.aw_app.get_service_registry()
@@ -0,0 +1,117 @@
+"""
+Template set-up and rendered-page caching for the actor web UI (``/<actor_id>/www``).
+
+Both integrations render the www pages with Jinja2. Two things keep that
+cheap:
+
+- :func:`prepare_environment` gives the Jinja2 environment a bytecode cache
+  (so a new worker process loads compiled templates instead of parsing them)
+  and compiles the www templates when the app is built, not on the first
+  page view.
+- :class:`FragmentCache`, enabled with ``with_web_ui(fragment_cache=True)``,
+  keeps each actor's last rendering of each page. A page is rendered again
+  only when its data version -- a digest of the template values the handler
+  produced -- or the template itself changes. Rendering a trust page for an
+  actor with hundreds of relationships is then one digest of the values
+  instead of a template walk over every row.
+
+A cached page is a function of its template values only. Custom templates
+that read anything else (``request``, ``session``, context processors) should
+not be used with the fragment cache.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from jinja2 import Environment, FileSystemBytecodeCache, Template
+
+from ...cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# www path -> template, for the pages WwwHandler renders itself
+WWW_TEMPLATES = {
+    "": "aw-actor-www-root.html",
+    "init": "aw-actor-www-init.html",
+    "properties": "aw-actor-www-properties.html",
+    "property": "aw-actor-www-property.html",
+    "trust": "aw-actor-www-trust.html",
+    "trust/new": "aw-actor-www-trust-new.html",
+}
+
+DEFAULT_FRAGMENT_CACHE_ENTRIES = 1000
+
+
+def www_template_for(path: str) -> str | None:
+    """The template for www ``path``, or None for custom (hook) pages."""
+    template_name = WWW_TEMPLATES.get(path)
+    if not template_name and path.startswith("properties/"):
+        # Individual property pages like "properties/notes"
+        template_name = WWW_TEMPLATES["property"]
+    return template_name
+
+
+def prepare_environment(env: Environment, precompile: bool = True) -> None:
+    """Add a bytecode cache to ``env`` and compile the www templates.
+
+    The bytecode cache is Jinja2's ``FileSystemBytecodeCache`` in its default
+    per-user temporary directory; an environment that already has one keeps
+    it. Failures are logged and leave ``env`` as it was: templates are then
+    compiled on first use, as before.
+    """
+    if env.bytecode_cache is None:
+        try:
+            env.bytecode_cache = FileSystemBytecodeCache()
+        except Exception as e:
+            logger.debug(f"Jinja2 bytecode cache unavailable: {e}")
+    if not precompile:
+        return
+    for template_name in WWW_TEMPLATES.values():
+        try:
+            env.get_template(template_name)
+        except Exception as e:
+            logger.debug(f"Could not precompile {template_name}: {e}")
+
+
+def data_version(values: dict[str, Any]) -> str | None:
+    """A digest of ``values``, or None if they are not plain JSON data."""
+    try:
+        encoded = json.dumps(values, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class FragmentCache:
+    """Each actor's last rendering of each www template."""
+
+    def __init__(self, max_entries: int = DEFAULT_FRAGMENT_CACHE_ENTRIES) -> None:
+        # (actor id, template name) -> (template, data version, html)
+        self._cache = TTLCache("www_fragments", max_entries=max_entries)
+
+    def render(
+        self,
+        actor_id: str,
+        template: Template,
+        values: dict[str, Any],
+        render: Callable[[], str],
+    ) -> str:
+        """The rendered page, from the cache if ``values`` are unchanged."""
+        version = data_version(values)
+        if version is None:
+            return render()
+        key = (actor_id, template.name)
+        hit, cached = self._cache.lookup(key)
+        # A reloaded template (auto_reload) is a new Template object
+        if hit and cached[0] is template and cached[1] == version:
+            html: str = cached[2]
+            return html
+        html = render()
+        self._cache.put(key, (template, version, html))
+        return html
+
+    def stats(self) -> dict[str, Any]:
+        return self._cache.stats()
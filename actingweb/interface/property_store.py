@@ -2,11 +2,11 @@
 Simplified property store interface for ActingWeb actors.
 """
 
-import json
 import logging
 from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any, Optional
 
+from .. import json_codec
 from ..property import PropertyStore as CorePropertyStore
 from ..property_list import ListItemHandle
 
@@ -83,7 +83,7 @@ class PropertyStore:
             return
 
         try:
-            blob = json.dumps(value) if value is not None else ""
+            blob = json_codec.encode(value) if value is not None else ""
             self._actor.register_diffs(
                 target="properties",
                 subtarget=key,
@@ -310,7 +310,7 @@ class NotifyingListProperty:
                 target="properties",
                 subtarget=self._list_name,
                 resource=None,
-                blob=json.dumps(diff_info),
+                blob=json_codec.encode(diff_info),
             )
         except Exception as e:
             logger.warning(f"Error registering diff for list {self._list_name}: {e}")
@@ -3,9 +3,11 @@ Simplified subscription management for ActingWeb actors.
 """
 
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from .. import json_codec
 from ..actor import Actor as CoreActor
 from ..subscription import Subscription as CoreSubscription
 
@@ -106,6 +108,15 @@ class SubscriptionWithDiffs:
             return []
         return diffs if isinstance(diffs, list) else []
 
+    def iter_diffs(self) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over the pending diffs of this subscription.
+
+        The same diffs as get_diffs(), read from the database a page at a
+        time as the iteration proceeds, for listings that are streamed.
+        """
+        return iter(self._core_sub.iter_diffs())
+
     def get_diff(self, seqnr: int) -> dict[str, Any] | None:
         """
         Get a specific diff by sequence number.
@@ -375,6 +386,8 @@ class SubscriptionManager:
             if url:
                 print(f"Subscribed and synced: {url}")
         """
+        import asyncio
+
         # Create the remote subscription
         # Note: This respects sync_subscription_callbacks config internally
         # for Lambda/serverless compatibility
@@ -424,7 +437,7 @@ class SubscriptionManager:
                 peer_id=peer_id,
                 validate_peer_id=False,
             )
-            store.apply_resync_data(transformed_data)
+            await asyncio.to_thread(store.apply_resync_data, transformed_data)
             logger.info(f"Stored initial baseline for {peer_id} from {target}")
 
         # Fetch peer metadata during initial subscription (independent of storage)
@@ -468,9 +481,7 @@ class SubscriptionManager:
 
         This will trigger callbacks to all actors subscribed to this target.
         """
-        import json
-
-        blob = json.dumps(data) if isinstance(data, dict) else str(data)
+        blob = json_codec.encode(data) if isinstance(data, dict) else str(data)
 
         self._core_actor.register_diffs(
             target=target,
@@ -1354,11 +1365,13 @@ class SubscriptionManager:
         Returns:
             Transformed data with lists in format {"property_name": {"_list": true, "items": [...]}}
         """
+        import asyncio
+
         # Create result dict (shallow copy)
         result = dict(baseline_data)
 
-        # Get proxy for fetching list items from remote peer
-        proxy = self._get_peer_proxy(peer_id)
+        # Get proxy for fetching list items from remote peer (reads the trust)
+        proxy = await asyncio.to_thread(self._get_peer_proxy, peer_id)
         if proxy is None or proxy.trust is None:
             logger.warning(
                 f"No trust with peer {peer_id}, skipping list transformation"
@@ -2176,6 +2189,8 @@ class SubscriptionManager:
         Returns:
             Transformed baseline data dict, or None if fetch failed
         """
+        import asyncio
+
         # Construct full target path
         target_path = target
         if subtarget:
@@ -2183,8 +2198,8 @@ class SubscriptionManager:
         if resource:
             target_path = f"{target_path}/{resource}"
 
-        # Get proxy for peer communication
-        proxy = self._get_peer_proxy(peer_id)
+        # Get proxy for peer communication (reads the trust)
+        proxy = await asyncio.to_thread(self._get_peer_proxy, peer_id)
         if not proxy:
             logger.warning(f"Cannot fetch baseline for {peer_id}: no proxy available")
             return None
@@ -2439,6 +2454,8 @@ class SubscriptionManager:
         Args:
             peer_id: ID of the peer to refresh metadata for
         """
+        import asyncio
+
         actor_id = self._core_actor.id
         actor_config = self._core_actor.config
 
@@ -2461,7 +2478,7 @@ class SubscriptionManager:
                     attributes=actor_config.peer_profile_attributes,
                 )
                 store = get_peer_profile_store(actor_config)
-                store.store_profile(profile)
+                await asyncio.to_thread(store.store_profile, profile)
                 logger.debug(f"Refreshed peer profile for {peer_id}")
             except Exception as e:
                 logger.warning(f"Failed to refresh peer profile: {e}")
@@ -2484,7 +2501,7 @@ class SubscriptionManager:
                     config=actor_config,
                 )
                 store = get_cached_capabilities_store(actor_config)
-                store.store_capabilities(capabilities)
+                await asyncio.to_thread(store.store_capabilities, capabilities)
                 logger.debug(f"Refreshed peer capabilities for {peer_id}")
             except Exception as e:
                 logger.warning(f"Failed to refresh peer capabilities: {e}")
@@ -2507,7 +2524,7 @@ class SubscriptionManager:
                     config=actor_config,
                 )
                 store = get_peer_permission_store(actor_config)
-                store.store_permissions(permissions)
+                await asyncio.to_thread(store.store_permissions, permissions)
                 logger.debug(f"Refreshed peer permissions for {peer_id}")
             except Exception as e:
                 logger.warning(f"Failed to refresh peer permissions: {e}")
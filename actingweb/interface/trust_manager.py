@@ -603,6 +603,14 @@ class TrustManager:
                     logger.info(
                         f"Successfully created OAuth trust relationship: peer_id={peer_id}, trust_type={trust_type}, source={source}"
                     )
+                    # Created via DbTrust directly, bypassing Trust.create().
+                    from ..permission_evaluator import (
+                        invalidate_effective_permissions,
+                    )
+
+                    invalidate_effective_permissions(
+                        self._core_actor.id, self._core_actor.config
+                    )
                 else:
                     logger.error(
                         f"Failed to create OAuth trust relationship in database: peer_id={peer_id}"
@@ -727,6 +735,30 @@ class TrustManager:
         )
         return bool(result)
 
+    async def modify_and_notify_async(
+        self,
+        peer_id: str,
+        relationship: str,
+        baseuri: str = "",
+        approved: bool | None = None,
+        peer_approved: bool | None = None,
+        description: str = "",
+    ) -> bool:
+        """Async variant of modify_and_notify for use in async contexts (FastAPI).
+
+        The peer is notified with a non-blocking HTTP call; the database
+        reads and update run in a worker thread.
+        """
+        result = await self._core_actor.modify_trust_and_notify_async(
+            peerid=peer_id,
+            relationship=relationship,
+            baseuri=baseuri if baseuri else "",
+            approved=approved,
+            peer_approved=peer_approved,
+            desc=description if description else "",
+        )
+        return bool(result)
+
     def delete_peer_trust(self, peer_id: str, notify_peer: bool = True) -> bool:
         """
         Delete a trust relationship, optionally notifying the peer.
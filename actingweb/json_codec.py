@@ -0,0 +1,239 @@
+"""
+JSON encoding and decoding for storage, handlers and peer calls.
+
+The JSON ActingWeb stores, serves and sends goes through this module, so a
+faster backend can be switched in at one place. There are two encoders,
+because not all of that text may change:
+
+- :func:`dumps` is for text whose exact bytes matter: stored property values
+  (returned verbatim by property reads and hashed into the lookup table),
+  handler response bodies (which must not depend on whether a listing is
+  streamed, see ``actingweb.json_stream``) and anything hashed into a cache
+  key or ETag. It always produces the text ``json.dumps()`` produces.
+- :func:`encode` and :func:`encode_bytes` are for text that is only ever
+  decoded again: list items and metadata, subscription diff blobs, attribute
+  data and the bodies of callbacks and other requests to peers. With a fast
+  backend this is the backend's compact encoding.
+
+:func:`loads` decodes with the backend and falls back to ``json.loads()`` for
+anything the backend rejects (integers beyond 64 bits, ``NaN``, lone
+surrogates, invalid input), so decoded values and the exceptions raised
+(``json.JSONDecodeError``, ``TypeError``) are those of the stdlib. The
+encoders fall back the same way for values the backend cannot encode, e.g.
+integers beyond 64 bits or ``datetime`` without a ``default``. One difference
+remains: the fast backends encode non-finite floats as ``null`` where the
+stdlib writes ``NaN``, which is not JSON and which JSONB columns reject.
+
+The backend is ``"json"`` (the stdlib, default), ``"orjson"`` or
+``"msgspec"``, set with :func:`configure` (or
+``ActingWebApp.with_json_codec()``) or the environment variable
+``ACTINGWEB_JSON_BACKEND``. A backend that is not installed is logged and the
+stdlib used instead.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+BACKENDS = ("json", "orjson", "msgspec")
+
+if ORJSON_AVAILABLE:
+    # Keys are coerced to strings as json.dumps() does; datetimes and
+    # dataclasses go to ``default`` (or fail) as they do with json.dumps().
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _json_loads(data: str | bytes) -> Any:
+    return json.loads(data)
+
+
+def _json_encode(
+    value: Any, sort_keys: bool, default: Callable[[Any], Any] | None
+) -> str:
+    return json.dumps(value, sort_keys=sort_keys, default=default)
+
+
+def _json_encode_bytes(
+    value: Any, sort_keys: bool, default: Callable[[Any], Any] | None
+) -> bytes:
+    return _json_encode(value, sort_keys, default).encode("utf-8")
+
+
+def _orjson_loads(data: str | bytes) -> Any:
+    try:
+        return orjson.loads(data)
+    except (orjson.JSONDecodeError, TypeError):
+        return json.loads(data)
+
+
+def _orjson_encode_bytes(
+    value: Any, sort_keys: bool, default: Callable[[Any], Any] | None
+) -> bytes:
+    option = _ORJSON_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _ORJSON_OPTIONS
+    try:
+        return orjson.dumps(value, default=default, option=option)
+    except orjson.JSONEncodeError:
+        return _json_encode_bytes(value, sort_keys, default)
+
+
+def _msgspec_loads(data: str | bytes) -> Any:
+    try:
+        return msgspec.json.decode(data)
+    except (msgspec.DecodeError, TypeError):
+        return json.loads(data)
+
+
+def _msgspec_encode_bytes(
+    value: Any, sort_keys: bool, default: Callable[[Any], Any] | None
+) -> bytes:
+    try:
+        encoded: bytes = msgspec.json.encode(
+            value, enc_hook=default, order="sorted" if sort_keys else None
+        )
+    except (msgspec.EncodeError, TypeError, ValueError, OverflowError):
+        return _json_encode_bytes(value, sort_keys, default)
+    return encoded
+
+
+def _decoded(
+    encode_bytes: Callable[[Any, bool, Callable[[Any], Any] | None], bytes],
+) -> Callable[[Any, bool, Callable[[Any], Any] | None], str]:
+    def encode(
+        value: Any, sort_keys: bool, default: Callable[[Any], Any] | None
+    ) -> str:
+        return encode_bytes(value, sort_keys, default).decode("utf-8")
+
+    return encode
+
+
+# Backend: (loads, encode to str, encode to bytes)
+_IMPLEMENTATIONS: dict[str, tuple[Callable[..., Any], ...]] = {
+    "json": (_json_loads, _json_encode, _json_encode_bytes),
+    "orjson": (
+        _orjson_loads,
+        _decoded(_orjson_encode_bytes),
+        _orjson_encode_bytes,
+    ),
+    "msgspec": (
+        _msgspec_loads,
+        _decoded(_msgspec_encode_bytes),
+        _msgspec_encode_bytes,
+    ),
+}
+
+
+def _available(backend: str) -> bool:
+    if backend == "orjson":
+        return ORJSON_AVAILABLE
+    if backend == "msgspec":
+        return MSGSPEC_AVAILABLE
+    return True
+
+
+def _env_backend() -> str:
+    backend = os.getenv("ACTINGWEB_JSON_BACKEND", "").strip().lower() or "json"
+    if backend not in BACKENDS:
+        logger.warning(f"Ignoring invalid ACTINGWEB_JSON_BACKEND={backend!r}")
+        return "json"
+    return backend
+
+
+def _select(backend: str) -> None:
+    global _backend, _loads, _encode, _encode_bytes
+
+    if not _available(backend):
+        logger.warning(f"JSON backend {backend!r} is not installed, using json")
+        backend = "json"
+    _backend = backend
+    _loads, _encode, _encode_bytes = _IMPLEMENTATIONS[backend]
+
+
+_backend = "json"
+_loads, _encode, _encode_bytes = _IMPLEMENTATIONS["json"]
+_select(_env_backend())
+
+
+def configure(backend: str = "orjson") -> None:
+    """
+    Choose the JSON backend for the process.
+
+    Args:
+        backend: ``"json"``, ``"orjson"`` or ``"msgspec"``. A backend that is
+            not installed is logged and the stdlib used instead.
+
+    Raises:
+        ValueError: ``backend`` is not one of :data:`BACKENDS`.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"JSON backend must be one of {BACKENDS}, not {backend!r}")
+    _select(backend)
+
+
+def reset() -> None:
+    """Back to the environment's backend (for tests)."""
+    _select(_env_backend())
+
+
+def get_backend() -> str:
+    """The backend in use."""
+    return _backend
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode ``data`` as ``json.loads()`` would."""
+    return _loads(data)
+
+
+def dumps(value: Any, **kwargs: Any) -> str:
+    """Encode ``value`` to exactly the text ``json.dumps(value, **kwargs)``
+    produces, whatever the backend."""
+    return json.dumps(value, **kwargs)
+
+
+def encode_bytes(
+    value: Any,
+    *,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Encode ``value`` to UTF-8 JSON with the backend. Only for text that is
+    decoded again rather than compared or shown, see the module docstring.
+
+    Raises:
+        TypeError: ``value`` contains something that cannot be encoded (and
+            ``default`` does not convert it).
+        ValueError: ``value`` contains a circular reference.
+    """
+    return _encode_bytes(value, sort_keys, default)  # type: ignore[no-any-return]
+
+
+def encode(
+    value: Any,
+    *,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """:func:`encode_bytes` as a string."""
+    return _encode(value, sort_keys, default)  # type: ignore[no-any-return]
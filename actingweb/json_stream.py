@@ -0,0 +1,114 @@
+"""
+Incremental JSON encoding for large listing responses.
+
+A listing handler describes its response as ordinary JSON values in which the
+potentially large parts are wrapped in :class:`StreamedArray` (items) or
+:class:`StreamedObject` (``(key, value)`` members), usually over generators.
+The same description can then be
+
+- encoded in one piece with :func:`dumps`, for a buffered response, or
+- encoded piece by piece with :func:`iter_encode`, for a streamed
+  (chunked) response: only one entry is decoded and encoded at a time, and
+  the text is handed out in chunks of about ``chunk_size`` characters.
+
+Both produce exactly the text ``json.dumps()`` produces for the equivalent
+plain lists and dicts (default separators), so streaming a listing does not
+change what a client receives, only when it receives it.
+
+Handlers use this through ``BaseHandler.write_json_listing()``, which streams
+when the listing has at least ``config.stream_listings_min_items`` entries.
+"""
+
+import itertools
+from collections.abc import Iterable, Iterator
+from typing import Any, TypeVar
+
+from actingweb import json_codec
+
+T = TypeVar("T")
+
+# Characters per chunk of a streamed body
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class StreamedArray:
+    """A JSON array whose items are produced while the response is written."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Iterable[Any]) -> None:
+        self.items = items
+
+
+class StreamedObject:
+    """A JSON object whose ``(key, value)`` members are produced while the
+    response is written."""
+
+    __slots__ = ("members",)
+
+    def __init__(self, members: Iterable[tuple[str, Any]]) -> None:
+        self.members = members
+
+
+def materialize(value: Any) -> Any:
+    """``value`` with its streamed parts read into plain lists and dicts."""
+    if isinstance(value, StreamedArray):
+        return [materialize(item) for item in value.items]
+    if isinstance(value, StreamedObject):
+        return {key: materialize(member) for key, member in value.members}
+    return value
+
+
+def dumps(value: Any) -> str:
+    """Encode ``value`` in one piece, as ``json.dumps()`` would."""
+    return json_codec.dumps(materialize(value))
+
+
+def _pieces(value: Any) -> Iterator[str]:
+    if isinstance(value, StreamedArray):
+        yield "["
+        for n, item in enumerate(value.items):
+            if n:
+                yield ", "
+            yield from _pieces(item)
+        yield "]"
+    elif isinstance(value, StreamedObject):
+        yield "{"
+        for n, (key, member) in enumerate(value.members):
+            if n:
+                yield ", "
+            yield json_codec.dumps(key)
+            yield ": "
+            yield from _pieces(member)
+        yield "}"
+    else:
+        yield json_codec.dumps(value)
+
+
+def iter_encode(value: Any, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """Encode ``value`` in chunks of at least ``chunk_size`` characters (the
+    last one may be shorter). Joined, the chunks equal :func:`dumps`."""
+    buffer: list[str] = []
+    size = 0
+    for piece in _pieces(value):
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def peek(items: Iterable[T], count: int | None) -> tuple[list[T], Iterator[T]]:
+    """The first ``count`` of ``items`` (all of them for None), and an
+    iterator over all of ``items``.
+
+    For deciding whether a listing read from a generator is large enough to
+    stream without reading it twice: ``len(head) < count`` means the head is
+    the whole listing.
+    """
+    iterator = iter(items)
+    head = list(iterator if count is None else itertools.islice(iterator, count))
+    return head, itertools.chain(head, iterator)
@@ -0,0 +1,170 @@
+"""Precomputed MCP tool, resource and prompt descriptors.
+
+``tools/list``, ``resources/list`` and ``prompts/list`` used to walk the hook
+registry on every call: check each hook for ``@mcp_tool``/``@mcp_resource``/
+``@mcp_prompt`` metadata, then assemble the wire dict from it. None of that
+depends on the request. This module does it once per hook registry and keeps
+the result, so a listing only has to filter and serialize.
+
+**What a descriptor holds.** ``definition`` is the static wire shape: name,
+static description, schemas, annotations, exactly as ``*/list`` emits it for a
+client with no per-client or per-actor overrides. ``metadata`` is the raw
+decorator metadata, kept for the parts that *are* per-request:
+``allowed_clients``, ``client_descriptions``, ``visibility_predicate`` and
+``description_predicate``. The handler applies those itself.
+
+**When a catalog is rebuilt.** :class:`~actingweb.interface.hooks.HookRegistry`
+bumps ``_version`` on every hook registration; :func:`get_catalog` rebuilds
+when the version it built from is stale. Apps register hooks before
+integrating with a web framework, and ``ActingWebApp.integrate_*`` calls
+:func:`get_catalog` up front, so in practice the build happens once, at startup.
+
+Permission filtering is not done here; the per-(actor, peer) filtered listing is
+cached by the MCP handler, see ``_listing_cache`` in
+``actingweb/handlers/mcp.py``.
+"""
+
+import itertools
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any
+
+from .decorators import get_mcp_metadata, is_mcp_exposed
+
+logger = logging.getLogger(__name__)
+
+_serials = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class MCPDescriptor:
+    """One listable MCP tool, resource or prompt."""
+
+    # What the permission evaluator is asked about: the tool name, the
+    # resource URI template or the prompt name.
+    target: str
+    # Static ``*/list`` entry. Treat as read-only; copy before modifying.
+    definition: dict[str, Any]
+    metadata: dict[str, Any]
+    hook: Any = field(repr=False, compare=False)
+
+
+@dataclass(frozen=True)
+class MCPCatalog:
+    """Every MCP-exposed hook in a registry, as ready-made descriptors."""
+
+    tools: tuple[MCPDescriptor, ...]
+    resources: tuple[MCPDescriptor, ...]
+    prompts: tuple[MCPDescriptor, ...]
+    # Unique per build, never reused: safe to put in cache keys.
+    serial: int = field(default_factory=lambda: next(_serials))
+
+
+def _tool_descriptor(
+    action_name: str, hook: Any, metadata: dict[str, Any]
+) -> MCPDescriptor:
+    tool_name = metadata.get("name") or action_name
+    definition: dict[str, Any] = {
+        "name": tool_name,
+        "description": metadata.get("description") or f"Execute {action_name} action",
+    }
+    if metadata.get("title"):
+        definition["title"] = metadata["title"]
+    if metadata.get("input_schema"):
+        definition["inputSchema"] = metadata["input_schema"]
+    if metadata.get("output_schema"):
+        definition["outputSchema"] = metadata["output_schema"]
+    # Annotations are used by ChatGPT for its safety evaluation
+    if metadata.get("annotations"):
+        definition["annotations"] = metadata["annotations"]
+    return MCPDescriptor(tool_name, definition, metadata, hook)
+
+
+def _resource_descriptor(
+    method_name: str, hook: Any, metadata: dict[str, Any]
+) -> MCPDescriptor:
+    # Decorator stores 'uri_template'; fall back to actingweb://{method_name}
+    uri_template = metadata.get("uri_template") or f"actingweb://{method_name}"
+    definition = {
+        "uri": uri_template,
+        "name": metadata.get("name") or method_name.replace("_", " ").title(),
+        "description": metadata.get("description") or f"Access {method_name} resource",
+        # Output key follows MCP spec; decorator uses 'mime_type'
+        "mimeType": metadata.get("mime_type", "application/json"),
+    }
+    return MCPDescriptor(uri_template, definition, metadata, hook)
+
+
+def _prompt_descriptor(
+    method_name: str, hook: Any, metadata: dict[str, Any]
+) -> MCPDescriptor:
+    prompt_name = metadata.get("name") or method_name
+    definition: dict[str, Any] = {
+        "name": prompt_name,
+        "description": metadata.get("description")
+        or f"Generate prompt for {method_name}",
+    }
+    if metadata.get("arguments"):
+        definition["arguments"] = metadata["arguments"]
+    return MCPDescriptor(prompt_name, definition, metadata, hook)
+
+
+def build_catalog(hooks: Any) -> MCPCatalog:
+    """Build descriptors for every MCP-exposed hook in ``hooks``.
+
+    Order follows hook registration, the order ``*/list`` has always used.
+    """
+    tools: list[MCPDescriptor] = []
+    resources: list[MCPDescriptor] = []
+    prompts: list[MCPDescriptor] = []
+
+    for action_name, action_hooks in hooks._action_hooks.items():
+        for hook in action_hooks:
+            if not is_mcp_exposed(hook):
+                continue
+            metadata = get_mcp_metadata(hook)
+            if metadata and metadata.get("type") == "tool":
+                tools.append(_tool_descriptor(action_name, hook, metadata))
+
+    for method_name, method_hooks in hooks._method_hooks.items():
+        for hook in method_hooks:
+            if not is_mcp_exposed(hook):
+                continue
+            metadata = get_mcp_metadata(hook)
+            if not metadata:
+                continue
+            if metadata.get("type") == "resource":
+                resources.append(_resource_descriptor(method_name, hook, metadata))
+            elif metadata.get("type") == "prompt":
+                prompts.append(_prompt_descriptor(method_name, hook, metadata))
+
+    logger.debug(
+        f"Built MCP catalog: {len(tools)} tools, {len(resources)} resources, "
+        f"{len(prompts)} prompts"
+    )
+    return MCPCatalog(tuple(tools), tuple(resources), tuple(prompts))
+
+
+# HookRegistry -> (registry version built from, catalog). Weak, so a registry
+# dropped by a test or a rebuilt app takes its catalog with it.
+_catalogs: "weakref.WeakKeyDictionary[Any, tuple[Any, MCPCatalog]]" = (
+    weakref.WeakKeyDictionary()
+)
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(hooks: Any) -> MCPCatalog:
+    """The catalog for ``hooks``, rebuilt only if hooks were registered since."""
+    version = getattr(hooks, "_version", None)
+    cached = _catalogs.get(hooks)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with _catalogs_lock:
+        cached = _catalogs.get(hooks)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        catalog = build_catalog(hooks)
+        _catalogs[hooks] = (version, catalog)
+        return catalog
@@ -18,7 +18,6 @@ import secrets
 from typing import Any
 
 import jwt
-from jwt.algorithms import RSAAlgorithm
 
 from . import oauth2_jwks
 
@@ -85,20 +84,18 @@ class JWKSIdTokenValidator:
             logger.warning("id_token header missing 'kid'")
             return None
 
-        jwk = oauth2_jwks.get_key_for_kid(self.jwks_uri, kid)
-        if jwk is None:
+        try:
+            public_key = oauth2_jwks.get_public_key(self.jwks_uri, kid)
+        except Exception as e:
+            logger.warning("Could not build public key from JWK: %s", e)
+            return None
+        if public_key is None:
             # Fail-closed: cannot resolve the signing key.
             logger.warning(
                 "No JWKS key for kid (signature key unavailable) at %s", self.jwks_uri
             )
             return None
 
-        try:
-            public_key = RSAAlgorithm.from_jwk(jwk)
-        except Exception as e:
-            logger.warning("Could not build public key from JWK: %s", e)
-            return None
-
         # Verify signature + standard time claims. We disable aud verification
         # here and check it ourselves below to support a list of acceptable
         # audiences.
@@ -10,6 +10,14 @@ of fetched key sets with:
   endpoint (fail-fast, avoids hammering a down IdP).
 - A ``kid``-miss force-refetch with a single debounced retry, so that key
   rotation is picked up promptly without a fetch storm.
+- Single-flight fetching: when a key set has to be fetched, one caller does
+  the network call and concurrent callers for the same URI wait for it instead
+  of stampeding the IdP.
+- Refresh-ahead: a cached key set inside the last ``JWKS_REFRESH_AHEAD``
+  seconds of its TTL is still served, and refreshed on a background thread,
+  so request threads normally never see an expired entry.
+- A cache of parsed public-key objects by ``(jwks_uri, kid)``, so verifying an
+  id_token does not rebuild the RSA key from its JWK every time.
 
 The cache is a module-level dict (per-process / per-Lambda-container). This is
 intentional and documented: each container fetches independently; no shared
@@ -22,6 +30,7 @@ import time
 from typing import Any
 
 import requests  # type: ignore[import-untyped]
+from jwt.algorithms import RSAAlgorithm
 
 logger = logging.getLogger(__name__)
 
@@ -31,13 +40,20 @@ _JWKS_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
 _JWKS_NEGATIVE_CACHE: dict[str, float] = {}
 # Debounce: jwks_uri -> last_forced_refetch_at_epoch
 _JWKS_FORCE_REFETCH: dict[str, float] = {}
+# Single-flight: jwks_uri -> event set when the in-progress fetch finishes
+_JWKS_INFLIGHT: dict[str, threading.Event] = {}
+# Parsed keys: (jwks_uri, kid) -> (jwk the key was built from, key object)
+_PARSED_KEYS: dict[tuple[str, str], tuple[dict[str, Any], Any]] = {}
 
 _LOCK = threading.Lock()
 
 JWKS_POSITIVE_TTL = 3600.0
 JWKS_NEGATIVE_TTL = 60.0
 JWKS_FORCE_REFETCH_DEBOUNCE = 5.0
+JWKS_REFRESH_AHEAD = 300.0
 JWKS_TIMEOUT = (3.0, 5.0)
+# How long a caller waits on another thread's fetch before giving up on it.
+JWKS_INFLIGHT_WAIT = sum(JWKS_TIMEOUT)
 
 
 def _now() -> float:
@@ -66,7 +82,10 @@ def fetch_jwks(jwks_uri: str, *, force: bool = False) -> dict[str, Any] | None:
         cached = _JWKS_CACHE.get(jwks_uri)
         if not force and cached is not None:
             fetched_at, jwks = cached
-            if now - fetched_at < JWKS_POSITIVE_TTL:
+            age = now - fetched_at
+            if age < JWKS_POSITIVE_TTL:
+                if age >= JWKS_POSITIVE_TTL - JWKS_REFRESH_AHEAD:
+                    _start_background_refresh(jwks_uri, now)
                 return jwks
 
         # Negative cache: suppress repeat fetches of an unreachable endpoint.
@@ -87,7 +106,31 @@ def fetch_jwks(jwks_uri: str, *, force: bool = False) -> dict[str, Any] | None:
                 return cached[1] if cached is not None else None
             _JWKS_FORCE_REFETCH[jwks_uri] = now
 
+        # Single-flight: if another thread is already fetching, wait for it.
+        inflight = _JWKS_INFLIGHT.get(jwks_uri)
+        if inflight is None:
+            inflight = _JWKS_INFLIGHT[jwks_uri] = threading.Event()
+            leader = True
+        else:
+            leader = False
+
+    if not leader:
+        inflight.wait(JWKS_INFLIGHT_WAIT)
+        with _LOCK:
+            latest = _JWKS_CACHE.get(jwks_uri)
+        return latest[1] if latest is not None else None
+
     # Perform the network fetch outside the lock.
+    try:
+        return _fetch_and_store(jwks_uri, cached)
+    finally:
+        _finish_flight(jwks_uri, inflight)
+
+
+def _fetch_and_store(
+    jwks_uri: str, cached: tuple[float, dict[str, Any]] | None
+) -> dict[str, Any] | None:
+    """Do the network fetch and update the caches. Caller holds the flight."""
     try:
         response = requests.get(jwks_uri, timeout=JWKS_TIMEOUT)
         if response.status_code != 200:
@@ -108,6 +151,11 @@ def fetch_jwks(jwks_uri: str, *, force: bool = False) -> dict[str, Any] | None:
         with _LOCK:
             _JWKS_CACHE[jwks_uri] = (_now(), jwks)
             _JWKS_NEGATIVE_CACHE.pop(jwks_uri, None)
+            # Drop parsed keys for kids the endpoint no longer publishes.
+            live_kids = {k.get("kid") for k in jwks["keys"] if isinstance(k, dict)}
+            for key in [k for k in _PARSED_KEYS if k[0] == jwks_uri]:
+                if key[1] not in live_kids:
+                    del _PARSED_KEYS[key]
         return jwks
 
     except Exception as e:
@@ -117,6 +165,50 @@ def fetch_jwks(jwks_uri: str, *, force: bool = False) -> dict[str, Any] | None:
         return cached[1] if cached is not None else None
 
 
+def _finish_flight(jwks_uri: str, inflight: threading.Event) -> None:
+    with _LOCK:
+        if _JWKS_INFLIGHT.get(jwks_uri) is inflight:
+            del _JWKS_INFLIGHT[jwks_uri]
+    inflight.set()
+
+
+def _start_background_refresh(jwks_uri: str, now: float) -> None:
+    """Refresh ``jwks_uri`` on a daemon thread. Caller must hold ``_LOCK``.
+
+    No-op while a fetch for the URI is already in flight, or while the
+    endpoint is inside its negative-cache window.
+    """
+    if jwks_uri in _JWKS_INFLIGHT:
+        return
+    last_failed = _JWKS_NEGATIVE_CACHE.get(jwks_uri)
+    if last_failed is not None and now - last_failed < JWKS_NEGATIVE_TTL:
+        return
+    inflight = _JWKS_INFLIGHT[jwks_uri] = threading.Event()
+    cached = _JWKS_CACHE.get(jwks_uri)
+
+    def refresh() -> None:
+        try:
+            _fetch_and_store(jwks_uri, cached)
+        finally:
+            _finish_flight(jwks_uri, inflight)
+
+    threading.Thread(target=refresh, name="jwks-refresh", daemon=True).start()
+
+
+def prefetch_jwks(jwks_uri: str) -> None:
+    """Warm the cache for ``jwks_uri`` in the background, if it is not cached.
+
+    For application startup: lets the first sign-in skip the JWKS round trip.
+    Never blocks and never raises.
+    """
+    if not jwks_uri:
+        return
+    with _LOCK:
+        if jwks_uri in _JWKS_CACHE:
+            return
+        _start_background_refresh(jwks_uri, _now())
+
+
 def get_key_for_kid(jwks_uri: str, kid: str) -> dict[str, Any] | None:
     """Return the JWK matching ``kid`` from the JWKS at ``jwks_uri``.
 
@@ -139,6 +231,35 @@ def get_key_for_kid(jwks_uri: str, kid: str) -> dict[str, Any] | None:
     return _find_kid(jwks, kid)
 
 
+def get_public_key(jwks_uri: str, kid: str) -> Any | None:
+    """Return the parsed RSA public key for ``kid`` at ``jwks_uri``.
+
+    Resolves the JWK as :func:`get_key_for_kid` does, then reuses the key
+    object built from that same JWK last time. A JWK whose material changed
+    under an unchanged ``kid`` is re-parsed.
+
+    Returns:
+        The public key, or None if no key matches.
+
+    Raises:
+        Exception: if the JWK cannot be turned into a key (malformed JWK).
+    """
+    jwk = get_key_for_kid(jwks_uri, kid)
+    if jwk is None:
+        return None
+
+    cache_key = (jwks_uri, kid)
+    with _LOCK:
+        parsed = _PARSED_KEYS.get(cache_key)
+    if parsed is not None and (parsed[0] is jwk or parsed[0] == jwk):
+        return parsed[1]
+
+    public_key = RSAAlgorithm.from_jwk(jwk)
+    with _LOCK:
+        _PARSED_KEYS[cache_key] = (jwk, public_key)
+    return public_key
+
+
 def _find_kid(jwks: dict[str, Any] | None, kid: str) -> dict[str, Any] | None:
     if not jwks:
         return None
@@ -154,3 +275,5 @@ def _reset_cache() -> None:
         _JWKS_CACHE.clear()
         _JWKS_NEGATIVE_CACHE.clear()
         _JWKS_FORCE_REFETCH.clear()
+        _JWKS_INFLIGHT.clear()
+        _PARSED_KEYS.clear()
@@ -9,17 +9,50 @@ This module records each accepted id_token by a stable per-token key (``jti``
 when present, otherwise ``sha256(iss + sub + iat)``) in the persistent attribute
 backend with a TTL covering the token's lifetime, and rejects any second sighting
 within that window.
+
+A first sighting, the common case, costs one conditional write
+(``insert_attr_if_absent``) rather than a read followed by a write; only a
+collision reads the existing record. Records are spread over
+``config.oauth2_system_shards`` actor ids
+(:func:`~actingweb.oauth2_server.system_actor.system_shard_actor_id`). Each
+process also remembers the keys it has accepted in a bounded in-process
+prefilter, so a replay against the same process is rejected without touching
+the database; the database stays authoritative for everything else.
 """
 
 import hashlib
 import logging
+import threading
 import time
+import weakref
 from typing import Any
 
 from . import config as config_class
+from .cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Config -> keys accepted by this process, alive until their replay window
+# ends. Keyed by config so separate apps (and tests) do not share entries.
+_prefilters: "weakref.WeakKeyDictionary[Any, TTLCache]" = weakref.WeakKeyDictionary()
+_prefilters_lock = threading.Lock()
+PREFILTER_MAX_ENTRIES = 50_000
+
+
+def _prefilter_for(config: config_class.Config) -> TTLCache | None:
+    if not getattr(config, "id_token_replay_prefilter", True):
+        return None
+    prefilter = _prefilters.get(config)
+    if prefilter is None:
+        with _prefilters_lock:
+            prefilter = _prefilters.get(config)
+            if prefilter is None:
+                prefilter = TTLCache(
+                    "id_token_replay_prefilter", max_entries=PREFILTER_MAX_ENTRIES
+                )
+                _prefilters[config] = prefilter
+    return prefilter
+
 
 class IdTokenReplayCache:
     """Single-use id_token tracker backed by the attribute storage system."""
@@ -48,11 +81,8 @@ class IdTokenReplayCache:
             True if this is the first sighting (accept), False if it is a replay.
         """
         from . import attribute
-        from .constants import (
-            ID_TOKEN_REPLAY_BUCKET,
-            ID_TOKEN_REPLAY_TTL,
-            OAUTH2_SYSTEM_ACTOR,
-        )
+        from .constants import ID_TOKEN_REPLAY_BUCKET, ID_TOKEN_REPLAY_TTL
+        from .oauth2_server.system_actor import system_shard_actor_id
 
         key = self._key_for_claims(claims)
         now = int(time.time())
@@ -61,24 +91,33 @@ class IdTokenReplayCache:
         exp = int(claims.get("exp", 0) or 0)
         ttl = max(ID_TOKEN_REPLAY_TTL, (exp - now) + 60) if exp else ID_TOKEN_REPLAY_TTL
 
+        prefilter = _prefilter_for(self.config)
+        if prefilter is not None and prefilter.lookup(key)[0]:
+            logger.warning("id_token replay detected (key=%s...)", key[:12])
+            return False
+
         bucket = attribute.Attributes(
-            actor_id=OAUTH2_SYSTEM_ACTOR,
+            actor_id=system_shard_actor_id(self.config, key),
             bucket=ID_TOKEN_REPLAY_BUCKET,
             config=self.config,
         )
-
-        existing = bucket.get_attr(name=key)
-        if existing and "data" in existing:
-            record = existing["data"]
-            recorded_exp = int(record.get("exp", 0) or 0)
-            # If the previous record is still within its validity window, reject.
-            if recorded_exp == 0 or recorded_exp + 60 > now:
-                logger.warning("id_token replay detected (key=%s...)", key[:12])
-                return False
-
-        bucket.set_attr(
-            name=key,
-            data={"seen_at": now, "exp": exp},
-            ttl_seconds=ttl,
-        )
+        record = {"seen_at": now, "exp": exp}
+
+        if not bucket.insert_attr_if_absent(name=key, data=record, ttl_seconds=ttl):
+            existing = bucket.get_attr(name=key)
+            if existing and "data" in existing:
+                recorded = existing["data"]
+                recorded_exp = int(recorded.get("exp", 0) or 0)
+                # If the previous record is still within its validity window, reject.
+                if recorded_exp == 0 or recorded_exp + 60 > now:
+                    logger.warning("id_token replay detected (key=%s...)", key[:12])
+                    return False
+            # The record outlived its window (the row TTL carries a clock-skew
+            # buffer): accept as a fresh sighting.
+            bucket.set_attr(name=key, data=record, ttl_seconds=ttl)
+
+        if prefilter is not None:
+            window = ttl if not exp else exp + 60 - now
+            if window > 0:
+                prefilter.put(key, True, ttl=window)
         return True
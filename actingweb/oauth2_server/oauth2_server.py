@@ -610,29 +610,9 @@ class ActingWebOAuth2Server:
         Returns:
             Authorization server metadata
         """
-        base_url = f"{self.config.proto}{self.config.fqdn}"
-
-        return {
-            "issuer": base_url,
-            "authorization_endpoint": f"{base_url}/oauth/authorize",
-            "token_endpoint": f"{base_url}/oauth/token",
-            "registration_endpoint": f"{base_url}/oauth/register",
-            "scopes_supported": ["mcp"],
-            "response_types_supported": ["code"],
-            "grant_types_supported": [
-                "authorization_code",
-                "refresh_token",
-                "client_credentials",
-            ],
-            "token_endpoint_auth_methods_supported": [
-                "client_secret_post",
-                "client_secret_basic",
-                "none",
-            ],
-            "code_challenge_methods_supported": ["S256"],
-            "service_documentation": f"{base_url}/mcp/info",
-            "mcp_resource": f"{base_url}/mcp",
-        }
+        from ..discovery import authorization_server_metadata
+
+        return authorization_server_metadata(self.config)
 
     def validate_mcp_token(self, token: str) -> tuple[str, str, dict[str, Any]] | None:
         """
@@ -827,20 +807,17 @@ class ActingWebOAuth2Server:
     ) -> None:
         """Store MCP client info in the trust relationship for the OAuth2 client."""
         try:
-            import time
-
             from ..handlers.mcp import _mcp_client_info_cache
 
             # Search through all cached client info to find match for this client
             # This is a fallback approach since we don't have request context here
             client_info = None
 
-            # Try to find client info in the cache (there should only be one recent entry)
-            current_time = time.time()
-            for _session_key, data in _mcp_client_info_cache.items():
-                if current_time - data["timestamp"] < 600:  # Within 10 minutes
-                    client_info = data["client_info"]
-                    break
+            # Try to find client info in the cache (there should only be one
+            # recent entry; expired entries are not returned)
+            for cached_client_info in _mcp_client_info_cache.values():
+                client_info = cached_client_info
+                break
 
             if client_info and actor_obj:
                 # Store client metadata in trust relationship (new approach)
@@ -6,9 +6,14 @@ The OAuth2 system actor (_actingweb_oauth2) is used for:
 2. Serving as the default actor for MCP client registrations
 3. Managing the global client index
 
+It also holds the single-use login records (id_token replay markers, OAuth
+state nonces, mobile exchange tickets), which can be spread over several
+"shard" actor ids, see :func:`system_shard_actor_id`.
+
 This module provides a single, reusable function to ensure the system actor exists.
 """
 
+import hashlib
 import logging
 from typing import TYPE_CHECKING
 
@@ -82,3 +87,27 @@ def ensure_oauth2_system_actor(config: "config_class.Config") -> str:
         logger.warning(f"Could not ensure OAuth2 system actor exists: {e}")
 
     return OAUTH2_SYSTEM_ACTOR
+
+
+def system_shard_actor_id(config: "config_class.Config", key: str) -> str:
+    """Actor id that holds the single-use login record ``key``.
+
+    On DynamoDB every attribute of one actor shares a partition, so during a
+    login storm all replay markers, state nonces and mobile tickets land on the
+    system actor's partition. With ``config.oauth2_system_shards`` set to N > 1
+    they are spread by a hash of ``key`` over N actor ids: shard 0 is the
+    system actor itself, shard i is ``f"{OAUTH2_SYSTEM_ACTOR}_{i}"``. Shard
+    actors are attribute namespaces only; no actor row is created for them.
+
+    Changing N relocates keys, so records written before the change (all short
+    lived: at most the longest TTL of the three stores) are no longer found.
+    Change it during a quiet period.
+    """
+    from ..constants import OAUTH2_SYSTEM_ACTOR
+
+    shards = getattr(config, "oauth2_system_shards", 1)
+    if not isinstance(shards, int) or shards <= 1:
+        return OAUTH2_SYSTEM_ACTOR
+    digest = hashlib.sha256(key.encode()).digest()
+    shard = int.from_bytes(digest[:4], "big") % shards
+    return OAUTH2_SYSTEM_ACTOR if shard == 0 else f"{OAUTH2_SYSTEM_ACTOR}_{shard}"
@@ -12,6 +12,11 @@ matching django-allauth / python-social-auth / Curity), we send Apple only an
 opaque single-use nonce as ``state`` and hold the full state payload server-side,
 keyed by that nonce. The callback consumes the nonce (single-use) to recover the
 payload and reject forged or replayed POSTs.
+
+Nonces and tickets are spread over ``config.oauth2_system_shards`` actor ids by
+a hash of the nonce/ticket itself, so both ``create`` and ``consume`` find the
+record without any extra lookup (see
+:func:`~actingweb.oauth2_server.system_actor.system_shard_actor_id`).
 """
 
 from __future__ import annotations
@@ -42,17 +47,14 @@ class StateNonceStore:
             A URL-safe opaque nonce to send as the ``state`` parameter.
         """
         from . import attribute
-        from .constants import (
-            OAUTH2_SYSTEM_ACTOR,
-            OAUTH_STATE_NONCE_BUCKET,
-            OAUTH_STATE_NONCE_TTL,
-        )
+        from .constants import OAUTH_STATE_NONCE_BUCKET, OAUTH_STATE_NONCE_TTL
+        from .oauth2_server.system_actor import system_shard_actor_id
 
         nonce = secrets.token_urlsafe(32)
         effective_ttl = ttl or OAUTH_STATE_NONCE_TTL
 
         bucket = attribute.Attributes(
-            actor_id=OAUTH2_SYSTEM_ACTOR,
+            actor_id=system_shard_actor_id(self.config, nonce),
             bucket=OAUTH_STATE_NONCE_BUCKET,
             config=self.config,
         )
@@ -66,13 +68,14 @@ class StateNonceStore:
             The stored payload, or None on miss / already-consumed / malformed.
         """
         from . import attribute
-        from .constants import OAUTH2_SYSTEM_ACTOR, OAUTH_STATE_NONCE_BUCKET
+        from .constants import OAUTH_STATE_NONCE_BUCKET
+        from .oauth2_server.system_actor import system_shard_actor_id
 
         if not nonce:
             return None
 
         bucket = attribute.Attributes(
-            actor_id=OAUTH2_SYSTEM_ACTOR,
+            actor_id=system_shard_actor_id(self.config, nonce),
             bucket=OAUTH_STATE_NONCE_BUCKET,
             config=self.config,
         )
@@ -115,11 +118,8 @@ class MobileTicketStore:
         ttl: int | None = None,
     ) -> str:
         from . import attribute
-        from .constants import (
-            MOBILE_TICKET_BUCKET,
-            MOBILE_TICKET_TTL,
-            OAUTH2_SYSTEM_ACTOR,
-        )
+        from .constants import MOBILE_TICKET_BUCKET, MOBILE_TICKET_TTL
+        from .oauth2_server.system_actor import system_shard_actor_id
 
         effective_ttl = ttl or MOBILE_TICKET_TTL
         ticket = secrets.token_urlsafe(32)
@@ -137,7 +137,7 @@ class MobileTicketStore:
             payload["extra"] = extra
 
         bucket = attribute.Attributes(
-            actor_id=OAUTH2_SYSTEM_ACTOR,
+            actor_id=system_shard_actor_id(self.config, ticket),
             bucket=MOBILE_TICKET_BUCKET,
             config=self.config,
         )
@@ -146,12 +146,13 @@ class MobileTicketStore:
 
     def consume(self, ticket: str) -> dict[str, Any] | None:
         from . import attribute
-        from .constants import MOBILE_TICKET_BUCKET, OAUTH2_SYSTEM_ACTOR
+        from .constants import MOBILE_TICKET_BUCKET
+        from .oauth2_server.system_actor import system_shard_actor_id
 
         if not ticket:
             return None
         bucket = attribute.Attributes(
-            actor_id=OAUTH2_SYSTEM_ACTOR,
+            actor_id=system_shard_actor_id(self.config, ticket),
             bucket=MOBILE_TICKET_BUCKET,
             config=self.config,
         )
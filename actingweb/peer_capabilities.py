@@ -6,22 +6,31 @@ This module provides:
    (aw_supported options like subscriptionbatch, callbackcompression, etc.)
 2. Methods/Actions caching - cache the RPC methods and state-modifying actions that
    peers expose via GET /methods and GET /actions endpoints
+3. Peer /meta caching - the /meta document of a peer by base URI, shared by
+   trust establishment (``Actor.get_peer_info``) and capability discovery
 
 Protocol capabilities are stored in the trust relationship with TTL.
 Methods/Actions are stored in a separate attribute bucket (peer_capabilities).
+Peer /meta documents are stored in a shared cache bucket, see get_peer_meta().
 """
 
+import asyncio
+import hashlib
 import json
 import logging
+import threading
+import time
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Any
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, cast
 
 import httpx
 
-from . import attribute
+from . import attribute, peer_transport
 from . import config as config_class
-from .constants import PEER_CAPABILITIES_BUCKET
+from .cache import TTLCache, actor_store_cache, bump_actor, sync_actor
+from .constants import PEER_CAPABILITIES_BUCKET, PEER_META_BUCKET, SHARED_CACHE_STORE
 
 if TYPE_CHECKING:
     from .interface.actor_interface import ActorInterface
@@ -161,8 +170,10 @@ class PeerCapabilities:
     def refresh(self) -> bool:
         """Re-fetch capabilities from peer (synchronous).
 
-        Makes HTTP requests to the peer's /meta/actingweb/supported and
-        /meta/actingweb/version endpoints, then updates the trust relationship.
+        Reads aw_supported and aw_version from the peer's cached /meta (see
+        get_peer_meta()), falling back to the /meta/actingweb/supported and
+        /meta/actingweb/version endpoints for peers that do not list them
+        there, then updates the trust relationship.
 
         For async contexts (FastAPI), use refresh_async() instead.
 
@@ -184,37 +195,49 @@ class PeerCapabilities:
             return False
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                # Fetch supported options
-                url = f"{baseuri}/meta/actingweb/supported"
-                response = client.get(url)
-
-                if response.status_code == 200:
-                    supported = response.text.strip()
-                    version = None
-
-                    # Also fetch version
-                    version_url = f"{baseuri}/meta/actingweb/version"
-                    try:
-                        version_response = client.get(version_url, timeout=5.0)
-                        if version_response.status_code == 200:
-                            version = version_response.text.strip()
-                    except Exception:
-                        pass  # Version is optional
-
-                    # Update trust with capabilities
-                    self._update_capabilities(supported, version)
-
-                    logger.debug(
-                        f"Refreshed capabilities for peer {self._peer_id}: {supported}"
-                    )
-                    return True
-                else:
-                    logger.warning(
-                        f"Failed to fetch capabilities from {self._peer_id}: "
-                        f"{response.status_code}"
-                    )
-                    return False
+            if self._apply_meta(get_peer_meta(baseuri, self._actor.config)):
+                return True
+        except httpx.HTTPError as e:
+            logger.warning(
+                f"Network error fetching capabilities from {self._peer_id}: {e}"
+            )
+            return False
+        except ValueError as e:
+            logger.debug(f"Invalid /meta from peer {self._peer_id}: {e}")
+
+        # Peers whose /meta does not list aw_supported
+        try:
+            client = peer_transport.get_client()
+            # Fetch supported options
+            url = f"{baseuri}/meta/actingweb/supported"
+            response = client.get(url, timeout=10.0)
+
+            if response.status_code == 200:
+                supported = response.text.strip()
+                version = None
+
+                # Also fetch version
+                version_url = f"{baseuri}/meta/actingweb/version"
+                try:
+                    version_response = client.get(version_url, timeout=5.0)
+                    if version_response.status_code == 200:
+                        version = version_response.text.strip()
+                except Exception:
+                    pass  # Version is optional
+
+                # Update trust with capabilities
+                self._update_capabilities(supported, version)
+
+                logger.debug(
+                    f"Refreshed capabilities for peer {self._peer_id}: {supported}"
+                )
+                return True
+            else:
+                logger.warning(
+                    f"Failed to fetch capabilities from {self._peer_id}: "
+                    f"{response.status_code}"
+                )
+                return False
 
         except httpx.RequestError as e:
             logger.warning(
@@ -228,8 +251,10 @@ class PeerCapabilities:
     async def refresh_async(self) -> bool:
         """Re-fetch capabilities from peer (asynchronous).
 
-        Makes HTTP requests to the peer's /meta/actingweb/supported and
-        /meta/actingweb/version endpoints, then updates the trust relationship.
+        Reads aw_supported and aw_version from the peer's cached /meta (see
+        get_peer_meta()), falling back to the /meta/actingweb/supported and
+        /meta/actingweb/version endpoints for peers that do not list them
+        there, then updates the trust relationship.
 
         Use this in async contexts (FastAPI handlers).
 
@@ -251,37 +276,49 @@ class PeerCapabilities:
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # Fetch supported options
-                url = f"{baseuri}/meta/actingweb/supported"
-                response = await client.get(url)
-
-                if response.status_code == 200:
-                    supported = response.text.strip()
-                    version = None
-
-                    # Also fetch version
-                    version_url = f"{baseuri}/meta/actingweb/version"
-                    try:
-                        version_response = await client.get(version_url, timeout=5.0)
-                        if version_response.status_code == 200:
-                            version = version_response.text.strip()
-                    except Exception:
-                        pass  # Version is optional
-
-                    # Update trust with capabilities
-                    self._update_capabilities(supported, version)
-
-                    logger.debug(
-                        f"Refreshed capabilities for peer {self._peer_id}: {supported}"
-                    )
-                    return True
-                else:
-                    logger.warning(
-                        f"Failed to fetch capabilities from {self._peer_id}: "
-                        f"{response.status_code}"
-                    )
-                    return False
+            if self._apply_meta(await get_peer_meta_async(baseuri, self._actor.config)):
+                return True
+        except httpx.HTTPError as e:
+            logger.warning(
+                f"Network error fetching capabilities from {self._peer_id}: {e}"
+            )
+            return False
+        except ValueError as e:
+            logger.debug(f"Invalid /meta from peer {self._peer_id}: {e}")
+
+        # Peers whose /meta does not list aw_supported
+        try:
+            client = await peer_transport.get_async_client()
+            # Fetch supported options
+            url = f"{baseuri}/meta/actingweb/supported"
+            response = await client.get(url, timeout=10.0)
+
+            if response.status_code == 200:
+                supported = response.text.strip()
+                version = None
+
+                # Also fetch version
+                version_url = f"{baseuri}/meta/actingweb/version"
+                try:
+                    version_response = await client.get(version_url, timeout=5.0)
+                    if version_response.status_code == 200:
+                        version = version_response.text.strip()
+                except Exception:
+                    pass  # Version is optional
+
+                # Update trust with capabilities
+                self._update_capabilities(supported, version)
+
+                logger.debug(
+                    f"Refreshed capabilities for peer {self._peer_id}: {supported}"
+                )
+                return True
+            else:
+                logger.warning(
+                    f"Failed to fetch capabilities from {self._peer_id}: "
+                    f"{response.status_code}"
+                )
+                return False
 
         except httpx.RequestError as e:
             logger.warning(
@@ -292,6 +329,20 @@ class PeerCapabilities:
             logger.error(f"Error fetching capabilities from {self._peer_id}: {e}")
             return False
 
+    def _apply_meta(self, meta: "CachedPeerMeta") -> bool:
+        """Update capabilities from the peer's /meta; False if it has none."""
+        if meta.status_code != 200 or not isinstance(meta.data, dict):
+            return False
+        if "aw_supported" not in meta.data:
+            return False
+        supported = str(meta.data.get("aw_supported") or "")
+        version = meta.data.get("aw_version")
+        self._update_capabilities(supported, str(version) if version else None)
+        logger.debug(
+            f"Refreshed capabilities for peer {self._peer_id} from /meta: {supported}"
+        )
+        return True
+
     def _update_capabilities(self, supported: str, version: str | None) -> None:
         """Update trust with fetched capabilities and reload cache."""
         now_iso = datetime.now(UTC).isoformat()
@@ -472,12 +523,22 @@ class CachedCapabilitiesStore:
     Capabilities are stored in actor-specific attribute buckets:
     bucket="peer_capabilities", actor_id={actor_id}, name="{actor_id}:{peer_id}"
 
-    This follows the same pattern as PeerProfileStore for consistency.
+    This follows the same pattern as PeerProfileStore for consistency,
+    including the bounded, optionally cross-worker coherent cache.
+
+    It also persists peer /meta documents (CachedPeerMeta), which belong to a
+    peer's base URI rather than to an actor: bucket=PEER_META_BUCKET,
+    actor_id=SHARED_CACHE_STORE, name=sha256(baseuri).
     """
 
     def __init__(self, config: config_class.Config):
         self.config = config
-        self._cache: dict[str, CachedPeerCapabilities] = {}
+        self._cache: TTLCache = actor_store_cache("peer_capabilities", config)
+        max_entries = getattr(config, "store_cache_max_entries", 10_000)
+        self._meta_cache = TTLCache(
+            "peer_meta",
+            max_entries=max_entries if isinstance(max_entries, int) else 10_000,
+        )
 
     def _get_capabilities_bucket(self, actor_id: str) -> attribute.Attributes | None:
         """Get the peer capabilities attribute bucket for an actor."""
@@ -520,6 +581,7 @@ class CachedCapabilitiesStore:
             )
 
             if success:
+                bump_actor(self.config, capabilities.actor_id, self._cache)
                 # Update cache
                 cache_key = f"{capabilities.actor_id}:{capabilities.peer_id}"
                 self._cache[cache_key] = capabilities
@@ -543,12 +605,15 @@ class CachedCapabilitiesStore:
         cache_key = f"{actor_id}:{peer_id}"
 
         # Check cache first
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        sync_actor(self.config, actor_id, self._cache)
+        hit, cached = self._cache.lookup(cache_key)
+        if hit:
+            return cast(CachedPeerCapabilities, cached)
 
         bucket = self._get_capabilities_bucket(actor_id)
         if not bucket:
             return None
+        generation = self._cache.generation.current
 
         try:
             capabilities_key = f"{actor_id}:{peer_id}"
@@ -564,7 +629,7 @@ class CachedCapabilitiesStore:
             capabilities = CachedPeerCapabilities.from_dict(capabilities_data)
 
             # Cache the result
-            self._cache[cache_key] = capabilities
+            self._cache.put(cache_key, capabilities, if_generation=generation)
 
             return capabilities
 
@@ -585,6 +650,7 @@ class CachedCapabilitiesStore:
             success = bucket.delete_attr(name=capabilities_key)
 
             if success:
+                bump_actor(self.config, actor_id, self._cache)
                 # Remove from cache
                 cache_key = f"{actor_id}:{peer_id}"
                 self._cache.pop(cache_key, None)
@@ -605,6 +671,8 @@ class CachedCapabilitiesStore:
             return []
 
         capabilities_list = []
+        sync_actor(self.config, actor_id, self._cache)
+        generation = self._cache.generation.current
 
         try:
             # Get all attributes from the peer capabilities bucket
@@ -618,7 +686,7 @@ class CachedCapabilitiesStore:
 
                     # Cache while we're at it
                     cache_key = f"{capabilities.actor_id}:{capabilities.peer_id}"
-                    self._cache[cache_key] = capabilities
+                    self._cache.put(cache_key, capabilities, if_generation=generation)
 
                 except Exception as e:
                     logger.error(f"Error parsing peer capabilities {attr_name}: {e}")
@@ -630,9 +698,89 @@ class CachedCapabilitiesStore:
             logger.error(f"Error listing peer capabilities for actor {actor_id}: {e}")
             return []
 
+    def _get_meta_bucket(self) -> attribute.Attributes | None:
+        """Get the shared bucket of peer /meta documents."""
+        try:
+            return attribute.Attributes(
+                actor_id=SHARED_CACHE_STORE,
+                bucket=PEER_META_BUCKET,
+                config=self.config,
+            )
+        except Exception as e:
+            logger.error(f"Error accessing peer meta bucket: {e}")
+            return None
+
+    @staticmethod
+    def _meta_name(baseuri: str) -> str:
+        return hashlib.sha256(baseuri.encode()).hexdigest()
+
+    def store_peer_meta(self, meta: "CachedPeerMeta") -> bool:
+        """Store a peer's /meta document for all workers."""
+        self._meta_cache[meta.baseuri] = meta
+        bucket = self._get_meta_bucket()
+        if not bucket:
+            return False
+
+        try:
+            # Keep the row a while after it turns unusable: its validators
+            # still turn the next fetch into a conditional request
+            keep = max(meta.stale_until - time.time(), 0.0) + PEER_META_STALE_TTL
+            success = bucket.set_attr(
+                name=self._meta_name(meta.baseuri),
+                data=json.dumps(meta.to_dict()),
+                ttl_seconds=int(keep),
+            )
+            if not success:
+                logger.error(f"Failed to store peer meta for {meta.baseuri}")
+            return bool(success)
+
+        except Exception as e:
+            logger.error(f"Error storing peer meta for {meta.baseuri}: {e}")
+            return False
+
+    def get_peer_meta(self, baseuri: str) -> "CachedPeerMeta | None":
+        """Get a peer's cached /meta document, usable or not."""
+        hit, cached = self._meta_cache.lookup(baseuri)
+        if hit and cached.is_fresh():
+            return cast(CachedPeerMeta, cached)
+
+        # Missing or stale here: another worker may have fetched it since
+        bucket = self._get_meta_bucket()
+        if not bucket:
+            return cast("CachedPeerMeta | None", cached)
+
+        try:
+            attr_data = bucket.get_attr(name=self._meta_name(baseuri))
+            if not attr_data or "data" not in attr_data:
+                return cast("CachedPeerMeta | None", cached)
+
+            stored = CachedPeerMeta.from_dict(json.loads(attr_data["data"]))
+            if cached is not None and cached.fetched_at >= stored.fetched_at:
+                return cast(CachedPeerMeta, cached)
+            self._meta_cache[baseuri] = stored
+            return stored
+
+        except Exception as e:
+            logger.error(f"Error loading peer meta for {baseuri}: {e}")
+            return cast("CachedPeerMeta | None", cached)
+
+    def delete_peer_meta(self, baseuri: str) -> bool:
+        """Forget a peer's /meta document, e.g. after the peer moved."""
+        self._meta_cache.pop(baseuri, None)
+        bucket = self._get_meta_bucket()
+        if not bucket:
+            return False
+
+        try:
+            return bool(bucket.delete_attr(name=self._meta_name(baseuri)))
+        except Exception as e:
+            logger.error(f"Error deleting peer meta for {baseuri}: {e}")
+            return False
+
     def clear_cache(self) -> None:
         """Clear the internal cache."""
         self._cache.clear()
+        self._meta_cache.clear()
 
 
 # Singleton instance for methods/actions store
@@ -848,7 +996,8 @@ async def fetch_peer_methods_and_actions_async(
             "peerid": peer_id,
             "passphrase": None,
         }
-        proxy = AwProxy(peer_target=peer_target, config=config)
+        # Reads the trust relationship
+        proxy = await asyncio.to_thread(AwProxy, peer_target=peer_target, config=config)
 
         if not proxy.trust:
             capabilities.fetch_error = "No trust relationship with peer"
@@ -913,3 +1062,295 @@ async def fetch_peer_methods_and_actions_async(
         capabilities.fetch_error = f"Exception: {str(e)}"
         logger.error(f"Exception fetching peer capabilities async from {peer_id}: {e}")
         return capabilities
+
+
+# =============================================================================
+# Peer /meta Caching
+# =============================================================================
+#
+# A peer's /meta document (id, type, aw_supported, aw_version, ...) rarely
+# changes but is read every time a trust with the peer is initiated, verified
+# or its capabilities refreshed. It is cached by base URI, shared by all
+# actors and workers through CachedCapabilitiesStore, and served stale while
+# a background refresh is running (stale-while-revalidate).
+# =============================================================================
+
+# Freshness of a peer's /meta when it sends no Cache-Control or Expires
+PEER_META_TTL = 300.0
+# How long expired /meta is still served while it is refreshed in the
+# background, unless the peer says otherwise (stale-while-revalidate=N)
+PEER_META_STALE_TTL = 86400.0
+PEER_META_TIMEOUT = (5, 10)
+
+_meta_lock = threading.Lock()
+# Base URIs with a background refresh running
+_meta_inflight: set[str] = set()
+# References to background refresh tasks, so they are not garbage collected
+_meta_tasks: set[asyncio.Task[None]] = set()
+
+
+@dataclass
+class CachedPeerMeta:
+    """A peer's /meta document and how long it may be used (epoch seconds)."""
+
+    baseuri: str
+    data: Any
+    status_code: int = 200
+    fetched_at: float = 0.0
+    expires_at: float = 0.0  # Fresh until
+    stale_until: float = 0.0  # Served while refreshing until
+    etag: str | None = None
+    last_modified: str | None = None
+    body: str | None = None  # The response body ``data`` was decoded from
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for storage."""
+        return asdict(self)
+
+    @property
+    def content(self) -> bytes:
+        """The response body, re-encoded from ``data`` for copies stored
+        without it."""
+        if self.body is not None:
+            return self.body.encode("utf-8")
+        return json.dumps(self.data).encode("utf-8")
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CachedPeerMeta":
+        """Create from dictionary loaded from storage."""
+        return cls(**data)
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def is_usable(self, now: float | None = None) -> bool:
+        """Fresh, or stale but within the stale-while-revalidate window."""
+        return (now if now is not None else time.time()) < self.stale_until
+
+
+def _seconds(value: str, default: float) -> float:
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return default
+
+
+def _cache_lifetime(headers: httpx.Headers, now: float) -> tuple[float, float] | None:
+    """Fresh and stale seconds from the peer's cache headers; None for no-store."""
+    directives: dict[str, str] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip().strip('"')
+    if "no-store" in directives:
+        return None
+
+    fresh = PEER_META_TTL
+    if "no-cache" in directives:
+        fresh = 0.0
+    elif "max-age" in directives:
+        fresh = _seconds(directives["max-age"], PEER_META_TTL)
+    elif "expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["expires"]).timestamp()
+            date = (
+                parsedate_to_datetime(headers["date"]).timestamp()
+                if "date" in headers
+                else now
+            )
+            fresh = max(expires - date, 0.0)
+        except (TypeError, ValueError):
+            # An invalid Expires means already expired (RFC 9111)
+            fresh = 0.0
+
+    stale = PEER_META_STALE_TTL
+    if "no-cache" in directives or "must-revalidate" in directives:
+        stale = 0.0
+    elif "stale-while-revalidate" in directives:
+        stale = _seconds(directives["stale-while-revalidate"], PEER_META_STALE_TTL)
+    return fresh, stale
+
+
+def _meta_request_headers(cached: CachedPeerMeta | None) -> dict[str, str]:
+    """Validators of the cached copy, to make the fetch conditional."""
+    headers: dict[str, str] = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+def _store_meta_response(
+    baseuri: str,
+    response: httpx.Response,
+    cached: CachedPeerMeta | None,
+    store: CachedCapabilitiesStore | None,
+) -> CachedPeerMeta:
+    """Turn a /meta response into a CachedPeerMeta, storing it if cacheable.
+
+    Raises:
+        ValueError: If the response body is not JSON
+    """
+    now = time.time()
+    if response.status_code == 304 and cached is not None:
+        data, status_code, body = cached.data, cached.status_code, cached.body
+        etag = response.headers.get("etag", cached.etag)
+        last_modified = response.headers.get("last-modified", cached.last_modified)
+    else:
+        data, status_code = response.json(), response.status_code
+        body = response.text
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+
+    lifetime = _cache_lifetime(response.headers, now) if status_code == 200 else None
+    fresh, stale = lifetime if lifetime is not None else (0.0, 0.0)
+    meta = CachedPeerMeta(
+        baseuri=baseuri,
+        data=data,
+        status_code=status_code,
+        fetched_at=now,
+        expires_at=now + fresh,
+        stale_until=now + fresh + stale,
+        etag=etag,
+        last_modified=last_modified,
+        body=body,
+    )
+    if store is not None and lifetime is not None:
+        store.store_peer_meta(meta)
+    return meta
+
+
+def _meta_store(config: config_class.Config | None) -> CachedCapabilitiesStore | None:
+    return get_cached_capabilities_store(config) if config is not None else None
+
+
+def _fetch_peer_meta(
+    baseuri: str,
+    cached: CachedPeerMeta | None,
+    store: CachedCapabilitiesStore | None,
+    timeout: peer_transport.TimeoutType,
+) -> CachedPeerMeta:
+    response = peer_transport.get(
+        f"{baseuri}/meta", headers=_meta_request_headers(cached), timeout=timeout
+    )
+    return _store_meta_response(baseuri, response, cached, store)
+
+
+async def _fetch_peer_meta_async(
+    baseuri: str,
+    cached: CachedPeerMeta | None,
+    store: CachedCapabilitiesStore | None,
+    timeout: peer_transport.TimeoutType,
+) -> CachedPeerMeta:
+    client = await peer_transport.get_async_client()
+    response = await client.get(
+        f"{baseuri}/meta",
+        headers=_meta_request_headers(cached),
+        timeout=peer_transport.to_timeout(timeout),
+    )
+    return _store_meta_response(baseuri, response, cached, store)
+
+
+def _claim_refresh(baseuri: str) -> bool:
+    """Mark a background refresh of ``baseuri`` as running; False if one is."""
+    with _meta_lock:
+        if baseuri in _meta_inflight:
+            return False
+        _meta_inflight.add(baseuri)
+        return True
+
+
+def _release_refresh(baseuri: str) -> None:
+    with _meta_lock:
+        _meta_inflight.discard(baseuri)
+
+
+def _cached_peer_meta(
+    baseuri: str, store: CachedCapabilitiesStore | None, force: bool
+) -> tuple[CachedPeerMeta | None, bool]:
+    """The cached copy and whether it can be returned as is."""
+    cached = store.get_peer_meta(baseuri) if store is not None else None
+    if cached is None or force:
+        return cached, False
+    return cached, cached.is_usable()
+
+
+def get_peer_meta(
+    baseuri: str,
+    config: config_class.Config | None,
+    *,
+    force: bool = False,
+    timeout: peer_transport.TimeoutType = PEER_META_TIMEOUT,
+) -> CachedPeerMeta:
+    """Get the /meta document of the peer at ``baseuri`` (synchronous).
+
+    Fresh cached meta is returned without a request. Stale meta within its
+    stale-while-revalidate window is returned at once and refreshed on a
+    background thread. Otherwise the peer is asked, conditionally
+    (If-None-Match / If-Modified-Since) when an expired copy is cached.
+
+    The peer's Cache-Control (max-age, no-cache, no-store, must-revalidate,
+    stale-while-revalidate) and Expires headers decide how long a 200
+    response is cached; PEER_META_TTL and PEER_META_STALE_TTL apply when it
+    sends none. Other responses are returned but not cached.
+
+    Args:
+        baseuri: Root URI of the peer actor
+        config: Configuration; None disables caching
+        force: Ask the peer even if the cached copy is fresh
+        timeout: Request timeout, as taken by peer_transport
+
+    Raises:
+        httpx.HTTPError: If the peer could not be reached
+        ValueError: If the peer's /meta is not JSON
+    """
+    baseuri = baseuri.rstrip("/")
+    store = _meta_store(config)
+    cached, usable = _cached_peer_meta(baseuri, store, force)
+    if cached is not None and usable:
+        if not cached.is_fresh() and _claim_refresh(baseuri):
+
+            def refresh() -> None:
+                try:
+                    _fetch_peer_meta(baseuri, cached, store, timeout)
+                except Exception as e:
+                    logger.debug(f"Background refresh of {baseuri}/meta failed: {e}")
+                finally:
+                    _release_refresh(baseuri)
+
+            threading.Thread(
+                target=refresh, name="peer-meta-refresh", daemon=True
+            ).start()
+        return cached
+    return _fetch_peer_meta(baseuri, cached, store, timeout)
+
+
+async def get_peer_meta_async(
+    baseuri: str,
+    config: config_class.Config | None,
+    *,
+    force: bool = False,
+    timeout: peer_transport.TimeoutType = PEER_META_TIMEOUT,
+) -> CachedPeerMeta:
+    """Async version of get_peer_meta(); refreshes stale meta in a task."""
+    baseuri = baseuri.rstrip("/")
+    store = _meta_store(config)
+    cached, usable = _cached_peer_meta(baseuri, store, force)
+    if cached is not None and usable:
+        if not cached.is_fresh() and _claim_refresh(baseuri):
+
+            async def refresh() -> None:
+                try:
+                    await _fetch_peer_meta_async(baseuri, cached, store, timeout)
+                except Exception as e:
+                    logger.debug(f"Background refresh of {baseuri}/meta failed: {e}")
+                finally:
+                    _release_refresh(baseuri)
+
+            task = asyncio.get_running_loop().create_task(refresh())
+            _meta_tasks.add(task)
+            task.add_done_callback(_meta_tasks.discard)
+        return cached
+    return await _fetch_peer_meta_async(baseuri, cached, store, timeout)
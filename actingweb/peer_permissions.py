@@ -9,15 +9,18 @@ This is distinct from TrustPermissions which stores what WE grant to peers.
 PeerPermissions stores what PEERS grant to us (the cached received permissions).
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 
 from . import attribute
 from . import config as config_class
+from .cache import TTLCache, actor_store_cache, bump_actor, sync_actor
 from .constants import PEER_PERMISSIONS_BUCKET
+from .permission_patterns import compile_patterns
 
 logger = logging.getLogger(__name__)
 
@@ -120,9 +123,8 @@ class PeerPermissions:
 
         # Check excluded patterns first (deny takes precedence)
         excluded = self.properties.get("excluded_patterns", [])
-        for excl_pattern in excluded:
-            if self._glob_match(pattern, excl_pattern):
-                return False
+        if excluded and self._glob_match_any(pattern, excluded):
+            return False
 
         # Check allowed patterns
         patterns = self.properties.get("patterns", [])
@@ -131,9 +133,8 @@ class PeerPermissions:
         if operation not in operations:
             return None
 
-        for allowed_pattern in patterns:
-            if self._glob_match(pattern, allowed_pattern):
-                return True
+        if patterns and self._glob_match_any(pattern, patterns):
+            return True
 
         return None
 
@@ -152,15 +153,13 @@ class PeerPermissions:
 
         # Check denied first
         denied = self.methods.get("denied", [])
-        for pattern in denied:
-            if self._glob_match(method_name, pattern):
-                return False
+        if denied and self._glob_match_any(method_name, denied):
+            return False
 
         # Check allowed
         allowed = self.methods.get("allowed", [])
-        for pattern in allowed:
-            if self._glob_match(method_name, pattern):
-                return True
+        if allowed and self._glob_match_any(method_name, allowed):
+            return True
 
         return None
 
@@ -179,15 +178,13 @@ class PeerPermissions:
 
         # Check denied first
         denied = self.tools.get("denied", [])
-        for pattern in denied:
-            if self._glob_match(tool_name, pattern):
-                return False
+        if denied and self._glob_match_any(tool_name, denied):
+            return False
 
         # Check allowed
         allowed = self.tools.get("allowed", [])
-        for pattern in allowed:
-            if self._glob_match(tool_name, pattern):
-                return True
+        if allowed and self._glob_match_any(tool_name, allowed):
+            return True
 
         return None
 
@@ -210,6 +207,15 @@ class PeerPermissions:
 
         return fnmatch.fnmatch(name, pattern)
 
+    def _glob_match_any(self, name: str, patterns: list[str]) -> bool:
+        """
+        Check name against a list of glob patterns in one pass.
+
+        Same semantics as _glob_match for each pattern; the list is compiled
+        once into a shared matcher.
+        """
+        return compile_patterns(patterns, fnmatch=True).matches(name)
+
 
 class PeerPermissionStore:
     """
@@ -218,12 +224,13 @@ class PeerPermissionStore:
     Permissions are stored in actor-specific attribute buckets:
     bucket="_peer_permissions", actor_id={actor_id}, name="{actor_id}:{peer_id}"
 
-    This follows the same pattern as PeerProfileStore for consistency.
+    This follows the same pattern as PeerProfileStore for consistency,
+    including the bounded, optionally cross-worker coherent cache.
     """
 
     def __init__(self, config: config_class.Config):
         self.config = config
-        self._cache: dict[str, PeerPermissions] = {}
+        self._cache: TTLCache = actor_store_cache("peer_permissions", config)
 
     def _get_permissions_bucket(self, actor_id: str) -> attribute.Attributes | None:
         """Get the peer permissions attribute bucket for an actor."""
@@ -252,6 +259,7 @@ class PeerPermissionStore:
 
         # Check timestamp ordering - reject older updates
         cache_key = f"{permissions.actor_id}:{permissions.peer_id}"
+        sync_actor(self.config, permissions.actor_id, self._cache)
         existing = self._cache.get(cache_key)
         if existing and existing.fetched_at and permissions.fetched_at:
             if permissions.fetched_at < existing.fetched_at:
@@ -276,6 +284,7 @@ class PeerPermissionStore:
             success = bucket.set_attr(name=perm_key, data=json.dumps(perm_data))
 
             if success:
+                bump_actor(self.config, permissions.actor_id, self._cache)
                 # Update cache
                 self._cache[cache_key] = permissions
                 logger.debug(
@@ -298,14 +307,17 @@ class PeerPermissionStore:
         cache_key = f"{actor_id}:{peer_id}"
 
         # Check cache first
-        if cache_key in self._cache:
+        sync_actor(self.config, actor_id, self._cache)
+        hit, cached = self._cache.lookup(cache_key)
+        if hit:
             logger.debug(f"Retrieved peer permissions from cache: {cache_key}")
-            return self._cache[cache_key]
+            return cast(PeerPermissions, cached)
 
         bucket = self._get_permissions_bucket(actor_id)
         if not bucket:
             logger.warning(f"Could not get permissions bucket for actor {actor_id}")
             return None
+        generation = self._cache.generation.current
 
         try:
             perm_key = f"{actor_id}:{peer_id}"
@@ -322,7 +334,7 @@ class PeerPermissionStore:
             permissions = PeerPermissions.from_dict(perm_data)
 
             # Cache the result
-            self._cache[cache_key] = permissions
+            self._cache.put(cache_key, permissions, if_generation=generation)
 
             logger.debug(f"Retrieved peer permissions from storage: {cache_key}")
 
@@ -345,6 +357,7 @@ class PeerPermissionStore:
             success = bucket.delete_attr(name=perm_key)
 
             if success:
+                bump_actor(self.config, actor_id, self._cache)
                 # Remove from cache
                 cache_key = f"{actor_id}:{peer_id}"
                 self._cache.pop(cache_key, None)
@@ -365,6 +378,8 @@ class PeerPermissionStore:
             return []
 
         permissions_list = []
+        sync_actor(self.config, actor_id, self._cache)
+        generation = self._cache.generation.current
 
         try:
             # Get all attributes from the peer permissions bucket
@@ -378,7 +393,7 @@ class PeerPermissionStore:
 
                     # Cache while we're at it
                     cache_key = f"{permissions.actor_id}:{permissions.peer_id}"
-                    self._cache[cache_key] = permissions
+                    self._cache.put(cache_key, permissions, if_generation=generation)
 
                 except Exception as e:
                     logger.error(f"Error parsing peer permissions {attr_name}: {e}")
@@ -561,7 +576,8 @@ async def fetch_peer_permissions_async(
             "peerid": peer_id,
             "passphrase": None,
         }
-        proxy = AwProxy(peer_target=peer_target, config=config)
+        # Reads the trust relationship
+        proxy = await asyncio.to_thread(AwProxy, peer_target=peer_target, config=config)
 
         if not proxy.trust:
             permissions.fetch_error = "No trust relationship with peer"
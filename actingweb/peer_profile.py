@@ -6,14 +6,16 @@ peer actors that have trust relationships. It enables automatic fetching and
 caching of peer profile data during trust establishment.
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 
 from . import attribute
 from . import config as config_class
+from .cache import TTLCache, actor_store_cache, bump_actor, sync_actor
 from .constants import PEER_PROFILES_BUCKET
 
 logger = logging.getLogger(__name__)
@@ -105,12 +107,13 @@ class PeerProfileStore:
     Profiles are stored in actor-specific attribute buckets:
     bucket="peer_profiles", actor_id={actor_id}, name="{actor_id}:{peer_id}"
 
-    This follows the same pattern as TrustPermissionStore for consistency.
+    This follows the same pattern as TrustPermissionStore for consistency,
+    including the bounded, optionally cross-worker coherent cache.
     """
 
     def __init__(self, config: config_class.Config):
         self.config = config
-        self._cache: dict[str, PeerProfile] = {}
+        self._cache: TTLCache = actor_store_cache("peer_profiles", config)
 
     def _get_profiles_bucket(self, actor_id: str) -> attribute.Attributes | None:
         """Get the peer profiles attribute bucket for an actor."""
@@ -147,6 +150,7 @@ class PeerProfileStore:
             success = bucket.set_attr(name=profile_key, data=json.dumps(profile_data))
 
             if success:
+                bump_actor(self.config, profile.actor_id, self._cache)
                 # Update cache
                 cache_key = f"{profile.actor_id}:{profile.peer_id}"
                 self._cache[cache_key] = profile
@@ -165,12 +169,15 @@ class PeerProfileStore:
         cache_key = f"{actor_id}:{peer_id}"
 
         # Check cache first
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        sync_actor(self.config, actor_id, self._cache)
+        hit, cached = self._cache.lookup(cache_key)
+        if hit:
+            return cast(PeerProfile, cached)
 
         bucket = self._get_profiles_bucket(actor_id)
         if not bucket:
             return None
+        generation = self._cache.generation.current
 
         try:
             profile_key = f"{actor_id}:{peer_id}"
@@ -186,7 +193,7 @@ class PeerProfileStore:
             profile = PeerProfile.from_dict(profile_data)
 
             # Cache the result
-            self._cache[cache_key] = profile
+            self._cache.put(cache_key, profile, if_generation=generation)
 
             return profile
 
@@ -207,6 +214,7 @@ class PeerProfileStore:
             success = bucket.delete_attr(name=profile_key)
 
             if success:
+                bump_actor(self.config, actor_id, self._cache)
                 # Remove from cache
                 cache_key = f"{actor_id}:{peer_id}"
                 self._cache.pop(cache_key, None)
@@ -227,6 +235,8 @@ class PeerProfileStore:
             return []
 
         profiles_list = []
+        sync_actor(self.config, actor_id, self._cache)
+        generation = self._cache.generation.current
 
         try:
             # Get all attributes from the peer profiles bucket
@@ -240,7 +250,7 @@ class PeerProfileStore:
 
                     # Cache while we're at it
                     cache_key = f"{profile.actor_id}:{profile.peer_id}"
-                    self._cache[cache_key] = profile
+                    self._cache.put(cache_key, profile, if_generation=generation)
 
                 except Exception as e:
                     logger.error(f"Error parsing peer profile {attr_name}: {e}")
@@ -414,7 +424,8 @@ async def fetch_peer_profile_async(
             "peerid": peer_id,
             "passphrase": None,
         }
-        proxy = AwProxy(peer_target=peer_target, config=config)
+        # Reads the trust relationship
+        proxy = await asyncio.to_thread(AwProxy, peer_target=peer_target, config=config)
 
         if not proxy.trust:
             profile.fetch_error = "No trust relationship with peer"
@@ -0,0 +1,232 @@
+"""
+Shared HTTP transport for outbound actor-to-actor (peer) calls.
+
+Every call to another actor — trust setup and verification, subscriptions and
+their callbacks, ``/meta`` and capability discovery, ``AwProxy`` resource calls
+and permission notifications — goes through the clients here, so connections
+to a peer are kept alive and reused instead of paying a new TCP and TLS
+handshake per call:
+
+- :func:`get_client`: one ``httpx.Client`` per process, for sync code
+  (re-created after a fork, so pre-forking servers do not share sockets)
+- :func:`get_async_client`: one ``httpx.AsyncClient`` per event loop
+
+Both keep a keep-alive pool per host and speak HTTP/2 when the ``h2`` package
+is installed (``pip install httpx[http2]``). Limits come from the environment
+(defaults in parentheses):
+
+- ``ACTINGWEB_PEER_HTTP_MAX_CONNECTIONS``: open connections in total (100)
+- ``ACTINGWEB_PEER_HTTP_MAX_KEEPALIVE``: idle connections kept (20)
+- ``ACTINGWEB_PEER_HTTP_KEEPALIVE_EXPIRY``: seconds an idle connection is
+  kept (30)
+- ``ACTINGWEB_PEER_HTTP2``: ``false`` to stay on HTTP/1.1 even with ``h2``
+
+Timeouts are per call: pass ``timeout=`` as seconds, a ``(connect, read)``
+tuple as ``requests`` takes it, or an ``httpx.Timeout``.
+
+:func:`get`, :func:`post`, :func:`put` and :func:`delete` take the arguments
+``requests`` took at the former call sites (a ``str``/``bytes`` ``data`` is sent
+as the body) and follow redirects like ``requests`` did. Async code calls the
+client's methods directly.
+
+Call :func:`close_clients` (and ``await close_async_client()`` from each loop
+that used one) at shutdown.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# What the former per-call clients used: 5s to connect, 10s for the rest
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+TimeoutType = float | int | tuple[float | int, float | int] | httpx.Timeout | None
+
+
+@dataclass(frozen=True)
+class TransportSettings:
+    """Connection pool settings, read from the environment by :meth:`from_env`."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
+    @classmethod
+    def from_env(cls) -> "TransportSettings":
+        http2 = os.getenv("ACTINGWEB_PEER_HTTP2", "true").strip().lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        return cls(
+            max_connections=int(
+                os.getenv("ACTINGWEB_PEER_HTTP_MAX_CONNECTIONS", "100")
+            ),
+            max_keepalive_connections=int(
+                os.getenv("ACTINGWEB_PEER_HTTP_MAX_KEEPALIVE", "20")
+            ),
+            keepalive_expiry=float(
+                os.getenv("ACTINGWEB_PEER_HTTP_KEEPALIVE_EXPIRY", "30")
+            ),
+            http2=http2 and importlib.util.find_spec("h2") is not None,
+        )
+
+    def client_kwargs(self) -> dict[str, Any]:
+        return {
+            "timeout": DEFAULT_TIMEOUT,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "http2": self.http2,
+        }
+
+
+_settings: TransportSettings | None = None
+_client: httpx.Client | None = None
+_client_pid: int | None = None
+_client_lock = threading.Lock()
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_settings() -> TransportSettings:
+    global _settings
+    if _settings is None:
+        _settings = TransportSettings.from_env()
+    return _settings
+
+
+def configure(settings: TransportSettings) -> None:
+    """Use ``settings`` for clients created from now on (closes the sync one)."""
+    global _settings
+    _settings = settings
+    close_clients()
+
+
+def to_timeout(timeout: TimeoutType) -> httpx.Timeout:
+    """An ``httpx.Timeout`` from seconds, ``(connect, read)`` or a Timeout."""
+    if timeout is None:
+        return DEFAULT_TIMEOUT
+    if isinstance(timeout, httpx.Timeout):
+        return timeout
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(float(read), connect=float(connect))
+    return httpx.Timeout(float(timeout))
+
+
+def get_client() -> httpx.Client:
+    """The process' shared sync client; thread-safe."""
+    global _client, _client_pid
+
+    pid = os.getpid()
+    client = _client
+    if client is not None and _client_pid == pid and not client.is_closed:
+        return client
+    with _client_lock:
+        if _client is None or _client_pid != pid or _client.is_closed:
+            _client = httpx.Client(**get_settings().client_kwargs())
+            _client_pid = pid
+            logger.debug("Created shared peer HTTP client")
+        return _client
+
+
+async def get_async_client() -> httpx.AsyncClient:
+    """The shared async client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(**get_settings().client_kwargs())
+        _async_clients[loop] = client
+        logger.debug("Created shared async peer HTTP client")
+    return client
+
+
+def close_clients() -> None:
+    """Close the shared sync client (async clients: :func:`close_async_client`)."""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None and _client_pid == os.getpid():
+        client.close()
+
+
+async def close_async_client() -> None:
+    """Close the running loop's shared async client."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def request(
+    method: str,
+    url: str,
+    data: Any = None,
+    json: Any = None,
+    headers: dict[str, str] | None = None,
+    timeout: TimeoutType = None,
+    follow_redirects: bool = True,
+) -> httpx.Response:
+    """Send a request on the shared sync client.
+
+    Raises:
+        httpx.HTTPError: On connection errors and timeouts
+    """
+    body: dict[str, Any] = {}
+    if isinstance(data, str | bytes):
+        body["content"] = data
+    elif data is not None:
+        body["data"] = data
+    if json is not None:
+        body["json"] = json
+    return get_client().request(
+        method,
+        url,
+        headers=headers,
+        timeout=to_timeout(timeout),
+        follow_redirects=follow_redirects,
+        **body,
+    )
+
+
+def get(
+    url: str, headers: dict[str, str] | None = None, timeout: TimeoutType = None
+) -> httpx.Response:
+    return request("GET", url, headers=headers, timeout=timeout)
+
+
+def post(
+    url: str,
+    data: Any = None,
+    json: Any = None,
+    headers: dict[str, str] | None = None,
+    timeout: TimeoutType = None,
+) -> httpx.Response:
+    return request("POST", url, data=data, json=json, headers=headers, timeout=timeout)
+
+
+def put(
+    url: str,
+    data: Any = None,
+    json: Any = None,
+    headers: dict[str, str] | None = None,
+    timeout: TimeoutType = None,
+) -> httpx.Response:
+    return request("PUT", url, data=data, json=json, headers=headers, timeout=timeout)
+
+
+def delete(
+    url: str, headers: dict[str, str] | None = None, timeout: TimeoutType = None
+) -> httpx.Response:
+    return request("DELETE", url, headers=headers, timeout=timeout)
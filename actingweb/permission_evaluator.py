@@ -14,22 +14,47 @@ The evaluator supports checking permissions for:
 - Tools (MCP tool access)
 - Resources (MCP resource access)
 - Prompts (MCP prompt access)
+
+Resolving the effective permissions of a relationship takes an override
+lookup, usually a trust row read, a trust type lookup and a merge; a single
+``tools/list`` or properties GET evaluates dozens of targets against the same
+relationship. The result is therefore memoized per (actor, peer) as an
+:class:`EffectivePermissions`, including the "no trust relationship" outcome.
+An entry is only served while the trust type registry is at the version it was
+built from; override writes and trust creation/deletion evict the actor's
+entries through :func:`invalidate_effective_permissions`. With
+``config.cache_coherence`` an override written, or a trust relationship
+created, changed or deleted, by another worker is picked up through the
+actor's cache generation row.
 """
 
 import logging
 import re
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
 from actingweb.db import get_trust
 
 from . import config as config_class
+from .cache import TTLCache, actor_generations, sync_actor
+from .permission_patterns import PatternMatcher, compile_patterns, glob_to_regex
 from .trust_permissions import get_trust_permission_store, merge_permissions
-from .trust_type_registry import get_registry as get_trust_type_registry
+
+if TYPE_CHECKING:
+    from .trust_type_registry import TrustTypeRegistry
 
 logger = logging.getLogger(__name__)
 
 
+def get_trust_type_registry(config: config_class.Config) -> "TrustTypeRegistry":
+    # Imported at call time: trust_type_registry imports actor, which imports
+    # this module, so either may be the first one imported.
+    from .trust_type_registry import get_registry
+
+    return get_registry(config)
+
+
 class PermissionResult(Enum):
     """Permission evaluation results."""
 
@@ -49,6 +74,24 @@ class PermissionType(Enum):
     PROMPTS = "prompts"
 
 
+EFFECTIVE_PERMISSIONS_TTL = 300
+EFFECTIVE_PERMISSIONS_NEGATIVE_TTL = 30
+
+
+@dataclass(frozen=True)
+class EffectivePermissions:
+    """Resolved permissions of one (actor, peer) relationship.
+
+    ``permissions`` is None when there is no usable relationship (no trust, or
+    an unknown trust type). ``policy_version`` is the trust type registry
+    version it was resolved against.
+    """
+
+    trust_type: str | None
+    permissions: dict[str, Any] | None
+    policy_version: int
+
+
 class PermissionEvaluator:
     """
     Core permission evaluation engine.
@@ -65,6 +108,45 @@ class PermissionEvaluator:
         # Cache for compiled regex patterns
         self._pattern_cache: dict[str, re.Pattern] = {}
 
+        # (actor_id, peer_id) -> EffectivePermissions, grouped by actor
+        self._effective_cache = TTLCache(
+            "effective_permissions",
+            max_entries=10_000,
+            ttl=EFFECTIVE_PERMISSIONS_TTL,
+            group_of=lambda key, _value: key[0] if isinstance(key, tuple) else None,
+        )
+        # Lookups that found an entry built against an older registry version
+        self.stale_hits = 0
+
+    def invalidate_actor(self, actor_id: str) -> int:
+        """Drop memoized effective permissions for ``actor_id``."""
+        return self._effective_cache.evict_group(actor_id)
+
+    def clear_cache(self) -> None:
+        """Drop all memoized effective permissions."""
+        self._effective_cache.clear()
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Effective-permission cache counters, with the hit rate."""
+        stats = self._effective_cache.stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["stale_hits"] = self.stale_hits
+        stats["hit_rate"] = (
+            (stats["hits"] - self.stale_hits) / lookups if lookups else 0.0
+        )
+        return stats
+
+    @property
+    def permission_version(self) -> int:
+        """Version of the process-wide permission policy this evaluator reads.
+
+        Changes when a trust type definition is registered, deleted or
+        reloaded. Per-relationship overrides are not covered: their writers
+        evict the affected actor's caches directly (see
+        ``actingweb.mcp.invalidation``).
+        """
+        return int(self.trust_type_registry.version)
+
     def evaluate_permission(
         self,
         actor_id: str,
@@ -152,7 +234,7 @@ class PermissionEvaluator:
         times because it:
         1. Fetches effective permissions only once
         2. Logs only a single summary line instead of one per property
-        3. Reuses compiled regex patterns
+        3. Compiles each pattern list once into a single matcher
 
         Args:
             actor_id: The actor owning the properties
@@ -183,9 +265,10 @@ class PermissionEvaluator:
                 return dict.fromkeys(property_paths, PermissionResult.NOT_FOUND)
 
             # Evaluate each property (suppress individual logging for bulk operations)
+            compiled_rules = self._compile_rules(permission_rules)
             for property_path in property_paths:
                 results[property_path] = self._evaluate_rules(
-                    permission_rules, property_path, operation, suppress_logging=True
+                    compiled_rules, property_path, operation, suppress_logging=True
                 )
 
             # Log summary instead of individual evaluations
@@ -395,6 +478,42 @@ class PermissionEvaluator:
         Get the effective permissions for a trust relationship.
 
         This combines base trust type permissions with individual overrides.
+        Memoized per (actor, peer); see the module docstring.
+        """
+        version = getattr(self.trust_type_registry, "version", None)
+        key = (actor_id, peer_id)
+        if isinstance(version, int):
+            # Overrides written by another worker bump the actor's generation
+            sync_actor(self.config, actor_id, self._effective_cache)
+            hit, cached = self._effective_cache.lookup(key)
+            if hit:
+                if cached.policy_version == version:
+                    return cast(dict[str, Any] | None, cached.permissions)
+                self.stale_hits += 1
+        generation = self._effective_cache.generation.current
+
+        resolved = self._resolve_effective_permissions(actor_id, peer_id)
+
+        if isinstance(version, int) and resolved is not None:
+            self._effective_cache.put(
+                key,
+                EffectivePermissions(resolved[0], resolved[1], version),
+                ttl=(
+                    EFFECTIVE_PERMISSIONS_TTL
+                    if resolved[1] is not None
+                    else EFFECTIVE_PERMISSIONS_NEGATIVE_TTL
+                ),
+                if_generation=generation,
+            )
+        return resolved[1] if resolved is not None else None
+
+    def _resolve_effective_permissions(
+        self, actor_id: str, peer_id: str
+    ) -> tuple[str | None, dict[str, Any] | None] | None:
+        """Resolve ``(trust type, effective permissions)`` from storage.
+
+        Returns None when the outcome must not be cached because a lookup
+        failed (the caller still treats it as "no permissions").
         """
         # First, determine the trust type for this relationship
         trust_type_name = None
@@ -405,11 +524,13 @@ class PermissionEvaluator:
             trust_type_name = permission_override.trust_type
         else:
             # Look up trust relationship from database
-            trust_type_name = self._lookup_trust_type_from_database(actor_id, peer_id)
+            found, trust_type_name = self._read_trust_type(actor_id, peer_id)
+            if not found:
+                return None
 
         if not trust_type_name:
             logger.debug(f"No trust relationship found for {actor_id}:{peer_id}")
-            return None
+            return None, None
 
         logger.debug(f"Found trust type '{trust_type_name}' for {actor_id}:{peer_id}")
 
@@ -417,7 +538,7 @@ class PermissionEvaluator:
         trust_type = self.trust_type_registry.get_type(trust_type_name)
         if not trust_type:
             logger.error(f"Unknown trust type: {trust_type_name}")
-            return None
+            return trust_type_name, None
 
         base_permissions = trust_type.base_permissions
         logger.debug(f"Base permissions for '{trust_type_name}': {base_permissions}")
@@ -444,7 +565,7 @@ class PermissionEvaluator:
         else:
             effective_permissions = base_permissions
 
-        return effective_permissions
+        return trust_type_name, effective_permissions
 
     def _lookup_trust_type_from_database(
         self, actor_id: str, peer_id: str
@@ -459,32 +580,40 @@ class PermissionEvaluator:
         Returns:
             Trust type name (relationship) or None if not found
         """
+        return self._read_trust_type(actor_id, peer_id)[1]
+
+    def _read_trust_type(self, actor_id: str, peer_id: str) -> tuple[bool, str | None]:
+        """Like :meth:`_lookup_trust_type_from_database`, as ``(ok, name)``.
+
+        ``ok`` is False when the lookup failed rather than found nothing, so
+        the caller knows not to cache the outcome.
+        """
         try:
             # Use the configured database backend
             if not self.config or not hasattr(self.config, "DbTrust"):
                 logger.error("Database backend (DbTrust) not configured")
-                return None
+                return False, None
             db_trust = get_trust(self.config)
             if not db_trust:
                 logger.error("Failed to instantiate database backend")
-                return None
+                return False, None
             trust_record = db_trust.get(actor_id=actor_id, peerid=peer_id)
 
             # DbTrust.get() returns a dict; support both dicts and objects defensively
             if isinstance(trust_record, dict):
                 relationship = trust_record.get("relationship")
                 if relationship:
-                    return str(relationship)
+                    return True, str(relationship)
             elif trust_record is not None and hasattr(trust_record, "relationship"):
-                return str(trust_record.relationship)
+                return True, str(trust_record.relationship)
 
-            return None
+            return True, None
 
         except Exception as e:
             logger.error(
                 f"Error looking up trust relationship {actor_id}:{peer_id}: {e}"
             )
-            return None
+            return False, None
 
     def _evaluate_rules(
         self,
@@ -587,19 +716,37 @@ class PermissionEvaluator:
             )
         return PermissionResult.NOT_FOUND
 
-    def _matches_any_pattern(self, target: str, patterns: list[str]) -> bool:
+    def _compile_rules(self, permission_rules: dict[str, Any]) -> dict[str, Any]:
+        """
+        Return a copy of permission_rules with pattern lists compiled.
+
+        _evaluate_rules accepts either form; compiling up front saves the
+        per-call list-to-matcher lookup when one rule set is evaluated against
+        many targets.
+        """
+        compiled = dict(permission_rules)
+        for key in ("denied", "allowed", "patterns", "excluded_patterns"):
+            patterns = compiled.get(key)
+            if isinstance(patterns, list | tuple):
+                compiled[key] = compile_patterns(patterns)
+        return compiled
+
+    def _matches_any_pattern(
+        self, target: str, patterns: list[str] | PatternMatcher
+    ) -> bool:
         """
         Check if target matches any of the given patterns.
 
-        Supports glob-style patterns with * and ? wildcards.
+        Supports glob-style patterns with * and ? wildcards. The list is
+        compiled into one matcher (see actingweb.permission_patterns) with the
+        same semantics as _matches_pattern.
         """
         if not patterns:
             return False
 
-        for pattern in patterns:
-            if self._matches_pattern(target, pattern):
-                return True
-        return False
+        if not isinstance(patterns, PatternMatcher):
+            patterns = compile_patterns(patterns)
+        return patterns.matches(target)
 
     def _matches_pattern(self, target: str, pattern: str) -> bool:
         """
@@ -634,15 +781,7 @@ class PermissionEvaluator:
 
     def _glob_to_regex(self, pattern: str) -> str:
         """Convert glob pattern to regex pattern."""
-        # Escape special regex characters except * and ?
-        escaped = re.escape(pattern)
-
-        # Replace escaped glob wildcards with regex equivalents
-        escaped = escaped.replace(r"\*", ".*")  # * matches any characters
-        escaped = escaped.replace(r"\?", ".")  # ? matches single character
-
-        # Anchor the pattern to match the entire string
-        return f"^{escaped}$"
+        return glob_to_regex(pattern)
 
 
 # Convenience functions for common permission checks
@@ -740,6 +879,34 @@ _permission_evaluator: PermissionEvaluator | None = None
 _permission_evaluator_config: config_class.Config | None = None
 
 
+def invalidate_effective_permissions(
+    actor_id: str | None, config: config_class.Config | None = None
+) -> int:
+    """Drop the memoized effective permissions of ``actor_id``'s relationships.
+
+    Called by writers of what they are derived from: permission overrides
+    (``TrustPermissionStore``) and trust relationships (create, approval
+    changes, delete). Trust type changes need no call; entries carry the
+    registry version. Trust writers pass ``config`` so that, with
+    ``config.cache_coherence``, the actor's cache generation is advanced and
+    other workers drop their entries too (the permission store bumps it
+    itself). Never raises.
+    """
+    if not actor_id:
+        return 0
+    if config is not None:
+        generations = actor_generations(config)
+        if generations is not None:
+            generations.bump(actor_id)
+    if _permission_evaluator is None:
+        return 0
+    try:
+        return _permission_evaluator.invalidate_actor(actor_id)
+    except Exception:  # pragma: no cover - invalidation must never fail a write
+        logger.warning("Failed to invalidate effective permissions", exc_info=True)
+        return 0
+
+
 def initialize_permission_evaluator(config: config_class.Config) -> None:
     """Initialize the permission evaluator at application startup."""
     global _permission_evaluator, _permission_evaluator_config
@@ -0,0 +1,175 @@
+"""
+Compiled glob matchers for permission rule lists.
+
+Permission rules are lists of glob patterns (``"memory_*"``, ``"profile/?"``,
+``"notes://"``). Matching a target against a list one pattern at a time costs
+one regex call per pattern, and a bulk check repeats that for every property.
+:func:`compile_patterns` turns a whole list into a :class:`PatternMatcher`
+that answers "which pattern matched" in a single pass:
+
+- ``"*"`` and exact patterns are set lookups,
+- ``literal*`` and ``scheme://`` patterns are one ``str.startswith`` call
+  over a tuple of prefixes,
+- everything else is one alternation regex with a named group per pattern.
+
+Two dialects are supported. The default follows
+:class:`~actingweb.permission_evaluator.PermissionEvaluator`: ``*`` and ``?``
+are the only wildcards, they do not match a newline, and a pattern ending in
+``://`` matches any target starting with it. ``fnmatch=True`` follows
+:func:`fnmatch.fnmatch` as used by
+:class:`~actingweb.peer_permissions.PeerPermissions`, including ``[...]``
+character classes.
+
+Compiled matchers are immutable and cached per pattern tuple.
+"""
+
+import fnmatch as fnmatch_module
+import os
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+# Distinct pattern lists in practice number in the tens (one per trust type and
+# override); the bound only protects against unbounded generated patterns.
+MAX_COMPILED_PATTERN_LISTS = 1024
+
+_WILDCARDS = frozenset("*?")
+_FNMATCH_SPECIALS = frozenset("*?[")
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a permission glob into an anchored regex (evaluator dialect)."""
+    escaped = re.escape(pattern).replace(r"\*", ".*").replace(r"\?", ".")
+    return f"^{escaped}$"
+
+
+@lru_cache(maxsize=MAX_COMPILED_PATTERN_LISTS)
+def _glob_regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(glob_to_regex(pattern))
+
+
+class PatternMatcher:
+    """A list of glob patterns compiled into a single matcher."""
+
+    __slots__ = (
+        "patterns",
+        "_fnmatch",
+        "_match_all",
+        "_exact",
+        "_prefixes",
+        "_uri_prefixes",
+        "_prefix_tuple",
+        "_regex",
+        "_groups",
+    )
+
+    def __init__(self, patterns: Iterable[str], fnmatch: bool = False) -> None:
+        self.patterns: tuple[str, ...] = tuple(patterns)
+        self._fnmatch = fnmatch
+        self._match_all: str | None = None
+        self._exact: dict[str, str] = {}
+        # literal* patterns: prefix -> pattern
+        self._prefixes: dict[str, str] = {}
+        # scheme:// patterns (evaluator dialect only)
+        self._uri_prefixes: tuple[str, ...] = ()
+        self._groups: dict[str, str] = {}
+
+        specials = _FNMATCH_SPECIALS if fnmatch else _WILDCARDS
+        uri_prefixes: list[str] = []
+        alternatives: list[str] = []
+        for pattern in self.patterns:
+            key = os.path.normcase(pattern) if fnmatch else pattern
+            if key == "*":
+                self._match_all = self._match_all or pattern
+                continue
+            if not fnmatch and key.endswith("://"):
+                uri_prefixes.append(key)
+            if not specials.intersection(key):
+                self._exact.setdefault(key, pattern)
+                continue
+            head = key[:-1]
+            if key.endswith("*") and not specials.intersection(head):
+                self._prefixes.setdefault(head, pattern)
+                continue
+            group = f"p{len(alternatives)}"
+            self._groups[group] = pattern
+            alternatives.append(f"(?P<{group}>{self._translate(key)})")
+
+        self._uri_prefixes = tuple(uri_prefixes)
+        self._prefix_tuple = tuple(self._prefixes)
+        self._regex: re.Pattern[str] | None = (
+            re.compile("|".join(alternatives)) if alternatives else None
+        )
+
+    def _translate(self, pattern: str) -> str:
+        if self._fnmatch:
+            return fnmatch_module.translate(pattern)
+        return glob_to_regex(pattern)[1:]
+
+    def match(self, target: str) -> str | None:
+        """Return a pattern that matches ``target``, or None."""
+        if self._match_all is not None:
+            return self._match_all
+        if self._fnmatch:
+            target = os.path.normcase(target)
+        elif "\n" in target:
+            # "*" stops at a newline and "$" matches before a trailing one;
+            # rare enough to take the per-pattern path.
+            return self._match_one_by_one(target)
+
+        pattern = self._exact.get(target)
+        if pattern is not None:
+            return pattern
+        if self._uri_prefixes and target.startswith(self._uri_prefixes):
+            return next(p for p in self._uri_prefixes if target.startswith(p))
+        if self._prefix_tuple and target.startswith(self._prefix_tuple):
+            return next(
+                pattern
+                for prefix, pattern in self._prefixes.items()
+                if target.startswith(prefix)
+            )
+        if self._regex is not None:
+            found = self._regex.match(target)
+            if found is not None and found.lastgroup is not None:
+                return self._groups[found.lastgroup]
+        return None
+
+    def _match_one_by_one(self, target: str) -> str | None:
+        for pattern in self.patterns:
+            if pattern == target or (
+                pattern.endswith("://") and target.startswith(pattern)
+            ):
+                return pattern
+            if _glob_regex(pattern).match(target):
+                return pattern
+        return None
+
+    def matches(self, target: str) -> bool:
+        """Return True if any pattern matches ``target``."""
+        return self.match(target) is not None
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __repr__(self) -> str:
+        dialect = "fnmatch" if self._fnmatch else "glob"
+        return f"PatternMatcher({list(self.patterns)!r}, {dialect})"
+
+
+@lru_cache(maxsize=MAX_COMPILED_PATTERN_LISTS)
+def _compile(patterns: tuple[str, ...], fnmatch: bool) -> PatternMatcher:
+    return PatternMatcher(patterns, fnmatch=fnmatch)
+
+
+def compile_patterns(patterns: Iterable[str], fnmatch: bool = False) -> PatternMatcher:
+    """Return the (cached) compiled matcher for ``patterns``.
+
+    Args:
+        patterns: Glob patterns, in rule order
+        fnmatch: Use :func:`fnmatch.fnmatch` semantics instead of the
+            permission evaluator's
+
+    Returns:
+        A :class:`PatternMatcher` shared by every caller with the same list
+    """
+    return _compile(tuple(patterns), fnmatch)
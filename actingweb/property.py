@@ -3,6 +3,7 @@ from typing import Any
 from actingweb.db import get_property, get_property_list
 
 from .property_list import ListProperty
+from .property_snapshot import property_snapshots
 
 
 class PropertyListStore:
@@ -160,12 +161,30 @@ class PropertyStore:
         try:
             return self.__dict__[k]
         except KeyError:
+            snapshot = self._actor_snapshot()
+            if snapshot is not None and k in snapshot:
+                self.__dict__[k] = snapshot[k]
+                return self.__dict__[k]
             self.__dict__["_db"] = get_property(self.__dict__["_config"])
             self.__dict__[k] = self.__dict__["_db"].get(
                 actor_id=self.__dict__["_actor_id"], name=k
             )
+            if snapshot is not None:
+                snapshot[k] = self.__dict__[k]
             return self.__dict__[k]
 
+    def _actor_snapshot(self) -> dict[str, Any] | None:
+        """The actor's shared property snapshot when snapshots are enabled,
+        looked up (one version read) on the store's first read."""
+        if "_snapshot" not in self.__dict__:
+            snapshots = None
+            if self.__dict__.get("_actor_id") and self.__dict__.get("_config"):
+                snapshots = property_snapshots(self.__dict__["_config"])
+            self.__dict__["_snapshot"] = (
+                snapshots.snapshot(self.__dict__["_actor_id"]) if snapshots else None
+            )
+        return self.__dict__["_snapshot"]  # type: ignore[no-any-return]
+
     def get_all(self) -> dict[str, Any]:
         """Fetch all properties from the database and return as dictionary."""
         if not self._actor_id or not self._config:
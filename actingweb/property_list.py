@@ -18,6 +18,7 @@ from typing import Any
 
 import fractional_indexing as fi
 
+from actingweb import json_codec
 from actingweb.db import get_property, get_property_list
 
 logger = logging.getLogger(__name__)
@@ -427,14 +428,14 @@ class ListProperty:
 
     def _decode_item(self, item_str: str) -> Any:
         try:
-            return json.loads(item_str)
+            return json_codec.loads(item_str)
         except (json.JSONDecodeError, TypeError) as e:
             logger.error(f"Failed to parse list item for '{self.name}': {e}")
             return item_str
 
     def _encode_item(self, item: Any) -> str:
         try:
-            return json.dumps(item)
+            return json_codec.encode(item)
         except (TypeError, ValueError):
             return str(item)
 
@@ -620,7 +621,7 @@ class ListProperty:
             return meta
 
         try:
-            parsed_meta = json.loads(meta_str)
+            parsed_meta = json_codec.loads(meta_str)
         except (json.JSONDecodeError, TypeError) as e:
             # Do NOT self-heal by writing a fresh default: that orphans
             # every existing item row (length: 0 with no way back to them).
@@ -681,7 +682,7 @@ class ListProperty:
         if meta_str is None:
             return None, None
         try:
-            parsed = json.loads(meta_str)
+            parsed = json_codec.loads(meta_str)
         except (json.JSONDecodeError, TypeError) as e:
             raise ValueError(f"Unparsable metadata for list '{self.name}': {e}") from e
         if not isinstance(parsed, dict):
@@ -972,7 +973,7 @@ class ListProperty:
 
         if self._db:
             meta_property_name = self._get_meta_property_name()
-            meta_json = json.dumps(meta)
+            meta_json = json_codec.encode(meta)
             # Use fresh DB instance to avoid handle conflicts
             meta_db = get_property(self.config)
             if expected_raw is None:
@@ -1038,7 +1039,7 @@ class ListProperty:
         if meta_str is None:
             return
         try:
-            parsed = json.loads(meta_str)
+            parsed = json_codec.loads(meta_str)
         except (json.JSONDecodeError, TypeError):
             return
         if not isinstance(parsed, dict):
@@ -1090,7 +1091,7 @@ class ListProperty:
                 result.append(self[i])
                 continue
             try:
-                result.append(json.loads(item_str))
+                result.append(json_codec.loads(item_str))
             except (json.JSONDecodeError, TypeError):
                 result.append(item_str)
         return result
@@ -1243,7 +1244,7 @@ class ListProperty:
             raise ListCorruptionError(self.name, index)
 
         try:
-            return json.loads(item_str)
+            return json_codec.loads(item_str)
         except (json.JSONDecodeError, TypeError) as e:
             logger.error(f"Failed to parse list item at index {index}: {e}")
             return item_str  # Return raw string if JSON parsing fails
@@ -1365,10 +1366,7 @@ class ListProperty:
             raise RuntimeError("No database connection available")
 
         # Serialize the value
-        try:
-            value_str = json.dumps(value)
-        except (TypeError, ValueError):
-            value_str = str(value)
+        value_str = self._encode_item(value)
 
         # Use fresh DB instance to avoid handle conflicts
         item_db = get_property(self.config)
@@ -1545,10 +1543,7 @@ class ListProperty:
         length = len(self)
 
         # Serialize the item
-        try:
-            item_str = json.dumps(item)
-        except (TypeError, ValueError):
-            item_str = str(item)
+        item_str = self._encode_item(item)
 
         # Store the new item - use fresh DB instance to avoid handle conflicts
         item_property_name = self._get_item_property_name(length)
@@ -2105,10 +2100,7 @@ class ListProperty:
                     )
 
         # Insert the new item
-        try:
-            item_str = json.dumps(item)
-        except (TypeError, ValueError):
-            item_str = str(item)
+        item_str = self._encode_item(item)
 
         insert_db = get_property(self.config)
         if not insert_db.set(
@@ -2540,7 +2532,7 @@ class ListProperty:
         except TypeError:
             # Unhashable identity (list/dict); compare on a stable
             # serialization instead of refusing to check it.
-            return ("json", json.dumps(value, sort_keys=True, default=str))
+            return ("json", json_codec.encode(value, sort_keys=True, default=str))
         # Type-tag even hashable values. Python considers True == 1 and
         # hashes them identically, so an untagged dict key would merge
         # {"id": true} with {"id": 1} and report a duplicate that does not
@@ -3197,7 +3189,7 @@ class ListProperty:
         )
         if current_meta_str:
             try:
-                current_meta = json.loads(current_meta_str)
+                current_meta = json_codec.loads(current_meta_str)
             except (json.JSONDecodeError, TypeError):
                 current_meta = None
             if isinstance(current_meta, dict) and current_meta.get("format") == 2:
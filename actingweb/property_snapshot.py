@@ -0,0 +1,304 @@
+"""
+Process-wide snapshots of actors' properties, validated by a version counter.
+
+A ``PropertyStore`` (``actor.property``, ``ActorInterface.properties``) keeps
+the values it has read, but a store lives for one request, so a busy actor's
+hot properties (configuration, profile) are read again by every request.
+With snapshots enabled (``config.property_snapshot_max_actors``, set by
+``ActingWebApp.with_property_snapshots()``):
+
+- Each actor has a version counter (``{"v": n}`` in the actor's
+  :data:`~actingweb.constants.PROPERTY_VERSION_BUCKET`). Every successful
+  write through ``get_property()`` advances it: ``set()``, ``delete()`` and
+  the conditional writes, in every worker. Writes to list rows do not, as
+  list rows are never part of a snapshot.
+- A store reads the counter once, on its first property read, and then reads
+  through the actor's snapshot for that version: a value another request
+  already read is served without a database read, and a value read now is
+  kept for the requests that follow. A snapshot for an older version is
+  replaced by an empty one.
+- Snapshots are kept for the ``max_actors`` most recently used actors.
+
+A store therefore sees every write that completed before its first read,
+from any worker, at the cost of one small read per store and, per property
+write, the read and conditional write that advance the counter. When the
+counter cannot be read the store reads from the database as without
+snapshots; when it cannot be advanced the failure is logged and other
+workers may serve the old value until the actor's next write.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import weakref
+from typing import Any
+
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Write methods of the property DB objects; a truthy result means a row changed
+_WRITES = frozenset(
+    {
+        "set",
+        "delete",
+        "create_if_not_exists",
+        "set_if_value_equals",
+        "delete_if_value_equals",
+        "batch_delete",
+    }
+)
+
+
+class _Snapshot:
+    __slots__ = ("version", "values")
+
+    def __init__(self, version: int) -> None:
+        self.version = version
+        self.values: dict[str, Any] = {}
+
+
+class PropertySnapshots:
+    """Per-actor property snapshots and version counters for one config.
+
+    Args:
+        config: The application config, for the attribute store.
+        max_actors: Snapshots kept, least recently used dropped first.
+    """
+
+    def __init__(self, config: Any, max_actors: int = 1000) -> None:
+        self.config = config
+        self._snapshots = TTLCache("property_snapshots", max_entries=max_actors)
+        self._lock = threading.Lock()
+        self.version_reads = 0
+        self.snapshots_replaced = 0
+        self.bumps = 0
+        self.bump_failures = 0
+
+    def _bucket(self, actor_id: str) -> Any:
+        from . import attribute
+        from .constants import PROPERTY_VERSION_BUCKET
+
+        return attribute.Attributes(
+            actor_id=actor_id, bucket=PROPERTY_VERSION_BUCKET, config=self.config
+        )
+
+    @staticmethod
+    def _version_of(record: dict[str, Any] | None) -> int:
+        if record and isinstance(record.get("data"), dict):
+            return int(record["data"].get("v", 0))
+        return 0
+
+    def version(self, actor_id: str) -> int | None:
+        """The actor's counter as stored, or None if it cannot be read."""
+        self.version_reads += 1
+        try:
+            return self._version_of(self._bucket(actor_id).get_attr(name="v"))
+        except Exception as e:
+            logger.warning("Property version read failed for %s: %s", actor_id, e)
+            return None
+
+    def snapshot(self, actor_id: str) -> dict[str, Any] | None:
+        """The actor's snapshot for its current version: property name to
+        value (None for a property that does not exist).
+
+        Reads the counter, so call it once per store. Returns None when the
+        counter cannot be read. The dict is shared with concurrent requests;
+        only add values read from the database after this call.
+        """
+        version = self.version(actor_id)
+        if version is None:
+            return None
+        with self._lock:
+            hit, snapshot = self._snapshots.lookup(actor_id)
+            if hit and snapshot.version == version:
+                return snapshot.values  # type: ignore[no-any-return]
+            fresh = _Snapshot(version)
+            if not hit or snapshot.version < version:
+                if hit:
+                    self.snapshots_replaced += 1
+                self._snapshots.put(actor_id, fresh)
+            # else: this read predates a newer snapshot another request
+            # already made; use a private one rather than replace it
+            return fresh.values
+
+    def bump(self, actor_id: str) -> int | None:
+        """Advance the actor's counter after a property write reached
+        storage. Returns the new counter, or None if it could not be
+        advanced (logged)."""
+        # This process's snapshot is stale whatever happens to the counter
+        self.forget(actor_id)
+        bucket = self._bucket(actor_id)
+        for _ in range(5):
+            try:
+                record = bucket.get_attr(name="v")
+                current = record.get("data") if record else None
+                version = self._version_of(record)
+                new_data = {"v": version + 1}
+                if current is None:
+                    stored = bucket.insert_attr_if_absent(name="v", data=new_data)
+                else:
+                    stored = bucket.conditional_update_attr(
+                        name="v", old_data=current, new_data=new_data
+                    )
+            except Exception as e:
+                logger.warning("Property version bump failed for %s: %s", actor_id, e)
+                break
+            if stored:
+                self.bumps += 1
+                return version + 1
+            bucket.data.pop("v", None)
+        else:
+            logger.warning("Property version bump for %s lost CAS race", actor_id)
+        self.bump_failures += 1
+        return None
+
+    def forget(self, actor_id: str) -> None:
+        """Drop this process's snapshot of the actor."""
+        with self._lock:
+            self._snapshots.invalidate(actor_id)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "actors": len(self._snapshots),
+            "version_reads": self.version_reads,
+            "snapshots_replaced": self.snapshots_replaced,
+            "bumps": self.bumps,
+            "bump_failures": self.bump_failures,
+        }
+
+
+# Config -> its PropertySnapshots, as for cache.actor_generations()
+_property_snapshots: weakref.WeakKeyDictionary[Any, PropertySnapshots] = (
+    weakref.WeakKeyDictionary()
+)
+_property_snapshots_lock = threading.Lock()
+
+
+def property_snapshots(config: Any) -> PropertySnapshots | None:
+    """The config's :class:`PropertySnapshots`, or None when disabled.
+
+    Enabled by ``config.property_snapshot_max_actors`` (a positive int).
+    """
+    max_actors = getattr(config, "property_snapshot_max_actors", None)
+    if not isinstance(max_actors, int) or isinstance(max_actors, bool):
+        return None
+    if max_actors <= 0:
+        return None
+    snapshots = _property_snapshots.get(config)
+    if snapshots is None:
+        with _property_snapshots_lock:
+            snapshots = _property_snapshots.get(config)
+            if snapshots is None:
+                snapshots = PropertySnapshots(config, max_actors=max_actors)
+                _property_snapshots[config] = snapshots
+    return snapshots
+
+
+def _target(
+    name: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[str | None, list[str]]:
+    """The actor and property names a DB call addresses, as far as given."""
+    actor_id = kwargs.get("actor_id", args[0] if args else None)
+    if name == "batch_delete":
+        names = kwargs.get("names", args[1] if len(args) > 1 else None) or []
+        return actor_id, list(names)
+    prop = kwargs.get("name", args[1] if len(args) > 1 else None)
+    return actor_id, [prop] if prop else []
+
+
+class _VersionedDb:
+    """A property (or property-list) DB object whose successful writes
+    advance the actor's property version."""
+
+    def __init__(self, db: Any, snapshots: PropertySnapshots, listing: bool) -> None:
+        self._db = db
+        self._snapshots = snapshots
+        self._listing = listing
+        # Actor and property of the last call, for delete() on the handle
+        self._actor_id: str | None = None
+        self._names: list[str] = []
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._db, name)
+        if not callable(attr):
+            return attr
+
+        def record(args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+            actor_id, names = _target(name, args, kwargs)
+            if actor_id:
+                self._actor_id = actor_id
+            if names and not self._listing:
+                self._names = names
+
+        if self._listing:
+            if name != "delete":
+
+                def read(*args: Any, **kwargs: Any) -> Any:
+                    record(args, kwargs)
+                    return attr(*args, **kwargs)
+
+                return read
+            # Deletes all of the actor's properties
+            return self._after(attr, self._bump)
+
+        if name not in _WRITES:
+
+            def call(*args: Any, **kwargs: Any) -> Any:
+                record(args, kwargs)
+                return attr(*args, **kwargs)
+
+            return call
+
+        def write_target(args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+            if name != "delete":
+                record(args, kwargs)
+
+        return self._after(attr, self._bump, write_target)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._db, name, value)
+
+    def _after(self, attr: Any, action: Any, before: Any = None) -> Any:
+        """``attr`` followed by ``action()`` when it returns a truthy result."""
+        if inspect.iscoroutinefunction(attr):
+
+            async def async_write(*args: Any, **kwargs: Any) -> Any:
+                if before is not None:
+                    before(args, kwargs)
+                result = await attr(*args, **kwargs)
+                if result:
+                    await asyncio.to_thread(action)
+                return result
+
+            return async_write
+
+        def write(*args: Any, **kwargs: Any) -> Any:
+            if before is not None:
+                before(args, kwargs)
+            result = attr(*args, **kwargs)
+            if result:
+                action()
+            return result
+
+        return write
+
+    def _bump(self) -> None:
+        if not self._actor_id:
+            return
+        if self._names and all(n.startswith("list:") for n in self._names):
+            return
+        self._snapshots.bump(self._actor_id)
+
+
+def versioned(db: Any, config: Any, listing: bool = False) -> Any:
+    """``db`` with its writes advancing property versions, when snapshots
+    are enabled for ``config``. ``listing`` marks a property-list object."""
+    snapshots = property_snapshots(config)
+    if snapshots is None:
+        return db
+    return _VersionedDb(db, snapshots, listing)
@@ -2,12 +2,18 @@
 
 This module provides thread-safe and async-safe storage for request-scoped
 context information (request ID, actor ID, peer ID) using Python's contextvars.
+It also holds the request's DB identity map (see ``actingweb.db.identity_map``),
+so rows read once during a request are not read again, and, with DB
+instrumentation enabled, its query log (see ``actingweb.db.instrumentation``).
+Both are created on the request's first DB access, so requests that never
+touch the DB do not pay for them.
 
 The context is automatically isolated per request and propagates correctly
 through async/await boundaries, making it suitable for both Flask (WSGI) and
 FastAPI (ASGI) applications.
 """
 
+import threading
 import uuid
 from contextvars import ContextVar
 from typing import Any
@@ -18,6 +24,24 @@ _actor_id: ContextVar[str | None] = ContextVar("actor_id", default=None)
 _peer_id: ContextVar[str | None] = ContextVar("peer_id", default=None)
 
 
+class _RequestDb:
+    """The request's DB state: its identity map and query log, each created
+    on first use. Shared by the threads and tasks the request's context is
+    copied to."""
+
+    __slots__ = ("use_identity_map", "identity_map", "query_log")
+
+    def __init__(self, use_identity_map: bool) -> None:
+        self.use_identity_map = use_identity_map
+        self.identity_map: Any = None
+        self.query_log: Any = None
+
+
+_request_db: ContextVar[_RequestDb | None] = ContextVar("request_db", default=None)
+# Guards creating a request's identity map or query log
+_request_db_lock = threading.Lock()
+
+
 def generate_request_id() -> str:
     """
     Generate a new UUID4 request ID.
@@ -189,6 +213,7 @@ def set_request_context(
     peer_id: str | None = None,
     *,
     generate_id: bool = True,
+    identity_map: bool = True,
 ) -> str:
     """
     Set all request context values at once.
@@ -201,6 +226,7 @@ def set_request_context(
         actor_id: The actor ID from the request path
         peer_id: The peer ID (typically set later after authentication)
         generate_id: If True and request_id is None, generate a new UUID
+        identity_map: If True, start a fresh DB identity map for the request
 
     Returns:
         The request ID that was set (either provided or generated)
@@ -220,6 +246,7 @@ def set_request_context(
     _request_id.set(request_id)
     _actor_id.set(actor_id)
     _peer_id.set(peer_id)
+    _request_db.set(_RequestDb(identity_map))
 
     return request_id or ""
 
@@ -230,7 +257,8 @@ def clear_request_context() -> None:
 
     This should be called at the end of request handling to prevent context
     leakage between requests. Framework integrations should call this in
-    finally blocks or response handlers.
+    finally blocks or response handlers. With DB instrumentation enabled, the
+    request's query summary is logged here.
 
     Example:
         >>> set_request_context(actor_id="actor123")
@@ -242,6 +270,69 @@ def clear_request_context() -> None:
     _request_id.set(None)
     _actor_id.set(None)
     _peer_id.set(None)
+    request_db = _request_db.get()
+    _request_db.set(None)
+    if request_db is not None and request_db.query_log is not None:
+        from actingweb.db import instrumentation
+
+        instrumentation.finish_request(request_db.query_log, request_db.identity_map)
+
+
+def get_identity_map() -> Any:
+    """
+    Get the DB identity map of the current request.
+
+    Created on the first call after :func:`set_request_context`.
+
+    Returns:
+        The request's ``actingweb.db.identity_map.IdentityMap``, or None
+        outside a request or when it was started with ``identity_map=False``
+
+    Example:
+        >>> set_request_context(actor_id="actor123")
+        >>> get_identity_map().stats()["queries"]
+        0
+    """
+    request_db = _request_db.get()
+    if request_db is None or not request_db.use_identity_map:
+        return None
+    if request_db.identity_map is None:
+        from actingweb.db.identity_map import IdentityMap
+
+        with _request_db_lock:
+            if request_db.identity_map is None:
+                request_db.identity_map = IdentityMap()
+    return request_db.identity_map
+
+
+def get_query_log() -> Any:
+    """
+    Get the DB query log of the current request.
+
+    Created on the first call after :func:`set_request_context` with DB
+    instrumentation enabled.
+
+    Returns:
+        The request's ``actingweb.db.instrumentation.QueryLog``, or None
+        outside a request or when DB instrumentation is disabled
+
+    Example:
+        >>> set_request_context(actor_id="actor123")
+        >>> get_query_log().summary()["queries"]
+        0
+    """
+    request_db = _request_db.get()
+    if request_db is None:
+        return None
+    if request_db.query_log is None:
+        from actingweb.db import instrumentation
+
+        if not instrumentation.is_enabled():
+            return None
+        with _request_db_lock:
+            if request_db.query_log is None:
+                request_db.query_log = instrumentation.QueryLog()
+    return request_db.query_log
 
 
 def get_context_dict() -> dict[str, Any]:
@@ -1,5 +1,6 @@
 import datetime
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 from actingweb.db import (
@@ -206,6 +207,13 @@ class Subscription:
         diff_list = get_subscription_diff_list(self.config)
         return diff_list.fetch(actor_id=self.actor_id, subid=self.subid)
 
+    def iter_diffs(self) -> Iterator[dict[str, Any]]:
+        """Yield the diffs get_diffs() returns, read from the database a page at a time"""
+        if not self.config:
+            return iter(())
+        diff_list = get_subscription_diff_list(self.config)
+        return diff_list.iter_fetch(actor_id=self.actor_id, subid=self.subid)
+
     def clear_diff(self, seqnr):
         """Clears one specific diff"""
         if not self.config:
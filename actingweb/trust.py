@@ -133,8 +133,10 @@ class Trust:
             # because the cached ActorInterface carries the trust list itself —
             # see evict_mcp_caches_for_actor(). No-op when MCP is not in use.
             from .mcp.invalidation import evict_caches_for_actor
+            from .permission_evaluator import invalidate_effective_permissions
 
             evict_caches_for_actor(self.actor_id)
+            invalidate_effective_permissions(self.actor_id, self.config)
 
         return result
 
@@ -224,7 +226,7 @@ class Trust:
             self.trust["aw_version"] = aw_version
         if capabilities_fetched_at is not None:
             self.trust["capabilities_fetched_at"] = capabilities_fetched_at
-        return self.handle.modify(
+        modified = self.handle.modify(
             baseuri=baseuri,
             secret=secret,
             desc=desc,
@@ -248,6 +250,21 @@ class Trust:
             aw_version=aw_version,
             capabilities_fetched_at=capabilities_fetched_at,
         )
+        if (
+            modified
+            and self.actor_id
+            and (
+                approved is not None
+                or verified is not None
+                or peer_approved is not None
+            )
+        ):
+            # Approval changes must reach other workers' permission caches;
+            # metadata-only updates (last_accessed, client info) need not.
+            from .permission_evaluator import invalidate_effective_permissions
+
+            invalidate_effective_permissions(self.actor_id, self.config)
+        return bool(modified)
 
     def create(
         self,
@@ -304,7 +321,7 @@ class Trust:
             )
         if not self.handle:
             return False
-        return self.handle.create(
+        created = self.handle.create(
             actor_id=self.actor_id,
             peerid=self.peerid,
             baseuri=self.trust["baseuri"],
@@ -322,6 +339,12 @@ class Trust:
             last_accessed=last_accessed,
             last_connected_via=last_connected_via,
         )
+        if created and self.actor_id:
+            # The evaluator may hold a cached "no relationship" for this peer.
+            from .permission_evaluator import invalidate_effective_permissions
+
+            invalidate_effective_permissions(self.actor_id, self.config)
+        return bool(created)
 
     def __init__(
         self,
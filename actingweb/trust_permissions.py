@@ -16,10 +16,11 @@ import json
 import logging
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 
 from . import attribute
 from . import config as config_class
+from .cache import TTLCache, actor_store_cache, bump_actor, sync_actor
 from .constants import TRUST_PERMISSIONS_BUCKET
 
 logger = logging.getLogger(__name__)
@@ -87,6 +88,10 @@ class TrustPermissionStore:
 
     This allows each actor to manage permissions for their trust relationships
     while maintaining the ActingWeb attribute store pattern.
+
+    The in-process cache is bounded and, with ``config.cache_coherence``,
+    kept coherent across workers by the actor's cache generation row
+    (actingweb.cache.ActorGenerations).
     """
 
     def __init__(self, config: config_class.Config):
@@ -94,7 +99,7 @@ class TrustPermissionStore:
         # Values may be None: a confirmed "no override stored" is cached too,
         # otherwise every permission evaluation for a peer without an
         # override re-reads the attribute bucket.
-        self._cache: dict[str, TrustPermissions | None] = {}
+        self._cache: TTLCache = actor_store_cache("trust_permissions", config)
 
     def _get_permissions_bucket(self, actor_id: str) -> attribute.Attributes | None:
         """Get the trust permissions attribute bucket for an actor."""
@@ -140,6 +145,9 @@ class TrustPermissionStore:
             )
 
             if success:
+                # Tell other workers first: the bump may evict this actor's
+                # local entries, and the fresh value should survive it.
+                bump_actor(self.config, permissions.actor_id, self._cache)
                 # Update cache
                 cache_key = f"{permissions.actor_id}:{permissions.peer_id}"
                 self._cache[cache_key] = permissions
@@ -148,8 +156,10 @@ class TrustPermissionStore:
                 # relationship for five minutes, so a downgrade would otherwise
                 # keep being honoured at the old level from a warm process.
                 from .mcp.invalidation import evict_caches_for_actor
+                from .permission_evaluator import invalidate_effective_permissions
 
                 evict_caches_for_actor(permissions.actor_id)
+                invalidate_effective_permissions(permissions.actor_id)
                 logger.info(f"Stored trust permissions: {cache_key}")
                 return True
             else:
@@ -321,7 +331,7 @@ class TrustPermissionStore:
 
         Note: Uses Trust directly instead of AwProxy because AwProxy doesn't
         support async HTTP. This approach manually constructs the callback URL
-        and uses httpx.AsyncClient for non-blocking HTTP requests.
+        and uses the shared async peer client for non-blocking HTTP requests.
 
         Args:
             permissions: The TrustPermissions that were stored.
@@ -334,8 +344,7 @@ class TrustPermissionStore:
         )
 
         try:
-            import httpx
-
+            from . import peer_transport
             from .trust import Trust
 
             # Get trust relationship to find peer URL and secret
@@ -372,23 +381,24 @@ class TrustPermissionStore:
             if peer_secret:
                 headers["Authorization"] = f"Bearer {peer_secret}"
 
-            async with httpx.AsyncClient(timeout=PEER_NOTIFICATION_TIMEOUT) as client:
-                response = await client.post(
-                    callback_url,
-                    json=callback_data,
-                    headers=headers,
-                )
+            client = await peer_transport.get_async_client()
+            response = await client.post(
+                callback_url,
+                json=callback_data,
+                headers=headers,
+                timeout=PEER_NOTIFICATION_TIMEOUT,
+            )
 
-                if response.status_code in (200, 201, 202, 204):
-                    logger.debug(
-                        f"Successfully notified peer {peer_id} of permission change "
-                        f"from actor {actor_id} (async)"
-                    )
-                else:
-                    logger.warning(
-                        f"Failed to notify peer {peer_id} from actor {actor_id}: "
-                        f"status={response.status_code}"
-                    )
+            if response.status_code in (200, 201, 202, 204):
+                logger.debug(
+                    f"Successfully notified peer {peer_id} of permission change "
+                    f"from actor {actor_id} (async)"
+                )
+            else:
+                logger.warning(
+                    f"Failed to notify peer {peer_id} from actor {actor_id}: "
+                    f"status={response.status_code}"
+                )
 
         except Exception as e:
             logger.warning(
@@ -479,12 +489,17 @@ class TrustPermissionStore:
         cache_key = f"{actor_id}:{peer_id}"
 
         # Check cache first
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        sync_actor(self.config, actor_id, self._cache)
+        hit, cached = self._cache.lookup(cache_key)
+        if hit:
+            return cast(TrustPermissions | None, cached)
 
         bucket = self._get_permissions_bucket(actor_id)
         if not bucket:
             return None
+        # Snapshot before the read: an eviction landing in between refuses
+        # the fill below instead of caching what may be the old value.
+        generation = self._cache.generation.current
 
         try:
             permission_key = f"{actor_id}:{peer_id}"
@@ -495,7 +510,7 @@ class TrustPermissionStore:
             if not attr_data or "data" not in attr_data:
                 # Cache the negative: store/delete paths update the cache, so
                 # this stays correct within the process.
-                self._cache[cache_key] = None
+                self._cache.put(cache_key, None, if_generation=generation)
                 return None
 
             # Parse JSON and create TrustPermissions
@@ -503,7 +518,7 @@ class TrustPermissionStore:
             permissions = TrustPermissions.from_dict(permissions_data)
 
             # Cache the result
-            self._cache[cache_key] = permissions
+            self._cache.put(cache_key, permissions, if_generation=generation)
 
             return permissions
 
@@ -518,6 +533,8 @@ class TrustPermissionStore:
             return []
 
         permissions_list = []
+        sync_actor(self.config, actor_id, self._cache)
+        generation = self._cache.generation.current
 
         try:
             # Get all attributes from the trust permissions bucket
@@ -531,7 +548,7 @@ class TrustPermissionStore:
 
                     # Cache while we're at it
                     cache_key = f"{permissions.actor_id}:{permissions.peer_id}"
-                    self._cache[cache_key] = permissions
+                    self._cache.put(cache_key, permissions, if_generation=generation)
 
                 except Exception as e:
                     logger.error(f"Error parsing trust permissions {attr_name}: {e}")
@@ -556,14 +573,17 @@ class TrustPermissionStore:
             success = bucket.delete_attr(name=permission_key)
 
             if success:
+                bump_actor(self.config, actor_id, self._cache)
                 # Remove from cache
                 cache_key = f"{actor_id}:{peer_id}"
                 self._cache.pop(cache_key, None)
                 # Same reason as _store_permissions_internal(): the MCP
                 # handler's cached trust relationship outlives this one.
                 from .mcp.invalidation import evict_caches_for_actor
+                from .permission_evaluator import invalidate_effective_permissions
 
                 evict_caches_for_actor(actor_id)
+                invalidate_effective_permissions(actor_id)
                 logger.info(f"Deleted trust permissions: {cache_key}")
                 return True
             else:
@@ -4,15 +4,29 @@ Trust Type Registry for ActingWeb Unified Access Control.
 This module provides a registry for trust relationship types using the ActingWeb
 property store pattern. Trust types are stored in a system actor's properties
 and define the base permissions and capabilities for different kinds of relationships.
+
+Every permission check looks up a trust type, so lookups are served from an
+immutable :class:`TrustTypeSnapshot` of all types, built by one bulk read of
+the system actor's properties at startup (:meth:`TrustTypeRegistry.preload`)
+or on first use. Lookups read the current snapshot reference and take no lock;
+changes made in this process publish a modified copy. Changes made by
+another process are picked up by a refresh every ``TRUST_TYPE_SNAPSHOT_TTL``
+seconds, which re-reads everything only when the registry version marker
+stored next to the types has changed; a name missing from the snapshot is
+looked up in storage directly. Registering a definition identical to the
+stored one writes nothing, so restarts do not make other processes reload.
 """
 
 import json
 import logging
+import threading
+import time
+import uuid
+from collections.abc import Mapping
 from dataclasses import asdict, dataclass
+from types import MappingProxyType
 from typing import Any
 
-from botocore.exceptions import ClientError
-
 from . import actor as actor_module
 from . import attribute
 from . import config as config_class
@@ -25,6 +39,16 @@ logger = logging.getLogger(__name__)
 
 # Use standardized constants for system actor and bucket names
 
+# Property prefix of stored trust types, and the marker rewritten on every
+# change so other processes can tell their snapshot is out of date.
+TRUST_TYPE_PROPERTY_PREFIX = "trust_type:"
+TRUST_TYPE_VERSION_PROPERTY = "trust_type_registry_version"
+
+# Seconds between version checks of a loaded snapshot
+TRUST_TYPE_SNAPSHOT_TTL = 60.0
+# Seconds to wait before retrying a failed bulk load
+TRUST_TYPE_LOAD_RETRY = 30.0
+
 
 @dataclass
 class TrustType:
@@ -77,6 +101,26 @@ class TrustType:
         return True
 
 
+@dataclass(frozen=True)
+class TrustTypeSnapshot:
+    """All known trust types at one point in time. Never mutated."""
+
+    types: Mapping[str, TrustType]
+    # Stored registry version marker the snapshot was read under
+    marker: str | None
+    # time.monotonic() of the last load or version check
+    checked_at: float
+
+    def with_type(self, trust_type: TrustType) -> "TrustTypeSnapshot":
+        types = dict(self.types)
+        types[trust_type.name] = trust_type
+        return TrustTypeSnapshot(MappingProxyType(types), self.marker, self.checked_at)
+
+    def without_type(self, name: str) -> "TrustTypeSnapshot":
+        types = {k: v for k, v in self.types.items() if k != name}
+        return TrustTypeSnapshot(MappingProxyType(types), self.marker, self.checked_at)
+
+
 class TrustTypeRegistry:
     """
     Registry for trust relationship types using ActingWeb attribute buckets.
@@ -87,8 +131,15 @@ class TrustTypeRegistry:
 
     def __init__(self, config: config_class.Config):
         self.config = config
-        self._cache: dict[str, TrustType] = {}
-        self._cache_valid = False
+        # Replaced, never modified, so readers need no lock
+        self._snapshot: TrustTypeSnapshot | None = None
+        # Serialises loads and copy-on-write updates of _snapshot
+        self._load_lock = threading.Lock()
+        self._load_failed_at: float | None = None
+        # Bumped whenever a trust type definition changes in this process, so
+        # callers caching permission-derived results can key on it.
+        self.version = 0
+        self.bulk_loads = 0
         # Cache for the system actor instance
         self._system_actor: Any = None
 
@@ -131,17 +182,22 @@ class TrustTypeRegistry:
                     )
                     if not created:
                         return None
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "ResourceInUseException":
-                        logger.debug(
-                            "System actor table already exists; another worker created it"
-                        )
-                        # Continue with the actor instance even if creation failed due to existing table
-                    else:
-                        raise  # Re-raise genuine errors
                 except Exception as e:
-                    logger.error(f"Error creating system actor: {e}")
-                    return None
+                    # A botocore ClientError is recognised by its response
+                    # rather than imported, so other backends never load it.
+                    response = getattr(e, "response", None)
+                    code = (
+                        response.get("Error", {}).get("Code")
+                        if isinstance(response, dict)
+                        else None
+                    )
+                    if code != "ResourceInUseException":
+                        logger.error(f"Error creating system actor: {e}")
+                        return None
+                    logger.debug(
+                        "System actor table already exists; another worker created it"
+                    )
+                    # Continue with the actor instance even if creation failed due to existing table
             self._system_actor = sys_actor
             return self._system_actor
         except Exception as e:
@@ -160,11 +216,15 @@ class TrustTypeRegistry:
             return False
 
         try:
-            prop_name = f"trust_type:{trust_type.name}"
+            prop_name = f"{TRUST_TYPE_PROPERTY_PREFIX}{trust_type.name}"
             trust_type_json = json.dumps(trust_type.to_dict())
+            if self._stored_json(sys_actor, trust_type.name) == trust_type_json:
+                # Unchanged (the default types are registered on every
+                # start): no write, and no reload in the other processes.
+                logger.debug(f"Trust type '{trust_type.name}' already registered")
+                return True
             setattr(sys_actor.property, prop_name, trust_type_json)
-            # Update cache
-            self._cache[trust_type.name] = trust_type
+            self._publish_change(sys_actor, lambda snap: snap.with_type(trust_type))
             logger.info(
                 f"Registered trust type '{trust_type.name}' with {len(trust_type.base_permissions)} permissions"
             )
@@ -173,17 +233,172 @@ class TrustTypeRegistry:
             logger.error(f"Error registering trust type {trust_type.name}: {e}")
             return False
 
+    def _stored_json(self, sys_actor: Any, name: str) -> str | None:
+        """The stored definition of ``name`` as :meth:`register_type` writes
+        it, from the snapshot or else one property read; None if absent."""
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            existing = snapshot.types.get(name)
+            return json.dumps(existing.to_dict()) if existing is not None else None
+        raw = getattr(sys_actor.property, f"{TRUST_TYPE_PROPERTY_PREFIX}{name}", None)
+        if not raw:
+            return None
+        return json.dumps(TrustType.from_dict(json.loads(raw)).to_dict())
+
+    def _publish_change(self, sys_actor: Any, change: Any) -> None:
+        """Apply a local change to the snapshot and tell other processes."""
+        marker: str | None = uuid.uuid4().hex
+        try:
+            setattr(sys_actor.property, TRUST_TYPE_VERSION_PROPERTY, marker)
+        except Exception as e:
+            # Other processes then only notice on their next full reload
+            logger.warning(f"Could not update trust type registry version: {e}")
+            marker = None
+        with self._load_lock:
+            snapshot = self._snapshot
+            if snapshot is not None:
+                snapshot = change(snapshot)
+                if marker is not None and snapshot.marker is not None:
+                    snapshot = TrustTypeSnapshot(
+                        snapshot.types, marker, snapshot.checked_at
+                    )
+                self._snapshot = snapshot
+            self.version += 1
+
+    def _read_all(self, sys_actor: Any) -> TrustTypeSnapshot:
+        """Build a snapshot from one read of all system actor properties."""
+        props = sys_actor.get_properties() or {}
+        types: dict[str, TrustType] = {}
+        for key, raw in props.items():
+            if not isinstance(key, str) or not key.startswith(
+                TRUST_TYPE_PROPERTY_PREFIX
+            ):
+                continue
+            try:
+                trust_type = TrustType.from_dict(json.loads(raw))
+                types[trust_type.name] = trust_type
+            except Exception as e:
+                logger.error(f"Error parsing trust type {key}: {e}")
+        marker = props.get(TRUST_TYPE_VERSION_PROPERTY)
+        return TrustTypeSnapshot(
+            MappingProxyType(types),
+            marker if isinstance(marker, str) else None,
+            time.monotonic(),
+        )
+
+    def _load(self) -> TrustTypeSnapshot | None:
+        """Bulk-load and publish a fresh snapshot. None if loading failed."""
+        sys_actor = self._get_system_actor()
+        if not sys_actor:
+            return None
+        with self._load_lock:
+            version = self.version
+            try:
+                snapshot = self._read_all(sys_actor)
+            except Exception as e:
+                logger.error(f"Error loading trust types: {e}")
+                self._load_failed_at = time.monotonic()
+                return None
+            self.bulk_loads += 1
+            self._load_failed_at = None
+            previous = self._snapshot
+            self._snapshot = snapshot
+            if version == self.version and (
+                previous is None or dict(previous.types) != dict(snapshot.types)
+            ):
+                self.version += 1
+            logger.debug(f"Loaded {len(snapshot.types)} trust types")
+            return snapshot
+
+    def _refresh_if_stale(self, snapshot: TrustTypeSnapshot) -> TrustTypeSnapshot:
+        """Version-check an expired snapshot; reload only if it changed.
+
+        Only one thread checks at a time; the others keep using the current
+        snapshot meanwhile.
+        """
+        if not self._load_lock.acquire(blocking=False):
+            return snapshot
+        try:
+            if self._snapshot is not snapshot:
+                return self._snapshot or snapshot
+            sys_actor = self._get_system_actor()
+            marker: Any = None
+            if sys_actor:
+                try:
+                    marker = getattr(sys_actor.property, TRUST_TYPE_VERSION_PROPERTY)
+                except Exception as e:
+                    logger.debug(f"Trust type registry version check failed: {e}")
+                    return snapshot
+            if marker == snapshot.marker:
+                self._snapshot = TrustTypeSnapshot(
+                    snapshot.types, snapshot.marker, time.monotonic()
+                )
+                return self._snapshot
+        finally:
+            self._load_lock.release()
+        return self._load() or snapshot
+
+    def _current_snapshot(self) -> TrustTypeSnapshot | None:
+        snapshot = self._snapshot
+        if snapshot is None:
+            failed_at = self._load_failed_at
+            if (
+                failed_at is not None
+                and time.monotonic() - failed_at < TRUST_TYPE_LOAD_RETRY
+            ):
+                return None
+            return self._load()
+        if time.monotonic() - snapshot.checked_at > TRUST_TYPE_SNAPSHOT_TTL:
+            return self._refresh_if_stale(snapshot)
+        return snapshot
+
+    def refresh(self) -> int:
+        """Reload the snapshot from storage, e.g. after an out-of-band change.
+
+        Returns the number of trust types loaded (0 if loading failed).
+        """
+        snapshot = self._load()
+        return len(snapshot.types) if snapshot is not None else 0
+
+    def preload(self) -> int:
+        """Load the snapshot now, so the first request does not pay for it.
+
+        A no-op if a snapshot is already loaded. Returns the number of trust
+        types available.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return len(snapshot.types)
+        return self.refresh()
+
     def get_type(self, name: str) -> TrustType | None:
         """Get a trust type by name (from system actor properties)."""
-        if self._cache_valid and name in self._cache:
-            return self._cache[name]
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            trust_type = snapshot.types.get(name)
+            if trust_type is not None:
+                return trust_type
+            # Possibly registered by another process since the snapshot was
+            # read: check storage before reporting it unknown.
+            trust_type = self._read_type(name)
+            if trust_type is not None:
+                with self._load_lock:
+                    if self._snapshot is not None:
+                        self._snapshot = self._snapshot.with_type(trust_type)
+                    self.version += 1
+            return trust_type
+
+        # Bulk load unavailable: read the single property
+        return self._read_type(name)
 
+    def _read_type(self, name: str) -> TrustType | None:
+        """Read one trust type from its system actor property."""
         sys_actor = self._get_system_actor()
         if not sys_actor:
             return None
 
         try:
-            prop_name = f"trust_type:{name}"
+            prop_name = f"{TRUST_TYPE_PROPERTY_PREFIX}{name}"
             raw = getattr(sys_actor.property, prop_name, None)
             if not raw:
                 logger.debug(
@@ -195,7 +410,6 @@ class TrustTypeRegistry:
             logger.debug(
                 f"Loaded trust type '{name}' from DB: base_permissions={trust_type.base_permissions}"
             )
-            self._cache[name] = trust_type
             return trust_type
         except Exception as e:
             logger.error(f"Error loading trust type {name}: {e}")
@@ -203,29 +417,10 @@ class TrustTypeRegistry:
 
     def list_types(self) -> list[TrustType]:
         """List all registered trust types from system actor properties."""
-        sys_actor = self._get_system_actor()
-        if not sys_actor:
-            return []
-
-        trust_types: list[TrustType] = []
-        try:
-            props = sys_actor.get_properties() or {}
-            for key, raw in props.items():
-                if not isinstance(key, str) or not key.startswith("trust_type:"):
-                    continue
-                try:
-                    trust_type_data = json.loads(raw)
-                    trust_type = TrustType.from_dict(trust_type_data)
-                    trust_types.append(trust_type)
-                    self._cache[trust_type.name] = trust_type
-                except Exception as e:
-                    logger.error(f"Error parsing trust type {key}: {e}")
-                    continue
-            self._cache_valid = True
-            return trust_types
-        except Exception as e:
-            logger.error(f"Error listing trust types: {e}")
+        snapshot = self._current_snapshot()
+        if snapshot is None:
             return []
+        return list(snapshot.types.values())
 
     def delete_type(self, name: str) -> bool:
         """Delete a trust type."""
@@ -238,8 +433,13 @@ class TrustTypeRegistry:
             success = bucket.delete_attr(name=name)
 
             if success:
-                # Remove from cache
-                self._cache.pop(name, None)
+                sys_actor = self._get_system_actor()
+                if sys_actor:
+                    self._publish_change(
+                        sys_actor, lambda snap: snap.without_type(name)
+                    )
+                else:
+                    self.clear_cache()
                 logger.info(f"Deleted trust type: {name}")
                 return True
             else:
@@ -251,9 +451,24 @@ class TrustTypeRegistry:
             return False
 
     def clear_cache(self) -> None:
-        """Clear the internal cache."""
-        self._cache.clear()
-        self._cache_valid = False
+        """Drop the snapshot; the next lookup reloads all trust types."""
+        with self._load_lock:
+            self._snapshot = None
+            self._load_failed_at = None
+            self.version += 1
+
+    def snapshot(self) -> TrustTypeSnapshot | None:
+        """The current snapshot, without loading or refreshing it."""
+        return self._snapshot
+
+    def current_version(self) -> int:
+        """``version``, after the usual reload/refresh of the snapshot.
+
+        For caches of documents built from :meth:`list_types`: a change made
+        by another process shows up here once the snapshot is refreshed.
+        """
+        self._current_snapshot()
+        return self.version
 
 
 # Singleton instance
@@ -270,9 +485,7 @@ def initialize_registry(config: config_class.Config) -> None:
         _registry = TrustTypeRegistry(config)
         _registry_config = config
         _register_default_types(_registry)
-        logger.info(
-            f"Trust type registry initialized with {len(_registry.list_types())} types"
-        )
+        logger.info(f"Trust type registry initialized with {_registry.preload()} types")
 
 
 def get_registry(config: config_class.Config) -> TrustTypeRegistry:
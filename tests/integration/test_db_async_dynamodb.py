@@ -0,0 +1,105 @@
+"""Async DynamoDB classes against DynamoDB Local.
+
+Items written by the async classes must be read back by the sync classes and
+the other way round: both go through the same PynamoDB models, and this is
+what proves the table and key layouts really are identical.
+"""
+
+import os
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+
+pytest.importorskip("aiobotocore", reason="aiobotocore not installed")
+
+from actingweb.db import (  # noqa: E402
+    get_attribute,
+    get_attribute_async,
+    get_property,
+    get_property_async,
+    get_subscription,
+    get_subscription_async,
+    get_subscription_diff_async,
+    get_subscription_diff_list_async,
+)
+from actingweb.interface.app import ActingWebApp  # noqa: E402
+
+DATABASE_BACKEND = os.environ.get("DATABASE_BACKEND", "dynamodb")
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.skipif(DATABASE_BACKEND != "dynamodb", reason="DynamoDB-only test"),
+]
+
+
+@pytest.fixture
+def config(docker_services, setup_database, worker_info):  # noqa: ARG001
+    return ActingWebApp(
+        aw_type="urn:actingweb:test:db_async_dynamodb",
+        database="dynamodb",
+        fqdn="test.example.com",
+        proto="http://",
+    ).get_config()
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[None]:
+    from actingweb.db.dynamodb import close_async_client
+
+    yield
+    await close_async_client()
+
+
+@pytest.fixture
+def actor_id() -> str:
+    return f"async-ddb-{uuid.uuid4()}"
+
+
+async def test_property_round_trip(config, client, actor_id) -> None:
+    db = get_property_async(config)
+    assert await db.set(actor_id=actor_id, name="color", value="blue")
+    assert get_property(config).get(actor_id=actor_id, name="color") == "blue"
+
+    assert get_property(config).set(actor_id=actor_id, name="size", value="L")
+    assert await get_property_async(config).get(actor_id=actor_id, name="size") == "L"
+
+    assert await db.set(actor_id=actor_id, name="color", value="")
+    assert get_property(config).get(actor_id=actor_id, name="color") is None
+
+
+async def test_attribute_conditions(config, client, actor_id) -> None:
+    db = get_attribute_async(config)
+    assert await db.insert_attr_if_absent(
+        actor_id=actor_id, bucket="b", name="k", data={"a": 1, "b": 2}
+    )
+    assert not await db.insert_attr_if_absent(
+        actor_id=actor_id, bucket="b", name="k", data={"a": 9}
+    )
+    assert await db.conditional_update_attr(
+        actor_id=actor_id, bucket="b", name="k", old_data={"b": 2, "a": 1}, new_data=3
+    )
+    sync_attr = get_attribute(config).get_attr(actor_id=actor_id, bucket="b", name="k")
+    assert sync_attr is not None and sync_attr["data"] == 3
+    assert await db.delete_attr_conditional(actor_id=actor_id, bucket="b", name="k")
+    assert not await db.delete_attr_conditional(actor_id=actor_id, bucket="b", name="k")
+
+
+async def test_subscription_and_diffs(config, client, actor_id) -> None:
+    sub = get_subscription_async(config)
+    assert await sub.create(actor_id=actor_id, peerid="p1", subid="s1", target="t")
+    sync_sub = get_subscription(config).get(actor_id=actor_id, peerid="p1", subid="s1")
+    assert sync_sub is not None and sync_sub["target"] == "t"
+
+    diff = get_subscription_diff_async(config)
+    for seqnr in (1, 2, 3):
+        assert await diff.create(actor_id=actor_id, subid="s1", diff="{}", seqnr=seqnr)
+    first = await get_subscription_diff_async(config).get(actor_id=actor_id, subid="s1")
+    assert first is not None and first["sequence"] == 1
+
+    diffs = get_subscription_diff_list_async(config)
+    assert len(await diffs.fetch(actor_id=actor_id, subid="s1")) == 3
+    assert await diffs.delete(seqnr=2)
+    remaining = await diffs.fetch(actor_id=actor_id, subid="s1")
+    assert [d["sequence"] for d in remaining] == [3]
+    assert await sub.delete()
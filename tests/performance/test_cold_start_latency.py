@@ -0,0 +1,77 @@
+"""
+Benchmark: cold-start import time and first-request latency.
+
+Each run starts a fresh interpreter (as a Lambda cold start does), imports
+``ActingWebApp``, builds a Flask app and serves its first request
+(``GET /`` as JSON, which needs no storage). The median of ``RUNS`` runs has to
+stay inside the budgets below; the module-level budget that keeps handlers
+and unused frameworks out of the import graph is
+``tests/test_cold_start_import_budget.py``.
+
+Run with:
+    pytest tests/performance/test_cold_start_latency.py -v -s -o addopts=""
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+RUNS = 5
+IMPORT_BUDGET_S = 0.4
+FIRST_REQUEST_BUDGET_S = 0.5
+
+_PROBE = """
+import json, time
+t0 = time.perf_counter()
+from flask import Flask
+from actingweb.interface import ActingWebApp
+t1 = time.perf_counter()
+
+from unittest import mock
+mock.patch.object(ActingWebApp, "_initialize_permission_system").start()
+flask_app = Flask(__name__)
+ActingWebApp(aw_type="urn:actingweb:test:cold", fqdn="localhost",
+             proto="http://").integrate_flask(flask_app)
+client = flask_app.test_client()
+
+t2 = time.perf_counter()
+response = client.get("/", headers={"Accept": "application/json"})
+t3 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "first_request": t3 - t2,
+                  "status": response.status_code}))
+"""
+
+
+def _cold_start() -> dict[str, float]:
+    env = dict(os.environ)
+    env["AWS_DB_AUTO_CREATE_TABLES"] = "false"
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__))) or ".",
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.benchmark
+def test_cold_start_within_budget() -> None:
+    pytest.importorskip("flask")
+    runs = [_cold_start() for _ in range(RUNS)]
+    assert all(run["status"] == 200 for run in runs)
+
+    import_s = statistics.median(run["import"] for run in runs)
+    first_request_s = statistics.median(run["first_request"] for run in runs)
+    print(
+        f"\nimport: {import_s * 1000:.0f} ms, "
+        f"first request: {first_request_s * 1000:.0f} ms (median of {RUNS})"
+    )
+    assert import_s < IMPORT_BUDGET_S
+    assert first_request_s < FIRST_REQUEST_BUDGET_S
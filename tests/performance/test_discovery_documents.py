@@ -0,0 +1,75 @@
+"""
+Benchmark: serving /meta and the OAuth2/MCP discovery documents.
+
+``CALLS`` responses are produced for each of
+
+- ``/<actor_id>/meta``, built and serialised per request as ``MetaHandler``
+  did before, against ``discovery.get_actor_meta()`` (pre-encoded);
+- ``/.well-known/oauth-protected-resource/mcp`` (the largest discovery
+  document), built and serialised per request, against
+  ``discovery.get_document()``.
+
+The trust type registry is a stand-in, so no database is needed. Run with:
+    pytest tests/performance/test_discovery_documents.py -v -s -o addopts=""
+"""
+
+import json
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from actingweb import discovery
+from actingweb.config import Config
+
+CALLS = 20000
+
+
+class _Registry:
+    version = 1
+
+    def list_types(self) -> list[Any]:
+        return [SimpleNamespace(name=name) for name in ("friend", "viewer", "admin")]
+
+    def current_version(self) -> int:
+        return self.version
+
+
+def _time(fn: Callable[[], bytes]) -> float:
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        fn()
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_pre_encoded_documents() -> None:
+    config = Config(fqdn="aw.example.com", proto="https://")
+    name = ".well-known/oauth-protected-resource/mcp"
+    registry = _Registry()
+    with patch("actingweb.trust_type_registry.get_registry", lambda config: registry):
+        results = {
+            "meta rebuilt": _time(
+                lambda: json.dumps(discovery.actor_meta(config, "actor1", "")).encode()
+            ),
+            "meta cached": _time(
+                lambda: discovery.get_actor_meta(config, "actor1", "").body
+            ),
+            "discovery rebuilt": _time(
+                lambda: json.dumps(
+                    discovery.mcp_protected_resource_metadata(config)
+                ).encode()
+            ),
+            "discovery cached": _time(
+                lambda: discovery.get_document(config, name).body
+            ),
+        }
+
+    print()
+    for label, seconds in results.items():
+        print(f"{label:>18}: {seconds / CALLS * 1e6:6.2f} us/response")
+    assert results["meta cached"] < results["meta rebuilt"] / 2
+    assert results["discovery cached"] < results["discovery rebuilt"] / 2
@@ -0,0 +1,69 @@
+"""
+Load benchmark: the FastAPI integration's handler pool under concurrent load.
+
+``REQUESTS`` concurrent requests are dispatched from the event loop with
+``loop.run_in_executor``, as ``FastAPIIntegration`` runs its synchronous
+handlers; each handler blocks for ``HANDLER_IO_SECONDS`` of simulated storage
+or peer I/O.
+
+- ``fixed``: a 10-thread ``ThreadPoolExecutor`` (the previous pool, sized by
+  ``with_thread_pool_workers``).
+- ``adaptive``: ``AdaptiveThreadPoolExecutor`` with the same 10 core threads,
+  growing to the default 64.
+
+No database is needed. Run with:
+    pytest tests/performance/test_fastapi_handler_pool.py -v -s -o addopts=""
+"""
+
+import asyncio
+import concurrent.futures
+import time
+
+import pytest
+
+from actingweb.interface.integrations.adaptive_executor import (
+    DEFAULT_MAX_WORKERS,
+    AdaptiveThreadPoolExecutor,
+)
+
+POOL_WORKERS = 10
+REQUESTS = 200
+HANDLER_IO_SECONDS = 0.02
+
+
+def handler() -> None:
+    time.sleep(HANDLER_IO_SECONDS)
+
+
+async def _load(executor: concurrent.futures.Executor) -> float:
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(loop.run_in_executor(executor, handler) for _ in range(REQUESTS))
+    )
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_adaptive_pool_is_bounded_by_io() -> None:
+    fixed = concurrent.futures.ThreadPoolExecutor(max_workers=POOL_WORKERS)
+    adaptive = AdaptiveThreadPoolExecutor(
+        min_workers=POOL_WORKERS, max_workers=DEFAULT_MAX_WORKERS
+    )
+    try:
+        fixed_s = asyncio.run(_load(fixed))
+        adaptive_s = asyncio.run(_load(adaptive))
+        stats = adaptive.stats()
+    finally:
+        fixed.shutdown()
+        adaptive.shutdown()
+
+    print(
+        f"\n{REQUESTS} concurrent {HANDLER_IO_SECONDS * 1000:.0f} ms handlers: "
+        f"fixed {POOL_WORKERS} threads {fixed_s * 1000:.0f} ms "
+        f"({REQUESTS / fixed_s:.0f} req/s), adaptive {adaptive_s * 1000:.0f} ms "
+        f"({REQUESTS / adaptive_s:.0f} req/s, peak {stats.peak_workers} threads, "
+        f"queue wait p95 {stats.queue_wait_p95 * 1000:.0f} ms)"
+    )
+    assert stats.peak_workers == DEFAULT_MAX_WORKERS
+    assert adaptive_s < fixed_s / 2
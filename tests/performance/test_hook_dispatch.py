@@ -0,0 +1,111 @@
+"""
+Benchmark: property hook dispatch.
+
+``HookRegistry.execute_property_hooks`` is called ``CALLS`` times with
+
+- a sync hook (the floor: no event loop involved),
+- an async hook, run on the hook loop pool (``interface.hook_executor``),
+- an async hook run with ``asyncio.run()`` per call, as
+  ``_execute_hook_in_sync_context`` did before the loop pool.
+
+A second benchmark reads a property that has no hooks, with a peer auth
+context: the dispatch table answers "no hooks" without consulting the
+permission evaluator (mocked here, so the hooked timing is a lower bound).
+
+No database is needed. Run with:
+    pytest tests/performance/test_hook_dispatch.py -v -s -o addopts=""
+"""
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from actingweb.interface.hooks import HookRegistry
+
+CALLS = 2000
+
+
+class _Actor:
+    id = "bench-actor"
+
+
+def sync_hook(actor: Any, operation: str, value: Any, path: list[str]) -> Any:
+    return value
+
+
+async def async_hook(actor: Any, operation: str, value: Any, path: list[str]) -> Any:
+    return value
+
+
+def _run(registry: HookRegistry) -> float:
+    actor = _Actor()
+    start = time.perf_counter()
+    for i in range(CALLS):
+        assert registry.execute_property_hooks("email", "get", actor, i) == i
+    return time.perf_counter() - start
+
+
+def _registry(hook: Any) -> HookRegistry:
+    registry = HookRegistry()
+    registry.register_property_hook("email", hook)
+    return registry
+
+
+@pytest.mark.benchmark
+def test_async_hooks_reuse_the_hook_loop() -> None:
+    sync_s = _run(_registry(sync_hook))
+    shared_s = _run(_registry(async_hook))
+
+    def asyncio_run_per_call(hook: Any, *args: Any, **kwargs: Any) -> Any:
+        return asyncio.run(hook(*args, **kwargs))
+
+    with patch(
+        "actingweb.interface.hooks.run_async_hook", side_effect=asyncio_run_per_call
+    ):
+        per_call_s = _run(_registry(async_hook))
+
+    def us(seconds: float) -> float:
+        return seconds * 1_000_000 / CALLS
+
+    print(
+        f"\n{CALLS} property hook calls: sync hook {us(sync_s):.1f} us/call, "
+        f"async hook on the loop pool {us(shared_s):.1f} us/call, "
+        f"async hook with asyncio.run per call {us(per_call_s):.1f} us/call"
+    )
+    assert shared_s < per_call_s
+
+
+@pytest.mark.benchmark
+def test_unhooked_property_skips_permission_evaluation() -> None:
+    from actingweb.permission_evaluator import PermissionResult
+
+    registry = HookRegistry()
+    for i in range(50):
+        registry.register_property_hook(f"prop{i}", sync_hook)
+    registry.build_dispatch_table()
+    actor = _Actor()
+    auth_context = {"peer_id": "peer-1", "config": object()}
+
+    with patch("actingweb.interface.hooks.get_permission_evaluator") as get:
+        evaluator = get.return_value
+        evaluator.evaluate_property_access.return_value = PermissionResult.ALLOWED
+        start = time.perf_counter()
+        for i in range(CALLS):
+            registry.execute_property_hooks("notes", "get", actor, i, [], auth_context)
+        unhooked_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for i in range(CALLS):
+            registry.execute_property_hooks("prop7", "get", actor, i, [], auth_context)
+        hooked_s = time.perf_counter() - start
+
+    print(
+        f"\n{CALLS} peer property reads: no hook {unhooked_s * 1_000_000 / CALLS:.2f}"
+        f" us/call, with hook and permission check "
+        f"{hooked_s * 1_000_000 / CALLS:.2f} us/call"
+    )
+    # Only the hooked property consulted the permission evaluator
+    assert evaluator.evaluate_property_access.call_count == CALLS
+    assert unhooked_s < hooked_s
@@ -0,0 +1,121 @@
+"""
+Benchmark: ``actingweb.json_codec`` with the stdlib backend against orjson
+(and msgspec when installed) on representative payloads:
+
+- small properties: ``PROPERTIES`` small JSON values decoded as a property
+  read does and encoded as ``ListProperty`` items are,
+- callback blobs: a subscription callback wrapping about 64 KB of data,
+  encoded as ``fanout.py`` sends it and decoded as the peer's callback
+  handler reads it,
+- a ``LIST_ITEMS``-item list, encoded item by item as a list is written and
+  decoded item by item as it is read.
+
+Reported per payload and backend: microseconds per round (encode plus
+decode), best of ``ROUNDS``.
+
+No database is needed. Run with:
+    pytest tests/performance/test_json_codec.py -v -s -o addopts=""
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+
+from actingweb import json_codec
+
+PROPERTIES = 1000
+LIST_ITEMS = 10000
+ROUNDS = 5
+
+
+def _small_properties() -> list[Any]:
+    return [
+        {"name": f"Item {i}", "enabled": i % 2 == 0, "count": i, "ratio": i / 7}
+        for i in range(PROPERTIES)
+    ]
+
+
+def _callback_blob() -> dict[str, Any]:
+    data = {
+        f"prop{i:04d}": {"title": f"Item {i}", "tags": ["a", "b"], "text": "x" * 40}
+        for i in range(610)
+    }
+    return {
+        "id": "actor1",
+        "target": "properties",
+        "sequence": 42,
+        "timestamp": "2026-01-02T03:04:05.000000Z",
+        "granularity": "high",
+        "subscriptionid": "sub1",
+        "data": data,
+    }
+
+
+def _list_items() -> list[Any]:
+    return [
+        {"id": i, "title": f"Note {i}", "done": False, "tags": ["x"]}
+        for i in range(LIST_ITEMS)
+    ]
+
+
+def _best_us(work: Callable[[], None]) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        work()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def _per_item(values: list[Any]) -> Callable[[], None]:
+    def work() -> None:
+        encoded = [json_codec.encode(value) for value in values]
+        for text in encoded:
+            json_codec.loads(text)
+
+    return work
+
+
+def _callback(wrapper: dict[str, Any]) -> Callable[[], None]:
+    def work() -> None:
+        json_codec.loads(json_codec.encode_bytes(wrapper))
+
+    return work
+
+
+def _backends() -> Iterator[str]:
+    yield "json"
+    if json_codec.ORJSON_AVAILABLE:
+        yield "orjson"
+    if json_codec.MSGSPEC_AVAILABLE:
+        yield "msgspec"
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not json_codec.ORJSON_AVAILABLE, reason="orjson not installed")
+def test_json_codec_backends() -> None:
+    wrapper = _callback_blob()
+    blob_kb = len(json_codec.dumps(wrapper)) / 1024
+    payloads = {
+        f"{PROPERTIES} small properties": _per_item(_small_properties()),
+        f"{blob_kb:.0f} KB callback": _callback(wrapper),
+        f"{LIST_ITEMS}-item list": _per_item(_list_items()),
+    }
+    results: dict[str, dict[str, float]] = {}
+    try:
+        for backend in _backends():
+            json_codec.configure(backend)
+            results[backend] = {name: _best_us(work) for name, work in payloads.items()}
+    finally:
+        json_codec.reset()
+
+    print()
+    for name in payloads:
+        timings = ", ".join(
+            f"{backend} {results[backend][name]:.0f} us" for backend in results
+        )
+        print(f"{name}: {timings}")
+    for name in payloads:
+        assert results["orjson"][name] < results["json"][name] / 1.5
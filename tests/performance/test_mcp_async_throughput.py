@@ -0,0 +1,211 @@
+"""
+Load benchmark: native async MCP path vs. the thread-pooled sync path.
+
+Each session sends one authenticated ``tools/call`` for a tool that spends
+5 ms on simulated I/O. Authentication is warm (token, actor and trust cached),
+which is the steady state for a connected MCP client.
+
+- ``native``: ``AsyncMCPHandler.post_async`` awaited on the event loop, as the
+  FastAPI integration serves ``/mcp``; the tool is ``async`` and awaits.
+- ``pooled``: ``MCPHandler.post`` dispatched to a 10-worker thread pool (the
+  ``with_thread_pool_workers`` default), as the FastAPI integration serves its
+  other synchronous handlers; the tool is sync and blocks its worker.
+
+No database is needed. Run with:
+    pytest tests/performance/test_mcp_async_throughput.py -v -o addopts=""
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from actingweb import aw_web_request, config
+from actingweb.handlers import mcp as mcp_module
+from actingweb.handlers.async_mcp import AsyncMCPHandler
+from actingweb.handlers.mcp import MCPHandler
+from actingweb.interface.actor_interface import ActorInterface
+from actingweb.interface.hooks import HookRegistry
+from actingweb.mcp import mcp_tool
+from actingweb.permission_evaluator import PermissionResult
+
+POOL_WORKERS = 10
+TOOL_IO_SECONDS = 0.005
+
+
+class _InFlight:
+    """Tool calls in progress, and the most seen at once."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __enter__(self) -> None:
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *exc: Any) -> None:
+        with self._lock:
+            self.current -= 1
+
+
+_in_flight = _InFlight()
+
+
+@pytest.fixture(scope="module")
+def cfg() -> config.Config:
+    c = config.Config()
+    c.fqdn = "bench.example.com"
+    c.proto = "https://"
+    return c
+
+
+@pytest.fixture(scope="module")
+def hooks() -> HookRegistry:
+    registry = HookRegistry()
+
+    @mcp_tool(description="simulated I/O")
+    async def io_tool(actor: Any, action_name: str, data: dict[str, Any]) -> Any:
+        with _in_flight:
+            await asyncio.sleep(TOOL_IO_SECONDS)
+        return {"ok": True}
+
+    @mcp_tool(name="io_tool_sync", description="simulated blocking I/O")
+    def io_tool_sync(actor: Any, action_name: str, data: dict[str, Any]) -> Any:
+        with _in_flight:
+            time.sleep(TOOL_IO_SECONDS)
+        return {"ok": True}
+
+    registry.register_action_hook("io_tool", io_tool)
+    registry.register_action_hook("io_tool_sync", io_tool_sync)
+    return registry
+
+
+@pytest.fixture
+def warm_sessions(cfg: config.Config) -> Iterator[list[str]]:
+    """1000 cached bearer tokens, each for its own actor and trust."""
+    tokens = []
+    for i in range(1000):
+        actor_id, client_id, token = f"bench_{i}", f"client_{i}", f"token_{i}"
+        core = SimpleNamespace(id=actor_id, creator="bench@example.com")
+        mcp_module._token_cache.put(
+            token, {"actor_id": actor_id, "client_id": client_id, "token_data": {}}
+        )
+        mcp_module._actor_cache.put(
+            actor_id,
+            {"actor": ActorInterface(core), "config": cfg},  # type: ignore[arg-type]
+        )
+        mcp_module._trust_cache.put(
+            (actor_id, client_id),
+            SimpleNamespace(peerid=f"peer_{i}", oauth_client_id=client_id),
+        )
+        tokens.append(token)
+    evaluator = Mock()
+    evaluator.evaluate_permission = Mock(return_value=PermissionResult.ALLOWED)
+    evaluator.permission_version = 0
+    with patch(
+        "actingweb.permission_evaluator.get_permission_evaluator",
+        return_value=evaluator,
+    ):
+        yield tokens
+    for cache in (
+        mcp_module._token_cache,
+        mcp_module._actor_cache,
+        mcp_module._trust_cache,
+    ):
+        cache.clear()
+
+
+def _webobj(token: str) -> aw_web_request.AWWebObj:
+    return aw_web_request.AWWebObj(
+        url="https://bench.example.com/mcp",
+        params={},
+        body="",
+        headers={"Authorization": f"Bearer {token}"},
+        cookies={},
+    )
+
+
+def _call(tool: str) -> dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": tool, "arguments": {}},
+    }
+
+
+async def _native(tokens: list[str], cfg: config.Config, hooks: HookRegistry) -> None:
+    async def one(token: str) -> dict[str, Any]:
+        handler = AsyncMCPHandler(_webobj(token), cfg, hooks=hooks)
+        return await handler.post_async(_call("io_tool"))
+
+    results = await asyncio.gather(*(one(t) for t in tokens))
+    assert all("result" in r and not r["result"].get("isError") for r in results)
+
+
+async def _pooled(tokens: list[str], cfg: config.Config, hooks: HookRegistry) -> None:
+    loop = asyncio.get_running_loop()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=POOL_WORKERS) as pool:
+
+        def one(token: str) -> dict[str, Any]:
+            return MCPHandler(_webobj(token), cfg, hooks=hooks).post(
+                _call("io_tool_sync")
+            )
+
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, one, t) for t in tokens)
+        )
+    assert all("result" in r and not r["result"].get("isError") for r in results)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("sessions", [50, 200, 1000])
+@pytest.mark.parametrize("path", ["native", "pooled"])
+def test_mcp_tools_call_throughput(
+    benchmark: Any,
+    cfg: config.Config,
+    hooks: HookRegistry,
+    warm_sessions: list[str],
+    path: str,
+    sessions: int,
+) -> None:
+    """Requests/second for ``sessions`` concurrent warm MCP sessions."""
+    tokens = warm_sessions[:sessions]
+    run = _native if path == "native" else _pooled
+
+    def round_trip() -> None:
+        asyncio.run(run(tokens, cfg, hooks))
+
+    benchmark.pedantic(round_trip, rounds=3, iterations=1)
+
+    if benchmark.stats:
+        throughput = sessions / benchmark.stats.stats.mean
+        benchmark.extra_info["requests_per_second"] = round(throughput, 1)
+        print(f"\n{path} @ {sessions} sessions: {throughput:.0f} req/s")
+
+
+def test_native_path_overlaps_more_calls_than_the_pool(
+    cfg: config.Config, hooks: HookRegistry, warm_sessions: list[str]
+) -> None:
+    """Sanity check without pytest-benchmark: 200 sessions, one round each.
+
+    The pool runs at most ``POOL_WORKERS`` tool calls at once; the native
+    path overlaps their I/O beyond that.
+    """
+    tokens = warm_sessions[:200]
+    peaks = {}
+    for name, run in (("native", _native), ("pooled", _pooled)):
+        _in_flight.peak = 0
+        asyncio.run(run(tokens, cfg, hooks))
+        peaks[name] = _in_flight.peak
+    assert peaks["pooled"] <= POOL_WORKERS
+    assert peaks["native"] > POOL_WORKERS
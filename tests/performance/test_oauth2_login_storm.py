@@ -0,0 +1,156 @@
+"""
+Login-storm benchmark: id_token replay checks under concurrency.
+
+Every native sign-in records its id_token in ``IdTokenReplayCache``. The
+backend here is in memory but models the property that matters on DynamoDB:
+each partition (actor id) serves one request at a time, for ``OP_SECONDS``.
+So throughput is bounded by round trips per login and by how many partitions
+those round trips are spread over.
+
+- ``legacy``: read-then-write on the single system actor (a backend without
+  ``insert_attr_if_absent``), the pre-sharding behaviour.
+- ``conditional``: one conditional write per login, one partition.
+- ``sharded``: one conditional write per login over ``SHARDS`` partitions.
+
+No database is needed. Run with:
+    pytest tests/performance/test_oauth2_login_storm.py -v -o addopts=""
+"""
+
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from actingweb.config import Config
+from actingweb.oauth2_replay import IdTokenReplayCache
+
+OP_SECONDS = 0.001
+SHARDS = 8
+WORKERS = 32
+LOGINS = 400
+
+
+def _make_config(conditional: bool, shards: int) -> Config:
+    config = Mock(spec=Config)
+    config.oauth2_system_shards = shards
+    config.id_token_replay_prefilter = True
+    storage: dict[str, dict[str, Any]] = defaultdict(dict)
+    partitions: dict[str, threading.Lock] = defaultdict(threading.Lock)
+    # Round trips per partition
+    config.partition_ops = Counter()
+    guard = threading.Lock()
+
+    def partition(actor_id: str) -> threading.Lock:
+        with guard:
+            config.partition_ops[actor_id] += 1
+            return partitions[actor_id]
+
+    class PartitionedDbAttribute:
+        def get_attr(self, actor_id, bucket, name):  # type: ignore
+            with partition(actor_id):
+                time.sleep(OP_SECONDS)
+                return storage[f"{actor_id}:{bucket}"].get(name)
+
+        def set_attr(
+            self, actor_id, bucket, name, data, timestamp=None, ttl_seconds=None
+        ):  # type: ignore
+            with partition(actor_id):
+                time.sleep(OP_SECONDS)
+                storage[f"{actor_id}:{bucket}"][name] = {"data": data}
+                return True
+
+    if conditional:
+
+        def insert_attr_if_absent(  # type: ignore
+            self, actor_id, bucket, name, data, timestamp=None, ttl_seconds=None
+        ):
+            with partition(actor_id):
+                time.sleep(OP_SECONDS)
+                slot = storage[f"{actor_id}:{bucket}"]
+                if name in slot:
+                    return False
+                slot[name] = {"data": data}
+                return True
+
+        PartitionedDbAttribute.insert_attr_if_absent = insert_attr_if_absent  # type: ignore[attr-defined]
+
+    db_module = Mock()
+    db_module.DbAttribute = PartitionedDbAttribute
+    config.DbAttribute = db_module
+    return config
+
+
+SCENARIOS = {
+    "legacy": (False, 1),
+    "conditional": (True, 1),
+    "sharded": (True, SHARDS),
+}
+
+
+def _storm(config: Config, logins: int) -> list[bool]:
+    now = int(time.time())
+    claims = [
+        {
+            "iss": "https://appleid.apple.com",
+            "sub": f"user{i}",
+            "iat": now,
+            "exp": now + 600,
+            "jti": f"storm-{id(config)}-{i}",
+        }
+        for i in range(logins)
+    ]
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        return list(
+            pool.map(lambda c: IdTokenReplayCache(config).check_and_record(c), claims)
+        )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_login_storm_throughput(benchmark: Any, scenario: str) -> None:
+    """Logins/second for ``LOGINS`` distinct id_tokens on ``WORKERS`` threads."""
+    conditional, shards = SCENARIOS[scenario]
+
+    def storm() -> None:
+        assert all(_storm(_make_config(conditional, shards), LOGINS))
+
+    benchmark.pedantic(storm, rounds=3, iterations=1)
+
+    if benchmark.stats:
+        throughput = LOGINS / benchmark.stats.stats.mean
+        benchmark.extra_info["logins_per_second"] = round(throughput, 1)
+        print(f"\n{scenario}: {throughput:.0f} logins/s")
+
+
+def test_concurrent_replays_accept_exactly_once() -> None:
+    """The same id_token presented by many threads at once is accepted once."""
+    config = _make_config(conditional=True, shards=SHARDS)
+    now = int(time.time())
+    claims = {"iss": "i", "sub": "s", "iat": now, "exp": now + 600, "jti": "dup"}
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = list(
+            pool.map(
+                lambda _: IdTokenReplayCache(config).check_and_record(claims),
+                range(WORKERS),
+            )
+        )
+    assert results.count(True) == 1
+
+
+def test_sharding_spreads_round_trips_over_partitions() -> None:
+    """Sanity check without pytest-benchmark, one storm per scenario.
+
+    Throughput is bounded by the busiest partition's round trips, as each
+    partition serves one request at a time.
+    """
+    busiest = {}
+    for name, (conditional, shards) in SCENARIOS.items():
+        config = _make_config(conditional, shards)
+        assert all(_storm(config, 200))
+        busiest[name] = max(config.partition_ops.values())  # type: ignore[attr-defined]
+    assert busiest["conditional"] < busiest["legacy"]
+    assert busiest["sharded"] < busiest["conditional"]
@@ -0,0 +1,111 @@
+"""
+Benchmark: shared keep-alive peer transport vs. a new client per call.
+
+A local HTTP/1.1 server stands in for a peer actor and counts the connections
+it accepts. ``CALLS`` sequential GETs are sent
+
+- ``per_call``: with a new ``httpx.Client`` per call, as the peer call sites
+  did before ``actingweb.peer_transport`` (one TCP handshake per call),
+- ``shared``: through ``peer_transport.get``, reusing the pooled connection.
+
+Plain TCP on loopback; against a remote peer over TLS the saving per call is
+the round trips of the TCP and TLS handshakes. No database is needed. Run with:
+    pytest tests/performance/test_peer_transport.py -v -s -o addopts=""
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import httpx
+import pytest
+
+from actingweb import peer_transport
+
+CALLS = 200
+
+
+class _PeerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle and
+    # delayed ACKs add ~40 ms to every response on a kept-alive connection
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        super().setup()
+        server: Any = self.server
+        with server.lock:
+            server.connections += 1
+
+    def do_GET(self) -> None:
+        body = b"subscriptionbatch,subscriptionresync"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def peer() -> Iterator[Any]:
+    server: Any = ThreadingHTTPServer(("127.0.0.1", 0), _PeerHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/meta/actingweb/supported"
+    peer_transport.configure(peer_transport.TransportSettings())
+    yield server
+    peer_transport.close_clients()
+    server.shutdown()
+    server.server_close()
+
+
+def _per_call(url: str) -> None:
+    with httpx.Client(timeout=10.0) as client:
+        assert client.get(url).status_code == 200
+
+
+def _shared(url: str) -> None:
+    assert peer_transport.get(url, timeout=10.0).status_code == 200
+
+
+def _run(call: Any, url: str) -> float:
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        call(url)
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_shared_transport_reuses_connections(peer: Any) -> None:
+    per_call_s = _run(_per_call, peer.url)
+    per_call_connections, peer.connections = peer.connections, 0
+    shared_s = _run(_shared, peer.url)
+
+    print(
+        f"\n{CALLS} calls: per-call clients {per_call_s * 1000 / CALLS:.2f} ms/call "
+        f"({per_call_connections} connections), shared transport "
+        f"{shared_s * 1000 / CALLS:.2f} ms/call ({peer.connections} connections)"
+    )
+    assert per_call_connections == CALLS
+    assert peer.connections == 1
+    assert shared_s < per_call_s
+
+
+@pytest.mark.benchmark
+async def test_async_calls_share_the_loop_client(peer: Any) -> None:
+    client = await peer_transport.get_async_client()
+    try:
+        for _ in range(CALLS // 4):
+            response = await client.get(peer.url, timeout=10.0)
+            assert response.status_code == 200
+    finally:
+        await peer_transport.close_async_client()
+    assert peer.connections == 1
@@ -0,0 +1,96 @@
+"""
+Benchmark: compiled pattern matcher vs. the per-pattern loop.
+
+A bulk property check evaluates every property against the same rule lists.
+With the per-pattern loop each property costs one regex call per pattern;
+the compiled matcher answers with a dict lookup, one ``startswith`` and at
+most one alternation regex.
+
+- ``loop``: ``_matches_pattern`` for each of ``RULES`` patterns, the
+  pre-compilation behaviour of ``_matches_any_pattern``.
+- ``compiled``: ``evaluate_bulk_property_access``'s path, one
+  ``PatternMatcher`` per rule list.
+
+No database is needed. Run with:
+    pytest tests/performance/test_permission_pattern_matching.py -v -o addopts=""
+"""
+
+import time
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from actingweb import permission_evaluator as pe
+from actingweb.permission_evaluator import PermissionEvaluator
+from actingweb.permission_patterns import compile_patterns
+
+NAMES = 1000
+RULES = 40
+
+
+def _rules() -> list[str]:
+    rules = [f"app{i}/*" for i in range(RULES // 2)]
+    rules += [f"data_{i}_?x*" for i in range(RULES // 4)]
+    rules += [f"exact_{i}" for i in range(RULES - len(rules))]
+    return rules
+
+
+def _names() -> list[str]:
+    # Mostly misses, which is the worst case for the loop
+    return [f"user/{i}/setting" if i % 10 else f"app{i % 20}/x" for i in range(NAMES)]
+
+
+@pytest.fixture(scope="module")
+def evaluator() -> PermissionEvaluator:
+    with (
+        patch.object(pe, "get_trust_type_registry"),
+        patch.object(pe, "get_trust_permission_store"),
+    ):
+        return PermissionEvaluator(Mock())
+
+
+def _loop(evaluator: PermissionEvaluator, rules: list[str], names: list[str]) -> int:
+    return sum(1 for n in names if any(evaluator._matches_pattern(n, p) for p in rules))
+
+
+def _compiled(rules: list[str], names: list[str]) -> int:
+    matcher = compile_patterns(rules)
+    return sum(1 for n in names if matcher.matches(n))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("strategy", ["loop", "compiled"])
+def test_pattern_matching_throughput(
+    benchmark: Any, evaluator: PermissionEvaluator, strategy: str
+) -> None:
+    """Names/second checked against ``RULES`` patterns."""
+    rules, names = _rules(), _names()
+    if strategy == "loop":
+        result = benchmark(_loop, evaluator, rules, names)
+    else:
+        result = benchmark(_compiled, rules, names)
+    assert result == NAMES // 10
+
+    if benchmark.stats:
+        throughput = NAMES / benchmark.stats.stats.mean
+        benchmark.extra_info["names_per_second"] = round(throughput, 1)
+        print(f"\n{strategy}: {throughput:.0f} names/s")
+
+
+def test_compiled_matcher_outpaces_the_loop(evaluator: PermissionEvaluator) -> None:
+    """Sanity check without pytest-benchmark, best of five rounds each."""
+    rules, names = _rules(), _names()
+    assert _loop(evaluator, rules, names) == _compiled(rules, names)
+    timings = {}
+    for name, run in (
+        ("loop", lambda: _loop(evaluator, rules, names)),
+        ("compiled", lambda: _compiled(rules, names)),
+    ):
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+    assert timings["compiled"] < timings["loop"]
@@ -0,0 +1,85 @@
+"""
+Benchmark: PostgreSQL connection pool under saturation.
+
+``WORKERS`` threads share a pool of ``POOL_SIZE`` connections and each run
+``QUERIES`` short queries (``pg_sleep(QUERY_S)``), so most of the wall time is
+spent waiting for a connection. ``pool_metrics()`` must attribute that time to
+pool wait, not to holding the connection, which is what makes it useful for
+telling a pool that is too small apart from slow queries.
+
+Needs a local PostgreSQL (see ``PG_DB_*`` in
+``actingweb/db/postgresql/connection.py``). Run with:
+    DATABASE_BACKEND=postgresql pytest tests/performance/test_pg_pool_saturation.py -v -s -o addopts=""
+"""
+
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+pytest.importorskip("psycopg", reason="PostgreSQL extra not installed")
+
+from actingweb.db.postgresql import connection  # noqa: E402
+
+POOL_SIZE = 4
+WORKERS = 32
+QUERIES = 10
+QUERY_S = 0.01
+
+
+@pytest.fixture
+def small_pool(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    if os.environ.get("DATABASE_BACKEND") != "postgresql":
+        pytest.skip("PostgreSQL-only benchmark")
+    monkeypatch.setenv("PG_POOL_MIN_SIZE", str(POOL_SIZE))
+    monkeypatch.setenv("PG_POOL_MAX_SIZE", str(POOL_SIZE))
+    monkeypatch.setenv("PG_POOL_TIMEOUT", "30")
+    monkeypatch.setenv("PG_POOL_HEALTH_CHECK_INTERVAL", "0")
+    connection.close_pool()
+    try:
+        connection.get_pool().wait(timeout=5)
+    except Exception as e:
+        connection.close_pool()
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+    connection.reset_pool_metrics()
+    yield
+    connection.close_pool()
+
+
+def _worker() -> None:
+    for _ in range(QUERIES):
+        with connection.get_connection("saturation") as conn:
+            conn.execute("SELECT pg_sleep(%s)", (QUERY_S,))
+
+
+@pytest.mark.benchmark
+def test_pool_saturation_is_visible_as_wait(small_pool: Any) -> None:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        for future in [pool.submit(_worker) for _ in range(WORKERS)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+
+    metrics = connection.pool_metrics()
+    family = metrics["families"]["saturation"]
+    total = WORKERS * QUERIES
+    print(
+        f"\n{total} queries over {POOL_SIZE} connections in {elapsed:.2f}s: "
+        f"wait avg {family['wait_ms_avg']:.1f} ms (max {family['wait_ms_max']:.0f}), "
+        f"held avg {family['held_ms_avg']:.1f} ms, "
+        f"pool requests_waiting={metrics['pool'].get('requests_waiting', 0)}"
+    )
+    assert family["checkouts"] == total
+    assert family["timeouts"] == 0
+    # Eight threads per connection: waiting dominates holding
+    assert family["wait_ms_avg"] > family["held_ms_avg"]
+    assert metrics["pool"]["requests_waiting"] >= 0
+
+
+@pytest.mark.benchmark
+def test_health_check_against_server(small_pool: Any) -> None:
+    result = connection.check_pool_health()
+    assert result["ok"] is True, result
@@ -0,0 +1,118 @@
+"""
+Benchmark: hot property reads across requests with and without
+``actingweb.property_snapshot``.
+
+Each of ``REQUESTS`` requests creates a fresh ``PropertyStore`` for one actor
+and reads its ``HOT`` hot properties, as a handler reading configuration and
+profile does; every ``WRITE_EVERY``-th request also writes one of them. The
+property and version stores sleep ``LATENCY`` per call to stand in for a
+database round trip.
+
+Reported: database reads (property and version) and wall time per request,
+without and with snapshots.
+
+No database is needed. Run with:
+    pytest tests/performance/test_property_snapshot.py -v -s -o addopts=""
+"""
+
+import time
+import types
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from actingweb.property import PropertyStore
+from actingweb.property_snapshot import PropertySnapshots
+
+REQUESTS = 200
+HOT = 8
+WRITE_EVERY = 20
+LATENCY = 0.0005
+
+
+class _Storage:
+    def __init__(self) -> None:
+        self.properties = {("a1", f"hot{i}"): f"value{i}" for i in range(HOT)}
+        self.version: dict[str, Any] | None = None
+        self.reads = 0
+
+
+class _Bucket:
+    def __init__(self, storage: _Storage) -> None:
+        self.storage = storage
+        self.data: dict[str, Any] = {}
+
+    def get_attr(self, name: str) -> dict[str, Any] | None:
+        time.sleep(LATENCY)
+        self.storage.reads += 1
+        version = self.storage.version
+        return {"data": dict(version)} if version is not None else None
+
+    def insert_attr_if_absent(self, name: str, data: dict[str, Any]) -> bool:
+        time.sleep(LATENCY)
+        self.storage.version = dict(data)
+        return True
+
+    def conditional_update_attr(
+        self, name: str, old_data: dict[str, Any], new_data: dict[str, Any]
+    ) -> bool:
+        time.sleep(LATENCY)
+        self.storage.version = dict(new_data)
+        return True
+
+
+def _config(storage: _Storage, max_actors: int | None) -> Any:
+    class DbProperty:
+        def __init__(self, **_: Any) -> None:
+            pass
+
+        def get(self, actor_id: str, name: str) -> Any:
+            time.sleep(LATENCY)
+            storage.reads += 1
+            return storage.properties.get((actor_id, name))
+
+        def set(self, actor_id: str, name: str, value: Any) -> bool:
+            time.sleep(LATENCY)
+            storage.properties[(actor_id, name)] = value
+            return True
+
+    class Config:
+        pass
+
+    config = Config()
+    config.DbProperty = types.SimpleNamespace(DbProperty=DbProperty)  # type: ignore[attr-defined]
+    config.use_lookup_table = False  # type: ignore[attr-defined]
+    config.indexed_properties = []  # type: ignore[attr-defined]
+    config.property_snapshot_max_actors = max_actors  # type: ignore[attr-defined]
+    return config
+
+
+def _run(max_actors: int | None) -> tuple[int, float]:
+    storage = _Storage()
+    config = _config(storage, max_actors)
+    with patch.object(PropertySnapshots, "_bucket", lambda self, a: _Bucket(storage)):
+        start = time.perf_counter()
+        for request in range(REQUESTS):
+            store = PropertyStore(actor_id="a1", config=config)
+            for i in range(HOT):
+                assert getattr(store, f"hot{i}") is not None
+            if request % WRITE_EVERY == WRITE_EVERY - 1:
+                store.hot0 = f"value{request}"
+        elapsed = time.perf_counter() - start
+    return storage.reads, elapsed / REQUESTS * 1e3
+
+
+@pytest.mark.benchmark
+def test_property_snapshot_reads() -> None:
+    plain_reads, plain_ms = _run(None)
+    snapshot_reads, snapshot_ms = _run(100)
+
+    print()
+    print(f"without snapshots: {plain_reads} reads, {plain_ms:.2f} ms/request")
+    print(f"with snapshots: {snapshot_reads} reads, {snapshot_ms:.2f} ms/request")
+    assert plain_reads == REQUESTS * HOT
+    # One version read per request, plus the reads refilling the snapshot
+    # after each write
+    assert snapshot_reads < plain_reads / 3
+    assert snapshot_ms < plain_ms
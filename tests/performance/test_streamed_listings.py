@@ -0,0 +1,83 @@
+"""
+Benchmark: ``GET /<actor_id>/properties`` for an actor with ``PROPERTIES``
+JSON properties, buffered against streamed (``with_streaming_listings()``).
+
+The storage read is a stand-in returning the actor's rows, which both modes
+hold while the response is produced. On top of that, the buffered response
+held every decoded value and the whole encoded body; the streamed one holds
+one value and one chunk at a time. Reported per mode: peak memory allocated
+while producing the body (``tracemalloc``) and the time until the first chunk
+is ready.
+
+No database is needed. Run with:
+    pytest tests/performance/test_streamed_listings.py -v -s -o addopts=""
+"""
+
+import json
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from actingweb.aw_web_request import AWWebObj
+from actingweb.config import Config
+from actingweb.handlers.properties import PropertiesHandler
+
+PROPERTIES = 20000
+
+
+def _rows() -> dict[str, str]:
+    return {
+        f"prop{i:05d}": json.dumps(
+            {"title": f"Item {i}", "tags": ["a", "b", "c"], "text": "x" * 200}
+        )
+        for i in range(PROPERTIES)
+    }
+
+
+def _produce_body(rows: dict[str, str], min_items: int | None) -> tuple[float, float]:
+    """Peak MB allocated and seconds to the first chunk."""
+    config = Config()
+    config.stream_listings_min_items = min_items
+    handler = PropertiesHandler(AWWebObj(), config)
+    db_list = Mock()
+    db_list.fetch_all_including_lists.return_value = rows
+    actor_interface = Mock(id="actor1", property_lists=None)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    with (
+        patch("actingweb.handlers.properties.get_property_list", return_value=db_list),
+        patch.object(handler, "_get_actor_interface", return_value=actor_interface),
+    ):
+        handler.listall(Mock(id="actor1"), Mock(acl={}))
+    response: Any = handler.response
+    if response.stream is not None:
+        chunks = iter(response.stream)
+        first = next(chunks)
+        first_s = time.perf_counter() - start
+        size = len(first) + sum(len(chunk) for chunk in chunks)
+    else:
+        first_s = time.perf_counter() - start
+        size = len(response.body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert size > PROPERTIES * 200
+    return peak / 1e6, first_s
+
+
+@pytest.mark.benchmark
+def test_streamed_property_listing() -> None:
+    rows = _rows()
+    buffered_mb, buffered_s = _produce_body(rows, None)
+    streamed_mb, streamed_s = _produce_body(rows, 1000)
+
+    print(
+        f"\n{PROPERTIES} properties: buffered peak {buffered_mb:.1f} MB, "
+        f"first byte after {buffered_s * 1000:.0f} ms; streamed peak "
+        f"{streamed_mb:.1f} MB, first byte after {streamed_s * 1000:.1f} ms"
+    )
+    assert streamed_mb < buffered_mb / 4
+    assert streamed_s < buffered_s / 4
@@ -0,0 +1,115 @@
+"""
+Benchmark: the www trust page for an actor with ``TRUSTS`` relationships.
+
+- Loading: ``WwwHandler`` builds the page context with a trust permission
+  store whose reads each take ``READ_SECONDS`` (simulated storage). The
+  previous loader read every peer's overrides separately; the bulk loader
+  reads the actor's overrides once.
+- Rendering: the default ``aw-actor-www-trust.html`` rendered by Jinja2
+  each time, against ``FragmentCache`` for unchanged data.
+
+No database is needed. Run with:
+    pytest tests/performance/test_www_trust_page.py -v -s -o addopts=""
+"""
+
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from jinja2 import Environment, FileSystemLoader
+
+from actingweb.aw_web_request import AWWebObj
+from actingweb.handlers.www import WwwHandler
+from actingweb.interface.integrations.base_integration import default_templates_dir
+from actingweb.interface.integrations.www_templates import FragmentCache
+
+TRUSTS = 300
+READ_SECONDS = 0.001
+RENDERS = 50
+
+
+class _PermissionStore:
+    def __init__(self) -> None:
+        self.reads = 0
+        self.overrides = [
+            SimpleNamespace(peer_id=f"peer{i}") for i in range(0, TRUSTS, 10)
+        ]
+
+    def get_permissions(self, actor_id: str, peer_id: str) -> Any:
+        self.reads += 1
+        time.sleep(READ_SECONDS)
+        return next((p for p in self.overrides if p.peer_id == peer_id), None)
+
+    def list_actor_permissions(self, actor_id: str) -> list[Any]:
+        self.reads += 1
+        time.sleep(READ_SECONDS)
+        return list(self.overrides)
+
+
+def _trust_page_values(store: _PermissionStore) -> tuple[dict[str, Any], float]:
+    handler = WwwHandler(AWWebObj(), Mock(ui=True, root="https://aw.example.com/"))
+    myself = Mock(id="actor1")
+    myself.get_trust_relationships.return_value = [
+        {
+            "relationship": "friend",
+            "peerid": f"peer{i}",
+            "baseuri": f"https://peer.example.com/peer{i}",
+            "desc": f"Peer {i}",
+            "approved": True,
+            "peer_approved": True,
+            "verified": True,
+            "created_at": f"2026-01-01T00:00:{i % 60:02d}",
+        }
+        for i in range(TRUSTS)
+    ]
+    with (
+        patch.object(handler, "require_authenticated_actor", return_value=myself),
+        patch(
+            "actingweb.trust_permissions.get_trust_permission_store",
+            return_value=store,
+        ),
+        patch.object(handler, "_get_oauth_clients_for_actor", return_value=[]),
+    ):
+        start = time.perf_counter()
+        handler.get("actor1", "trust")
+        elapsed = time.perf_counter() - start
+    return handler.response.template_values, elapsed
+
+
+@pytest.mark.benchmark
+def test_trust_page_load_and_render() -> None:
+    bulk_store = _PermissionStore()
+    values, bulk_s = _trust_page_values(bulk_store)
+    # The per-peer loader this replaced: one read per relationship
+    per_peer_store = _PermissionStore()
+    start = time.perf_counter()
+    for trust in values["trusts"]:
+        per_peer_store.get_permissions("actor1", trust["peerid"])
+    per_peer_s = time.perf_counter() - start
+
+    env = Environment(loader=FileSystemLoader(default_templates_dir()))
+    template = env.get_template("aw-actor-www-trust.html")
+    start = time.perf_counter()
+    for _ in range(RENDERS):
+        html = template.render(values)
+    render_s = (time.perf_counter() - start) / RENDERS
+
+    cache = FragmentCache()
+    cache.render("actor1", template, values, lambda: template.render(values))
+    start = time.perf_counter()
+    for _ in range(RENDERS):
+        cached = cache.render("actor1", template, values, lambda: "")
+    cached_s = (time.perf_counter() - start) / RENDERS
+
+    print(
+        f"\n{TRUSTS} relationships, {READ_SECONDS * 1000:.0f} ms per read: "
+        f"per-peer permission reads {per_peer_store.reads} ({per_peer_s * 1000:.0f} ms), "
+        f"bulk {bulk_store.reads} (page context {bulk_s * 1000:.1f} ms); "
+        f"render {render_s * 1000:.2f} ms, fragment cache hit "
+        f"{cached_s * 1000:.2f} ms"
+    )
+    assert bulk_store.reads == 1
+    assert cached == html
+    assert cached_s < render_s / 2
@@ -1,5 +1,7 @@
 """Tests for actor module."""
 
+import asyncio
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -200,6 +202,49 @@ class TestActorMethods:
                 assert callable(actor.get_property)
                 assert callable(actor.delete_property)
 
+    def test_modify_trust_and_notify_async_keeps_storage_off_the_loop(self):
+        """The trust read and update of the async variant run in worker threads."""
+        mock_config = Mock()
+        mock_config.force_email_prop_as_creator = False
+        mock_db_actor = Mock()
+        mock_db_actor.get.return_value = {
+            "id": "test_actor",
+            "creator": "test_creator",
+            "passphrase": "test_passphrase",
+        }
+        mock_config.DbActor.DbActor.return_value = mock_db_actor
+        threads: dict[str, threading.Thread] = {}
+
+        def record(step, result):
+            def call(*args, **kwargs):
+                threads[step] = threading.current_thread()
+                return result
+
+            return call
+
+        with patch("actingweb.actor.attribute"), patch("actingweb.actor.property"):
+            actor = Actor("test_actor", mock_config)
+        actor.get_trust_relationships = record(  # type: ignore[method-assign]
+            "read", [{"approved": True, "baseuri": "https://peer.example.com/p1"}]
+        )
+
+        async def modify():
+            threads["loop"] = threading.current_thread()
+            return await actor.modify_trust_and_notify_async(
+                relationship="friend", peerid="p1", desc="updated"
+            )
+
+        trust_obj = Mock()
+        trust_obj.modify = record("modify", True)
+        with patch("actingweb.actor.trust.Trust", record("load", trust_obj)):
+            assert asyncio.run(modify()) is True
+
+        assert threads["loop"] not in (
+            threads["read"],
+            threads["load"],
+            threads["modify"],
+        )
+
 
 class TestActorCreatorLookup:
     """Tests for creator-based actor lookup."""
@@ -0,0 +1,137 @@
+"""Tests for the FastAPI integration's handler pool (``AdaptiveThreadPoolExecutor``)."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from actingweb.interface.integrations.adaptive_executor import (
+    AdaptiveThreadPoolExecutor,
+)
+
+
+@pytest.fixture
+def executor() -> Iterator[AdaptiveThreadPoolExecutor]:
+    executor = AdaptiveThreadPoolExecutor(
+        min_workers=2, max_workers=8, idle_timeout=0.1, thread_name_prefix="test-pool"
+    )
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def wait_for(condition: Callable[[], bool]) -> None:
+    deadline = time.time() + 5
+    while not condition():
+        assert time.time() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+class TestAdaptiveThreadPoolExecutor:
+    def test_results_and_exceptions(self, executor: AdaptiveThreadPoolExecutor) -> None:
+        assert executor.submit(lambda a, b=0: a + b, 1, b=2).result(timeout=5) == 3
+
+        def fail() -> None:
+            raise ValueError("handler failed")
+
+        with pytest.raises(ValueError, match="handler failed"):
+            executor.submit(fail).result(timeout=5)
+        assert (
+            executor.submit(lambda: threading.current_thread().name)
+            .result()
+            .startswith("test-pool_")
+        )
+
+    def test_grows_up_to_max_workers(
+        self, executor: AdaptiveThreadPoolExecutor
+    ) -> None:
+        release = threading.Event()
+        running: list[int] = []
+        lock = threading.Lock()
+
+        def block(i: int) -> int:
+            with lock:
+                running.append(i)
+            release.wait(timeout=5)
+            return i
+
+        futures = [executor.submit(block, i) for i in range(12)]
+        wait_for(lambda: len(running) == 8)
+        stats = executor.stats()
+        assert stats.workers == 8
+        assert stats.queued == 4
+        release.set()
+        assert [f.result(timeout=5) for f in futures] == list(range(12))
+        assert executor.stats().peak_workers == 8
+
+    def test_idle_threads_above_min_retire(
+        self, executor: AdaptiveThreadPoolExecutor
+    ) -> None:
+        release = threading.Event()
+        futures = [executor.submit(release.wait, 5) for _ in range(6)]
+        wait_for(lambda: executor.stats().workers == 6)
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+        wait_for(lambda: executor.stats().workers == 2)
+        # The pool still serves work after shrinking
+        assert executor.submit(lambda: "ok").result(timeout=5) == "ok"
+
+    def test_queue_wait_is_recorded(self) -> None:
+        small = AdaptiveThreadPoolExecutor(min_workers=1, max_workers=1)
+        try:
+            futures = [small.submit(time.sleep, 0.05) for _ in range(3)]
+            for future in futures:
+                future.result(timeout=5)
+            stats = small.stats()
+        finally:
+            small.shutdown()
+        assert stats.completed == 3
+        assert stats.queue_wait_max >= 0.09
+        assert 0 < stats.queue_wait_avg <= stats.queue_wait_max
+        assert stats.queue_wait_p95 == stats.queue_wait_max
+
+    def test_slow_waits_are_logged(self, caplog: pytest.LogCaptureFixture) -> None:
+        small = AdaptiveThreadPoolExecutor(
+            min_workers=1, max_workers=1, slow_wait_threshold=0.01
+        )
+        try:
+            with caplog.at_level("WARNING"):
+                futures = [small.submit(time.sleep, 0.05) for _ in range(3)]
+                for future in futures:
+                    future.result(timeout=5)
+        finally:
+            small.shutdown()
+        warnings = [r for r in caplog.records if "consider raising" in r.message]
+        # Rate limited to one warning per interval
+        assert len(warnings) == 1
+
+    def test_run_in_executor(self, executor: AdaptiveThreadPoolExecutor) -> None:
+        async def main() -> list[int]:
+            loop = asyncio.get_running_loop()
+            return await asyncio.gather(
+                *(loop.run_in_executor(executor, pow, i, 2) for i in range(20))
+            )
+
+        assert asyncio.run(main()) == [i * i for i in range(20)]
+
+    def test_shutdown(self) -> None:
+        executor = AdaptiveThreadPoolExecutor(min_workers=1, max_workers=1)
+        release = threading.Event()
+        running = executor.submit(release.wait, 5)
+        queued = executor.submit(lambda: "never")
+        wait_for(lambda: running.running())
+        executor.shutdown(wait=False, cancel_futures=True)
+        assert queued.cancelled()
+        release.set()
+        assert running.result(timeout=5) is True
+        wait_for(lambda: executor.stats().workers == 0)
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+    def test_bounds_are_validated(self) -> None:
+        with pytest.raises(ValueError):
+            AdaptiveThreadPoolExecutor(min_workers=0)
+        with pytest.raises(ValueError):
+            AdaptiveThreadPoolExecutor(min_workers=10, max_workers=5)
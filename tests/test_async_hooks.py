@@ -118,7 +118,7 @@ class TestAsyncHookExecution:
 
         registry.register_method_hook("test_method", async_hook)
 
-        # Sync execution should still work (via asyncio.run())
+        # Sync execution should still work (via the shared hook loop)
         result = registry.execute_method_hooks("test_method", mock_actor, {})
 
         assert result == {"result": "async_from_sync"}
@@ -314,18 +314,18 @@ class TestAsyncHookContextDetection:
         result = await registry.execute_method_hooks_async("test", mock_actor, {})
         assert result == {"context": "async"}
 
-    def test_async_hook_from_sync_context_via_asyncio_run(self, registry, mock_actor):
-        """Test that async hook can be called from sync context via asyncio.run()."""
+    def test_async_hook_from_sync_context_via_hook_loop(self, registry, mock_actor):
+        """Test that async hook can be called from sync context via the hook loop."""
 
         async def async_hook(actor, method_name, data):
             await asyncio.sleep(0.01)
-            return {"ran": "via_asyncio_run"}
+            return {"ran": "via_hook_loop"}
 
         registry.register_method_hook("test", async_hook)
 
-        # This should use asyncio.run() internally
+        # This should use run_async_hook() internally
         result = registry.execute_method_hooks("test", mock_actor, {})
-        assert result == {"ran": "via_asyncio_run"}
+        assert result == {"ran": "via_hook_loop"}
 
     @pytest.mark.asyncio
     async def test_async_hook_from_sync_method_in_async_context(
@@ -333,10 +333,9 @@ class TestAsyncHookContextDetection:
     ):
         """Test async hook called from sync method while inside async event loop.
 
-        This tests the ThreadPoolExecutor fallback path in _execute_hook_in_sync_context.
         When sync execution methods are called from an async context (e.g., Flask
-        running in async wrapper), async hooks must be executed via thread pool
-        to avoid 'asyncio.run() cannot be called from a running event loop' error.
+        running in async wrapper), async hooks must run on the shared hook loop
+        thread rather than the caller's (already running) loop.
         """
         execution_log = []
 
@@ -344,15 +343,14 @@ class TestAsyncHookContextDetection:
             execution_log.append("async_hook_start")
             await asyncio.sleep(0.01)
             execution_log.append("async_hook_end")
-            return {"executed_via": "thread_pool"}
+            return {"executed_via": "hook_loop"}
 
         registry.register_method_hook("test_method", async_hook)
 
-        # Call sync method from async context - this triggers ThreadPoolExecutor path
-        # The sync method will detect we're in an event loop and use thread pool
+        # Call sync method from async context - the hook runs on the hook loop
         result = registry.execute_method_hooks("test_method", mock_actor, {})
 
-        assert result == {"executed_via": "thread_pool"}
+        assert result == {"executed_via": "hook_loop"}
         assert execution_log == ["async_hook_start", "async_hook_end"]
 
     @pytest.mark.asyncio
@@ -456,3 +456,216 @@ class TestAsyncMCPHandler:
         # With true async, all 3 should run concurrently in ~10ms
         # With thread pool, they'd run sequentially in ~30ms
         assert len(call_times) == 3
+
+
+class TestAsyncMCPEventLoopPath:
+    """Warm requests stay on the event loop; cold ones go to a worker thread."""
+
+    TOKEN = "warm-token"
+    ACTOR_ID = "warm_actor"
+    CLIENT_ID = "warm-client"
+
+    @pytest.fixture(autouse=True)
+    def _clean_caches(self):
+        from actingweb.handlers import mcp as mcp_module
+
+        for cache in (
+            mcp_module._token_cache,
+            mcp_module._actor_cache,
+            mcp_module._trust_cache,
+            mcp_module._listing_cache,
+        ):
+            cache.clear()
+        yield
+        for cache in (
+            mcp_module._token_cache,
+            mcp_module._actor_cache,
+            mcp_module._trust_cache,
+            mcp_module._listing_cache,
+        ):
+            cache.clear()
+
+    @pytest.fixture
+    def test_config(self):
+        cfg = config.Config()
+        cfg.fqdn = "test.example.com"
+        cfg.proto = "https://"
+        return cfg
+
+    @pytest.fixture
+    def hooks(self):
+        from actingweb.interface.hooks import HookRegistry
+
+        registry = HookRegistry()
+
+        @mcp_tool(description="search")
+        def search(actor, action_name, data):
+            return {}
+
+        registry.register_action_hook("search", search)
+        return registry
+
+    def _handler(self, test_config, hooks) -> AsyncMCPHandler:
+        webobj = aw_web_request.AWWebObj(
+            url="https://test.example.com/mcp",
+            params={},
+            body="",
+            headers={"Authorization": f"Bearer {self.TOKEN}"},
+            cookies={},
+        )
+        return AsyncMCPHandler(webobj, test_config, hooks=hooks)
+
+    def _prime_auth(self, test_config) -> ActorInterface:
+        from actingweb.handlers import mcp as mcp_module
+
+        class MockActorObj:
+            id = self.ACTOR_ID
+            creator = "test@example.com"
+            properties = {}
+
+        actor = ActorInterface(MockActorObj())  # type: ignore[arg-type]
+        mcp_module._token_cache.put(
+            self.TOKEN,
+            {"actor_id": self.ACTOR_ID, "client_id": self.CLIENT_ID, "token_data": {}},
+        )
+        mcp_module._actor_cache.put(
+            self.ACTOR_ID, {"actor": actor, "config": test_config}
+        )
+        mcp_module._trust_cache.put(
+            (self.ACTOR_ID, self.CLIENT_ID),
+            Mock(peerid="warm-peer", oauth_client_id=self.CLIENT_ID),
+        )
+        return actor
+
+    @staticmethod
+    def _versioned_evaluator() -> Mock:
+        evaluator = _allow_all_evaluator()
+        evaluator.permission_version = 0
+        return evaluator
+
+    @pytest.mark.asyncio
+    async def test_warm_tools_list_never_leaves_the_loop(self, test_config, hooks):
+        self._prime_auth(test_config)
+        handler = self._handler(test_config, hooks)
+        evaluator = self._versioned_evaluator()
+        request = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+
+        with patch(
+            "actingweb.permission_evaluator.get_permission_evaluator",
+            return_value=evaluator,
+        ):
+            first = await handler.post_async(request)  # fills the listing cache
+            with patch(
+                "actingweb.handlers.async_mcp.asyncio.to_thread",
+                side_effect=AssertionError("warm request hopped to a thread"),
+            ):
+                second = await handler.post_async(request)
+
+        assert [t["name"] for t in second["result"]["tools"]] == ["search"]
+        assert second["result"] == first["result"]
+
+    @pytest.mark.asyncio
+    async def test_cold_authentication_runs_off_the_loop(self, test_config, hooks):
+        import threading
+
+        handler = self._handler(test_config, hooks)
+        seen_threads = []
+
+        def cold_auth():
+            seen_threads.append(threading.current_thread())
+            return None
+
+        handler.authenticate_and_get_actor_cached = cold_auth  # type: ignore[method-assign]
+        result = await handler.post_async(
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+        )
+
+        assert result["error"]["code"] == -32002
+        assert seen_threads and seen_threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_cold_authentication_looks_up_the_caches_once(
+        self, test_config, hooks
+    ):
+        from actingweb.handlers import mcp as mcp_module
+
+        handler = self._handler(test_config, hooks)
+        misses = mcp_module._token_cache.stats()["misses"]
+        with (
+            patch.object(
+                handler,
+                "_bearer_token_for_cached_auth",
+                wraps=handler._bearer_token_for_cached_auth,
+            ) as token_reads,
+            patch.object(
+                handler, "_authenticate_uncached", return_value=None
+            ) as full_flow,
+        ):
+            assert await handler.authenticate_and_get_actor_async() is None
+
+        assert token_reads.call_count == 1
+        assert mcp_module._token_cache.stats()["misses"] == misses + 1
+        full_flow.assert_called_once_with(self.TOKEN)
+
+    @pytest.mark.asyncio
+    async def test_predicate_tools_list_runs_off_the_loop(self, test_config, hooks):
+        @mcp_tool(description="gated", visibility_predicate=lambda actor: True)
+        def gated(actor, action_name, data):
+            return {}
+
+        hooks.register_action_hook("gated", gated)
+        self._prime_auth(test_config)
+        handler = self._handler(test_config, hooks)
+        calls = []
+
+        async def fake_to_thread(func, *args, **kwargs):
+            calls.append(func)
+            return func(*args, **kwargs)
+
+        request = {"jsonrpc": "2.0", "id": 4, "method": "tools/list"}
+        with (
+            patch(
+                "actingweb.permission_evaluator.get_permission_evaluator",
+                return_value=self._versioned_evaluator(),
+            ),
+            patch(
+                "actingweb.handlers.async_mcp.asyncio.to_thread",
+                side_effect=fake_to_thread,
+            ),
+        ):
+            await handler.post_async(request)  # fills the listing cache
+            result = await handler.post_async(request)
+
+        assert sorted(t["name"] for t in result["result"]["tools"]) == [
+            "gated",
+            "search",
+        ]
+        # The cached listing still runs its predicate in a thread
+        assert calls == [handler._handle_tools_list] * 2
+
+    @pytest.mark.asyncio
+    async def test_uncached_listing_runs_off_the_loop(self, test_config, hooks):
+        self._prime_auth(test_config)
+        handler = self._handler(test_config, hooks)
+        calls = []
+
+        async def fake_to_thread(func, *args, **kwargs):
+            calls.append(func)
+            return func(*args, **kwargs)
+
+        with (
+            patch(
+                "actingweb.permission_evaluator.get_permission_evaluator",
+                return_value=self._versioned_evaluator(),
+            ),
+            patch(
+                "actingweb.handlers.async_mcp.asyncio.to_thread",
+                side_effect=fake_to_thread,
+            ),
+        ):
+            result = await handler.post_async(
+                {"jsonrpc": "2.0", "id": 3, "method": "tools/list"}
+            )
+
+        assert [t["name"] for t in result["result"]["tools"]] == ["search"]
+        assert calls == [handler._handle_tools_list]
@@ -0,0 +1,102 @@
+"""Tests for the async properties handler used by the FastAPI integration."""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+from actingweb.handlers.async_properties import AsyncPropertiesHandler
+
+
+def _handler(
+    hooks: Mock | None = None, is_list: bool = False
+) -> AsyncPropertiesHandler:
+    handler = AsyncPropertiesHandler()
+    handler.config = Mock()
+    handler.hooks = hooks
+    handler.request = Mock()
+    handler.request.get = Mock(return_value="")
+    handler.response = Mock()
+    handler.response.headers = {}
+    actor = Mock()
+    actor.id = "me"
+    actor.property_lists.exists = Mock(return_value=is_list)
+    handler.authenticate_actor = Mock(  # type: ignore[method-assign]
+        return_value=Mock(success=True, actor=actor, auth_obj=Mock())
+    )
+    handler._check_property_permission = Mock(return_value=True)  # type: ignore[method-assign]
+    return handler
+
+
+def _db(value: str | None) -> Mock:
+    db = Mock()
+    db.get = AsyncMock(return_value=value)
+    return db
+
+
+async def test_get_async_reads_through_async_accessor() -> None:
+    handler = _handler()
+    db = _db(json.dumps({"theme": "dark"}))
+
+    with patch(
+        "actingweb.handlers.async_properties.get_property_async", return_value=db
+    ):
+        await handler.get_async("me", "config/theme")
+
+    db.get.assert_awaited_once_with(actor_id="me", name="config")
+    handler.response.set_status.assert_called_with(200, "Ok")
+    handler.response.write.assert_called_once_with('"dark"')
+
+
+async def test_get_async_missing_property() -> None:
+    handler = _handler()
+
+    with patch(
+        "actingweb.handlers.async_properties.get_property_async",
+        return_value=_db(None),
+    ):
+        await handler.get_async("me", "missing")
+
+    handler.response.set_status.assert_called_with(404, "Property not found")
+
+
+async def test_get_async_list_property() -> None:
+    handler = _handler(is_list=True)
+    handler._get_list_property = Mock()  # type: ignore[method-assign]
+
+    with patch(
+        "actingweb.handlers.async_properties.get_property_async",
+        return_value=_db(None),
+    ):
+        await handler.get_async("me", "notes")
+
+    handler._get_list_property.assert_called_once()
+    assert handler._get_list_property.call_args.args[2] == "notes"
+
+
+async def test_get_async_runs_property_hooks() -> None:
+    hooks = Mock()
+    hooks.execute_property_hooks = Mock(return_value={"theme": "light"})
+    handler = _handler(hooks=hooks)
+    handler._get_actor_interface = Mock(return_value=Mock())  # type: ignore[method-assign]
+
+    with patch(
+        "actingweb.handlers.async_properties.get_property_async",
+        return_value=_db(json.dumps({"theme": "dark"})),
+    ):
+        await handler.get_async("me", "config")
+
+    assert hooks.execute_property_hooks.call_args.args[:2] == ("config", "get")
+    assert json.loads(handler.response.write.call_args.args[0]) == {"theme": "light"}
+
+
+async def test_get_async_forbidden() -> None:
+    handler = _handler()
+    handler._check_property_permission = Mock(return_value=False)  # type: ignore[method-assign]
+    db = _db("x")
+
+    with patch(
+        "actingweb.handlers.async_properties.get_property_async", return_value=db
+    ):
+        await handler.get_async("me", "secret")
+
+    handler.response.set_status.assert_called_with(403)
+    db.get.assert_not_awaited()
@@ -0,0 +1,48 @@
+"""Tests for the async subscription handler used by the FastAPI integration."""
+
+import json
+from unittest.mock import AsyncMock, Mock
+
+from actingweb.handlers.async_subscription import AsyncSubscriptionRootHandler
+
+
+def _handler(body: dict) -> tuple[AsyncSubscriptionRootHandler, Mock]:
+    handler = AsyncSubscriptionRootHandler()
+    handler.config = Mock()
+    handler.request = Mock()
+    handler.request.body = json.dumps(body).encode("utf-8")
+    handler.response = Mock()
+    handler.response.headers = {}
+    handler.require_authenticated_actor = Mock(return_value=Mock())  # type: ignore[method-assign]
+    actor_interface = Mock()
+    actor_interface.subscriptions.subscribe_to_peer_async = AsyncMock(
+        return_value="https://peer.example.com/peer1/subscriptions/me/sub1"
+    )
+    handler._get_actor_interface = Mock(return_value=actor_interface)  # type: ignore[method-assign]
+    return handler, actor_interface
+
+
+async def test_post_async_awaits_subscription() -> None:
+    handler, actor_interface = _handler({"peerid": "peer1", "target": "properties"})
+
+    await handler.post_async("me")
+
+    actor_interface.subscriptions.subscribe_to_peer_async.assert_awaited_once_with(
+        peer_id="peer1",
+        target="properties",
+        subtarget="",
+        resource="",
+        granularity="none",
+    )
+    actor_interface.subscriptions.subscribe_to_peer.assert_not_called()
+    assert handler.response.headers["Location"].endswith("/sub1")
+    handler.response.set_status.assert_called_with(204, "Created")
+
+
+async def test_post_async_validates_before_contacting_peer() -> None:
+    handler, actor_interface = _handler({"peerid": "peer1"})
+
+    await handler.post_async("me")
+
+    handler.response.set_status.assert_called_with(400, "Missing target")
+    actor_interface.subscriptions.subscribe_to_peer_async.assert_not_called()
@@ -63,7 +63,7 @@ class TestTimeoutConfiguration:
         mock_response.json.return_value = {}
 
         with patch(
-            "actingweb.aw_proxy.requests.get", return_value=mock_response
+            "actingweb.aw_proxy.peer_transport.get", return_value=mock_response
         ) as mock_get:
             proxy.get_resource(path="test")
 
@@ -85,7 +85,7 @@ class TestTimeoutConfiguration:
         mock_response.headers = {}
 
         with patch(
-            "actingweb.aw_proxy.requests.post", return_value=mock_response
+            "actingweb.aw_proxy.peer_transport.post", return_value=mock_response
         ) as mock_post:
             proxy.create_resource(path="test", params={"key": "value"})
 
@@ -105,7 +105,7 @@ class TestTimeoutConfiguration:
         mock_response.json.return_value = {}
 
         with patch(
-            "actingweb.aw_proxy.requests.put", return_value=mock_response
+            "actingweb.aw_proxy.peer_transport.put", return_value=mock_response
         ) as mock_put:
             proxy.change_resource(path="test", params={"key": "value"})
 
@@ -124,7 +124,7 @@ class TestTimeoutConfiguration:
         mock_response.content = b""
 
         with patch(
-            "actingweb.aw_proxy.requests.delete", return_value=mock_response
+            "actingweb.aw_proxy.peer_transport.delete", return_value=mock_response
         ) as mock_delete:
             proxy.delete_resource(path="test")
 
@@ -335,7 +335,7 @@ class TestGetResource:
         mock_response.content = b'{"key": "value"}'
         mock_response.json.return_value = {"key": "value"}
 
-        with patch("actingweb.aw_proxy.requests.get", return_value=mock_response):
+        with patch("actingweb.aw_proxy.peer_transport.get", return_value=mock_response):
             result = proxy.get_resource(path="properties/config")
 
         assert result == {"key": "value"}
@@ -351,7 +351,7 @@ class TestGetResource:
         mock_response.json.return_value = {}
 
         with patch(
-            "actingweb.aw_proxy.requests.get", return_value=mock_response
+            "actingweb.aw_proxy.peer_transport.get", return_value=mock_response
         ) as mock_get:
             proxy.get_resource(path="search", params={"q": "test"})
 
@@ -364,7 +364,8 @@ class TestGetResource:
         proxy = self._create_proxy_with_trust()
 
         with patch(
-            "actingweb.aw_proxy.requests.get", side_effect=Exception("Network error")
+            "actingweb.aw_proxy.peer_transport.get",
+            side_effect=Exception("Network error"),
         ):
             result = proxy.get_resource(path="some/path")
 
@@ -386,7 +387,7 @@ class TestGetResource:
         mock_basic_response.content = b'{"success": true}'
         mock_basic_response.json.return_value = {"success": True}
 
-        with patch("actingweb.aw_proxy.requests.get") as mock_get:
+        with patch("actingweb.aw_proxy.peer_transport.get") as mock_get:
             mock_get.side_effect = [mock_bearer_response, mock_basic_response]
             result = proxy.get_resource(path="some/path")
 
@@ -433,7 +434,9 @@ class TestCreateResource:
         mock_response.json.return_value = {"id": "new_id"}
         mock_response.headers = {"Location": "https://peer.example.com/new_id"}
 
-        with patch("actingweb.aw_proxy.requests.post", return_value=mock_response):
+        with patch(
+            "actingweb.aw_proxy.peer_transport.post", return_value=mock_response
+        ):
             result = proxy.create_resource(path="items", params={"name": "test"})
 
         assert result == {"id": "new_id"}
@@ -450,7 +453,9 @@ class TestCreateResource:
         mock_response.json.return_value = {}
         mock_response.headers = {}
 
-        with patch("actingweb.aw_proxy.requests.post", return_value=mock_response):
+        with patch(
+            "actingweb.aw_proxy.peer_transport.post", return_value=mock_response
+        ):
             proxy.create_resource(path="items")
 
         assert proxy.last_location is None
@@ -494,7 +499,7 @@ class TestChangeResource:
         mock_response.content = b'{"updated": true}'
         mock_response.json.return_value = {"updated": True}
 
-        with patch("actingweb.aw_proxy.requests.put", return_value=mock_response):
+        with patch("actingweb.aw_proxy.peer_transport.put", return_value=mock_response):
             result = proxy.change_resource(path="items/123", params={"name": "updated"})
 
         assert result == {"updated": True}
@@ -539,7 +544,7 @@ class TestDeleteResource:
         mock_response.content = b""
 
         with patch(
-            "actingweb.aw_proxy.requests.delete", return_value=mock_response
+            "actingweb.aw_proxy.peer_transport.delete", return_value=mock_response
         ) as mock_delete:
             proxy.delete_resource(path="items/123")
 
@@ -577,7 +582,7 @@ class TestMaybeRetryWithBasic:
         mock_response.status_code = 200
 
         with patch(
-            "actingweb.aw_proxy.requests.get", return_value=mock_response
+            "actingweb.aw_proxy.peer_transport.get", return_value=mock_response
         ) as mock_get:
             result = proxy._maybe_retry_with_basic("GET", "https://example.com/path")
 
@@ -592,7 +597,7 @@ class TestMaybeRetryWithBasic:
         mock_response.status_code = 201
 
         with patch(
-            "actingweb.aw_proxy.requests.post", return_value=mock_response
+            "actingweb.aw_proxy.peer_transport.post", return_value=mock_response
         ) as mock_post:
             result = proxy._maybe_retry_with_basic(
                 "POST", "https://example.com/path", data='{"key": "value"}'
@@ -605,7 +610,9 @@ class TestMaybeRetryWithBasic:
         """Test _maybe_retry_with_basic returns None on exception."""
         proxy = self._create_proxy_with_trust()
 
-        with patch("actingweb.aw_proxy.requests.get", side_effect=Exception("Error")):
+        with patch(
+            "actingweb.aw_proxy.peer_transport.get", side_effect=Exception("Error")
+        ):
             result = proxy._maybe_retry_with_basic("GET", "https://example.com/path")
 
         assert result is None
@@ -635,7 +642,7 @@ class TestURLConstruction:
         mock_response.json.return_value = {}
 
         with patch(
-            "actingweb.aw_proxy.requests.get", return_value=mock_response
+            "actingweb.aw_proxy.peer_transport.get", return_value=mock_response
         ) as mock_get:
             proxy.get_resource(path="/path/to/resource/")
 
@@ -655,7 +662,7 @@ class TestURLConstruction:
         mock_response.json.return_value = {}
 
         with patch(
-            "actingweb.aw_proxy.requests.get", return_value=mock_response
+            "actingweb.aw_proxy.peer_transport.get", return_value=mock_response
         ) as mock_get:
             proxy.get_resource(path="path/to/resource")
 
@@ -60,6 +60,15 @@ class TestGetHandlerClass:
         assert handler is not None
         assert "PropertiesHandler" in type(handler).__name__
 
+    def test_get_handler_class_properties_async(self):
+        """Test async frameworks get AsyncPropertiesHandler."""
+        integration, webobj, config = self._create_integration()
+        integration._prefer_async_handlers = lambda: True  # type: ignore[attr-defined]
+
+        handler = integration.get_handler_class("properties", webobj, config)
+
+        assert type(handler).__name__ == "AsyncPropertiesHandler"
+
     def test_get_handler_class_properties_metadata(self):
         """Test properties metadata endpoint returns PropertyMetadataHandler."""
         integration, webobj, config = self._create_integration()
@@ -145,6 +154,17 @@ class TestTrustHandlerSelection:
         assert handler is not None
         assert "TrustPeerHandler" in type(handler).__name__
 
+    def test_trust_peer_handler_async(self):
+        """Test async frameworks get AsyncTrustPeerHandler for the peer endpoint."""
+        integration, webobj, config = self._create_integration()
+        integration._prefer_async_handlers = lambda: True  # type: ignore[attr-defined]
+
+        handler = integration.get_handler_class(
+            "trust", webobj, config, relationship="friend", peerid="peer123"
+        )
+
+        assert type(handler).__name__ == "AsyncTrustPeerHandler"
+
     def test_trust_permissions_handler(self):
         """Test trust permissions endpoint returns TrustPermissionHandler."""
         integration, webobj, config = self._create_integration()
@@ -219,6 +239,20 @@ class TestSubscriptionHandlerSelection:
         assert handler is not None
         assert "SubscriptionRootHandler" in type(handler).__name__
 
+    def test_subscription_root_handler_async(self):
+        """Test async frameworks get AsyncSubscriptionRootHandler."""
+        integration, webobj, config = self._create_integration()
+        integration._prefer_async_handlers = lambda: True  # type: ignore[attr-defined]
+
+        handler = integration.get_handler_class("subscriptions", webobj, config)
+
+        assert type(handler).__name__ == "AsyncSubscriptionRootHandler"
+        # Deeper subscription paths stay on the sync handlers
+        handler = integration.get_handler_class(
+            "subscriptions", webobj, config, peerid="peer123", subid="sub456"
+        )
+        assert handler.__class__.__name__ == "SubscriptionHandler"
+
     def test_subscription_relationship_handler(self):
         """Test subscription relationship endpoint returns SubscriptionRelationshipHandler."""
         integration, webobj, config = self._create_integration()
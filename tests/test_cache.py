@@ -0,0 +1,334 @@
+"""Unit tests for actingweb.cache: bounds, TTL, group eviction, generations."""
+
+import threading
+import time
+from typing import Any
+from unittest import mock
+
+from actingweb.cache import (
+    ActorGenerations,
+    AttributeCacheBackend,
+    CacheGeneration,
+    LocalCacheBackend,
+    TTLCache,
+    actor_generations,
+    actor_store_cache,
+)
+
+
+class TestBoundsAndTTL:
+    def test_least_recently_used_entry_is_dropped_when_full(self) -> None:
+        cache = TTLCache("t", max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.lookup("a")  # "b" is now the least recently used
+        cache.put("c", 3)
+
+        assert "b" not in cache
+        assert set(cache) == {"a", "c"}
+        assert cache.stats()["evictions"] == 1
+
+    def test_entries_expire_after_ttl(self) -> None:
+        cache = TTLCache("t", ttl=10)
+        cache.put("a", 1)
+        cache.entry("a").stored_at -= 11  # type: ignore[union-attr]
+
+        assert cache.lookup("a") == (False, None)
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_overrides_default(self) -> None:
+        cache = TTLCache("t", ttl=None)
+        cache.put("short", None, ttl=1)
+        cache.put("forever", 1)
+        cache.entry("short").stored_at -= 2  # type: ignore[union-attr]
+        cache.entry("forever").stored_at -= 10**6  # type: ignore[union-attr]
+
+        assert cache.lookup("short") == (False, None)
+        assert cache.lookup("forever") == (True, 1)
+
+    def test_cached_none_is_a_hit(self) -> None:
+        cache = TTLCache("t")
+        cache.put("k", None)
+        assert cache.lookup("k") == (True, None)
+        assert cache.hits == 1 and cache.misses == 0
+
+    def test_sliding_ttl_is_refreshed_by_access(self) -> None:
+        cache = TTLCache("t", ttl=10, sliding=True)
+        cache.put("a", 1)
+        entry = cache.entry("a")
+        assert entry is not None
+        entry.stored_at -= 100
+        entry.accessed_at -= 5
+        assert cache.lookup("a") == (True, 1)
+        assert time.time() - entry.accessed_at < 1
+
+    def test_purge_walks_from_the_cold_end_only(self) -> None:
+        cache = TTLCache("t", ttl=10, sliding=True)
+        for key in ("a", "b", "c"):
+            cache.put(key, key)
+        cache.entry("a").accessed_at -= 11  # type: ignore[union-attr]
+
+        assert cache.purge_expired() == ["a"]
+        assert set(cache) == {"b", "c"}
+
+
+class TestGroups:
+    def test_evict_group_drops_only_that_group(self) -> None:
+        cache = TTLCache("t", group_of=lambda key, _value: key[0])
+        cache.put(("actor-1", "c1"), 1)
+        cache.put(("actor-1", "c2"), 2)
+        cache.put(("actor-2", "c1"), 3)
+
+        assert cache.evict_group("actor-1") == 2
+        assert set(cache) == {("actor-2", "c1")}
+        assert cache.evict_group("actor-1") == 0
+
+    def test_explicit_group_wins_over_group_of(self) -> None:
+        cache = TTLCache("t", group_of=lambda _key, _value: "derived")
+        cache.put("k", 1, group="explicit")
+        assert cache.evict_group("derived") == 0
+        assert cache.evict_group("explicit") == 1
+
+    def test_lru_eviction_keeps_the_group_index_consistent(self) -> None:
+        backend = LocalCacheBackend(max_entries=1)
+        cache = TTLCache("t", group_of=lambda key, _value: "g", backend=backend)
+        cache.put("a", 1)
+        cache.put("b", 2)  # evicts "a"
+        assert cache.evict_group("g") == 1
+        assert len(cache) == 0
+
+    def test_concurrent_insert_and_group_eviction(self) -> None:
+        cache = TTLCache("t", max_entries=None, group_of=lambda key, _v: key[0])
+        errors: list[BaseException] = []
+
+        def inserter() -> None:
+            for i in range(5000):
+                cache.put((f"actor-{i % 50}", f"client-{i}"), i)
+
+        def evictor() -> None:
+            try:
+                for i in range(5000):
+                    cache.evict_group(f"actor-{i % 50}")
+            except BaseException as exc:  # noqa: BLE001
+                errors.append(exc)
+
+        threads = [threading.Thread(target=inserter), threading.Thread(target=evictor)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+
+
+class TestGenerations:
+    def test_fill_is_refused_after_an_invalidation(self) -> None:
+        cache = TTLCache("t")
+        snapshot = cache.generation.current
+        cache.invalidate("anything")
+        assert cache.put("k", 1, if_generation=snapshot) is False
+        assert "k" not in cache
+
+    def test_undisturbed_fill_is_accepted(self) -> None:
+        cache = TTLCache("t")
+        snapshot = cache.generation.current
+        assert cache.put("k", 1, if_generation=snapshot) is True
+        assert cache["k"] == 1
+
+    def test_shared_generation_spans_caches(self) -> None:
+        generation = CacheGeneration()
+        tokens = TTLCache("tokens", generation=generation)
+        actors = TTLCache("actors", generation=generation)
+        snapshot = generation.current
+        actors.evict_group("actor-1")
+        assert tokens.put("tok", 1, if_generation=snapshot) is False
+
+
+class _FakeAttributes:
+    """In-memory stand-in for actingweb.attribute.Attributes."""
+
+    store: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def __init__(self, actor_id: str, bucket: str, config: Any) -> None:
+        self.bucket = bucket
+        self.data: dict[str, Any] = {}
+
+    def get_attr(self, name: str) -> dict[str, Any] | None:
+        return self.store.get((self.bucket, name))
+
+    def set_attr(self, name: str, data: Any, ttl_seconds: int | None = None) -> bool:
+        self.store[(self.bucket, name)] = {"data": data}
+        return True
+
+    def insert_attr_if_absent(self, name: str, data: Any) -> bool:
+        if (self.bucket, name) in self.store:
+            return False
+        self.store[(self.bucket, name)] = {"data": data}
+        return True
+
+    def conditional_update_attr(self, name: str, old_data: Any, new_data: Any) -> bool:
+        current = self.store.get((self.bucket, name))
+        if current is None or current["data"] != old_data:
+            return False
+        self.store[(self.bucket, name)] = {"data": new_data}
+        return True
+
+    def delete_attr_conditional(self, name: str) -> bool:
+        return self.store.pop((self.bucket, name), None) is not None
+
+    def get_bucket(self) -> dict[str, Any]:
+        return {n: v for (b, n), v in self.store.items() if b == self.bucket}
+
+    def delete_bucket(self) -> bool:
+        for key in [k for k in self.store if k[0] == self.bucket]:
+            del self.store[key]
+        return True
+
+
+class TestAttributeCacheBackend:
+    def setup_method(self) -> None:
+        _FakeAttributes.store = {}
+        self._patch = mock.patch("actingweb.attribute.Attributes", _FakeAttributes)
+        self._patch.start()
+
+    def teardown_method(self) -> None:
+        self._patch.stop()
+
+    def _cache(self) -> TTLCache:
+        return TTLCache(
+            "shared",
+            ttl=60,
+            group_of=lambda key, _v: key[0],
+            backend=AttributeCacheBackend(config=object(), namespace="test"),
+        )
+
+    def test_entries_are_visible_to_another_worker(self) -> None:
+        self._cache().put(("actor-1", "c1"), {"v": 1})
+        assert self._cache().lookup(("actor-1", "c1")) == (True, {"v": 1})
+        assert self._cache().keys() == {("actor-1", "c1")}
+
+    def test_group_eviction_is_a_generation_bump_seen_by_all_workers(self) -> None:
+        writer, other = self._cache(), self._cache()
+        writer.put(("actor-1", "c1"), 1)
+        writer.put(("actor-2", "c1"), 2)
+
+        other.evict_group("actor-1")
+
+        assert writer.lookup(("actor-1", "c1")) == (False, None)
+        assert writer.lookup(("actor-2", "c1")) == (True, 2)
+        # A fresh write after the eviction is live again.
+        writer.put(("actor-1", "c1"), 3)
+        assert other.lookup(("actor-1", "c1")) == (True, 3)
+
+    def test_racing_first_evictions_both_count(self) -> None:
+        cache = self._cache()
+        real_insert = _FakeAttributes.insert_attr_if_absent
+
+        def insert_after_other_worker(
+            attrs: _FakeAttributes, name: str, data: Any
+        ) -> bool:
+            # Another worker creates the group row between our read and insert
+            real_insert(attrs, name, data)
+            return real_insert(attrs, name, data)
+
+        with mock.patch.object(
+            _FakeAttributes, "insert_attr_if_absent", insert_after_other_worker
+        ):
+            cache.evict_group("actor-1")
+        (record,) = [
+            r for (b, _n), r in _FakeAttributes.store.items() if "gen" in r["data"]
+        ]
+        assert record["data"] == {"gen": 2}
+
+    def test_expired_rows_are_misses(self) -> None:
+        cache = self._cache()
+        cache.put(("actor-1", "c1"), 1)
+        for record in _FakeAttributes.store.values():
+            if "stored_at" in record["data"]:
+                record["data"]["stored_at"] -= 61
+        assert cache.lookup(("actor-1", "c1")) == (False, None)
+
+
+class TestActorGenerations:
+    """Two ActorGenerations over one store model two worker processes."""
+
+    def setup_method(self) -> None:
+        _FakeAttributes.store = {}
+        self._patch = mock.patch("actingweb.attribute.Attributes", _FakeAttributes)
+        self._patch.start()
+
+    def teardown_method(self) -> None:
+        self._patch.stop()
+
+    def _worker(self, ttl: float = 60) -> tuple[ActorGenerations, TTLCache]:
+        generations = ActorGenerations(config=object(), ttl=ttl)
+        cache = generations.register(actor_store_cache("store", None))
+        return generations, cache
+
+    def test_a_bump_elsewhere_evicts_after_the_ttl(self) -> None:
+        writer, _ = self._worker()
+        reader, cache = self._worker(ttl=60)
+        reader.sync("a1")
+        cache["a1:p1"] = "old"
+        cache["a2:p1"] = "other actor"
+
+        writer.bump("a1")
+        # Within the TTL the reader trusts the counter it last read.
+        assert reader.sync("a1") is False
+        assert "a1:p1" in cache
+
+        reader._remote.entry("a1").stored_at -= 61  # type: ignore[union-attr]
+        assert reader.sync("a1") is True
+        assert "a1:p1" not in cache
+        assert cache["a2:p1"] == "other actor"
+        assert reader.sync("a1") is False
+
+    def test_counter_is_read_once_per_ttl(self) -> None:
+        reader, _ = self._worker(ttl=60)
+        for _ in range(10):
+            reader.sync("a1")
+        assert reader.remote_reads == 1
+
+    def test_own_bump_keeps_fresh_entries(self) -> None:
+        generations, cache = self._worker()
+        generations.sync("a1")
+        assert generations.bump("a1") == 1
+        cache["a1:p1"] = "new"
+        assert generations.sync("a1") is False
+        assert cache["a1:p1"] == "new"
+
+    def test_bump_notices_missed_changes(self) -> None:
+        other, _ = self._worker()
+        generations, cache = self._worker()
+        generations.sync("a1")
+        cache["a1:p1"] = "stale"
+        other.bump("a1")
+        generations.bump("a1")
+        assert "a1:p1" not in cache
+        assert generations.current("a1") == 2
+
+    def test_eviction_refuses_a_racing_fill(self) -> None:
+        writer, _ = self._worker()
+        reader, cache = self._worker(ttl=0)
+        reader.sync("a1")
+        snapshot = cache.generation.current  # before the storage read
+        writer.bump("a1")
+        reader.sync("a1")
+        assert (
+            cache.put("a1:p1", "read before the bump", if_generation=snapshot) is False
+        )
+
+    def test_disabled_unless_configured(self) -> None:
+        assert actor_generations(mock.MagicMock()) is None
+        assert actor_generations(None) is None
+        config = mock.MagicMock(cache_coherence=True, cache_coherence_ttl=5)
+        generations = actor_generations(config)
+        assert generations is not None and generations.ttl == 5.0
+        assert actor_generations(config) is generations
+
+    def test_store_cache_is_bounded_and_grouped_by_actor(self) -> None:
+        cache = actor_store_cache("t", mock.MagicMock(store_cache_max_entries=2))
+        cache["a1:p1"] = 1
+        cache["a1:p2"] = 2
+        cache["a2:p1"] = 3
+        assert len(cache) == 2
+        assert cache.evict_group("a1") == 1
@@ -0,0 +1,163 @@
+"""
+Cold-start import budget: what a process loads before and at its first request.
+
+On Lambda every cold start pays for the modules ``actingweb`` imports, so a
+deployment that only serves ``/callbacks`` and ``/properties`` must not import
+the other handlers, the OAuth2/MCP/www subsystems or the web framework it does
+not use. Each probe runs in a fresh interpreter, since this process has long
+since imported everything.
+
+If a test here fails, an eager import was added somewhere on the path: move it
+into the function that needs it (see ``actingweb/interface/__init__.py`` and
+``base_integration._ENDPOINT_HANDLERS`` for the patterns), or, if the module
+really is needed up front, update the budget deliberately.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+# actingweb modules loaded by ``from actingweb.interface import ActingWebApp``.
+# Pinned like the model count in test_cold_start_budget.py: growing it is
+# sometimes right, doing so without noticing is not.
+MAX_MODULES_ON_IMPORT = 22
+
+# Never loaded by importing the package or building an app
+NOT_ON_IMPORT = (
+    "actingweb.actor",
+    "actingweb.handlers",
+    "actingweb.oauth2",
+    "actingweb.mcp",
+    "actingweb.fanout",
+    "fastapi",
+    "flask",
+    "httpx",
+    "jinja2",
+)
+NOT_ON_FLASK_BUILD = (
+    "actingweb.handlers.",
+    "actingweb.oauth2",
+    "actingweb.interface.integrations.fastapi_integration",
+    "fastapi",
+    "starlette",
+    "pydantic",
+)
+
+# Probes build apps without touching storage: the permission system (which
+# loads the trust type registry from the database) is not initialised.
+_PROBE_PRELUDE = """
+import json, sys
+from unittest import mock
+from actingweb.interface.app import ActingWebApp as _App
+mock.patch.object(_App, "_initialize_permission_system").start()
+def loaded(prefixes):
+    return sorted(m for m in sys.modules if m.startswith(prefixes))
+"""
+
+
+def _probe(body: str) -> dict:
+    """Run ``body`` in a fresh interpreter; it prints one JSON object."""
+    env = dict(os.environ)
+    # No table pre-warm: nothing here should depend on reaching the database
+    env["AWS_DB_AUTO_CREATE_TABLES"] = "false"
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE_PRELUDE + textwrap.dedent(body)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _offenders(modules: list[str], prefixes: tuple[str, ...]) -> list[str]:
+    return [m for m in modules if m.startswith(prefixes)]
+
+
+class TestImportBudget:
+    def test_importing_the_app_class_stays_small(self) -> None:
+        result = _probe(
+            """
+            from actingweb.interface import ActingWebApp
+            print(json.dumps({"modules": loaded(("actingweb", "fastapi", "flask",
+                                                 "httpx", "jinja2"))}))
+            """
+        )
+        modules = result["modules"]
+        assert not _offenders(modules, NOT_ON_IMPORT), _offenders(
+            modules, NOT_ON_IMPORT
+        )
+        own = [m for m in modules if m.startswith("actingweb")]
+        assert len(own) <= MAX_MODULES_ON_IMPORT, own
+
+    def test_public_names_still_resolve(self) -> None:
+        result = _probe(
+            """
+            import actingweb
+            import actingweb.interface as interface
+            names = {name: getattr(interface, name).__name__
+                     for name in interface.__all__}
+            names["ListMetadataContentionError"] = (
+                actingweb.ListMetadataContentionError.__name__)
+            print(json.dumps(names))
+            """
+        )
+        assert result["ActingWebApp"] == "ActingWebApp"
+        assert result["ListMetadataContentionError"] == "ListMetadataContentionError"
+
+
+class TestFirstRequestBudget:
+    def test_flask_app_build_loads_no_handler_or_other_framework(self) -> None:
+        pytest.importorskip("flask")
+        result = _probe(
+            """
+            from flask import Flask
+            from actingweb.interface import ActingWebApp
+            app = ActingWebApp(aw_type="urn:actingweb:test:cold", fqdn="localhost",
+                               proto="http://")
+            app.integrate_flask(Flask(__name__))
+            print(json.dumps({"modules": loaded(("actingweb", "fastapi",
+                                                 "starlette", "pydantic"))}))
+            """
+        )
+        offenders = _offenders(result["modules"], NOT_ON_FLASK_BUILD)
+        assert not offenders, offenders
+
+    def test_first_request_loads_only_its_handler(self) -> None:
+        result = _probe(
+            """
+            from actingweb.aw_web_request import AWWebObj
+            from actingweb.interface import ActingWebApp
+            from actingweb.interface.integrations.base_integration import (
+                BaseActingWebIntegration,
+            )
+            app = ActingWebApp(aw_type="urn:actingweb:test:cold", fqdn="localhost",
+                               proto="http://")
+            integration = BaseActingWebIntegration(app)
+            handlers = {}
+            for endpoint in ("callbacks", "properties"):
+                webobj = AWWebObj(url="/a1/" + endpoint, params={}, body="",
+                                  headers={})
+                handler = integration.get_handler_class(
+                    endpoint, webobj, app.get_config())
+                handlers[endpoint] = type(handler).__name__
+            print(json.dumps({"handlers": handlers,
+                              "modules": loaded(("actingweb.handlers",))}))
+            """
+        )
+        assert result["handlers"] == {
+            "callbacks": "CallbacksHandler",
+            "properties": "PropertiesHandler",
+        }
+        assert result["modules"] == [
+            "actingweb.handlers",
+            "actingweb.handlers.base_handler",
+            "actingweb.handlers.callbacks",
+            "actingweb.handlers.properties",
+        ]
@@ -429,6 +429,53 @@ class TestConditionalUpdateAttrConcurrency:
         assert final["data"]["version"] == 5
 
 
+@pytest.mark.integration
+class TestInsertAttrIfAbsent:
+    """insert_attr_if_absent: the single-write first-sighting primitive."""
+
+    def setup_method(self):
+        self.config = Config()
+        self.test_actor_id = f"insert_test_{int(time.time() * 1000000)}"
+
+    def teardown_method(self):
+        try:
+            buckets = self.config.DbAttribute.DbAttributeBucketList()  # type: ignore
+            buckets.delete(actor_id=self.test_actor_id)
+        except Exception:
+            pass
+
+    def _insert(self, name: str, data: dict, ttl_seconds: int | None = None) -> bool:
+        db_attr = self.config.DbAttribute.DbAttribute()  # type: ignore
+        return db_attr.insert_attr_if_absent(
+            actor_id=self.test_actor_id,
+            bucket="test_bucket",
+            name=name,
+            data=data,
+            ttl_seconds=ttl_seconds,
+        )
+
+    def test_creates_when_absent_and_refuses_when_present(self):
+        assert self._insert("once", {"v": 1}) is True
+        assert self._insert("once", {"v": 2}) is False
+
+        db_attr = self.config.DbAttribute.DbAttribute()  # type: ignore
+        stored = db_attr.get_attr(
+            actor_id=self.test_actor_id, bucket="test_bucket", name="once"
+        )
+        assert stored is not None
+        assert stored["data"] == {"v": 1}
+
+    def test_concurrent_inserts_only_one_succeeds(self):
+        num_workers = 5
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(self._insert, "race", {"worker": i})
+                for i in range(num_workers)
+            ]
+            results = [future.result() for future in as_completed(futures)]
+        assert results.count(True) == 1
+
+
 @pytest.mark.integration
 class TestTryMarkRefreshTokenUsed:
     """Test try_mark_refresh_token_used functionality for OAuth token rotation."""
@@ -0,0 +1,382 @@
+"""Tests for the async DB accessors and the PostgreSQL async classes.
+
+The async pool is faked, so these run without a database: they check the SQL
+each class sends, that results have the same shape as the sync classes', and
+which implementation the ``get_*_async`` accessors pick.
+"""
+
+import asyncio
+import weakref
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("psycopg", reason="PostgreSQL extra not installed")
+
+from actingweb.db import (  # noqa: E402
+    get_attribute_async,
+    get_property_async,
+    get_trust_async,
+    get_trust_list_async,
+)
+from actingweb.db.postgresql import attribute as pg_attribute  # noqa: E402
+from actingweb.db.postgresql import connection  # noqa: E402
+from actingweb.db.postgresql import property as pg_property  # noqa: E402
+from actingweb.db.postgresql import subscription_diff as pg_subscription_diff  # noqa: E402
+from actingweb.db.postgresql import trust as pg_trust  # noqa: E402
+from actingweb.db.protocols import (  # noqa: E402
+    AsyncDbAttributeProtocol,
+    AsyncDbPropertyProtocol,
+    AsyncDbTrustProtocol,
+)
+
+
+class FakeAsyncCursor:
+    def __init__(self, conn: "FakeAsyncConnection") -> None:
+        self.conn = conn
+        self.rowcount = conn.rowcount
+
+    async def __aenter__(self) -> "FakeAsyncCursor":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    async def execute(self, query: str, params: Any = None) -> "FakeAsyncCursor":
+        self.conn.executed.append((" ".join(query.split()), params))
+        return self
+
+    async def fetchone(self) -> Any:
+        return self.conn.rows[0] if self.conn.rows else None
+
+    async def fetchall(self) -> list[Any]:
+        return list(self.conn.rows)
+
+
+class FakeAsyncConnection:
+    """Records statements; answers every query with ``rows``."""
+
+    def __init__(self) -> None:
+        self.executed: list[tuple[str, Any]] = []
+        self.rows: list[Any] = []
+        self.rowcount = 1
+        self.commits = 0
+
+    def cursor(self) -> FakeAsyncCursor:
+        return FakeAsyncCursor(self)
+
+    async def execute(self, query: str, params: Any = None) -> FakeAsyncCursor:
+        return await self.cursor().execute(query, params)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+class FakeAsyncPool:
+    def __init__(self) -> None:
+        self.conn = FakeAsyncConnection()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[FakeAsyncConnection]:
+        yield self.conn
+
+
+@pytest.fixture
+def pool() -> Iterator[FakeAsyncPool]:
+    fake = FakeAsyncPool()
+
+    async def get_async_pool() -> FakeAsyncPool:
+        return fake
+
+    connection.reset_pool_metrics()
+    with mock.patch.object(connection, "get_async_pool", get_async_pool):
+        yield fake
+    connection.reset_pool_metrics()
+
+
+def _trust_row() -> tuple[Any, ...]:
+    created = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+    return (
+        "a1",
+        "peer1",
+        "https://peer.example/peer1",
+        "urn:actingweb:example",
+        "friend",
+        "s3cret",
+        "",
+        True,
+        True,
+        True,
+        "",
+        "peer@example.com",
+        "trust",
+        created,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+    )
+
+
+class TestAsyncProperty:
+    async def test_get_sets_handle(self, pool: FakeAsyncPool) -> None:
+        pool.conn.rows = [("hello",)]
+        db = pg_property.AsyncDbProperty(use_lookup_table=False)
+        assert await db.get(actor_id="a1", name="greeting") == "hello"
+        assert db.handle == {"id": "a1", "name": "greeting", "value": "hello"}
+        assert pool.conn.executed[0][1] == ("a1", "greeting")
+
+    async def test_get_raises_db_error_on_fault(self, pool: FakeAsyncPool) -> None:
+        from actingweb.db.exceptions import DbError
+
+        async def broken(*args: Any) -> None:
+            raise RuntimeError("connection lost")
+
+        db = pg_property.AsyncDbProperty(use_lookup_table=False)
+        with mock.patch.object(FakeAsyncCursor, "execute", broken):
+            with pytest.raises(DbError):
+                await db.get(actor_id="a1", name="greeting")
+
+    async def test_set_serializes_and_upserts(self, pool: FakeAsyncPool) -> None:
+        db = pg_property.AsyncDbProperty(use_lookup_table=False)
+        assert await db.set(actor_id="a1", name="config", value={"a": 1}) is True
+        query, params = pool.conn.executed[-1]
+        assert query.startswith("INSERT INTO properties")
+        assert params == ("a1", "config", '{"a": 1}')
+        assert pool.conn.commits == 1
+
+    async def test_empty_value_deletes(self, pool: FakeAsyncPool) -> None:
+        pool.conn.rows = [("old",)]
+        db = pg_property.AsyncDbProperty(use_lookup_table=False)
+        assert await db.set(actor_id="a1", name="greeting", value="") is True
+        assert pool.conn.executed[-1] == (
+            "DELETE FROM properties WHERE id = %s AND name = %s",
+            ("a1", "greeting"),
+        )
+        assert db.handle is None
+
+    async def test_indexed_property_uses_sync_write(self, pool: FakeAsyncPool) -> None:
+        db = pg_property.AsyncDbProperty(
+            use_lookup_table=True, indexed_properties=["email"]
+        )
+        with mock.patch.object(
+            pg_property.DbProperty, "set", return_value=True
+        ) as sync_set:
+            assert await db.set(actor_id="a1", name="email", value="x@example.com")
+        sync_set.assert_called_once_with("a1", "email", "x@example.com")
+        # The lookup-table write happens in the sync path, not on the async pool
+        assert pool.conn.executed == []
+
+    async def test_property_list_fetch(self, pool: FakeAsyncPool) -> None:
+        pool.conn.rows = [("a", "1"), ("b", "2")]
+        db = pg_property.AsyncDbPropertyList()
+        assert await db.fetch(actor_id="a1") == {"a": "1", "b": "2"}
+        assert "NOT LIKE 'list:%%'" in pool.conn.executed[0][0]
+
+
+class TestAsyncTrust:
+    async def test_get_matches_sync_row_mapping(self, pool: FakeAsyncPool) -> None:
+        row = _trust_row()
+        pool.conn.rows = [row]
+        db = pg_trust.AsyncDbTrust()
+        result = await db.get(actor_id="a1", peerid="peer1")
+        assert result == pg_trust._trust_from_row(row)
+        assert result is not None
+        assert result["last_connected_at"] == result["created_at"]
+        assert "client_name" not in result
+        assert db.handle == result
+
+    async def test_get_by_token(self, pool: FakeAsyncPool) -> None:
+        pool.conn.rows = [_trust_row()]
+        await pg_trust.AsyncDbTrust().get(actor_id="a1", token="s3cret")
+        query, params = pool.conn.executed[0]
+        assert "secret = %s LIMIT 1" in query
+        assert params == ("a1", "s3cret")
+
+    async def test_modify_runs_sync_with_handle(self, pool: FakeAsyncPool) -> None:
+        pool.conn.rows = [_trust_row()]
+        db = pg_trust.AsyncDbTrust()
+        await db.get(actor_id="a1", peerid="peer1")
+        seen: dict[str, Any] = {}
+
+        def modify(self: pg_trust.DbTrust, **kwargs: Any) -> bool:
+            seen["handle"] = self.handle
+            seen["kwargs"] = kwargs
+            return True
+
+        with mock.patch.object(pg_trust.DbTrust, "modify", modify):
+            assert await db.modify(approved=False) is True
+        assert seen["handle"]["peerid"] == "peer1"
+        assert seen["kwargs"] == {"approved": False}
+
+    async def test_list_fetch(self, pool: FakeAsyncPool) -> None:
+        pool.conn.rows = [_trust_row(), _trust_row()]
+        trusts = await pg_trust.AsyncDbTrustList().fetch(actor_id="a1")
+        assert len(trusts) == 2
+        assert pool.conn.executed[0][0].endswith("WHERE id = %s ORDER BY peerid")
+
+    async def test_is_token_in_db(self, pool: FakeAsyncPool) -> None:
+        pool.conn.rows = [("a1",)]
+        assert await pg_trust.AsyncDbTrust().is_token_in_db("a1", "s3cret")
+        pool.conn.rows = []
+        assert not await pg_trust.AsyncDbTrust().is_token_in_db("a1", "nope")
+
+
+class TestAsyncAttribute:
+    async def test_get_bucket(self, pool: FakeAsyncPool) -> None:
+        pool.conn.rows = [("k", {"v": 1}, None)]
+        db = pg_attribute.AsyncDbAttribute()
+        assert await db.get_bucket(actor_id="a1", bucket="b") == {
+            "k": {"data": {"v": 1}, "timestamp": None}
+        }
+
+    async def test_set_attr_with_ttl(self, pool: FakeAsyncPool) -> None:
+        db = pg_attribute.AsyncDbAttribute()
+        assert await db.set_attr("a1", "b", "k", data={"v": 1}, ttl_seconds=60)
+        params = pool.conn.executed[-1][1]
+        assert params[:5] == ("a1", "b:k", "b", "k", '{"v": 1}')
+        assert params[6] is not None
+
+    async def test_conditional_operations_report_rowcount(
+        self, pool: FakeAsyncPool
+    ) -> None:
+        db = pg_attribute.AsyncDbAttribute()
+        assert await db.insert_attr_if_absent("a1", "b", "k", data={"v": 1})
+        assert await db.delete_attr_conditional("a1", "b", "k")
+        pool.conn.rowcount = 0
+        assert not await db.conditional_update_attr(
+            "a1", "b", "k", old_data={"v": 1}, new_data={"v": 2}
+        )
+        assert not await db.delete_attr_conditional("a1", "b", "k")
+
+
+class TestAsyncSubscriptionDiff:
+    async def test_get_lowest_seqnr_and_delete(self, pool: FakeAsyncPool) -> None:
+        pool.conn.rows = [("a1", "s1:3", "s1", None, "{}", 3)]
+        db = pg_subscription_diff.AsyncDbSubscriptionDiff()
+        diff = await db.get(actor_id="a1", subid="s1")
+        assert diff == {
+            "id": "a1",
+            "subscriptionid": "s1",
+            "timestamp": None,
+            "data": "{}",
+            "sequence": 3,
+        }
+        assert await db.delete()
+        assert pool.conn.executed[-1][1] == ("a1", "s1:3")
+
+    async def test_list_delete_up_to_seqnr(self, pool: FakeAsyncPool) -> None:
+        db = pg_subscription_diff.AsyncDbSubscriptionDiffList()
+        await db.fetch(actor_id="a1", subid="s1")
+        assert await db.delete(seqnr=5)
+        assert pool.conn.executed[-1] == (
+            "DELETE FROM subscription_diffs WHERE id = %s AND subid = %s "
+            "AND seqnr <= %s",
+            ("a1", "s1", 5),
+        )
+
+
+class TestAsyncPool:
+    async def test_checkouts_are_counted_per_family(self, pool: FakeAsyncPool) -> None:
+        await pg_trust.AsyncDbTrust().is_token_in_db("a1", "t")
+        async with connection.get_async_connection():
+            pass
+        families = connection.pool_metrics()["families"]
+        assert families["trust"]["checkouts"] == 1
+        assert families["test_db_async"]["checkouts"] == 1
+
+    @pytest.fixture
+    def pool_class(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[mock.Mock]:
+        """``AsyncConnectionPool`` returning a new fake pool per call."""
+        monkeypatch.setattr(connection, "_async_pools", weakref.WeakKeyDictionary())
+
+        def build(**kwargs: Any) -> mock.Mock:
+            pool = mock.Mock()
+            pool.open = mock.AsyncMock()
+            pool.close = mock.AsyncMock()
+            return pool
+
+        with mock.patch.object(
+            connection, "AsyncConnectionPool", side_effect=build
+        ) as pool_class:
+            yield pool_class
+
+    async def test_pool_is_built_once_per_loop(
+        self, monkeypatch: pytest.MonkeyPatch, pool_class: mock.Mock
+    ) -> None:
+        monkeypatch.setenv("PG_POOL_MAX_SIZE", "7")
+        first = await connection.get_async_pool()
+        second = await connection.get_async_pool()
+        assert first is second
+        assert pool_class.call_count == 1
+        assert pool_class.call_args.kwargs["max_size"] == 7
+        assert pool_class.call_args.kwargs["open"] is False
+        await connection.close_async_pool()
+        first.close.assert_awaited_once()
+
+    def test_live_loops_keep_their_own_pool(self, pool_class: mock.Mock) -> None:
+        loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+        try:
+            pools = [
+                loop.run_until_complete(connection.get_async_pool()) for loop in loops
+            ]
+            # Alternating loops reuses each loop's pool and closes none
+            for _ in range(3):
+                for loop, pool in zip(loops, pools, strict=True):
+                    assert loop.run_until_complete(connection.get_async_pool()) is pool
+            assert pool_class.call_count == 2
+            for pool in pools:
+                pool.close.assert_not_awaited()
+
+            loops[0].run_until_complete(loops[0].shutdown_asyncgens())
+            pools[0].close.assert_awaited_once()
+            pools[1].close.assert_not_awaited()
+            assert list(connection._async_pools.values())[0].pool is pools[1]
+        finally:
+            for loop in loops:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+        pools[1].close.assert_awaited_once()
+
+
+class TestAsyncAccessors:
+    def _config(self, **modules: Any) -> Any:
+        return SimpleNamespace(use_lookup_table=False, indexed_properties=[], **modules)
+
+    def test_native_classes_are_used_when_the_backend_has_them(self) -> None:
+        config = self._config(
+            DbProperty=pg_property, DbTrust=pg_trust, DbAttribute=pg_attribute
+        )
+        assert isinstance(get_property_async(config), pg_property.AsyncDbProperty)
+        assert isinstance(get_trust_list_async(config), pg_trust.AsyncDbTrustList)
+        assert isinstance(get_property_async(config), AsyncDbPropertyProtocol)
+        assert isinstance(get_trust_async(config), AsyncDbTrustProtocol)
+        assert isinstance(get_attribute_async(config), AsyncDbAttributeProtocol)
+
+    async def test_sync_only_backend_runs_in_a_thread(self) -> None:
+        import threading
+
+        calls: list[str] = []
+
+        class DbTrust:
+            handle = {"peerid": "peer1"}
+
+            def get(self, actor_id: str | None = None, **kwargs: Any) -> dict[str, Any]:
+                calls.append(threading.current_thread().name)
+                return {"id": actor_id}
+
+        config = self._config(DbTrust=SimpleNamespace(DbTrust=DbTrust))
+        db = get_trust_async(config)
+        assert await db.get(actor_id="a1", peerid="peer1") == {"id": "a1"}
+        assert db.handle == {"peerid": "peer1"}
+        assert calls and calls[0] != threading.current_thread().name
@@ -0,0 +1,347 @@
+"""Tests for the async DynamoDB classes.
+
+The aiobotocore client is faked, so these run without DynamoDB: they check the
+requests each class sends (built from the same PynamoDB models as the sync
+path) and that results have the same shape as the sync classes'. The
+round trip against DynamoDB Local is
+``tests/integration/test_db_async_dynamodb.py``.
+"""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("aiobotocore", reason="aiobotocore not installed")
+
+from botocore.exceptions import ClientError  # noqa: E402
+
+from actingweb.db import (  # noqa: E402
+    get_subscription_async,
+    get_trust_async,
+)
+from actingweb.db.dynamodb import _async, _ensure  # noqa: E402
+from actingweb.db.dynamodb import attribute as ddb_attribute  # noqa: E402
+from actingweb.db.dynamodb import property as ddb_property  # noqa: E402
+from actingweb.db.dynamodb import subscription as ddb_subscription  # noqa: E402
+from actingweb.db.dynamodb import subscription_diff as ddb_diff  # noqa: E402
+from actingweb.db.dynamodb import trust as ddb_trust  # noqa: E402
+from actingweb.db.exceptions import DbError  # noqa: E402
+from actingweb.db.protocols import (  # noqa: E402
+    AsyncDbSubscriptionProtocol,
+    AsyncDbTrustProtocol,
+)
+
+
+class FakeClient:
+    """Records calls; answers each operation from its queue of responses."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.responses: dict[str, list[Any]] = {}
+
+    def respond(self, operation: str, *responses: Any) -> None:
+        self.responses.setdefault(operation, []).extend(responses)
+
+    def __getattr__(self, operation: str) -> Any:
+        async def call(**kwargs: Any) -> Any:
+            self.calls.append((operation, kwargs))
+            queue = self.responses.get(operation)
+            response = queue.pop(0) if queue else {}
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        return call
+
+    def ops(self) -> list[str]:
+        return [op for op, _ in self.calls]
+
+
+def _condition_failed(operation: str) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+        operation,
+    )
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeClient]:
+    fake = FakeClient()
+
+    async def get_client() -> FakeClient:
+        return fake
+
+    monkeypatch.setattr(_async, "get_client", get_client)
+    # Constructors call ensure_table(); never reach for a real table here
+    monkeypatch.setattr(_ensure, "_auto_create_override", False)
+    yield fake
+
+
+class TestRequests:
+    async def test_get_item_is_consistent_and_decodes_the_model(
+        self, client: FakeClient
+    ) -> None:
+        client.respond(
+            "get_item",
+            {"Item": {"id": {"S": "a1"}, "name": {"S": "n"}, "value": {"S": "v"}}},
+        )
+        item = await _async.get_item(ddb_property.Property, "a1", "n")
+        assert item is not None and item.value == "v"
+        op, kwargs = client.calls[0]
+        assert op == "get_item"
+        assert kwargs["TableName"] == ddb_property.Property.Meta.table_name
+        assert kwargs["Key"] == {"id": {"S": "a1"}, "name": {"S": "n"}}
+        assert kwargs["ConsistentRead"] is True
+
+    async def test_query_follows_pages(self, client: FakeClient) -> None:
+        row = {"id": {"S": "a1"}, "name": {"S": "n"}, "value": {"S": "v"}}
+        client.respond(
+            "query",
+            {"Items": [row], "LastEvaluatedKey": {"id": {"S": "a1"}}},
+            {"Items": [row]},
+        )
+        items = await _async.query(ddb_property.Property, "a1")
+        assert len(items) == 2
+        first, second = (kwargs for _, kwargs in client.calls)
+        assert "ExclusiveStartKey" not in first
+        assert second["ExclusiveStartKey"] == {"id": {"S": "a1"}}
+        assert first["ConsistentRead"] is True
+
+    async def test_index_query_names_the_index(self, client: FakeClient) -> None:
+        await _async.query(ddb_trust.Trust, "tok", index=ddb_trust.Trust.secret_index)
+        kwargs = client.calls[0][1]
+        assert kwargs["IndexName"] == ddb_trust.Trust.secret_index.Meta.index_name
+        assert "ConsistentRead" not in kwargs
+        assert "secret" in kwargs["ExpressionAttributeNames"].values()
+
+    async def test_instrumented_calls_report_capacity(
+        self, client: FakeClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from actingweb.db import instrumentation
+
+        seen: list[Any] = []
+        monkeypatch.setattr(instrumentation, "_enabled", True)
+        monkeypatch.setattr(instrumentation, "_on_query", [seen.append])
+        client.respond("get_item", {"ConsumedCapacity": {"CapacityUnits": 0.5}})
+        db = instrumentation.instrumented("property", ddb_property.AsyncDbProperty())
+        assert await db.get(actor_id="a1", name="color") is None
+        assert client.calls[0][1]["ReturnConsumedCapacity"] == "TOTAL"
+        assert (seen[0].backend, seen[0].consumed_capacity) == ("dynamodb", 0.5)
+
+
+class TestAsyncProperty:
+    async def test_set_writes_the_sync_item(self, client: FakeClient) -> None:
+        db = ddb_property.AsyncDbProperty(use_lookup_table=False)
+        assert await db.set(actor_id="a1", name="color", value={"r": 1})
+        op, kwargs = client.calls[0]
+        assert op == "put_item"
+        assert kwargs["Item"] == {
+            "id": {"S": "a1"},
+            "name": {"S": "color"},
+            "value": {"S": '{"r": 1}'},
+        }
+
+    async def test_get_raises_on_backend_fault(self, client: FakeClient) -> None:
+        client.respond("get_item", RuntimeError("throttled"))
+        db = ddb_property.AsyncDbProperty(use_lookup_table=False)
+        with pytest.raises(DbError):
+            await db.get(actor_id="a1", name="color")
+
+    async def test_list_fetch_skips_list_rows(self, client: FakeClient) -> None:
+        client.respond(
+            "query",
+            {"Items": [{"id": {"S": "a1"}, "name": {"S": "a"}, "value": {"S": "1"}}]},
+            {"Items": [{"id": {"S": "a1"}, "name": {"S": "z"}, "value": {"S": "2"}}]},
+        )
+        db = ddb_property.AsyncDbPropertyList(use_lookup_table=False)
+        assert await db.fetch(actor_id="a1") == {"a": "1", "z": "2"}
+        conditions = [kwargs["KeyConditionExpression"] for _, kwargs in client.calls]
+        assert " < " in conditions[0] and " >= " in conditions[1]
+
+
+class TestAsyncAttribute:
+    async def test_insert_if_absent_reports_live_item(self, client: FakeClient) -> None:
+        client.respond("put_item", _condition_failed("PutItem"))
+        db = ddb_attribute.AsyncDbAttribute()
+        assert not await db.insert_attr_if_absent(
+            actor_id="a1", bucket="b", name="k", data={"x": 1}, ttl_seconds=60
+        )
+        kwargs = client.calls[0][1]
+        assert "attribute_not_exists" in kwargs["ConditionExpression"]
+        assert kwargs["Item"]["bucket_name"] == {"S": "b:k"}
+        assert "ttl_timestamp" in kwargs["Item"]
+
+    async def test_empty_data_deletes_without_a_read(self, client: FakeClient) -> None:
+        db = ddb_attribute.AsyncDbAttribute()
+        assert await db.delete_attr(actor_id="a1", bucket="b", name="k")
+        assert client.ops() == ["delete_item"]
+
+    async def test_conditional_update_compares_order_independently(
+        self, client: FakeClient
+    ) -> None:
+        client.respond(
+            "get_item",
+            {
+                "Item": {
+                    "id": {"S": "a1"},
+                    "bucket_name": {"S": "b:k"},
+                    "bucket": {"S": "b"},
+                    "name": {"S": "k"},
+                    "data": {"S": '{"b": 2, "a": 1}'},
+                }
+            },
+        )
+        db = ddb_attribute.AsyncDbAttribute()
+        assert await db.conditional_update_attr(
+            actor_id="a1", bucket="b", name="k", old_data={"a": 1, "b": 2}, new_data=3
+        )
+        op, kwargs = client.calls[1]
+        assert op == "update_item"
+        assert "ConditionExpression" in kwargs
+
+    async def test_get_bucket_queries_the_prefix(self, client: FakeClient) -> None:
+        db = ddb_attribute.AsyncDbAttribute()
+        assert await db.get_bucket(actor_id="a1", bucket="b") == {}
+        assert "begins_with" in client.calls[0][1]["KeyConditionExpression"]
+
+
+class TestAsyncTrust:
+    async def test_token_lookup_matches_the_actor(self, client: FakeClient) -> None:
+        def trust(actor_id: str) -> dict[str, Any]:
+            return {
+                "id": {"S": actor_id},
+                "peerid": {"S": "p1"},
+                "baseuri": {"S": "https://peer"},
+                "type": {"S": "urn:t"},
+                "relationship": {"S": "friend"},
+                "secret": {"S": "tok"},
+                "desc": {"S": ""},
+                "approved": {"BOOL": True},
+                "peer_approved": {"BOOL": True},
+                "verified": {"BOOL": True},
+                "verification_token": {"S": ""},
+            }
+
+        client.respond("query", {"Items": [trust("other"), trust("a1")]})
+        db = ddb_trust.AsyncDbTrust()
+        result = await db.get(actor_id="a1", token="tok")
+        assert result is not None and result["id"] == "a1"
+        assert result["relationship"] == "friend"
+        client.respond("query", {"Items": [trust("other")]})
+        assert not await db.is_token_in_db(actor_id="a1", token="tok")
+
+
+class TestAsyncSubscriptionDiff:
+    async def test_get_without_seqnr_picks_the_lowest(self, client: FakeClient) -> None:
+        def diff(seqnr: int) -> dict[str, Any]:
+            return {
+                "id": {"S": "a1"},
+                "subid_seqnr": {"S": f"s1:{seqnr}"},
+                "subid": {"S": "s1"},
+                "diff": {"S": "{}"},
+                "seqnr": {"N": str(seqnr)},
+            }
+
+        client.respond("query", {"Items": [diff(3), diff(2)]})
+        db = ddb_diff.AsyncDbSubscriptionDiff()
+        result = await db.get(actor_id="a1", subid="s1")
+        assert result is not None and result["sequence"] == 2
+
+        client.respond("query", {"Items": [diff(3), diff(2)]})
+        diffs = ddb_diff.AsyncDbSubscriptionDiffList()
+        assert [d["sequence"] for d in await diffs.fetch("a1", "s1")] == [2, 3]
+        client.calls.clear()
+        client.respond("query", {"Items": [diff(3), diff(2)]})
+        assert await diffs.delete(seqnr=2)
+        deleted = [kw["Key"] for op, kw in client.calls if op == "delete_item"]
+        assert deleted == [{"id": {"S": "a1"}, "subid_seqnr": {"S": "s1:2"}}]
+
+
+class FakeSession:
+    """Counts the clients aiobotocore would open and close."""
+
+    def __init__(self) -> None:
+        self.opened = 0
+        self.closed = 0
+
+    def create_client(self, *args: Any, **kwargs: Any) -> Any:
+        session = self
+
+        class Context:
+            async def __aenter__(self) -> object:
+                session.opened += 1
+                return object()
+
+            async def __aexit__(self, *exc: Any) -> None:
+                session.closed += 1
+
+        return Context()
+
+
+class TestClientPerLoop:
+    @pytest.fixture
+    def session(self, monkeypatch: pytest.MonkeyPatch) -> FakeSession:
+        session = FakeSession()
+        monkeypatch.setattr("aiobotocore.session.get_session", lambda: session)
+        return session
+
+    def test_live_loops_keep_their_own_client(self, session: FakeSession) -> None:
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        try:
+            other_client = asyncio.run_coroutine_threadsafe(
+                _async.get_client(), other
+            ).result(5)
+
+            async def use() -> Any:
+                client = await _async.get_client()
+                assert await _async.get_client() is client
+                return client
+
+            assert asyncio.run(use()) is not other_client
+            # asyncio.run() closed its loop's client, not the other loop's
+            assert (session.opened, session.closed) == (2, 1)
+            assert (
+                asyncio.run_coroutine_threadsafe(_async.get_client(), other).result(5)
+                is other_client
+            )
+        finally:
+            asyncio.run_coroutine_threadsafe(other.shutdown_asyncgens(), other).result(
+                5
+            )
+            other.call_soon_threadsafe(other.stop)
+            thread.join(5)
+            other.close()
+        assert session.closed == 2
+
+    def test_close_client(self, session: FakeSession) -> None:
+        async def reopen() -> None:
+            first = await _async.get_client()
+            await _async.close_client()
+            assert session.closed == 1
+            assert await _async.get_client() is not first
+
+        asyncio.run(reopen())
+        assert (session.opened, session.closed) == (2, 2)
+
+
+class TestAccessors:
+    def test_dynamodb_native_classes_are_used(self, client: FakeClient) -> None:
+        config = SimpleNamespace(DbTrust=ddb_trust, DbSubscription=ddb_subscription)
+        db = get_subscription_async(config)  # type: ignore[arg-type]
+        assert isinstance(db, ddb_subscription.AsyncDbSubscription)
+        assert isinstance(db, AsyncDbSubscriptionProtocol)
+        assert isinstance(get_trust_async(config), AsyncDbTrustProtocol)  # type: ignore[arg-type]
+
+    def test_without_aiobotocore_calls_run_in_a_thread(
+        self, client: FakeClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_async, "ASYNC_DB_AVAILABLE", False)
+        config = SimpleNamespace(DbTrust=ddb_trust)
+        db = get_trust_async(config)  # type: ignore[arg-type]
+        assert not isinstance(db, ddb_trust.AsyncDbTrust)
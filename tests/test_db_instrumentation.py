@@ -0,0 +1,201 @@
+"""Tests for per-request DB query accounting (``actingweb.db.instrumentation``)."""
+
+import logging
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from actingweb import request_context
+from actingweb.db import get_trust, get_trust_list, instrumentation
+
+
+class FakeDbTrust:
+    def __init__(self) -> None:
+        self.handle: dict[str, Any] | None = None
+
+    def get(
+        self, actor_id: str | None = None, peerid: str | None = None
+    ) -> dict[str, Any] | None:
+        self.handle = {"id": actor_id, "peerid": peerid} if peerid != "nope" else None
+        return dict(self.handle) if self.handle else None
+
+    def modify(self, relationship: str | None = None) -> bool:
+        if relationship == "boom":
+            raise RuntimeError("backend down")
+        return True
+
+
+class FakeDbTrustList:
+    def fetch(self, actor_id: str | None = None) -> list[dict[str, Any]]:
+        return [{"id": actor_id, "peerid": "p1"}, {"id": actor_id, "peerid": "p2"}]
+
+    def iter_fetch(self, actor_id: str | None = None) -> Iterator[dict[str, Any]]:
+        yield from self.fetch(actor_id=actor_id)
+
+
+class FakeDbProperty:
+    def __init__(self, **kwargs: Any) -> None:
+        pass
+
+    async def get(self, actor_id: str | None = None, name: str | None = None) -> str:
+        instrumentation.add_consumed_capacity(0.5)
+        return "blue"
+
+
+@pytest.fixture
+def config() -> Iterator[Any]:
+    instrumentation.configure(slow_query_ms=0)
+    request_context.set_request_context(actor_id="a1")
+    yield SimpleNamespace(
+        DbTrust=SimpleNamespace(DbTrust=FakeDbTrust, DbTrustList=FakeDbTrustList),
+        DbProperty=SimpleNamespace(DbProperty=FakeDbProperty),
+        use_lookup_table=False,
+        indexed_properties=[],
+    )
+    request_context.clear_request_context()
+    instrumentation.reset()
+
+
+class TestRecording:
+    def test_calls_are_recorded_in_the_request_log(self, config: Any) -> None:
+        db = get_trust(config)
+        db.get(actor_id="a1", peerid="p1")
+        db.get(actor_id="a1", peerid="nope")
+        assert db.modify(relationship="friend")
+        get_trust_list(config).fetch(actor_id="a1")
+
+        records = request_context.get_query_log().records
+        assert [(r.table, r.operation, r.items) for r in records] == [
+            ("trusts", "get", 1),
+            ("trusts", "get", 0),
+            ("trusts", "modify", None),
+            ("trusts", "fetch", 2),
+        ]
+        assert all(r.duration_ms >= 0 and r.backend == "unknown" for r in records)
+        assert records[0].request_id == request_context.get_request_id()
+
+    def test_identity_map_hits_are_not_recorded(self, config: Any) -> None:
+        for _ in range(3):
+            get_trust(config).get(actor_id="a1", peerid="p1")
+        assert request_context.get_query_log().summary()["queries"] == 1
+
+    def test_errors_are_recorded_and_raised(self, config: Any) -> None:
+        db = get_trust(config)
+        db.get(actor_id="a1", peerid="p1")
+        with pytest.raises(RuntimeError):
+            db.modify(relationship="boom")
+        record = request_context.get_query_log().records[-1]
+        assert record.error == "RuntimeError"
+        assert record.attributes()["error.type"] == "RuntimeError"
+
+    def test_generator_reads_are_recorded_when_consumed(self, config: Any) -> None:
+        rows = get_trust_list(config).iter_fetch(actor_id="a1")
+        query_log = request_context.get_query_log()
+        assert not query_log.records
+        assert [row["peerid"] for row in rows] == ["p1", "p2"]
+        (record,) = query_log.records
+        assert (record.operation, record.items) == ("iter_fetch", 2)
+
+    async def test_async_calls_collect_capacity(self, config: Any) -> None:
+        config.DbProperty.AsyncDbProperty = FakeDbProperty
+        from actingweb.db import get_property_async
+
+        assert await get_property_async(config).get(actor_id="a1", name="c") == "blue"
+        (record,) = request_context.get_query_log().records
+        assert (record.table, record.operation) == ("properties", "get")
+        assert record.consumed_capacity == 0.5
+        # Outside a call, reported capacity goes nowhere
+        instrumentation.add_consumed_capacity(1.0)
+        assert record.consumed_capacity == 0.5
+
+    def test_backend_is_taken_from_the_module(self, config: Any) -> None:
+        pytest.importorskip("psycopg")
+        from actingweb.db.postgresql import trust as pg_trust
+
+        db = instrumentation.instrumented("trust", pg_trust.DbTrust())
+        assert db._backend == "postgresql"
+        assert db.handle is None
+
+
+class TestDisabled:
+    def test_objects_are_returned_unwrapped(self, config: Any) -> None:
+        instrumentation.configure(False)
+        request_context.set_request_context(actor_id="a1", identity_map=False)
+        assert isinstance(get_trust(config), FakeDbTrust)
+        assert request_context.get_query_log() is None
+
+
+class TestReporting:
+    def test_summary_is_logged_at_request_end(
+        self, config: Any, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        get_trust(config).get(actor_id="a1", peerid="p1")
+        get_trust(config).get(actor_id="a1", peerid="p1")
+        with caplog.at_level(logging.INFO, logger=instrumentation.__name__):
+            request_context.clear_request_context()
+        (message,) = [r.getMessage() for r in caplog.records]
+        assert message.startswith("DB: 1 queries")
+        assert "avoided=1" in message and "trusts.get x1" in message
+
+    def test_slow_queries_are_logged(
+        self, config: Any, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        instrumentation.configure(slow_query_ms=1e-9)
+        with caplog.at_level(logging.WARNING, logger=instrumentation.__name__):
+            get_trust(config).get(actor_id="a1", peerid="p1")
+        assert "Slow DB query: trusts.get" in caplog.text
+
+    def test_callbacks_receive_records_and_logs(self, config: Any) -> None:
+        seen: list[Any] = []
+
+        def failing(record: Any) -> None:
+            raise ValueError("exporter bug")
+
+        instrumentation.configure(on_query=failing)
+        instrumentation.configure(on_query=seen.append, on_request=seen.append)
+        get_trust_list(config).fetch(actor_id="a1")
+        query_log = request_context.get_query_log()
+        request_context.clear_request_context()
+
+        record, logged = seen
+        assert logged is query_log and logged.records == [record]
+        assert record.span_name == "fetch trusts"
+        assert record.end_time_ns >= record.start_time_ns
+        assert record.attributes()["db.response.returned_rows"] == 2
+
+
+class TestDynamoDBCapacity:
+    def test_capacity_units_of_responses(self) -> None:
+        pytest.importorskip("pynamodb")
+        from actingweb.db.dynamodb._instrument import consumed_capacity_units
+
+        assert consumed_capacity_units({}) is None
+        assert consumed_capacity_units({"ConsumedCapacity": {"CapacityUnits": 1}}) == 1
+        batch = {"ConsumedCapacity": [{"CapacityUnits": 1}, {"CapacityUnits": 2.5}]}
+        assert consumed_capacity_units(batch) == 3.5
+
+    def test_pynamodb_requests_report_capacity(
+        self, config: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pytest.importorskip("pynamodb")
+        from pynamodb.connection.base import Connection
+
+        from actingweb.db.dynamodb._instrument import install
+
+        install()
+        monkeypatch.setattr(
+            Connection,
+            "_make_api_call",
+            lambda self, name, kwargs: {"ConsumedCapacity": {"CapacityUnits": 2.0}},
+        )
+
+        class DbCounter:
+            def get(self) -> int:
+                Connection(region="us-east-1").dispatch("GetItem", {"TableName": "t"})
+                return 1
+
+        instrumentation.instrumented("counter", DbCounter()).get()
+        (record,) = request_context.get_query_log().records
+        assert record.consumed_capacity == 2.0
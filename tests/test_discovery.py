@@ -0,0 +1,211 @@
+"""Tests for the pre-encoded /meta and discovery documents (``actingweb.discovery``)."""
+
+import json
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from actingweb import discovery
+from actingweb.aw_web_request import AWResponse
+from actingweb.config import Config
+from actingweb.discovery import EncodedDocument
+
+
+class FakeRegistry:
+    def __init__(self, *names: str) -> None:
+        self.names = list(names)
+        self.version = 1
+
+    def list_types(self) -> list[Any]:
+        return [
+            SimpleNamespace(
+                name=name, display_name=name.title(), description="", created_by="test"
+            )
+            for name in self.names
+        ]
+
+    def current_version(self) -> int:
+        return self.version
+
+
+@pytest.fixture
+def registry() -> Iterator[FakeRegistry]:
+    registry = FakeRegistry("friend", "viewer")
+    with patch("actingweb.trust_type_registry.get_registry", return_value=registry):
+        yield registry
+
+
+@pytest.fixture
+def config() -> Config:
+    return Config(fqdn="aw.example.com", proto="https://", mcp=False)
+
+
+class TestEncodedDocument:
+    def test_from_json(self) -> None:
+        document = EncodedDocument.from_json({"b": 1, "a": [1, 2]}, "max-age=1")
+        assert json.loads(document.body) == {"b": 1, "a": [1, 2]}
+        # The bytes the handlers wrote before documents were cached
+        assert document.body == json.dumps({"b": 1, "a": [1, 2]}).encode("utf-8")
+        assert document.etag.startswith('"') and document.etag.endswith('"')
+        assert document.headers == {"ETag": document.etag, "Cache-Control": "max-age=1"}
+        assert EncodedDocument.from_json({"b": 1, "a": [1, 2]}, "x").etag == (
+            document.etag
+        )
+
+    def test_matches(self) -> None:
+        document = EncodedDocument.from_json({}, "max-age=1")
+        assert document.matches(document.etag)
+        assert document.matches(f"W/{document.etag}")
+        assert document.matches(f'"other", {document.etag}')
+        assert document.matches("*")
+        assert not document.matches('"other"')
+        assert not document.matches(None)
+        assert not document.matches("")
+
+    def test_write(self) -> None:
+        document = EncodedDocument.from_json({"id": "a1"}, "max-age=1")
+        response = AWResponse()
+        document.write(response, None)
+        assert response.status_code == 200
+        assert response.body == document.body
+        assert response.headers["Content-Type"] == "application/json"
+        assert response.headers["ETag"] == document.etag
+
+        response = AWResponse()
+        document.write(response, document.etag)
+        assert response.status_code == 304
+        assert not response.body
+        assert "Content-Type" not in response.headers
+        assert response.headers["Cache-Control"] == "max-age=1"
+
+
+class TestDocuments:
+    def test_documents_are_encoded_once(self, config: Config) -> None:
+        document = discovery.get_document(
+            config, ".well-known/oauth-authorization-server"
+        )
+        assert json.loads(document.body) == discovery.authorization_server_metadata(
+            config
+        )
+        assert json.loads(document.body)["issuer"] == "https://aw.example.com"
+        assert document.cache_control == discovery.DISCOVERY_CACHE_CONTROL
+        assert (
+            discovery.get_document(config, ".well-known/oauth-authorization-server")
+            is document
+        )
+
+    def test_prebuild(self, config: Config) -> None:
+        discovery.prebuild(config)
+        with patch.object(discovery, "mcp_info", side_effect=AssertionError("rebuilt")):
+            discovery.get_document(config, "mcp/info")
+
+    def test_config_change_rebuilds(self, config: Config) -> None:
+        document = discovery.get_document(
+            config, ".well-known/oauth-protected-resource"
+        )
+        config.fqdn = "other.example.com"
+        rebuilt = discovery.get_document(config, ".well-known/oauth-protected-resource")
+        assert rebuilt.etag != document.etag
+        assert json.loads(rebuilt.body)["resource"] == "https://other.example.com/mcp"
+
+    def test_trust_type_documents_follow_the_registry(
+        self, config: Config, registry: FakeRegistry
+    ) -> None:
+        document = discovery.get_document(config, "meta/trusttypes")
+        assert json.loads(document.body)["default_trust_type"] == "friend"
+        assert discovery.get_document(config, "meta/trusttypes") is document
+
+        registry.names = ["viewer"]
+        registry.version += 1
+        rebuilt = discovery.get_document(config, "meta/trusttypes")
+        assert json.loads(rebuilt.body)["trust_types"].keys() == {"viewer"}
+
+
+class TestActorMeta:
+    def test_actor_meta(self, config: Config, registry: FakeRegistry) -> None:
+        document = discovery.get_actor_meta(config, "a1", "https://root.example.com")
+        values = json.loads(document.body)
+        assert values["id"] == "a1"
+        assert values["trustee_root"] == "https://root.example.com"
+        assert values["aw_trust_types"] == ["friend", "viewer"]
+        assert document.cache_control == discovery.META_CACHE_CONTROL
+        assert (
+            discovery.get_actor_meta(config, "a1", "https://root.example.com")
+            is document
+        )
+        assert json.loads(discovery.get_actor_meta(config, "a2", "").body)["id"] == (
+            "a2"
+        )
+
+    def test_trustee_root_change_rebuilds(
+        self, config: Config, registry: FakeRegistry
+    ) -> None:
+        document = discovery.get_actor_meta(config, "a1", "")
+        rebuilt = discovery.get_actor_meta(config, "a1", "https://root.example.com")
+        assert rebuilt.etag != document.etag
+
+    def test_update_supported_options_rebuilds(
+        self, config: Config, registry: FakeRegistry
+    ) -> None:
+        document = discovery.get_actor_meta(config, "a1", "")
+        assert "mcp" not in json.loads(document.body)["aw_supported"].split(",")
+
+        config.mcp = True
+        config.update_supported_options()
+        rebuilt = discovery.get_actor_meta(config, "a1", "")
+        assert "mcp" in json.loads(rebuilt.body)["aw_supported"].split(",")
+        assert rebuilt.etag != document.etag
+
+    def test_registry_change_rebuilds(
+        self, config: Config, registry: FakeRegistry
+    ) -> None:
+        discovery.get_actor_meta(config, "a1", "")
+        registry.names.append("admin")
+        registry.version += 1
+        rebuilt = discovery.get_actor_meta(config, "a1", "")
+        assert json.loads(rebuilt.body)["aw_trust_types"][-1] == "admin"
+
+
+class TestEndpoints:
+    @pytest.fixture
+    def client(self) -> Any:
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from actingweb.interface import ActingWebApp
+        from actingweb.interface.integrations.fastapi_integration import (
+            FastAPIIntegration,
+        )
+
+        # No storage: the permission system loads trust types from the database
+        with patch.object(ActingWebApp, "_initialize_permission_system"):
+            aw_app = ActingWebApp(
+                aw_type="urn:actingweb:test", fqdn="aw.example.com", proto="https://"
+            )
+            fastapi_app = FastAPI()
+            FastAPIIntegration(aw_app, fastapi_app).setup_routes()
+        return TestClient(fastapi_app)
+
+    @pytest.mark.parametrize(
+        "path",
+        ["/.well-known/oauth-authorization-server", "/mcp", "/mcp/info"],
+    )
+    def test_revalidation(self, client: Any, path: str) -> None:
+        response = client.get(path)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == discovery.DISCOVERY_CACHE_CONTROL
+
+        revalidated = client.get(path, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+
+    def test_discovery_keeps_cors_headers(self, client: Any) -> None:
+        response = client.get("/.well-known/oauth-protected-resource")
+        assert response.json()["resource"] == "https://aw.example.com/mcp"
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert response.headers["access-control-max-age"] == "86400"
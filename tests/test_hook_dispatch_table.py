@@ -0,0 +1,138 @@
+"""Tests for HookRegistry's precompiled dispatch table."""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from actingweb.interface.hooks import NO_HOOKS, HookRegistry
+
+
+class _Actor:
+    id = "actor-1"
+
+
+PEER_CONTEXT = {"peer_id": "peer-1", "config": object()}
+
+
+@pytest.fixture
+def evaluator() -> Any:
+    with patch("actingweb.interface.hooks.get_permission_evaluator") as get:
+        yield get.return_value
+
+
+def _tag(name: str, calls: list[str]) -> Any:
+    def hook(actor: Any, operation: str, value: Any, path: list[str]) -> Any:
+        calls.append(name)
+        return value
+
+    return hook
+
+
+class TestDispatchTable:
+    def test_specific_hooks_run_before_wildcards(self) -> None:
+        registry = HookRegistry()
+        calls: list[str] = []
+        registry.register_property_hook("*", _tag("wildcard", calls))
+        registry.register_property_hook("email", _tag("email", calls))
+        registry.register_property_hook("email", _tag("email-2", calls))
+
+        chain = registry.build_dispatch_table().property_hooks("email", "get")
+        assert len(chain.specific) == 2 and len(chain.wildcard) == 1
+
+        registry.execute_property_hooks("email", "get", _Actor(), "v")
+        assert calls == ["email", "email-2", "wildcard"]
+
+    def test_names_without_hooks_fall_back_to_wildcards(self) -> None:
+        registry = HookRegistry()
+        calls: list[str] = []
+        registry.register_property_hook("*", _tag("wildcard", calls))
+        get_only = _tag("email", calls)
+        get_only._operations = ["get"]
+        registry.register_property_hook("email", get_only)
+
+        table = registry.build_dispatch_table()
+        assert table.property_hooks("other", "get").specific == ()
+        assert table.property_hooks("email", "put").specific == ()
+        registry.execute_property_hooks("email", "put", _Actor(), "v")
+        assert calls == ["wildcard"]
+
+    def test_registration_rebuilds_the_table(self) -> None:
+        registry = HookRegistry()
+        table = registry.build_dispatch_table()
+        assert not table.method_hooks("search")
+
+        registry.register_method_hook("search", lambda actor, name, data: "found")
+        assert registry.execute_method_hooks("search", _Actor(), {}) == "found"
+        assert registry._dispatch is not table
+
+    def test_table_is_immutable(self) -> None:
+        registry = HookRegistry()
+        registry.register_callback_hook("ping", lambda actor, name, data: True)
+        table = registry.build_dispatch_table()
+        with pytest.raises(TypeError):
+            table.callbacks["pong"] = NO_HOOKS  # type: ignore[index]
+
+
+class TestNoHookFastPath:
+    def test_property_without_hooks_skips_permission_check(
+        self, evaluator: MagicMock
+    ) -> None:
+        registry = HookRegistry()
+        registry.register_property_hook("email", _tag("email", []))
+        auth_context = dict(PEER_CONTEXT)
+
+        assert (
+            registry.execute_property_hooks(
+                "notes", "put", _Actor(), "v", [], auth_context
+            )
+            == "v"
+        )
+        evaluator.evaluate_property_access.assert_not_called()
+
+    def test_property_with_hooks_still_checks_permission(
+        self, evaluator: MagicMock
+    ) -> None:
+        from actingweb.permission_evaluator import PermissionResult
+
+        evaluator.evaluate_property_access.return_value = PermissionResult.DENIED
+        registry = HookRegistry()
+        registry.register_property_hook("*", _tag("wildcard", []))
+
+        result = registry.execute_property_hooks(
+            "notes", "put", _Actor(), "v", [], dict(PEER_CONTEXT)
+        )
+        assert result is None
+        evaluator.evaluate_property_access.assert_called_once()
+
+    def test_methods_and_actions_without_hooks(self, evaluator: MagicMock) -> None:
+        registry = HookRegistry()
+        assert registry.execute_method_hooks("m", _Actor(), {}, PEER_CONTEXT) is None
+        assert registry.execute_action_hooks("a", _Actor(), {}, PEER_CONTEXT) is None
+        assert registry.execute_callback_hooks("c", _Actor(), {}) is False
+        assert registry.execute_app_callback_hooks("c", {}) is False
+        evaluator.evaluate_method_access.assert_not_called()
+        evaluator.evaluate_action_access.assert_not_called()
+
+    async def test_async_dispatch_uses_the_table(self, evaluator: MagicMock) -> None:
+        registry = HookRegistry()
+
+        async def search(actor: Any, name: str, data: Any) -> Any:
+            return {"action": name}
+
+        registry.register_action_hook("*", search)
+        assert (
+            await registry.execute_method_hooks_async("m", _Actor(), {}, PEER_CONTEXT)
+            is None
+        )
+        evaluator.evaluate_method_access.assert_not_called()
+        assert await registry.execute_action_hooks_async("find", _Actor(), {}) == {
+            "action": "find"
+        }
+        assert (
+            await registry.execute_property_hooks_async(
+                "notes", "get", _Actor(), "v", [], dict(PEER_CONTEXT)
+            )
+            == "v"
+        )
+        evaluator.evaluate_property_access.assert_not_called()
@@ -0,0 +1,193 @@
+"""Tests for running async hooks from sync code (``interface.hook_executor``)."""
+
+import asyncio
+import contextvars
+import threading
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from actingweb.interface import hook_executor
+from actingweb.interface.hook_executor import AsyncHookRunner, AsyncHookRunnerPool
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+@pytest.fixture
+def runner() -> Iterator[AsyncHookRunner]:
+    runner = AsyncHookRunner(name="test-async-hooks")
+    yield runner
+    runner.shutdown()
+
+
+async def where() -> tuple[str, int]:
+    await asyncio.sleep(0)
+    return threading.current_thread().name, id(asyncio.get_running_loop())
+
+
+class TestAsyncHookRunner:
+    def test_loop_is_reused_across_calls(self, runner: AsyncHookRunner) -> None:
+        first = runner.run(where)
+        assert runner.run(where) == first
+        assert first[0] == "test-async-hooks"
+
+    def test_arguments_and_result(self, runner: AsyncHookRunner) -> None:
+        async def add(a: int, b: int = 0) -> int:
+            await asyncio.sleep(0)
+            return a + b
+
+        assert runner.run(add, 1, b=2) == 3
+
+    def test_callers_context_is_propagated(self, runner: AsyncHookRunner) -> None:
+        async def read() -> str:
+            value = request_id.get("unset")
+            request_id.set("changed-by-hook")
+            return value
+
+        token = request_id.set("req-1")
+        try:
+            assert runner.run(read) == "req-1"
+            # The hook ran in a copy; the caller's value is unchanged
+            assert request_id.get() == "req-1"
+        finally:
+            request_id.reset(token)
+        assert runner.run(read) == "unset"
+
+    def test_exceptions_are_raised_in_caller(self, runner: AsyncHookRunner) -> None:
+        async def fail() -> None:
+            raise ValueError("hook failed")
+
+        with pytest.raises(ValueError, match="hook failed"):
+            runner.run(fail)
+        # The loop survives a failing hook
+        assert runner.run(where)[0] == "test-async-hooks"
+
+    def test_concurrent_callers(self, runner: AsyncHookRunner) -> None:
+        async def echo(value: int) -> int:
+            await asyncio.sleep(0.01)
+            return value
+
+        results: dict[int, int] = {}
+
+        def call(i: int) -> None:
+            results[i] = runner.run(echo, i)
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == {i: i for i in range(10)}
+
+    def test_nested_call_from_loop_thread(self, runner: AsyncHookRunner) -> None:
+        async def inner() -> str:
+            return request_id.get("unset")
+
+        async def outer() -> str:
+            # An async hook calling sync code that bridges another async hook
+            return runner.run(inner)
+
+        token = request_id.set("req-nested")
+        try:
+            assert runner.run(outer) == "req-nested"
+        finally:
+            request_id.reset(token)
+
+    def test_called_from_running_loop(self, runner: AsyncHookRunner) -> None:
+        async def caller() -> tuple[str, int]:
+            return runner.run(where)
+
+        name, loop_id = runner.run(where)
+        assert asyncio.run(caller()) == (name, loop_id)
+
+    def test_loop_restarts_after_shutdown(self, runner: AsyncHookRunner) -> None:
+        runner.run(where)
+        thread = runner._thread
+        runner.shutdown()
+        assert thread is not None and not thread.is_alive()
+        runner.run(where)
+        assert runner._thread is not thread
+
+    def test_loop_is_recreated_after_fork(
+        self, runner: AsyncHookRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        runner.run(where)
+        old_loop, old_thread = runner._loop, runner._thread
+        monkeypatch.setattr(runner, "_pid", -1)
+        runner.run(where)
+        assert runner._loop is not old_loop
+        # Clean up the loop the "parent" left behind
+        assert old_loop is not None and old_thread is not None
+        old_loop.call_soon_threadsafe(old_loop.stop)
+        old_thread.join(timeout=5)
+
+
+@pytest.fixture
+def pool() -> Iterator[AsyncHookRunnerPool]:
+    pool = AsyncHookRunnerPool(size=3, name="test-hook-pool")
+    yield pool
+    pool.shutdown()
+
+
+class TestAsyncHookRunnerPool:
+    def test_sequential_calls_share_the_first_loop(
+        self, pool: AsyncHookRunnerPool
+    ) -> None:
+        first = pool.run(where)
+        assert pool.run(where) == first
+        assert first[0] == "test-hook-pool-0"
+
+    def test_blocking_hook_does_not_hold_up_others(
+        self, pool: AsyncHookRunnerPool
+    ) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        async def blocking() -> tuple[str, int]:
+            # An async hook calling sync, blocking code
+            started.set()
+            release.wait(5)
+            return await where()
+
+        blocked: list[tuple[str, int]] = []
+        thread = threading.Thread(target=lambda: blocked.append(pool.run(blocking)))
+        thread.start()
+        try:
+            assert started.wait(5)
+            other = pool.run(where)
+        finally:
+            release.set()
+            thread.join(5)
+        assert other != blocked[0]
+        assert pool.busy() == 0
+
+    def test_nested_call_from_pool_loop(self, pool: AsyncHookRunnerPool) -> None:
+        async def outer() -> str:
+            return pool.run(where)[0]
+
+        # The inner hook gets a private loop instead of waiting on the pool
+        assert not pool.run(outer).startswith("test-hook-pool")
+
+    def test_size_must_be_positive(self) -> None:
+        with pytest.raises(ValueError):
+            AsyncHookRunnerPool(size=0)
+
+
+def test_configure(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(hook_executor, "_pool", AsyncHookRunnerPool(size=2))
+    previous = hook_executor._pool
+    hook_executor.configure(2)
+    assert hook_executor._pool is previous
+    hook_executor.configure(4)
+    assert hook_executor._pool.size == 4
+    assert hook_executor.run_async_hook(where)[0] == "actingweb-async-hooks-0"
+    hook_executor._pool.shutdown()
+
+    # The app sizes it like the FastAPI handler pool
+    from actingweb.interface import ActingWebApp
+
+    with patch.object(ActingWebApp, "_initialize_permission_system"):
+        aw_app = ActingWebApp(aw_type="urn:actingweb:test", fqdn="aw.example.com")
+    aw_app.with_thread_pool_workers(5)
+    assert hook_executor._pool.size == 5
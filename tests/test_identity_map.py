@@ -0,0 +1,175 @@
+"""Tests for the request-scoped identity map behind the ``actingweb.db`` accessors."""
+
+import contextvars
+import threading
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from actingweb import request_context
+from actingweb.db import get_actor, get_trust, get_trust_list
+
+
+class FakeDbTrust:
+    """Counts backend reads; ``get`` returns the handle once loaded, like DbTrust."""
+
+    reads = 0
+    rows: dict[str, dict[str, Any]] = {}
+
+    def __init__(self) -> None:
+        self.handle: dict[str, Any] | None = None
+
+    def get(
+        self,
+        actor_id: str | None = None,
+        peerid: str | None = None,
+        token: str | None = None,
+    ) -> dict[str, Any] | None:
+        if not self.handle:
+            FakeDbTrust.reads += 1
+            row = self.rows.get(f"{actor_id}/{peerid}")
+            self.handle = dict(row) if row else None
+        return dict(self.handle) if self.handle else None
+
+    def modify(self, relationship: str | None = None) -> bool:
+        if not self.handle:
+            return False
+        self.handle["relationship"] = relationship
+        key = f"{self.handle['id']}/{self.handle['peerid']}"
+        self.rows[key] = dict(self.handle)
+        return True
+
+
+class FakeDbTrustList:
+    reads = 0
+
+    def fetch(self, actor_id: str | None) -> list[dict[str, Any]]:
+        FakeDbTrustList.reads += 1
+        return [dict(row) for row in FakeDbTrust.rows.values() if row["id"] == actor_id]
+
+
+class FakeDbActor:
+    reads = 0
+
+    def __init__(self) -> None:
+        self.handle: dict[str, Any] | None = None
+
+    def get(self, actor_id: str | None = None) -> dict[str, Any] | None:
+        FakeDbActor.reads += 1
+        self.handle = {"id": actor_id, "creator": "me"}
+        return dict(self.handle)
+
+    def modify(self, creator: str | None = None) -> bool:
+        return self.handle is not None
+
+
+@pytest.fixture
+def config() -> Iterator[Any]:
+    FakeDbTrust.reads = FakeDbTrustList.reads = FakeDbActor.reads = 0
+    FakeDbTrust.rows = {
+        "a1/p1": {"id": "a1", "peerid": "p1", "relationship": "friend"},
+        "a2/p1": {"id": "a2", "peerid": "p1", "relationship": "friend"},
+    }
+    request_context.set_request_context(actor_id="a1")
+    yield SimpleNamespace(
+        DbTrust=SimpleNamespace(DbTrust=FakeDbTrust, DbTrustList=FakeDbTrustList),
+        DbActor=SimpleNamespace(DbActor=FakeDbActor),
+    )
+    request_context.clear_request_context()
+
+
+class TestReadThrough:
+    def test_row_is_read_once_per_request(self, config: Any) -> None:
+        for _ in range(3):
+            trust = get_trust(config).get(actor_id="a1", peerid="p1")
+            assert trust is not None and trust["relationship"] == "friend"
+        assert FakeDbTrust.reads == 1
+        stats = request_context.get_identity_map().stats()
+        assert stats["families"]["trust"] == {"queries": 1, "avoided": 2}
+        assert (stats["queries"], stats["avoided"]) == (1, 2)
+
+    def test_absent_rows_are_cached_too(self, config: Any) -> None:
+        assert get_trust(config).get(actor_id="a1", peerid="nope") is None
+        assert get_trust(config).get(actor_id="a1", peerid="nope") is None
+        assert FakeDbTrust.reads == 1
+
+    def test_callers_get_copies(self, config: Any) -> None:
+        first = get_trust(config).get(actor_id="a1", peerid="p1")
+        assert first is not None
+        first["relationship"] = "changed by caller"
+        second = get_trust(config).get(actor_id="a1", peerid="p1")
+        assert second is not None and second["relationship"] == "friend"
+
+    def test_nothing_is_cached_outside_a_request(self, config: Any) -> None:
+        request_context.clear_request_context()
+        assert isinstance(get_trust(config), FakeDbTrust)
+        get_trust(config).get(actor_id="a1", peerid="p1")
+        get_trust(config).get(actor_id="a1", peerid="p1")
+        assert FakeDbTrust.reads == 2
+
+    def test_requests_do_not_share_rows(self, config: Any) -> None:
+        get_trust(config).get(actor_id="a1", peerid="p1")
+        request_context.set_request_context(actor_id="a1")
+        get_trust(config).get(actor_id="a1", peerid="p1")
+        assert FakeDbTrust.reads == 2
+
+    def test_map_is_created_on_first_access_and_shared_with_threads(
+        self, config: Any
+    ) -> None:
+        request_context.set_request_context(actor_id="a1")
+        assert request_context._request_db.get().identity_map is None  # type: ignore[union-attr]
+        maps = []
+        thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(lambda: maps.append(request_context.get_identity_map()),),
+        )
+        thread.start()
+        thread.join()
+        assert maps[0] is not None
+        assert request_context.get_identity_map() is maps[0]
+
+
+class TestWrites:
+    def test_modify_after_a_hit_loads_the_handle(self, config: Any) -> None:
+        get_trust(config).get(actor_id="a1", peerid="p1")
+        db = get_trust(config)
+        assert db.get(actor_id="a1", peerid="p1") is not None
+        assert FakeDbTrust.reads == 1
+
+        # The hit left the backend object empty; modify() must still work
+        assert db.modify(relationship="admin")
+        assert FakeDbTrust.reads == 2
+        assert request_context.get_identity_map().stats()["avoided"] == 0
+
+    def test_handle_is_loaded_on_access(self, config: Any) -> None:
+        get_trust(config).get(actor_id="a1", peerid="p1")
+        db = get_trust(config)
+        db.get(actor_id="a1", peerid="p1")
+        assert db.handle is not None and db.handle["relationship"] == "friend"
+
+    def test_write_evicts_the_actor_rows_of_the_family(self, config: Any) -> None:
+        db = get_trust(config)
+        db.get(actor_id="a1", peerid="p1")
+        get_trust(config).get(actor_id="a2", peerid="p1")
+        assert len(get_trust_list(config).fetch(actor_id="a1")) == 1
+        db.modify(relationship="admin")
+
+        trust = get_trust(config).get(actor_id="a1", peerid="p1")
+        assert trust is not None and trust["relationship"] == "admin"
+        assert get_trust_list(config).fetch(actor_id="a1")[0]["relationship"] == (
+            "admin"
+        )
+        assert FakeDbTrustList.reads == 2
+        # Another actor's rows stay cached
+        get_trust(config).get(actor_id="a2", peerid="p1")
+        assert FakeDbTrust.reads == 3
+
+    def test_actor_write_evicts_all_families_of_the_actor(self, config: Any) -> None:
+        get_trust(config).get(actor_id="a1", peerid="p1")
+        actor = get_actor(config)
+        actor.get(actor_id="a1")
+        assert actor.modify(creator="new")
+        get_trust(config).get(actor_id="a1", peerid="p1")
+        assert FakeDbTrust.reads == 2
@@ -0,0 +1,158 @@
+"""Tests for the pluggable JSON codec (``actingweb.json_codec``)."""
+
+import datetime
+import json
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from actingweb import json_codec
+
+BACKENDS = [
+    "json",
+    pytest.param(
+        "orjson",
+        marks=pytest.mark.skipif(
+            not json_codec.ORJSON_AVAILABLE, reason="orjson not installed"
+        ),
+    ),
+    pytest.param(
+        "msgspec",
+        marks=pytest.mark.skipif(
+            not json_codec.MSGSPEC_AVAILABLE, reason="msgspec not installed"
+        ),
+    ),
+]
+
+VALUES: list[Any] = [
+    {"b": 1, "a": [1.5, None, True, "æøå"], "nested": {"x": {}}},
+    ["x" * 1000, -3, 0.1, False],
+    "plain",
+    12,
+    None,
+]
+
+
+@pytest.fixture(autouse=True)
+def _reset_codec() -> Iterator[None]:
+    yield
+    json_codec.reset()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestBackends:
+    def test_dumps_is_stdlib_text(self, backend: str) -> None:
+        json_codec.configure(backend)
+        assert json_codec.get_backend() == backend
+        for value in VALUES:
+            assert json_codec.dumps(value) == json.dumps(value)
+        assert json_codec.dumps({"b": 1, "a": 2}, sort_keys=True, indent=2) == (
+            json.dumps({"b": 1, "a": 2}, sort_keys=True, indent=2)
+        )
+
+    def test_round_trip(self, backend: str) -> None:
+        json_codec.configure(backend)
+        for value in VALUES:
+            assert json_codec.loads(json_codec.encode(value)) == value
+            assert json_codec.loads(json_codec.encode_bytes(value)) == value
+            assert json_codec.loads(json.dumps(value)) == value
+            assert json_codec.loads(json.dumps(value).encode()) == value
+
+    def test_encode_like_stdlib(self, backend: str) -> None:
+        json_codec.configure(backend)
+        assert json.loads(json_codec.encode({1: "a", "b": 2})) == {"1": "a", "b": 2}
+        ordered = json.loads(json_codec.encode({"b": 1, "a": 2}, sort_keys=True))
+        assert list(ordered) == ["a", "b"]
+        big = {"n": 2**70}
+        assert json.loads(json_codec.encode(big)) == big
+        when = datetime.datetime(2026, 1, 2, 3, 4, 5)
+        with pytest.raises(TypeError):
+            json_codec.encode({"when": when})
+        assert json.loads(json_codec.encode({"when": when}, default=str)) == {
+            "when": str(when)
+        }
+        circular: list[Any] = []
+        circular.append(circular)
+        with pytest.raises(ValueError):
+            json_codec.encode(circular)
+
+    def test_loads_like_stdlib(self, backend: str) -> None:
+        json_codec.configure(backend)
+        assert json_codec.loads('{"n": 1180591620717411303424}') == {"n": 2**70}
+        assert json_codec.loads('"\\ud800"') == "\ud800"
+        nan = json_codec.loads("[NaN]")[0]
+        assert nan != nan
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads("{not json")
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads("")
+        with pytest.raises(TypeError):
+            json_codec.loads(None)  # type: ignore[arg-type]
+
+
+class TestConfiguration:
+    def test_stdlib_encode_is_unchanged(self) -> None:
+        json_codec.configure("json")
+        for value in VALUES:
+            assert json_codec.encode(value) == json.dumps(value)
+            assert json_codec.encode_bytes(value) == json.dumps(value).encode()
+
+    def test_invalid_backend(self) -> None:
+        with pytest.raises(ValueError):
+            json_codec.configure("yaml")
+
+    def test_missing_backend_falls_back(self) -> None:
+        with patch.object(json_codec, "MSGSPEC_AVAILABLE", False):
+            json_codec.configure("msgspec")
+        assert json_codec.get_backend() == "json"
+
+    def test_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("ACTINGWEB_JSON_BACKEND", "nope")
+        json_codec.reset()
+        assert json_codec.get_backend() == "json"
+        if json_codec.ORJSON_AVAILABLE:
+            monkeypatch.setenv("ACTINGWEB_JSON_BACKEND", "ORJSON")
+            json_codec.reset()
+            assert json_codec.get_backend() == "orjson"
+
+    def test_app_builder(self) -> None:
+        from actingweb.interface import ActingWebApp
+
+        with patch.object(ActingWebApp, "_initialize_permission_system"):
+            aw_app = ActingWebApp(aw_type="urn:actingweb:test", fqdn="aw.example.com")
+        assert aw_app.with_json_codec("json") is aw_app
+        assert json_codec.get_backend() == "json"
+        with pytest.raises(ValueError):
+            aw_app.with_json_codec("yaml")
+
+
+@pytest.mark.skipif(not json_codec.ORJSON_AVAILABLE, reason="orjson not installed")
+class TestCallSites:
+    def test_list_items(self) -> None:
+        from actingweb.property_list import ListProperty
+
+        json_codec.configure("orjson")
+        prop = ListProperty.__new__(ListProperty)
+        prop.name = "notes"
+        assert prop._encode_item({"a": [1, 2]}) == '{"a":[1,2]}'
+        assert prop._decode_item('{"a": [1, 2]}') == {"a": [1, 2]}
+        assert prop._encode_item({1, 2}) == str({1, 2})
+
+    def test_dynamodb_attribute(self) -> None:
+        from actingweb.db.dynamodb.attribute import CodecJSONAttribute
+
+        json_codec.configure("orjson")
+        attribute = CodecJSONAttribute(null=True)
+        assert attribute.serialize(None) is None
+        assert attribute.serialize({"a": 1}) == '{"a":1}'
+        assert attribute.deserialize('{"a": 1}') == {"a": 1}
+        # JSONAttribute accepts raw control characters in strings
+        assert attribute.deserialize('{"a": "x\ny"}') == {"a": "x\ny"}
+
+    def test_property_values_keep_stdlib_text(self) -> None:
+        from actingweb.db.postgresql.property import _serialize_property_value
+
+        json_codec.configure("orjson")
+        assert _serialize_property_value({"a": [1, 2]}) == '{"a": [1, 2]}'
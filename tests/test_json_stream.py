@@ -0,0 +1,332 @@
+"""Tests for streamed JSON listings (``actingweb.json_stream``, ``AWResponse.write_stream``)."""
+
+import datetime
+import json
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from actingweb import json_stream
+from actingweb.aw_web_request import AWResponse, AWWebObj
+from actingweb.config import Config
+from actingweb.json_stream import StreamedArray, StreamedObject
+
+
+def _body(response: AWResponse) -> str:
+    if response.stream is not None:
+        return "".join(str(chunk) for chunk in response.stream)
+    return str(response.body)
+
+
+class TestEncoding:
+    def test_same_text_as_json_dumps(self) -> None:
+        items = [{"a": 1, "b": [1, 2]}, "æøå", None, 1.5, []]
+        value = StreamedObject(
+            [
+                ("id", "a1"),
+                ("data", StreamedArray(iter(items))),
+                ("nested", StreamedObject(iter([("x", StreamedArray([]))]))),
+                ("empty", StreamedObject([])),
+            ]
+        )
+        plain = {"id": "a1", "data": items, "nested": {"x": []}, "empty": {}}
+        assert "".join(json_stream.iter_encode(value)) == json.dumps(plain)
+
+        value = StreamedObject(
+            [
+                ("id", "a1"),
+                ("data", StreamedArray(items)),
+                ("nested", StreamedObject([("x", StreamedArray([]))])),
+                ("empty", StreamedObject([])),
+            ]
+        )
+        assert json_stream.dumps(value) == json.dumps(plain)
+        assert json_stream.dumps({"plain": [1]}) == json.dumps({"plain": [1]})
+
+    def test_chunks(self) -> None:
+        value = StreamedArray("x" * 10 for _ in range(100))
+        chunks = list(json_stream.iter_encode(value, chunk_size=100))
+        assert len(chunks) > 5
+        assert all(len(chunk) >= 100 for chunk in chunks[:-1])
+        assert json.loads("".join(chunks)) == ["x" * 10] * 100
+
+    def test_items_are_read_as_encoded(self) -> None:
+        read = []
+
+        def items() -> Any:
+            for n in range(10):
+                read.append(n)
+                yield n
+
+        chunks = json_stream.iter_encode(StreamedArray(items()), chunk_size=1)
+        assert next(chunks) == "["
+        assert next(chunks) == "0"
+        assert read == [0]
+
+    def test_peek(self) -> None:
+        head, items = json_stream.peek(iter(range(5)), 3)
+        assert head == [0, 1, 2]
+        assert list(items) == [0, 1, 2, 3, 4]
+        head, items = json_stream.peek(iter(range(2)), 3)
+        assert head == [0, 1]
+        assert list(items) == [0, 1]
+        head, items = json_stream.peek(iter(range(5)), None)
+        assert head == [0, 1, 2, 3, 4]
+        assert list(items) == [0, 1, 2, 3, 4]
+
+
+class TestWriteJsonListing:
+    def _handler(self, min_items: int | None) -> Any:
+        from actingweb.handlers.base_handler import BaseHandler
+
+        config = Config()
+        config.stream_listings_min_items = min_items
+        return BaseHandler(AWWebObj(), config)
+
+    @pytest.mark.parametrize(
+        ("min_items", "streamed"), [(None, False), (3, False), (2, True), (0, True)]
+    )
+    def test_threshold(self, min_items: int | None, streamed: bool) -> None:
+        handler = self._handler(min_items)
+        handler.write_json_listing(StreamedArray([1, 2]), 2)
+        assert (handler.response.stream is not None) is streamed
+        assert handler.response.headers["Content-Type"] == "application/json"
+        assert _body(handler.response) == "[1, 2]"
+
+    def test_write_stream(self) -> None:
+        response = AWResponse()
+        response.write_stream(iter(["a"]), content_type="text/plain")
+        assert response.body == ""
+        assert response.headers["Content-Type"] == "text/plain"
+        assert list(response.stream or []) == ["a"]
+
+    def test_app_builder(self) -> None:
+        from actingweb.interface import ActingWebApp
+
+        with patch.object(ActingWebApp, "_initialize_permission_system"):
+            aw_app = ActingWebApp(aw_type="urn:actingweb:test", fqdn="aw.example.com")
+        assert aw_app.get_config().stream_listings_min_items is None
+        aw_app.with_streaming_listings(min_items=50)
+        assert aw_app.get_config().stream_listings_min_items == 50
+        with pytest.raises(ValueError):
+            aw_app.with_streaming_listings(min_items=-1)
+
+
+class _ListProperty:
+    def __init__(self, items: list[Any]) -> None:
+        self.items = items
+
+    def prime_from_rows(self, rows: dict[str, str]) -> None:
+        pass
+
+    def to_list_from_rows(self, rows: dict[str, str]) -> list[Any]:
+        return list(self.items)
+
+    def get_description(self) -> str:
+        return "desc"
+
+    def get_explanation(self) -> str:
+        return "expl"
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class TestListings:
+    ROWS = {
+        "a": '{"x": 1}',
+        "b": "plain",
+        "secret": "s",
+        "list:notes-meta": "{}",
+        "list:notes-0": '"n0"',
+    }
+
+    def _listall(self, params: dict[str, str], min_items: int | None) -> Any:
+        from actingweb.handlers.properties import PropertiesHandler
+
+        config = Config()
+        config.stream_listings_min_items = min_items
+        hooks = Mock()
+        hooks.execute_property_hooks.side_effect = (
+            lambda name, op, actor, value, path, ctx: (
+                None if name == "secret" else value
+            )
+        )
+        handler = PropertiesHandler(AWWebObj(params=params), config, hooks=hooks)
+        db_list = Mock()
+        db_list.fetch_all_including_lists.return_value = dict(self.ROWS)
+        actor_interface = Mock(id="actor1")
+        actor_interface.property_lists.notes = _ListProperty(["n0"])
+        with (
+            patch(
+                "actingweb.handlers.properties.get_property_list",
+                return_value=db_list,
+            ),
+            patch.object(handler, "_get_actor_interface", return_value=actor_interface),
+        ):
+            handler.listall(Mock(id="actor1"), Mock(acl={}))
+        return handler.response
+
+    @pytest.mark.parametrize(
+        ("params", "expected"),
+        [
+            (
+                {},
+                {
+                    "a": {"x": 1},
+                    "b": "plain",
+                    "notes": {"_list": True, "count": 1},
+                },
+            ),
+            (
+                {"format": "full"},
+                {
+                    "a": {"x": 1},
+                    "b": "plain",
+                    "notes": {
+                        "_list": True,
+                        "count": 1,
+                        "description": "desc",
+                        "explanation": "expl",
+                        "items": ["n0"],
+                    },
+                },
+            ),
+        ],
+    )
+    def test_properties(self, params: dict[str, str], expected: Any) -> None:
+        buffered = self._listall(params, None)
+        streamed = self._listall(params, 5)
+        assert buffered.stream is None
+        assert streamed.stream is not None
+        assert buffered.body == json.dumps(expected)
+        assert _body(streamed) == buffered.body
+        assert streamed.headers["Content-Type"] == "application/json"
+
+    def test_properties_metadata(self) -> None:
+        body = json.loads(_body(self._listall({"metadata": "true"}, 0)))
+        assert body["simple"]["properties"] == ["a", "b"]
+        assert body["lists"]["notes"]["count"] == 1
+
+    def test_trust(self) -> None:
+        from actingweb.handlers.trust import TrustHandler
+
+        config = Config()
+        config.stream_listings_min_items = 2
+        handler = TrustHandler(AWWebObj(), config)
+        myself = Mock()
+        trusts = [{"peerid": f"peer{i}", "relationship": "friend"} for i in range(3)]
+        myself.get_trust_relationships.return_value = trusts
+        with patch.object(handler, "require_authenticated_actor", return_value=myself):
+            handler.get("actor1")
+        assert handler.response.status_code == 200
+        assert handler.response.stream is not None
+        assert json.loads(_body(handler.response)) == trusts
+
+    @pytest.mark.parametrize("min_items", [None, 3, 2])
+    def test_subscription_diffs(self, min_items: int | None) -> None:
+        from actingweb.handlers.subscription import SubscriptionHandler
+
+        config = Config()
+        config.stream_listings_min_items = min_items
+        handler = SubscriptionHandler(AWWebObj(), config)
+        timestamp = datetime.datetime(2026, 1, 2, 3, 4, 5)
+        diffs = [
+            {"sequence": 1, "timestamp": timestamp, "diff": '{"a": 1}'},
+            {"sequence": 2, "timestamp": timestamp, "diff": "not json"},
+        ]
+        sub_with_diffs = Mock()
+        sub_with_diffs.iter_diffs.return_value = iter(diffs)
+        sub_with_diffs.subscription_info.to_dict.return_value = {
+            "target": "properties",
+            "subtarget": None,
+            "resource": None,
+            "sequence": 2,
+        }
+        actor_interface = Mock()
+        actor_interface.subscriptions.get_subscription_with_diffs.return_value = (
+            sub_with_diffs
+        )
+        auth_result = Mock(success=True, actor=Mock(id="actor1"))
+        with (
+            patch.object(handler, "authenticate_actor", return_value=auth_result),
+            patch.object(handler, "_get_actor_interface", return_value=actor_interface),
+        ):
+            handler.get("actor1", "peer1", "sub1")
+
+        assert (handler.response.stream is not None) is (min_items == 2)
+        body = json.loads(_body(handler.response))
+        assert body["subscriptionid"] == "sub1"
+        assert body["sequence"] == 2
+        assert body["data"] == [
+            {
+                "sequence": 1,
+                "timestamp": "2026-01-02T03:04:05.000000Z",
+                "data": {"a": 1},
+            },
+            {
+                "sequence": 2,
+                "timestamp": "2026-01-02T03:04:05.000000Z",
+                "data": "not json",
+            },
+        ]
+
+
+class TestIntegrations:
+    def _webobj(self) -> AWWebObj:
+        webobj = AWWebObj()
+        webobj.response.set_status(200, "Ok")
+        webobj.response.write_stream(
+            json_stream.iter_encode(StreamedArray(range(1000)), chunk_size=100)
+        )
+        return webobj
+
+    def _aw_app(self) -> Mock:
+        aw_app = Mock()
+        aw_app.hooks = {}
+        aw_app.get_config.return_value = Mock(ui=False)
+        return aw_app
+
+    def test_fastapi(self) -> None:
+        from fastapi import FastAPI, Request
+        from fastapi.testclient import TestClient
+
+        from actingweb.interface.integrations.fastapi_integration import (
+            FastAPIIntegration,
+        )
+
+        fastapi_app = FastAPI()
+        integration = FastAPIIntegration(self._aw_app(), fastapi_app)
+        webobj = self._webobj()
+
+        @fastapi_app.get("/listing")
+        def listing(request: Request) -> Any:
+            return integration._create_fastapi_response(webobj, request)
+
+        response = TestClient(fastapi_app).get("/listing")
+        assert response.status_code == 200
+        assert "content-length" not in response.headers
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == list(range(1000))
+
+    def test_flask(self) -> None:
+        from flask import Flask
+
+        from actingweb.interface.integrations.flask_integration import (
+            FlaskIntegration,
+        )
+
+        flask_app = Flask(__name__)
+        with patch.object(FlaskIntegration, "setup_routes"):
+            integration = FlaskIntegration(self._aw_app(), flask_app)
+        webobj = self._webobj()
+        flask_app.add_url_rule(
+            "/listing", "listing", lambda: integration._create_flask_response(webobj)
+        )
+
+        response = flask_app.test_client().get("/listing")
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.headers["Content-Type"] == "application/json"
+        assert response.get_json() == list(range(1000))
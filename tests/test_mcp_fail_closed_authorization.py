@@ -483,12 +483,8 @@ class TestNegativeTTL(unittest.TestCase):
 
         # Just past the negative TTL, but nowhere near the 5-minute
         # positive-cache window: must be a miss (fresh lookup required).
-        past_negative_ttl = (
-            mcp_mod._trust_cache[key]["cached_at"]
-            - mcp_mod._TRUST_CACHE_NEGATIVE_TTL
-            - 1
-        )
-        mcp_mod._trust_cache[key]["cached_at"] = past_negative_ttl
+        entry = mcp_mod._trust_cache.entry(key)
+        entry.stored_at -= mcp_mod._TRUST_CACHE_NEGATIVE_TTL + 1
 
         hit, trust = mcp_mod._trust_cache_get(key)
         self.assertFalse(hit)
@@ -0,0 +1,223 @@
+"""tools/list, resources/list and prompts/list: precomputed and cached.
+
+Descriptors come from ``actingweb.mcp.catalog`` (built once per hook
+registry); the permission-filtered listing is cached per (actor, peer,
+permission version, protocol version) in ``_listing_cache``. These tests pin
+what must still invalidate that cache, and what must never be cached.
+"""
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from actingweb.handlers import mcp as mcp_module
+from actingweb.handlers.mcp import MCPHandler, evict_mcp_caches_for_actor
+from actingweb.interface.hooks import HookRegistry
+from actingweb.mcp.catalog import get_catalog
+from actingweb.mcp.decorators import mcp_prompt, mcp_resource, mcp_tool
+from actingweb.permission_evaluator import PermissionResult
+
+ACTOR_ID = "actor1"
+PEER_ID = "oauth2_client:client-1:client-1"
+
+
+class CountingEvaluator:
+    """Evaluator stub with a real ``permission_version``, so results cache."""
+
+    def __init__(self, denied: set[str] | None = None) -> None:
+        self.denied = denied or set()
+        self.permission_version = 0
+        self.calls = 0
+
+    def evaluate_permission(self, actor_id, peer_id, ptype, target, operation=""):
+        self.calls += 1
+        if target in self.denied:
+            return PermissionResult.DENIED
+        return PermissionResult.ALLOWED
+
+
+class FakeActor:
+    def __init__(self, actor_id: str = ACTOR_ID) -> None:
+        self.id = actor_id
+
+
+def _make_hooks() -> HookRegistry:
+    hooks = HookRegistry()
+
+    @mcp_tool(description="search")
+    def search(actor, action_name, data):
+        return {}
+
+    @mcp_tool(description="delete")
+    def delete(actor, action_name, data):
+        return {}
+
+    @mcp_resource(uri_template="notes://{id}")
+    def notes(actor, method_name, data):
+        return {}
+
+    @mcp_prompt(description="summary")
+    def summarize(actor, method_name, data):
+        return {}
+
+    hooks.register_action_hook("search", search)
+    hooks.register_action_hook("delete", delete)
+    hooks.register_method_hook("notes", notes)
+    hooks.register_method_hook("summarize", summarize)
+    return hooks
+
+
+@pytest.fixture(autouse=True)
+def _empty_listing_cache() -> None:
+    mcp_module._listing_cache.clear()
+
+
+def _list(
+    handler: MCPHandler,
+    method: str,
+    evaluator: Any,
+    actor: FakeActor | None = None,
+    peer_id: str = PEER_ID,
+) -> list[dict[str, Any]]:
+    actor = actor or FakeActor()
+    with (
+        patch.object(
+            MCPHandler, "authenticate_and_get_actor_cached", return_value=actor
+        ),
+        patch("actingweb.handlers.mcp.RuntimeContext") as mock_rc,
+        patch(
+            "actingweb.permission_evaluator.get_permission_evaluator",
+            return_value=evaluator,
+        ),
+        patch(
+            "actingweb.runtime_context.get_client_info_from_context",
+            return_value=None,
+        ),
+    ):
+        mock_rc.return_value.get_mcp_context.return_value = Mock(peer_id=peer_id)
+        resp = handler.post({"jsonrpc": "2.0", "id": "1", "method": method})
+    key = method.split("/")[0]
+    return list(resp["result"][key])
+
+
+def _handler(hooks: HookRegistry | None = None) -> MCPHandler:
+    handler = MCPHandler()
+    handler.hooks = hooks or _make_hooks()
+    return handler
+
+
+class TestCatalog:
+    def test_catalog_is_built_once_per_registry(self) -> None:
+        hooks = _make_hooks()
+        catalog = get_catalog(hooks)
+        assert get_catalog(hooks) is catalog
+        assert [d.target for d in catalog.tools] == ["search", "delete"]
+        assert [d.target for d in catalog.resources] == ["notes://{id}"]
+        assert [d.target for d in catalog.prompts] == ["summarize"]
+
+    def test_registering_a_hook_rebuilds_the_catalog(self) -> None:
+        hooks = _make_hooks()
+        before = get_catalog(hooks)
+
+        @mcp_tool(description="late")
+        def late(actor, action_name, data):
+            return {}
+
+        hooks.register_action_hook("late", late)
+        after = get_catalog(hooks)
+        assert after is not before
+        assert after.serial != before.serial
+        assert "late" in [d.target for d in after.tools]
+
+
+class TestListingCache:
+    def test_repeat_listing_skips_permission_evaluation(self) -> None:
+        handler = _handler()
+        evaluator = CountingEvaluator(denied={"delete"})
+
+        first = _list(handler, "tools/list", evaluator)
+        calls_after_first = evaluator.calls
+        second = _list(handler, "tools/list", evaluator)
+
+        assert [t["name"] for t in first] == ["search"]
+        assert second == first
+        assert evaluator.calls == calls_after_first
+
+    def test_resources_and_prompts_are_cached_too(self) -> None:
+        handler = _handler()
+        evaluator = CountingEvaluator()
+        for method in ("resources/list", "prompts/list"):
+            _list(handler, method, evaluator)
+        calls = evaluator.calls
+        assert _list(handler, "resources/list", evaluator)[0]["uri"] == "notes://{id}"
+        assert _list(handler, "prompts/list", evaluator)[0]["name"] == "summarize"
+        assert evaluator.calls == calls
+
+    def test_permission_version_change_refilters(self) -> None:
+        handler = _handler()
+        evaluator = CountingEvaluator()
+        assert len(_list(handler, "tools/list", evaluator)) == 2
+
+        evaluator.denied = {"search"}
+        evaluator.permission_version += 1
+        assert [t["name"] for t in _list(handler, "tools/list", evaluator)] == [
+            "delete"
+        ]
+
+    def test_actor_eviction_refilters(self) -> None:
+        """Per-relationship permission writes evict the actor's group."""
+        handler = _handler()
+        evaluator = CountingEvaluator()
+        _list(handler, "tools/list", evaluator)
+
+        evaluator.denied = {"search", "delete"}
+        evict_mcp_caches_for_actor(ACTOR_ID)
+        assert _list(handler, "tools/list", evaluator) == []
+
+    def test_peers_do_not_share_listings(self) -> None:
+        handler = _handler()
+        evaluator = CountingEvaluator()
+        _list(handler, "tools/list", evaluator, peer_id="peer-a")
+        calls = evaluator.calls
+        _list(handler, "tools/list", evaluator, peer_id="peer-b")
+        assert evaluator.calls > calls
+
+    def test_fail_open_listing_is_not_cached(self) -> None:
+        handler = _handler()
+        evaluator = CountingEvaluator()
+        evaluator.evaluate_permission = Mock(  # type: ignore[method-assign]
+            side_effect=RuntimeError("store down")
+        )
+        assert len(_list(handler, "tools/list", evaluator)) == 2
+        assert len(mcp_module._listing_cache) == 0
+
+    def test_evaluator_without_version_is_not_cached(self) -> None:
+        handler = _handler()
+        evaluator = Mock()
+        evaluator.evaluate_permission = Mock(return_value=PermissionResult.ALLOWED)
+        _list(handler, "tools/list", evaluator)
+        assert len(mcp_module._listing_cache) == 0
+
+    def test_visibility_predicate_runs_on_every_listing(self) -> None:
+        hooks = HookRegistry()
+        visible = {"flag": True}
+
+        @mcp_tool(description="gated", visibility_predicate=lambda a: visible["flag"])
+        def gated(actor, action_name, data):
+            return {}
+
+        hooks.register_action_hook("gated", gated)
+        handler = _handler(hooks)
+        evaluator = CountingEvaluator()
+
+        assert len(_list(handler, "tools/list", evaluator)) == 1
+        visible["flag"] = False
+        assert _list(handler, "tools/list", evaluator) == []
+
+    def test_listed_entries_do_not_alias_the_catalog(self) -> None:
+        hooks = _make_hooks()
+        handler = _handler(hooks)
+        tools = _list(handler, "tools/list", CountingEvaluator())
+        tools[0]["description"] = "mutated"
+        assert get_catalog(hooks).tools[0].definition["description"] == "search"
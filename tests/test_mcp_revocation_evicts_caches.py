@@ -36,14 +36,10 @@ def _clean_caches() -> None:
 
 def _seed(actor_id: str = ACTOR, token: str = "aw_token") -> None:
     """Populate all three caches for one actor, the way a live request would."""
-    mcp_module._token_cache[token] = {"actor_id": actor_id, "cached_at": 0.0}
-    mcp_module._actor_cache[actor_id] = {
-        "actor": object(),
-        "last_accessed": 0.0,
-        "config": None,
-    }
-    mcp_module._trust_cache[(actor_id, "client-a")] = {"trust": object()}
-    mcp_module._trust_cache[(actor_id, "client-b")] = {"trust": object()}
+    mcp_module._token_cache[token] = {"actor_id": actor_id}
+    mcp_module._actor_cache[actor_id] = {"actor": object(), "config": None}
+    mcp_module._trust_cache[(actor_id, "client-a")] = object()
+    mcp_module._trust_cache[(actor_id, "client-b")] = object()
 
 
 class TestActorWideEviction:
@@ -128,8 +128,8 @@ class TrustCacheTestCase(unittest.TestCase):
         mcp_mod._token_cache.clear()
         mcp_mod._actor_cache.clear()
         mcp_mod._trust_cache.clear()
-        for key in mcp_mod._cache_stats:
-            mcp_mod._cache_stats[key] = 0
+        for cache in (mcp_mod._token_cache, mcp_mod._actor_cache, mcp_mod._trust_cache):
+            cache.reset_stats()
         mcp_mod._next_cleanup_at = 0.0
 
     def run_request(
@@ -185,7 +185,7 @@ class TestIdentitySequence(TrustCacheTestCase):
 
         # Requests 3-5 (index 2+) must be genuine cache hits, not misses that
         # happen to resolve correctly.
-        self.assertGreaterEqual(mcp_mod._cache_stats["trust_hits"], 3)
+        self.assertGreaterEqual(mcp_mod._trust_cache.hits, 3)
 
     def test_this_test_fails_against_actor_only_keying(self) -> None:
         """Prove the test has teeth: simulate the old actor-only key shape.
@@ -215,7 +215,7 @@ class TestIdentitySequence(TrustCacheTestCase):
             mock.patch.object(
                 mcp_mod,
                 "_trust_cache_put",
-                side_effect=lambda key, trust: legacy_put(key[0], key[1], trust),
+                side_effect=lambda key, trust, *_: legacy_put(key[0], key[1], trust),
             ),
         ):
             for token in ["token-A", "token-B", "token-A"]:
@@ -281,7 +281,7 @@ class TestActorExpiryEviction(TrustCacheTestCase):
         )
 
         # Force actor-1's actor-cache entry to look expired.
-        mcp_mod._actor_cache[ACTOR_ID]["last_accessed"] = (
+        mcp_mod._actor_cache.entry(ACTOR_ID).accessed_at = (
             time.time() - mcp_mod._cache_ttl - 1
         )
 
@@ -296,7 +296,7 @@ class TestActorExpiryEviction(TrustCacheTestCase):
 
     def test_scheduler_trigger_fires_cleanup(self) -> None:
         self.run_request("token-A")
-        mcp_mod._actor_cache[ACTOR_ID]["last_accessed"] = (
+        mcp_mod._actor_cache.entry(ACTOR_ID).accessed_at = (
             time.time() - mcp_mod._cache_ttl - 1
         )
         # Force the monotonic cleanup deadline to be in the past so the next
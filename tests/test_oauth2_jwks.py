@@ -1,10 +1,13 @@
 """Tests for the JWKS fetch + cache module (actingweb.oauth2_jwks)."""
 
+import threading
 import time
 from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
 
 from actingweb import oauth2_jwks
 
@@ -125,3 +128,109 @@ class TestGetKeyForKid:
             oauth2_jwks.get_key_for_kid("https://idp/keys", "miss2")
         # The debounce prevents a second forced refetch within the window.
         assert mock_get.call_count == calls_after_first
+
+
+class TestSingleFlight:
+    def test_concurrent_misses_share_one_fetch(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return _resp(200, _jwks("a"))
+
+        results: list = []
+        with patch("actingweb.oauth2_jwks.requests.get", side_effect=slow_get) as g:
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        oauth2_jwks.fetch_jwks("https://idp/keys")
+                    )
+                )
+                for _ in range(8)
+            ]
+            threads[0].start()
+            assert started.wait(5)
+            for t in threads[1:]:
+                t.start()
+            release.set()
+            for t in threads:
+                t.join(5)
+        assert g.call_count == 1
+        assert len(results) == 8
+        assert all(r is not None and r["keys"][0]["kid"] == "a" for r in results)
+
+    def test_entry_near_expiry_is_served_and_refreshed_in_background(self) -> None:
+        uri = "https://idp/keys"
+        with patch("actingweb.oauth2_jwks.requests.get") as mock_get:
+            mock_get.return_value = _resp(200, _jwks("a"))
+            oauth2_jwks.fetch_jwks(uri)
+            ts, jwks = oauth2_jwks._JWKS_CACHE[uri]
+            aged = (
+                ts - oauth2_jwks.JWKS_POSITIVE_TTL + oauth2_jwks.JWKS_REFRESH_AHEAD / 2
+            )
+            oauth2_jwks._JWKS_CACHE[uri] = (aged, jwks)
+
+            mock_get.return_value = _resp(200, _jwks("a", "b"))
+            served = oauth2_jwks.fetch_jwks(uri)
+            assert served is jwks
+            deadline = time.time() + 5
+            while oauth2_jwks._JWKS_CACHE[uri][0] == aged and time.time() < deadline:
+                time.sleep(0.01)
+        assert mock_get.call_count == 2
+        assert [k["kid"] for k in oauth2_jwks._JWKS_CACHE[uri][1]["keys"]] == [
+            "a",
+            "b",
+        ]
+        assert oauth2_jwks._JWKS_INFLIGHT == {}
+
+
+def _rsa_jwk(kid: str) -> dict:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = RSAAlgorithm.to_jwk(key.public_key(), as_dict=True)
+    jwk["kid"] = kid
+    return jwk
+
+
+class TestGetPublicKey:
+    def test_parsed_key_is_reused(self) -> None:
+        with (
+            patch("actingweb.oauth2_jwks.requests.get") as mock_get,
+            patch(
+                "actingweb.oauth2_jwks.RSAAlgorithm.from_jwk",
+                wraps=RSAAlgorithm.from_jwk,
+            ) as from_jwk,
+        ):
+            mock_get.return_value = _resp(200, {"keys": [_rsa_jwk("a")]})
+            first = oauth2_jwks.get_public_key("https://idp/keys", "a")
+            second = oauth2_jwks.get_public_key("https://idp/keys", "a")
+        assert first is not None
+        assert second is first
+        assert from_jwk.call_count == 1
+
+    def test_rotated_material_under_same_kid_is_reparsed(self) -> None:
+        uri = "https://idp/keys"
+        with patch("actingweb.oauth2_jwks.requests.get") as mock_get:
+            mock_get.return_value = _resp(200, {"keys": [_rsa_jwk("a")]})
+            first = oauth2_jwks.get_public_key(uri, "a")
+            mock_get.return_value = _resp(200, {"keys": [_rsa_jwk("a")]})
+            oauth2_jwks.fetch_jwks(uri, force=True)
+            second = oauth2_jwks.get_public_key(uri, "a")
+        assert second is not None
+        assert second.public_numbers() != first.public_numbers()
+
+    def test_refresh_drops_parsed_keys_for_retired_kids(self) -> None:
+        uri = "https://idp/keys"
+        with patch("actingweb.oauth2_jwks.requests.get") as mock_get:
+            mock_get.return_value = _resp(200, {"keys": [_rsa_jwk("a")]})
+            oauth2_jwks.get_public_key(uri, "a")
+            assert (uri, "a") in oauth2_jwks._PARSED_KEYS
+            mock_get.return_value = _resp(200, {"keys": [_rsa_jwk("b")]})
+            oauth2_jwks.fetch_jwks(uri, force=True)
+        assert (uri, "a") not in oauth2_jwks._PARSED_KEYS
+
+    def test_unknown_kid_returns_none(self) -> None:
+        with patch("actingweb.oauth2_jwks.requests.get") as mock_get:
+            mock_get.return_value = _resp(200, {"keys": [_rsa_jwk("a")]})
+            assert oauth2_jwks.get_public_key("https://idp/keys", "zzz") is None
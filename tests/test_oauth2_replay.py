@@ -106,3 +106,127 @@ class TestIdTokenReplayCache:
         assert IdTokenReplayCache._key_for_claims(
             c
         ) == IdTokenReplayCache._key_for_claims(dict(c))
+
+
+def _make_counting_config(conditional: bool = True, **settings) -> tuple[Config, dict]:
+    """Config whose attribute backend counts calls and, optionally, supports
+    ``insert_attr_if_absent``."""
+    config = _make_config()
+    for name, value in settings.items():
+        setattr(config, name, value)
+    base = config.DbAttribute.DbAttribute
+    calls: dict = {"get_attr": 0, "set_attr": 0, "insert_attr_if_absent": 0}
+    actor_ids: set = set()
+
+    class CountingDbAttribute(base):  # type: ignore[misc, valid-type]
+        def get_attr(self, actor_id, bucket, name):  # type: ignore
+            calls["get_attr"] += 1
+            return super().get_attr(actor_id, bucket, name)
+
+        def set_attr(
+            self, actor_id, bucket, name, data, timestamp=None, ttl_seconds=None
+        ):  # type: ignore
+            calls["set_attr"] += 1
+            actor_ids.add(actor_id)
+            return super().set_attr(
+                actor_id, bucket, name, data, timestamp, ttl_seconds
+            )
+
+    if conditional:
+
+        def insert_attr_if_absent(  # type: ignore
+            self, actor_id, bucket, name, data, timestamp=None, ttl_seconds=None
+        ):
+            calls["insert_attr_if_absent"] += 1
+            actor_ids.add(actor_id)
+            slot = self.storage.setdefault(f"{actor_id}:{bucket}", {})
+            if name in slot:
+                return False
+            slot[name] = {"data": data, "timestamp": timestamp}
+            return True
+
+        CountingDbAttribute.insert_attr_if_absent = insert_attr_if_absent  # type: ignore[attr-defined]
+
+    config.DbAttribute.DbAttribute = CountingDbAttribute
+    calls["actor_ids"] = actor_ids
+    return config, calls
+
+
+class TestReplayCacheWrites:
+    def test_first_sighting_is_a_single_conditional_write(self) -> None:
+        config, calls = _make_counting_config(id_token_replay_prefilter=False)
+        assert IdTokenReplayCache(config).check_and_record(_claims(jti="j1")) is True
+        assert calls["insert_attr_if_absent"] == 1
+        assert calls["get_attr"] == 0
+        assert calls["set_attr"] == 0
+
+    def test_replay_detected_by_conditional_write(self) -> None:
+        config, calls = _make_counting_config(id_token_replay_prefilter=False)
+        claims = _claims(jti="j2")
+        assert IdTokenReplayCache(config).check_and_record(claims) is True
+        assert IdTokenReplayCache(config).check_and_record(claims) is False
+        assert calls["insert_attr_if_absent"] == 2
+
+    def test_backend_without_conditional_insert_still_detects_replay(self) -> None:
+        config, calls = _make_counting_config(
+            conditional=False, id_token_replay_prefilter=False
+        )
+        claims = _claims(jti="j3")
+        assert IdTokenReplayCache(config).check_and_record(claims) is True
+        assert IdTokenReplayCache(config).check_and_record(claims) is False
+
+
+class TestReplayPrefilter:
+    def test_local_replay_rejected_without_backend_call(self) -> None:
+        config, calls = _make_counting_config()
+        claims = _claims(jti="p1")
+        assert IdTokenReplayCache(config).check_and_record(claims) is True
+        writes = calls["insert_attr_if_absent"]
+        assert IdTokenReplayCache(config).check_and_record(claims) is False
+        assert calls["insert_attr_if_absent"] == writes
+        assert calls["get_attr"] == 0
+
+    def test_prefilter_is_per_config(self) -> None:
+        claims = _claims(jti="p2")
+        assert IdTokenReplayCache(_make_config()).check_and_record(claims) is True
+        assert IdTokenReplayCache(_make_config()).check_and_record(claims) is True
+
+    def test_expired_token_is_not_remembered(self) -> None:
+        config, calls = _make_counting_config()
+        now = int(time.time())
+        claims = _claims(iat=now - 2000, exp=now - 1000, jti="p3")
+        cache = IdTokenReplayCache(config)
+        assert cache.check_and_record(claims) is True
+        assert cache.check_and_record(claims) is True
+
+
+class TestReplaySharding:
+    def test_unsharded_uses_the_system_actor(self) -> None:
+        from actingweb.constants import OAUTH2_SYSTEM_ACTOR
+
+        config, calls = _make_counting_config()
+        for i in range(20):
+            IdTokenReplayCache(config).check_and_record(_claims(jti=f"s{i}"))
+        assert calls["actor_ids"] == {OAUTH2_SYSTEM_ACTOR}
+
+    def test_keys_spread_over_shards(self) -> None:
+        from actingweb.constants import OAUTH2_SYSTEM_ACTOR
+
+        config, calls = _make_counting_config(oauth2_system_shards=4)
+        for i in range(200):
+            IdTokenReplayCache(config).check_and_record(_claims(jti=f"s{i}"))
+        assert calls["actor_ids"] == {
+            OAUTH2_SYSTEM_ACTOR,
+            f"{OAUTH2_SYSTEM_ACTOR}_1",
+            f"{OAUTH2_SYSTEM_ACTOR}_2",
+            f"{OAUTH2_SYSTEM_ACTOR}_3",
+        }
+
+    def test_replay_detected_across_shards(self) -> None:
+        config, _ = _make_counting_config(
+            oauth2_system_shards=8, id_token_replay_prefilter=False
+        )
+        for i in range(50):
+            claims = _claims(jti=f"r{i}")
+            assert IdTokenReplayCache(config).check_and_record(claims) is True
+            assert IdTokenReplayCache(config).check_and_record(claims) is False
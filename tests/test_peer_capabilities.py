@@ -1,7 +1,7 @@
 """Unit tests for PeerCapabilities class and methods/actions caching."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -10,6 +10,7 @@ from actingweb.peer_capabilities import (
     CachedCapabilitiesStore,
     CachedCapability,
     CachedPeerCapabilities,
+    CachedPeerMeta,
     PeerCapabilities,
     _parse_actions_response,
     _parse_methods_response,
@@ -26,6 +27,20 @@ class TestPeerCapabilities:
         actor.trust = MagicMock()
         return actor
 
+    @pytest.fixture(autouse=True)
+    def legacy_meta(self):
+        """A peer whose /meta does not list aw_supported (fallback endpoints)."""
+        meta = CachedPeerMeta(baseuri="https://peer.example.com/peer123", data={})
+        with (
+            patch("actingweb.peer_capabilities.get_peer_meta", return_value=meta),
+            patch(
+                "actingweb.peer_capabilities.get_peer_meta_async",
+                new_callable=AsyncMock,
+                return_value=meta,
+            ),
+        ):
+            yield meta
+
     def test_init(self, mock_actor):
         """Test PeerCapabilities initialization."""
         caps = PeerCapabilities(mock_actor, "peer123")
@@ -216,8 +231,8 @@ class TestPeerCapabilities:
         # Should handle naive datetime and treat as UTC
         assert caps._is_cache_valid() is True
 
-    @patch("actingweb.peer_capabilities.httpx.Client")
-    def test_refresh_success(self, mock_client_class, mock_actor):
+    @patch("actingweb.peer_capabilities.peer_transport.get_client")
+    def test_refresh_success(self, mock_get_client, mock_actor):
         """Test refresh() fetches capabilities successfully."""
         mock_actor.trust.get_trust.return_value = {
             "peerid": "peer123",
@@ -227,8 +242,7 @@ class TestPeerCapabilities:
 
         # Mock HTTP client and responses
         mock_client = MagicMock()
-        mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
-        mock_client_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_get_client.return_value = mock_client
 
         supported_response = MagicMock()
         supported_response.status_code = 200
@@ -272,16 +286,15 @@ class TestPeerCapabilities:
 
         assert result is False
 
-    @patch("actingweb.peer_capabilities.httpx.Client")
-    def test_refresh_http_error(self, mock_client_class, mock_actor):
+    @patch("actingweb.peer_capabilities.peer_transport.get_client")
+    def test_refresh_http_error(self, mock_get_client, mock_actor):
         """Test refresh() handles HTTP errors."""
         mock_actor.trust.get_trust.return_value = {
             "baseuri": "https://peer.example.com/peer123",
         }
 
         mock_client = MagicMock()
-        mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
-        mock_client_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_get_client.return_value = mock_client
 
         error_response = MagicMock()
         error_response.status_code = 500
@@ -292,8 +305,8 @@ class TestPeerCapabilities:
 
         assert result is False
 
-    @patch("actingweb.peer_capabilities.httpx.Client")
-    def test_refresh_network_error(self, mock_client_class, mock_actor):
+    @patch("actingweb.peer_capabilities.peer_transport.get_client")
+    def test_refresh_network_error(self, mock_get_client, mock_actor):
         """Test refresh() handles network errors."""
         import httpx
 
@@ -302,8 +315,7 @@ class TestPeerCapabilities:
         }
 
         mock_client = MagicMock()
-        mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
-        mock_client_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_get_client.return_value = mock_client
         mock_client.get.side_effect = httpx.RequestError("Network error")
 
         caps = PeerCapabilities(mock_actor, "peer123")
@@ -311,10 +323,8 @@ class TestPeerCapabilities:
 
         assert result is False
 
-    @patch("actingweb.peer_capabilities.httpx.Client")
-    def test_refresh_version_fetch_fails_gracefully(
-        self, mock_client_class, mock_actor
-    ):
+    @patch("actingweb.peer_capabilities.peer_transport.get_client")
+    def test_refresh_version_fetch_fails_gracefully(self, mock_get_client, mock_actor):
         """Test refresh() handles version fetch failure gracefully."""
         mock_actor.trust.get_trust.return_value = {
             "baseuri": "https://peer.example.com/peer123",
@@ -322,8 +332,7 @@ class TestPeerCapabilities:
         mock_actor.trust.modify_trust.return_value = True
 
         mock_client = MagicMock()
-        mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
-        mock_client_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_get_client.return_value = mock_client
 
         supported_response = MagicMock()
         supported_response.status_code = 200
@@ -343,6 +352,22 @@ class TestPeerCapabilities:
         assert call_args[1]["aw_supported"] == "subscriptionbatch"
         assert call_args[1]["aw_version"] is None
 
+    @patch("actingweb.peer_capabilities.peer_transport.get_client")
+    def test_refresh_from_meta(self, mock_get_client, mock_actor, legacy_meta):
+        """Test refresh() takes aw_supported/aw_version from the cached /meta."""
+        mock_actor.trust.get_trust.return_value = {
+            "baseuri": "https://peer.example.com/peer123",
+        }
+        legacy_meta.data = {"aw_supported": "subscriptionbatch", "aw_version": "1.4"}
+
+        caps = PeerCapabilities(mock_actor, "peer123")
+        assert caps.refresh() is True
+
+        mock_get_client.assert_not_called()
+        call_args = mock_actor.trust.modify_trust.call_args
+        assert call_args[1]["aw_supported"] == "subscriptionbatch"
+        assert call_args[1]["aw_version"] == "1.4"
+
     def test_ensure_loaded_valid_cache(self, mock_actor):
         """Test ensure_loaded() does not refresh with valid cache."""
         now = datetime.now(UTC)
@@ -415,11 +440,26 @@ class TestPeerCapabilitiesAsync:
         actor.trust = MagicMock()
         return actor
 
-    @patch("actingweb.peer_capabilities.httpx.AsyncClient")
-    async def test_refresh_async_success(self, mock_client_class, mock_actor):
+    @pytest.fixture(autouse=True)
+    def legacy_meta(self):
+        """A peer whose /meta does not list aw_supported (fallback endpoints)."""
+        meta = CachedPeerMeta(baseuri="https://peer.example.com/peer123", data={})
+        with (
+            patch("actingweb.peer_capabilities.get_peer_meta", return_value=meta),
+            patch(
+                "actingweb.peer_capabilities.get_peer_meta_async",
+                new_callable=AsyncMock,
+                return_value=meta,
+            ),
+        ):
+            yield meta
+
+    @patch(
+        "actingweb.peer_capabilities.peer_transport.get_async_client",
+        new_callable=AsyncMock,
+    )
+    async def test_refresh_async_success(self, mock_get_client, mock_actor):
         """Test refresh_async() fetches capabilities successfully."""
-        from unittest.mock import AsyncMock
-
         mock_actor.trust.get_trust.return_value = {
             "peerid": "peer123",
             "baseuri": "https://peer.example.com/peer123",
@@ -437,10 +477,8 @@ class TestPeerCapabilitiesAsync:
         version_response.status_code = 200
         version_response.text = "1.4"
 
-        # Setup async context manager with AsyncMock
         mock_client.get = AsyncMock(side_effect=[supported_response, version_response])
-        mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client
 
         caps = PeerCapabilities(mock_actor, "peer123")
         result = await caps.refresh_async()
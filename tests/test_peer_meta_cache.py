@@ -0,0 +1,247 @@
+"""Tests for the peer /meta cache (``peer_capabilities.get_peer_meta``)."""
+
+import time
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from actingweb import peer_capabilities
+from actingweb.peer_capabilities import (
+    PEER_META_STALE_TTL,
+    PEER_META_TTL,
+    CachedCapabilitiesStore,
+    _cache_lifetime,
+    get_peer_meta,
+    get_peer_meta_async,
+)
+
+BASEURI = "https://peer.example.com/peer123"
+META = {"id": "peer123", "type": "urn:actingweb:example", "aw_supported": "trust"}
+
+
+class FakeBucket:
+    def __init__(self) -> None:
+        self.rows: dict[str, dict[str, Any]] = {}
+
+    def get_attr(self, name: str) -> dict[str, Any] | None:
+        return self.rows.get(name)
+
+    def set_attr(self, name: str, data: Any, ttl_seconds: int | None = None) -> bool:
+        self.rows[name] = {"data": data, "ttl": ttl_seconds}
+        return True
+
+    def delete_attr(self, name: str) -> bool:
+        return self.rows.pop(name, None) is not None
+
+
+class Peer:
+    """Answers /meta with ``responses`` in turn (the last one repeats)."""
+
+    def __init__(self, *responses: httpx.Response) -> None:
+        self.responses = list(responses)
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self.responses[min(len(self.requests), len(self.responses)) - 1]
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=response.content
+        )
+
+
+@pytest.fixture
+def store() -> Iterator[CachedCapabilitiesStore]:
+    store = CachedCapabilitiesStore(SimpleNamespace(store_cache_max_entries=100))  # type: ignore[arg-type]
+    bucket = FakeBucket()
+    with (
+        patch.object(store, "_get_meta_bucket", return_value=bucket),
+        patch.object(peer_capabilities, "_meta_store", return_value=store),
+    ):
+        yield store
+
+
+def serve(peer: Peer) -> Any:
+    return patch.object(
+        peer_capabilities.peer_transport,
+        "get_client",
+        return_value=httpx.Client(transport=httpx.MockTransport(peer)),
+    )
+
+
+def wait_for(condition: Any) -> None:
+    deadline = time.time() + 5
+    while not condition():
+        assert time.time() < deadline, "background refresh did not finish"
+        time.sleep(0.01)
+
+
+def age(store: CachedCapabilitiesStore, seconds: float) -> None:
+    """Move the cached entry ``seconds`` into the past."""
+    meta = store.get_peer_meta(BASEURI)
+    assert meta is not None
+    meta.fetched_at -= seconds
+    meta.expires_at -= seconds
+    meta.stale_until -= seconds
+    store.store_peer_meta(meta)
+
+
+class TestCacheLifetime:
+    def test_defaults_without_headers(self) -> None:
+        assert _cache_lifetime(httpx.Headers(), 0) == (
+            PEER_META_TTL,
+            PEER_META_STALE_TTL,
+        )
+
+    def test_cache_control(self) -> None:
+        headers = httpx.Headers(
+            {"Cache-Control": "public, max-age=60, stale-while-revalidate=30"}
+        )
+        assert _cache_lifetime(headers, 0) == (60.0, 30.0)
+        assert _cache_lifetime(httpx.Headers({"Cache-Control": "no-store"}), 0) is None
+        assert _cache_lifetime(httpx.Headers({"Cache-Control": "no-cache"}), 0) == (
+            0.0,
+            0.0,
+        )
+        headers = httpx.Headers({"Cache-Control": "max-age=10, must-revalidate"})
+        assert _cache_lifetime(headers, 0) == (10.0, 0.0)
+
+    def test_expires_relative_to_date(self) -> None:
+        headers = httpx.Headers(
+            {
+                "Date": "Mon, 19 Oct 2026 10:00:00 GMT",
+                "Expires": "Mon, 19 Oct 2026 10:02:00 GMT",
+            }
+        )
+        assert _cache_lifetime(headers, 0)[0] == 120.0  # type: ignore[index]
+        assert _cache_lifetime(httpx.Headers({"Expires": "0"}), 0)[0] == 0.0  # type: ignore[index]
+
+
+class TestGetPeerMeta:
+    def test_fresh_meta_is_served_from_cache(
+        self, store: CachedCapabilitiesStore
+    ) -> None:
+        peer = Peer(httpx.Response(200, json=META))
+        with serve(peer):
+            first = get_peer_meta(BASEURI + "/", None)
+            second = get_peer_meta(BASEURI, None)
+        assert first.data == second.data == META
+        assert len(peer.requests) == 1
+        assert str(peer.requests[0].url) == BASEURI + "/meta"
+
+    def test_meta_is_shared_through_the_store(
+        self, store: CachedCapabilitiesStore
+    ) -> None:
+        with serve(Peer(httpx.Response(200, json=META))):
+            get_peer_meta(BASEURI, None)
+        # Another worker: nothing in its local cache, the row is persisted
+        store._meta_cache.clear()
+        peer = Peer(httpx.Response(500))
+        with serve(peer):
+            assert get_peer_meta(BASEURI, None).data == META
+        assert peer.requests == []
+
+    def test_stale_meta_is_served_while_revalidating(
+        self, store: CachedCapabilitiesStore
+    ) -> None:
+        peer = Peer(
+            httpx.Response(200, json=META, headers={"ETag": '"v1"'}),
+            httpx.Response(304, headers={"ETag": '"v1"'}),
+        )
+        with serve(peer):
+            get_peer_meta(BASEURI, None)
+            age(store, PEER_META_TTL + 1)
+            stale = get_peer_meta(BASEURI, None)
+            assert stale.data == META and not stale.is_fresh()
+            wait_for(lambda: not peer_capabilities._meta_inflight)
+        assert len(peer.requests) == 2
+        assert peer.requests[1].headers["If-None-Match"] == '"v1"'
+        refreshed = store.get_peer_meta(BASEURI)
+        assert refreshed is not None and refreshed.is_fresh()
+        assert refreshed.data == META
+
+    def test_unusable_meta_is_fetched_before_returning(
+        self, store: CachedCapabilitiesStore
+    ) -> None:
+        changed = {**META, "aw_supported": "trust,subscriptionbatch"}
+        peer = Peer(
+            httpx.Response(200, json=META, headers={"Cache-Control": "max-age=5"}),
+            httpx.Response(200, json=changed),
+        )
+        with serve(peer):
+            get_peer_meta(BASEURI, None)
+            age(store, PEER_META_STALE_TTL + 10)
+            assert get_peer_meta(BASEURI, None).data == changed
+
+    def test_uncacheable_responses_are_not_stored(
+        self, store: CachedCapabilitiesStore
+    ) -> None:
+        peer = Peer(
+            httpx.Response(404, json={"error": "not found"}),
+            httpx.Response(200, json=META, headers={"Cache-Control": "no-store"}),
+        )
+        with serve(peer):
+            assert get_peer_meta(BASEURI, None).status_code == 404
+            assert get_peer_meta(BASEURI, None).data == META
+            get_peer_meta(BASEURI, None)
+        assert len(peer.requests) == 3
+        assert store.get_peer_meta(BASEURI) is None
+
+    def test_errors_are_raised(self, store: CachedCapabilitiesStore) -> None:
+        with serve(Peer(httpx.Response(200, content=b"<html>"))):
+            with pytest.raises(ValueError):
+                get_peer_meta(BASEURI, None)
+
+    def test_delete_peer_meta(self, store: CachedCapabilitiesStore) -> None:
+        with serve(Peer(httpx.Response(200, json=META))):
+            get_peer_meta(BASEURI, None)
+        assert store.delete_peer_meta(BASEURI) is True
+        assert store.get_peer_meta(BASEURI) is None
+
+
+class TestGetPeerInfo:
+    def test_message_is_the_response_body(self, store: CachedCapabilitiesStore) -> None:
+        from actingweb.actor import Actor
+
+        body = b'{"id": "peer123",  "type": "urn:actingweb:example"}'
+        peer = Peer(
+            httpx.Response(200, content=body, headers={"ETag": '"v1"'}),
+            httpx.Response(304, headers={"ETag": '"v1"'}),
+        )
+        actor = SimpleNamespace(config=None)
+        with serve(peer):
+            first = Actor.get_peer_info(actor, BASEURI)  # type: ignore[arg-type]
+            cached = Actor.get_peer_info(actor, BASEURI)  # type: ignore[arg-type]
+            age(store, PEER_META_STALE_TTL + PEER_META_TTL + 1)
+            revalidated = Actor.get_peer_info(actor, BASEURI)  # type: ignore[arg-type]
+        assert len(peer.requests) == 2
+        for info in (first, cached, revalidated):
+            assert info["last_response_code"] == 200
+            assert info["last_response_message"] == body
+            assert info["data"]["id"] == "peer123"
+
+
+class TestGetPeerMetaAsync:
+    async def test_stale_meta_is_refreshed_in_a_task(
+        self, store: CachedCapabilitiesStore
+    ) -> None:
+        changed = {**META, "type": "urn:actingweb:other"}
+        peer = Peer(httpx.Response(200, json=META), httpx.Response(200, json=changed))
+        client = httpx.AsyncClient(transport=httpx.MockTransport(peer))
+        with patch.object(
+            peer_capabilities.peer_transport,
+            "get_async_client",
+            new_callable=AsyncMock,
+            return_value=client,
+        ):
+            assert (await get_peer_meta_async(BASEURI, None)).data == META
+            assert (await get_peer_meta_async(BASEURI, None)).data == META
+            age(store, PEER_META_TTL + 1)
+            assert (await get_peer_meta_async(BASEURI, None)).data == META
+            for task in list(peer_capabilities._meta_tasks):
+                await task
+            assert (await get_peer_meta_async(BASEURI, None)).data == changed
+        assert len(peer.requests) == 2
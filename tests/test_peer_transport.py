@@ -0,0 +1,97 @@
+"""Tests for the shared peer HTTP transport (``actingweb.peer_transport``)."""
+
+import asyncio
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from actingweb import peer_transport
+
+
+@pytest.fixture(autouse=True)
+def fresh_transport() -> Iterator[None]:
+    peer_transport.configure(peer_transport.TransportSettings())
+    yield
+    peer_transport.close_clients()
+
+
+def _recording_transport(seen: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(204)
+
+    return httpx.MockTransport(handler)
+
+
+class TestSettings:
+    def test_limits_come_from_environment(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("ACTINGWEB_PEER_HTTP_MAX_CONNECTIONS", "7")
+        monkeypatch.setenv("ACTINGWEB_PEER_HTTP_MAX_KEEPALIVE", "3")
+        monkeypatch.setenv("ACTINGWEB_PEER_HTTP_KEEPALIVE_EXPIRY", "2.5")
+        monkeypatch.setenv("ACTINGWEB_PEER_HTTP2", "false")
+        settings = peer_transport.TransportSettings.from_env()
+        assert settings == peer_transport.TransportSettings(7, 3, 2.5, False)
+
+    def test_http2_needs_h2(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(peer_transport.importlib.util, "find_spec", lambda n: None)
+        assert peer_transport.TransportSettings.from_env().http2 is False
+
+    def test_timeouts(self):
+        assert peer_transport.to_timeout(None) == peer_transport.DEFAULT_TIMEOUT
+        assert peer_transport.to_timeout(3) == httpx.Timeout(3.0)
+        # (connect, read) like requests
+        timeout = peer_transport.to_timeout((2, 9))
+        assert (timeout.connect, timeout.read) == (2.0, 9.0)
+
+
+class TestSyncClient:
+    def test_client_is_shared_until_closed(self):
+        client = peer_transport.get_client()
+        assert peer_transport.get_client() is client
+        peer_transport.close_clients()
+        assert client.is_closed
+        assert peer_transport.get_client() is not client
+
+    def test_client_is_recreated_after_fork(self, monkeypatch: pytest.MonkeyPatch):
+        client = peer_transport.get_client()
+        monkeypatch.setattr(peer_transport, "_client_pid", -1)
+        assert peer_transport.get_client() is not client
+        client.close()
+
+    def test_requests_style_arguments(self, monkeypatch: pytest.MonkeyPatch):
+        seen: list[httpx.Request] = []
+        client = httpx.Client(transport=_recording_transport(seen))
+        monkeypatch.setattr(peer_transport, "get_client", lambda: client)
+
+        peer_transport.post(
+            "https://peer.example.com/callbacks",
+            data='{"a": 1}',
+            headers={"Content-Type": "application/json"},
+            timeout=(5, 20),
+        )
+        peer_transport.put("https://peer.example.com/p", json={"b": 2})
+        peer_transport.delete("https://peer.example.com/p")
+
+        assert [r.method for r in seen] == ["POST", "PUT", "DELETE"]
+        assert seen[0].content == b'{"a": 1}'
+        assert seen[0].extensions["timeout"]["read"] == 20.0
+        assert seen[1].content == b'{"b":2}'
+
+
+class TestAsyncClient:
+    async def test_client_is_shared_per_loop(self):
+        client = await peer_transport.get_async_client()
+        assert await peer_transport.get_async_client() is client
+        await peer_transport.close_async_client()
+        assert client.is_closed
+
+    def test_each_loop_gets_its_own_client(self):
+        async def get_and_close() -> httpx.AsyncClient:
+            client = await peer_transport.get_async_client()
+            await peer_transport.close_async_client()
+            return client
+
+        first = asyncio.run(get_and_close())
+        second = asyncio.run(get_and_close())
+        assert first is not second
@@ -0,0 +1,229 @@
+"""Memoized effective permissions in PermissionEvaluator.
+
+``_get_effective_permissions`` resolves override -> trust row -> trust type ->
+merge once per (actor, peer) and caches the outcome, "no trust" included.
+These tests pin when the cache must be bypassed or dropped.
+"""
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from actingweb import permission_evaluator as pe
+from actingweb.cache import actor_generations
+from actingweb.permission_evaluator import (
+    PermissionEvaluator,
+    PermissionResult,
+    PermissionType,
+    invalidate_effective_permissions,
+)
+
+FRIEND_PERMS = {"tools": {"allowed": ["search"], "denied": []}}
+
+
+class FakeRegistry:
+    def __init__(self) -> None:
+        self.version = 0
+        self.types = {"friend": SimpleNamespace(base_permissions=FRIEND_PERMS)}
+        self.lookups = 0
+
+    def get_type(self, name: str) -> Any:
+        self.lookups += 1
+        return self.types.get(name)
+
+
+class FakeStore:
+    def __init__(self) -> None:
+        self.overrides: dict[tuple[str, str], Any] = {}
+        self.reads = 0
+
+    def get_permissions(self, actor_id: str, peer_id: str) -> Any:
+        self.reads += 1
+        return self.overrides.get((actor_id, peer_id))
+
+
+class FakeDbTrust:
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str], dict[str, Any]] = {}
+        self.reads = 0
+        self.fail = False
+
+    def get(self, actor_id: str, peerid: str) -> dict[str, Any] | None:
+        self.reads += 1
+        if self.fail:
+            raise RuntimeError("db down")
+        return self.rows.get((actor_id, peerid))
+
+
+class SharedAttributes:
+    """actingweb.attribute.Attributes over one in-memory table."""
+
+    rows: dict[tuple[str, str, str], dict[str, Any]] = {}
+
+    def __init__(self, actor_id: str, bucket: str, config: Any) -> None:
+        self.key = (actor_id, bucket)
+        self.data: dict[str, Any] = {}
+
+    def get_attr(self, name: str) -> dict[str, Any] | None:
+        return self.rows.get((*self.key, name))
+
+    def insert_attr_if_absent(self, name: str, data: Any) -> bool:
+        return self.rows.setdefault((*self.key, name), {"data": data})["data"] is data
+
+    def conditional_update_attr(self, name: str, old_data: Any, new_data: Any) -> bool:
+        current = self.rows.get((*self.key, name))
+        if current is None or current["data"] != old_data:
+            return False
+        self.rows[(*self.key, name)] = {"data": new_data}
+        return True
+
+
+@pytest.fixture
+def env() -> Iterator[SimpleNamespace]:
+    registry, store, db = FakeRegistry(), FakeStore(), FakeDbTrust()
+    config = Mock()
+    with (
+        patch.object(pe, "get_trust_type_registry", return_value=registry),
+        patch.object(pe, "get_trust_permission_store", return_value=store),
+        patch.object(pe, "get_trust", return_value=db),
+    ):
+        evaluator = PermissionEvaluator(config)
+        yield SimpleNamespace(
+            evaluator=evaluator, registry=registry, store=store, db=db
+        )
+
+
+def _check(evaluator: PermissionEvaluator, tool: str = "search") -> PermissionResult:
+    return evaluator.evaluate_permission("a1", "p1", PermissionType.TOOLS, tool)
+
+
+class TestEffectivePermissionCache:
+    def test_repeat_evaluations_resolve_once(self, env: SimpleNamespace) -> None:
+        env.db.rows[("a1", "p1")] = {"relationship": "friend"}
+        for _ in range(20):
+            assert _check(env.evaluator) == PermissionResult.ALLOWED
+        assert env.db.reads == 1
+        assert env.store.reads == 1
+        assert env.registry.lookups == 1
+        stats = env.evaluator.cache_stats()
+        assert stats["hits"] == 19
+        assert stats["hit_rate"] == pytest.approx(19 / 20)
+
+    def test_no_trust_is_cached_too(self, env: SimpleNamespace) -> None:
+        for _ in range(5):
+            assert _check(env.evaluator) == PermissionResult.NOT_FOUND
+        assert env.db.reads == 1
+
+    def test_lookup_failure_is_not_cached(self, env: SimpleNamespace) -> None:
+        env.db.fail = True
+        assert _check(env.evaluator) == PermissionResult.NOT_FOUND
+        env.db.fail = False
+        env.db.rows[("a1", "p1")] = {"relationship": "friend"}
+        assert _check(env.evaluator) == PermissionResult.ALLOWED
+
+    def test_registry_version_change_re_resolves(self, env: SimpleNamespace) -> None:
+        env.db.rows[("a1", "p1")] = {"relationship": "friend"}
+        assert _check(env.evaluator) == PermissionResult.ALLOWED
+
+        env.registry.types["friend"] = SimpleNamespace(
+            base_permissions={"tools": {"allowed": [], "denied": ["search"]}}
+        )
+        env.registry.version += 1
+        assert _check(env.evaluator) == PermissionResult.DENIED
+        assert env.evaluator.cache_stats()["stale_hits"] == 1
+
+    def test_actor_invalidation_re_resolves(self, env: SimpleNamespace) -> None:
+        assert _check(env.evaluator) == PermissionResult.NOT_FOUND
+        env.db.rows[("a1", "p1")] = {"relationship": "friend"}
+        env.evaluator.invalidate_actor("a1")
+        assert _check(env.evaluator) == PermissionResult.ALLOWED
+
+    def test_unversioned_registry_disables_caching(self, env: SimpleNamespace) -> None:
+        env.registry.version = Mock()
+        env.db.rows[("a1", "p1")] = {"relationship": "friend"}
+        _check(env.evaluator)
+        _check(env.evaluator)
+        assert env.db.reads == 2
+
+
+class TestInvalidationHook:
+    def test_module_hook_targets_the_singleton(self, env: SimpleNamespace) -> None:
+        env.db.rows[("a1", "p1")] = {"relationship": "friend"}
+        _check(env.evaluator)
+        with patch.object(pe, "_permission_evaluator", env.evaluator):
+            assert invalidate_effective_permissions("a1") == 1
+        _check(env.evaluator)
+        assert env.db.reads == 2
+
+    def test_module_hook_without_evaluator_is_a_noop(self) -> None:
+        with patch.object(pe, "_permission_evaluator", None):
+            assert invalidate_effective_permissions("a1") == 0
+
+    def test_override_write_invalidates(self, env: SimpleNamespace) -> None:
+        from actingweb.trust_permissions import TrustPermissions, TrustPermissionStore
+
+        env.db.rows[("a1", "p1")] = {"relationship": "friend"}
+        assert _check(env.evaluator) == PermissionResult.ALLOWED
+
+        store = TrustPermissionStore(Mock())
+        bucket = Mock()
+        bucket.set_attr.return_value = True
+        override = TrustPermissions(
+            actor_id="a1",
+            peer_id="p1",
+            trust_type="friend",
+            tools={"allowed": [], "denied": ["search"]},
+        )
+        with (
+            patch.object(store, "_get_permissions_bucket", return_value=bucket),
+            patch.object(pe, "_permission_evaluator", env.evaluator),
+        ):
+            assert store.store_permissions(override)
+        env.store.overrides[("a1", "p1")] = override
+        assert _check(env.evaluator) == PermissionResult.DENIED
+
+
+class TestTrustWrites:
+    """Trust writes reach the effective permissions memo of other workers."""
+
+    @pytest.fixture(autouse=True)
+    def shared_db(self) -> Iterator[None]:
+        SharedAttributes.rows = {}
+        with patch("actingweb.attribute.Attributes", SharedAttributes):
+            yield
+
+    @staticmethod
+    def _coherent_config() -> Any:
+        return MagicMock(cache_coherence=True, cache_coherence_ttl=60)
+
+    def test_deleted_trust_reaches_the_other_worker(self, env: SimpleNamespace) -> None:
+        env.evaluator.config = self._coherent_config()
+        env.db.rows[("a1", "p1")] = {"relationship": "friend"}
+        assert _check(env.evaluator) == PermissionResult.ALLOWED
+
+        # Another worker (no evaluator there) deletes the relationship
+        del env.db.rows[("a1", "p1")]
+        with patch.object(pe, "_permission_evaluator", None):
+            invalidate_effective_permissions("a1", self._coherent_config())
+        assert _check(env.evaluator) == PermissionResult.ALLOWED  # within the TTL
+
+        generations = actor_generations(env.evaluator.config)
+        assert generations is not None
+        generations._remote.entry("a1").stored_at -= 61  # type: ignore[union-attr]
+        assert _check(env.evaluator) == PermissionResult.NOT_FOUND
+
+    def test_trust_modify_invalidates_on_approval_changes(self) -> None:
+        from actingweb.trust import Trust
+
+        config = self._coherent_config()
+        relationship = Trust(actor_id="a1", config=None)
+        relationship.config = config
+        relationship.handle = Mock(**{"modify.return_value": True})
+        with patch.object(pe, "invalidate_effective_permissions") as invalidate:
+            assert relationship.modify(last_accessed="2026-01-01T00:00:00")
+            invalidate.assert_not_called()
+            assert relationship.modify(approved=False)
+            invalidate.assert_called_once_with("a1", config)
@@ -0,0 +1,153 @@
+"""Compiled pattern matchers must agree with the per-pattern matchers they replace."""
+
+import fnmatch
+import random
+import re
+from unittest.mock import Mock, patch
+
+import pytest
+
+from actingweb import permission_evaluator as pe
+from actingweb.permission_evaluator import PermissionEvaluator, PermissionResult
+from actingweb.permission_patterns import compile_patterns, glob_to_regex
+
+PATTERNS = [
+    "memory_*",
+    "profile/?",
+    "notes://",
+    "exact_name",
+    "*_user",
+    "a*b?c",
+    "sys.*",
+    "x[1]",
+    "",
+]
+
+TARGETS = [
+    "memory_",
+    "memory_travel",
+    "profile/a",
+    "profile/ab",
+    "notes://work/projects",
+    "notes:/",
+    "exact_name",
+    "exact_name\n",
+    "exact_namex",
+    "delete_user",
+    "axxbyc",
+    "abc",
+    "sys.x",
+    "sysx",
+    "x[1]",
+    "x1",
+    "",
+    "memory_\nx",
+    "line\n_user",
+]
+
+
+def _per_pattern(target: str, pattern: str) -> bool:
+    """The evaluator's original single-pattern semantics."""
+    if pattern == "*" or pattern == target:
+        return True
+    if pattern.endswith("://") and target.startswith(pattern):
+        return True
+    return bool(re.compile(glob_to_regex(pattern)).match(target))
+
+
+class TestEvaluatorDialect:
+    @pytest.mark.parametrize("target", TARGETS)
+    def test_agrees_with_per_pattern_loop(self, target: str) -> None:
+        expected = any(_per_pattern(target, p) for p in PATTERNS)
+        assert compile_patterns(PATTERNS).matches(target) is expected
+
+    def test_reports_which_pattern_matched(self) -> None:
+        matcher = compile_patterns(PATTERNS)
+        assert matcher.match("memory_travel") == "memory_*"
+        assert matcher.match("profile/a") == "profile/?"
+        assert matcher.match("notes://work") == "notes://"
+        assert matcher.match("axxbyc") == "a*b?c"
+        assert matcher.match("nothing") is None
+
+    def test_star_matches_everything(self) -> None:
+        assert compile_patterns(["foo", "*"]).match("anything") == "*"
+
+    def test_compiled_once_per_list(self) -> None:
+        assert compile_patterns(["a*", "b"]) is compile_patterns(("a*", "b"))
+
+    def test_random_lists_agree(self) -> None:
+        rng = random.Random(1234)
+        alphabet = "ab/*?.:\n"
+        for _ in range(300):
+            patterns = [
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 5)))
+                for _ in range(rng.randint(1, 6))
+            ]
+            matcher = compile_patterns(patterns)
+            for _ in range(10):
+                target = "".join(
+                    rng.choice("ab/.:\n") for _ in range(rng.randint(0, 6))
+                )
+                expected = any(_per_pattern(target, p) for p in patterns)
+                assert matcher.matches(target) is expected, (patterns, target)
+
+
+class TestFnmatchDialect:
+    @pytest.mark.parametrize("target", TARGETS)
+    def test_agrees_with_fnmatch(self, target: str) -> None:
+        patterns = [p for p in PATTERNS if p] + ["x[0-9]", "[!m]*"]
+        expected = any(fnmatch.fnmatch(target, p) for p in patterns)
+        assert compile_patterns(patterns, fnmatch=True).matches(target) is expected
+
+    def test_peer_permissions_use_compiled_lists(self) -> None:
+        from actingweb.peer_permissions import PeerPermissions
+
+        perm = PeerPermissions(
+            actor_id="a1",
+            peer_id="p1",
+            properties={
+                "patterns": ["memory_*"],
+                "operations": ["read"],
+                "excluded_patterns": ["memory_secret*"],
+            },
+            tools={"allowed": ["search", "fetch_?"], "denied": ["fetch_x"]},
+        )
+        assert perm.has_property_access("memory_travel", "read") is True
+        assert perm.has_property_access("memory_secret_x", "read") is False
+        assert perm.has_property_access("profile", "read") is None
+        assert perm.has_tool_access("fetch_a") is True
+        assert perm.has_tool_access("fetch_x") is False
+        assert perm.has_tool_access("other") is None
+
+
+class TestBulkEvaluation:
+    def test_bulk_matches_single_evaluations(self) -> None:
+        rules = {
+            "properties": {
+                "patterns": ["public/*", "memory_*", "profile/?"],
+                "operations": ["read"],
+                "excluded_patterns": ["memory_private*"],
+            }
+        }
+        with (
+            patch.object(pe, "get_trust_type_registry"),
+            patch.object(pe, "get_trust_permission_store"),
+        ):
+            evaluator = PermissionEvaluator(Mock())
+        paths = [
+            "public/a",
+            "memory_travel",
+            "memory_private_x",
+            "profile/a",
+            "profile/ab",
+            "secret",
+        ]
+        with patch.object(evaluator, "_get_effective_permissions", return_value=rules):
+            bulk = evaluator.evaluate_bulk_property_access("a1", "p1", paths, "read")
+            single = {
+                p: evaluator.evaluate_property_access("a1", "p1", p, "read")
+                for p in paths
+            }
+        assert bulk == single
+        assert bulk["memory_private_x"] == PermissionResult.DENIED
+        assert bulk["profile/a"] == PermissionResult.ALLOWED
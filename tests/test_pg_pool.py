@@ -0,0 +1,187 @@
+"""Unit tests for PostgreSQL pool settings, checkout metrics and health checks.
+
+The pool is faked, so these run without a database; the saturation benchmark
+against a real server is ``tests/performance/test_pg_pool_saturation.py``.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("psycopg", reason="PostgreSQL extra not installed")
+
+from psycopg_pool import PoolTimeout  # noqa: E402
+
+from actingweb.db.postgresql import connection  # noqa: E402
+from actingweb.db.postgresql.connection import PoolSettings  # noqa: E402
+
+_POOL_ENV = (
+    "PG_POOL_MIN_SIZE",
+    "PG_POOL_MAX_SIZE",
+    "PG_POOL_TIMEOUT",
+    "PG_POOL_MAX_WAITING",
+    "PG_POOL_MAX_IDLE",
+    "PG_POOL_MAX_LIFETIME",
+    "PG_POOL_CHECK_ON_CHECKOUT",
+    "PG_POOL_HEALTH_CHECK_INTERVAL",
+    "PG_PREPARE_THRESHOLD",
+    "PG_STATEMENT_TIMEOUT_MS",
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_state(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    for name in _POOL_ENV:
+        monkeypatch.delenv(name, raising=False)
+    connection.reset_pool_metrics()
+    yield
+    connection.reset_pool_metrics()
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.executed: list[str] = []
+
+    def execute(self, query: str) -> None:
+        self.executed.append(query)
+
+
+class FakePool:
+    """Hands out one connection, or times out when ``exhausted``."""
+
+    def __init__(self) -> None:
+        self.conn = FakeConnection()
+        self.exhausted = False
+        self.checks = 0
+
+    @contextmanager
+    def connection(self, timeout: float | None = None) -> Iterator[FakeConnection]:
+        if self.exhausted:
+            raise PoolTimeout("couldn't get a connection after 0.01 sec")
+        yield self.conn
+
+    def check(self) -> None:
+        self.checks += 1
+
+    def get_stats(self) -> dict[str, int]:
+        return {"pool_size": 1}
+
+
+class TestPoolSettings:
+    def test_defaults(self) -> None:
+        settings = PoolSettings.from_env()
+        assert settings == PoolSettings()
+        assert settings.connection_kwargs() == {"prepare_threshold": 5}
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PG_POOL_MIN_SIZE", "4")
+        monkeypatch.setenv("PG_POOL_MAX_SIZE", "40")
+        monkeypatch.setenv("PG_POOL_MAX_IDLE", "30")
+        monkeypatch.setenv("PG_POOL_MAX_LIFETIME", "900")
+        monkeypatch.setenv("PG_POOL_CHECK_ON_CHECKOUT", "false")
+        monkeypatch.setenv("PG_PREPARE_THRESHOLD", "none")
+        monkeypatch.setenv("PG_STATEMENT_TIMEOUT_MS", "2500")
+        settings = PoolSettings.from_env()
+        assert (settings.min_size, settings.max_size) == (4, 40)
+        assert (settings.max_idle, settings.max_lifetime) == (30.0, 900.0)
+        assert settings.check_on_checkout is False
+        assert settings.connection_kwargs() == {
+            "prepare_threshold": None,
+            "options": "-c statement_timeout=2500",
+        }
+
+    def test_rejects_max_below_min(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PG_POOL_MIN_SIZE", "5")
+        monkeypatch.setenv("PG_POOL_MAX_SIZE", "2")
+        with pytest.raises(ValueError):
+            PoolSettings.from_env()
+
+    def test_get_pool_applies_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PG_POOL_MAX_SIZE", "25")
+        monkeypatch.setenv("PG_POOL_CHECK_ON_CHECKOUT", "0")
+        monkeypatch.setenv("PG_POOL_HEALTH_CHECK_INTERVAL", "0")
+        monkeypatch.setenv("PG_PREPARE_THRESHOLD", "none")
+        monkeypatch.setattr(connection, "_pool", None)
+        monkeypatch.setattr(connection, "_pool_schema", None)
+        with mock.patch.object(connection, "ConnectionPool") as pool_class:
+            connection.get_pool()
+        kwargs: dict[str, Any] = pool_class.call_args.kwargs
+        assert kwargs["max_size"] == 25
+        assert kwargs["check"] is None
+        assert kwargs["kwargs"] == {"prepare_threshold": None}
+        assert connection.pool_metrics()["settings"]["max_size"] == 25
+        monkeypatch.setattr(connection, "_pool", None)
+
+
+class TestCheckoutMetrics:
+    def test_checkouts_are_counted_per_family(self) -> None:
+        pool = FakePool()
+        with mock.patch.object(connection, "get_pool", return_value=pool):
+            for _ in range(3):
+                with connection.get_connection() as conn:
+                    assert conn is pool.conn
+            with connection.get_connection("trust"):
+                pass
+
+        families = connection.pool_metrics()["families"]
+        # Unnamed checkouts are attributed to the calling module
+        assert families["test_pg_pool"]["checkouts"] == 3
+        assert families["trust"]["checkouts"] == 1
+        assert families["trust"]["timeouts"] == 0
+        assert families["trust"]["held_ms_total"] >= 0.0
+
+    def test_timeouts_are_counted_and_reraised(self) -> None:
+        pool = FakePool()
+        pool.exhausted = True
+        with mock.patch.object(connection, "get_pool", return_value=pool):
+            with pytest.raises(PoolTimeout):
+                with connection.get_connection("property"):
+                    pass
+
+        stats = connection.pool_metrics()["families"]["property"]
+        assert (stats["checkouts"], stats["timeouts"]) == (0, 1)
+
+    def test_errors_in_the_block_still_count_the_checkout(self) -> None:
+        pool = FakePool()
+        with mock.patch.object(connection, "get_pool", return_value=pool):
+            with pytest.raises(RuntimeError):
+                with connection.get_connection("actor"):
+                    raise RuntimeError("query failed")
+
+        stats = connection.pool_metrics()["families"]["actor"]
+        assert (stats["checkouts"], stats["timeouts"]) == (1, 0)
+
+
+class TestHealthCheck:
+    def test_healthy_pool(self) -> None:
+        pool = FakePool()
+        result = connection.check_pool_health(pool)
+        assert result["ok"] is True
+        assert pool.checks == 1
+        assert pool.conn.executed == ["SELECT 1"]
+        assert connection.pool_metrics()["health"] is result
+
+    def test_saturated_pool_reports_unhealthy(self) -> None:
+        pool = FakePool()
+        pool.exhausted = True
+        result = connection.check_pool_health(pool, timeout=0.01)
+        assert result["ok"] is False
+        assert "connection" in result["error"]
+
+    def test_background_checker_runs_until_stopped(self) -> None:
+        pool = FakePool()
+        checker = connection._HealthChecker(pool, interval=0.01)
+        checker.start()
+        try:
+            for _ in range(200):
+                if pool.checks >= 2:
+                    break
+                checker.join(0.01)
+        finally:
+            checker.stop()
+            checker.join(1)
+        assert pool.checks >= 2
+        assert not checker.is_alive()
@@ -0,0 +1,213 @@
+"""Tests for cross-request property snapshots (``actingweb.property_snapshot``)."""
+
+import asyncio
+import types
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from actingweb import property_snapshot
+from actingweb.db import get_property, get_property_list
+from actingweb.property import PropertyStore
+from actingweb.property_snapshot import PropertySnapshots, property_snapshots
+
+
+class FakeStorage:
+    """Property rows and version rows shared by all "workers"."""
+
+    def __init__(self) -> None:
+        self.properties: dict[tuple[str, str], Any] = {}
+        self.versions: dict[str, dict[str, Any]] = {}
+        self.property_reads = 0
+        self.fail_version_reads = False
+
+
+class FakeBucket:
+    def __init__(self, storage: FakeStorage, actor_id: str) -> None:
+        self.storage = storage
+        self.actor_id = actor_id
+        self.data: dict[str, Any] = {}
+
+    def get_attr(self, name: str) -> dict[str, Any] | None:
+        if self.storage.fail_version_reads:
+            raise RuntimeError("attribute store down")
+        data = self.storage.versions.get(self.actor_id)
+        return {"data": dict(data)} if data is not None else None
+
+    def insert_attr_if_absent(self, name: str, data: dict[str, Any]) -> bool:
+        if self.actor_id in self.storage.versions:
+            return False
+        self.storage.versions[self.actor_id] = dict(data)
+        return True
+
+    def conditional_update_attr(
+        self, name: str, old_data: dict[str, Any], new_data: dict[str, Any]
+    ) -> bool:
+        if self.storage.versions.get(self.actor_id) != old_data:
+            return False
+        self.storage.versions[self.actor_id] = dict(new_data)
+        return True
+
+
+def _config(storage: FakeStorage, max_actors: int | None = 100) -> Any:
+    """A config ("worker") whose property DB objects use ``storage``."""
+
+    class DbProperty:
+        def __init__(self, **_: Any) -> None:
+            pass
+
+        def get(self, actor_id: str, name: str) -> Any:
+            storage.property_reads += 1
+            return storage.properties.get((actor_id, name))
+
+        def set(self, actor_id: str, name: str, value: Any) -> bool:
+            if value is None:
+                storage.properties.pop((actor_id, name), None)
+            else:
+                storage.properties[(actor_id, name)] = value
+            return True
+
+    class DbPropertyList:
+        def __init__(self, **_: Any) -> None:
+            self.actor_id: str | None = None
+
+        def fetch(self, actor_id: str) -> dict[str, Any]:
+            self.actor_id = actor_id
+            return {n: v for (a, n), v in storage.properties.items() if a == actor_id}
+
+        def delete(self) -> bool:
+            for key in [k for k in storage.properties if k[0] == self.actor_id]:
+                del storage.properties[key]
+            return True
+
+    class Config:
+        pass
+
+    config = Config()
+    config.DbProperty = types.SimpleNamespace(  # type: ignore[attr-defined]
+        DbProperty=DbProperty, DbPropertyList=DbPropertyList
+    )
+    config.use_lookup_table = False  # type: ignore[attr-defined]
+    config.indexed_properties = []  # type: ignore[attr-defined]
+    config.property_snapshot_max_actors = max_actors  # type: ignore[attr-defined]
+    return config
+
+
+@pytest.fixture
+def storage() -> Iterator[FakeStorage]:
+    storage = FakeStorage()
+    with patch.object(
+        PropertySnapshots,
+        "_bucket",
+        lambda self, actor_id: FakeBucket(storage, actor_id),
+    ):
+        yield storage
+
+
+class TestSnapshots:
+    def test_reused_across_stores(self, storage: FakeStorage) -> None:
+        config = _config(storage)
+        storage.properties[("a1", "config")] = "dark"
+        first = PropertyStore(actor_id="a1", config=config)
+        assert first.config == "dark"
+        assert first.missing is None
+        reads = storage.property_reads
+
+        second = PropertyStore(actor_id="a1", config=config)
+        assert second.config == "dark"
+        assert second.missing is None
+        assert storage.property_reads == reads
+        # One version read per store, whatever it reads
+        assert property_snapshots(config).version_reads == 2  # type: ignore[union-attr]
+
+    def test_write_from_another_worker(self, storage: FakeStorage) -> None:
+        worker1 = _config(storage)
+        worker2 = _config(storage)
+        storage.properties[("a1", "config")] = "dark"
+        assert PropertyStore(actor_id="a1", config=worker1).config == "dark"
+
+        PropertyStore(actor_id="a1", config=worker2).config = "light"
+        assert storage.versions["a1"] == {"v": 1}
+        assert PropertyStore(actor_id="a1", config=worker1).config == "light"
+
+        get_property(worker2).set(actor_id="a1", name="config", value=None)
+        assert PropertyStore(actor_id="a1", config=worker1).config is None
+
+    def test_own_write_is_seen(self, storage: FakeStorage) -> None:
+        config = _config(storage)
+        store = PropertyStore(actor_id="a1", config=config)
+        assert store.profile is None
+        store.profile = "x"
+        assert PropertyStore(actor_id="a1", config=config).profile == "x"
+
+    def test_list_rows_do_not_advance_version(self, storage: FakeStorage) -> None:
+        config = _config(storage)
+        db = get_property(config)
+        db.set(actor_id="a1", name="list:notes-meta", value="{}")
+        assert "a1" not in storage.versions
+        db.set(actor_id="a1", name="config", value="dark")
+        assert storage.versions["a1"] == {"v": 1}
+
+    def test_property_list_delete(self, storage: FakeStorage) -> None:
+        config = _config(storage)
+        storage.properties[("a1", "config")] = "dark"
+        assert PropertyStore(actor_id="a1", config=config).config == "dark"
+        db_list = get_property_list(config)
+        db_list.fetch(actor_id="a1")
+        db_list.delete()
+        assert PropertyStore(actor_id="a1", config=config).config is None
+
+    def test_async_write(self, storage: FakeStorage) -> None:
+        class AsyncDb:
+            async def set(self, actor_id: str, name: str, value: Any) -> bool:
+                return True
+
+        db = property_snapshot.versioned(AsyncDb(), _config(storage))
+        assert asyncio.run(db.set(actor_id="a1", name="config", value="x"))
+        assert storage.versions["a1"] == {"v": 1}
+
+    def test_older_version_does_not_replace(self, storage: FakeStorage) -> None:
+        snapshots = PropertySnapshots(_config(storage))
+        storage.versions["a1"] = {"v": 3}
+        snapshots.snapshot("a1")["config"] = "new"  # type: ignore[index]
+        storage.versions["a1"] = {"v": 2}
+        assert snapshots.snapshot("a1") == {}
+        storage.versions["a1"] = {"v": 3}
+        assert snapshots.snapshot("a1") == {"config": "new"}
+
+    def test_actor_bound(self, storage: FakeStorage) -> None:
+        config = _config(storage, max_actors=2)
+        for actor_id in ("a1", "a2", "a3"):
+            assert PropertyStore(actor_id=actor_id, config=config).config is None
+        assert property_snapshots(config).stats()["actors"] == 2  # type: ignore[union-attr]
+
+    def test_unreadable_version(self, storage: FakeStorage) -> None:
+        config = _config(storage)
+        storage.properties[("a1", "config")] = "dark"
+        storage.fail_version_reads = True
+        for _ in range(2):
+            assert PropertyStore(actor_id="a1", config=config).config == "dark"
+        assert storage.property_reads == 2
+
+    def test_disabled_by_default(self, storage: FakeStorage) -> None:
+        config = _config(storage, max_actors=None)
+        assert property_snapshots(config) is None
+        store = PropertyStore(actor_id="a1", config=config)
+        assert store.config is None
+        store.config = "dark"
+        assert PropertyStore(actor_id="a1", config=config).config == "dark"
+        assert storage.versions == {}
+
+
+def test_app_builder() -> None:
+    from actingweb.interface import ActingWebApp
+
+    with patch.object(ActingWebApp, "_initialize_permission_system"):
+        aw_app = ActingWebApp(aw_type="urn:actingweb:test", fqdn="aw.example.com")
+    assert aw_app.get_config().property_snapshot_max_actors is None
+    assert aw_app.with_property_snapshots(max_actors=50) is aw_app
+    assert aw_app.get_config().property_snapshot_max_actors == 50
+    with pytest.raises(ValueError):
+        aw_app.with_property_snapshots(max_actors=0)
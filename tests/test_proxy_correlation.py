@@ -107,7 +107,7 @@ class TestProxyCorrelationHeaders:
         assert "X-Request-ID" in headers
         assert "X-Parent-Request-ID" not in headers
 
-    @patch("actingweb.aw_proxy.requests.get")
+    @patch("actingweb.aw_proxy.peer_transport.get")
     def test_get_resource_sends_correlation_headers(
         self,
         mock_get: MagicMock,
@@ -141,7 +141,7 @@ class TestProxyCorrelationHeaders:
         assert "X-Parent-Request-ID" in headers
         assert headers["X-Parent-Request-ID"] == "test-parent-id"
 
-    @patch("actingweb.aw_proxy.requests.post")
+    @patch("actingweb.aw_proxy.peer_transport.post")
     def test_create_resource_sends_correlation_headers(
         self,
         mock_post: MagicMock,
@@ -175,7 +175,7 @@ class TestProxyCorrelationHeaders:
         assert "X-Parent-Request-ID" in headers
         assert headers["X-Parent-Request-ID"] == "test-create-parent"
 
-    @patch("actingweb.aw_proxy.requests.get")
+    @patch("actingweb.aw_proxy.peer_transport.get")
     def test_retry_preserves_correlation_headers(
         self,
         mock_get: MagicMock,
@@ -207,12 +207,13 @@ class TestTwoActorObjectsInOneRequest:
 
 
 class TestExecutorHopIsolation:
-    """actingweb/interface/hooks.py:562 -- an async hook dispatched through
-    HookRegistry._execute_hook_in_sync_context's thread-pool branch must
-    see the calling thread's RuntimeContext. Exercised via the real public
+    """An async hook dispatched through
+    HookRegistry._execute_hook_in_sync_context onto the hook loop pool
+    (actingweb/interface/hook_executor.py) must see the calling thread's
+    RuntimeContext. Exercised via the real public
     entry point (execute_lifecycle_hooks), not a hand-rolled copy, so a
     regression in the fix shape (e.g. reverting to a bare
-    executor.submit(asyncio.run, ...)) fails this test."""
+    loop.create_task(coro) without the caller's context) fails this test."""
 
     @pytest.mark.asyncio
     async def test_async_lifecycle_hook_sees_callers_context(self):
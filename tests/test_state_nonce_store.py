@@ -119,6 +119,31 @@ class TestAppleTicketStore:
         assert store.consume("nope") is None
 
 
+class TestShardedStores:
+    def test_nonces_and_tickets_round_trip_across_shards(self) -> None:
+        config = _make_config()
+        config.oauth2_system_shards = 4
+        nonces = StateNonceStore(config)
+        tickets = AppleTicketStore(config)
+        for i in range(40):
+            nonce = nonces.create({"i": i})
+            assert nonces.consume(nonce) == {"i": i}
+            ticket = tickets.create(
+                code=f"c{i}", redirect_uri="https://x", provider="apple-mobile"
+            )
+            payload = tickets.consume(ticket)
+            assert payload is not None and payload["code"] == f"c{i}"
+
+    def test_records_land_on_several_actor_ids(self) -> None:
+        config = _make_config()
+        config.oauth2_system_shards = 4
+        store = StateNonceStore(config)
+        for _ in range(100):
+            store.create({"provider": "apple"})
+        storage = config.DbAttribute.DbAttribute().storage
+        assert len([k for k in storage if k.endswith(":_oauth_state_nonces")]) == 4
+
+
 class TestLooksLikeStateNonce:
     def test_json_is_not_a_nonce(self) -> None:
         assert looks_like_state_nonce('{"provider": "apple"}') is False
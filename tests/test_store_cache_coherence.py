@@ -0,0 +1,175 @@
+"""Per-actor store caches stay coherent across worker processes.
+
+Two store instances built from two configs stand in for two gunicorn workers
+sharing one database. With ``cache_coherence`` on, a write by one must reach
+the other's cache once the generation counter TTL has passed; with it off
+(the default) each worker keeps serving what it cached.
+"""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from actingweb.cache import actor_generations
+from actingweb.peer_capabilities import CachedCapabilitiesStore, CachedPeerCapabilities
+from actingweb.peer_permissions import PeerPermissions, PeerPermissionStore
+from actingweb.peer_profile import PeerProfile, PeerProfileStore
+from actingweb.trust_permissions import TrustPermissions, TrustPermissionStore
+
+
+class SharedAttributes:
+    """actingweb.attribute.Attributes over one in-memory table."""
+
+    rows: dict[tuple[str, str, str], dict[str, Any]] = {}
+    reads = 0
+
+    def __init__(self, actor_id: str, bucket: str, config: Any) -> None:
+        self.actor_id = actor_id
+        self.bucket = bucket
+        self.data: dict[str, Any] = {}
+
+    def _key(self, name: str) -> tuple[str, str, str]:
+        return (self.actor_id, self.bucket, name)
+
+    def get_attr(self, name: str) -> dict[str, Any] | None:
+        SharedAttributes.reads += 1
+        return self.rows.get(self._key(name))
+
+    def set_attr(self, name: str, data: Any, **_kw: Any) -> bool:
+        self.rows[self._key(name)] = {"data": data}
+        return True
+
+    def insert_attr_if_absent(self, name: str, data: Any, **_kw: Any) -> bool:
+        if self._key(name) in self.rows:
+            return False
+        return self.set_attr(name, data)
+
+    def conditional_update_attr(self, name: str, old_data: Any, new_data: Any) -> bool:
+        current = self.rows.get(self._key(name))
+        if current is None or current["data"] != old_data:
+            return False
+        return self.set_attr(name, new_data)
+
+    def delete_attr(self, name: str) -> bool:
+        return self.rows.pop(self._key(name), None) is not None
+
+    def get_bucket(self) -> dict[str, Any]:
+        return {
+            n: v
+            for (a, b, n), v in self.rows.items()
+            if a == self.actor_id and b == self.bucket
+        }
+
+
+@pytest.fixture(autouse=True)
+def shared_db() -> Iterator[None]:
+    SharedAttributes.rows = {}
+    SharedAttributes.reads = 0
+    with (
+        patch("actingweb.attribute.Attributes", SharedAttributes),
+        patch("actingweb.mcp.invalidation.evict_caches_for_actor"),
+        patch("actingweb.permission_evaluator.invalidate_effective_permissions"),
+    ):
+        yield
+
+
+def _config(coherent: bool) -> Any:
+    config = MagicMock(cache_coherence=coherent, cache_coherence_ttl=60)
+    config.notify_peer_on_change = False
+    return config
+
+
+# store class, value factory, write, read
+STORES: dict[str, tuple[Any, Callable[[str], Any], str, str]] = {
+    "trust_permissions": (
+        TrustPermissionStore,
+        lambda v: TrustPermissions(
+            actor_id="a1", peer_id="p1", trust_type="friend", notes=v
+        ),
+        "store_permissions",
+        "get_permissions",
+    ),
+    "peer_permissions": (
+        PeerPermissionStore,
+        lambda v: PeerPermissions(actor_id="a1", peer_id="p1", fetched_at=v),
+        "store_permissions",
+        "get_permissions",
+    ),
+    "peer_profiles": (
+        PeerProfileStore,
+        lambda v: PeerProfile(actor_id="a1", peer_id="p1", displayname=v),
+        "store_profile",
+        "get_profile",
+    ),
+    "peer_capabilities": (
+        CachedCapabilitiesStore,
+        lambda v: CachedPeerCapabilities(actor_id="a1", peer_id="p1", fetched_at=v),
+        "store_capabilities",
+        "get_capabilities",
+    ),
+}
+
+
+def _expire_counter(store: Any) -> None:
+    generations = actor_generations(store.config)
+    assert generations is not None
+    generations._remote.entry("a1").stored_at -= 61
+
+
+@pytest.mark.parametrize("name", list(STORES))
+class TestCrossWorker:
+    def test_write_reaches_the_other_worker(self, name: str) -> None:
+        cls, make, write, read = STORES[name]
+        worker_a, worker_b = cls(_config(True)), cls(_config(True))
+
+        assert getattr(worker_a, write)(make("2024-01-01"))
+        assert getattr(worker_b, read)("a1", "p1") == make("2024-01-01")
+
+        assert getattr(worker_a, write)(make("2024-02-01"))
+        # Within the counter TTL worker B may still serve its entry...
+        assert getattr(worker_b, read)("a1", "p1") == make("2024-01-01")
+        # ...but not after it.
+        _expire_counter(worker_b)
+        assert getattr(worker_b, read)("a1", "p1") == make("2024-02-01")
+
+    def test_warm_reads_stay_in_process(self, name: str) -> None:
+        cls, make, write, read = STORES[name]
+        worker_a, worker_b = cls(_config(True)), cls(_config(True))
+        getattr(worker_a, write)(make("2024-01-01"))
+        getattr(worker_b, read)("a1", "p1")
+
+        SharedAttributes.reads = 0
+        for _ in range(20):
+            getattr(worker_b, read)("a1", "p1")
+        assert SharedAttributes.reads == 0
+
+    def test_off_by_default(self, name: str) -> None:
+        cls, make, write, read = STORES[name]
+        worker_a, worker_b = cls(_config(False)), cls(_config(False))
+        getattr(worker_a, write)(make("2024-01-01"))
+        getattr(worker_b, read)("a1", "p1")
+        getattr(worker_a, write)(make("2024-02-01"))
+        assert getattr(worker_b, read)("a1", "p1") == make("2024-01-01")
+        assert not any(key[1] == "_cache_generation" for key in SharedAttributes.rows)
+
+
+def test_delete_reaches_the_other_worker() -> None:
+    worker_a = PeerProfileStore(_config(True))
+    worker_b = PeerProfileStore(_config(True))
+    worker_a.store_profile(PeerProfile(actor_id="a1", peer_id="p1"))
+    assert worker_b.get_profile("a1", "p1") is not None
+
+    assert worker_a.delete_profile("a1", "p1")
+    _expire_counter(worker_b)
+    assert worker_b.get_profile("a1", "p1") is None
+
+
+def test_store_caches_are_bounded() -> None:
+    config = _config(False)
+    config.store_cache_max_entries = 3
+    store = PeerProfileStore(config)
+    for i in range(10):
+        store.store_profile(PeerProfile(actor_id="a1", peer_id=f"p{i}"))
+    assert len(store._cache) == 3
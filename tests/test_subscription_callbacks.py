@@ -10,8 +10,8 @@ affect test isolation in parallel execution.
 
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
-import requests
 
 
 @pytest.fixture
@@ -76,8 +76,8 @@ def mock_actor_async():
 class TestSyncSubscriptionCallbacks:
     """Test synchronous subscription callback functionality."""
 
-    def test_sync_callbacks_enabled_uses_requests(self, mock_actor_sync):
-        """Test that sync_subscription_callbacks=True uses requests.post."""
+    def test_sync_callbacks_enabled_uses_peer_transport(self, mock_actor_sync):
+        """Test that sync_subscription_callbacks=True uses peer_transport.post."""
         actor = mock_actor_sync
 
         # Set up test data - use "trust" target to avoid permission filtering
@@ -101,7 +101,7 @@ class TestSyncSubscriptionCallbacks:
         }
 
         with patch.object(actor, "get_trust_relationship", return_value=trust_rel):
-            with patch("actingweb.actor.requests.post") as mock_post:
+            with patch("actingweb.actor.peer_transport.post") as mock_post:
                 mock_response = Mock()
                 mock_response.status_code = 200
                 mock_response.content = b"OK"
@@ -115,9 +115,9 @@ class TestSyncSubscriptionCallbacks:
                     blob="{}",
                 )
 
-                # Verify requests.post was called (sync path)
+                # Verify peer_transport.post was called (sync path)
                 assert mock_post.called, (
-                    "requests.post should be called when sync_callbacks=True"
+                    "peer_transport.post should be called when sync_callbacks=True"
                 )
                 call_args = mock_post.call_args
                 assert (
@@ -152,7 +152,7 @@ class TestSyncSubscriptionCallbacks:
         # In a non-async context without event loop, it will fall back to sync
         # but the INFO log for forced sync should not be called
         with patch.object(actor, "get_trust_relationship", return_value=trust_rel):
-            with patch("actingweb.actor.requests.post") as mock_post:
+            with patch("actingweb.actor.peer_transport.post") as mock_post:
                 mock_response = Mock()
                 mock_response.status_code = 200
                 mock_response.content = b"OK"
@@ -197,9 +197,9 @@ class TestSyncSubscriptionCallbacks:
         }
 
         with patch.object(actor, "get_trust_relationship", return_value=trust_rel):
-            with patch("actingweb.actor.requests.post") as mock_post:
+            with patch("actingweb.actor.peer_transport.post") as mock_post:
                 # Simulate a network error
-                mock_post.side_effect = requests.RequestException("Connection failed")
+                mock_post.side_effect = httpx.ConnectError("Connection failed")
 
                 # Should not raise, exception is caught
                 actor.callback_subscription(
@@ -237,9 +237,9 @@ class TestSyncSubscriptionCallbacks:
         }
 
         with patch.object(actor, "get_trust_relationship", return_value=trust_rel):
-            with patch("actingweb.actor.requests.post") as mock_post:
+            with patch("actingweb.actor.peer_transport.post") as mock_post:
                 # Simulate a timeout
-                mock_post.side_effect = requests.Timeout("Request timed out")
+                mock_post.side_effect = httpx.ReadTimeout("Request timed out")
 
                 # Should not raise, exception is caught
                 actor.callback_subscription(
@@ -277,7 +277,7 @@ class TestSyncSubscriptionCallbacks:
         }
 
         with patch.object(actor, "get_trust_relationship", return_value=trust_rel):
-            with patch("actingweb.actor.requests.post") as mock_post:
+            with patch("actingweb.actor.peer_transport.post") as mock_post:
                 # Simulate a connection error
                 mock_post.side_effect = ConnectionError("Cannot connect")
 
@@ -322,7 +322,7 @@ class TestSyncSubscriptionCallbacks:
         }
 
         with patch.object(actor, "get_trust_relationship", return_value=trust_rel):
-            with patch("actingweb.actor.requests.post") as mock_post:
+            with patch("actingweb.actor.peer_transport.post") as mock_post:
                 mock_response = Mock()
                 mock_response.status_code = 204
                 mock_response.content = b""
@@ -365,7 +365,7 @@ class TestSyncSubscriptionCallbacks:
         }
 
         with patch.object(actor, "get_trust_relationship", return_value=trust_rel):
-            with patch("actingweb.actor.requests.post") as mock_post:
+            with patch("actingweb.actor.peer_transport.post") as mock_post:
                 mock_response = Mock()
                 mock_response.status_code = 200  # Not 204
                 mock_response.content = b"OK"
@@ -7,7 +7,11 @@ Tests the newly added methods that support subscription handler refactoring:
 - SubscriptionWithDiffs wrapper class
 """
 
+import asyncio
+import threading
+from collections.abc import Iterator
 from typing import Any
+from unittest.mock import AsyncMock, patch
 
 from actingweb.interface.subscription_manager import (
     SubscriptionManager,
@@ -57,6 +61,10 @@ class FakeCoreSubscription:
         """Get all pending diffs."""
         return self._diffs.copy()
 
+    def iter_diffs(self) -> Iterator[dict[str, Any]]:
+        """Iterate over pending diffs."""
+        return iter(self._diffs.copy())
+
     def get_diff(self, seqnr: int) -> dict[str, Any] | None:
         """Get specific diff by sequence number."""
         for diff in self._diffs:
@@ -322,6 +330,20 @@ class TestSubscriptionWithDiffs:
         assert diffs[0]["seqnr"] == 1
         assert diffs[1]["seqnr"] == 2
 
+    def test_iter_diffs(self):
+        """Test iterating over diffs gives the same diffs as get_diffs()."""
+        core_sub = FakeCoreSubscription(
+            peerid="peer_1", subid="sub_1", target="properties"
+        )
+        core_sub._diffs = [
+            {"seqnr": 1, "target": "properties", "blob": {"key": "value1"}},
+            {"seqnr": 2, "target": "properties", "blob": {"key": "value2"}},
+        ]
+
+        wrapper = SubscriptionWithDiffs(core_sub)  # type: ignore[arg-type]
+
+        assert list(wrapper.iter_diffs()) == wrapper.get_diffs()
+
     def test_get_diff_by_seqnr(self):
         """Test getting specific diff by sequence number."""
         core_sub = FakeCoreSubscription(
@@ -631,6 +653,47 @@ class TestSubscriptionManagerCallbackMethods:
         assert regular_sub.is_callback is False
 
 
+class TestSubscribeToPeerAsync:
+    """subscribe_to_peer_async() keeps its storage steps off the event loop."""
+
+    def test_baseline_is_stored_in_a_worker_thread(self):
+        from actingweb.subscription_config import SubscriptionProcessingConfig
+
+        actor = FakeCoreActor()
+        actor.config._subscription_config = SubscriptionProcessingConfig(  # type: ignore[attr-defined]
+            enabled=True
+        )
+        actor.create_remote_subscription_async = AsyncMock(  # type: ignore[attr-defined]
+            return_value="https://peer.example.com/peer_1/subscriptions/actor_1/s1"
+        )
+        manager = SubscriptionManager(actor)  # type: ignore[arg-type]
+        manager._fetch_and_transform_baseline_async = AsyncMock(  # type: ignore[method-assign]
+            return_value={"config": {"value": "dark"}}
+        )
+        manager._refresh_peer_metadata_async = AsyncMock()  # type: ignore[method-assign]
+        threads: list[threading.Thread] = []
+
+        def apply_resync_data(store: Any, data: dict[str, Any]) -> dict[str, Any]:
+            threads.append(threading.current_thread())
+            return {}
+
+        async def subscribe() -> Any:
+            threads.append(threading.current_thread())
+            return await manager.subscribe_to_peer_async(
+                peer_id="peer_1", target="properties"
+            )
+
+        with patch(
+            "actingweb.remote_storage.RemotePeerStore.apply_resync_data",
+            apply_resync_data,
+        ):
+            assert asyncio.run(subscribe()).endswith("/s1")
+
+        loop_thread, store_thread = threads
+        assert store_thread is not loop_thread
+        manager._refresh_peer_metadata_async.assert_awaited_once_with("peer_1")
+
+
 class TestBaselineTransformation:
     """Test suite for _transform_baseline_list_properties() method."""
 
@@ -258,7 +258,7 @@ class TestCallbackSubscriptionFiltering:
                 mock_filter.return_value = None  # Simulate all data filtered out
 
                 # Mock requests.post to verify it's not called
-                with patch("actingweb.actor.requests.post") as mock_post:
+                with patch("actingweb.actor.peer_transport.post") as mock_post:
                     actor.callback_subscription(
                         peerid="peer-123",
                         sub_obj=Mock(),
@@ -294,7 +294,7 @@ class TestCallbackSubscriptionFiltering:
             with patch.object(
                 actor, "_filter_subscription_data_by_permissions"
             ) as mock_filter:
-                with patch("actingweb.actor.requests.post") as mock_post:
+                with patch("actingweb.actor.peer_transport.post") as mock_post:
                     mock_post.return_value = Mock(status_code=204)
 
                     actor.callback_subscription(
@@ -336,7 +336,7 @@ class TestCallbackSubscriptionFiltering:
             ) as mock_filter:
                 mock_filter.return_value = filtered_data
 
-                with patch("actingweb.actor.requests.post") as mock_post:
+                with patch("actingweb.actor.peer_transport.post") as mock_post:
                     mock_post.return_value = Mock(status_code=204)
 
                     actor.callback_subscription(
@@ -5,10 +5,12 @@ This test suite verifies that the trust handler properly supports
 per-relationship permission management as specified in the ActingWeb spec.
 """
 
+import asyncio
 import json
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+from actingweb.handlers.async_trust import AsyncTrustPeerHandler
 from actingweb.handlers.trust import TrustPeerHandler, TrustPermissionHandler
 from actingweb.trust_permissions import TrustPermissions
 
@@ -163,6 +165,101 @@ class TestTrustHandlerPermissions(unittest.TestCase):
             mock_permissions
         )
 
+    @patch("actingweb.handlers.trust.PERMISSION_SYSTEM_AVAILABLE", True)
+    @patch("actingweb.handlers.trust.get_trust_permission_store")
+    @patch("actingweb.handlers.trust.create_permission_override")
+    def test_put_async_awaits_peer_notification(
+        self, mock_create_override, mock_get_store
+    ):
+        """Test async PUT /trust/{relationship}/{peerid} used by FastAPI"""
+        mock_get_store.return_value = self.permission_store
+        self.permission_store.get_permissions.return_value = None
+        self.actor.modify_trust_and_notify_async = AsyncMock(return_value=True)
+
+        handler = AsyncTrustPeerHandler()
+        handler.config = self.config
+        handler.request = self.request
+        handler.response = self.response
+        self._mock_authentication(handler)
+        handler.request.body = json.dumps(
+            {"approved": True, "permissions": {"methods": {"allowed": ["ping"]}}}
+        ).encode("utf-8")
+
+        asyncio.run(handler.put_async("test-actor", "friend", "test-peer"))
+
+        self.actor.modify_trust_and_notify_async.assert_awaited_once()
+        self.actor.modify_trust_and_notify.assert_not_called()
+        self.permission_store.store_permissions.assert_called_once()
+        self.response.set_status.assert_called_with(204, "Ok")
+
+    @patch("actingweb.handlers.async_trust.get_trust_async")
+    def test_get_async_reads_through_async_accessor(self, mock_get_trust_async):
+        """Test async GET /trust/{relationship}/{peerid} used by FastAPI"""
+        db = Mock()
+        db.get = AsyncMock(
+            return_value={
+                "peerid": "test-peer",
+                "relationship": "friend",
+                "approved": True,
+            }
+        )
+        mock_get_trust_async.return_value = db
+
+        handler = AsyncTrustPeerHandler()
+        handler.config = self.config
+        handler.request = Mock()
+        handler.request.get = Mock(return_value=None)
+        handler.response = self.response
+        self._mock_authentication(handler)
+
+        asyncio.run(handler.get_async("test-actor", "friend", "test-peer"))
+
+        db.get.assert_awaited_once_with(actor_id="test-actor", peerid="test-peer")
+        self.actor.get_trust_relationships.assert_not_called()
+        response_data = json.loads(self.response.write.call_args[0][0])
+        self.assertEqual(response_data["peerid"], "test-peer")
+        self.response.set_status.assert_called_with(200, "Ok")
+
+        # A relationship of another type is not found
+        self.response.reset_mock()
+        asyncio.run(handler.get_async("test-actor", "admin", "test-peer"))
+        self.response.set_status.assert_called_with(404, "Not found")
+
+    @patch("actingweb.handlers.async_trust.get_trust_async")
+    def test_put_async_reads_approval_through_async_accessor(
+        self, mock_get_trust_async
+    ):
+        """The approval hook gets the relationship from the async accessor"""
+        trust_data = {
+            "peerid": "test-peer",
+            "relationship": "friend",
+            "approved": True,
+            "peer_approved": True,
+        }
+        db = Mock()
+        db.get = AsyncMock(return_value=trust_data)
+        mock_get_trust_async.return_value = db
+        self.actor.modify_trust_and_notify_async = AsyncMock(return_value=True)
+
+        handler = AsyncTrustPeerHandler()
+        handler.config = self.config
+        handler.request = self.request
+        handler.response = self.response
+        handler.hooks = Mock()
+        self._mock_authentication(handler)
+        handler.request.body = json.dumps({"approved": True}).encode("utf-8")
+
+        asyncio.run(handler.put_async("test-actor", "friend", "test-peer"))
+
+        db.get.assert_awaited_once_with(actor_id="test-actor", peerid="test-peer")
+        self.actor.get_trust_relationships.assert_not_called()
+        handler.hooks.execute_lifecycle_hooks.assert_called_once()
+        self.assertEqual(
+            handler.hooks.execute_lifecycle_hooks.call_args.kwargs["trust_data"],
+            trust_data,
+        )
+        self.response.set_status.assert_called_with(204, "Ok")
+
     @patch("actingweb.handlers.trust.PERMISSION_SYSTEM_AVAILABLE", True)
     @patch("actingweb.handlers.trust.get_trust_permission_store")
     def test_get_trust_permissions_handler(self, mock_get_store):
@@ -237,6 +237,159 @@ class TestTrustTypeRegistry(unittest.TestCase):
         self.assertFalse(result)
 
 
+def _stored(name: str, description: str = "") -> str:
+    return json.dumps(
+        TrustType(
+            name=name,
+            display_name=name.title(),
+            description=description,
+            base_permissions={},
+        ).to_dict()
+    )
+
+
+class _StoredActor:
+    """System actor over a plain dict, counting reads."""
+
+    def __init__(self, props: dict):
+        self.id = TRUST_TYPE_SYSTEM_ACTOR
+        self.props = props
+        self.bulk_reads = 0
+        self.single_reads = 0
+        actor = self
+
+        class _Property:
+            def __getattr__(self, name):
+                actor.single_reads += 1
+                return actor.props.get(name)
+
+            def __setattr__(self, name, value):
+                actor.props[name] = value
+
+        self.property = _Property()
+
+    def get_properties(self):
+        self.bulk_reads += 1
+        return dict(self.props)
+
+
+class TestTrustTypeSnapshot(unittest.TestCase):
+    """Lookups are served from one bulk-loaded, immutable snapshot."""
+
+    def setUp(self):
+        self.actor = _StoredActor(
+            {
+                "trust_type:friend": _stored("friend"),
+                "trust_type:viewer": _stored("viewer"),
+                "unrelated": "x",
+            }
+        )
+        self.registry = TrustTypeRegistry(config_class.Config())
+        self.registry._system_actor = self.actor
+
+    def test_one_bulk_read_serves_all_lookups(self):
+        self.assertEqual(self.registry.preload(), 2)
+        for _ in range(10):
+            self.assertIsNotNone(self.registry.get_type("friend"))
+        self.assertEqual(len(self.registry.list_types()), 2)
+        self.assertEqual(self.actor.bulk_reads, 1)
+        self.assertEqual(self.actor.single_reads, 0)
+
+    def test_snapshot_miss_checks_storage_once(self):
+        self.registry.preload()
+        self.assertIsNone(self.registry.get_type("missing"))
+        self.assertEqual(self.actor.single_reads, 1)
+
+        # Registered by another process after the snapshot was read
+        self.actor.props["trust_type:partner"] = _stored("partner")
+        version = self.registry.version
+        self.assertIsNotNone(self.registry.get_type("partner"))
+        self.assertIsNotNone(self.registry.get_type("partner"))
+        self.assertEqual(self.actor.single_reads, 2)
+        self.assertEqual(self.actor.bulk_reads, 1)
+        self.assertGreater(self.registry.version, version)
+
+    def test_snapshot_is_immutable(self):
+        self.registry.preload()
+        snapshot = self.registry.snapshot()
+        assert snapshot is not None
+        with self.assertRaises(TypeError):
+            snapshot.types["x"] = snapshot.types["friend"]  # type: ignore[index]
+
+    def test_register_and_delete_publish_new_snapshots(self):
+        self.registry.preload()
+        before = self.registry.snapshot()
+        version = self.registry.version
+        self.registry.register_type(
+            TrustType(
+                name="partner",
+                display_name="Partner",
+                description="",
+                base_permissions={},
+            )
+        )
+        self.assertIsNotNone(self.registry.get_type("partner"))
+        self.assertIsNot(self.registry.snapshot(), before)
+        self.assertNotIn("partner", before.types)  # type: ignore[union-attr]
+        self.assertGreater(self.registry.version, version)
+        self.assertEqual(self.actor.bulk_reads, 1)
+
+    def test_unchanged_registration_writes_nothing(self):
+        self.actor.props["trust_type_registry_version"] = "v1"
+        writes = []
+        original = type(self.actor.property).__setattr__
+
+        def counting_setattr(prop, name, value):
+            writes.append(name)
+            original(prop, name, value)
+
+        with patch.object(type(self.actor.property), "__setattr__", counting_setattr):
+            friend = TrustType.from_dict(json.loads(_stored("friend")))
+            self.assertTrue(self.registry.register_type(friend))
+            self.assertEqual(writes, [])
+            self.assertEqual(self.actor.props["trust_type_registry_version"], "v1")
+
+            friend.description = "changed"
+            self.assertTrue(self.registry.register_type(friend))
+            self.assertEqual(
+                writes, ["trust_type:friend", "trust_type_registry_version"]
+            )
+        self.assertEqual(self.actor.bulk_reads, 1)
+
+    def test_expired_snapshot_reloads_only_when_version_changed(self):
+        self.actor.props["trust_type_registry_version"] = "v1"
+        self.registry.preload()
+
+        def expire():
+            snapshot = self.registry.snapshot()
+            object.__setattr__(snapshot, "checked_at", snapshot.checked_at - 3600)
+
+        expire()
+        self.assertIsNotNone(self.registry.get_type("friend"))
+        self.assertEqual(self.actor.bulk_reads, 1)
+        self.assertEqual(self.actor.single_reads, 1)
+
+        # Another process changes a type and rewrites the marker
+        self.actor.props["trust_type:friend"] = _stored("friend", "changed")
+        self.actor.props["trust_type_registry_version"] = "v2"
+        version = self.registry.version
+        self.assertEqual(self.registry.get_type("friend").description, "")  # type: ignore[union-attr]
+        expire()
+        self.assertEqual(self.registry.get_type("friend").description, "changed")  # type: ignore[union-attr]
+        self.assertEqual(self.actor.bulk_reads, 2)
+        self.assertGreater(self.registry.version, version)
+
+    def test_failed_bulk_load_falls_back_to_single_reads(self):
+        def broken():
+            raise RuntimeError("backend down")
+
+        self.actor.get_properties = broken  # type: ignore[method-assign]
+        self.assertIsNotNone(self.registry.get_type("friend"))
+        self.assertIsNotNone(self.registry.get_type("viewer"))
+        self.assertIsNone(self.registry.snapshot())
+        self.assertEqual(self.actor.single_reads, 2)
+
+
 class TestRegistrySingleton(unittest.TestCase):
     """Test the singleton registry."""
 
@@ -0,0 +1,136 @@
+"""Tests for the www UI template set-up, fragment cache and trust page loading."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock, patch
+
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from actingweb.aw_web_request import AWWebObj
+from actingweb.interface.integrations.base_integration import (
+    BaseActingWebIntegration,
+    default_templates_dir,
+)
+from actingweb.interface.integrations.www_templates import (
+    WWW_TEMPLATES,
+    FragmentCache,
+    data_version,
+    prepare_environment,
+    www_template_for,
+)
+
+
+class TestPrepareEnvironment:
+    def test_www_templates(self) -> None:
+        assert www_template_for("") == "aw-actor-www-root.html"
+        assert www_template_for("trust") == "aw-actor-www-trust.html"
+        assert www_template_for("properties/notes") == "aw-actor-www-property.html"
+        assert www_template_for("custom/page") is None
+
+    def test_precompiles_with_bytecode_cache(self, tmp_path: Path) -> None:
+        env = Environment(
+            loader=FileSystemLoader(default_templates_dir()),
+            bytecode_cache=FileSystemBytecodeCache(str(tmp_path)),
+        )
+        prepare_environment(env)
+        # An existing bytecode cache is kept, and filled by the precompile
+        assert isinstance(env.bytecode_cache, FileSystemBytecodeCache)
+        assert env.bytecode_cache.directory == str(tmp_path)
+        assert len(list(tmp_path.iterdir())) >= len(WWW_TEMPLATES)
+        assert env.cache is not None
+        assert len(env.cache) >= len(WWW_TEMPLATES)
+
+    def test_missing_templates_are_skipped(self) -> None:
+        env = Environment(loader=DictLoader({}))
+        prepare_environment(env)
+        assert env.bytecode_cache is not None
+
+
+class TestFragmentCache:
+    def setup_method(self) -> None:
+        self.env = Environment(
+            loader=DictLoader(
+                {"page.html": "{% for t in trusts %}{{ t }},{% endfor %}"}
+            )
+        )
+        self.renders = 0
+
+    def _render(self, cache: FragmentCache, values: dict[str, Any]) -> str:
+        template = self.env.get_template("page.html")
+
+        def render() -> str:
+            self.renders += 1
+            return template.render(values)
+
+        return cache.render("actor1", template, values, render)
+
+    def test_renders_again_only_when_data_changes(self) -> None:
+        cache = FragmentCache()
+        assert self._render(cache, {"trusts": ["a", "b"]}) == "a,b,"
+        assert self._render(cache, {"trusts": ["a", "b"]}) == "a,b,"
+        assert self.renders == 1
+        assert self._render(cache, {"trusts": ["a"]}) == "a,"
+        assert self.renders == 2
+        assert cache.stats()["size"] == 1
+
+    def test_template_reload_renders_again(self) -> None:
+        cache = FragmentCache()
+        self._render(cache, {"trusts": []})
+        self.env.cache.clear()  # type: ignore[union-attr]
+        self._render(cache, {"trusts": []})
+        assert self.renders == 2
+
+    def test_values_that_are_not_json_are_not_cached(self) -> None:
+        cache = FragmentCache()
+        self._render(cache, {"trusts": [object()]})
+        self._render(cache, {"trusts": [object()]})
+        assert self.renders == 2
+        assert data_version({"a": object()}) is None
+        assert data_version({"a": 1, "b": 2}) == data_version({"b": 2, "a": 1})
+
+    def test_enabled_by_config(self) -> None:
+        config = SimpleNamespace(www_fragment_cache=False)
+        integration = BaseActingWebIntegration(Mock(get_config=lambda: config))
+        assert integration.get_www_fragment_cache() is None
+        config.www_fragment_cache = True
+        cache = integration.get_www_fragment_cache()
+        assert isinstance(cache, FragmentCache)
+        assert integration.get_www_fragment_cache() is cache
+
+
+class TestTrustPage:
+    def test_one_read_per_store(self) -> None:
+        from actingweb.handlers.www import WwwHandler
+
+        config = Mock(ui=True, root="https://aw.example.com/")
+        handler = WwwHandler(AWWebObj(), config)
+        myself = Mock(id="actor1")
+        myself.get_trust_relationships.return_value = [
+            {"relationship": "friend", "peerid": "peer1"},
+            {"relationship": "friend", "peerid": "peer2"},
+        ]
+        store = Mock()
+        store.list_actor_permissions.return_value = [SimpleNamespace(peer_id="peer2")]
+
+        with (
+            patch.object(handler, "require_authenticated_actor", return_value=myself),
+            patch(
+                "actingweb.trust_permissions.get_trust_permission_store",
+                return_value=store,
+            ),
+            patch.object(
+                handler, "_get_oauth_clients_for_actor", return_value=[]
+            ) as oauth_clients,
+        ):
+            handler.get("actor1", "trust")
+
+        store.list_actor_permissions.assert_called_once_with("actor1")
+        store.get_permissions.assert_not_called()
+        myself.get_trust_relationships.assert_called_once()
+        oauth_clients.assert_called_once_with("actor1")
+        trusts = handler.response.template_values["trusts"]
+        assert {t["peerid"]: t["has_custom_permissions"] for t in trusts} == {
+            "peer1": False,
+            "peer2": True,
+        }